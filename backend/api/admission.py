@@ -0,0 +1,169 @@
+"""
+接口准入控制：写入、语义搜索、关键字搜索使用各自的并发池（见 core/admission.py）
+
+写入的向量化再多也不会占用搜索的名额和线程，批量导入期间关键字搜索的延迟不受影响。
+
+request_cancel 为每个请求创建取消状态（见 core/cancellation.py）：客户端可以用 X-Request-Timeout 头
+给出超时秒数，请求在排队和各阶段之间检查，客户端断开或超时后不再继续执行
+"""
+import asyncio
+from typing import Callable, Optional
+from fastapi import HTTPException, Request
+from fastapi.responses import StreamingResponse
+from ..core.admission import AdmissionPool, AdmissionRejected
+from ..core.cancellation import CancelScope, RequestCancelled
+from ..config import settings
+
+# 客户端超时请求头（秒，可以是小数）
+TIMEOUT_HEADER = "X-Request-Timeout"
+# 客户端已断开（nginx 的约定，响应不会被收到，只出现在访问日志中）
+STATUS_CLIENT_CLOSED = 499
+# 边读边处理的请求体最多缓冲的分块数（读取快于处理时暂停读取，由 TCP 流控让客户端等待）
+BODY_QUEUE_CHUNKS = 64
+
+# 写入：创建、更新、批量导入（向量化和写入向量库）
+ingest_pool = AdmissionPool("ingest", settings.ingest_max_concurrent, settings.ingest_max_waiting,
+                            settings.admission_max_wait)
+# 语义搜索：搜索、批量搜索、相似记忆、上下文组装（查询向量化和向量检索）
+semantic_pool = AdmissionPool("semantic", settings.semantic_max_concurrent, settings.semantic_max_waiting,
+                              settings.admission_max_wait)
+# 关键字搜索（SQLite 全文检索）
+keyword_pool = AdmissionPool("keyword", settings.keyword_max_concurrent, settings.keyword_max_waiting,
+                             settings.admission_max_wait)
+
+POOLS = (ingest_pool, semantic_pool, keyword_pool)
+
+def _rejected(e: AdmissionRejected) -> HTTPException:
+    """排队已满返回 429，排队超时返回 503"""
+    return HTTPException(
+        status_code=429 if e.reason == "queue_full" else 503,
+        detail=f"Server busy ({e.pool} {e.reason.replace('_', ' ')}), retry later",
+        headers={"Retry-After": str(e.retry_after)}
+    )
+
+def check_capacity(pool: AdmissionPool):
+    """长请求（如批量导入）开始前检查：排队已满时直接拒绝，不读取请求体"""
+    if pool.saturated():
+        pool.rejected += 1
+        raise _rejected(AdmissionRejected(pool.name, "queue_full", pool.retry_after()))
+
+async def admitted(pool: AdmissionPool, fn: Callable, *args, bounded: bool = True,
+                   cancel: Optional[CancelScope] = None):
+    """在并发池中执行 fn(*args)，未被接纳时抛出 429 / 503，被放弃时抛出 499 / 504"""
+    try:
+        return await pool.run(fn, *args, bounded=bounded, cancel=cancel)
+    except AdmissionRejected as e:
+        raise _rejected(e)
+    except RequestCancelled as e:
+        raise _cancelled(pool, e)
+
+def _cancelled(pool: AdmissionPool, e: RequestCancelled) -> HTTPException:
+    """客户端断开返回 499，超过截止时间返回 504"""
+    print(f"[请求取消] {pool.name} 池：{e.stage} 阶段前放弃（{e.reason}）", flush=True)
+    if e.reason == "deadline":
+        return HTTPException(status_code=504, detail=f"Request timeout exceeded before {e.stage}")
+    return HTTPException(status_code=STATUS_CLIENT_CLOSED, detail="Client closed request")
+
+def _parse_timeout(value: Optional[str]) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        timeout = float(value)
+    except ValueError:
+        timeout = -1.0
+    if not timeout > 0:
+        raise HTTPException(status_code=400, detail=f"{TIMEOUT_HEADER} must be a positive number of seconds")
+    return timeout
+
+async def _watch_disconnect(request: Request, cancel: CancelScope):
+    """等待客户端断开连接（请求体已由路由读完，之后 receive() 只会收到 http.disconnect）"""
+    while True:
+        message = await request.receive()
+        if message["type"] == "http.disconnect":
+            cancel.cancel("disconnected")
+            return
+
+async def request_cancel(request: Request):
+    """
+    依赖项：当前请求的取消状态
+
+    截止时间取 X-Request-Timeout（从开始处理请求起计算）；请求处理期间在后台等待断开连接，
+    不能用于自己读取请求体的路由（如批量导入）
+    """
+    cancel = CancelScope(_parse_timeout(request.headers.get(TIMEOUT_HEADER)))
+    watcher = asyncio.create_task(_watch_disconnect(request, cancel))
+    try:
+        yield cancel
+    finally:
+        watcher.cancel()
+
+def admission_metrics() -> dict:
+    """各并发池的执行数、排队深度、拒绝次数和被放弃的请求数"""
+    return {pool.name: pool.stats() for pool in POOLS}
+
+class StreamedBody:
+    """
+    边读请求体边输出响应：后台任务独占读取请求的 ASGI 消息，请求体分块放入队列，收到 http.disconnect 时标记断开
+
+    StreamingResponse 监听断开连接时也会调用 receive()，与读取请求体同时进行会争抢消息（请求体分块可能被它取走丢弃）；
+    由本任务统一读取，响应（StreamedBodyResponse）只从这里得到断开通知
+    """
+
+    def __init__(self, request: Request):
+        self._request = request
+        self._chunks = asyncio.Queue(BODY_QUEUE_CHUNKS)
+        self._disconnect = asyncio.Event()
+        self._task = asyncio.create_task(self._read())
+
+    @property
+    def disconnected(self) -> bool:
+        return self._disconnect.is_set()
+
+    async def _read(self):
+        body_done = False
+        try:
+            while True:
+                message = await self._request.receive()
+                if message["type"] == "http.disconnect":
+                    return
+                if body_done:
+                    continue
+                if message.get("body"):
+                    await self._chunks.put(message["body"])
+                if not message.get("more_body", False):
+                    # 请求体已读完，继续等待断开连接
+                    body_done = True
+                    await self._chunks.put(None)
+        finally:
+            self._disconnect.set()
+            if not body_done:
+                await self._chunks.put(None)
+
+    async def chunks(self):
+        """依次返回请求体分块；请求体读完或客户端断开时结束（断开时 disconnected 为 True）"""
+        while True:
+            chunk = await self._chunks.get()
+            if chunk is None:
+                return
+            yield chunk
+
+    async def wait_disconnect(self) -> dict:
+        """供 StreamingResponse 监听断开连接（代替 ASGI receive）"""
+        await self._disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    def close(self):
+        self._task.cancel()
+
+class StreamedBodyResponse(StreamingResponse):
+    """输出期间仍在读取请求体的流式响应：断开连接的通知来自 StreamedBody，不再自己调用 receive()"""
+
+    def __init__(self, content, body: StreamedBody, **kwargs):
+        super().__init__(content, **kwargs)
+        self.body_reader = body
+
+    async def __call__(self, scope, receive, send):
+        try:
+            await super().__call__(scope, self.body_reader.wait_disconnect, send)
+        finally:
+            self.body_reader.close()
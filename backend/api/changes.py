@@ -0,0 +1,120 @@
+"""
+变更流接口路由（mymem 实例之间增量同步）
+"""
+import base64
+import json
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+import numpy as np
+from .memories import sqlite_db, chroma_db
+from ..config import settings
+
+router = APIRouter(prefix="/api/v1/changes", tags=["changes"])
+
+# 禁用自动重定向，统一路径行为
+router.redirect_slashes = False
+
+# 每次从 SQLite / ChromaDB 读取的变更条数
+CHANGES_PAGE_SIZE = 200
+
+def _encode_vectors(memory_ids):
+    """
+    读取一批记忆的块向量
+
+    Returns:
+        memory_id -> [{"chunk_hash", "embedding"（float32 小端序的 base64）}]
+    """
+    if not memory_ids:
+        return {}
+    existing = chroma_db.collection.get(
+        where={"memory_id": {"$in": memory_ids}}, include=["embeddings", "metadatas"]
+    )
+    vectors = {}
+    for embedding, metadata in zip(existing["embeddings"] or [], existing["metadatas"] or []):
+        if not metadata.get("chunk_hash"):
+            continue
+        data = np.asarray(embedding, dtype="<f4").tobytes()
+        vectors.setdefault(metadata["memory_id"], []).append({
+            "chunk_hash": metadata["chunk_hash"],
+            "embedding": base64.b64encode(data).decode("ascii")
+        })
+    return vectors
+
+def _stream_changes(since: int, limit: int, include_vectors: bool):
+    """逐页读取变更并输出 NDJSON 行（同步生成器，由 StreamingResponse 放到线程池执行）"""
+    instance_id = sqlite_db.instance_id
+    # 只输出到请求开始时的最大序号，持续写入时也能结束
+    until = sqlite_db.get_max_change_seq()
+    yield json.dumps({
+        "op": "header",
+        "instance_id": instance_id,
+        "embedding_model": settings.embedding_model,
+        "since": since,
+        "until": until
+    }, ensure_ascii=False) + "\n"
+
+    last_seq = since
+    sent = 0
+    has_more = False
+    while True:
+        page_size = min(CHANGES_PAGE_SIZE, limit - sent) if limit else CHANGES_PAGE_SIZE
+        if page_size <= 0:
+            has_more = last_seq < until
+            break
+        changes = [change for change in sqlite_db.get_changes(last_seq, page_size) if change["seq"] <= until]
+        if not changes:
+            break
+
+        indexed = [change["memory_id"] for change in changes
+                   if change["op"] == "upsert" and change["indexing_status"] == "done"]
+        vectors = _encode_vectors(indexed) if include_vectors else {}
+
+        lines = []
+        for change in changes:
+            # 本机创建的记忆以本实例 ID 作为 origin
+            record = {
+                "seq": change["seq"],
+                "op": change["op"],
+                "origin": change["origin"] or instance_id,
+                "origin_id": change["origin_id"] if change["origin"] else change["memory_id"]
+            }
+            if change["op"] == "upsert":
+                record.update({
+                    "title": change["title"],
+                    "content": change["content"],
+                    "tags": change["tags"],
+                    "created_at": change["created_at"],
+                    "updated_at": change["updated_at"],
+                    # 向量尚未写完时为 null，接收方自行向量化
+                    "chunks": vectors.get(change["memory_id"])
+                })
+            lines.append(json.dumps(record, ensure_ascii=False) + "\n")
+        yield "".join(lines)
+
+        last_seq = changes[-1]["seq"]
+        sent += len(changes)
+        if len(changes) < page_size:
+            break
+
+    yield json.dumps({"op": "end", "last_seq": last_seq, "has_more": has_more}) + "\n"
+
+@router.get("")
+async def get_changes(since: int = 0, limit: int = 0, vectors: bool = True):
+    """
+    获取序号大于 since 的变更（NDJSON 流）
+
+    第一行为 header（实例 ID、向量模型），之后每行一条变更（upsert 含记录内容及块向量，
+    delete 为墓碑），最后一行为 end（last_seq 作为下次同步的 since）
+
+    Args:
+        since: 上次同步到的序号
+        limit: 最多返回的变更条数，0 表示不限
+        vectors: 是否附带块向量
+    """
+    if since < 0 or limit < 0:
+        raise HTTPException(status_code=400, detail="since and limit must be non-negative")
+    if vectors:
+        # 多进程模式下的只读副本：writer worker 写入过向量库时在后台重新打开（不阻塞本请求）；
+        # 尚未读到的新向量按 chunk_hash 对不上，接收方会自行向量化这些块
+        chroma_db.refresh()
+    return StreamingResponse(_stream_changes(since, limit, vectors), media_type="application/x-ndjson")
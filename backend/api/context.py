@@ -0,0 +1,199 @@
+"""
+RAG 上下文组装接口路由
+"""
+import logging
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException
+from .models import ContextRequest, ContextResponse, ContextCitation
+# 复用搜索路由的实例，避免重复加载模型
+from .search import chroma_db, sqlite_db, embedder, _require_vector_search
+from .admission import admitted, request_cancel, semantic_pool
+from ..core.search_engine import chunk_distance, collapse_chunks, distance_to_relevance
+from ..core.cancellation import CancelScope, checkpoint
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1/context", tags=["context"])
+
+# 禁用自动重定向，统一路径行为
+router.redirect_slashes = False
+
+# 向量检索候选数量（ChromaDB.search 实际返回 top_k * 3 个块）
+CONTEXT_TOP_K = 10
+# tiktoken 编码名称
+TOKEN_ENCODING = "cl100k_base"
+# 段落之间的分隔符
+BLOCK_SEPARATOR = "\n\n"
+# 剩余预算不少于该值时，放不下的段落会被截断后放入
+MIN_TRUNCATED_TOKENS = 50
+
+_encoder = None
+
+class _CharEncoder:
+    """tiktoken 不可用时的兜底：按字符计数（对中文偏保守）"""
+
+    def encode(self, text: str) -> list:
+        return list(text)
+
+    def decode(self, tokens: list) -> str:
+        return "".join(tokens)
+
+def _get_encoder():
+    """懒加载 tiktoken 编码器（首次使用可能需要下载词表）"""
+    global _encoder
+    if _encoder is None:
+        try:
+            import tiktoken
+            _encoder = tiktoken.get_encoding(TOKEN_ENCODING)
+        except Exception as e:
+            logger.warning(f"[上下文组装] tiktoken 加载失败，退回按字符计数: {e}")
+            _encoder = _CharEncoder()
+    return _encoder
+
+def _decode_prefix(encoder, tokens: list) -> tuple:
+    """
+    解码截断后的 token 前缀
+
+    BPE 的 token 边界可能落在多字节字符（如中文）中间，解码会在末尾留下 U+FFFD；
+    此时逐个回退 token，直到末尾能完整解码（一个 UTF-8 字符最多跨 4 个字节）
+
+    Returns:
+        (文本, 实际使用的 token 列表)
+    """
+    text = encoder.decode(tokens)
+    for _ in range(3):
+        if not text.endswith("\ufffd") or len(tokens) <= 1:
+            break
+        tokens = tokens[:-1]
+        text = encoder.decode(tokens)
+    return text, tokens
+
+def _merge_regions(chunks: list, text_length: int) -> list:
+    """
+    合并同一记忆中重叠的命中块区域
+
+    Args:
+        chunks: 命中块列表，包含 chunk_index、start、end、distance
+        text_length: "标题\\n内容" 全文长度
+
+    Returns:
+        合并后的区域列表，包含 start、end、chunk_indexes、distance（取最小）
+    """
+    regions = []
+    for chunk in sorted(chunks, key=lambda c: c["start"] if c["start"] is not None else 0):
+        start, end = chunk["start"], chunk["end"]
+        if start is None or end is None:
+            # 旧数据没有偏移信息，视为整篇
+            start, end = 0, text_length
+        indexes = [chunk["chunk_index"]] if chunk["chunk_index"] is not None else []
+
+        if regions and start < regions[-1]["end"]:
+            last = regions[-1]
+            last["end"] = max(last["end"], end)
+            last["chunk_indexes"].extend(indexes)
+            last["distance"] = min(last["distance"], chunk["distance"])
+        else:
+            regions.append({
+                "start": start,
+                "end": end,
+                "chunk_indexes": indexes,
+                "distance": chunk["distance"]
+            })
+    return regions
+
+@router.post("", response_model=ContextResponse)
+@router.post("/", response_model=ContextResponse, include_in_schema=False)
+async def build_context(data: ContextRequest, cancel: CancelScope = Depends(request_cancel)):
+    """按 token 预算组装 RAG 上下文（查询向量化、检索和分词在语义搜索并发池中执行）"""
+    if data.token_budget <= 0:
+        raise HTTPException(status_code=400, detail="token_budget must be positive")
+    _require_vector_search()
+    return await admitted(semantic_pool, _build_context, data, cancel, cancel=cancel)
+
+def _build_context(data: ContextRequest, cancel: Optional[CancelScope] = None) -> ContextResponse:
+    # 1. 向量检索命中块
+    checkpoint(cancel, "encode")
+    query_embedding = embedder.encode(data.query)
+    checkpoint(cancel, "vector_query")
+    vector_results = chroma_db.search(query_embedding, top_k=CONTEXT_TOP_K)
+    if not vector_results:
+        return ContextResponse(context="", citations=[], used_tokens=0, token_budget=data.token_budget)
+
+    # 2. 按记忆分组（与语义搜索共用搜索引擎的块 -> 记忆解析和距离默认值）
+    collapsed = collapse_chunks(vector_results)
+    chunks_by_memory = {}
+    for memory_id, rows in zip(collapsed.memory_ids.tolist(), collapsed.chunk_rows):
+        chunks = []
+        for row in rows.tolist():
+            vec_result = vector_results[row]
+            metadata = vec_result.get("metadata") or {}
+            chunks.append({
+                "chunk_index": metadata.get("chunk_index"),
+                "start": metadata.get("start"),
+                "end": metadata.get("end"),
+                "distance": chunk_distance(vec_result)
+            })
+        chunks_by_memory[memory_id] = chunks
+
+    # 3. 批量获取记忆，合并重叠区域
+    checkpoint(cancel, "hydrate")
+    memories = sqlite_db.get_memories_by_ids(list(chunks_by_memory.keys()))
+    candidates = []
+    for memory in memories:
+        full_text = f"{memory['title']}\n{memory['content']}"
+        for region in _merge_regions(chunks_by_memory[memory["id"]], len(full_text)):
+            candidates.append((memory, full_text, region))
+
+    # 4. 按相关性从高到低贪心装箱
+    checkpoint(cancel, "pack")
+    candidates.sort(key=lambda c: c[2]["distance"])
+    encoder = _get_encoder()
+    separator_tokens = len(encoder.encode(BLOCK_SEPARATOR))
+    blocks = []
+    citations = []
+    used_tokens = 0
+
+    for memory, full_text, region in candidates:
+        index = len(citations) + 1
+        # 段落头已包含标题，区域从全文开头开始时跳过标题部分
+        text_start = max(region["start"], len(memory["title"]) + 1)
+        block = f"[{index}] {memory['title']}\n{full_text[text_start:region['end']].strip()}"
+        tokens = encoder.encode(block)
+        cost = len(tokens) + (separator_tokens if blocks else 0)
+        truncated = False
+
+        if used_tokens + cost > data.token_budget:
+            remaining = data.token_budget - used_tokens - (separator_tokens if blocks else 0)
+            if remaining < MIN_TRUNCATED_TOKENS:
+                # 放不下，尝试更短的候选
+                continue
+            # 截断后放入，预算已用尽
+            block, tokens = _decode_prefix(encoder, tokens[:remaining])
+            cost = len(tokens) + (separator_tokens if blocks else 0)
+            truncated = True
+
+        blocks.append(block)
+        used_tokens += cost
+        citations.append(ContextCitation(
+            index=index,
+            memory_id=memory["id"],
+            title=memory["title"],
+            chunk_indexes=region["chunk_indexes"],
+            start=region["start"],
+            end=region["end"],
+            relevance=distance_to_relevance(region["distance"]),
+            tokens=len(tokens),
+            truncated=truncated
+        ))
+        if truncated or data.token_budget - used_tokens < MIN_TRUNCATED_TOKENS:
+            break
+
+    print(f"[上下文组装] 查询: '{data.query}'，候选区域 {len(candidates)} 个，"
+          f"装入 {len(citations)} 个，占用 {used_tokens}/{data.token_budget} tokens", flush=True)
+
+    return ContextResponse(
+        context=BLOCK_SEPARATOR.join(blocks),
+        citations=citations,
+        used_tokens=used_tokens,
+        token_budget=data.token_budget
+    )
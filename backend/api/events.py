@@ -0,0 +1,86 @@
+"""
+记忆变更事件接口路由（Server-Sent Events）
+"""
+import asyncio
+import json
+from typing import Optional
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from .memories import event_broker, sqlite_db
+
+router = APIRouter(prefix="/api/v1/events", tags=["events"])
+
+# 禁用自动重定向，统一路径行为
+router.redirect_slashes = False
+
+# 空闲时发送心跳并检查其他进程（mymem ingest / sync 等）写入的变更的间隔（秒）
+HEARTBEAT_INTERVAL = 15.0
+
+def _format_event(event: dict) -> str:
+    """SSE 格式：id 为变更序号，断线重连时浏览器通过 Last-Event-ID 带回"""
+    return f"id: {event['seq']}\nevent: {event['op']}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+async def _event_stream(since: int):
+    subscription = event_broker.subscribe()
+    last_seq = since
+    try:
+        # 重连时浏览器等待 3 秒后重试
+        yield "retry: 3000\n\n"
+        catch_up = True
+        while True:
+            if catch_up or subscription.lagging:
+                # 从 SQLite 补读（首次连接、缓冲区溢出或其他进程有写入）
+                subscription.lagging = False
+                while not subscription.queue.empty():
+                    subscription.queue.get_nowait()
+                while True:
+                    events = await run_in_threadpool(event_broker.read_events, last_seq)
+                    for event in events:
+                        yield _format_event(event)
+                    if not events:
+                        break
+                    last_seq = events[-1]["seq"]
+                catch_up = False
+                continue
+
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), timeout=HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                catch_up = await run_in_threadpool(sqlite_db.get_max_change_seq) > last_seq
+                if not catch_up:
+                    yield ": keepalive\n\n"
+                continue
+            # 补读时已发送过的事件跳过
+            if event["seq"] > last_seq:
+                last_seq = event["seq"]
+                yield _format_event(event)
+    finally:
+        event_broker.unsubscribe(subscription)
+
+@router.get("")
+async def stream_events(since: Optional[int] = None, last_event_id: Optional[str] = Header(None)):
+    """
+    订阅记忆变更事件（SSE）
+
+    每个事件为 {"seq", "op": create/update/delete, "id", "timestamp"}，按 seq 递增；
+    同一条记忆多次修改后补读时只返回最后一次。客户端据此增量更新本地缓存
+
+    Args:
+        since: 从该序号之后开始推送；不传时只推送订阅之后的变更
+        last_event_id: 断线重连时浏览器自动带回的 Last-Event-ID，优先于 since
+    """
+    if last_event_id:
+        try:
+            since = int(last_event_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Last-Event-ID")
+    if since is None:
+        since = sqlite_db.get_max_change_seq()
+    if since < 0:
+        raise HTTPException(status_code=400, detail="since must be non-negative")
+    return StreamingResponse(
+        _event_stream(since),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
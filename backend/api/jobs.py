@@ -0,0 +1,19 @@
+"""
+索引任务接口路由
+"""
+from fastapi import APIRouter, HTTPException
+from .models import JobResponse
+from .memories import sqlite_db
+
+router = APIRouter(prefix="/api/v1/jobs", tags=["jobs"])
+
+# 禁用自动重定向，统一路径行为
+router.redirect_slashes = False
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(job_id: int):
+    """获取后台索引任务状态及进度"""
+    job = sqlite_db.get_index_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobResponse(**job)
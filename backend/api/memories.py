@@ -1,12 +1,23 @@
 """
 存储接口路由
 """
-from fastapi import APIRouter, HTTPException
-from .models import MemoryCreate, MemoryResponse
-from ..core.chroma_db import ChromaDB
-from ..core.sqlite_db import SQLiteDB
-from ..core.embedding import Embedding
-from ..utils.text_splitter import split_text_by_chars
+import json
+from typing import Callable, Dict, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import JSONResponse, Response
+from starlette.concurrency import run_in_threadpool
+from .models import MemoryCreate, MemoryResponse, SearchResult, SimilarMode, DedupPolicy, DuplicateInfo
+from .search import chroma_db, sqlite_db, embedder, engine, _to_search_result, _require_vector_search
+from .responses import json_response, is_not_modified, validator_headers, VersionClock
+from .admission import admitted, check_capacity, request_cancel, ingest_pool, semantic_pool
+from .admission import StreamedBody, StreamedBodyResponse
+from ..core.search_engine import collapse_chunks
+from ..core.cancellation import CancelScope, RequestCancelled, checkpoint
+from ..core.indexer import Indexer
+from ..core.index_queue import IndexQueue, apply_index_jobs
+from ..core.events import EventBroker
+from ..core.dedup import DuplicateDetector
+from ..config import settings
 import numpy as np
 
 router = APIRouter(prefix="/api/v1/memories", tags=["memories"])
@@ -14,96 +25,413 @@ router = APIRouter(prefix="/api/v1/memories", tags=["memories"])
 # 禁用自动重定向，统一路径行为
 router.redirect_slashes = False
 
-# 直接实例化（后续可改为依赖注入）
-chroma_db = ChromaDB()
-sqlite_db = SQLiteDB()
-embedder = Embedding()
+# 多进程模式下 writer worker 检查其他 worker 提交的索引日志的间隔（秒）
+WRITER_POLL_INTERVAL = 0.5
+
+# 直接实例化（后续可改为依赖注入）；向量库、模型与搜索路由共用
+indexer = Indexer(chroma_db, embedder)
+# 后台索引队列（在应用启动时启动，多进程模式下只在 writer worker 中运行）；
+# writer 无法直接收到其他 worker 的通知，缩短空闲轮询间隔
+index_queue = IndexQueue(indexer, poll_interval=WRITER_POLL_INTERVAL if settings.worker_role == "writer" else None)
+# 记忆变更事件广播（/api/v1/events）
+event_broker = EventBroker(sqlite_db)
+duplicate_detector = DuplicateDetector(sqlite_db, chroma_db, threshold=settings.dedup_threshold)
+
+# 批量导入时每批处理的记忆条数
+BULK_BATCH_SIZE = 256
+# 默认的重复检测策略（取值已在加载配置时校验）
+DEFAULT_DEDUP_POLICY = DedupPolicy(settings.dedup_policy) if settings.dedup_policy else None
+
+def _ingest_batch(batch: List[Tuple[int, MemoryCreate]]) -> List[dict]:
+    """
+    导入一批记忆：单事务写入 SQLite，整批向量化后一次写入 ChromaDB
+
+    Args:
+        batch: (行号, 记忆) 列表
+
+    Returns:
+        每条记忆的导入状态
+    """
+    try:
+        memory_ids = sqlite_db.create_memories(
+            [(data.title, data.content, data.tags) for _, data in batch]
+        )
+    except Exception as e:
+        return [{"line": line, "status": "error", "error": str(e)} for line, _ in batch]
+    event_broker.publish()
+
+    indexed = _apply_index_jobs(memory_ids, lambda: indexer.index_memories([
+        (memory_id, data.title, data.content)
+        for memory_id, (_, data) in zip(memory_ids, batch)
+    ]))
+
+    return [
+        {"line": line, "status": "created", "id": memory_id, "indexing_status": "done" if indexed else "pending"}
+        for memory_id, (line, _) in zip(memory_ids, batch)
+    ]
+
+def _vectors_ready() -> bool:
+    """向量库和模型是否已加载（服务刚启动时在后台加载）"""
+    return chroma_db.is_loaded and embedder.is_loaded
+
+def _apply_index_jobs(memory_ids: List[int], apply: Callable[[], None]) -> bool:
+    """
+    同步写入向量并结束索引日志，失败时通知后台索引队列重试
+
+    向量库或模型还在加载时不等待，直接交给后台索引队列（请求返回 202）；
+    多进程模式下的只读 worker 不写向量库，由 writer worker 的后台索引队列处理
+    """
+    if chroma_db.read_only:
+        sqlite_db.release_memory_index_jobs(memory_ids)
+        return False
+    if not _vectors_ready():
+        sqlite_db.release_memory_index_jobs(memory_ids, error="model loading")
+        index_queue.notify()
+        return False
+    if apply_index_jobs(sqlite_db, memory_ids, apply):
+        return True
+    index_queue.notify()
+    return False
+
+def _accepted_response(memory_id: int, duplicate: Optional[DuplicateInfo] = None) -> JSONResponse:
+    """异步写入的 202 响应：返回记录及索引任务 ID"""
+    index_queue.notify()
+    memory = sqlite_db.get_memory(memory_id)
+    if memory is None:
+        raise HTTPException(status_code=500, detail="Failed to retrieve memory")
+    job = sqlite_db.get_latest_index_job(memory_id)
+    response = MemoryResponse(**memory, job_id=job["id"] if job else None, duplicate=duplicate)
+    return JSONResponse(status_code=202, content=response.model_dump(mode="json"))
+
+def _check_queue_capacity():
+    """索引队列已满时拒绝异步写入"""
+    if index_queue.is_full():
+        raise HTTPException(
+            status_code=503,
+            detail="Indexing queue is full, retry later",
+            headers={"Retry-After": "5"}
+        )
+
+def _find_duplicate(data: MemoryCreate, embed: bool) -> Tuple[Optional[DuplicateInfo], Optional[Dict]]:
+    """
+    写入前检查重复：先按内容哈希查精确重复，再用新记忆的块向量检索近重复
+
+    Args:
+        embed: 是否向量化并检查近重复（异步写入或模型还在加载时只做精确检查）
+
+    Returns:
+        (重复信息, 块内容哈希 -> 向量)；已向量化的块在写入时直接复用
+    """
+    existing_id = duplicate_detector.find_exact(data.content)
+    if existing_id is not None:
+        return DuplicateInfo(id=existing_id, similarity=1.0, exact=True), None
+    if not embed:
+        return None, None
+
+    _, texts, metadatas = indexer.build_chunks(0, data.title, data.content)
+    embeddings = embedder.encode_batch(texts)
+    vectors = {metadata["chunk_hash"]: embedding for metadata, embedding in zip(metadatas, embeddings)}
+    near = duplicate_detector.find_near(embeddings)
+    if near is None:
+        return None, vectors
+    return DuplicateInfo(id=near["id"], similarity=round(near["similarity"], 4)), vectors
+
+def _merge_duplicate(data: MemoryCreate, duplicate: DuplicateInfo) -> Optional[MemoryResponse]:
+    """把新记忆的标签合并到已有的重复记忆（不新建记录，不写入多余的向量）"""
+    existing = sqlite_db.get_memory(duplicate.id)
+    if existing is None:
+        # 已有记忆刚被删除，按新记忆写入
+        return None
+    tags = existing["tags"] + [tag for tag in data.tags if tag not in existing["tags"]]
+    if tags != existing["tags"]:
+        sqlite_db.update_memory(duplicate.id, existing["title"], existing["content"], tags)
+        event_broker.publish()
+        # 内容未变，所有块都会复用，只更新元数据
+        _apply_index_jobs([duplicate.id], lambda: indexer.reindex_memory(
+            duplicate.id, existing["title"], existing["content"]
+        ))
+        existing = sqlite_db.get_memory(duplicate.id)
+    return MemoryResponse(**existing, duplicate=duplicate)
 
 @router.post("/", response_model=MemoryResponse)
-async def create_memory(data: MemoryCreate):
-    """存储记忆"""
+async def create_memory(data: MemoryCreate, async_index: bool = False, dedup: Optional[DedupPolicy] = None,
+                        cancel: CancelScope = Depends(request_cancel)):
+    """
+    存储记忆
+
+    Args:
+        async_index: 为 True 时记录写入 SQLite 后立即返回 202（indexing_status=pending），
+                     向量化由后台索引队列完成，可通过 /api/v1/jobs/{job_id} 查询进度；
+                     同步写入向量失败时同样返回 202，由后台索引队列重试
+        dedup: 重复检测策略（默认取配置 dedup_policy，为空时不检查）：内容完全相同，
+               或块向量与已有记忆的平均相似度不低于 dedup_threshold 时视为重复。
+               reject 返回 409；merge 不新建，标签合并到已有记忆并返回它；
+               allow 照常写入。响应的 duplicate 字段报告重复的记忆。异步写入只检查内容完全相同
+
+    同步写入（向量化）在写入并发池中执行，排队已满返回 429、排队超时返回 503。
+    客户端断开或超过 X-Request-Timeout 时，只在写入 SQLite 之前放弃（不留下记录，客户端可以安全重试）；
+    已写入的记录照常完成向量化
+    """
+    if dedup is None:
+        dedup = DEFAULT_DEDUP_POLICY
+    if async_index:
+        _check_queue_capacity()
+        # 异步写入只写 SQLite，不占用写入并发池；在线程池中执行，等待写锁时不阻塞事件循环
+        return await run_in_threadpool(_create_memory, data, async_index, dedup)
+    return await admitted(ingest_pool, _create_memory, data, async_index, dedup, cancel, cancel=cancel)
+
+def _create_memory(data: MemoryCreate, async_index: bool, dedup: Optional[DedupPolicy],
+                   cancel: Optional[CancelScope] = None):
     try:
-        # 1. 保存到 SQLite，获取 ID
+        duplicate, vectors = None, None
+        if dedup is not None:
+            duplicate, vectors = _find_duplicate(data, embed=not async_index and _vectors_ready())
+            if duplicate is not None and dedup == DedupPolicy.reject:
+                raise HTTPException(status_code=409, detail={
+                    "message": "Duplicate memory",
+                    "duplicate": duplicate.model_dump()
+                })
+            if duplicate is not None and dedup == DedupPolicy.merge:
+                merged = _merge_duplicate(data, duplicate)
+                if merged is not None:
+                    return merged
+
+        # 1. 保存到 SQLite，获取 ID（之后不再放弃）
+        checkpoint(cancel, "write")
         memory_id = sqlite_db.create_memory(
             title=data.title,
             content=data.content,
-            tags=data.tags
+            tags=data.tags,
+            enqueue_index=async_index
         )
-
-        # 2. 组合 title 和 content，然后切割文本
-        full_text = f"{data.title}\n{data.content}"
-        text_chunks = split_text_by_chars(full_text, chunk_size=1000, overlap=100)
-
-        # 3. 为每个文本块生成向量并存储
-        if text_chunks:
-            embeddings_list = []
-            ids_list = []
-            metadatas_list = []
-
-            for chunk_index, chunk in enumerate(text_chunks):
-                # 生成向量
-                embedding = embedder.encode(chunk)
-                embeddings_list.append(embedding)
-
-                # 使用 memory_id:chunk_index 作为唯一ID
-                chunk_id = f"{memory_id}:{chunk_index}"
-                ids_list.append(chunk_id)
-
-                # 存储元数据，包含原始记忆ID和块索引
-                metadatas_list.append({
-                    "memory_id": memory_id,
-                    "chunk_index": chunk_index,
-                    "title": data.title,
-                    "total_chunks": len(text_chunks)
-                })
-
-            # 批量添加到 ChromaDB
-            embeddings_array = np.array(embeddings_list)
-            chroma_db.add_vectors(
-                ids=ids_list,
-                embeddings=embeddings_array,
-                metadatas=metadatas_list
+        event_broker.publish()
+        if async_index:
+            return _accepted_response(memory_id, duplicate)
+
+        # 2. 切割文本、批量生成向量并存储到 ChromaDB（重复检测时已向量化的块直接复用）
+        if vectors is not None:
+            apply = lambda: indexer.index_memories_with_vectors(
+                [(memory_id, data.title, data.content)], {memory_id: vectors}
             )
+        else:
+            apply = lambda: indexer.index_memories([(memory_id, data.title, data.content)])
+        if not _apply_index_jobs([memory_id], apply):
+            return _accepted_response(memory_id, duplicate)
 
-        # 4. 获取完整记录返回
+        # 3. 获取完整记录返回
         memory = sqlite_db.get_memory(memory_id)
         if memory is None:
             raise HTTPException(status_code=500, detail="Failed to retrieve created memory")
 
-        return MemoryResponse(**memory)
+        return MemoryResponse(**memory, duplicate=duplicate)
+    except (HTTPException, RequestCancelled):
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/bulk")
+async def bulk_create_memories(request: Request, batch_size: int = BULK_BATCH_SIZE):
+    """
+    批量导入记忆（NDJSON 流式输入）
+
+    请求体每行一个 {"title", "content", "tags"} 对象，边读取边按批导入；
+    响应为 NDJSON，每行对应一条输入的导入状态（每批导入后立即输出），最后一行为汇总
+    """
+    batch_size = max(1, batch_size)
+    # 写入并发池排队已满时直接拒绝；已开始的导入按批排队，不中途拒绝
+    check_capacity(ingest_pool)
+    body = StreamedBody(request)
+
+    async def process():
+        created = 0
+        failed = 0
+        line_no = 0
+        batch = []
+        buffer = b""
+
+        async def flush():
+            nonlocal created, failed, batch
+            statuses = await admitted(ingest_pool, _ingest_batch, batch, bounded=False)
+            batch = []
+            for status in statuses:
+                if status["status"] == "created":
+                    created += 1
+                else:
+                    failed += 1
+            return statuses
+
+        def parse(raw: bytes):
+            nonlocal failed
+            raw = raw.strip()
+            if not raw:
+                return None
+            try:
+                batch.append((line_no, MemoryCreate.model_validate_json(raw)))
+                return None
+            except ValueError as e:
+                failed += 1
+                return {"line": line_no, "status": "error", "error": str(e)}
+
+        async for piece in body.chunks():
+            buffer += piece
+            *lines, buffer = buffer.split(b"\n")
+            for raw in lines:
+                line_no += 1
+                error = parse(raw)
+                if error:
+                    yield json.dumps(error, ensure_ascii=False) + "\n"
+                if len(batch) >= batch_size:
+                    for status in await flush():
+                        yield json.dumps(status, ensure_ascii=False) + "\n"
+
+        if body.disconnected:
+            # 客户端已断开：已导入的批次保留，剩余内容不再导入
+            print(f"[批量导入] 客户端已断开，停止导入：成功 {created} 条，失败 {failed} 条", flush=True)
+            return
+
+        # 最后一行可能没有换行符
+        if buffer.strip():
+            line_no += 1
+            error = parse(buffer)
+            if error:
+                yield json.dumps(error, ensure_ascii=False) + "\n"
+        if batch:
+            for status in await flush():
+                yield json.dumps(status, ensure_ascii=False) + "\n"
+
+        print(f"[批量导入] 完成：成功 {created} 条，失败 {failed} 条", flush=True)
+        yield json.dumps({"done": True, "created": created, "failed": failed}) + "\n"
+
+    return StreamedBodyResponse(process(), body, media_type="application/x-ndjson")
+
+# 列表和详情的 Last-Modified：本进程第一次看到当前记忆表版本的时间
+version_clock = VersionClock()
+
 @router.get("/", response_model=list[MemoryResponse])
-async def list_memories():
-    """获取所有记忆列表"""
-    memories = sqlite_db.get_all_memories()
-    return [MemoryResponse(**mem) for mem in memories]
+async def list_memories(request: Request):
+    """
+    获取所有记忆列表（由 SQLite 直接生成 JSON，不逐条构建响应模型）
+
+    ETag 为记忆表版本（任何增删改或索引状态变化后改变），未变化时返回 304，不读取记录
+    """
+    # 先取版本再生成内容：期间有写入时内容只会比 ETag 新，下次请求 ETag 不匹配，不会缓存旧内容
+    instance_id, generation = version = sqlite_db.get_corpus_version()
+    last_modified = version_clock.last_modified(version)
+    headers = validator_headers(f'W/"{instance_id[:12]}-{generation}"', last_modified)
+    if is_not_modified(request.headers, headers["ETag"], last_modified):
+        return Response(status_code=304, headers=headers)
+    return Response(content=sqlite_db.get_all_memories_json(), media_type="application/json", headers=headers)
 
 @router.get("/stats")
 async def get_stats():
     """获取数据库统计信息"""
     try:
         sqlite_count = sqlite_db.count()
-        chroma_count = chroma_db.count()
+        # 向量库还在加载时为 None
+        chroma_count = chroma_db.count() if chroma_db.is_loaded else None
         return {
             "sqlite_count": sqlite_count,
-            "chroma_count": chroma_count
+            "chroma_count": chroma_count,
+            # 尚未写入向量库的索引日志数
+            "pending_index_jobs": sqlite_db.count_index_jobs()
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/{memory_id}", response_model=MemoryResponse)
-async def get_memory(memory_id: int):
-    """获取记忆详情"""
+async def get_memory(memory_id: int, request: Request):
+    """获取记忆详情（ETag 由记录的变更序号和索引状态生成，未变化时返回 304，不读取内容）"""
+    record_version = sqlite_db.get_memory_version(memory_id)
+    if record_version is None:
+        raise HTTPException(status_code=404, detail="Memory not found")
+    instance_id, _ = version = sqlite_db.get_corpus_version()
+    seq, indexing_status = record_version
+    last_modified = version_clock.last_modified(version)
+    etag = f'W/"{instance_id[:12]}-{memory_id}-{seq}-{indexing_status}"'
+    headers = validator_headers(etag, last_modified)
+    if is_not_modified(request.headers, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
     memory = sqlite_db.get_memory(memory_id)
     if memory is None:
         raise HTTPException(status_code=404, detail="Memory not found")
-    return MemoryResponse(**memory)
+    return json_response({**memory, "job_id": None, "duplicate": None}, headers=headers)
+
+# 相似记忆检索最多使用的块向量数（超出时均匀采样）
+MAX_SIMILAR_QUERY_CHUNKS = 64
+
+@router.get("/{memory_id}/similar", response_model=list[SearchResult])
+async def get_similar_memories(memory_id: int, limit: int = 5, mode: SimilarMode = SimilarMode.max,
+                               include_content: bool = False, cancel: CancelScope = Depends(request_cancel)):
+    """
+    查找与指定记忆相似的记忆（直接复用已存储的块向量，无需模型推理）
+
+    Args:
+        memory_id: 记忆 ID
+        limit: 返回数量
+        mode: max 为每个块分别检索并取最相似块；mean 为块向量取平均后检索一次
+        include_content: 是否返回记忆全文
+    """
+    if sqlite_db.get_memory(memory_id) is None:
+        raise HTTPException(status_code=404, detail="Memory not found")
+    _require_vector_search(need_model=False)
+
+    hits = await admitted(semantic_pool, _find_similar, memory_id, limit, mode, cancel, cancel=cancel)
+    return json_response([_to_search_result(hit, include_content) for hit in hits])
+
+def _find_similar(memory_id: int, limit: int, mode: SimilarMode, cancel: Optional[CancelScope] = None) -> list:
+    """用已存储的块向量检索相似记忆（在语义搜索并发池中执行）"""
+    stored = chroma_db.get_memory_vectors(memory_id)
+    if not stored["ids"]:
+        raise HTTPException(status_code=409, detail="Memory has no stored vectors")
+
+    vectors = np.asarray(stored["embeddings"], dtype=np.float32)
+    if mode == SimilarMode.mean:
+        query_vectors = vectors.mean(axis=0, keepdims=True)
+    else:
+        if len(vectors) > MAX_SIMILAR_QUERY_CHUNKS:
+            sample = np.linspace(0, len(vectors) - 1, MAX_SIMILAR_QUERY_CHUNKS).astype(int)
+            vectors = vectors[sample]
+        query_vectors = vectors
+
+    # 自身的块也会被检索到，按实际查询的向量数多取一些以便排除后仍有足够结果
+    # （不按存储的块总数，长记忆会让每个查询的 kNN 请求过大；search_many 还会再放大）
+    top_k = limit + len(query_vectors)
+    checkpoint(cancel, "vector_query")
+    results_per_query = chroma_db.search_many(query_vectors, top_k=top_k)
+
+    # 合并多个查询的结果：同一块只保留最小距离，并排除自身
+    own_chunk_ids = set(stored["ids"])
+    best_by_chunk = {}
+    for vector_results in results_per_query:
+        for vec_result in vector_results:
+            chunk_id = vec_result["id"]
+            if chunk_id in own_chunk_ids:
+                continue
+            if chunk_id not in best_by_chunk or vec_result["distance"] < best_by_chunk[chunk_id]["distance"]:
+                best_by_chunk[chunk_id] = vec_result
+    merged = sorted(best_by_chunk.values(), key=lambda r: r["distance"])
+
+    # 按记忆聚合，取最近的 limit 条
+    checkpoint(cancel, "hydrate")
+    return engine.nearest(collapse_chunks(merged, exclude_memory_id=memory_id), limit)
 
 @router.put("/{memory_id}", response_model=MemoryResponse)
-async def update_memory(memory_id: int, data: MemoryCreate):
-    """修改记忆"""
+async def update_memory(memory_id: int, data: MemoryCreate, async_index: bool = False,
+                        cancel: CancelScope = Depends(request_cancel)):
+    """
+    修改记忆
+
+    Args:
+        async_index: 为 True 时更新 SQLite 后立即返回 202，重新向量化由后台索引队列完成
+    """
+    if async_index:
+        _check_queue_capacity()
+        return await run_in_threadpool(_update_memory, memory_id, data, async_index)
+    # 排队期间客户端断开或超时则不再更新；开始更新后照常完成
+    return await admitted(ingest_pool, _update_memory, memory_id, data, async_index, cancel=cancel)
+
+def _update_memory(memory_id: int, data: MemoryCreate, async_index: bool):
     try:
         # 1. 检查记录是否存在
         existing_memory = sqlite_db.get_memory(memory_id)
@@ -115,64 +443,25 @@ async def update_memory(memory_id: int, data: MemoryCreate):
             memory_id=memory_id,
             title=data.title,
             content=data.content,
-            tags=data.tags
+            tags=data.tags,
+            enqueue_index=async_index
         )
         if not success:
             raise HTTPException(status_code=500, detail="Failed to update memory")
+        event_broker.publish()
+        if async_index:
+            return _accepted_response(memory_id)
 
-        # 3. 删除 ChromaDB 中的旧向量
-        collection = chroma_db.collection
-        all_docs = collection.get()
-        chunk_ids_to_delete = []
-
-        for doc_id in all_docs["ids"]:
-            # 检查是否是旧格式（纯数字ID）
-            if doc_id == str(memory_id):
-                chunk_ids_to_delete.append(doc_id)
-            # 检查是否是新格式（memory_id:chunk_index）
-            elif doc_id.startswith(f"{memory_id}:"):
-                chunk_ids_to_delete.append(doc_id)
-
-        # 批量删除所有相关的块
-        if chunk_ids_to_delete:
-            chroma_db.delete(ids=chunk_ids_to_delete)
-
-        # 4. 重新切分文本并生成向量
-        full_text = f"{data.title}\n{data.content}"
-        text_chunks = split_text_by_chars(full_text, chunk_size=1000, overlap=100)
-
-        # 5. 为每个文本块生成向量并存储
-        if text_chunks:
-            embeddings_list = []
-            ids_list = []
-            metadatas_list = []
-
-            for chunk_index, chunk in enumerate(text_chunks):
-                # 生成向量
-                embedding = embedder.encode(chunk)
-                embeddings_list.append(embedding)
-
-                # 使用 memory_id:chunk_index 作为唯一ID
-                chunk_id = f"{memory_id}:{chunk_index}"
-                ids_list.append(chunk_id)
-
-                # 存储元数据，包含原始记忆ID和块索引
-                metadatas_list.append({
-                    "memory_id": memory_id,
-                    "chunk_index": chunk_index,
-                    "title": data.title,
-                    "total_chunks": len(text_chunks)
-                })
+        # 3. 重新切分文本，按内容哈希比对，只为变化的块生成向量
+        def reindex():
+            stats = indexer.reindex_memory(memory_id, data.title, data.content)
+            print(f"[更新记忆] memory_id={memory_id}，复用 {stats['kept']} 块，"
+                  f"新增 {stats['added']} 块，删除 {stats['deleted']} 块", flush=True)
 
-            # 批量添加到 ChromaDB
-            embeddings_array = np.array(embeddings_list)
-            chroma_db.add_vectors(
-                ids=ids_list,
-                embeddings=embeddings_array,
-                metadatas=metadatas_list
-            )
+        if not _apply_index_jobs([memory_id], reindex):
+            return _accepted_response(memory_id)
 
-        # 6. 获取更新后的记录返回
+        # 4. 获取更新后的记录返回
         memory = sqlite_db.get_memory(memory_id)
         if memory is None:
             raise HTTPException(status_code=500, detail="Failed to retrieve updated memory")
@@ -185,33 +474,17 @@ async def update_memory(memory_id: int, data: MemoryCreate):
 
 @router.delete("/{memory_id}")
 async def delete_memory(memory_id: int):
-    """删除记忆"""
-    # 先检查是否存在
-    memory = sqlite_db.get_memory(memory_id)
-    if memory is None:
+    """删除记忆（在写入并发池中执行，与其他写入一样不阻塞事件循环）"""
+    return await admitted(ingest_pool, _delete_memory, memory_id)
+
+def _delete_memory(memory_id: int) -> dict:
+    # 删除 SQLite 数据（记录不存在时返回 False）
+    if not sqlite_db.delete_memory(memory_id):
         raise HTTPException(status_code=404, detail="Memory not found")
+    event_broker.publish()
 
-    # 删除 SQLite 数据
-    sqlite_db.delete_memory(memory_id)
-
-    # 删除 ChromaDB 向量（需要删除所有相关的块）
-    # 查询所有以 memory_id: 开头的ID
-    collection = chroma_db.collection
-    # 获取所有文档，筛选出属于这个memory_id的块
-    all_docs = collection.get()
-    chunk_ids_to_delete = []
-
-    for doc_id in all_docs["ids"]:
-        # 检查是否是旧格式（纯数字ID）
-        if doc_id == str(memory_id):
-            chunk_ids_to_delete.append(doc_id)
-        # 检查是否是新格式（memory_id:chunk_index）
-        elif doc_id.startswith(f"{memory_id}:"):
-            chunk_ids_to_delete.append(doc_id)
-
-    # 批量删除所有相关的块
-    if chunk_ids_to_delete:
-        chroma_db.delete(ids=chunk_ids_to_delete)
+    # 删除 ChromaDB 向量（需要删除所有相关的块），失败时由后台索引队列重试
+    _apply_index_jobs([memory_id], lambda: indexer.delete_memory_vectors(memory_id))
 
     return {"message": "Memory deleted successfully"}
 
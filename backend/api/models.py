@@ -4,6 +4,7 @@ Pydantic 数据模型
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
+from enum import Enum
 
 class MemoryCreate(BaseModel):
     """创建记忆请求"""
@@ -11,6 +12,19 @@ class MemoryCreate(BaseModel):
     content: str
     tags: List[str]
 
+class DedupPolicy(str, Enum):
+    """写入时发现重复记忆的处理策略"""
+    reject = "reject"  # 拒绝写入（409）
+    merge = "merge"    # 不新建，标签合并到已有记忆
+    allow = "allow"    # 照常写入，响应中报告重复
+
+class DuplicateInfo(BaseModel):
+    """写入时检测到的重复记忆"""
+    id: int
+    similarity: float
+    # 内容完全相同（否则为向量近重复）
+    exact: bool = False
+
 class MemoryResponse(BaseModel):
     """记忆响应"""
     id: int
@@ -19,19 +33,88 @@ class MemoryResponse(BaseModel):
     tags: List[str]
     created_at: datetime
     updated_at: Optional[datetime] = None
+    # 向量索引状态：pending / indexing / done / failed
+    indexing_status: Optional[str] = None
+    # 异步写入时返回的索引任务 ID
+    job_id: Optional[int] = None
+    # 指定 dedup 策略且检测到重复时返回
+    duplicate: Optional[DuplicateInfo] = None
+
+class JobResponse(BaseModel):
+    """索引任务状态"""
+    id: int
+    memory_id: int
+    op: str = "index"
+    status: str
+    attempts: int
+    total_chunks: Optional[int] = None
+    done_chunks: int
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
 
 class SearchRequest(BaseModel):
     """搜索请求"""
     query: str
     limit: int = 3
     filters: Optional[dict] = None
+    # 为 True 时在结果旁返回排序轨迹（候选、阈值/间隔决策、各阶段耗时）
+    explain: bool = False
+    # 为 True 时返回记忆全文，默认只返回命中块的片段
+    include_content: bool = False
+
+class ChunkHit(BaseModel):
+    """命中的文本块"""
+    chunk_index: Optional[int] = None
+    # 块在 "标题\n内容" 全文中的字符偏移（旧数据没有偏移信息时为 None）
+    start: Optional[int] = None
+    end: Optional[int] = None
+    relevance: float
+    snippet: str
 
 class SearchResult(BaseModel):
     """搜索结果"""
     id: int
     title: str
-    content: str
+    content: Optional[str] = None
     tags: List[str]
     created_at: datetime
     relevance: float
+    chunks: List[ChunkHit] = []
+
+
+class SimilarMode(str, Enum):
+    """相似记忆的块向量聚合方式"""
+    max = "max"    # 每个块分别检索，取最相似的块
+    mean = "mean"  # 块向量取平均后检索一次
+
+class SearchExplainResponse(BaseModel):
+    """搜索响应（explain 模式，附带排序轨迹）"""
+    results: List[SearchResult]
+    explain: dict
+
+class ContextRequest(BaseModel):
+    """RAG 上下文组装请求"""
+    query: str
+    # 上下文最多占用的 token 数
+    token_budget: int = 2000
+
+class ContextCitation(BaseModel):
+    """上下文引用（对应上下文中的 [n] 段落）"""
+    index: int
+    memory_id: int
+    title: str
+    chunk_indexes: List[int]
+    # 段落在 "标题\n内容" 全文中的字符偏移
+    start: int
+    end: int
+    relevance: float
+    tokens: int
+    truncated: bool = False
 
+class ContextResponse(BaseModel):
+    """RAG 上下文组装响应"""
+    context: str
+    citations: List[ContextCitation]
+    used_tokens: int
+    token_budget: int
@@ -0,0 +1,206 @@
+"""
+JSON 响应、压缩与条件请求
+
+读接口直接返回 json_response(...)：结果已由搜索引擎/数据库层组装好，不再逐条构建和校验 Pydantic 模型，
+由 orjson（未安装时退回标准库 json）序列化；路由上的 response_model 仍用于接口文档。
+CompressionMiddleware 对超过阈值的非流式响应做 brotli（已安装时）或 gzip 压缩。
+is_not_modified / validator_headers 处理 ETag、Last-Modified 条件请求（304）
+"""
+import gzip
+import json
+import time
+from datetime import date, datetime
+from email.utils import formatdate, parsedate_to_datetime
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # 可选依赖
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # 可选依赖
+    brotli = None
+
+# gzip / brotli 压缩级别：中文文本在低级别已有较好的压缩率，高级别耗时成倍增加
+GZIP_LEVEL = 4
+BROTLI_QUALITY = 4
+# 超过该大小的响应使用最快的压缩级别（避免压缩耗时超过传输节省的时间）
+LARGE_BODY_SIZE = 8 * 1024 * 1024
+# 超过该大小的响应在线程池中压缩，不阻塞事件循环
+THREAD_BODY_SIZE = 128 * 1024
+# 不压缩的内容类型（流式响应或已压缩的格式）
+EXCLUDED_CONTENT_TYPES = ("text/event-stream", "application/x-ndjson", "application/zip",
+                          "image/", "font/woff2")
+
+def _default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    # numpy 标量（排序轨迹中可能出现）
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps(content) -> bytes:
+    """序列化为 JSON（UTF-8，紧凑格式；datetime 输出 ISO 格式，与 Pydantic 一致）"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    """使用 orjson 序列化的 JSON 响应"""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+def json_response(content, status_code: int = 200, headers: dict = None) -> FastJSONResponse:
+    """返回已组装好的 JSON 内容（跳过 response_model 的校验和序列化）"""
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
+
+def accepted_encodings(accept_encoding: str) -> set:
+    """解析 Accept-Encoding，返回客户端接受的编码（忽略 q=0 的项）"""
+    accepted = set()
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip())
+    return accepted
+
+def _choose_encoding(accept_encoding: str):
+    """按 Accept-Encoding 选择压缩方式：优先 br（已安装 brotli 时），其次 gzip"""
+    accepted = accepted_encodings(accept_encoding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+def http_date(timestamp: float) -> str:
+    """HTTP 日期格式（GMT）"""
+    return formatdate(timestamp, usegmt=True)
+
+def validator_headers(etag: str, last_modified: float = None, cache_control: str = "no-cache") -> dict:
+    """
+    缓存校验响应头
+
+    Args:
+        etag: ETag（含引号，弱校验加 W/ 前缀）
+        last_modified: 最后修改时间戳，None 时不发送 Last-Modified
+        cache_control: 默认 no-cache（可以缓存，但每次使用前都要向服务端确认）
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+def is_not_modified(request_headers, etag: str, last_modified: float = None) -> bool:
+    """
+    条件请求是否命中（可以返回 304）
+
+    有 If-None-Match 时按 ETag 弱比较，忽略 If-Modified-Since；否则比较 If-Modified-Since（秒级）
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {_opaque_tag(tag.strip()) for tag in if_none_match.split(",")}
+        return "*" in tags or _opaque_tag(etag) in tags
+    if_modified_since = request_headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+class VersionClock:
+    """
+    版本标识对应的最后修改时间：本进程第一次看到某个版本的时间
+
+    版本只在数据变化后才会被读到，所以该时间不早于实际修改时间（用作 Last-Modified 不会漏掉修改）
+    """
+
+    def __init__(self):
+        self._version = None
+        self._seen_at = 0.0
+
+    def last_modified(self, version) -> float:
+        if version != self._version:
+            self._version, self._seen_at = version, time.time()
+        return self._seen_at
+
+def compress(body: bytes, encoding: str) -> bytes:
+    fast = len(body) >= LARGE_BODY_SIZE
+    if encoding == "br":
+        return brotli.compress(body, quality=1 if fast else BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=1 if fast else GZIP_LEVEL, mtime=0)
+
+class CompressionMiddleware:
+    """
+    响应压缩（纯 ASGI 中间件）
+
+    只压缩一次性发送的响应体（JSON 等）；流式响应（SSE、NDJSON、文件分块）原样透传，不缓冲
+    """
+
+    def __init__(self, app, minimum_size: int = 1024):
+        """
+        Args:
+            app: ASGI 应用
+            minimum_size: 小于该字节数的响应不压缩，0 表示关闭压缩
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.minimum_size <= 0:
+            await self.app(scope, receive, send)
+            return
+        encoding = _choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                # 等到响应体再决定是否压缩
+                start_message = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start_message["headers"])
+            content_type = headers.get("content-type", "")
+            if (message.get("more_body", False) or len(body) < self.minimum_size
+                    or "content-encoding" in headers
+                    or any(content_type.startswith(excluded) for excluded in EXCLUDED_CONTENT_TYPES)):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            if len(body) >= THREAD_BODY_SIZE:
+                compressed = await run_in_threadpool(compress, body, encoding)
+            else:
+                compressed = compress(body, encoding)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
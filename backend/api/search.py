@@ -1,274 +1,124 @@
 """
-搜索接口路由
+搜索接口路由（排序逻辑见 core/search_engine.py）
 """
-import sys
-import logging
-from fastapi import APIRouter
-from .models import SearchRequest, SearchResult
+import time
+from typing import Optional, Union
+from fastapi import APIRouter, Depends, HTTPException
+from .models import SearchRequest, SearchResult, SearchExplainResponse
+from .responses import json_response
+from .admission import admitted, request_cancel, semantic_pool, keyword_pool
 from ..core.chroma_db import ChromaDB
 from ..core.sqlite_db import SQLiteDB
 from ..core.embedding import Embedding
-
-logger = logging.getLogger(__name__)
+from ..core.search_engine import SearchEngine, SearchHit, VECTOR_TOP_K, elapsed_ms
+from ..core.cancellation import CancelScope
+from ..config import settings
 
 router = APIRouter(prefix="/api/v1/search", tags=["search"])
 
 # 禁用自动重定向，统一路径行为
 router.redirect_slashes = False
 
-# 直接实例化（后续可改为依赖注入）
-chroma_db = ChromaDB()
+# 直接实例化（后续可改为依赖注入）；向量库和模型延迟加载，由应用启动后的后台线程预热，
+# 其他路由共用这里的实例；多进程模式下只有 writer worker 写入向量库，其他 worker 打开只读副本
+chroma_db = ChromaDB(read_only=settings.worker_role == "reader")
 sqlite_db = SQLiteDB()
 embedder = Embedding()
-
-@router.post("/", response_model=list[SearchResult])
-async def search(data: SearchRequest):
-    """语义搜索"""
-    # 1. 查询向量化
-    query_embedding = embedder.encode(data.query)
-
-    # 2. 向量检索（ChromaDB 返回 ID 和 distance）
-    # 返回的ID格式是 "memory_id:chunk_index"
-    # 先获取top 10条数据用于间隔分析
-    vector_results = chroma_db.search(query_embedding, top_k=10)
-
-    if not vector_results:
+engine = SearchEngine(chroma_db, sqlite_db, embedder, verbose=True)
+
+# 批量搜索单次最多查询数
+MAX_BATCH_QUERIES = 64
+
+def _require_vector_search(need_model: bool = True):
+    """
+    向量库或模型还在加载时返回 503（不在事件循环中阻塞加载，关键字搜索不受影响）
+
+    所有向量检索前调用；只读副本在这里触发后台重新打开向量库（不阻塞请求，完成前使用已打开的集合）
+    """
+    if not chroma_db.is_loaded or (need_model and not embedder.is_loaded):
+        raise HTTPException(
+            status_code=503,
+            detail="Vector search is still loading, see /ready (keyword search is available)",
+            headers={"Retry-After": "5"}
+        )
+    # 只读副本：writer worker 写入过向量库时在后台重新打开
+    chroma_db.refresh()
+
+def _to_search_result(hit: SearchHit, include_content: bool) -> dict:
+    """
+    搜索引擎结果转换为响应内容（字段同 SearchResult），全文只在 include_content 时返回
+
+    字段由搜索引擎组装，类型已确定，直接序列化，不再构建和校验响应模型
+    """
+    return {
+        "id": hit.id,
+        "title": hit.title,
+        "content": hit.content if include_content else None,
+        "tags": hit.tags,
+        "created_at": hit.created_at,
+        "relevance": hit.relevance,
+        "chunks": [
+            {"chunk_index": c.chunk_index, "start": c.start, "end": c.end, "relevance": c.relevance, "snippet": c.snippet}
+            for c in hit.chunks
+        ]
+    }
+
+def _new_trace(data: SearchRequest) -> Optional[dict]:
+    """创建排序轨迹，explain 关闭时返回 None，不构建任何轨迹数据"""
+    if not data.explain:
+        return None
+    return {
+        "query": data.query,
+        "limit": data.limit,
+        "top_k": VECTOR_TOP_K,
+        "timings_ms": {}
+    }
+
+def _finish(data: SearchRequest, hits: list, trace: Optional[dict], start: float):
+    """转换结果；explain 模式下返回带轨迹的响应（补齐总耗时），否则直接返回结果列表"""
+    results = [_to_search_result(hit, data.include_content) for hit in hits]
+    if trace is None:
+        return results
+    trace["returned"] = len(results)
+    trace["timings_ms"]["total"] = elapsed_ms(start)
+    return {"results": results, "explain": trace}
+
+@router.post("/", response_model=Union[list[SearchResult], SearchExplainResponse])
+async def search(data: SearchRequest, cancel: CancelScope = Depends(request_cancel)):
+    """语义搜索（客户端断开或超过 X-Request-Timeout 时在下一阶段前放弃）"""
+    _require_vector_search()
+    request_start = time.perf_counter()
+    trace = _new_trace(data)
+    hits = await admitted(semantic_pool, engine.search, data.query, data.limit, trace, cancel, cancel=cancel)
+    return json_response(_finish(data, hits, trace, request_start))
+
+@router.post("/batch", response_model=list[Union[list[SearchResult], SearchExplainResponse]])
+async def search_batch(requests: list[SearchRequest], cancel: CancelScope = Depends(request_cancel)):
+    """
+    批量语义搜索：所有查询一次批量向量化、一次多查询向量检索、一次批量获取记忆
+    按请求顺序返回每个查询的结果
+    """
+    if not requests:
         return []
-
-    # 3. 解析ID，提取memory_id，并去重（同一记忆的多个块只保留相关性最高的）
-    memory_id_to_best_result = {}
-    for vec_result in vector_results:
-        chunk_id = vec_result["id"]
-        metadata = vec_result.get("metadata", {})
-
-        # 从metadata中获取memory_id，如果没有则从ID中解析
-        if "memory_id" in metadata:
-            memory_id = metadata["memory_id"]
-        else:
-            # 兼容旧格式：如果ID是纯数字
-            try:
-                memory_id = int(chunk_id)
-            except ValueError:
-                # 新格式：memory_id:chunk_index
-                memory_id = int(chunk_id.split(":")[0])
-
-        distance = vec_result.get("distance", 1.0)
-
-        # 如果这个memory_id还没有记录，或者这个块的相关性更高，则更新
-        if memory_id not in memory_id_to_best_result:
-            memory_id_to_best_result[memory_id] = {
-                "memory_id": memory_id,
-                "distance": distance
-            }
-        else:
-            # 保留距离更小的（相关性更高）
-            if distance < memory_id_to_best_result[memory_id]["distance"]:
-                memory_id_to_best_result[memory_id]["distance"] = distance
-
-    # 4. 从 SQLite 批量获取完整数据
-    memory_ids = list(memory_id_to_best_result.keys())
-    deduplicated_ids = sorted(memory_ids)
-    memories = sqlite_db.get_memories_by_ids(memory_ids)
-    found_ids = sorted([mem["id"] for mem in memories])
-
-    # 警告：如果SQLite中找不到某些id
-    if len(found_ids) < len(deduplicated_ids):
-        missing_ids = sorted(set(deduplicated_ids) - set(found_ids))
-        log_msg = f"[语义搜索] 警告: 以下id在SQLite中未找到: {missing_ids}"
-        print(log_msg, flush=True)
-        logger.warning(log_msg)
-
-    # 创建 ID 到记忆的映射
-    memory_dict = {mem["id"]: mem for mem in memories}
-
-    # 5. 合并结果（将 distance 转换为相似度）
-    # ChromaDB cosine 距离：0 表示完全相同，2 表示完全相反
-    # 相似度 = 1 - (distance / 2)，归一化到 [0, 1]
-    results = []
-    for memory_id, best_result in memory_id_to_best_result.items():
-        if memory_id in memory_dict:
-            memory = memory_dict[memory_id]
-            distance = best_result["distance"]
-            relevance = max(0.0, 1.0 - (distance / 2.0))  # 归一化到 [0, 1]
-
-            results.append(SearchResult(
-                id=memory["id"],
-                title=memory["title"],
-                content=memory["content"],
-                tags=memory["tags"],
-                created_at=memory["created_at"],
-                relevance=relevance
-            ))
-
-    # 6. 按相关性排序（从高到低）
-    results.sort(key=lambda x: x.relevance, reverse=True)
-
-    # 辅助函数：格式化结果输出
-    def format_result_list(result_list, prefix="  "):
-        """格式化结果列表，显示id、title和relevance"""
-        if not result_list:
-            return ""
-        lines = []
-        for i, r in enumerate(result_list, 1):
-            title_short = r.title[:30] + "..." if len(r.title) > 30 else r.title
-            lines.append(f"{prefix}{i}. [ID:{r.id}] {title_short} (relevance: {r.relevance:.4f})")
-        return "\n".join(lines)
-
-    print(f"\n{'='*80}", flush=True)
-    print(f"[语义搜索] 查询: '{data.query}'", flush=True)
-    print(f"[初始结果] 排序后共 {len(results)} 条", flush=True)
-    if results:
-        print(format_result_list(results), flush=True)
-
-    # 7. 阈值过滤：先过滤明显不相关的结果
-    RELEVANCE_THRESHOLD = 0.7
-    before_threshold_filter = len(results)
-    # 保存被过滤掉的数据用于日志
-    filtered_out_results = [r for r in results if r.relevance < RELEVANCE_THRESHOLD]
-    results = [r for r in results if r.relevance >= RELEVANCE_THRESHOLD]
-    after_threshold_filter = len(results)
-
-    if before_threshold_filter != after_threshold_filter:
-        print(f"\n[阈值过滤] {before_threshold_filter} -> {after_threshold_filter} 条 (阈值: {RELEVANCE_THRESHOLD})", flush=True)
-        if filtered_out_results:
-            print(f"[阈值过滤] 过滤掉的数据:", flush=True)
-            print(format_result_list(filtered_out_results), flush=True)
-    else:
-        print(f"[阈值过滤] {before_threshold_filter} 条 (全部通过阈值 {RELEVANCE_THRESHOLD})", flush=True)
-
-    # 8. 智能分割：基于relevance间隔分析（找到相关性明显下降的临界点）
-    if len(results) > 1:
-        # 提取relevance值列表
-        relevance_values = [r.relevance for r in results]
-
-        # 计算相邻relevance的间隔
-        gaps = []
-        for i in range(len(relevance_values) - 1):
-            gap = relevance_values[i] - relevance_values[i + 1]
-            gaps.append(gap)
-
-        if gaps:
-            # 找到最大间隔的位置
-            max_gap_index = gaps.index(max(gaps))
-            max_gap_value = gaps[max_gap_index]
-
-            # 计算所有间隔的平均值（包括最大间隔）
-            avg_gap_value = sum(gaps) / len(gaps)
-            GAP_THRESHOLD_OFFSET = 0.02  # 间隔阈值偏移量
-            gap_threshold = avg_gap_value + GAP_THRESHOLD_OFFSET
-
-            # 打印间隔分析详情
-            print(f"\n[间隔分析] 计算相邻relevance间隔:", flush=True)
-            for i, gap in enumerate(gaps):
-                marker = " ← 最大间隔" if i == max_gap_index else ""
-                title1 = results[i].title[:20] + "..." if len(results[i].title) > 20 else results[i].title
-                title2 = results[i+1].title[:20] + "..." if len(results[i+1].title) > 20 else results[i+1].title
-                print(f"  间隔 {i+1}: [{results[i].id}] {title1} ({relevance_values[i]:.4f}) -> "
-                      f"[{results[i+1].id}] {title2} ({relevance_values[i+1]:.4f}) = {gap:.4f}{marker}", flush=True)
-
-            print(f"\n[间隔分析] 最大间隔位置: {max_gap_index} (在索引 {max_gap_index} 和 {max_gap_index+1} 之间)", flush=True)
-            print(f"[间隔分析] 最大间隔值: {max_gap_value:.4f}", flush=True)
-            print(f"[间隔分析] 平均间隔值: {avg_gap_value:.4f}", flush=True)
-            print(f"[间隔分析] 分割阈值: {gap_threshold:.4f} (平均间隔 {avg_gap_value:.4f} + {GAP_THRESHOLD_OFFSET})", flush=True)
-
-            # 计算除了最大间隔之外的其他间隔的平均值（用于参考）
-            other_gaps = [gap for i, gap in enumerate(gaps) if i != max_gap_index]
-            if other_gaps:
-                avg_other_gaps = sum(other_gaps) / len(other_gaps)
-                print(f"[间隔分析] 其他间隔平均值: {avg_other_gaps:.4f} (共 {len(other_gaps)} 个间隔)", flush=True)
-            else:
-                print(f"[间隔分析] 其他间隔平均值: 无 (只有1个间隔)", flush=True)
-
-            # 只有当最大间隔 > 平均间隔值 + 0.02 时才进行分割
-            if max_gap_value > gap_threshold:
-                split_position = max_gap_index + 1  # 分割位置（保留前split_position个）
-
-                # 分割：只保留第一组（relevance更高的部分）
-                filtered_results = results[:split_position]
-
-                print(f"[间隔分析] 最大间隔 {max_gap_value:.4f} > 阈值 {gap_threshold:.4f}，执行分割", flush=True)
-                print(f"[间隔分析] 分割结果: {len(results)} -> {len(filtered_results)} 条", flush=True)
-                print(f"[间隔分析] 保留的数据:", flush=True)
-                print(format_result_list(filtered_results), flush=True)
-                if len(results) > split_position:
-                    discarded = results[split_position:]
-                    print(f"[间隔分析] 舍弃的数据:", flush=True)
-                    print(format_result_list(discarded), flush=True)
-
-                results = filtered_results
-            else:
-                print(f"[间隔分析] 最大间隔 {max_gap_value:.4f} <= 阈值 {gap_threshold:.4f}，不执行分割，保留全部 {len(results)} 条", flush=True)
-        else:
-            print(f"[间隔分析] {len(results)} 条 (无间隔，全部保留)", flush=True)
-    elif len(results) == 1:
-        print(f"[间隔分析] 1 条 (跳过间隔分析)", flush=True)
-    elif len(results) == 0:
-        print(f"[间隔分析] 0 条", flush=True)
-
-    print(f"\n[最终结果] 返回 {len(results)} 条", flush=True)
-    if results:
-        print(format_result_list(results), flush=True)
-    print(f"{'='*80}\n", flush=True)
-
-    # 9. 限制返回数量（如果用户请求的数量小于过滤后的结果）
-    return results[:data.limit]
-
-@router.post("/sqlite", response_model=list[SearchResult])
-async def search_sqlite(data: SearchRequest):
+    _require_vector_search()
+    if len(requests) > MAX_BATCH_QUERIES:
+        raise HTTPException(status_code=400, detail=f"Too many queries in one batch (max {MAX_BATCH_QUERIES})")
+
+    batch_start = time.perf_counter()
+    traces = [_new_trace(data) for data in requests]
+    hits_list = await admitted(semantic_pool, engine.search_many,
+                               [data.query for data in requests], [data.limit for data in requests], traces, cancel,
+                               cancel=cancel)
+    responses = [_finish(data, hits, trace, batch_start) for data, hits, trace in zip(requests, hits_list, traces)]
+    print(f"[批量语义搜索] {len(requests)} 个查询，总耗时 {elapsed_ms(batch_start)} ms", flush=True)
+    return json_response(responses)
+
+@router.post("/sqlite", response_model=Union[list[SearchResult], SearchExplainResponse])
+async def search_sqlite(data: SearchRequest, cancel: CancelScope = Depends(request_cancel)):
     """关键字搜索 (SQLite)"""
-    print(f"\n{'='*80}", flush=True)
-    print(f"[SQLite搜索] 查询关键字: '{data.query}'", flush=True)
-    print(f"[SQLite搜索] 限制返回数量: {data.limit}", flush=True)
-
-    memories = sqlite_db.search_memories(data.query)
-
-    print(f"[SQLite搜索] 数据库返回 {len(memories)} 条记录", flush=True)
-
-    results = []
-    import math
-    for memory in memories:
-        # FTS5 rank 转换逻辑修复：
-        # rank 越小（越负）表示越匹配。
-        # 我们使用 Sigmoid 函数将 rank 映射到 0-1 之间：relevance = 1 / (1 + exp(rank))
-        rank = memory.get("rank", 0)
-
-        try:
-            # 使用 Sigmoid 函数：rank=-10 -> 0.999, rank=0 -> 0.5, rank=10 -> 0.0001
-            relevance = 1.0 / (1.0 + math.exp(rank))
-        except OverflowError:
-            # 极端情况处理
-            relevance = 1.0 if rank < 0 else 0.0
-
-        results.append(SearchResult(
-            id=memory["id"],
-            title=memory["title"],
-            content=memory["content"],
-            tags=memory["tags"],
-            created_at=memory["created_at"],
-            relevance=relevance
-        ))
-
-    # 显式按相关度降序排序（确保分数最高的排在最前面）
-    results.sort(key=lambda x: x.relevance, reverse=True)
-
-    # 格式化结果输出
-    def format_result_list(result_list, prefix="  "):
-        """格式化结果列表，显示id、title和评分"""
-        if not result_list:
-            return ""
-        lines = []
-        for i, r in enumerate(result_list, 1):
-            title_short = r.title[:30] + "..." if len(r.title) > 30 else r.title
-            lines.append(f"{prefix}{i}. [ID:{r.id}] {title_short} (评分: {r.relevance:.4f})")
-        return "\n".join(lines)
-
-    print(f"[SQLite搜索] 处理后的结果: {len(results)} 条", flush=True)
-    if results:
-        print(format_result_list(results), flush=True)
-
-    final_results = results[:data.limit]
-    print(f"[SQLite搜索] 最终返回: {len(final_results)} 条 (限制: {data.limit})", flush=True)
-    print(f"{'='*80}\n", flush=True)
-
-    return final_results
-
+    request_start = time.perf_counter()
+    trace = None
+    if data.explain:
+        trace = {"query": data.query, "limit": data.limit, "timings_ms": {}}
+    hits = await admitted(keyword_pool, engine.keyword_search, data.query, data.limit, trace, cancel, cancel=cancel)
+    return json_response(_finish(data, hits, trace, request_start))
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""
+mymem 命令入口
+
+mymem search 不导入 FastAPI 应用（导入应用会初始化数据库和各路由组件），直接执行命令行搜索；
+其他命令交给 backend.main.cli
+"""
+import sys
+
+def main():
+    if sys.argv[1:2] == ["search"]:
+        from backend.search_cli import main as search_main
+        sys.exit(search_main(sys.argv[2:]))
+
+    from backend.main import cli
+    cli()
+
+if __name__ == "__main__":
+    main()
@@ -3,8 +3,16 @@
 """
 import os
 from pathlib import Path
+from pydantic import field_validator
 from pydantic_settings import BaseSettings
 
+from .paths import is_dev_env, resolve_data_dir
+
+# 写入时重复检测的策略（与 api/models.py 中的 DedupPolicy 一致）
+DEDUP_POLICIES = ("reject", "merge", "allow")
+# 文本分段模式（与 utils/text_splitter.py 一致）
+CHUNKING_MODES = ("cdc", "fixed")
+
 class Settings(BaseSettings):
     """配置（支持环境变量）"""
 
@@ -18,32 +26,12 @@ class Settings(BaseSettings):
 
     @property
     def is_dev(self) -> bool:
-        """统一判断是否为开发环境"""
-        env_val = self.env.lower()
-        if env_val in ["dev", "development"]:
-            return True
-        if env_val in ["prod", "production"]:
-            return False
-
-        # 默认逻辑 (auto): 检查是否存在 .git 目录
-        return (self.project_root / ".git").exists()
-
-    # 智能路径管理
-    # 1. 优先使用环境变量 MYMEM_DATA_PATH
-    # 2. 如果是开发环境，使用项目根目录下的 ./data
-    # 3. 否则认为是用户环境，使用 ~/.mymem/data
-    def _get_default_data_dir(self) -> str:
-        env_path = os.getenv("MYMEM_DATA_PATH")
-        if env_path:
-            return os.path.abspath(env_path)
-
-        # 使用统一的环境判断属性
-        if self.is_dev:
-            return str(self.project_root / "data")
+        """统一判断是否为开发环境（未设置时按项目根目录下是否存在 .git 判断）"""
+        return is_dev_env(self.env)
 
-        # 用户环境，存放在家目录
-        user_home_data = Path.home() / ".mymem" / "data"
-        return str(user_home_data)
+    # 智能路径管理：MYMEM_DATA_PATH > 开发环境的 ./data > 用户环境的 ~/.mymem/data（见 backend/paths.py）
+    def _get_default_data_dir(self) -> str:
+        return resolve_data_dir(self.env)
 
     @property
     def data_dir(self) -> str:
@@ -61,12 +49,67 @@ class Settings(BaseSettings):
     def db_path(self) -> str:
         return os.path.join(self.data_dir, "memories.db")
 
+    @property
+    def socket_path(self) -> str:
+        """本机客户端（技能脚本）优先使用的 Unix domain socket"""
+        return os.path.join(self.data_dir, "mymem.sock")
+
     # Embedding
     embedding_model: str = "BAAI/bge-small-zh-v1.5"
 
+    # 文本分段模式：cdc（内容定义分段，修改长文档时只重新向量化改动附近的块）或 fixed（固定长度 + 重叠）
+    # 已按 fixed 分段的记忆不需要迁移：块按内容哈希比对，下次修改时按当前模式重新分段
+    chunking_mode: str = "cdc"
+
+    # 写入时的重复检测：默认策略（reject / merge / allow，空表示不检查）及近重复的相似度阈值
+    dedup_policy: str = ""
+    dedup_threshold: float = 0.95
+
+    @field_validator("chunking_mode")
+    @classmethod
+    def _check_chunking_mode(cls, value: str) -> str:
+        """启动时校验，写错的取值不会让每次向量化都失败"""
+        value = value.strip().lower()
+        if value not in CHUNKING_MODES:
+            raise ValueError(f"MYMEM_CHUNKING_MODE 必须是 {' / '.join(CHUNKING_MODES)} 之一，当前为 {value!r}")
+        return value
+
+    @field_validator("dedup_policy")
+    @classmethod
+    def _check_dedup_policy(cls, value: str) -> str:
+        """启动时校验，写错的取值不会让之后的每次写入都返回 500"""
+        value = value.strip().lower()
+        if value and value not in DEDUP_POLICIES:
+            raise ValueError(f"MYMEM_DEDUP_POLICY 必须是 {' / '.join(DEDUP_POLICIES)} 之一或为空，当前为 {value!r}")
+        return value
+
+    # 后台索引队列排队任务上限（超出时异步写入返回 503）
+    index_queue_max_pending: int = 1000
+
+    # 准入控制：写入、语义搜索、关键字搜索各自的并发数和排队上限（每个进程独立计数）；
+    # 排队已满返回 429，排队超过 admission_max_wait 秒返回 503，均带 Retry-After。
+    # 写入默认单并发：向量化本身已用满多核，且写入共用同一个 SQLite 连接
+    ingest_max_concurrent: int = 1
+    ingest_max_waiting: int = 16
+    semantic_max_concurrent: int = 4
+    semantic_max_waiting: int = 64
+    keyword_max_concurrent: int = 8
+    keyword_max_waiting: int = 256
+    admission_max_wait: float = 30.0
+
     # API
     port: int = 7937
     host: str = "127.0.0.1"
+    # 除 TCP 端口外同时监听数据目录下的 Unix domain socket（Linux/macOS，开发模式热重载时不监听）
+    unix_socket: bool = True
+    # 响应压缩阈值（字节）：超过该大小的非流式响应按 Accept-Encoding 使用 brotli / gzip 压缩，0 表示关闭
+    compression_min_size: int = 1024
+
+    # 服务进程数：大于 1 时由主进程预加载模型后 fork 出多个 worker（仅 Linux/macOS）
+    workers: int = 1
+    # 多进程模式下本进程的角色（由主进程在 fork 后设置）：空表示单进程；
+    # writer 为唯一写入向量库并运行后台索引队列的 worker，reader 为只读 worker
+    worker_role: str = ""
 
     class Config:
         env_prefix = "MYMEM_"
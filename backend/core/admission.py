@@ -0,0 +1,155 @@
+"""
+准入控制（并发池）
+
+推理密集的请求在独立的并发池中执行：同时执行的任务数有上限，超出的在有界队列中按到达顺序等待，
+队列已满或等待超时时立即拒绝，而不是无限堆积。每个池有自己的线程池，任务不阻塞事件循环，
+不同类别的请求（写入、语义搜索、关键字搜索）互不占用对方的名额和线程。
+请求带有取消状态时，排队等待不超过其截止时间，取得名额后客户端已断开或已超时则不再执行
+"""
+import asyncio
+import functools
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from .cancellation import CancelScope, RequestCancelled
+
+# 平均执行耗时的平滑系数
+EWMA_ALPHA = 0.2
+# 建议的重试等待秒数上限
+MAX_RETRY_AFTER = 60
+
+class AdmissionRejected(Exception):
+    """请求未被接纳：reason 为 queue_full（排队已满）或 timeout（排队超时）"""
+
+    def __init__(self, pool: str, reason: str, retry_after: int):
+        super().__init__(f"{pool} pool rejected request ({reason})")
+        self.pool = pool
+        self.reason = reason
+        self.retry_after = retry_after
+
+class AdmissionPool:
+    """
+    并发池：最多 max_concurrent 个任务同时执行，最多 max_waiting 个排队等待，排队超过 max_wait 秒放弃
+
+    计数只在事件循环线程中修改，不需要加锁
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_waiting: int, max_wait: float):
+        """
+        Args:
+            name: 池名称（指标和日志中使用）
+            max_concurrent: 同时执行的任务数上限
+            max_waiting: 排队等待的任务数上限，0 表示不排队（没有空闲名额时直接拒绝）
+            max_wait: 排队等待的最长秒数
+        """
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_waiting = max(0, max_waiting)
+        self.max_wait = max_wait
+        self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        # 独立线程池：请求被取消后仍在运行的任务也只占用本池的线程
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent, thread_name_prefix=f"admission-{name}")
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.completed = 0
+        # 被放弃的请求：按原因（disconnected / deadline）和放弃前的阶段计数
+        self.cancelled: Dict[str, int] = {}
+        self.cancelled_stages: Dict[str, int] = {}
+        # 平均执行耗时（秒），用于估算 Retry-After
+        self._avg_seconds: Optional[float] = None
+
+    def saturated(self) -> bool:
+        """没有空闲名额且排队已满"""
+        return self.active >= self.max_concurrent and self.waiting >= self.max_waiting
+
+    def retry_after(self) -> int:
+        """按当前排队长度和平均执行耗时估算的重试等待秒数"""
+        avg = self._avg_seconds or 1.0
+        estimate = avg * (self.waiting + 1) / self.max_concurrent
+        return max(1, min(MAX_RETRY_AFTER, math.ceil(estimate)))
+
+    async def run(self, fn: Callable, *args, bounded: bool = True, cancel: Optional[CancelScope] = None):
+        """
+        取得名额后在线程池中执行 fn(*args)
+
+        Args:
+            bounded: 为 False 时不受排队长度和等待时间限制（用于已被接纳的长请求中的后续批次）
+            cancel: 请求的取消状态（fn 自身也应在阶段之间检查）
+
+        Raises:
+            AdmissionRejected: 排队已满或等待超时
+            RequestCancelled: 客户端已断开或超过截止时间
+        """
+        try:
+            await self._acquire(bounded, cancel)
+            started = time.perf_counter()
+            try:
+                if cancel is not None:
+                    # 排队期间客户端可能已经断开
+                    cancel.check("queue")
+                result = await asyncio.get_running_loop().run_in_executor(self._executor, functools.partial(fn, *args))
+            finally:
+                self._release(time.perf_counter() - started)
+        except RequestCancelled as e:
+            self.cancelled[e.reason] = self.cancelled.get(e.reason, 0) + 1
+            self.cancelled_stages[e.stage] = self.cancelled_stages.get(e.stage, 0) + 1
+            raise
+        self.completed += 1
+        return result
+
+    async def _acquire(self, bounded: bool, cancel: Optional[CancelScope] = None):
+        # 排队等待不超过请求的截止时间
+        max_wait = self.max_wait if bounded else None
+        until_deadline = False
+        if cancel is not None:
+            cancel.check("queue")
+            remaining = cancel.remaining()
+            if remaining is not None and (max_wait is None or remaining < max_wait):
+                max_wait, until_deadline = remaining, True
+        if not self._semaphore.locked():
+            await self._semaphore.acquire()
+        else:
+            if bounded and self.waiting >= self.max_waiting:
+                self.rejected += 1
+                raise AdmissionRejected(self.name, "queue_full", self.retry_after())
+            self.waiting += 1
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), max_wait)
+            except TimeoutError:
+                if until_deadline:
+                    cancel.cancel("deadline")
+                    cancel.check("queue")
+                self.timed_out += 1
+                raise AdmissionRejected(self.name, "timeout", self.retry_after())
+            finally:
+                self.waiting -= 1
+        self.active += 1
+        self.admitted += 1
+
+    def _release(self, seconds: float):
+        self.active -= 1
+        self._semaphore.release()
+        if self._avg_seconds is None:
+            self._avg_seconds = seconds
+        else:
+            self._avg_seconds += EWMA_ALPHA * (seconds - self._avg_seconds)
+
+    def stats(self) -> dict:
+        return {
+            "active": self.active,
+            "waiting": self.waiting,
+            "max_concurrent": self.max_concurrent,
+            "max_waiting": self.max_waiting,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "completed": self.completed,
+            "cancelled": dict(self.cancelled),
+            "cancelled_stages": dict(self.cancelled_stages),
+            "avg_ms": round(self._avg_seconds * 1000, 1) if self._avg_seconds is not None else None
+        }
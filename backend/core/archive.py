@@ -0,0 +1,263 @@
+"""
+知识库快照导出/导入（mymem export / mymem import）
+
+归档为 zip 文件（不压缩，读写以 I/O 为主）：
+    manifest.json           格式版本、模型名称、向量维度及类型、条数
+    memories.db             SQLite 备份 API 生成的一致性快照
+    chunks/ids.json         块 ID（按列存储，与向量矩阵逐行对应）
+    chunks/chunk_hash.json  块内容哈希
+    chunks/<列名>.npy        memory_id、chunk_index、start、end、total_chunks（int64，缺失为 -1）
+    embeddings.npy          向量矩阵（float32 或 float16）
+"""
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import uuid
+import zipfile
+from collections import Counter
+from datetime import datetime
+from typing import Callable, Dict, Optional
+import numpy as np
+from .chroma_db import ChromaDB
+from .sqlite_db import SQLiteDB
+from ..config import settings
+
+ARCHIVE_FORMAT = "mymem-export"
+ARCHIVE_VERSION = 1
+# 按列存储的整数元数据
+INT_COLUMNS = ("memory_id", "chunk_index", "start", "end", "total_chunks")
+# 读取/写入向量库的每页条数
+PAGE_SIZE = 5000
+
+def _incomplete_memories(memory_ids: set, chunk_memory_ids: list, total_chunks: list) -> set:
+    """导出的块不完整的记忆：块数与元数据中的 total_chunks 不符，或没有任何块"""
+    found = Counter(chunk_memory_ids)
+    expected = {memory_id: total for memory_id, total in zip(chunk_memory_ids, total_chunks) if total >= 0}
+    incomplete = {memory_id for memory_id, total in expected.items() if found[memory_id] != total}
+    return incomplete | (memory_ids - found.keys())
+
+def export_archive(path: str, sqlite_db: SQLiteDB, chroma_db: ChromaDB, dtype: str = "float32",
+                   progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+    """
+    导出快照（服务运行时也可执行）
+
+    先用 SQLite 备份 API 得到一致性快照，再按块 ID 分页读取向量；快照之后被修改或删除的记忆、
+    以及导出的块数与 total_chunks 不符（读取期间被改写）或没有向量的记忆，在快照中写入待处理的索引日志，
+    导入后由后台索引队列按块增量同步
+
+    Args:
+        path: 归档文件路径
+        sqlite_db: 数据库
+        chroma_db: 向量库
+        dtype: 向量存储类型 float32 / float16
+        progress: 进度回调 progress(已导出块数, 总块数)
+
+    Returns:
+        manifest 字典
+    """
+    if dtype not in ("float32", "float16"):
+        raise ValueError(f"不支持的向量类型: {dtype}")
+
+    with tempfile.TemporaryDirectory(prefix="mymem-export-") as tmp:
+        # 1. SQLite 一致性快照
+        snapshot_path = os.path.join(tmp, "memories.db")
+        snapshot = sqlite3.connect(snapshot_path)
+        sqlite_db.conn.backup(snapshot)
+        snapshot_job_id = snapshot.execute("SELECT COALESCE(MAX(id), 0) FROM index_jobs").fetchone()[0]
+        memory_ids = {row[0] for row in snapshot.execute("SELECT id FROM memories")}
+
+        # 2. 分页读取向量，写入原始矩阵文件
+        raw_path = os.path.join(tmp, "embeddings.raw")
+        columns = {name: [] for name in INT_COLUMNS}
+        chunk_ids = []
+        chunk_hashes = []
+        dim = None
+        # 先取得全部块 ID 再按 ID 分页：读取期间服务写入也不会跳过或重复块
+        all_ids = chroma_db.list_ids()
+        total = len(all_ids)
+        seen = 0
+        with open(raw_path, "wb") as raw:
+            for page in chroma_db.iter_pages(all_ids, ["embeddings", "metadatas"], PAGE_SIZE):
+                keep = []
+                for i, (chunk_id, metadata) in enumerate(zip(page["ids"], page["metadatas"])):
+                    metadata = metadata or {}
+                    memory_id = metadata.get("memory_id", int(chunk_id.split(":")[0]))
+                    # 快照之后才创建的记忆不导出
+                    if memory_id not in memory_ids:
+                        continue
+                    keep.append(i)
+                    chunk_ids.append(chunk_id)
+                    chunk_hashes.append(metadata.get("chunk_hash"))
+                    columns["memory_id"].append(memory_id)
+                    for name in INT_COLUMNS[1:]:
+                        value = metadata.get(name)
+                        columns[name].append(-1 if value is None else value)
+                if keep:
+                    matrix = np.asarray(page["embeddings"], dtype=np.float32)[keep].astype(dtype)
+                    dim = matrix.shape[1]
+                    raw.write(matrix.tobytes())
+                seen += len(page["ids"])
+                if progress is not None:
+                    progress(seen, total)
+
+        # 3. 快照之后被修改或删除的记忆（向量与快照不一致）：导入后重新同步
+        changed = sqlite_db.get_changed_memory_ids(snapshot_job_id) & memory_ids
+        changed |= {row[0] for row in snapshot.execute(
+            "SELECT DISTINCT memory_id FROM index_jobs WHERE status IN ('pending', 'running')"
+        )}
+        changed |= _incomplete_memories(memory_ids, columns["memory_id"], columns["total_chunks"])
+        now = datetime.now().isoformat()
+        snapshot.execute("UPDATE index_jobs SET status = 'pending' WHERE status = 'running'")
+        snapshot.executemany(
+            "INSERT INTO index_jobs (memory_id, op, status, attempts, created_at, updated_at) "
+            "VALUES (?, 'index', 'pending', 0, ?, ?)",
+            [(memory_id, now, now) for memory_id in changed]
+        )
+        # 检查点只对本机的向量库有效
+        snapshot.execute("DELETE FROM meta WHERE key LIKE 'fsck_%'")
+        snapshot.commit()
+        snapshot.close()
+
+        rows = len(chunk_ids)
+        manifest = {
+            "format": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "created_at": now,
+            "embedding_model": settings.embedding_model,
+            "chunking_mode": settings.chunking_mode,
+            "dtype": dtype,
+            "dim": dim or 0,
+            "memories": len(memory_ids),
+            "chunks": rows,
+            "reindex": len(changed)
+        }
+
+        # 4. 写入归档（向量矩阵已是二进制，不再压缩）
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+            zf.writestr("manifest.json", json.dumps(manifest, ensure_ascii=False, indent=2))
+            zf.write(snapshot_path, "memories.db")
+            zf.writestr("chunks/ids.json", json.dumps(chunk_ids))
+            zf.writestr("chunks/chunk_hash.json", json.dumps(chunk_hashes))
+            for name, values in columns.items():
+                with zf.open(f"chunks/{name}.npy", "w", force_zip64=True) as f:
+                    np.save(f, np.asarray(values, dtype=np.int64))
+            with zf.open("embeddings.npy", "w", force_zip64=True) as f:
+                np.lib.format.write_array_header_1_0(f, {
+                    "descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+                    "fortran_order": False,
+                    "shape": (rows, dim or 0)
+                })
+                with open(raw_path, "rb") as raw:
+                    shutil.copyfileobj(raw, f, 1024 * 1024)
+
+    return manifest
+
+def read_manifest(path: str) -> Dict:
+    """读取并校验归档的 manifest"""
+    with zipfile.ZipFile(path) as zf:
+        manifest = json.loads(zf.read("manifest.json"))
+    if manifest.get("format") != ARCHIVE_FORMAT:
+        raise ValueError("不是 mymem 导出的归档文件")
+    if manifest.get("version", 0) > ARCHIVE_VERSION:
+        raise ValueError(f"归档版本 {manifest['version']} 高于当前支持的版本 {ARCHIVE_VERSION}，请升级 mymem")
+    return manifest
+
+def _assign_new_instance_id(sqlite_db: SQLiteDB):
+    """
+    导入后使用新的实例 ID：原实例创建的记忆记为从原实例同步而来，
+    之后与原实例互相同步时按 (origin, origin_id) 对应，不会重复创建
+    """
+    old_instance_id = sqlite_db.instance_id
+    sqlite_db.conn.execute(
+        "UPDATE memories SET origin = ?, origin_id = id WHERE origin IS NULL", (old_instance_id,)
+    )
+    sqlite_db.conn.execute(
+        "UPDATE tombstones SET origin = ?, origin_id = memory_id WHERE origin IS NULL", (old_instance_id,)
+    )
+    sqlite_db.conn.execute("UPDATE meta SET value = ? WHERE key = 'instance_id'", (uuid.uuid4().hex,))
+    sqlite_db.conn.commit()
+
+def import_archive(path: str, chroma_db: ChromaDB, db_path: str = None,
+                   progress: Optional[Callable[[int, int], None]] = None) -> Dict:
+    """
+    导入快照（覆盖当前的 SQLite 数据库和向量库，需在服务停止时执行）
+
+    模型名称一致时直接批量写入向量，不做模型推理；不一致时跳过向量，
+    为全部记忆写入待处理的索引日志，由服务启动后的后台索引队列重新向量化
+
+    Args:
+        path: 归档文件路径
+        chroma_db: 向量库（会被清空）
+        db_path: 数据库文件路径，默认使用 settings.db_path
+        progress: 进度回调 progress(已导入块数, 总块数)
+
+    Returns:
+        manifest 字典，附加 "vectors_loaded"（是否直接导入了向量）
+    """
+    if db_path is None:
+        db_path = settings.db_path
+    manifest = read_manifest(path)
+    reuse_vectors = manifest["embedding_model"] == settings.embedding_model and manifest["chunks"] > 0
+
+    with tempfile.TemporaryDirectory(prefix="mymem-import-") as tmp, zipfile.ZipFile(path) as zf:
+        # 1. 替换 SQLite 数据库
+        zf.extract("memories.db", tmp)
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+        shutil.move(os.path.join(tmp, "memories.db"), db_path)
+        sqlite_db = SQLiteDB(db_path)
+        _assign_new_instance_id(sqlite_db)
+
+        # 2. 清空向量库
+        chroma_db.reset()
+
+        if reuse_vectors:
+            # 3. 直接写入向量（解压后以内存映射方式分批读取）
+            zf.extract("embeddings.npy", tmp)
+            embeddings = np.load(os.path.join(tmp, "embeddings.npy"), mmap_mode="r")
+            chunk_ids = json.loads(zf.read("chunks/ids.json"))
+            chunk_hashes = json.loads(zf.read("chunks/chunk_hash.json"))
+            columns = {}
+            for name in INT_COLUMNS:
+                with zf.open(f"chunks/{name}.npy") as f:
+                    columns[name] = np.load(f).tolist()
+            titles = dict(sqlite_db.conn.execute("SELECT id, title FROM memories").fetchall())
+
+            total = len(chunk_ids)
+            step = min(PAGE_SIZE, getattr(chroma_db.client, "max_batch_size", PAGE_SIZE))
+            for offset in range(0, total, step):
+                end = min(offset + step, total)
+                metadatas = []
+                for i in range(offset, end):
+                    metadata = {"title": titles.get(columns["memory_id"][i], "")}
+                    for name in INT_COLUMNS:
+                        if columns[name][i] != -1:
+                            metadata[name] = columns[name][i]
+                    if chunk_hashes[i]:
+                        metadata["chunk_hash"] = chunk_hashes[i]
+                    metadatas.append(metadata)
+                chroma_db.add_vectors(
+                    ids=chunk_ids[offset:end],
+                    embeddings=np.asarray(embeddings[offset:end], dtype=np.float32),
+                    metadatas=metadatas
+                )
+                if progress is not None:
+                    progress(end, total)
+            del embeddings
+        else:
+            # 模型不同，向量不可复用：全部交给后台索引队列重新向量化
+            now = datetime.now().isoformat()
+            sqlite_db.conn.execute(
+                "INSERT INTO index_jobs (memory_id, op, status, attempts, created_at, updated_at) "
+                "SELECT id, 'index', 'pending', 0, ?, ? FROM memories",
+                (now, now)
+            )
+            sqlite_db.conn.execute("UPDATE memories SET indexing_status = 'pending'")
+            sqlite_db.conn.commit()
+        sqlite_db.conn.close()
+
+    manifest["vectors_loaded"] = reuse_vectors
+    return manifest
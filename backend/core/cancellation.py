@@ -0,0 +1,58 @@
+"""
+请求级取消
+
+CancelScope 随请求传入搜索和写入流水线，在各阶段（排队、向量化、向量检索、获取记忆、排序）之间调用
+checkpoint()：客户端已断开连接或已超过客户端给出的截止时间时抛出 RequestCancelled，放弃剩余阶段，
+不再为已经没人等待的结果占用 CPU。
+
+取消标志由事件循环线程设置、工作线程读取（单个属性赋值），不需要加锁
+"""
+import time
+from typing import Optional
+
+class RequestCancelled(Exception):
+    """请求已被放弃：reason 为 disconnected（客户端断开）或 deadline（超过截止时间），stage 为放弃前未执行的阶段"""
+
+    def __init__(self, reason: str, stage: str):
+        super().__init__(f"request cancelled before {stage} ({reason})")
+        self.reason = reason
+        self.stage = stage
+
+class CancelScope:
+    """一个请求的取消状态：截止时间 + 取消标志"""
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Args:
+            timeout: 从现在起的超时秒数，None 表示没有截止时间（只在客户端断开时取消）
+        """
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self.reason: Optional[str] = None
+
+    def cancel(self, reason: str = "disconnected"):
+        """标记请求已被放弃（只记录第一次的原因）"""
+        if self.reason is None:
+            self.reason = reason
+
+    def remaining(self) -> Optional[float]:
+        """距截止时间的秒数，没有截止时间时返回 None"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def check(self, stage: str):
+        """
+        开始 stage 阶段前检查
+
+        Raises:
+            RequestCancelled: 客户端已断开或已超过截止时间
+        """
+        if self.reason is None and self.deadline is not None and time.monotonic() >= self.deadline:
+            self.reason = "deadline"
+        if self.reason is not None:
+            raise RequestCancelled(self.reason, stage)
+
+def checkpoint(cancel: Optional[CancelScope], stage: str):
+    """阶段之间的取消检查点（cancel 为 None 时不检查，命令行等非请求调用方不传）"""
+    if cancel is not None:
+        cancel.check(stage)
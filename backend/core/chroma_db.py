@@ -1,34 +1,225 @@
 """
 ChromaDB 简单封装
 """
-import chromadb
-from chromadb.config import Settings
+import contextlib
+import sqlite3
+import threading
+import time
 from typing import List, Dict, Optional
 import numpy as np
 import os
 from ..config import settings
 
+try:
+    import fcntl
+except ImportError:
+    # Windows 不支持多进程模式，不需要跨进程锁
+    fcntl = None
+
 class ChromaDB:
-    """ChromaDB 简单封装"""
+    """ChromaDB 简单封装（首次访问时才导入 chromadb 并打开向量库）"""
+
+    # 只读副本检查向量库是否有新写入的最小间隔（秒）
+    REFRESH_INTERVAL = 1.0
+    # 只读副本两次重新打开的最小间隔（秒）：每次重新打开都要重新加载 HNSW 索引
+    REOPEN_INTERVAL = 5.0
+    # 发现新写入后等待写入日志序号稳定的间隔和最长等待（秒），连续写入（如批量导入）合并为一次重新打开
+    REFRESH_DEBOUNCE = 0.5
+    REFRESH_MAX_DELAY = 5.0
+    # 重新打开后旧的 chromadb System 再保留的秒数，让仍在使用旧集合的查询完成后再停止
+    RETIRED_SYSTEM_GRACE = 30.0
 
-    def __init__(self, persist_dir: str = None):
+    def __init__(self, persist_dir: str = None, read_only: bool = False):
         """
-        初始化 ChromaDB 客户端
+        初始化 ChromaDB 客户端（延迟到首次使用或调用 load() 时）
 
         Args:
             persist_dir: 持久化目录路径，默认使用 settings.chroma_dir
+            read_only: 只读副本（多进程模式下的 reader worker）：不写入，
+                其他进程写入后通过 refresh() 重新打开以读到最新数据
         """
         if persist_dir is None:
             persist_dir = settings.chroma_dir
+        self.persist_dir = persist_dir
+        self.read_only = read_only
+        self._client = None
+        self._collection = None
+        # 当前客户端的 chromadb System（重新打开后需要停止旧的）
+        self._system = None
+        self._lock = threading.Lock()
+        # 打开向量库的耗时（秒），未加载时为 None
+        self.load_seconds: Optional[float] = None
+        # 打开时向量库写入日志的序号（只读副本据此判断是否需要重新打开）
+        self._loaded_seq = 0
+        self._last_refresh_check = 0.0
+        self._opened_at = 0.0
+        # 同一时间只有一个后台线程重新打开
+        self._refresh_lock = threading.Lock()
 
-        self.client = chromadb.PersistentClient(
-            path=persist_dir,
-            settings=Settings(anonymized_telemetry=False)
-        )
-        self.collection = self.client.get_or_create_collection(
-            name="memories",
-            metadata={"hnsw:space": "cosine"}
-        )
+    @property
+    def is_loaded(self) -> bool:
+        return self._collection is not None
+
+    def load(self):
+        """导入 chromadb 并打开向量库（可重复调用，多线程同时调用时只加载一次）"""
+        if self._collection is not None:
+            return
+        with self._lock:
+            if self._collection is not None:
+                return
+            started = time.perf_counter()
+            self._open()
+            self.load_seconds = time.perf_counter() - started
+
+    def _open(self):
+        """
+        打开向量库（调用方持有 self._lock）
+
+        打开时 chromadb 会把上次持久化之后的写入日志重放进内存索引，并可能把索引写回磁盘，
+        因此在跨进程写锁内进行，避免与写入进程同时写索引文件
+        """
+        import chromadb
+        from chromadb.api.client import SharedSystemClient
+        from chromadb.config import Settings
+
+        retired = None
+        with self._write_lock():
+            self._loaded_seq = self._queue_seq()
+            if self._client is not None:
+                # chromadb 按路径缓存客户端状态，重新打开时需要清除才会重新读取磁盘；
+                # 清除缓存不会停止旧的 System，需要自己停止，否则每次重新打开都留下一整套段文件句柄
+                retired = self._system
+                SharedSystemClient.clear_system_cache()
+            client = chromadb.PersistentClient(
+                path=self.persist_dir,
+                settings=Settings(anonymized_telemetry=False)
+            )
+            collection = client.get_or_create_collection(
+                name="memories",
+                metadata={"hnsw:space": "cosine"}
+            )
+            # 同一进程中打开其他向量库时也可能清除缓存，这里先记下本客户端的 System
+            system = client._system
+        # 查询每次只读取一次 self._collection，替换是单个属性赋值；进行中的查询继续使用旧的集合对象
+        self._client = client
+        self._system = system
+        self._collection = collection
+        self._opened_at = time.monotonic()
+        if retired is not None:
+            timer = threading.Timer(self.RETIRED_SYSTEM_GRACE, self._stop_system, args=(retired,))
+            timer.daemon = True
+            timer.start()
+
+    @staticmethod
+    def _stop_system(system):
+        try:
+            system.stop()
+        except Exception as e:
+            print(f"[向量库] 停止旧的向量库实例失败: {e}", flush=True)
+
+    def _queue_seq(self) -> int:
+        """向量库写入日志（chroma.sqlite3 的 embeddings_queue）的最新序号，每次增删改向量都会增加"""
+        path = os.path.join(self.persist_dir, "chroma.sqlite3")
+        if not os.path.exists(path):
+            return 0
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            row = conn.execute("SELECT MAX(seq_id) FROM embeddings_queue").fetchone()
+        except sqlite3.OperationalError:
+            # 尚未建表
+            return 0
+        finally:
+            conn.close()
+        return row[0] or 0
+
+    @contextlib.contextmanager
+    def _write_lock(self):
+        """
+        跨进程写锁（向量库目录下的锁文件）
+
+        多进程模式下写入进程的每次写入、只读副本的每次重新打开都在锁内进行，
+        两者不会同时写 HNSW 索引文件
+        """
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.persist_dir, "mymem-write.lock"), "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _check_writable(self):
+        if self.read_only:
+            raise RuntimeError("只读副本不能写入向量库（多进程模式下由 writer worker 写入）")
+
+    def refresh(self):
+        """
+        只读副本：其他进程写入过向量库时重新打开，读到最新数据
+
+        不阻塞调用方（在事件循环中调用）：最多每 REFRESH_INTERVAL 秒启动一次后台检查，
+        检查和重新打开都在后台线程中进行，完成前查询继续使用当前打开的集合
+        """
+        if not self.read_only or self._collection is None:
+            return
+        now = time.monotonic()
+        if now - self._last_refresh_check < self.REFRESH_INTERVAL:
+            return
+        self._last_refresh_check = now
+        if not self._refresh_lock.acquire(blocking=False):
+            # 上一次后台检查还没结束
+            return
+        threading.Thread(target=self._refresh_in_background, name="chroma-refresh", daemon=True).start()
+
+    def _refresh_in_background(self):
+        """
+        后台检查并重新打开（调用方已获取 self._refresh_lock）
+
+        两次重新打开至少间隔 REOPEN_INTERVAL 秒；发现新写入后等写入日志序号稳定（最多 REFRESH_MAX_DELAY 秒）
+        再重新打开，写入进程连续写入时只重新加载一次索引
+        """
+        try:
+            seq = self._queue_seq()
+            if seq <= self._loaded_seq:
+                return
+            wait = self._opened_at + self.REOPEN_INTERVAL - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            deadline = time.monotonic() + self.REFRESH_MAX_DELAY
+            while time.monotonic() < deadline:
+                time.sleep(self.REFRESH_DEBOUNCE)
+                latest = self._queue_seq()
+                if latest == seq:
+                    break
+                seq = latest
+            with self._lock:
+                self._open()
+        except Exception as e:
+            print(f"[向量库] 只读副本重新打开失败: {e}", flush=True)
+        finally:
+            self._refresh_lock.release()
+
+    @property
+    def client(self):
+        self.load()
+        return self._client
+
+    @property
+    def collection(self):
+        self.load()
+        return self._collection
+
+    def reset(self):
+        """清空向量库（删除并重建集合）"""
+        self._check_writable()
+        client = self.client
+        with self._write_lock():
+            client.delete_collection(name="memories")
+            self._collection = client.get_or_create_collection(
+                name="memories",
+                metadata={"hnsw:space": "cosine"}
+            )
 
     def add_vectors(self, ids: List[str], embeddings: np.ndarray, metadatas: List[Dict]):
         """
@@ -40,12 +231,15 @@ class ChromaDB:
             metadatas: 元数据列表
         """
         # 将 numpy 数组转换为列表
+        self._check_writable()
         embeddings_list = embeddings.tolist() if isinstance(embeddings, np.ndarray) else embeddings
-        self.collection.add(
-            ids=ids,
-            embeddings=embeddings_list,
-            metadatas=metadatas
-        )
+        collection = self.collection
+        with self._write_lock():
+            collection.add(
+                ids=ids,
+                embeddings=embeddings_list,
+                metadatas=metadatas
+            )
 
     def search(self, query_embedding: np.ndarray, top_k: int = 3) -> List[Dict]:
         """
@@ -60,24 +254,108 @@ class ChromaDB:
         """
         # 将 numpy 数组转换为列表
         query_list = query_embedding.tolist() if isinstance(query_embedding, np.ndarray) else query_embedding
+        return self.search_many([query_list], top_k=top_k)[0]
+
+    def search_many(self, query_embeddings, top_k: int = 3) -> List[List[Dict]]:
+        """
+        多查询向量搜索（一次 collection.query 调用）
+
+        Args:
+            query_embeddings: 查询向量矩阵或向量列表
+            top_k: 每个查询返回结果数量（同 search）
+
+        Returns:
+            与查询顺序一致的搜索结果列表，每项格式同 search
+        """
+        query_list = query_embeddings.tolist() if isinstance(query_embeddings, np.ndarray) else query_embeddings
+        if len(query_list) == 0:
+            return []
         # 增加返回数量，因为可能需要去重
         results = self.collection.query(
-            query_embeddings=[query_list],
+            query_embeddings=query_list,
             n_results=top_k * 3  # 多返回一些，以便去重后有足够的结果
         )
 
         # 格式化返回结果
-        formatted_results = []
-        if results["ids"] and len(results["ids"][0]) > 0:
-            for i, chunk_id in enumerate(results["ids"][0]):
-                metadata = results["metadatas"][0][i] if results["metadatas"] and results["metadatas"][0] else {}
-                formatted_results.append({
-                    "id": chunk_id,  # 保持原始ID格式 "memory_id:chunk_index"
-                    "distance": results["distances"][0][i] if results["distances"] else None,
-                    "metadata": metadata
-                })
-
-        return formatted_results
+        all_results = []
+        for q in range(len(query_list)):
+            formatted_results = []
+            if results["ids"] and len(results["ids"][q]) > 0:
+                for i, chunk_id in enumerate(results["ids"][q]):
+                    metadata = results["metadatas"][q][i] if results["metadatas"] and results["metadatas"][q] else {}
+                    formatted_results.append({
+                        "id": chunk_id,  # 保持原始ID格式 "memory_id:块标识"
+                        "distance": results["distances"][q][i] if results["distances"] else None,
+                        "metadata": metadata
+                    })
+            all_results.append(formatted_results)
+
+        return all_results
+
+    def get_memory_vectors(self, memory_id: int) -> Dict:
+        """
+        获取某条记忆已存储的全部块向量
+
+        Args:
+            memory_id: 记忆 ID
+
+        Returns:
+            包含 ids、embeddings、metadatas 的字典（同 collection.get）
+        """
+        results = self.collection.get(
+            where={"memory_id": memory_id},
+            include=["embeddings", "metadatas"]
+        )
+        if not results["ids"]:
+            # 兼容旧格式：纯数字 ID 且没有 memory_id 元数据
+            results = self.collection.get(
+                ids=[str(memory_id)],
+                include=["embeddings", "metadatas"]
+            )
+        return results
+
+    def list_ids(self) -> List[str]:
+        """全部块 ID（排序，不读取元数据和向量）"""
+        return sorted(self.collection.get(include=[])["ids"])
+
+    def iter_pages(self, ids: List[str], include: List[str], page_size: int = 1000):
+        """
+        按给定的块 ID 分批读取
+
+        按 limit/offset 分页时，遍历期间的写入会让后面的页整体移位，块被跳过或重复读取；
+        先取得 ID 列表（list_ids）再按 ID 读取不受影响：之后新增的块不在列表中，期间删除的块不返回
+
+        Yields:
+            collection.get 的结果（ids 及 include 中的字段）
+        """
+        for offset in range(0, len(ids), page_size):
+            page = self.collection.get(ids=ids[offset:offset + page_size], include=include)
+            if page["ids"]:
+                yield page
+
+    def iter_metadata_pages(self, page_size: int = 1000):
+        """
+        分页遍历全部块的元数据（不读取向量，按 ID 分页，遍历期间有写入也不会跳过或重复）
+
+        Yields:
+            (块 ID 列表, 元数据列表)
+        """
+        for page in self.iter_pages(self.list_ids(), ["metadatas"], page_size):
+            yield page["ids"], page["metadatas"]
+
+    def update_metadatas(self, ids: List[str], metadatas: List[Dict]):
+        """
+        只更新元数据（保留已有向量）
+
+        Args:
+            ids: 向量 ID 列表
+            metadatas: 元数据列表
+        """
+        if ids:
+            self._check_writable()
+            collection = self.collection
+            with self._write_lock():
+                collection.update(ids=ids, metadatas=metadatas)
 
     def delete(self, ids: List[str]):
         """
@@ -87,7 +365,10 @@ class ChromaDB:
             ids: 要删除的向量 ID 列表
         """
         if ids:
-            self.collection.delete(ids=ids)
+            self._check_writable()
+            collection = self.collection
+            with self._write_lock():
+                collection.delete(ids=ids)
 
     def count(self) -> int:
         """
@@ -0,0 +1,143 @@
+"""
+重复记忆检测：写入时的精确/近重复检查，以及存量数据的重复分组（mymem dedup）
+"""
+from typing import Callable, Dict, List, Optional
+import numpy as np
+from .chroma_db import ChromaDB
+from .sqlite_db import SQLiteDB
+
+class DuplicateDetector:
+    """
+    重复检测
+
+    精确重复：内容哈希相同（content_hash 索引查询）
+    近重复：记忆 A 的每个块在记忆 B 中最相似块的相似度（1 - 余弦距离）取平均，
+    不低于阈值即认为 A 与 B 近重复（A 的内容基本都能在 B 中找到）
+    """
+
+    # 每个块检索的近邻块数
+    NEIGHBORS = 5
+    # 扫描存量数据时每页读取的块数
+    PAGE_SIZE = 500
+
+    def __init__(self, sqlite_db: SQLiteDB, chroma_db: ChromaDB, threshold: float = 0.95):
+        """
+        Args:
+            sqlite_db: 数据库
+            chroma_db: 向量库
+            threshold: 近重复的相似度阈值
+        """
+        self.sqlite_db = sqlite_db
+        self.chroma_db = chroma_db
+        self.threshold = threshold
+
+    def find_exact(self, content: str) -> Optional[int]:
+        """查找内容完全相同的记忆"""
+        return self.sqlite_db.find_memory_by_content_hash(self.sqlite_db.content_hash(content))
+
+    def find_near(self, embeddings: np.ndarray, exclude_id: Optional[int] = None) -> Optional[Dict]:
+        """
+        用一条记忆的块向量查找与之近重复的已有记忆
+
+        Args:
+            embeddings: 块向量矩阵
+            exclude_id: 排除的记忆 ID（检查已入库的记忆时排除自身）
+
+        Returns:
+            {"id": 最相似的记忆 ID, "similarity": 相似度}，没有超过阈值的返回 None
+        """
+        if len(embeddings) == 0:
+            return None
+        results_per_chunk = self.chroma_db.search_many(embeddings, top_k=self.NEIGHBORS)
+        scores = self._coverage(results_per_chunk, len(embeddings), exclude_id)
+        if not scores:
+            return None
+        memory_id, similarity = max(scores.items(), key=lambda item: item[1])
+        if similarity < self.threshold:
+            return None
+        return {"id": memory_id, "similarity": similarity}
+
+    @staticmethod
+    def _coverage(results_per_chunk: List[List[Dict]], total_chunks: int,
+                  exclude_id: Optional[int] = None) -> Dict[int, float]:
+        """每个候选记忆对查询记忆各块的最高相似度之和 / 查询记忆的块数"""
+        best = {}
+        for chunk_results in results_per_chunk:
+            chunk_best = {}
+            for result in chunk_results:
+                metadata = result["metadata"] or {}
+                memory_id = metadata.get("memory_id", int(result["id"].split(":")[0]))
+                if memory_id == exclude_id:
+                    continue
+                similarity = 1 - result["distance"]
+                if similarity > chunk_best.get(memory_id, 0.0):
+                    chunk_best[memory_id] = similarity
+            for memory_id, similarity in chunk_best.items():
+                best[memory_id] = best.get(memory_id, 0.0) + similarity
+        return {memory_id: total / total_chunks for memory_id, total in best.items()}
+
+    def find_clusters(self, progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]:
+        """
+        找出存量数据中的重复分组
+
+        按块 ID 分页读取全部块向量（服务运行时的写入不会让块被跳过或重复计入），每页一次多查询检索近邻块，按记忆汇总相似度；
+        精确重复直接用内容哈希分组，两者合并（并查集）成重复组
+
+        Args:
+            progress: 进度回调 progress(已扫描块数, 总块数)
+
+        Returns:
+            重复组列表，每组 {"ids": [记忆 ID...], "pairs": [{"a", "b", "similarity", "exact"}...]}，
+            按组大小降序
+        """
+        pairs = {}
+        for group in self.sqlite_db.get_duplicate_content_groups():
+            for other in group[1:]:
+                pairs[(group[0], other)] = {"a": group[0], "b": other, "similarity": 1.0, "exact": True}
+
+        # memory_id -> 块数；(查询记忆, 候选记忆) -> 相似度之和
+        chunk_counts = {}
+        sums = {}
+        all_ids = self.chroma_db.list_ids()
+        total = len(all_ids)
+        scanned = 0
+        for page in self.chroma_db.iter_pages(all_ids, ["embeddings", "metadatas"], self.PAGE_SIZE):
+            scanned += len(page["ids"])
+            results_per_chunk = self.chroma_db.search_many(page["embeddings"], top_k=self.NEIGHBORS)
+            for chunk_id, metadata, chunk_results in zip(page["ids"], page["metadatas"], results_per_chunk):
+                memory_id = (metadata or {}).get("memory_id", int(chunk_id.split(":")[0]))
+                chunk_counts[memory_id] = chunk_counts.get(memory_id, 0) + 1
+                for other, similarity in self._coverage([chunk_results], 1, exclude_id=memory_id).items():
+                    sums[(memory_id, other)] = sums.get((memory_id, other), 0.0) + similarity
+            if progress is not None:
+                progress(scanned, total)
+
+        for (memory_id, other), total_similarity in sums.items():
+            similarity = total_similarity / chunk_counts[memory_id]
+            if similarity < self.threshold:
+                continue
+            key = (min(memory_id, other), max(memory_id, other))
+            if key not in pairs or (not pairs[key]["exact"] and similarity > pairs[key]["similarity"]):
+                pairs[key] = {"a": key[0], "b": key[1], "similarity": round(similarity, 4), "exact": False}
+
+        # 并查集合并成组
+        parent = {}
+
+        def find(x):
+            parent.setdefault(x, x)
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        for a, b in pairs:
+            parent[find(a)] = find(b)
+        groups = {}
+        for a, b in pairs:
+            groups.setdefault(find(a), {"ids": set(), "pairs": []})
+            groups[find(a)]["ids"].update((a, b))
+            groups[find(a)]["pairs"].append(pairs[(a, b)])
+
+        clusters = [{"ids": sorted(group["ids"]), "pairs": group["pairs"]} for group in groups.values()]
+        clusters.sort(key=lambda cluster: (-len(cluster["ids"]), cluster["ids"][0]))
+        return clusters
@@ -7,23 +7,56 @@ import os
 # 方案：使用 ModelScope (阿里) 的镜像，通常比 hf-mirror 更稳定
 os.environ["HF_ENDPOINT"] = "https://modelscope.cn/api/v1/models/server/huggingface"
 
-from sentence_transformers import SentenceTransformer
+import threading
+import time
 import numpy as np
+from typing import List, Optional
 from ..config import settings
 
+# 已加载的模型（按模型名共享）：多进程模式下主进程在 fork 前加载，各 worker 写时复制共享同一份权重
+_loaded_models = {}
+
 class Embedding:
-    """Embedding 简单封装"""
+    """Embedding 简单封装（首次向量化或调用 load() 时才导入 sentence_transformers 并加载模型）"""
 
     def __init__(self, model_name: str = None):
         """
-        初始化 Embedding 模型
+        初始化 Embedding 模型（延迟加载）
         """
         if model_name is None:
             model_name = settings.embedding_model
+        self.model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+        # 加载模型的耗时（秒），未加载时为 None
+        self.load_seconds: Optional[float] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._model is not None
+
+    def load(self):
+        """加载模型（可重复调用，多线程同时调用时只加载一次）"""
+        if self._model is not None:
+            return
+        with self._lock:
+            if self._model is not None:
+                return
+            started = time.perf_counter()
+            model = _loaded_models.get(self.model_name)
+            if model is None:
+                from sentence_transformers import SentenceTransformer
 
-        print(f"🔄 正在从镜像站加载/下载模型: {model_name}...")
-        self.model = SentenceTransformer(model_name)
-        print("✅ 模型加载成功")
+                print(f"🔄 正在从镜像站加载/下载模型: {self.model_name}...", flush=True)
+                model = _loaded_models[self.model_name] = SentenceTransformer(self.model_name)
+                print(f"✅ 模型加载成功 ({time.perf_counter() - started:.1f}s)", flush=True)
+            self._model = model
+            self.load_seconds = time.perf_counter() - started
+
+    @property
+    def model(self):
+        self.load()
+        return self._model
 
     def encode(self, text: str) -> np.ndarray:
         """
@@ -37,3 +70,16 @@ class Embedding:
         """
         return self.model.encode(text)
 
+    def encode_batch(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
+        """
+        批量生成向量（一次前向计算处理多条文本）
+
+        Args:
+            texts: 输入文本列表
+            batch_size: 每次前向计算的文本数
+
+        Returns:
+            向量矩阵，形状为 (len(texts), 维度)
+        """
+        return self.model.encode(texts, batch_size=batch_size)
+
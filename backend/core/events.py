@@ -0,0 +1,112 @@
+"""
+记忆变更事件广播（/api/v1/events 的 SSE 推送）
+"""
+import asyncio
+import threading
+from typing import Dict, List
+from .sqlite_db import SQLiteDB
+
+class Subscription:
+    """
+    单个订阅者
+
+    事件放入有界队列；队列满时不再放入并标记为 lagging，
+    由订阅者从 SQLite 的变更序号补读，慢客户端不会占用无限内存
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, buffer_size: int):
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=buffer_size)
+        self.lagging = False
+
+    def _put(self, events: List[Dict]):
+        """在订阅者所在的事件循环中执行"""
+        for event in events:
+            if self.lagging:
+                return
+            try:
+                self.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                self.lagging = True
+
+class EventBroker:
+    """
+    事件广播
+
+    变更的持久记录就是 SQLite 中的变更序号（seq）和墓碑：写入提交后调用 publish()，
+    一次读取新增的变更分发给所有订阅者；订阅者断线重连时按序号从 SQLite 补读
+    """
+
+    # 每个订阅者缓冲的事件数
+    BUFFER_SIZE = 256
+    # 每次从 SQLite 读取的变更数
+    READ_BATCH = 500
+
+    def __init__(self, sqlite_db: SQLiteDB, buffer_size: int = None):
+        """
+        Args:
+            sqlite_db: 数据库
+            buffer_size: 每个订阅者缓冲的事件数
+        """
+        self.sqlite_db = sqlite_db
+        self.buffer_size = buffer_size or self.BUFFER_SIZE
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._last_seq = None
+
+    def read_events(self, since: int, limit: int = None) -> List[Dict]:
+        """从 SQLite 读取序号大于 since 的事件"""
+        changes = self.sqlite_db.get_changes(since, limit or self.READ_BATCH, with_content=False)
+        return [self._to_event(change) for change in changes]
+
+    @staticmethod
+    def _to_event(change: Dict) -> Dict:
+        """变更记录转为事件：create / update / delete"""
+        if change["op"] == "delete":
+            op = "delete"
+        else:
+            op = "update" if change["updated_at"] else "create"
+        return {
+            "seq": change["seq"],
+            "op": op,
+            "id": change["memory_id"],
+            "timestamp": change["updated_at"] or change["created_at"]
+        }
+
+    def subscribe(self) -> Subscription:
+        """在当前事件循环中注册订阅者"""
+        subscription = Subscription(asyncio.get_running_loop(), self.buffer_size)
+        with self._lock:
+            if self._last_seq is None:
+                self._last_seq = self.sqlite_db.get_max_change_seq()
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """注销订阅者"""
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def publish(self):
+        """
+        分发新提交的变更（可在任意线程调用，写入提交后调用）
+
+        没有订阅者时不读取数据库
+        """
+        with self._lock:
+            if not self._subscribers:
+                self._last_seq = None
+                return
+            events = []
+            while True:
+                batch = self.read_events(self._last_seq)
+                if not batch:
+                    break
+                events.extend(batch)
+                self._last_seq = batch[-1]["seq"]
+                if len(batch) < self.READ_BATCH:
+                    break
+            if not events:
+                return
+            for subscription in self._subscribers:
+                subscription.loop.call_soon_threadsafe(subscription._put, events)
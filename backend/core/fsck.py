@@ -0,0 +1,174 @@
+"""
+SQLite 与 ChromaDB 一致性检查及修复（mymem fsck）
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+from .chroma_db import ChromaDB
+from .sqlite_db import SQLiteDB
+from .indexer import Indexer
+
+# 检查点（meta 表中的键）：上次检查通过时的最大索引日志 ID 及时间
+CHECKPOINT_JOB_ID_KEY = "fsck_job_id"
+CHECKPOINT_TIME_KEY = "fsck_checked_at"
+
+class ConsistencyChecker:
+    """
+    一致性检查
+
+    - missing：SQLite 中存在，但向量缺失或块数与 total_chunks 不符
+    - orphaned：向量的 memory_id 在 SQLite 中不存在
+    - pending：还有未完成的索引日志，交给后台索引队列处理，不算问题
+
+    每次增删改都会写入索引日志，检查通过后记录最大日志 ID 作为检查点，
+    下次只检查此后有日志的记忆；检查点早于日志保留期限时退回全量检查
+    """
+
+    # SQLite / ChromaDB 每页读取的条数
+    PAGE_SIZE = 500
+    # 修复时每批同步的记忆数
+    REPAIR_BATCH = 64
+
+    def __init__(self, sqlite_db: SQLiteDB, chroma_db: ChromaDB, retention_days: int = 7):
+        """
+        Args:
+            sqlite_db: 数据库
+            chroma_db: 向量库
+            retention_days: 索引日志保留天数（与后台索引队列一致），检查点超过该期限时全量检查
+        """
+        self.sqlite_db = sqlite_db
+        self.chroma_db = chroma_db
+        self.retention_days = retention_days
+
+    def check(self, full: bool = False) -> Dict:
+        """
+        检查一致性
+
+        Args:
+            full: 忽略检查点，全量检查
+
+        Returns:
+            {"mode": "full"/"incremental", "checked": 检查的记忆数, "missing": [...],
+             "orphaned": [...], "pending": [...], "job_id": 本次检查对应的最大日志 ID}
+        """
+        job_id = self.sqlite_db.get_max_index_job_id()
+        pending = self.sqlite_db.get_pending_index_memory_ids()
+        checkpoint = None if full else self._load_checkpoint()
+
+        if checkpoint is None:
+            report = self._check_full(pending)
+        else:
+            report = self._check_changed(checkpoint, pending)
+        report["pending"] = sorted(pending)
+        report["job_id"] = job_id
+        return report
+
+    def _load_checkpoint(self) -> Optional[int]:
+        """读取检查点，不存在或已超过日志保留期限时返回 None"""
+        job_id = self.sqlite_db.get_meta(CHECKPOINT_JOB_ID_KEY)
+        checked_at = self.sqlite_db.get_meta(CHECKPOINT_TIME_KEY)
+        if job_id is None or checked_at is None:
+            return None
+        if datetime.fromisoformat(checked_at) < datetime.now() - timedelta(days=self.retention_days):
+            # 之后的日志可能已被清理
+            return None
+        return int(job_id)
+
+    def save_checkpoint(self, job_id: int):
+        """记录检查点（检查通过或修复完成后调用）"""
+        self.sqlite_db.set_meta(CHECKPOINT_JOB_ID_KEY, str(job_id))
+        self.sqlite_db.set_meta(CHECKPOINT_TIME_KEY, datetime.now().isoformat())
+
+    def _chunk_counts(self, memory_ids: List[int]) -> Dict[int, tuple]:
+        """获取一批记忆的 (实际块数, 元数据中的 total_chunks)"""
+        counts = {}
+        existing = self.chroma_db.collection.get(where={"memory_id": {"$in": memory_ids}}, include=["metadatas"])
+        for metadata in existing["metadatas"] or []:
+            memory_id = metadata["memory_id"]
+            found, expected = counts.get(memory_id, (0, metadata.get("total_chunks")))
+            counts[memory_id] = (found + 1, expected)
+        # 兼容旧格式（纯数字ID，整篇一个向量）
+        legacy = self.chroma_db.collection.get(ids=[str(memory_id) for memory_id in memory_ids], include=[])
+        for chunk_id in legacy["ids"]:
+            found, expected = counts.get(int(chunk_id), (0, None))
+            counts[int(chunk_id)] = (found + 1, expected)
+        return counts
+
+    def _find_missing(self, memory_ids: List[int], pending: set) -> List[int]:
+        """找出一批存在于 SQLite 的记忆中向量缺失或不完整的"""
+        counts = self._chunk_counts(memory_ids)
+        missing = []
+        for memory_id in memory_ids:
+            if memory_id in pending:
+                continue
+            found, expected = counts.get(memory_id, (0, None))
+            if found == 0 or (expected is not None and found != expected):
+                missing.append(memory_id)
+        return missing
+
+    def _check_full(self, pending: set) -> Dict:
+        """全量检查：分页遍历 SQLite 的记忆 ID 和 ChromaDB 的块元数据"""
+        missing = []
+        checked = 0
+        for page in self.sqlite_db.iter_memory_id_pages(self.PAGE_SIZE):
+            checked += len(page)
+            missing.extend(self._find_missing(page, pending))
+
+        orphaned = set()
+        for chunk_ids, metadatas in self.chroma_db.iter_metadata_pages(self.PAGE_SIZE):
+            page_ids = set()
+            for chunk_id, metadata in zip(chunk_ids, metadatas):
+                if metadata and "memory_id" in metadata:
+                    page_ids.add(metadata["memory_id"])
+                else:
+                    page_ids.add(int(chunk_id.split(":")[0]))
+            page_ids -= pending
+            orphaned |= page_ids - self.sqlite_db.get_existing_memory_ids(list(page_ids))
+
+        return {"mode": "full", "checked": checked, "missing": missing, "orphaned": sorted(orphaned)}
+
+    def _check_changed(self, checkpoint: int, pending: set) -> Dict:
+        """增量检查：只检查检查点之后有索引日志的记忆"""
+        changed = sorted(self.sqlite_db.get_changed_memory_ids(checkpoint) - pending)
+        missing = []
+        orphaned = []
+        for offset in range(0, len(changed), self.PAGE_SIZE):
+            page = changed[offset:offset + self.PAGE_SIZE]
+            existing = self.sqlite_db.get_existing_memory_ids(page)
+            missing.extend(self._find_missing([memory_id for memory_id in page if memory_id in existing], pending))
+            deleted = [memory_id for memory_id in page if memory_id not in existing]
+            if deleted:
+                counts = self._chunk_counts(deleted)
+                orphaned.extend(memory_id for memory_id in deleted if counts.get(memory_id, (0,))[0] > 0)
+
+        return {"mode": "incremental", "checked": len(changed), "missing": missing, "orphaned": orphaned}
+
+    def repair(self, report: Dict, indexer: Indexer, progress=None) -> int:
+        """
+        分批修复：缺失的重新向量化，孤立的删除向量
+
+        Args:
+            report: check() 的返回值
+            indexer: 向量索引
+            progress: 进度回调 progress(已修复数, 总数)
+
+        Returns:
+            修复的记忆数
+        """
+        targets = list(report["missing"]) + list(report["orphaned"])
+        for offset in range(0, len(targets), self.REPAIR_BATCH):
+            batch = targets[offset:offset + self.REPAIR_BATCH]
+            found = {memory["id"]: memory for memory in self.sqlite_db.get_memories_by_ids(batch)}
+            # 按 SQLite 当前状态同步：存在的重新向量化，不存在的删除向量
+            indexer.sync_memories({memory_id: found.get(memory_id) for memory_id in batch})
+            if progress is not None:
+                progress(min(offset + len(batch), len(targets)), len(targets))
+        return len(targets)
+
+    def enqueue_repair(self, report: Dict) -> int:
+        """
+        服务正在运行时的修复：不直接写向量库，为缺失和孤立的记忆写入索引日志，由服务的后台索引队列修复
+
+        Returns:
+            提交修复的记忆数
+        """
+        return self.sqlite_db.enqueue_index_jobs(list(report["missing"]) + list(report["orphaned"]))
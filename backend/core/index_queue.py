@@ -0,0 +1,183 @@
+"""
+后台索引队列（索引日志持久化在 SQLite 的 index_jobs 表中）
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+from .indexer import Indexer
+from .sqlite_db import SQLiteDB
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+def apply_index_jobs(db: SQLiteDB, memory_ids: List[int], apply: Optional[Callable[[], None]]) -> bool:
+    """
+    同步写入向量，并结束这些记忆由调用方认领的索引日志
+
+    写入失败时日志交还后台索引队列重试（SQLite 已提交，向量库最终会补齐）
+
+    Args:
+        db: 数据库
+        memory_ids: 记忆 ID 列表
+        apply: 写入向量的操作；为 None 时不写向量库，日志直接交给服务的后台索引队列
+               （服务运行时命令行不能写向量库：服务内存中的索引看不到这些向量，还可能用自己的索引覆盖它们）
+
+    Returns:
+        是否已同步完成
+    """
+    if apply is None:
+        db.release_memory_index_jobs(memory_ids)
+        return False
+    try:
+        apply()
+    except Exception as e:
+        logger.error(f"[索引日志] 同步写入向量失败，交由后台重试 (memory_ids={memory_ids[:10]}): {e}")
+        db.release_memory_index_jobs(memory_ids, error=str(e))
+        return False
+    db.finish_memory_index_jobs(memory_ids)
+    return True
+
+class IndexQueue:
+    """
+    后台索引队列
+
+    每次增删改记忆都会在同一 SQLite 事务中写入一条索引日志（index_jobs）。
+    异步写入的日志由后台线程处理；同步写入由请求自己处理，写入向量失败或
+    进程在写入前退出时，日志会回到队列由后台线程补做，保证两个库最终一致
+    """
+
+    # 单次领取并批量处理的任务数
+    CLAIM_BATCH = 32
+    # 每次向量化并写入 ChromaDB 的块数（用于汇报进度）
+    CHUNK_BATCH = 32
+    # 单个任务最多尝试次数
+    MAX_ATTEMPTS = 3
+    # 空闲时轮询间隔（秒）
+    POLL_INTERVAL = 5.0
+    # 已完成日志的保留天数（供 /api/v1/jobs 查询），空闲时每小时清理一次
+    JOB_RETENTION_DAYS = 7
+    PRUNE_INTERVAL = 3600.0
+
+    def __init__(self, indexer: Indexer, db_path: str = None, max_pending: int = None,
+                 poll_interval: float = None):
+        """
+        Args:
+            indexer: 向量索引
+            db_path: 数据库文件路径，默认使用 settings.db_path
+            max_pending: 排队任务上限，默认使用 settings.index_queue_max_pending
+            poll_interval: 空闲时轮询间隔（秒），默认使用 POLL_INTERVAL
+        """
+        self.indexer = indexer
+        # 后台线程使用独立连接，不重复建表
+        self.db = SQLiteDB(db_path, init_tables=False)
+        self.max_pending = max_pending if max_pending is not None else settings.index_queue_max_pending
+        self.poll_interval = poll_interval or self.POLL_INTERVAL
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._last_prune = 0.0
+
+    def start(self):
+        """启动后台线程（恢复上次未完成的任务）"""
+        if self._thread is not None:
+            return
+        recovered = self.db.reset_running_index_jobs()
+        if recovered:
+            logger.info(f"[索引队列] 恢复 {recovered} 个未完成的任务")
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="mymem-index-queue", daemon=True)
+        self._thread.start()
+        self._wakeup.set()
+
+    def stop(self, timeout: float = 10.0):
+        """停止后台线程（正在处理的任务会在下次启动时重试）"""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def notify(self):
+        """通知后台线程有新任务"""
+        self._wakeup.set()
+
+    def is_full(self) -> bool:
+        """排队任务是否已达上限"""
+        return self.db.count_index_jobs() >= self.max_pending
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                jobs = self.db.claim_index_jobs(self.CLAIM_BATCH)
+            except Exception as e:
+                logger.error(f"[索引队列] 领取任务失败: {e}")
+                jobs = []
+
+            if not jobs:
+                self._prune()
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+
+            self._process_batch(jobs)
+
+    def _prune(self):
+        """清理过期的已完成日志"""
+        now = time.monotonic()
+        if now - self._last_prune < self.PRUNE_INTERVAL:
+            return
+        self._last_prune = now
+        before = (datetime.now() - timedelta(days=self.JOB_RETENTION_DAYS)).isoformat()
+        try:
+            pruned = self.db.prune_index_jobs(before)
+            if pruned:
+                logger.info(f"[索引队列] 清理 {pruned} 条已完成的日志")
+        except Exception as e:
+            logger.error(f"[索引队列] 清理日志失败: {e}")
+
+    def _process_batch(self, jobs: list):
+        """
+        批量处理索引日志：同一记忆只按 SQLite 当前状态同步一次，
+        整批一次查询向量库、一次删除、新记忆一次向量化；整批失败时逐条重试以隔离错误
+        """
+        job_ids = [job["id"] for job in jobs]
+        memory_ids = list(dict.fromkeys(job["memory_id"] for job in jobs))
+        try:
+            found = {memory["id"]: memory for memory in self.db.get_memories_by_ids(memory_ids)}
+            self.indexer.sync_memories(
+                {memory_id: found.get(memory_id) for memory_id in memory_ids},
+                chunk_batch_size=self.CHUNK_BATCH,
+                progress=lambda done, total: self.db.update_index_job_progress(job_ids, done, total)
+            )
+        except Exception as e:
+            logger.warning(f"[索引队列] 批量处理 {len(jobs)} 个任务失败，逐条重试: {e}")
+            for job in jobs:
+                if self._stopping.is_set():
+                    break
+                self._process(job)
+            return
+
+        for job in jobs:
+            self.db.finish_index_job(job["id"], "done")
+        logger.info(f"[索引队列] 完成 {len(jobs)} 个任务 (memory_ids={memory_ids})")
+
+    def _process(self, job: dict):
+        """处理单条索引日志：按 SQLite 当前状态同步向量"""
+        job_id = job["id"]
+        memory_id = job["memory_id"]
+        try:
+            memory = self.db.get_memory(memory_id)
+            self.indexer.sync_memories(
+                {memory_id: memory},
+                chunk_batch_size=self.CHUNK_BATCH,
+                progress=lambda done, total: self.db.update_index_job_progress([job_id], done, total)
+            )
+            self.db.finish_index_job(job_id, "done")
+            logger.info(f"[索引队列] 任务 {job_id} 完成 (memory_id={memory_id}, op={job['op']})")
+        except Exception as e:
+            status = "failed" if job["attempts"] >= self.MAX_ATTEMPTS else "pending"
+            logger.error(f"[索引队列] 任务 {job_id} 失败 (第 {job['attempts']} 次): {e}")
+            self.db.finish_index_job(job_id, status, error=str(e))
@@ -0,0 +1,271 @@
+"""
+记忆向量索引：切割文本、批量向量化并写入 ChromaDB
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+from .chroma_db import ChromaDB
+from .embedding import Embedding
+from ..config import settings
+from ..utils.text_splitter import split_text, chunk_hash
+
+class Indexer:
+    """记忆向量索引（ChromaDB + Embedding 的组合操作）"""
+
+    def __init__(self, chroma_db: ChromaDB, embedder: Embedding):
+        """
+        Args:
+            chroma_db: 向量库
+            embedder: 向量化模型
+        """
+        self.chroma_db = chroma_db
+        self.embedder = embedder
+
+    def build_chunks(self, memory_id: int, title: str, content: str) -> Tuple[List[str], List[str], List[dict]]:
+        """
+        切割一条记忆的文本
+
+        Returns:
+            (块 ID 列表, 块文本列表, 元数据列表)
+        """
+        # 组合 title 和 content，然后切割文本
+        full_text = f"{title}\n{content}"
+        text_chunks = split_text(full_text, mode=settings.chunking_mode, chunk_size=1000, overlap=100)
+
+        ids_list = []
+        texts_list = []
+        metadatas_list = []
+        for chunk_index, (chunk_start, chunk_end, chunk) in enumerate(text_chunks):
+            digest = chunk_hash(chunk)
+            # 使用 memory_id:内容哈希 作为唯一ID（同一记忆内重复的块追加块索引）
+            chunk_id = f"{memory_id}:{digest}"
+            if chunk_id in ids_list:
+                chunk_id = f"{chunk_id}-{chunk_index}"
+            ids_list.append(chunk_id)
+            texts_list.append(chunk)
+            # 存储元数据，包含原始记忆ID、块索引、块在全文中的偏移及内容哈希
+            metadatas_list.append({
+                "memory_id": memory_id,
+                "chunk_index": chunk_index,
+                "start": chunk_start,
+                "end": chunk_end,
+                "chunk_hash": digest,
+                "title": title,
+                "total_chunks": len(text_chunks)
+            })
+        return ids_list, texts_list, metadatas_list
+
+    def _embed_and_add(self, ids_list: List[str], texts_list: List[str], metadatas_list: List[dict],
+                       chunk_batch_size: Optional[int] = None,
+                       progress: Optional[Callable[[int, int], None]] = None):
+        """分批向量化并写入 ChromaDB"""
+        total = len(texts_list)
+        if total == 0:
+            return
+        step = chunk_batch_size or total
+
+        for offset in range(0, total, step):
+            end = offset + step
+            # 一次前向计算，一次写入 ChromaDB
+            embeddings_array = self.embedder.encode_batch(texts_list[offset:end])
+            self.chroma_db.add_vectors(
+                ids=ids_list[offset:end],
+                embeddings=embeddings_array,
+                metadatas=metadatas_list[offset:end]
+            )
+            if progress is not None:
+                progress(min(end, total), total)
+
+    def index_memories(self, items: List[Tuple[int, str, str]], chunk_batch_size: Optional[int] = None,
+                       progress: Optional[Callable[[int, int], None]] = None):
+        """
+        为一批记忆批量生成向量并写入 ChromaDB
+
+        Args:
+            items: (memory_id, title, content) 列表
+            chunk_batch_size: 每次向量化并写入的块数，None 表示整批一次完成
+            progress: 进度回调 progress(已完成块数, 总块数)
+        """
+        ids_list = []
+        texts_list = []
+        metadatas_list = []
+        for memory_id, title, content in items:
+            ids, texts, metadatas = self.build_chunks(memory_id, title, content)
+            ids_list.extend(ids)
+            texts_list.extend(texts)
+            metadatas_list.extend(metadatas)
+
+        self._embed_and_add(ids_list, texts_list, metadatas_list, chunk_batch_size, progress)
+
+    def reindex_memory(self, memory_id: int, title: str, content: str, chunk_batch_size: Optional[int] = None,
+                       progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, int]:
+        """
+        增量更新一条记忆的向量
+
+        按内容哈希比对新旧文本块：未变的块只更新元数据（偏移、块索引、标题），
+        删除消失的块，只对新出现的块向量化。
+
+        Args:
+            memory_id: 记忆 ID
+            title: 新标题
+            content: 新内容
+            chunk_batch_size: 每次向量化并写入的块数
+            progress: 进度回调 progress(已完成块数, 需要向量化的块数)
+
+        Returns:
+            {"kept": 复用块数, "added": 新增块数, "deleted": 删除块数}
+        """
+        existing = self.chroma_db.collection.get(where={"memory_id": memory_id}, include=["metadatas"])
+        # 内容哈希 -> 已有块 ID 列表（旧数据没有 chunk_hash，只能删除重建）
+        old_by_hash = {}
+        stale_ids = []
+        for chunk_id, metadata in zip(existing["ids"], existing["metadatas"] or []):
+            digest = (metadata or {}).get("chunk_hash")
+            if digest:
+                old_by_hash.setdefault(digest, []).append(chunk_id)
+            else:
+                stale_ids.append(chunk_id)
+
+        # 兼容旧格式（纯数字ID）
+        legacy = self.chroma_db.collection.get(ids=[str(memory_id)], include=[])
+        stale_ids.extend(legacy["ids"])
+
+        ids, texts, metadatas = self.build_chunks(memory_id, title, content)
+        keep_ids, keep_metadatas = [], []
+        add_ids, add_texts, add_metadatas = [], [], []
+        for chunk_id, text, metadata in zip(ids, texts, metadatas):
+            reusable = old_by_hash.get(metadata["chunk_hash"])
+            if reusable:
+                # 内容未变，沿用原有块 ID 和向量
+                keep_ids.append(reusable.pop())
+                keep_metadatas.append(metadata)
+            else:
+                add_ids.append(chunk_id)
+                add_texts.append(text)
+                add_metadatas.append(metadata)
+
+        for remaining in old_by_hash.values():
+            stale_ids.extend(remaining)
+
+        # 新块 ID 可能与待删除的旧块相同，先删除再写入
+        self.chroma_db.delete(ids=stale_ids)
+        if keep_ids:
+            self.chroma_db.update_metadatas(ids=keep_ids, metadatas=keep_metadatas)
+
+        # 新块 ID 与沿用的块 ID 冲突时（同一记忆内有重复块）追加序号
+        taken = set(keep_ids)
+        for i, chunk_id in enumerate(add_ids):
+            candidate, n = chunk_id, 0
+            while candidate in taken:
+                n += 1
+                candidate = f"{chunk_id}-r{n}"
+            add_ids[i] = candidate
+            taken.add(candidate)
+        self._embed_and_add(add_ids, add_texts, add_metadatas, chunk_batch_size, progress)
+
+        return {"kept": len(keep_ids), "added": len(add_ids), "deleted": len(stale_ids)}
+
+    def sync_memories(self, memories: Dict[int, Optional[dict]], chunk_batch_size: Optional[int] = None,
+                      progress: Optional[Callable[[int, int], None]] = None):
+        """
+        把一批记忆的向量同步到 SQLite 中的当前状态（可重复执行）
+
+        已删除的记忆一次性删除全部向量；还没有向量的记忆整批向量化；
+        已有向量的记忆逐条增量更新
+
+        Args:
+            memories: memory_id -> 记忆字典（需包含 title、content），None 表示记忆已删除
+            chunk_batch_size: 每次向量化并写入的块数
+            progress: 新记忆向量化的进度回调 progress(已完成块数, 总块数)
+        """
+        memory_ids = list(memories)
+        if not memory_ids:
+            return
+        existing = self.chroma_db.collection.get(where={"memory_id": {"$in": memory_ids}}, include=["metadatas"])
+        chunk_ids_by_memory = {}
+        for chunk_id, metadata in zip(existing["ids"], existing["metadatas"] or []):
+            chunk_ids_by_memory.setdefault(metadata["memory_id"], []).append(chunk_id)
+        # 兼容旧格式（纯数字ID）
+        legacy = self.chroma_db.collection.get(ids=[str(memory_id) for memory_id in memory_ids], include=[])
+        for chunk_id in legacy["ids"]:
+            chunk_ids_by_memory.setdefault(int(chunk_id), []).append(chunk_id)
+
+        stale_ids = []
+        fresh = []
+        for memory_id, memory in memories.items():
+            if memory is None:
+                stale_ids.extend(chunk_ids_by_memory.get(memory_id, []))
+            elif memory_id in chunk_ids_by_memory:
+                self.reindex_memory(memory_id, memory["title"], memory["content"], chunk_batch_size)
+            else:
+                fresh.append((memory_id, memory["title"], memory["content"]))
+
+        self.chroma_db.delete(ids=stale_ids)
+        self.index_memories(fresh, chunk_batch_size, progress)
+
+    def index_memories_with_vectors(self, items: List[Tuple[int, str, str]], vectors: Dict[int, Dict[str, list]],
+                                    chunk_batch_size: Optional[int] = None) -> Dict[str, int]:
+        """
+        用已有的块向量（如从其他实例同步来的）为一批记忆重建索引
+
+        按本地切割结果逐块比对内容哈希：哈希相同的块直接写入已有向量，
+        其余的块（切割方式不同、向量缺失等）才向量化；原有向量全部替换
+
+        Args:
+            items: (memory_id, title, content) 列表
+            vectors: memory_id -> {块内容哈希: 向量}
+            chunk_batch_size: 每次向量化并写入的块数
+
+        Returns:
+            {"reused": 复用的块数, "embedded": 重新向量化的块数}
+        """
+        memory_ids = [memory_id for memory_id, _, _ in items]
+        if not memory_ids:
+            return {"reused": 0, "embedded": 0}
+        existing = self.chroma_db.collection.get(where={"memory_id": {"$in": memory_ids}}, include=[])
+        stale_ids = list(existing["ids"])
+        # 兼容旧格式（纯数字ID）
+        legacy = self.chroma_db.collection.get(ids=[str(memory_id) for memory_id in memory_ids], include=[])
+        stale_ids.extend(legacy["ids"])
+        self.chroma_db.delete(ids=stale_ids)
+
+        reuse_ids, reuse_embeddings, reuse_metadatas = [], [], []
+        add_ids, add_texts, add_metadatas = [], [], []
+        for memory_id, title, content in items:
+            known = vectors.get(memory_id) or {}
+            ids, texts, metadatas = self.build_chunks(memory_id, title, content)
+            for chunk_id, text, metadata in zip(ids, texts, metadatas):
+                embedding = known.get(metadata["chunk_hash"])
+                if embedding is not None:
+                    reuse_ids.append(chunk_id)
+                    reuse_embeddings.append(embedding)
+                    reuse_metadatas.append(metadata)
+                else:
+                    add_ids.append(chunk_id)
+                    add_texts.append(text)
+                    add_metadatas.append(metadata)
+
+        if reuse_ids:
+            self.chroma_db.add_vectors(
+                ids=reuse_ids,
+                embeddings=np.asarray(reuse_embeddings, dtype=np.float32),
+                metadatas=reuse_metadatas
+            )
+        self._embed_and_add(add_ids, add_texts, add_metadatas, chunk_batch_size)
+        return {"reused": len(reuse_ids), "embedded": len(add_ids)}
+
+    def delete_memory_vectors(self, memory_id: int):
+        """
+        删除一条记忆的全部块向量
+
+        Args:
+            memory_id: 记忆 ID
+        """
+        existing = self.chroma_db.collection.get(where={"memory_id": memory_id}, include=[])
+        chunk_ids_to_delete = list(existing["ids"])
+
+        # 兼容旧格式（纯数字ID）
+        legacy = self.chroma_db.collection.get(ids=[str(memory_id)], include=[])
+        chunk_ids_to_delete.extend(legacy["ids"])
+
+        # 批量删除所有相关的块
+        self.chroma_db.delete(ids=chunk_ids_to_delete)
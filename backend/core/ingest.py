@@ -0,0 +1,240 @@
+"""
+目录导入：把目录中的文本文件同步为记忆（mymem ingest）
+"""
+import hashlib
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from .indexer import Indexer
+from .index_queue import apply_index_jobs
+from .sqlite_db import SQLiteDB
+
+# 默认导入的文件扩展名
+DEFAULT_EXTENSIONS = (".md", ".markdown", ".txt")
+
+class DirectoryIngester:
+    """
+    目录导入
+
+    用 ingest_files 清单记录每个文件的 (mtime, size, hash, memory_id)：
+    mtime 和 size 都没变的文件不读取内容直接跳过；内容哈希没变的只更新清单；
+    新文件分批写入并批量向量化，修改的文件按块增量更新，已删除的文件同步删除记忆
+    """
+
+    # 每批写入 SQLite 的新文件数
+    FILE_BATCH = 64
+    # 每次向量化的块数
+    CHUNK_BATCH = 64
+
+    def __init__(self, sqlite_db: SQLiteDB, extensions: Optional[Tuple[str, ...]] = None):
+        """
+        Args:
+            sqlite_db: 数据库
+            extensions: 导入的文件扩展名，默认 .md / .markdown / .txt
+        """
+        self.sqlite_db = sqlite_db
+        self.extensions = tuple(ext.lower() for ext in (extensions or DEFAULT_EXTENSIONS))
+
+    def scan(self, root: str) -> Dict[str, list]:
+        """
+        扫描目录，与清单比对得到变更计划（不修改任何数据）
+
+        Args:
+            root: 目录路径
+
+        Returns:
+            {"added": [...], "changed": [...], "removed": [...], "touched": [...], "unchanged": 数量, "skipped": [...]}
+        """
+        root = os.path.realpath(root)
+        known = self.sqlite_db.get_ingest_files(root)
+        plan = {"added": [], "changed": [], "removed": [], "touched": [], "unchanged": 0, "skipped": []}
+        seen = set()
+
+        for dirpath, dirnames, filenames in os.walk(root):
+            # 跳过隐藏目录（.git 等）
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+            for name in filenames:
+                if name.startswith(".") or not name.lower().endswith(self.extensions):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                seen.add(path)
+
+                entry = known.get(path)
+                # 空哈希表示上次导入未完成，需要重新处理
+                if entry and entry["hash"] and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+                    plan["unchanged"] += 1
+                    continue
+
+                try:
+                    with open(path, "rb") as f:
+                        data = f.read()
+                except OSError as e:
+                    plan["skipped"].append((path, str(e)))
+                    continue
+
+                digest = hashlib.sha1(data).hexdigest()
+                if entry and entry["hash"] == digest:
+                    # 只是 mtime 变了（touch、git checkout 等），更新清单即可
+                    plan["touched"].append((path, stat.st_mtime, stat.st_size, digest, entry["memory_id"]))
+                    continue
+
+                try:
+                    text = data.decode("utf-8")
+                except UnicodeDecodeError:
+                    plan["skipped"].append((path, "not utf-8"))
+                    continue
+
+                title, tags = self._describe(root, path, text)
+                item = {
+                    "path": path,
+                    "mtime": stat.st_mtime,
+                    "size": stat.st_size,
+                    "hash": digest,
+                    "title": title,
+                    "content": text,
+                    "tags": tags,
+                    "memory_id": entry["memory_id"] if entry else None
+                }
+                plan["changed" if entry else "added"].append(item)
+
+        plan["removed"] = [entry for path, entry in known.items() if path not in seen]
+        return plan
+
+    def _describe(self, root: str, path: str, text: str) -> Tuple[str, List[str]]:
+        """
+        生成记忆标题和标签：标题取第一个 Markdown 标题，没有则用文件名；
+        标签为文件相对目录的各级目录名
+        """
+        title = os.path.splitext(os.path.basename(path))[0]
+        for line in text.splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith("#"):
+                heading = line.lstrip("#").strip()
+                if heading:
+                    title = heading
+            break
+
+        relative_dir = os.path.dirname(os.path.relpath(path, root))
+        tags = [part for part in relative_dir.split(os.sep) if part]
+        return title, tags
+
+    def apply(self, plan: Dict[str, list], indexer: Optional[Indexer]) -> Dict[str, int]:
+        """
+        执行变更计划
+
+        Args:
+            plan: scan() 的返回值
+            indexer: 向量索引；为 None 时只写 SQLite，向量由正在运行的服务的后台索引队列写入
+
+        Returns:
+            {"added": 数量, "updated": 数量, "removed": 数量}
+        """
+        stats = {"added": 0, "updated": 0, "removed": 0}
+        self.sqlite_db.upsert_ingest_files(plan["touched"])
+
+        # 1. 修改的文件：按块增量更新向量
+        added = list(plan["added"])
+        for item in plan["changed"]:
+            memory_id = item["memory_id"]
+            if self.sqlite_db.get_memory(memory_id) is None:
+                # 对应的记忆已在界面中被删除，重新创建
+                added.append(item)
+                continue
+            self.sqlite_db.update_memory(memory_id, item["title"], item["content"], item["tags"])
+            self._index(indexer, [memory_id], lambda: indexer.reindex_memory(
+                memory_id, item["title"], item["content"], chunk_batch_size=self.CHUNK_BATCH
+            ))
+            self.sqlite_db.upsert_ingest_files([
+                (item["path"], item["mtime"], item["size"], item["hash"], memory_id)
+            ])
+            stats["updated"] += 1
+
+        # 2. 新文件：分批写入 SQLite，一批一次向量化
+        for offset in range(0, len(added), self.FILE_BATCH):
+            batch = added[offset:offset + self.FILE_BATCH]
+            memory_ids = self.sqlite_db.create_memories([
+                (item["title"], item["content"], item["tags"]) for item in batch
+            ])
+            # 先以空哈希登记清单：中途退出时下次运行按"修改"处理，不会重复创建记忆
+            self.sqlite_db.upsert_ingest_files([
+                (item["path"], item["mtime"], item["size"], "", memory_id)
+                for item, memory_id in zip(batch, memory_ids)
+            ])
+            # 向量化失败时索引日志留在队列中，由服务的后台索引队列补做
+            self._index(indexer, memory_ids, lambda: indexer.index_memories(
+                [(memory_id, item["title"], item["content"]) for item, memory_id in zip(batch, memory_ids)],
+                chunk_batch_size=self.CHUNK_BATCH
+            ))
+            self.sqlite_db.upsert_ingest_files([
+                (item["path"], item["mtime"], item["size"], item["hash"], memory_id)
+                for item, memory_id in zip(batch, memory_ids)
+            ])
+            stats["added"] += len(batch)
+            print(f"[目录导入] 已导入 {stats['added']}/{len(added)} 个新文件", flush=True)
+
+        # 3. 已删除的文件：同步删除记忆和向量
+        removed_ids = [entry["memory_id"] for entry in plan["removed"]]
+        for memory_id in removed_ids:
+            self.sqlite_db.delete_memory(memory_id)
+        self._index(indexer, removed_ids, lambda: indexer.sync_memories(
+            {memory_id: None for memory_id in removed_ids}
+        ))
+        stats["removed"] = len(removed_ids)
+        self.sqlite_db.delete_ingest_files([entry["path"] for entry in plan["removed"]])
+
+        return stats
+
+    def _index(self, indexer: Optional[Indexer], memory_ids: List[int], apply: Callable[[], None]):
+        """写入向量；indexer 为 None 时索引日志交给服务的后台索引队列"""
+        apply_index_jobs(self.sqlite_db, memory_ids, apply if indexer is not None else None)
+
+def run_ingest(root: str, sqlite_db: SQLiteDB, get_indexer: Callable[[], Indexer], watch: bool = False,
+               interval: float = 2.0, extensions: Optional[Tuple[str, ...]] = None,
+               server_running: Optional[Callable[[], bool]] = None):
+    """
+    导入目录，watch 为 True 时轮询目录持续同步
+
+    Args:
+        root: 目录路径
+        sqlite_db: 数据库
+        get_indexer: 返回向量索引的函数（只有存在变更时才调用，目录未变化时不加载模型）
+        watch: 是否持续监听
+        interval: 轮询间隔（秒）
+        extensions: 导入的文件扩展名
+        server_running: 每轮导入前调用，返回 True 时（服务正在运行）不写向量库，
+                        只写 SQLite 和索引日志，向量由服务的后台索引队列写入
+    """
+    ingester = DirectoryIngester(sqlite_db, extensions)
+    indexer = None
+    while True:
+        started = time.perf_counter()
+        plan = ingester.scan(root)
+        for path, reason in plan["skipped"]:
+            print(f"⚠️  跳过 {path}: {reason}", flush=True)
+
+        if plan["added"] or plan["changed"] or plan["removed"]:
+            if server_running is not None and server_running():
+                stats = ingester.apply(plan, None)
+                print("💡 服务正在运行，向量由服务的后台索引队列写入", flush=True)
+            else:
+                if indexer is None:
+                    indexer = get_indexer()
+                stats = ingester.apply(plan, indexer)
+            print(f"✅ 新增 {stats['added']}，更新 {stats['updated']}，删除 {stats['removed']}，"
+                  f"未变化 {plan['unchanged'] + len(plan['touched'])}，"
+                  f"耗时 {time.perf_counter() - started:.2f}s", flush=True)
+        else:
+            ingester.sqlite_db.upsert_ingest_files(plan["touched"])
+            if not watch:
+                print(f"✅ 没有变化（{plan['unchanged'] + len(plan['touched'])} 个文件），"
+                      f"耗时 {time.perf_counter() - started:.2f}s", flush=True)
+
+        if not watch:
+            return
+        time.sleep(interval)
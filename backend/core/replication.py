@@ -0,0 +1,193 @@
+"""
+从其他 mymem 实例增量同步（mymem sync --from <url>）
+"""
+import base64
+import json
+from typing import Callable, Dict, List, Optional
+import httpx
+import numpy as np
+from .indexer import Indexer
+from .index_queue import apply_index_jobs
+from .sqlite_db import SQLiteDB
+from ..config import settings
+
+# meta 表中保存同步游标的键前缀（按源地址区分）
+CURSOR_KEY_PREFIX = "sync_cursor:"
+
+class Replicator:
+    """
+    增量同步
+
+    拉取源实例 /api/v1/changes 的变更流，按 (origin, origin_id) 找到本地对应的记忆：
+    新增/修改直接写入 SQLite，向量按块内容哈希复用源实例的结果（模型不同时本地重新向量化）；
+    删除按墓碑同步删除。每批提交后保存游标，中断后从断点继续。
+    不传 indexer 时只写 SQLite 和索引日志，向量由正在运行的服务的后台索引队列写入（不复用源实例的向量）
+    """
+
+    # 每批应用的变更条数
+    APPLY_BATCH = 64
+    # 每次向量化的块数
+    CHUNK_BATCH = 64
+
+    def __init__(self, sqlite_db: SQLiteDB, indexer: Optional[Indexer]):
+        """
+        Args:
+            sqlite_db: 数据库
+            indexer: 向量索引，为 None 时不写向量库（服务正在运行）
+        """
+        self.sqlite_db = sqlite_db
+        self.indexer = indexer
+        self.instance_id = sqlite_db.instance_id
+
+    def load_cursor(self, url: str) -> Dict:
+        """读取同步游标 {"instance_id": 源实例 ID, "seq": 已同步到的序号}"""
+        value = self.sqlite_db.get_meta(CURSOR_KEY_PREFIX + url)
+        return json.loads(value) if value else {"instance_id": None, "seq": 0}
+
+    def save_cursor(self, url: str, instance_id: str, seq: int):
+        """保存同步游标"""
+        self.sqlite_db.set_meta(CURSOR_KEY_PREFIX + url, json.dumps({"instance_id": instance_id, "seq": seq}))
+
+    def pull(self, url: str, progress: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        从源实例拉取并应用变更
+
+        Args:
+            url: 源实例地址，如 http://192.168.1.10:8000
+            progress: 每批应用后的回调 progress(累计统计)
+
+        Returns:
+            {"created", "updated", "deleted", "skipped", "reused", "embedded", "last_seq"}
+        """
+        url = url.rstrip("/")
+        cursor = self.load_cursor(url)
+        stats = {"created": 0, "updated": 0, "deleted": 0, "skipped": 0, "reused": 0, "embedded": 0,
+                 "last_seq": cursor["seq"]}
+
+        with httpx.stream("GET", f"{url}/api/v1/changes", params={"since": cursor["seq"]},
+                          timeout=httpx.Timeout(30.0, read=None)) as response:
+            response.raise_for_status()
+            lines = response.iter_lines()
+            header = json.loads(next(lines))
+            remote_id = header["instance_id"]
+            if remote_id == self.instance_id:
+                raise ValueError("不能从本实例同步")
+            if cursor["instance_id"] not in (None, remote_id):
+                # 源实例已被重建（如导入了快照），序号不再连续，从头同步
+                self.save_cursor(url, remote_id, 0)
+                return self.pull(url, progress)
+            reuse_vectors = header.get("embedding_model") == settings.embedding_model
+
+            batch = []
+            for line in lines:
+                if not line:
+                    continue
+                record = json.loads(line)
+                if record["op"] == "end":
+                    break
+                batch.append(record)
+                if len(batch) >= self.APPLY_BATCH:
+                    self._apply_batch(batch, reuse_vectors, stats)
+                    self.save_cursor(url, remote_id, batch[-1]["seq"])
+                    stats["last_seq"] = batch[-1]["seq"]
+                    batch = []
+                    if progress is not None:
+                        progress(stats)
+            if batch:
+                self._apply_batch(batch, reuse_vectors, stats)
+                self.save_cursor(url, remote_id, batch[-1]["seq"])
+                stats["last_seq"] = batch[-1]["seq"]
+                if progress is not None:
+                    progress(stats)
+            elif cursor["instance_id"] is None:
+                self.save_cursor(url, remote_id, cursor["seq"])
+
+        return stats
+
+    def _resolve(self, batch: List[Dict]) -> Dict[tuple, Optional[int]]:
+        """把一批变更的 (origin, origin_id) 映射为本地记忆 ID（不存在为 None）"""
+        resolved = {}
+        by_origin = {}
+        for record in batch:
+            by_origin.setdefault(record["origin"], set()).add(record["origin_id"])
+        for origin, origin_ids in by_origin.items():
+            if origin == self.instance_id:
+                # 本机创建的记忆：origin_id 就是本地 ID（本地已删除则不再恢复）
+                existing = self.sqlite_db.get_existing_memory_ids(list(origin_ids))
+                found = {origin_id: origin_id for origin_id in existing}
+            else:
+                found = self.sqlite_db.find_memory_ids_by_origin(origin, list(origin_ids))
+            for origin_id in origin_ids:
+                resolved[(origin, origin_id)] = found.get(origin_id)
+        return resolved
+
+    def _apply_batch(self, batch: List[Dict], reuse_vectors: bool, stats: Dict):
+        """应用一批变更：SQLite 写入（同一事务中写入索引日志）后统一同步向量"""
+        # 同一条记忆在一批中只保留最后一次变更
+        latest = {}
+        for record in batch:
+            latest[(record["origin"], record["origin_id"])] = record
+        resolved = self._resolve(list(latest.values()))
+        current = {memory["id"]: memory for memory in self.sqlite_db.get_memories_by_ids(
+            [memory_id for memory_id in resolved.values() if memory_id is not None]
+        )}
+
+        creates, updates, deletes = [], [], []
+        for key, record in latest.items():
+            local_id = resolved[key]
+            if record["op"] == "delete":
+                if local_id is None:
+                    stats["skipped"] += 1
+                else:
+                    deletes.append(local_id)
+                continue
+            if local_id is None:
+                if record["origin"] == self.instance_id:
+                    stats["skipped"] += 1
+                else:
+                    creates.append(record)
+                continue
+            memory = current[local_id]
+            if (memory["title"], memory["content"], memory["tags"]) == \
+                    (record["title"], record["content"], record["tags"]):
+                # 内容相同（如双向同步时回传的本机修改），不再写入，避免来回同步
+                stats["skipped"] += 1
+                continue
+            updates.append((local_id, record))
+
+        items = []
+        vectors = {}
+
+        def collect(memory_id, record):
+            items.append((memory_id, record["title"], record["content"]))
+            if reuse_vectors and record.get("chunks"):
+                vectors[memory_id] = {
+                    chunk["chunk_hash"]: np.frombuffer(base64.b64decode(chunk["embedding"]), dtype="<f4")
+                    for chunk in record["chunks"]
+                }
+
+        if creates:
+            memory_ids = self.sqlite_db.create_memories(
+                [(record["title"], record["content"], record["tags"]) for record in creates],
+                origins=[(record["origin"], record["origin_id"]) for record in creates]
+            )
+            for memory_id, record in zip(memory_ids, creates):
+                collect(memory_id, record)
+            stats["created"] += len(creates)
+        for local_id, record in updates:
+            if self.sqlite_db.update_memory(local_id, record["title"], record["content"], record["tags"]):
+                collect(local_id, record)
+                stats["updated"] += 1
+        for local_id in deletes:
+            if self.sqlite_db.delete_memory(local_id):
+                stats["deleted"] += 1
+
+        def sync_vectors():
+            result = self.indexer.index_memories_with_vectors(items, vectors, chunk_batch_size=self.CHUNK_BATCH)
+            self.indexer.sync_memories({memory_id: None for memory_id in deletes})
+            stats["reused"] += result["reused"]
+            stats["embedded"] += result["embedded"]
+
+        # 向量写入失败时索引日志留在队列中，由服务的后台索引队列补做
+        apply_index_jobs(self.sqlite_db, [memory_id for memory_id, _, _ in items] + deletes,
+                         sync_vectors if self.indexer is not None else None)
@@ -0,0 +1,502 @@
+"""
+搜索引擎：语义搜索、批量语义搜索、关键字搜索的统一实现
+
+HTTP 路由、命令行搜索和脚本共用这里的去重、相关度换算、阈值过滤和间隔分析。
+向量检索的候选块以 NumPy 数组批量去重、排序，只为最终返回的结果构建结果对象。
+模块本身不导入 NumPy、向量库和模型（关键字搜索的命令行快速路径不需要），由调用方传入已创建的组件
+"""
+import logging
+import math
+import time
+from typing import Dict, List, Optional
+
+from .cancellation import CancelScope, checkpoint
+
+logger = logging.getLogger(__name__)
+
+# 向量检索候选数量（用于间隔分析）
+VECTOR_TOP_K = 10
+# 相关度阈值：低于该值的结果直接过滤
+RELEVANCE_THRESHOLD = 0.7
+# 间隔阈值偏移量：最大间隔需超过 平均间隔 + 偏移量 才分割
+GAP_THRESHOLD_OFFSET = 0.02
+# 命中片段的最大字符数
+SNIPPET_MAX_CHARS = 300
+
+class ChunkMatch:
+    """命中的文本块"""
+    __slots__ = ("chunk_index", "start", "end", "relevance", "snippet")
+
+    def __init__(self, chunk_index: Optional[int], start: Optional[int], end: Optional[int],
+                 relevance: float, snippet: str):
+        self.chunk_index = chunk_index
+        # 块在 "标题\n内容" 全文中的字符偏移（旧数据、关键字搜索为 None）
+        self.start = start
+        self.end = end
+        self.relevance = relevance
+        self.snippet = snippet
+
+class SearchHit:
+    """搜索结果（content 始终为全文，是否返回由调用方决定）"""
+    __slots__ = ("id", "title", "content", "tags", "created_at", "relevance", "chunks")
+
+    def __init__(self, id: int, title: str, content: str, tags: List[str], created_at,
+                 relevance: float, chunks: List[ChunkMatch]):
+        self.id = id
+        self.title = title
+        self.content = content
+        self.tags = tags
+        self.created_at = created_at
+        self.relevance = relevance
+        self.chunks = chunks
+
+class Candidates:
+    """
+    按记忆去重后的向量检索候选（NumPy 数组，按最小块距离升序）
+
+    Attributes:
+        memory_ids: 记忆 ID
+        distances: 每条记忆最相近块的距离
+        chunk_rows: 每条记忆命中的块在 vector_results 中的下标（按距离升序）
+        vector_results: 向量库返回的原始块结果
+    """
+    __slots__ = ("memory_ids", "distances", "chunk_rows", "vector_results")
+
+    def __init__(self, memory_ids, distances, chunk_rows, vector_results):
+        self.memory_ids = memory_ids
+        self.distances = distances
+        self.chunk_rows = chunk_rows
+        self.vector_results = vector_results
+
+    def __len__(self):
+        return len(self.memory_ids)
+
+    def take(self, mask_or_index) -> "Candidates":
+        """按布尔掩码或下标数组取子集"""
+        import numpy as np
+        index = np.flatnonzero(mask_or_index) if mask_or_index.dtype == bool else mask_or_index
+        return Candidates(self.memory_ids[index], self.distances[index],
+                          [self.chunk_rows[i] for i in index.tolist()], self.vector_results)
+
+def elapsed_ms(start: float) -> float:
+    """计算从 start 到现在经过的毫秒数"""
+    return round((time.perf_counter() - start) * 1000, 3)
+
+def distance_to_relevance(distance: float) -> float:
+    """
+    将 ChromaDB cosine 距离转换为相似度
+    距离 0 表示完全相同，2 表示完全相反；相似度 = 1 - (distance / 2)，归一化到 [0, 1]
+    """
+    return max(0.0, 1.0 - (distance / 2.0))
+
+def rank_to_relevance(rank: float) -> float:
+    """
+    FTS5 rank 转换为相似度：rank 越小（越负）表示越匹配，
+    使用 Sigmoid 函数映射到 0-1：rank=-10 -> 0.999, rank=0 -> 0.5, rank=10 -> 0.0001
+    """
+    try:
+        return 1.0 / (1.0 + math.exp(rank))
+    except OverflowError:
+        # 极端情况处理
+        return 1.0 if rank < 0 else 0.0
+
+def truncate_snippet(text: str) -> str:
+    """将片段截断到 SNIPPET_MAX_CHARS 以内"""
+    text = text.strip()
+    if len(text) > SNIPPET_MAX_CHARS:
+        return text[:SNIPPET_MAX_CHARS] + "..."
+    return text
+
+def _memory_id_of(vec_result: dict) -> int:
+    """块所属的记忆 ID：优先读 metadata，旧数据从块 ID（纯数字或 "memory_id:块标识"）解析"""
+    metadata = vec_result.get("metadata") or {}
+    if "memory_id" in metadata:
+        return metadata["memory_id"]
+    chunk_id = vec_result["id"]
+    try:
+        return int(chunk_id)
+    except ValueError:
+        return int(chunk_id.split(":")[0])
+
+def chunk_distance(vec_result: dict) -> float:
+    """块的距离（缺失时按 1.0，即相关度 0.5）"""
+    distance = vec_result.get("distance")
+    return 1.0 if distance is None else distance
+
+def collapse_chunks(vector_results: list, exclude_memory_id: Optional[int] = None) -> Candidates:
+    """
+    按记忆去重：同一记忆的多个块以最近块的距离排序，命中块全部记录
+
+    Args:
+        vector_results: ChromaDB.search 的结果
+        exclude_memory_id: 排除的记忆（相似记忆检索时排除自身）
+    """
+    import numpy as np
+
+    count = len(vector_results)
+    memory_ids = np.fromiter((_memory_id_of(r) for r in vector_results), dtype=np.int64, count=count)
+    distances = np.fromiter((chunk_distance(r) for r in vector_results), dtype=np.float64, count=count)
+    if count == 0:
+        return Candidates(memory_ids, distances, [], vector_results)
+
+    # 按 (记忆, 距离) 排序后，每组第一个即该记忆最近的块
+    order = np.lexsort((distances, memory_ids))
+    sorted_ids = memory_ids[order]
+    group_starts = np.flatnonzero(np.concatenate(([True], sorted_ids[1:] != sorted_ids[:-1])))
+    best_rows = order[group_starts]
+    groups = np.split(order, group_starts[1:])
+
+    # 记忆按最近块距离升序（即相关度降序）
+    by_distance = np.argsort(distances[best_rows], kind="stable")
+    candidates = Candidates(memory_ids[best_rows][by_distance], distances[best_rows][by_distance],
+                            [groups[i] for i in by_distance.tolist()], vector_results)
+    if exclude_memory_id is not None:
+        candidates = candidates.take(candidates.memory_ids != exclude_memory_id)
+    return candidates
+
+def build_chunk_matches(memory: dict, vector_results: list, rows) -> List[ChunkMatch]:
+    """根据块偏移从 "标题\n内容" 全文中截取命中块的片段"""
+    full_text = f"{memory['title']}\n{memory['content']}"
+    matches = []
+    for row in rows:
+        vec_result = vector_results[row]
+        metadata = vec_result.get("metadata") or {}
+        start, end = metadata.get("start"), metadata.get("end")
+        if start is not None and end is not None:
+            text = full_text[start:end]
+        else:
+            # 旧数据没有偏移信息，退回到内容开头
+            text = memory["content"]
+        matches.append(ChunkMatch(
+            chunk_index=metadata.get("chunk_index"),
+            start=start,
+            end=end,
+            relevance=distance_to_relevance(chunk_distance(vec_result)),
+            snippet=truncate_snippet(text)
+        ))
+    return matches
+
+def _format_ranked(entries, prefix="  ", label="relevance") -> str:
+    """格式化结果列表，显示 id、title 和评分；entries 为 (id, title, relevance)"""
+    lines = []
+    for i, (memory_id, title, relevance) in enumerate(entries, 1):
+        title_short = title[:30] + "..." if len(title) > 30 else title
+        lines.append(f"{prefix}{i}. [ID:{memory_id}] {title_short} ({label}: {relevance:.4f})")
+    return "\n".join(lines)
+
+class SearchEngine:
+    """
+    搜索引擎
+
+    组件由调用方创建后传入（服务共用路由模块的实例，命令行以只读方式打开）；
+    只做关键字搜索时可以只传 sqlite_db
+    """
+
+    def __init__(self, chroma_db=None, sqlite_db=None, embedder=None, verbose: bool = False):
+        """
+        Args:
+            chroma_db: ChromaDB 实例（语义搜索需要）
+            sqlite_db: SQLiteDB 实例
+            embedder: Embedding 实例（语义搜索需要）
+            verbose: 是否打印排序过程（服务日志）
+        """
+        self.chroma_db = chroma_db
+        self.sqlite_db = sqlite_db
+        self.embedder = embedder
+        self.verbose = verbose
+
+    def _log(self, message: str):
+        if self.verbose:
+            print(message, flush=True)
+
+    # ---------- 语义搜索 ----------
+
+    def search(self, query: str, limit: int = 3, trace: Optional[dict] = None,
+               cancel: Optional[CancelScope] = None) -> List[SearchHit]:
+        """
+        语义搜索：向量化、向量检索、按记忆去重、批量获取记忆、阈值过滤和间隔分析
+
+        Args:
+            query: 查询文本
+            limit: 最多返回的条数
+            trace: 排序轨迹（explain 模式），为 None 时不记录
+            cancel: 请求的取消状态，各阶段之前检查（客户端断开或超时时抛出 RequestCancelled）
+
+        Returns:
+            按相关度降序的结果
+        """
+        checkpoint(cancel, "encode")
+        stage_start = time.perf_counter()
+        query_embedding = self.embedder.encode(query)
+        if trace is not None:
+            trace["timings_ms"]["encode"] = elapsed_ms(stage_start)
+
+        # 返回的块 ID 格式是 "memory_id:块标识"，先取 VECTOR_TOP_K 条用于间隔分析
+        checkpoint(cancel, "vector_query")
+        stage_start = time.perf_counter()
+        vector_results = self.chroma_db.search(query_embedding, top_k=VECTOR_TOP_K)
+        if trace is not None:
+            trace["timings_ms"]["vector_query"] = elapsed_ms(stage_start)
+            self._trace_candidates(trace, vector_results)
+        if not vector_results:
+            return []
+
+        stage_start = time.perf_counter()
+        candidates = collapse_chunks(vector_results)
+        if trace is not None:
+            trace["timings_ms"]["dedupe"] = elapsed_ms(stage_start)
+
+        checkpoint(cancel, "hydrate")
+        stage_start = time.perf_counter()
+        memory_dict = self._hydrate(candidates.memory_ids.tolist())
+        if trace is not None:
+            trace["timings_ms"]["hydrate"] = elapsed_ms(stage_start)
+
+        checkpoint(cancel, "rank")
+        return self._rank(query, candidates, memory_dict, limit, trace)
+
+    def search_many(self, queries: List[str], limits: List[int],
+                    traces: Optional[List[Optional[dict]]] = None,
+                    cancel: Optional[CancelScope] = None) -> List[List[SearchHit]]:
+        """
+        批量语义搜索：一次批量向量化、一次多查询向量检索、对所有命中记忆的并集做一次批量获取
+
+        Args:
+            queries: 查询文本
+            limits: 每个查询最多返回的条数
+            traces: 每个查询的排序轨迹（批量阶段记录整批共享的耗时）
+            cancel: 请求的取消状态，各阶段之前检查
+
+        Returns:
+            与 queries 顺序一致的结果
+        """
+        if not queries:
+            return []
+        traces = traces or [None] * len(queries)
+
+        def record_timing(name: str, start: float):
+            elapsed = elapsed_ms(start)
+            for trace in traces:
+                if trace is not None:
+                    trace["timings_ms"][name] = elapsed
+                    trace["batch_size"] = len(queries)
+
+        checkpoint(cancel, "encode")
+        stage_start = time.perf_counter()
+        query_embeddings = self.embedder.encode_batch(queries)
+        record_timing("encode", stage_start)
+
+        checkpoint(cancel, "vector_query")
+        stage_start = time.perf_counter()
+        vector_results_list = self.chroma_db.search_many(query_embeddings, top_k=VECTOR_TOP_K)
+        record_timing("vector_query", stage_start)
+
+        stage_start = time.perf_counter()
+        candidates_list = [collapse_chunks(vector_results) for vector_results in vector_results_list]
+        record_timing("dedupe", stage_start)
+
+        checkpoint(cancel, "hydrate")
+        stage_start = time.perf_counter()
+        union_ids = set()
+        for candidates in candidates_list:
+            union_ids.update(candidates.memory_ids.tolist())
+        memory_dict = self._hydrate(list(union_ids))
+        record_timing("hydrate", stage_start)
+
+        checkpoint(cancel, "rank")
+        results = []
+        for query, limit, trace, vector_results, candidates in zip(
+                queries, limits, traces, vector_results_list, candidates_list):
+            if trace is not None:
+                self._trace_candidates(trace, vector_results)
+            results.append(self._rank(query, candidates, memory_dict, limit, trace) if len(candidates) else [])
+        return results
+
+    def nearest(self, candidates: Candidates, limit: int) -> List[SearchHit]:
+        """按距离取最近的 limit 条记忆（不做阈值过滤和间隔分析，用于相似记忆）"""
+        import numpy as np
+        candidates = candidates.take(np.arange(min(limit, len(candidates))))
+        memory_dict = self._hydrate(candidates.memory_ids.tolist())
+        hits = []
+        for i, memory_id in enumerate(candidates.memory_ids.tolist()):
+            memory = memory_dict.get(memory_id)
+            if memory is not None:
+                hits.append(self._build_hit(memory, float(candidates.distances[i]), candidates, i))
+        return hits
+
+    def _hydrate(self, memory_ids: List[int]) -> Dict[int, dict]:
+        """从 SQLite 批量获取记忆"""
+        return {memory["id"]: memory for memory in self.sqlite_db.get_memories_by_ids(memory_ids)}
+
+    def _build_hit(self, memory: dict, distance: float, candidates: Candidates, index: int) -> SearchHit:
+        return SearchHit(
+            id=memory["id"],
+            title=memory["title"],
+            content=memory["content"],
+            tags=memory["tags"],
+            created_at=memory["created_at"],
+            relevance=distance_to_relevance(distance),
+            chunks=build_chunk_matches(memory, candidates.vector_results, candidates.chunk_rows[index].tolist())
+        )
+
+    @staticmethod
+    def _trace_candidates(trace: dict, vector_results: list):
+        """记录向量检索返回的候选块"""
+        trace["candidates"] = [
+            {
+                "chunk_id": r["id"],
+                "memory_id": (r.get("metadata") or {}).get("memory_id"),
+                "distance": r.get("distance")
+            }
+            for r in vector_results
+        ]
+
+    def _rank(self, query: str, candidates: Candidates, memory_dict: Dict[int, dict], limit: int,
+              trace: Optional[dict]) -> List[SearchHit]:
+        """
+        合并记忆数据并排序，依次执行阈值过滤和间隔分析（候选已按相关度降序，两步都只是确定保留的前缀长度）
+
+        Returns:
+            截断到 limit 的结果
+        """
+        import numpy as np
+
+        stage_start = time.perf_counter()
+
+        # 警告：如果 SQLite 中找不到某些 id
+        present = np.fromiter((memory_id in memory_dict for memory_id in candidates.memory_ids.tolist()),
+                              dtype=bool, count=len(candidates))
+        if not present.all():
+            missing_ids = sorted(candidates.memory_ids[~present].tolist())
+            log_msg = f"[语义搜索] 警告: 以下id在SQLite中未找到: {missing_ids}（可运行 mymem fsck --repair 清理孤立向量）"
+            print(log_msg, flush=True)
+            logger.warning(log_msg)
+            if trace is not None:
+                trace["missing_ids"] = missing_ids
+            candidates = candidates.take(present)
+
+        memory_ids = candidates.memory_ids.tolist()
+        relevance = np.clip(1.0 - candidates.distances / 2.0, 0.0, None)
+        relevance_list = relevance.tolist()
+        if trace is not None:
+            trace["memories"] = [
+                {"memory_id": memory_id, "distance": distance, "relevance": rel}
+                for memory_id, distance, rel in zip(memory_ids, candidates.distances.tolist(), relevance_list)
+            ]
+
+        def ranked(start: int, stop: int):
+            return [(memory_ids[i], memory_dict[memory_ids[i]]["title"], relevance_list[i]) for i in range(start, stop)]
+
+        total = len(memory_ids)
+        if self.verbose:
+            self._log(f"\n{'='*80}")
+            self._log(f"[语义搜索] 查询: '{query}'")
+            self._log(f"[初始结果] 排序后共 {total} 条")
+            if total:
+                self._log(_format_ranked(ranked(0, total)))
+
+        # 阈值过滤：先过滤明显不相关的结果
+        keep = int(np.count_nonzero(relevance >= RELEVANCE_THRESHOLD))
+        if trace is not None:
+            trace["threshold"] = {
+                "value": RELEVANCE_THRESHOLD,
+                "before": total,
+                "after": keep,
+                "dropped_ids": memory_ids[keep:]
+            }
+            trace["gap"] = {"applied": False}
+        if keep != total:
+            self._log(f"\n[阈值过滤] {total} -> {keep} 条 (阈值: {RELEVANCE_THRESHOLD})")
+            if self.verbose:
+                self._log(f"[阈值过滤] 过滤掉的数据:\n{_format_ranked(ranked(keep, total))}")
+        else:
+            self._log(f"[阈值过滤] {total} 条 (全部通过阈值 {RELEVANCE_THRESHOLD})")
+
+        # 智能分割：找到相关性明显下降的临界点，最大间隔超过 平均间隔 + 偏移量 时只保留之前的部分
+        if keep > 1:
+            gaps = relevance[:keep - 1] - relevance[1:keep]
+            max_gap_index = int(np.argmax(gaps))
+            max_gap_value = float(gaps[max_gap_index])
+            avg_gap_value = float(gaps.mean())
+            gap_threshold = avg_gap_value + GAP_THRESHOLD_OFFSET
+            if trace is not None:
+                trace["gap"].update({
+                    "gaps": gaps.tolist(),
+                    "max_gap": max_gap_value,
+                    "max_gap_index": max_gap_index,
+                    "avg_gap": avg_gap_value,
+                    "threshold": gap_threshold
+                })
+            self._log(f"\n[间隔分析] 最大间隔 {max_gap_value:.4f} (在索引 {max_gap_index} 和 {max_gap_index + 1} 之间)，"
+                      f"分割阈值 {gap_threshold:.4f} (平均间隔 {avg_gap_value:.4f} + {GAP_THRESHOLD_OFFSET})")
+
+            if max_gap_value > gap_threshold:
+                split_position = max_gap_index + 1
+                self._log(f"[间隔分析] 执行分割: {keep} -> {split_position} 条")
+                if trace is not None:
+                    trace["gap"]["applied"] = True
+                    trace["gap"]["split_position"] = split_position
+                    trace["gap"]["dropped_ids"] = memory_ids[split_position:keep]
+                keep = split_position
+            else:
+                self._log(f"[间隔分析] 不执行分割，保留全部 {keep} 条")
+        else:
+            self._log(f"[间隔分析] {keep} 条 (跳过间隔分析)")
+
+        if self.verbose:
+            self._log(f"\n[最终结果] 返回 {keep} 条")
+            if keep:
+                self._log(_format_ranked(ranked(0, keep)))
+            self._log(f"{'='*80}\n")
+
+        # 只为最终返回的结果构建结果对象和片段
+        hits = [
+            self._build_hit(memory_dict[memory_ids[i]], float(candidates.distances[i]), candidates, i)
+            for i in range(min(keep, limit))
+        ]
+        if trace is not None:
+            trace["timings_ms"]["rank"] = elapsed_ms(stage_start)
+        return hits
+
+    # ---------- 关键字搜索 ----------
+
+    def keyword_search(self, query: str, limit: int = 3, trace: Optional[dict] = None,
+                       cancel: Optional[CancelScope] = None) -> List[SearchHit]:
+        """
+        关键字搜索（SQLite FTS5），片段来自 snippet()，LIKE 兜底搜索时退回到内容开头
+
+        Returns:
+            按相关度降序的结果
+        """
+        checkpoint(cancel, "fts")
+        self._log(f"\n{'='*80}")
+        self._log(f"[SQLite搜索] 查询关键字: '{query}'，限制返回数量: {limit}")
+
+        stage_start = time.perf_counter()
+        memories = self.sqlite_db.search_memories(query, limit=limit)
+        if trace is not None:
+            trace["timings_ms"]["fts"] = elapsed_ms(stage_start)
+            trace["candidates"] = [{"memory_id": m["id"], "rank": m.get("rank", 0)} for m in memories]
+
+        hits = []
+        for memory in memories:
+            relevance = rank_to_relevance(memory.get("rank", 0))
+            snippet = memory.get("snippet") or truncate_snippet(memory["content"])
+            hits.append(SearchHit(
+                id=memory["id"],
+                title=memory["title"],
+                content=memory["content"],
+                tags=memory["tags"],
+                created_at=memory["created_at"],
+                relevance=relevance,
+                chunks=[ChunkMatch(None, None, None, relevance, snippet)]
+            ))
+        # 显式按相关度降序排序（LIKE 兜底搜索按时间排序）
+        hits.sort(key=lambda hit: hit.relevance, reverse=True)
+
+        if self.verbose:
+            self._log(f"[SQLite搜索] 返回 {len(hits)} 条")
+            if hits:
+                self._log(_format_ranked([(h.id, h.title, h.relevance) for h in hits], label="评分"))
+            self._log(f"{'='*80}\n")
+        return hits
@@ -2,28 +2,183 @@
 SQLite 简单封装
 """
 import sqlite3
+import functools
+import hashlib
 import json
 import os
-from typing import List, Optional, Dict
+import threading
+import time
+import uuid
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime
-from ..config import settings
+from urllib.parse import quote
+
+# FTS5 snippet() 高亮标记及截取的词数（单字分词模式下即字符数，FTS5 上限为 64）
+SNIPPET_OPEN = "<mark>"
+SNIPPET_CLOSE = "</mark>"
+SNIPPET_TOKENS = 48
+# 索引内容中代替原文空白的标记：FTS5（unicode61）把它当作分隔符而不是词，不影响检索，snippet() 中还原为空格
+FTS_SPACE = "\u2581"
+
+# 库结构版本（PRAGMA user_version），低于该版本时在启动时重建全文索引
+# 2：索引内容保留原文空白的位置（FTS_SPACE）
+SCHEMA_VERSION = 2
+
+# 读取记忆时查询的列（与 MemoryRecord 的字段顺序一致）
+MEMORY_COLUMNS = "id, title, content, tags, created_at, updated_at, indexing_status"
+
+def _parse_time(value):
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+class MemoryRecord:
+    """
+    一条记忆（轻量记录）
+
+    保存查询得到的原始列值，tags 和时间字段在第一次访问时才解码；
+    兼容原来返回的字典用法：record["title"]、record.get("rank", 0)、MemoryResponse(**record)
+    """
+    __slots__ = ("_row", "_tags", "_created_at", "_updated_at", "rank", "snippet")
+
+    FIELDS = ("id", "title", "content", "tags", "created_at", "updated_at", "indexing_status")
+    _UNSET = object()
+
+    def __init__(self, row: tuple, rank: Optional[float] = None, snippet: Optional[str] = None):
+        """
+        Args:
+            row: 按 MEMORY_COLUMNS 顺序的列值
+            rank: FTS5 相关度（全文检索结果）
+            snippet: 命中片段（全文检索结果）
+        """
+        self._row = row
+        self._tags = self._created_at = self._updated_at = MemoryRecord._UNSET
+        self.rank = rank
+        self.snippet = snippet
+
+    @property
+    def id(self) -> int:
+        return self._row[0]
+
+    @property
+    def title(self) -> str:
+        return self._row[1]
+
+    @property
+    def content(self) -> str:
+        return self._row[2]
+
+    @property
+    def tags(self) -> List[str]:
+        if self._tags is MemoryRecord._UNSET:
+            self._tags = json.loads(self._row[3])
+        return self._tags
+
+    @property
+    def created_at(self):
+        if self._created_at is MemoryRecord._UNSET:
+            self._created_at = _parse_time(self._row[4])
+        return self._created_at
+
+    @property
+    def updated_at(self):
+        if self._updated_at is MemoryRecord._UNSET:
+            self._updated_at = _parse_time(self._row[5]) if self._row[5] is not None else None
+        return self._updated_at
+
+    @property
+    def indexing_status(self) -> str:
+        # 旧数据没有索引状态，视为已完成
+        return self._row[6] or "done"
+
+    def keys(self):
+        extra = tuple(name for name in ("rank", "snippet") if getattr(self, name) is not None)
+        return MemoryRecord.FIELDS + extra
+
+    def __getitem__(self, key: str):
+        if key in MemoryRecord.FIELDS or (key in ("rank", "snippet") and getattr(self, key) is not None):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key) -> bool:
+        return key in self.keys()
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __repr__(self) -> str:
+        return f"MemoryRecord(id={self.id!r}, title={self.title!r})"
+
+# 记忆直接序列化为 JSON 的 SQL 表达式（字段与 MemoryResponse 一致；时间统一为 ISO 格式的 "T" 分隔）
+MEMORY_JSON_SQL = """
+    json_object(
+        'id', id, 'title', title, 'content', content, 'tags', json(tags),
+        'created_at', replace(created_at, ' ', 'T'),
+        'updated_at', replace(updated_at, ' ', 'T'),
+        'indexing_status', coalesce(nullif(indexing_status, ''), 'done'),
+        'job_id', NULL, 'duplicate', NULL
+    )
+"""
+
+def _write_transaction(method):
+    """
+    写事务装饰器：同一连接上的写入串行执行
+
+    连接在事件循环和各线程（写入并发池、线程池）之间共享，事务属于连接而不属于线程：
+    不加锁时两个线程的写入会交错（"cannot start a transaction within a transaction"），
+    一个线程的 rollback() 也会撤销另一个线程尚未提交的写入
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._write_lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 class SQLiteDB:
-    """SQLite 简单封装"""
+    """SQLite 简单封装（写入方法由 _write_lock 串行化，读取不加锁）"""
 
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, init_tables: bool = True, read_only: bool = False,
+                 verbose: bool = True):
         """
         初始化 SQLite 连接
 
         Args:
             db_path: 数据库文件路径，默认使用 settings.db_path
+            init_tables: 是否建表/迁移，同一进程内的额外连接（如后台索引队列）应传 False
+            read_only: 以只读方式打开（mode=ro，不建表、不迁移、不改日志模式；数据库不存在时抛出 sqlite3.OperationalError），
+                       供命令行搜索等只查询的场景使用
+            verbose: 是否打印检索日志
         """
         if db_path is None:
+            # 延迟导入：只读的命令行搜索传入路径，不需要加载配置（pydantic）
+            from ..config import settings
             db_path = settings.db_path
 
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        started = time.perf_counter()
+        self.read_only = read_only
+        self.verbose = verbose
+        # 可重入：写入方法之间可以互相调用
+        self._write_lock = threading.RLock()
+        if read_only:
+            self.conn = sqlite3.connect(f"file:{quote(os.path.abspath(db_path))}?mode=ro", uri=True,
+                                        check_same_thread=False)
+        else:
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
-        self._init_tables()
+        if not read_only:
+            # WAL 模式：读写互不阻塞，便于后台线程与请求处理并发访问
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            if init_tables:
+                self._init_tables()
+        # 打开数据库（含建表/迁移）的耗时（秒）
+        self.init_seconds = time.perf_counter() - started
 
     def _init_tables(self):
         """创建表"""
@@ -39,6 +194,149 @@ class SQLiteDB:
             )
         """)
 
+        # 全文索引只在库结构版本升级时重建（旧版本每次启动都会重建，数据量大时很慢）
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] < SCHEMA_VERSION:
+            self._rebuild_fts(cursor)
+        else:
+            # 防止全文索引表被意外删除
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memories_fts'")
+            if cursor.fetchone() is None:
+                self._rebuild_fts(cursor)
+
+        # 如果表已存在但没有 updated_at 字段，则添加
+        try:
+            cursor.execute("ALTER TABLE memories ADD COLUMN updated_at TIMESTAMP")
+            self.conn.commit()
+        except sqlite3.OperationalError:
+            # 字段已存在，忽略错误
+            pass
+
+        # 向量索引状态：pending / indexing / done / failed（NULL 表示同步写入，视为 done）
+        try:
+            cursor.execute("ALTER TABLE memories ADD COLUMN indexing_status TEXT")
+            self.conn.commit()
+        except sqlite3.OperationalError:
+            pass
+
+        # 索引日志表（outbox）：每次增删改记忆都在同一事务中写入一条，
+        # 向量库写入完成后标记为 done；进程崩溃时由后台索引队列继续处理
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS index_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                memory_id INTEGER NOT NULL,
+                op TEXT NOT NULL DEFAULT 'index',
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                total_chunks INTEGER,
+                done_chunks INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                created_at TIMESTAMP,
+                updated_at TIMESTAMP
+            )
+        """)
+        # 操作类型：index（写入/更新向量）/ delete（删除向量）
+        try:
+            cursor.execute("ALTER TABLE index_jobs ADD COLUMN op TEXT NOT NULL DEFAULT 'index'")
+            self.conn.commit()
+        except sqlite3.OperationalError:
+            pass
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_index_jobs_status ON index_jobs(status, id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_index_jobs_memory ON index_jobs(memory_id, status)")
+
+        # 目录导入清单（mymem ingest）：记录文件状态，未变化的文件直接跳过
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS ingest_files (
+                path TEXT PRIMARY KEY,
+                mtime REAL NOT NULL,
+                size INTEGER NOT NULL,
+                hash TEXT NOT NULL,
+                memory_id INTEGER NOT NULL,
+                updated_at TIMESTAMP
+            )
+        """)
+
+        # 键值元数据（mymem fsck 检查点、变更序号、实例 ID 等）
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """)
+
+        # 变更序号（变更流 /api/v1/changes）：每次增删改分配一个递增的 seq
+        # origin / origin_id：从其他实例同步来的记忆在源实例的全局标识（本机创建的为 NULL）
+        try:
+            cursor.execute("ALTER TABLE memories ADD COLUMN seq INTEGER")
+            cursor.execute("ALTER TABLE memories ADD COLUMN origin TEXT")
+            cursor.execute("ALTER TABLE memories ADD COLUMN origin_id INTEGER")
+            # 存量记录按 ID 顺序补齐序号
+            cursor.execute("UPDATE memories SET seq = id")
+            self.conn.commit()
+        except sqlite3.OperationalError:
+            pass
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_seq ON memories(seq)")
+        cursor.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS idx_memories_origin ON memories(origin, origin_id) "
+            "WHERE origin IS NOT NULL"
+        )
+
+        # 删除记录的墓碑，变更流据此通知其他实例删除
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS tombstones (
+                memory_id INTEGER PRIMARY KEY,
+                origin TEXT,
+                origin_id INTEGER,
+                seq INTEGER NOT NULL,
+                deleted_at TIMESTAMP
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tombstones_seq ON tombstones(seq)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_tombstones_origin ON tombstones(origin, origin_id)")
+
+        cursor.execute(
+            "INSERT OR IGNORE INTO meta (key, value) "
+            "SELECT 'change_seq', MAX(COALESCE((SELECT MAX(seq) FROM memories), 0), "
+            "COALESCE((SELECT MAX(seq) FROM tombstones), 0))"
+        )
+        cursor.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('instance_id', ?)", (uuid.uuid4().hex,))
+
+        # 记忆表代数（列表/详情接口的 ETag）：记忆表的每次增删改（含索引状态变化）由触发器加一，
+        # 不依赖各写入方法，多进程写入同样可见
+        cursor.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', '0')")
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS memories_generation_{event.lower()} AFTER {event} ON memories
+                BEGIN
+                    UPDATE meta SET value = CAST(value AS INTEGER) + 1 WHERE key = 'generation';
+                END
+            """)
+
+        # 内容哈希（写入时精确去重）
+        try:
+            cursor.execute("ALTER TABLE memories ADD COLUMN content_hash TEXT")
+            cursor.execute("SELECT id, content FROM memories")
+            cursor.executemany(
+                "UPDATE memories SET content_hash = ? WHERE id = ?",
+                [(self.content_hash(row["content"]), row["id"]) for row in cursor.fetchall()]
+            )
+            self.conn.commit()
+        except sqlite3.OperationalError:
+            pass
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_content_hash ON memories(content_hash)")
+        # 列表按创建时间倒序：有索引时按索引顺序读取，不必把整行（含全文）放进排序器
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_memories_created_at ON memories(created_at)")
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.commit()
+
+    @staticmethod
+    def content_hash(content: str) -> str:
+        """记忆内容哈希（忽略首尾空白）"""
+        return hashlib.sha1(content.strip().encode("utf-8")).hexdigest()
+
+    def _rebuild_fts(self, cursor):
+        """重建 FTS5 全文索引（带分词处理）"""
         # 创建 FTS5 虚拟表（不使用外部内容模式，以便独立存储分词后的内容）
         # 这种方式对于中文检索最稳健
         cursor.execute("DROP TABLE IF EXISTS memories_fts")
@@ -58,40 +356,78 @@ class SQLiteDB:
         # 初始存量数据搬迁（带分词处理）
         cursor.execute("SELECT id, title, content, tags FROM memories")
         rows = cursor.fetchall()
-        for row in rows:
-            cursor.execute(
-                "INSERT INTO memories_fts(rowid, title, content, tags) VALUES (?, ?, ?, ?)",
+        cursor.executemany(
+            "INSERT INTO memories_fts(rowid, title, content, tags) VALUES (?, ?, ?, ?)",
+            [
                 (
                     row["id"],
                     self._tokenize_for_fts(row["title"]),
                     self._tokenize_for_fts(row["content"]),
                     self._tokenize_for_fts(row["tags"])
                 )
-            )
-
-        # 如果表已存在但没有 updated_at 字段，则添加
-        try:
-            cursor.execute("ALTER TABLE memories ADD COLUMN updated_at TIMESTAMP")
-            self.conn.commit()
-        except sqlite3.OperationalError:
-            # 字段已存在，忽略错误
-            pass
-        self.conn.commit()
+                for row in rows
+            ]
+        )
 
-    def _tokenize_for_fts(self, text: str) -> str:
+    def _tokenize_for_fts(self, text: str, keep_spaces: bool = True) -> str:
         """
         为 FTS5 准备的分词逻辑：在每个字符间添加空格
         这样可以将每个中文字符当作一个独立的词处理，实现完美的全文检索效果
+
+        Args:
+            keep_spaces: 原文中的空白（连续空白算一处）记为 FTS_SPACE，片段据此还原英文等的词间空格；
+                         查询词不需要（标记不是词，短语匹配时会跨过）
         """
         if not text:
             return ""
-        # 去掉原有的多余空格，并重新按字符拆分
-        chars = [c for c in text if not c.isspace()]
+        chars = []
+        space = False
+        for c in text.strip():
+            if c.isspace():
+                space = keep_spaces
+                continue
+            if space:
+                chars.append(FTS_SPACE)
+                space = False
+            chars.append(c)
         return " ".join(chars)
 
-    def create_memory(self, title: str, content: str, tags: List[str]) -> int:
+    def _detokenize_snippet(self, text: str) -> str:
         """
-        创建记录
+        还原 FTS5 snippet() 的输出：去掉分词时插入的空格，把 FTS_SPACE 还原为空格，并合并相邻的高亮标记
+        """
+        if not text:
+            return ""
+        text = text.replace(" ", "").replace(FTS_SPACE, " ")
+        return text.replace(f"{SNIPPET_CLOSE}{SNIPPET_OPEN}", "")
+
+    def _next_seq(self, cursor, count: int = 1) -> int:
+        """
+        在当前事务中分配 count 个变更序号（先 UPDATE 取得写锁，多进程写入也不会重复）
+
+        Returns:
+            分配的最后一个序号（第一个为 返回值 - count + 1）
+        """
+        cursor.execute(
+            "UPDATE meta SET value = CAST(value AS INTEGER) + ? WHERE key = 'change_seq'",
+            (count,)
+        )
+        cursor.execute("SELECT CAST(value AS INTEGER) FROM meta WHERE key = 'change_seq'")
+        return cursor.fetchone()[0]
+
+    @property
+    def instance_id(self) -> str:
+        """本实例的唯一标识（变更流中作为本机记忆的 origin）"""
+        return self.get_meta("instance_id")
+
+    @_write_transaction
+    def create_memory(self, title: str, content: str, tags: List[str], enqueue_index: bool = False) -> int:
+        """
+        创建记录（同一事务中写入索引日志）
+
+        Args:
+            enqueue_index: 为 True 时日志交给后台索引队列处理（pending）；
+                           为 False 时由调用方立即写入向量，完成后调用 finish_memory_index_jobs
         """
         cursor = self.conn.cursor()
         tags_json = json.dumps(tags, ensure_ascii=False)
@@ -100,9 +436,10 @@ class SQLiteDB:
         created_at = datetime.now().isoformat()
 
         # 1. 存入主表
+        seq = self._next_seq(cursor)
         cursor.execute(
-            "INSERT INTO memories (title, content, tags, created_at) VALUES (?, ?, ?, ?)",
-            (title, content, tags_json, created_at)
+            "INSERT INTO memories (title, content, tags, created_at, seq, content_hash) VALUES (?, ?, ?, ?, ?, ?)",
+            (title, content, tags_json, created_at, seq, self.content_hash(content))
         )
         memory_id = cursor.lastrowid
 
@@ -117,12 +454,90 @@ class SQLiteDB:
             )
         )
 
+        self._insert_index_job(cursor, memory_id, claimed=not enqueue_index)
+
         self.conn.commit()
         return memory_id
 
-    def update_memory(self, memory_id: int, title: str, content: str, tags: List[str]) -> bool:
+    @_write_transaction
+    def create_memories(self, items: List[Tuple[str, str, List[str]]],
+                        origins: Optional[List[Tuple[str, int]]] = None) -> List[int]:
+        """
+        批量创建记录（单个事务，executemany 写入主表、FTS 表和索引日志）
+
+        索引日志由调用方认领，向量写入完成后调用 finish_memory_index_jobs
+
+        Args:
+            items: (title, content, tags) 列表
+            origins: 与 items 对应的 (origin, origin_id)，从其他实例同步时使用
+
+        Returns:
+            与输入顺序一致的记录 ID 列表
         """
-        更新记录
+        if not items:
+            return []
+
+        cursor = self.conn.cursor()
+        created_at = datetime.now().isoformat()
+        try:
+            # 立即获取写锁，保证预分配的 ID 区间不会被其他写入占用
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'memories'")
+            row = cursor.fetchone()
+            cursor.execute("SELECT MAX(id) FROM memories")
+            max_id = cursor.fetchone()[0]
+            base_id = max(row[0] if row else 0, max_id or 0)
+            memory_ids = list(range(base_id + 1, base_id + 1 + len(items)))
+            first_seq = self._next_seq(cursor, len(items)) - len(items) + 1
+            if origins is None:
+                origins = [(None, None)] * len(items)
+
+            rows = []
+            fts_rows = []
+            for i, (memory_id, (title, content, tags)) in enumerate(zip(memory_ids, items)):
+                tags_json = json.dumps(tags, ensure_ascii=False)
+                origin, origin_id = origins[i]
+                rows.append((memory_id, title, content, tags_json, created_at, first_seq + i, origin, origin_id,
+                             self.content_hash(content)))
+                fts_rows.append((
+                    memory_id,
+                    self._tokenize_for_fts(title),
+                    self._tokenize_for_fts(content),
+                    self._tokenize_for_fts(tags_json)
+                ))
+
+            cursor.executemany(
+                "INSERT INTO memories (id, title, content, tags, created_at, seq, origin, origin_id, content_hash) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            cursor.executemany(
+                "INSERT INTO memories_fts(rowid, title, content, tags) VALUES (?, ?, ?, ?)",
+                fts_rows
+            )
+            cursor.executemany(
+                "INSERT INTO index_jobs (memory_id, op, status, attempts, created_at, updated_at) "
+                "VALUES (?, 'index', 'running', 1, ?, ?)",
+                [(memory_id, created_at, created_at) for memory_id in memory_ids]
+            )
+            cursor.execute(
+                "UPDATE memories SET indexing_status = 'indexing' WHERE id BETWEEN ? AND ?",
+                (memory_ids[0], memory_ids[-1])
+            )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return memory_ids
+
+    @_write_transaction
+    def update_memory(self, memory_id: int, title: str, content: str, tags: List[str],
+                      enqueue_index: bool = False) -> bool:
+        """
+        更新记录（同一事务中写入索引日志）
+
+        Args:
+            enqueue_index: 同 create_memory
         """
         cursor = self.conn.cursor()
         tags_json = json.dumps(tags, ensure_ascii=False)
@@ -131,10 +546,16 @@ class SQLiteDB:
         updated_at = datetime.now().isoformat()
 
         # 1. 更新主表
+        seq = self._next_seq(cursor)
         cursor.execute(
-            "UPDATE memories SET title = ?, content = ?, tags = ?, updated_at = ? WHERE id = ?",
-            (title, content, tags_json, updated_at, memory_id)
+            "UPDATE memories SET title = ?, content = ?, tags = ?, updated_at = ?, seq = ?, content_hash = ? WHERE id = ?",
+            (title, content, tags_json, updated_at, seq, self.content_hash(content), memory_id)
         )
+        updated = cursor.rowcount > 0
+        if not updated:
+            # 记录不存在，放弃分配的序号
+            self.conn.rollback()
+            return False
 
         # 2. 同步更新 FTS 表
         cursor.execute(
@@ -147,25 +568,49 @@ class SQLiteDB:
             )
         )
 
+        self._insert_index_job(cursor, memory_id, claimed=not enqueue_index)
+
         self.conn.commit()
-        return cursor.rowcount > 0
+        return updated
 
-    def delete_memory(self, memory_id: int) -> bool:
+    @_write_transaction
+    def delete_memory(self, memory_id: int, enqueue_index: bool = False) -> bool:
         """
-        删除记录
+        删除记录（同一事务中写入删除向量的索引日志，由调用方认领）
+
+        Args:
+            enqueue_index: 为 True 时删除向量交给后台索引队列
         """
         cursor = self.conn.cursor()
 
-        # 1. 删除主表
+        # 1. 写入墓碑（变更流据此通知其他实例），再删除主表
+        seq = self._next_seq(cursor)
+        cursor.execute(
+            "INSERT OR REPLACE INTO tombstones (memory_id, origin, origin_id, seq, deleted_at) "
+            "SELECT id, origin, origin_id, ?, ? FROM memories WHERE id = ?",
+            (seq, datetime.now().isoformat(), memory_id)
+        )
         cursor.execute("DELETE FROM memories WHERE id = ?", (memory_id,))
+        deleted = cursor.rowcount > 0
+        if not deleted:
+            self.conn.rollback()
+            return False
 
         # 2. 同步删除 FTS 表
         cursor.execute("DELETE FROM memories_fts WHERE rowid = ?", (memory_id,))
 
+        self._insert_index_job(cursor, memory_id, op="delete", claimed=not enqueue_index)
+
         self.conn.commit()
-        return cursor.rowcount > 0
+        return deleted
+
+    def _record_cursor(self):
+        """返回元组行的游标（MemoryRecord 按下标取列，不需要 sqlite3.Row）"""
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        return cursor
 
-    def get_memory(self, memory_id: int) -> Optional[Dict]:
+    def get_memory(self, memory_id: int) -> Optional[MemoryRecord]:
         """
         获取单条记录
 
@@ -173,55 +618,57 @@ class SQLiteDB:
             memory_id: 记录 ID
 
         Returns:
-            记录字典或 None
+            记录或 None
         """
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM memories WHERE id = ?", (memory_id,))
+        cursor = self._record_cursor()
+        cursor.execute(f"SELECT {MEMORY_COLUMNS} FROM memories WHERE id = ?", (memory_id,))
         row = cursor.fetchone()
-        if row is None:
-            return None
-        result = {
-            "id": row["id"],
-            "title": row["title"],
-            "content": row["content"],
-            "tags": json.loads(row["tags"]),
-            "created_at": datetime.fromisoformat(row["created_at"]) if isinstance(row["created_at"], str) else row["created_at"]
-        }
-        # 处理 updated_at 字段（可能为 None）
-        if "updated_at" in row.keys() and row["updated_at"] is not None:
-            result["updated_at"] = datetime.fromisoformat(row["updated_at"]) if isinstance(row["updated_at"], str) else row["updated_at"]
-        else:
-            result["updated_at"] = None
-        return result
+        return MemoryRecord(row) if row is not None else None
 
-    def get_all_memories(self) -> List[Dict]:
+    def get_all_memories(self) -> List[MemoryRecord]:
         """
         获取所有记录（按创建时间倒序）
 
         Returns:
             记录列表
         """
+        cursor = self._record_cursor()
+        cursor.execute(f"SELECT {MEMORY_COLUMNS} FROM memories ORDER BY created_at DESC")
+        return [MemoryRecord(row) for row in cursor.fetchall()]
+
+    def get_all_memories_json(self) -> bytes:
+        """
+        所有记录直接序列化为 JSON 数组（按创建时间倒序，格式同 MemoryResponse 列表）
+
+        由 SQLite 的 JSON 函数逐行生成，不构建 Python 对象，用于列表接口
+        """
+        cursor = self._record_cursor()
+        cursor.execute(f"SELECT {MEMORY_JSON_SQL} FROM memories ORDER BY created_at DESC")
+        return ("[" + ",".join(row[0] for row in cursor) + "]").encode("utf-8")
+
+    def get_corpus_version(self) -> Tuple[str, int]:
+        """
+        记忆表的版本 (实例 ID, 代数)：任何记忆增删改或索引状态变化后代数加一
+
+        导入快照会更换实例 ID，代数从快照中的值继续也不会与之前的版本重复
+        """
+        cursor = self._record_cursor()
+        cursor.execute("SELECT key, value FROM meta WHERE key IN ('instance_id', 'generation')")
+        values = dict(cursor.fetchall())
+        return values.get("instance_id", ""), int(values.get("generation") or 0)
+
+    def get_memory_version(self, memory_id: int) -> Optional[Tuple[int, str]]:
+        """
+        单条记录的版本 (seq, indexing_status)，不读取内容；记录不存在时返回 None
+
+        seq 在每次修改内容时重新分配，indexing_status 覆盖只改变索引状态的情况
+        """
         cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM memories ORDER BY created_at DESC")
-        rows = cursor.fetchall()
-        result = []
-        for row in rows:
-            memory_dict = {
-                "id": row["id"],
-                "title": row["title"],
-                "content": row["content"],
-                "tags": json.loads(row["tags"]),
-                "created_at": datetime.fromisoformat(row["created_at"]) if isinstance(row["created_at"], str) else row["created_at"]
-            }
-            # 处理 updated_at 字段（可能为 None）
-            if "updated_at" in row.keys() and row["updated_at"] is not None:
-                memory_dict["updated_at"] = datetime.fromisoformat(row["updated_at"]) if isinstance(row["updated_at"], str) else row["updated_at"]
-            else:
-                memory_dict["updated_at"] = None
-            result.append(memory_dict)
-        return result
+        cursor.execute("SELECT seq, indexing_status FROM memories WHERE id = ?", (memory_id,))
+        row = cursor.fetchone()
+        return (row[0], row[1] or "done") if row is not None else None
 
-    def get_memories_by_ids(self, ids: List[int]) -> List[Dict]:
+    def get_memories_by_ids(self, ids: List[int]) -> List[MemoryRecord]:
         """
         批量获取记录
 
@@ -233,122 +680,484 @@ class SQLiteDB:
         """
         if not ids:
             return []
-        cursor = self.conn.cursor()
+        cursor = self._record_cursor()
         placeholders = ",".join("?" * len(ids))
-        cursor.execute(f"SELECT * FROM memories WHERE id IN ({placeholders})", ids)
-        rows = cursor.fetchall()
-        result = []
-        for row in rows:
-            memory_dict = {
-                "id": row["id"],
-                "title": row["title"],
-                "content": row["content"],
-                "tags": json.loads(row["tags"]),
-                "created_at": datetime.fromisoformat(row["created_at"]) if isinstance(row["created_at"], str) else row["created_at"]
-            }
-            # 处理 updated_at 字段（可能为 None）
-            if "updated_at" in row.keys() and row["updated_at"] is not None:
-                memory_dict["updated_at"] = datetime.fromisoformat(row["updated_at"]) if isinstance(row["updated_at"], str) else row["updated_at"]
-            else:
-                memory_dict["updated_at"] = None
-            result.append(memory_dict)
-        return result
+        cursor.execute(f"SELECT {MEMORY_COLUMNS} FROM memories WHERE id IN ({placeholders})", ids)
+        return [MemoryRecord(row) for row in cursor.fetchall()]
 
-    def search_memories(self, query: str) -> List[Dict]:
+    def search_memories(self, query: str, limit: Optional[int] = None) -> List[MemoryRecord]:
         """
         基于 FTS5 的全文检索（标题、内容或标签）
 
         Args:
             query: 搜索关键字
+            limit: 最多返回的条数（在 SQL 中截断，只为前 limit 条生成片段），默认全部
 
         Returns:
-            匹配的记录列表（按相关度排序）
+            匹配的记录列表（按相关度排序，带 rank 和 snippet）
         """
         if not query:
             return []
 
-        cursor = self.conn.cursor()
+        cursor = self._record_cursor()
 
         # 1. 关键：将搜索词也进行空格分词
         # 比如用户搜 "模式" -> 变成 "模 式"
         # 这样 MATCH 语法才能匹配到 FTS 表中被拆分开的字符
-        tokenized_query = self._tokenize_for_fts(query)
+        tokenized_query = self._tokenize_for_fts(query, keep_spaces=False)
 
         # 打印搜索信息
-        print(f"[SQLiteDB] 执行 FTS5 全文检索 (空格分词模式)", flush=True)
-        print(f"[SQLiteDB] 查询词: '{query}' -> 分词: '{tokenized_query}'", flush=True)
+        if self.verbose:
+            print(f"[SQLiteDB] 执行 FTS5 全文检索 (空格分词模式)", flush=True)
+            print(f"[SQLiteDB] 查询词: '{query}' -> 分词: '{tokenized_query}'", flush=True)
 
         # 使用 FTS5 的 MATCH 语法
-        # 提取 f.rank 以便后续计算相关度分数
-        sql = """
-            SELECT m.*, f.rank
+        # 提取 f.rank 以便后续计算相关度分数，snippet() 截取命中位置附近的片段
+        sql = f"""
+            SELECT m.id, m.title, m.content, m.tags, m.created_at, m.updated_at, m.indexing_status, f.rank,
+                   snippet(memories_fts, -1, '{SNIPPET_OPEN}', '{SNIPPET_CLOSE}', '...', {SNIPPET_TOKENS}) AS snippet
             FROM memories m
             JOIN memories_fts f ON m.id = f.rowid
             WHERE memories_fts MATCH ?
             ORDER BY rank
+            LIMIT ?
         """
+        # LIMIT -1 表示不限制
+        sql_limit = limit if limit is not None else -1
 
         try:
             # FTS5 的查询词如果包含特殊字符可能报错，这里做一个简单的转义处理
             # 在空格分词模式下，我们将 tokenized_query 整体放入引号中作为短语搜索
             # 这样搜索 "模 式" 必须是这两个字紧挨着的才算匹配
             phrase_query = f'"{tokenized_query}"'
-            cursor.execute(sql, (phrase_query,))
+            cursor.execute(sql, (phrase_query, sql_limit))
         except sqlite3.OperationalError as e:
-            print(f"[SQLiteDB] FTS5 搜索遇到语法错误: {e}，尝试不带引号查询...", flush=True)
+            if self.verbose:
+                print(f"[SQLiteDB] FTS5 搜索遇到语法错误: {e}，尝试不带引号查询...", flush=True)
             try:
-                cursor.execute(sql, (tokenized_query,))
+                cursor.execute(sql, (tokenized_query, sql_limit))
             except sqlite3.OperationalError:
                 # 最后的兜底方案：退回到原始的 LIKE 搜索
-                print(f"[SQLiteDB] 尝试失败，退回到 LIKE 搜索", flush=True)
-                return self._search_like(cursor, query)
+                if self.verbose:
+                    print(f"[SQLiteDB] 尝试失败，退回到 LIKE 搜索", flush=True)
+                return self._search_like(cursor, query, sql_limit)
 
         rows = cursor.fetchall()
-        print(f"[SQLiteDB] SQL查询返回 {len(rows)} 行", flush=True)
-
-        result = []
-        for row in rows:
-            memory_dict = {
-                "id": row["id"],
-                "title": row["title"],
-                "content": row["content"],
-                "tags": json.loads(row["tags"]),
-                "rank": row["rank"] if "rank" in row.keys() else 0,
-                "created_at": datetime.fromisoformat(row["created_at"]) if isinstance(row["created_at"], str) else row["created_at"]
-            }
-            # 处理 updated_at 字段（可能为 None）
-            if "updated_at" in row.keys() and row["updated_at"] is not None:
-                memory_dict["updated_at"] = datetime.fromisoformat(row["updated_at"]) if isinstance(row["updated_at"], str) else row["updated_at"]
-            else:
-                memory_dict["updated_at"] = None
-            result.append(memory_dict)
-
-        print(f"[SQLiteDB] 搜索完成，返回 {len(result)} 条记录", flush=True)
+        if self.verbose:
+            print(f"[SQLiteDB] SQL查询返回 {len(rows)} 行", flush=True)
+
+        # 前 7 列为记忆字段，其后是 rank 和 snippet
+        result = [MemoryRecord(row[:7], rank=row[7], snippet=self._detokenize_snippet(row[8])) for row in rows]
+
+        if self.verbose:
+            print(f"[SQLiteDB] 搜索完成，返回 {len(result)} 条记录", flush=True)
         return result
 
-    def _search_like(self, cursor, query):
+    def _search_like(self, cursor, query, limit: int = -1) -> List[MemoryRecord]:
         """内部辅助：退回到 LIKE 搜索"""
         search_pattern = f"%{query}%"
         cursor.execute(
-            "SELECT * FROM memories WHERE title LIKE ? OR content LIKE ? OR tags LIKE ? ORDER BY created_at DESC",
-            (search_pattern, search_pattern, search_pattern)
+            f"SELECT {MEMORY_COLUMNS} FROM memories WHERE title LIKE ? OR content LIKE ? OR tags LIKE ? "
+            "ORDER BY created_at DESC LIMIT ?",
+            (search_pattern, search_pattern, search_pattern, limit)
         )
-        rows = cursor.fetchall()
-        result = []
-        for row in rows:
-            memory_dict = {
-                "id": row["id"],
-                "title": row["title"],
-                "content": row["content"],
-                "tags": json.loads(row["tags"]),
-                "created_at": datetime.fromisoformat(row["created_at"]) if isinstance(row["created_at"], str) else row["created_at"]
-            }
-            if "updated_at" in row.keys() and row["updated_at"] is not None:
-                memory_dict["updated_at"] = datetime.fromisoformat(row["updated_at"]) if isinstance(row["updated_at"], str) else row["updated_at"]
-            else:
-                memory_dict["updated_at"] = None
-            result.append(memory_dict)
-        return result
+        return [MemoryRecord(row) for row in cursor.fetchall()]
+
+    # ---------- 后台索引任务 ----------
+
+    def _insert_index_job(self, cursor, memory_id: int, op: str = "index", claimed: bool = False) -> int:
+        """
+        在当前事务中写入索引日志（不提交）
+
+        Args:
+            op: index（写入/更新向量）或 delete（删除向量）
+            claimed: 为 True 时由当前调用方立即处理（running），否则交给后台索引队列（pending）
+        """
+        now = datetime.now().isoformat()
+        status = "running" if claimed else "pending"
+        cursor.execute(
+            "INSERT INTO index_jobs (memory_id, op, status, attempts, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (memory_id, op, status, 1 if claimed else 0, now, now)
+        )
+        job_id = cursor.lastrowid
+        if op == "index":
+            cursor.execute(
+                "UPDATE memories SET indexing_status = ? WHERE id = ?",
+                ("indexing" if claimed else "pending", memory_id)
+            )
+        return job_id
+
+    @_write_transaction
+    def enqueue_index_jobs(self, memory_ids: List[int]) -> int:
+        """
+        为记忆写入待处理的索引日志，由后台索引队列按 SQLite 当前状态同步向量
+        （存在的记忆重新写入向量，已不存在的删除向量）
+
+        Returns:
+            写入的日志条数
+        """
+        existing = set()
+        for offset in range(0, len(memory_ids), 500):
+            existing |= self.get_existing_memory_ids(memory_ids[offset:offset + 500])
+        cursor = self.conn.cursor()
+        try:
+            for memory_id in memory_ids:
+                self._insert_index_job(cursor, memory_id, op="index" if memory_id in existing else "delete")
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return len(memory_ids)
+
+    def get_index_job(self, job_id: int) -> Optional[Dict]:
+        """
+        获取索引任务
+
+        Args:
+            job_id: 任务 ID
+
+        Returns:
+            任务字典或 None
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT * FROM index_jobs WHERE id = ?", (job_id,))
+        row = cursor.fetchone()
+        return dict(row) if row is not None else None
+
+    def get_latest_index_job(self, memory_id: int) -> Optional[Dict]:
+        """获取某条记忆最新的索引任务"""
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT * FROM index_jobs WHERE memory_id = ? ORDER BY id DESC LIMIT 1",
+            (memory_id,)
+        )
+        row = cursor.fetchone()
+        return dict(row) if row is not None else None
+
+    def count_index_jobs(self, statuses: Tuple[str, ...] = ("pending", "running")) -> int:
+        """统计指定状态的索引任务数"""
+        cursor = self.conn.cursor()
+        placeholders = ",".join("?" * len(statuses))
+        cursor.execute(f"SELECT COUNT(*) FROM index_jobs WHERE status IN ({placeholders})", statuses)
+        return cursor.fetchone()[0]
+
+    @_write_transaction
+    def claim_index_jobs(self, limit: int) -> List[Dict]:
+        """
+        领取待处理的索引任务（标记为 running 并累加尝试次数）
+
+        Args:
+            limit: 最多领取的任务数
+
+        Returns:
+            任务列表（按创建顺序）
+        """
+        cursor = self.conn.cursor()
+        now = datetime.now().isoformat()
+        try:
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute(
+                "SELECT * FROM index_jobs WHERE status = 'pending' ORDER BY id LIMIT ?",
+                (limit,)
+            )
+            jobs = [dict(row) for row in cursor.fetchall()]
+            for job in jobs:
+                job["attempts"] += 1
+                cursor.execute(
+                    "UPDATE index_jobs SET status = 'running', attempts = ?, updated_at = ? WHERE id = ?",
+                    (job["attempts"], now, job["id"])
+                )
+                cursor.execute(
+                    "UPDATE memories SET indexing_status = 'indexing' WHERE id = ?",
+                    (job["memory_id"],)
+                )
+            self.conn.commit()
+        except Exception:
+            self.conn.rollback()
+            raise
+        return jobs
+
+    @_write_transaction
+    def update_index_job_progress(self, job_ids: List[int], done_chunks: int, total_chunks: int):
+        """更新索引任务进度（同一批处理的任务共享进度）"""
+        now = datetime.now().isoformat()
+        self.conn.executemany(
+            "UPDATE index_jobs SET done_chunks = ?, total_chunks = ?, updated_at = ? WHERE id = ?",
+            [(done_chunks, total_chunks, now, job_id) for job_id in job_ids]
+        )
+        self.conn.commit()
+
+    @_write_transaction
+    def finish_index_job(self, job_id: int, status: str, error: str = None):
+        """
+        结束索引任务
+
+        Args:
+            job_id: 任务 ID
+            status: done / failed / pending（失败后重试）
+            error: 错误信息
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "UPDATE index_jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+            (status, error, datetime.now().isoformat(), job_id)
+        )
+        # 只有该记忆没有更新的任务排队时才同步记录状态
+        cursor.execute(
+            """
+            UPDATE memories SET indexing_status = ?
+            WHERE id = (SELECT memory_id FROM index_jobs WHERE id = ?)
+              AND NOT EXISTS (
+                  SELECT 1 FROM index_jobs j
+                  WHERE j.memory_id = memories.id AND j.id > ? AND j.status IN ('pending', 'running')
+              )
+            """,
+            (status, job_id, job_id)
+        )
+        self.conn.commit()
+
+    def finish_memory_index_jobs(self, memory_ids: List[int]):
+        """
+        调用方已同步写入向量：结束这些记忆正在处理的索引日志
+
+        Args:
+            memory_ids: 记忆 ID 列表
+        """
+        self._close_memory_index_jobs(memory_ids, "done", None)
+
+    def release_memory_index_jobs(self, memory_ids: List[int], error: str = None):
+        """
+        调用方写入向量失败：把这些记忆正在处理的索引日志交还后台索引队列重试
+
+        Args:
+            memory_ids: 记忆 ID 列表
+            error: 错误信息
+        """
+        self._close_memory_index_jobs(memory_ids, "pending", error)
+
+    @_write_transaction
+    def _close_memory_index_jobs(self, memory_ids: List[int], status: str, error: Optional[str]):
+        if not memory_ids:
+            return
+        now = datetime.now().isoformat()
+        cursor = self.conn.cursor()
+        for offset in range(0, len(memory_ids), 500):
+            batch = memory_ids[offset:offset + 500]
+            placeholders = ",".join("?" * len(batch))
+            # 先更新记录状态：running 的任务随后都会被关闭，还有 pending 任务（之后入队的）时保留其状态
+            # （在关闭之后判断会把刚交还的任务也当作新任务）
+            cursor.execute(
+                f"UPDATE memories SET indexing_status = ? WHERE id IN ({placeholders}) "
+                f"AND NOT EXISTS (SELECT 1 FROM index_jobs j "
+                f"WHERE j.memory_id = memories.id AND j.status = 'pending')",
+                [status] + batch
+            )
+            cursor.execute(
+                f"UPDATE index_jobs SET status = ?, error = ?, updated_at = ? "
+                f"WHERE memory_id IN ({placeholders}) AND status = 'running'",
+                [status, error, now] + batch
+            )
+        self.conn.commit()
+
+    @_write_transaction
+    def prune_index_jobs(self, before: str) -> int:
+        """
+        清理已完成的索引日志
+
+        Args:
+            before: ISO 时间，早于该时间完成的日志会被删除
+
+        Returns:
+            删除的条数
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM index_jobs WHERE status = 'done' AND updated_at < ?", (before,))
+        self.conn.commit()
+        return cursor.rowcount
+
+    @_write_transaction
+    def reset_running_index_jobs(self) -> int:
+        """将上次进程退出时未完成的 running 任务放回队列"""
+        cursor = self.conn.cursor()
+        cursor.execute("UPDATE index_jobs SET status = 'pending' WHERE status = 'running'")
+        self.conn.commit()
+        return cursor.rowcount
+
+    def get_pending_index_memory_ids(self) -> set:
+        """获取还有未完成索引日志（pending / running）的记忆 ID"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT DISTINCT memory_id FROM index_jobs WHERE status IN ('pending', 'running')")
+        return {row[0] for row in cursor.fetchall()}
+
+    def get_max_index_job_id(self) -> int:
+        """当前最大的索引日志 ID"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT MAX(id) FROM index_jobs")
+        return cursor.fetchone()[0] or 0
+
+    def get_changed_memory_ids(self, after_job_id: int) -> set:
+        """获取索引日志 ID 大于 after_job_id 的记忆 ID（即此后增删改过的记忆）"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT DISTINCT memory_id FROM index_jobs WHERE id > ?", (after_job_id,))
+        return {row[0] for row in cursor.fetchall()}
+
+    def iter_memory_id_pages(self, page_size: int = 500):
+        """
+        按 ID 顺序分页遍历记忆 ID（键集分页，不一次性读取全部）
+
+        Yields:
+            每页的记忆 ID 列表
+        """
+        last_id = 0
+        cursor = self.conn.cursor()
+        while True:
+            cursor.execute("SELECT id FROM memories WHERE id > ? ORDER BY id LIMIT ?", (last_id, page_size))
+            ids = [row[0] for row in cursor.fetchall()]
+            if not ids:
+                return
+            yield ids
+            last_id = ids[-1]
+
+    def get_existing_memory_ids(self, ids: List[int]) -> set:
+        """返回 ids 中在 memories 表里存在的 ID"""
+        if not ids:
+            return set()
+        cursor = self.conn.cursor()
+        placeholders = ",".join("?" * len(ids))
+        cursor.execute(f"SELECT id FROM memories WHERE id IN ({placeholders})", ids)
+        return {row[0] for row in cursor.fetchall()}
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """读取键值元数据"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT value FROM meta WHERE key = ?", (key,))
+        row = cursor.fetchone()
+        return row[0] if row is not None else None
+
+    @_write_transaction
+    def set_meta(self, key: str, value: str):
+        """写入键值元数据"""
+        self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+        self.conn.commit()
+
+    def get_changes(self, since: int, limit: int = 500, with_content: bool = True) -> List[Dict]:
+        """
+        获取序号大于 since 的变更（走 seq 索引，开销只与变更数量有关）
+
+        Args:
+            since: 起始序号（不含）
+            limit: 最多返回条数
+            with_content: 为 False 时不读取标题、内容和标签
+
+        Returns:
+            按 seq 升序的变更列表：新增/修改为 op="upsert"（附带记录内容和 indexing_status），
+            删除为 op="delete"（memory_id、origin、origin_id，删除时间在 updated_at）
+        """
+        content_columns = "title, content, tags" if with_content else "NULL AS title, NULL AS content, NULL AS tags"
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT seq, 'upsert' AS op, id AS memory_id, origin, origin_id,
+                   {content_columns}, created_at, updated_at, indexing_status
+            FROM memories WHERE seq > ?
+            UNION ALL
+            SELECT seq, 'delete' AS op, memory_id, origin, origin_id,
+                   NULL, NULL, NULL, NULL, deleted_at, NULL
+            FROM tombstones WHERE seq > ?
+            ORDER BY seq
+            LIMIT ?
+        """, (since, since, limit))
+        changes = []
+        for row in cursor.fetchall():
+            change = dict(row)
+            if change["op"] == "upsert" and with_content:
+                change["tags"] = json.loads(change["tags"])
+            changes.append(change)
+        return changes
+
+    def find_memory_by_content_hash(self, content_hash: str) -> Optional[int]:
+        """按内容哈希查找已有记录（走 content_hash 索引），返回最早的记录 ID"""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT MIN(id) FROM memories WHERE content_hash = ?", (content_hash,))
+        return cursor.fetchone()[0]
+
+    def get_duplicate_content_groups(self) -> List[List[int]]:
+        """内容完全相同的记录分组（每组至少两条）"""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT GROUP_CONCAT(id) FROM memories
+            WHERE content_hash IS NOT NULL
+            GROUP BY content_hash HAVING COUNT(*) > 1
+        """)
+        return [sorted(int(memory_id) for memory_id in row[0].split(",")) for row in cursor.fetchall()]
+
+    def get_max_change_seq(self) -> int:
+        """当前最大的变更序号"""
+        return int(self.get_meta("change_seq") or 0)
+
+    def find_memory_ids_by_origin(self, origin: str, origin_ids: List[int]) -> Dict[int, int]:
+        """
+        按源实例标识查找同步来的记录
+
+        Returns:
+            origin_id -> 本地记录 ID
+        """
+        if not origin_ids:
+            return {}
+        cursor = self.conn.cursor()
+        placeholders = ",".join("?" * len(origin_ids))
+        cursor.execute(
+            f"SELECT origin_id, id FROM memories WHERE origin = ? AND origin_id IN ({placeholders})",
+            [origin] + list(origin_ids)
+        )
+        return {row[0]: row[1] for row in cursor.fetchall()}
+
+    def get_ingest_files(self, root: str) -> Dict[str, Dict]:
+        """
+        获取某个目录下已导入文件的清单
+
+        Args:
+            root: 目录绝对路径
+
+        Returns:
+            文件路径 -> {mtime, size, hash, memory_id}
+        """
+        prefix = root.rstrip(os.sep) + os.sep
+        # 用范围查询代替 LIKE，可以走主键索引且无需转义通配符
+        upper = prefix[:-1] + chr(ord(os.sep) + 1)
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT path, mtime, size, hash, memory_id FROM ingest_files WHERE path >= ? AND path < ?",
+            (prefix, upper)
+        )
+        return {row["path"]: dict(row) for row in cursor.fetchall()}
+
+    @_write_transaction
+    def upsert_ingest_files(self, rows: List[Tuple[str, float, int, str, int]]):
+        """
+        写入或更新导入清单
+
+        Args:
+            rows: (path, mtime, size, hash, memory_id) 列表
+        """
+        if not rows:
+            return
+        updated_at = datetime.now().isoformat()
+        cursor = self.conn.cursor()
+        cursor.executemany(
+            "INSERT OR REPLACE INTO ingest_files (path, mtime, size, hash, memory_id, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [row + (updated_at,) for row in rows]
+        )
+        self.conn.commit()
+
+    @_write_transaction
+    def delete_ingest_files(self, paths: List[str]):
+        """从导入清单中移除文件"""
+        if not paths:
+            return
+        cursor = self.conn.cursor()
+        cursor.executemany("DELETE FROM ingest_files WHERE path = ?", [(path,) for path in paths])
+        self.conn.commit()
 
     def count(self) -> int:
         """
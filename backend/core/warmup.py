@@ -0,0 +1,67 @@
+"""
+启动预热：服务端口先就绪，向量库和模型在后台线程加载（/ready 查询各组件状态）
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+class Warmup:
+    """
+    按顺序在后台线程加载各组件，记录状态（loading / ready / failed）和耗时
+
+    加载失败不影响服务运行：组件在第一次使用时会再次尝试加载
+    """
+
+    def __init__(self):
+        self._loaders: List[Tuple[str, Callable[[], None]]] = []
+        self._status: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def mark_ready(self, name: str, seconds: float):
+        """登记已在导入时完成加载的组件（如 SQLite）"""
+        with self._lock:
+            self._status[name] = {"status": "ready", "seconds": round(seconds, 3)}
+
+    def add(self, name: str, loader: Callable[[], None]):
+        """登记需要在后台加载的组件"""
+        with self._lock:
+            self._loaders.append((name, loader))
+            self._status[name] = {"status": "loading", "seconds": None}
+
+    def start(self):
+        """启动后台加载线程"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="mymem-warmup", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        for name, loader in self._loaders:
+            started = time.perf_counter()
+            try:
+                loader()
+            except Exception as e:
+                logger.error(f"[启动预热] {name} 加载失败: {e}")
+                with self._lock:
+                    self._status[name] = {"status": "failed", "seconds": None, "error": str(e)}
+                continue
+            seconds = round(time.perf_counter() - started, 3)
+            with self._lock:
+                self._status[name] = {"status": "ready", "seconds": seconds}
+            print(f"[启动预热] {name} 已就绪 ({seconds:.2f}s)", flush=True)
+
+    def status(self) -> Dict:
+        """
+        Returns:
+            {"ready": 是否全部就绪, "components": {名称: {"status", "seconds", ["error"]}}}
+        """
+        with self._lock:
+            components = {name: dict(state) for name, state in self._status.items()}
+        return {
+            "ready": all(state["status"] == "ready" for state in components.values()),
+            "components": components
+        }
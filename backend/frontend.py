@@ -0,0 +1,335 @@
+"""
+前端静态文件（SPA）
+
+启动时扫描一次静态目录：
+- index.html 读入内存，Cache-Control: no-cache + ETag（引用的资源文件名随构建变化，每次都要确认）
+- /assets 下由 Vite 构建清单（.vite/manifest.json）列出的文件名含内容哈希，按 immutable 长期缓存，请求时不再 stat；
+  不在清单中的文件（如没有清单的旧构建产物）文件名不保证随内容变化，按 no-cache + ETag 每次确认。
+  有预压缩的 .br / .gz 文件时按 Accept-Encoding 选用，没有时可压缩的文件在第一次请求时用 gzip 压缩并缓存在内存中
+按 no-cache 返回的文件（包括 index.html）每次请求重新 stat，原地修改后 ETag、长度和压缩结果随之更新，不需要重启服务
+"""
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+
+from backend.api.responses import accepted_encodings, is_not_modified
+
+# 带内容哈希的资源文件：一年内不需要重新验证
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 预压缩文件的后缀（优先 br）
+PRECOMPRESSED_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+# 可压缩的内容类型（其他类型如图片、字体已经压缩过）
+COMPRESSIBLE_TYPES = ("text/", "application/javascript", "application/json", "image/svg+xml")
+# 小于该字节数的文件不压缩
+MIN_COMPRESS_SIZE = 1024
+# 请求的资源不在索引中时，最多每隔该秒数重新扫描一次目录
+RESCAN_INTERVAL = 2.0
+# Vite 构建清单（相对静态目录，vite.config.js 中 build.manifest 开启）
+BUILD_MANIFEST = os.path.join(".vite", "manifest.json")
+# 构建时记录的前端源码指纹（相对静态目录，由 scripts/build_dist.py 写入）
+SOURCE_STAMP = os.path.join(".vite", "source-hash")
+# 参与指纹的前端源码（相对 frontend 目录）
+FRONTEND_SOURCES = ("src", "index.html", "package.json", "package-lock.json", "vite.config.js")
+
+def _media_type(path: str) -> str:
+    return mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+def _is_compressible(media_type: str) -> bool:
+    return media_type.startswith(COMPRESSIBLE_TYPES)
+
+def precompress_assets(directory: str, verbose: bool = True) -> int:
+    """
+    为目录中可压缩的文件生成 .gz（已安装 brotli 时同时生成 .br），构建前端时调用
+
+    Returns:
+        生成的文件数
+    """
+    from backend.api.responses import brotli
+
+    count = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.join(root, name)
+            if name.endswith((".gz", ".br")) or not _is_compressible(_media_type(path)):
+                continue
+            with open(path, "rb") as f:
+                data = f.read()
+            if len(data) < MIN_COMPRESS_SIZE:
+                continue
+            variants = [(".gz", gzip.compress(data, compresslevel=9, mtime=0))]
+            if brotli is not None:
+                variants.append((".br", brotli.compress(data, quality=11)))
+            for suffix, compressed in variants:
+                with open(path + suffix, "wb") as f:
+                    f.write(compressed)
+                count += 1
+                if verbose:
+                    print(f"  {os.path.relpath(path, directory)}{suffix}: {len(data)} -> {len(compressed)} 字节", flush=True)
+    return count
+
+def frontend_source_hash(frontend_dir: str) -> str:
+    """前端源码指纹：FRONTEND_SOURCES 中各文件的相对路径和内容的 sha256"""
+    digest = hashlib.sha256()
+    for name in FRONTEND_SOURCES:
+        path = os.path.join(frontend_dir, name)
+        if os.path.isdir(path):
+            files = sorted(os.path.join(root, f) for root, _, names in os.walk(path) for f in names)
+        elif os.path.isfile(path):
+            files = [path]
+        else:
+            continue
+        for file in files:
+            digest.update(os.path.relpath(file, frontend_dir).replace(os.sep, "/").encode("utf-8") + b"\0")
+            with open(file, "rb") as f:
+                digest.update(f.read())
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+def check_build_freshness(static_dir: str, frontend_dir: str) -> bool:
+    """
+    源码目录中运行时检查静态目录是否由当前 frontend 源码构建，不是时提示重新构建
+    （安装包中没有 frontend 目录，不检查）
+
+    Returns:
+        产物与源码一致或无法检查时返回 True
+    """
+    if not os.path.isdir(os.path.join(frontend_dir, "src")):
+        return True
+    try:
+        with open(os.path.join(static_dir, SOURCE_STAMP), "r", encoding="utf-8") as f:
+            built = f.read().strip()
+    except OSError:
+        built = None
+    if built == frontend_source_hash(frontend_dir):
+        return True
+    print("⚠️  backend/static 中的前端产物不是由当前 frontend 源码构建的，页面可能缺少最新功能，"
+          "请运行 python scripts/build_dist.py 重新构建", flush=True)
+    return False
+
+class StaticAsset:
+    """静态目录中的一个文件（及其预压缩版本）"""
+    __slots__ = ("path", "stat", "media_type", "etag", "variants")
+
+    def __init__(self, path: str, stat: os.stat_result):
+        self.path = path
+        self.stat = stat
+        self.media_type = _media_type(path)
+        self.etag = f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+        # 编码 -> (文件路径, stat) 或内存中的压缩结果 bytes
+        self.variants: Dict[str, object] = {}
+
+    @classmethod
+    def load(cls, path: str, stat: os.stat_result) -> "StaticAsset":
+        """按文件当前状态建立，附上不比原文件旧的预压缩文件"""
+        asset = cls(path, stat)
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES:
+            try:
+                variant_stat = os.stat(path + suffix)
+            except OSError:
+                continue
+            if variant_stat.st_mtime >= stat.st_mtime:
+                asset.variants[encoding] = (path + suffix, variant_stat)
+        return asset
+
+    def revalidate(self) -> Optional["StaticAsset"]:
+        """
+        重新 stat 文件
+
+        Returns:
+            未变化时返回自身；修改时间或大小变化时返回新的 StaticAsset（内存中的压缩结果一并丢弃）；文件已删除时返回 None
+        """
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        if stat.st_mtime_ns == self.stat.st_mtime_ns and stat.st_size == self.stat.st_size:
+            return self
+        return StaticAsset.load(self.path, stat)
+
+    @property
+    def compressible(self) -> bool:
+        return _is_compressible(self.media_type) and self.stat.st_size >= MIN_COMPRESS_SIZE
+
+    def choose_encoding(self, accept_encoding: str) -> Optional[str]:
+        accepted = accepted_encodings(accept_encoding)
+        for encoding, _ in PRECOMPRESSED_SUFFIXES:
+            if encoding in accepted and encoding in self.variants:
+                return encoding
+        if "gzip" in accepted and self.compressible:
+            return "gzip"
+        return None
+
+    async def response(self, request_headers, cache_control: str) -> Response:
+        headers = {"ETag": self.etag, "Cache-Control": cache_control}
+        if self.compressible or self.variants:
+            headers["Vary"] = "Accept-Encoding"
+        if is_not_modified(request_headers, self.etag):
+            return Response(status_code=304, headers=headers)
+
+        encoding = self.choose_encoding(request_headers.get("accept-encoding", ""))
+        if encoding is None:
+            return FileResponse(self.path, stat_result=self.stat, media_type=self.media_type, headers=headers)
+
+        headers["Content-Encoding"] = encoding
+        variant = self.variants.get(encoding)
+        if variant is None:
+            # 没有预压缩文件：压缩一次后缓存在内存中（文件变化后 revalidate 返回新对象，不会用到旧的压缩结果）
+            variant = await run_in_threadpool(self._compress)
+            self.variants[encoding] = variant
+        if isinstance(variant, bytes):
+            return Response(content=variant, media_type=self.media_type, headers=headers)
+        path, stat = variant
+        return FileResponse(path, stat_result=stat, media_type=self.media_type, headers=headers)
+
+    def _compress(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return gzip.compress(f.read(), compresslevel=9, mtime=0)
+
+def scan_directory(directory: str, recursive: bool = True) -> Dict[str, StaticAsset]:
+    """
+    扫描目录，返回 相对路径 -> StaticAsset（.br / .gz 文件作为原文件的预压缩版本，不单独列出）
+    """
+    assets = {}
+    variants = []
+    for root, dirs, files in os.walk(directory):
+        if not recursive:
+            dirs.clear()
+        for name in files:
+            path = os.path.join(root, name)
+            relative = os.path.relpath(path, directory)
+            stat = os.stat(path)
+            for encoding, suffix in PRECOMPRESSED_SUFFIXES:
+                if name.endswith(suffix):
+                    variants.append((relative[:-len(suffix)], encoding, path, stat))
+                    break
+            else:
+                assets[relative] = StaticAsset(path, stat)
+    for relative, encoding, path, stat in variants:
+        asset = assets.get(relative)
+        # 原文件更新后旧的预压缩文件不再使用
+        if asset is not None and stat.st_mtime >= asset.stat.st_mtime:
+            asset.variants[encoding] = (path, stat)
+    return assets
+
+def load_hashed_assets(manifest_path: str) -> set:
+    """
+    读取 Vite 构建清单，返回带内容哈希的产物路径（相对 /assets 目录）；清单不存在或无法解析时返回空集合
+    """
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return set()
+    hashed = set()
+    for chunk in manifest.values():
+        for path in [chunk.get("file")] + chunk.get("css", []) + chunk.get("assets", []):
+            if path and path.startswith("assets/"):
+                hashed.add(os.path.normpath(path[len("assets/"):]))
+    return hashed
+
+class AssetFiles(StaticFiles):
+    """
+    /assets 静态资源
+
+    文件索引和构建清单在启动时读取；请求的文件不在索引中时（如服务运行期间重新构建）限频重新扫描
+    """
+
+    def __init__(self, directory: str, manifest_path: str):
+        super().__init__(directory=directory)
+        self.manifest_path = manifest_path
+        self._assets = scan_directory(directory)
+        self._hashed = load_hashed_assets(manifest_path)
+        self._scanned_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _rescan(self) -> bool:
+        with self._lock:
+            if time.monotonic() - self._scanned_at < RESCAN_INTERVAL:
+                return False
+            self._assets = scan_directory(self.directory)
+            self._hashed = load_hashed_assets(self.manifest_path)
+            self._scanned_at = time.monotonic()
+            return True
+
+    def cache_control(self, path: str) -> str:
+        """构建清单中的文件按 immutable 长期缓存，其他文件每次确认"""
+        return IMMUTABLE_CACHE_CONTROL if path in self._hashed else "no-cache"
+
+    async def get_response(self, path: str, scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405)
+        asset = self._assets.get(path)
+        if asset is None and await run_in_threadpool(self._rescan):
+            asset = self._assets.get(path)
+        cache_control = self.cache_control(path)
+        if asset is not None and cache_control != IMMUTABLE_CACHE_CONTROL:
+            # 文件名不随内容变化：原地修改后按新内容返回
+            asset = _revalidated(self._assets, path, asset)
+        if asset is None:
+            raise HTTPException(status_code=404)
+        return await asset.response(Headers(scope=scope), cache_control)
+
+def _revalidated(assets: Dict[str, StaticAsset], key: str, asset: StaticAsset) -> Optional[StaticAsset]:
+    """重新 stat 并更新索引中的条目，文件已删除时从索引中移除并返回 None"""
+    current = asset.revalidate()
+    if current is None:
+        assets.pop(key, None)
+    elif current is not asset:
+        assets[key] = current
+    return current
+
+class Frontend:
+    """
+    前端入口：index.html（内存中）和静态目录顶层的其他文件；其余路径返回 index.html（支持 React Router）
+    """
+
+    def __init__(self, static_dir: str):
+        self.static_dir = static_dir
+        self.assets = AssetFiles(os.path.join(static_dir, "assets"), os.path.join(static_dir, BUILD_MANIFEST))
+        # 顶层文件（favicon 等）
+        self._files = scan_directory(static_dir, recursive=False)
+        self._index_path = os.path.join(static_dir, "index.html")
+        self._index_stat = None
+        self._load_index()
+
+    def _load_index(self):
+        """index.html 变化（如重新构建）时重新读入内存"""
+        stat = os.stat(self._index_path)
+        if self._index_stat is not None and \
+                (stat.st_mtime_ns, stat.st_size) == (self._index_stat.st_mtime_ns, self._index_stat.st_size):
+            return
+        with open(self._index_path, "rb") as f:
+            self._index_html = f.read()
+        self._index_etag = f'"{hashlib.sha1(self._index_html).hexdigest()[:16]}"'
+        self._index_stat = stat
+
+    def index_response(self, request_headers) -> Response:
+        try:
+            self._load_index()
+        except OSError:
+            # 重新构建期间文件可能暂时不存在，继续使用内存中的版本
+            pass
+        headers = {"ETag": self._index_etag, "Cache-Control": "no-cache"}
+        if is_not_modified(request_headers, self._index_etag):
+            return Response(status_code=304, headers=headers)
+        return Response(content=self._index_html, media_type="text/html", headers=headers)
+
+    async def response(self, path: str, request_headers) -> Response:
+        key = os.path.normpath(path) if path else None
+        asset = self._files.get(key) if key else None
+        if asset is not None and path != "index.html":
+            asset = _revalidated(self._files, key, asset)
+        if asset is None or path == "index.html":
+            return self.index_response(request_headers)
+        return await asset.response(request_headers, "no-cache")
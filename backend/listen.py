@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+"""
+服务监听的 socket：TCP 端口，以及供本机客户端（技能脚本）使用的 Unix domain socket
+"""
+import logging
+import os
+import socket
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 监听队列长度
+BACKLOG = 2048
+
+def bind_sockets(host: str, port: int, socket_path: Optional[str] = None) -> List[socket.socket]:
+    """
+    绑定 TCP 端口，并在 socket_path 不为空时同时监听 Unix domain socket
+
+    Unix socket 绑定失败（如路径过长）只记录警告，客户端会回退到 TCP
+
+    Returns:
+        [TCP socket, (Unix socket)]，可由多个进程继承共用
+    """
+    tcp = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    tcp.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    tcp.bind((host, port))
+    tcp.listen(BACKLOG)
+    tcp.set_inheritable(True)
+    sockets = [tcp]
+
+    if socket_path and hasattr(socket, "AF_UNIX"):
+        try:
+            sockets.append(_bind_unix(socket_path))
+            print(f"🔌 本机客户端可通过 Unix socket 连接: {socket_path}", flush=True)
+        except OSError as e:
+            logger.warning(f"未能监听 Unix socket {socket_path}: {e}")
+    return sockets
+
+def _bind_unix(path: str) -> socket.socket:
+    if os.path.exists(path):
+        # 有服务在监听时不抢占；连接不上说明是上次异常退出留下的文件
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+            raise OSError("已有服务在监听")
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(path)
+        finally:
+            probe.close()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # 只允许当前用户连接
+    old_umask = os.umask(0o177)
+    try:
+        sock.bind(path)
+    except OSError:
+        sock.close()
+        raise
+    finally:
+        os.umask(old_umask)
+    sock.listen(BACKLOG)
+    sock.set_inheritable(True)
+    return sock
+
+def close_sockets(sockets: List[socket.socket], socket_path: Optional[str] = None):
+    """关闭 socket，并删除 Unix socket 文件（uvicorn 退出时可能已关闭 socket，路径由调用方传入）"""
+    for sock in sockets:
+        sock.close()
+    if socket_path and any(sock.family == getattr(socket, "AF_UNIX", None) for sock in sockets):
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
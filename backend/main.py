@@ -15,13 +15,16 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 # 统一使用绝对导入，避免 reloader 子进程中的相对导入问题
-from backend.api import memories, search
+from backend.api import memories, search, context, jobs, changes, events
+from backend.api.responses import CompressionMiddleware
+from backend.api.admission import admission_metrics
 from backend.config import settings
+from backend.core.warmup import Warmup
+from backend.frontend import Frontend, check_build_freshness
 
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import JSONResponse
 
 # 配置日志
 logging.basicConfig(
@@ -41,53 +44,116 @@ app.add_middleware(
     allow_headers=["*"],
     expose_headers=["*"],
 )
+# 压缩较大的 JSON 响应（流式响应不压缩）
+app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_min_size)
 
 # 注册 API 路由
 app.include_router(memories.router)
 app.include_router(search.router)
+app.include_router(context.router)
+app.include_router(jobs.router)
+app.include_router(changes.router)
+app.include_router(events.router)
+
+# 启动预热：端口立即可用，向量库和模型在后台线程加载（关键字搜索和写入不必等待）
+warmup = Warmup()
+warmup.mark_ready("sqlite", search.sqlite_db.init_seconds)
+warmup.add("chroma", search.chroma_db.load)
+warmup.add("embedding", search.embedder.load)
+
+@app.on_event("startup")
+async def start_background_workers():
+    """启动预热线程和后台索引队列（继续处理上次未完成的任务；多进程模式下只在 writer worker 中运行）"""
+    warmup.start()
+    if settings.worker_role != "reader":
+        memories.index_queue.start()
+
+@app.on_event("shutdown")
+async def stop_background_workers():
+    """停止后台索引队列"""
+    memories.index_queue.stop()
 
 # 静态文件目录
 static_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
 
 @app.get("/health")
 async def health():
-    """健康检查"""
+    """存活检查（进程能响应即可，不代表模型已加载）"""
     return {"status": "ok"}
 
-# 挂载前端静态文件
+@app.get("/ready")
+async def ready():
+    """就绪检查：各组件的加载状态和耗时，全部就绪时返回 200，否则 503"""
+    state = warmup.status()
+    return JSONResponse(status_code=200 if state["ready"] else 503, content=state)
+
+@app.get("/metrics")
+async def metrics():
+    """运行指标：各准入并发池的执行数、排队深度、拒绝次数和平均耗时（多进程模式下为处理本请求的 worker 的数据）"""
+    return {
+        "pid": os.getpid(),
+        "worker_role": settings.worker_role or None,
+        "admission": admission_metrics()
+    }
+
+# 挂载前端静态文件（启动时建立文件索引，index.html 读入内存，/assets 按内容哈希长期缓存）
 if os.path.exists(static_dir):
-    app.mount("/assets", StaticFiles(directory=os.path.join(static_dir, "assets")), name="assets")
+    frontend = Frontend(static_dir)
+    app.mount("/assets", frontend.assets, name="assets")
 
     @app.get("/{full_path:path}")
-    async def serve_frontend(full_path: str):
+    async def serve_frontend(full_path: str, request: Request):
         # 如果是 API 请求，由路由器处理；如果是静态文件，直接返回 index.html (支持 SPA)
         if full_path.startswith("api/"):
             return None # 让 FastAPI 继续寻找匹配的路由
 
-        file_path = os.path.join(static_dir, full_path)
-        if os.path.isfile(file_path):
-            return FileResponse(file_path)
-
-        # 默认返回 index.html 支持 React Router
-        return FileResponse(os.path.join(static_dir, "index.html"))
+        # 顶层静态文件直接返回，其他路径返回 index.html 支持 React Router
+        return await frontend.response(full_path, request.headers)
 else:
     @app.get("/")
     async def root_fallback():
         return {"message": "Mymem API is running. Frontend not built yet."}
 
-def run_server():
+def run_server(workers: int = 1):
+    if os.path.exists(static_dir):
+        # 只在启动服务时提示（命令行子命令也会导入本模块）
+        check_build_freshness(static_dir, str(project_root / "frontend"))
+    if workers > 1:
+        # 多进程模式：换成不导入应用的主进程（应用导入时打开的 SQLite 连接不能跨 fork 使用）
+        if os.name == 'nt':
+            logging.warning("Windows 不支持多进程模式，以单进程启动")
+        else:
+            logging.info(f"正在以多进程模式启动服务器 (workers={workers})...")
+            os.execv(sys.executable, [sys.executable, str(backend_dir / "prefork.py"), "--workers", str(workers)])
+
     import uvicorn
     # 根据环境决定是否开启 reload
     reload = settings.is_dev
     mode = "开发模式" if reload else "生产模式"
     logging.info(f"正在以 {mode} 启动服务器 (reload={reload})...")
 
-    # 使用模块方式运行，支持相对导入
-    uvicorn.run("backend.main:app", host=settings.host, port=settings.port, reload=reload)
+    if reload:
+        # 使用模块方式运行，支持相对导入（热重载只监听 TCP 端口）
+        uvicorn.run("backend.main:app", host=settings.host, port=settings.port, reload=reload)
+        return
+
+    # 自行绑定 TCP 端口和 Unix socket，交给 uvicorn 同时监听
+    import signal
+    from backend.listen import bind_sockets, close_sockets
+    socket_path = settings.socket_path if settings.unix_socket else None
+    sockets = bind_sockets(settings.host, settings.port, socket_path)
+    # uvicorn 退出后会按原处理方式重新发出收到的 SIGTERM：转为正常退出，执行下面的清理（删除 socket 文件）
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        config = uvicorn.Config("backend.main:app", host=settings.host, port=settings.port)
+        uvicorn.Server(config).run(sockets=sockets)
+    finally:
+        close_sockets(sockets, socket_path)
 
 def cli():
     """CLI 入口函数"""
     import argparse
+    import json
     import sys
     import socket
     import subprocess
@@ -99,6 +165,10 @@ def cli():
     # start 命令
     start_parser = subparsers.add_parser("start", help="启动服务")
     start_parser.add_argument("--bg", action="store_true", help="在后台启动服务")
+    start_parser.add_argument("--timeout", type=float, default=120.0,
+                              help="后台启动时等待服务就绪（模型加载完成）的秒数（默认 120）")
+    start_parser.add_argument("--workers", type=int, default=settings.workers,
+                              help=f"服务进程数，大于 1 时预加载模型后 fork 多个 worker（仅 Linux/macOS，默认 {settings.workers}）")
 
     # status 命令
     subparsers.add_parser("status", help="检查服务状态")
@@ -106,6 +176,41 @@ def cli():
     # stop 命令
     subparsers.add_parser("stop", help="停止服务")
 
+    # ingest 命令
+    ingest_parser = subparsers.add_parser("ingest", help="导入目录中的文本文件（只处理变化的文件）")
+    ingest_parser.add_argument("dir", help="要导入的目录")
+    ingest_parser.add_argument("--watch", action="store_true", help="持续监听目录变化")
+    ingest_parser.add_argument("--interval", type=float, default=2.0, help="监听模式的轮询间隔（秒，默认 2）")
+    ingest_parser.add_argument("--ext", nargs="+", help="导入的文件扩展名（默认 .md .markdown .txt）")
+
+    # fsck 命令
+    fsck_parser = subparsers.add_parser("fsck", help="检查 SQLite 与向量库的一致性")
+    fsck_parser.add_argument("--repair", action="store_true", help="修复：重新向量化缺失的记忆，删除孤立的向量")
+    fsck_parser.add_argument("--full", action="store_true", help="忽略检查点，全量检查")
+
+    # dedup 命令
+    dedup_parser = subparsers.add_parser("dedup", help="找出知识库中重复/近重复的记忆分组")
+    dedup_parser.add_argument("--threshold", type=float, default=None,
+                              help=f"近重复的相似度阈值（默认 {settings.dedup_threshold}）")
+    dedup_parser.add_argument("--json", action="store_true", help="以 JSON 输出分组")
+
+    # export / import 命令
+    export_parser = subparsers.add_parser("export", help="导出知识库快照（含向量，服务运行时也可执行）")
+    export_parser.add_argument("file", help="归档文件路径（.zip）")
+    export_parser.add_argument("--dtype", choices=["float32", "float16"], default="float32",
+                               help="向量存储类型（float16 体积减半，默认 float32）")
+    import_parser = subparsers.add_parser("import", help="从快照恢复知识库（覆盖当前数据）")
+    import_parser.add_argument("file", help="归档文件路径")
+    import_parser.add_argument("--force", action="store_true", help="当前知识库非空时也覆盖")
+
+    # search 命令（参数见 backend/search_cli.py）
+    from backend.search_cli import build_parser as build_search_parser
+    build_search_parser(subparsers.add_parser("search", help="搜索知识库（关键字搜索不需要启动服务和加载模型）"))
+
+    # sync 命令
+    sync_parser = subparsers.add_parser("sync", help="从其他 mymem 实例增量同步（只拉取上次同步之后的变更）")
+    sync_parser.add_argument("--from", dest="source", required=True, help="源实例地址，如 http://192.168.1.10:8000")
+
     args = parser.parse_args()
 
     def is_port_open(host, port):
@@ -113,6 +218,29 @@ def cli():
             s.settimeout(1)
             return s.connect_ex((host, port)) == 0
 
+    def get_readiness():
+        """查询 /ready，服务未响应时返回 None"""
+        import urllib.request
+        import urllib.error
+        try:
+            with urllib.request.urlopen(f"http://{settings.host}:{settings.port}/ready", timeout=2) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            # 503：还在加载
+            try:
+                return json.loads(e.read())
+            except ValueError:
+                return None
+        except (OSError, ValueError):
+            return None
+
+    def describe_loading(state):
+        """还在加载或加载失败的组件"""
+        return "、".join(
+            f"{name}({component['status']})" for name, component in state["components"].items()
+            if component["status"] != "ready"
+        )
+
     def stop_service():
         """停止服务"""
         try:
@@ -159,7 +287,11 @@ def cli():
 
     if args.command == "status":
         if is_port_open(settings.host, settings.port):
-            print(f"✅ Mymem 服务正在运行: http://{settings.host}:{settings.port}")
+            state = get_readiness()
+            if state is None or state["ready"]:
+                print(f"✅ Mymem 服务正在运行: http://{settings.host}:{settings.port}")
+            else:
+                print(f"⏳ Mymem 服务正在运行，尚未就绪: {describe_loading(state)}（关键字搜索已可用）")
         else:
             print(f"❌ Mymem 服务未运行")
         sys.exit(0)
@@ -180,11 +312,211 @@ def cli():
             print(f"❌ 未能找到占用端口 {settings.port} 的进程")
         sys.exit(0)
 
+    elif args.command == "ingest":
+        if not os.path.isdir(args.dir):
+            print(f"❌ 目录不存在: {args.dir}")
+            sys.exit(1)
+        from backend.core.sqlite_db import SQLiteDB
+        from backend.core.ingest import run_ingest
+
+        def get_indexer():
+            # 只有存在变更时才加载模型
+            from backend.core.chroma_db import ChromaDB
+            from backend.core.embedding import Embedding
+            from backend.core.indexer import Indexer
+            return Indexer(ChromaDB(), Embedding())
+
+        extensions = tuple(ext if ext.startswith(".") else f".{ext}" for ext in args.ext) if args.ext else None
+        if args.watch:
+            print(f"👀 正在监听 {os.path.abspath(args.dir)}（Ctrl+C 退出）")
+        try:
+            # 服务运行时不写向量库（每轮检查，监听期间启动的服务同样适用）
+            run_ingest(args.dir, SQLiteDB(), get_indexer, watch=args.watch,
+                       interval=args.interval, extensions=extensions,
+                       server_running=lambda: is_port_open(settings.host, settings.port))
+        except KeyboardInterrupt:
+            print("👋 已停止监听")
+        sys.exit(0)
+
+    elif args.command == "fsck":
+        from backend.core.sqlite_db import SQLiteDB
+        from backend.core.chroma_db import ChromaDB
+        from backend.core.fsck import ConsistencyChecker
+        from backend.core.index_queue import IndexQueue
+
+        sqlite_db = SQLiteDB()
+        checker = ConsistencyChecker(sqlite_db, ChromaDB(), retention_days=IndexQueue.JOB_RETENTION_DAYS)
+        started = time.perf_counter()
+        report = checker.check(full=args.full)
+        mode = "全量" if report["mode"] == "full" else "增量"
+        print(f"🔍 {mode}检查 {report['checked']} 条记忆，耗时 {time.perf_counter() - started:.2f}s")
+        print(f"   缺失向量: {len(report['missing'])}  孤立向量: {len(report['orphaned'])}  "
+              f"等待索引: {len(report['pending'])}")
+        for label, ids in (("缺失向量", report["missing"]), ("孤立向量", report["orphaned"])):
+            if ids:
+                preview = ", ".join(str(memory_id) for memory_id in ids[:20])
+                print(f"   {label}的记忆 ID: {preview}{' ...' if len(ids) > 20 else ''}")
+
+        problems = len(report["missing"]) + len(report["orphaned"])
+        if problems and args.repair and is_port_open(settings.host, settings.port):
+            # 服务正在运行：命令行不写向量库，交给服务的后台索引队列修复
+            queued = checker.enqueue_repair(report)
+            print(f"✅ 已提交 {queued} 条记忆的修复，由服务的后台索引队列完成（可再次运行 `mymem fsck` 确认）")
+            sys.exit(0)
+        elif problems and args.repair:
+            from backend.core.embedding import Embedding
+            from backend.core.indexer import Indexer
+            indexer = Indexer(checker.chroma_db, Embedding())
+            repaired = checker.repair(
+                report, indexer,
+                progress=lambda done, total: print(f"   已修复 {done}/{total}", flush=True)
+            )
+            print(f"✅ 已修复 {repaired} 条记忆")
+            problems = 0
+        elif problems:
+            print("💡 使用 `mymem fsck --repair` 修复")
+
+        # 只有在全部一致时才推进检查点，否则下次增量检查会漏掉这些问题
+        if not problems and not report["pending"]:
+            checker.save_checkpoint(report["job_id"])
+        elif not problems:
+            print("💡 后台索引队列还有未完成的日志，检查点未更新")
+        sys.exit(1 if problems else 0)
+
+    elif args.command == "dedup":
+        from backend.core.sqlite_db import SQLiteDB
+        from backend.core.chroma_db import ChromaDB
+        from backend.core.dedup import DuplicateDetector
+
+        sqlite_db = SQLiteDB()
+        detector = DuplicateDetector(sqlite_db, ChromaDB(), threshold=args.threshold or settings.dedup_threshold)
+        started = time.perf_counter()
+        clusters = detector.find_clusters(
+            progress=None if args.json else
+            lambda done, total: print(f"\r   已扫描 {done}/{total} 个向量", end="", flush=True)
+        )
+        if args.json:
+            print(json.dumps(clusters, ensure_ascii=False, indent=2))
+            sys.exit(0)
+        print()
+        titles = {memory["id"]: memory["title"] for memory in sqlite_db.get_memories_by_ids(
+            [memory_id for cluster in clusters for memory_id in cluster["ids"]]
+        )}
+        for n, cluster in enumerate(clusters, 1):
+            print(f"[{n}] {len(cluster['ids'])} 条记忆")
+            for memory_id in cluster["ids"]:
+                print(f"    #{memory_id} {titles.get(memory_id, '')}")
+            for pair in cluster["pairs"]:
+                kind = "内容相同" if pair["exact"] else f"相似度 {pair['similarity']:.3f}"
+                print(f"      #{pair['a']} ~ #{pair['b']}: {kind}")
+        redundant = sum(len(cluster["ids"]) - 1 for cluster in clusters)
+        print(f"🔍 发现 {len(clusters)} 组重复，可清理约 {redundant} 条记忆 "
+              f"(阈值 {detector.threshold}, {time.perf_counter() - started:.2f}s)")
+        sys.exit(0)
+
+    elif args.command == "export":
+        from backend.core.sqlite_db import SQLiteDB
+        from backend.core.chroma_db import ChromaDB
+        from backend.core.archive import export_archive
+
+        started = time.perf_counter()
+        manifest = export_archive(
+            args.file, SQLiteDB(), ChromaDB(), dtype=args.dtype,
+            progress=lambda done, total: print(f"\r   已读取 {done}/{total} 个向量", end="", flush=True)
+        )
+        print()
+        print(f"✅ 已导出 {manifest['memories']} 条记忆、{manifest['chunks']} 个向量 -> {args.file} "
+              f"({os.path.getsize(args.file) / 1024 / 1024:.1f} MB, {time.perf_counter() - started:.2f}s)")
+        if manifest["reindex"]:
+            print(f"💡 {manifest['reindex']} 条记忆在导出过程中被修改，导入后会由后台索引队列重新同步")
+        sys.exit(0)
+
+    elif args.command == "import":
+        if not os.path.isfile(args.file):
+            print(f"❌ 文件不存在: {args.file}")
+            sys.exit(1)
+        if is_port_open(settings.host, settings.port):
+            print("❌ Mymem 服务正在运行，请先执行 `mymem stop`")
+            sys.exit(1)
+
+        from backend.core.sqlite_db import SQLiteDB
+        from backend.core.chroma_db import ChromaDB
+        from backend.core.archive import import_archive, read_manifest
+
+        try:
+            manifest = read_manifest(args.file)
+        except Exception as e:
+            print(f"❌ 无法读取归档: {e}")
+            sys.exit(1)
+        chroma_db = ChromaDB()
+        current = SQLiteDB()
+        existing = current.count()
+        current.conn.close()
+        if (existing or chroma_db.count()) and not args.force:
+            print(f"❌ 当前知识库已有 {existing} 条记忆，导入会覆盖全部数据；确认请加 --force")
+            sys.exit(1)
+        if manifest["embedding_model"] != settings.embedding_model:
+            print(f"⚠️  归档使用的模型 {manifest['embedding_model']} 与当前模型 {settings.embedding_model} 不同，"
+                  f"向量将在服务启动后重新生成")
+
+        started = time.perf_counter()
+        manifest = import_archive(
+            args.file, chroma_db,
+            progress=lambda done, total: print(f"\r   已写入 {done}/{total} 个向量", end="", flush=True)
+        )
+        if manifest["vectors_loaded"]:
+            print()
+        print(f"✅ 已导入 {manifest['memories']} 条记忆"
+              f"{'、' + str(manifest['chunks']) + ' 个向量' if manifest['vectors_loaded'] else ''}"
+              f" ({time.perf_counter() - started:.2f}s)")
+        sys.exit(0)
+
+    elif args.command == "search":
+        from backend.search_cli import run as run_search
+        sys.exit(run_search(args))
+
+    elif args.command == "sync":
+        from backend.core.sqlite_db import SQLiteDB
+        from backend.core.replication import Replicator
+
+        if is_port_open(settings.host, settings.port):
+            # 服务正在运行：命令行不写向量库，索引日志交给服务的后台索引队列
+            print("💡 Mymem 服务正在运行，向量由服务的后台索引队列写入")
+            replicator = Replicator(SQLiteDB(), None)
+        else:
+            from backend.core.chroma_db import ChromaDB
+            from backend.core.embedding import Embedding
+            from backend.core.indexer import Indexer
+            # 模型在第一次向量化时才加载，向量全部可复用时不加载
+            replicator = Replicator(SQLiteDB(), Indexer(ChromaDB(), Embedding()))
+        started = time.perf_counter()
+        try:
+            stats = replicator.pull(
+                args.source,
+                progress=lambda s: print(f"\r   已同步到序号 {s['last_seq']}"
+                                         f"（新增 {s['created']}，更新 {s['updated']}，删除 {s['deleted']}）",
+                                         end="", flush=True)
+            )
+        except Exception as e:
+            print(f"\n❌ 同步失败: {e}")
+            sys.exit(1)
+        if stats["created"] or stats["updated"] or stats["deleted"] or stats["skipped"]:
+            print()
+        print(f"✅ 新增 {stats['created']}，更新 {stats['updated']}，删除 {stats['deleted']}，"
+              f"跳过 {stats['skipped']}；复用向量 {stats['reused']} 个，重新向量化 {stats['embedded']} 个块"
+              f" ({time.perf_counter() - started:.2f}s)")
+        sys.exit(0)
+
     elif args.command == "start" or args.command is None:
         if is_port_open(settings.host, settings.port):
             print(f"✨ Mymem 服务已在 http://{settings.host}:{settings.port} 运行。")
             sys.exit(0)
 
+        workers = getattr(args, 'workers', settings.workers)
+        if workers > 1 and os.name == 'nt':
+            print("⚠️  Windows 不支持多进程模式，以单进程启动")
+            workers = 1
+
         if getattr(args, 'bg', False):
             # 后台启动模式
             print("🚀 正在后台启动 Mymem 服务...")
@@ -202,10 +534,17 @@ def cli():
                 "--port", str(settings.port)
             ]
 
-            # 根据开发模式决定是否启用 reload
-            if settings.is_dev:
+            if workers > 1:
+                # 多进程模式不支持 reload
+                cmd = [python_exe, str(backend_dir / "prefork.py"), "--workers", str(workers)]
+                print(f"📝 多进程模式: {workers} 个 worker（模型由主进程预加载后共享）")
+            elif settings.is_dev:
+                # 根据开发模式决定是否启用 reload
                 cmd.append("--reload")
                 print(f"📝 开发模式已启用，代码修改将自动重载")
+            else:
+                # 生产模式同 mymem start，同时监听 Unix socket
+                cmd = [python_exe, str(backend_dir / "main.py"), "start"]
 
             if os.name == 'nt':
                 subprocess.Popen(
@@ -224,18 +563,30 @@ def cli():
                     preexec_fn=os.setpgrp
                 )
 
-            # 等待启动
-            for i in range(5):
-                time.sleep(1)
-                if is_port_open(settings.host, settings.port):
+            # 等待就绪：端口很快可用，模型在服务内后台加载，以 /ready 为准
+            deadline = time.time() + args.timeout
+            last_message = None
+            while time.time() < deadline:
+                time.sleep(0.5)
+                state = get_readiness()
+                if state is None:
+                    continue
+                if state["ready"]:
                     print(f"✅ 服务启动成功: http://{settings.host}:{settings.port}")
                     print(f"📝 日志文件: {log_file}")
                     sys.exit(0)
+                message = describe_loading(state)
+                if any(component["status"] == "failed" for component in state["components"].values()):
+                    print(f"❌ 组件加载失败: {message}，请查看日志: {log_file}")
+                    sys.exit(1)
+                if message != last_message:
+                    print(f"⏳ 服务已响应，正在加载: {message}")
+                    last_message = message
             print(f"⏳ 服务正在启动中，请稍后通过 `mymem status` 检查。")
             print(f"📝 日志文件: {log_file}")
         else:
             print(f"🚀 正在启动 Mymem 服务 (端口: {settings.port})...")
-            run_server()
+            run_server(workers)
     else:
         parser.print_help()
 
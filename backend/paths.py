@@ -0,0 +1,36 @@
+"""
+数据目录解析（不依赖 pydantic，供命令行快速路径直接使用；Settings 也通过这里解析）
+"""
+import os
+from pathlib import Path
+
+# 项目根目录（backend 的上一级）
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+def is_dev_env(env: str = None) -> bool:
+    """
+    是否为开发环境
+
+    Args:
+        env: dev / prod / auto，默认读取环境变量 MYMEM_ENV；auto 时以项目根目录下是否存在 .git 判断
+    """
+    env_val = (env if env is not None else os.getenv("MYMEM_ENV", "auto")).lower()
+    if env_val in ["dev", "development"]:
+        return True
+    if env_val in ["prod", "production"]:
+        return False
+    return (PROJECT_ROOT / ".git").exists()
+
+def resolve_data_dir(env: str = None) -> str:
+    """
+    数据目录（不创建）
+    1. 优先使用环境变量 MYMEM_DATA_PATH
+    2. 如果是开发环境，使用项目根目录下的 ./data
+    3. 否则认为是用户环境，使用 ~/.mymem/data
+    """
+    env_path = os.getenv("MYMEM_DATA_PATH")
+    if env_path:
+        return os.path.abspath(env_path)
+    if is_dev_env(env):
+        return str(PROJECT_ROOT / "data")
+    return str(Path.home() / ".mymem" / "data")
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+多进程服务入口（mymem start --workers N）
+
+主进程预加载模型后 fork 出多个 uvicorn worker，worker 写时复制共享模型权重，共用同一个监听端口。
+主进程不导入 backend.main（导入应用会打开 SQLite 连接，连接不能跨 fork 使用），由 worker 在 fork 后导入
+"""
+import argparse
+import logging
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 确保项目根目录在 sys.path 中（以脚本方式 python backend/prefork.py 启动）
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from backend.config import settings
+from backend.listen import bind_sockets, close_sockets
+
+logger = logging.getLogger(__name__)
+
+class PreforkServer:
+    """
+    预派生（pre-fork）多进程服务
+
+    主进程先执行 preload 加载只读状态，再绑定端口并 fork 出 worker：worker 继承已加载的内存页
+    （写时复制，不重复占用内存），由内核在 worker 之间分配连接。
+    worker 运行中异常退出时主进程按原编号重新 fork；启动阶段就退出视为启动失败，停止整个服务。
+    收到 SIGTERM / SIGINT 时通知所有 worker 优雅退出
+    """
+
+    # worker 启动后存活不足该秒数就退出，视为启动失败（如导入出错）
+    MIN_UPTIME = 5.0
+    # 停止时等待 worker 退出的秒数，超时后强制结束
+    STOP_TIMEOUT = 30
+
+    def __init__(self, app: str, host: str, port: int, workers: int,
+                 socket_path: Optional[str] = None,
+                 preload: Optional[Callable[[], None]] = None,
+                 post_fork: Optional[Callable[[int], None]] = None):
+        """
+        Args:
+            app: uvicorn 应用路径，如 "backend.main:app"（在 worker 中 fork 之后才导入）
+            host: 监听地址
+            port: 监听端口
+            workers: worker 数
+            socket_path: 同时监听的 Unix domain socket 路径，为空时只监听 TCP
+            preload: fork 前在主进程执行（只加载只读状态，不能打开数据库连接）
+            post_fork: fork 后在 worker 中、导入应用之前执行 post_fork(worker 编号)
+        """
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.socket_path = socket_path
+        self.preload = preload
+        self.post_fork = post_fork
+        # pid -> (worker 编号, 启动时间)
+        self._children: Dict[int, Tuple[int, float]] = {}
+        self._stopping = False
+        self._exit_code = 0
+
+    def run(self) -> int:
+        """启动并监管 worker，直到收到停止信号；返回退出码"""
+        if self.preload is not None:
+            started = time.perf_counter()
+            self.preload()
+            print(f"[多进程] 主进程预加载完成 ({time.perf_counter() - started:.1f}s)", flush=True)
+
+        sockets = bind_sockets(self.host, self.port, self.socket_path)
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGALRM, self._handle_stop_timeout)
+
+        for index in range(self.workers):
+            self._spawn(index, sockets)
+        print(f"[多进程] 已启动 {self.workers} 个 worker: http://{self.host}:{self.port}", flush=True)
+
+        self._supervise(sockets)
+        close_sockets(sockets, self.socket_path)
+        return self._exit_code
+
+    def _spawn(self, index: int, sockets: List):
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                signal.signal(signal.SIGALRM, signal.SIG_DFL)
+                if self.post_fork is not None:
+                    self.post_fork(index)
+                import uvicorn
+                config = uvicorn.Config(self.app, host=self.host, port=self.port)
+                uvicorn.Server(config).run(sockets=sockets)
+            except BaseException:
+                logger.exception(f"[多进程] worker {index} 异常退出")
+                code = 1
+            finally:
+                os._exit(code)
+        self._children[pid] = (index, time.monotonic())
+
+    def _supervise(self, sockets: List):
+        while self._children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            index, started = self._children.pop(pid, (None, 0.0))
+            if index is None or self._stopping:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            if time.monotonic() - started < self.MIN_UPTIME:
+                print(f"[多进程] worker {index} 启动失败 (退出码 {code})，停止服务", flush=True)
+                self._exit_code = 1
+                self._stop_children()
+                continue
+            print(f"[多进程] worker {index} (pid {pid}) 退出 (退出码 {code})，重新启动", flush=True)
+            self._spawn(index, sockets)
+
+    def _stop_children(self):
+        """通知所有 worker 优雅退出，超时未退出的由 SIGALRM 强制结束"""
+        self._stopping = True
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        signal.alarm(self.STOP_TIMEOUT)
+
+    def _handle_stop(self, signum, frame):
+        if self._stopping:
+            return
+        print(f"[多进程] 收到停止信号，等待 {len(self._children)} 个 worker 退出...", flush=True)
+        self._stop_children()
+
+    def _handle_stop_timeout(self, signum, frame):
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+def _preload():
+    """fork 前加载模型（只加载权重，不做推理：推理会初始化线程池，线程池不能跨 fork 使用）"""
+    from backend.core.embedding import Embedding
+    # 导入较大的依赖，代码页同样由 worker 共享；向量库和数据库在 worker 中打开
+    import chromadb  # noqa: F401
+    import fastapi  # noqa: F401
+
+    Embedding().load()
+
+def _post_fork(workers: int) -> Callable[[int], None]:
+    def post_fork(index: int):
+        # worker 0 唯一写入向量库并运行后台索引队列，其余 worker 只读
+        settings.worker_role = "writer" if index == 0 else "reader"
+        if "torch" in sys.modules:
+            # 各 worker 平分 CPU 核，避免推理线程数超过核数
+            import torch
+            torch.set_num_threads(max(1, (os.cpu_count() or 1) // workers))
+    return post_fork
+
+def main():
+    parser = argparse.ArgumentParser(description="Mymem 多进程服务")
+    parser.add_argument("--workers", type=int, default=settings.workers, help="worker 数")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    server = PreforkServer(
+        "backend.main:app", settings.host, settings.port, args.workers,
+        socket_path=settings.socket_path if settings.unix_socket else None,
+        preload=_preload, post_fork=_post_fork(args.workers)
+    )
+    sys.exit(server.run())
+
+if __name__ == "__main__":
+    main()
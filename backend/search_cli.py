@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+命令行搜索（mymem search）
+
+不导入 FastAPI 和应用：关键字搜索以只读方式打开 SQLite（mode=ro，不建表、不重建全文索引），
+不加载配置和模型；语义搜索优先请求正在运行的服务，服务未运行或向量检索未就绪时才在本进程加载模型
+
+使用方法：
+mymem search "关键字"
+mymem search "问题描述" --semantic --limit 5
+mymem search "关键字" --json
+"""
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import time
+
+from backend.paths import resolve_data_dir
+
+# 结果中片段的最大字符数
+PREVIEW_CHARS = 200
+# 请求本机服务的超时（秒）
+SERVER_TIMEOUT = 30
+
+def _preview(text: str) -> str:
+    text = (text or "").strip()
+    return text[:PREVIEW_CHARS] + "..." if len(text) > PREVIEW_CHARS else text
+
+def _format_time(value) -> str:
+    return value.isoformat(sep=" ", timespec="seconds") if hasattr(value, "isoformat") else str(value or "")
+
+def _hit_to_dict(hit) -> dict:
+    """搜索引擎结果转换为输出格式"""
+    from backend.core.sqlite_db import SNIPPET_OPEN, SNIPPET_CLOSE
+
+    snippet = hit.chunks[0].snippet if hit.chunks else hit.content
+    return {
+        "id": hit.id,
+        "title": hit.title,
+        "tags": hit.tags,
+        "created_at": _format_time(hit.created_at),
+        "relevance": hit.relevance,
+        "snippet": _preview(snippet.replace(SNIPPET_OPEN, "").replace(SNIPPET_CLOSE, ""))
+    }
+
+def keyword_search(db_path: str, query: str, limit: int) -> list:
+    """
+    只读关键字搜索
+
+    Returns:
+        [{"id", "title", "tags", "created_at", "relevance", "snippet"}...]（按相关度降序）
+    """
+    from backend.core.search_engine import SearchEngine
+    from backend.core.sqlite_db import SQLiteDB
+
+    db = SQLiteDB(db_path, read_only=True, verbose=False)
+    try:
+        return [_hit_to_dict(hit) for hit in SearchEngine(sqlite_db=db).keyword_search(query, limit)]
+    finally:
+        db.conn.close()
+
+def _load_client_class():
+    """
+    与技能脚本共用的客户端（skills/myMem/mymem_client.py：Unix socket 优先、复用 keep-alive 连接）
+
+    Returns:
+        MymemClient 类；安装包中不含技能脚本时返回 None
+    """
+    skills_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "skills", "myMem")
+    if os.path.isdir(skills_dir) and skills_dir not in sys.path:
+        sys.path.insert(0, skills_dir)
+    try:
+        from mymem_client import MymemClient
+    except ImportError:
+        return None
+    return MymemClient
+
+def _request_server(data_dir: str, body: bytes):
+    """
+    POST 语义搜索请求
+
+    Returns:
+        (状态码, 响应体 bytes)；服务未运行时返回 None
+    """
+    from backend.config import settings
+
+    api_url = f"http://{settings.host}:{settings.port}"
+    client_class = _load_client_class()
+    if client_class is not None:
+        with client_class(api_url, timeout=SERVER_TIMEOUT, socket_path=os.path.join(data_dir, "mymem.sock")) as client:
+            try:
+                return client.request_raw("POST", "/api/v1/search/", body)
+            except ConnectionError:
+                return None
+
+    import urllib.error
+    import urllib.request
+
+    request = urllib.request.Request(
+        f"{api_url}/api/v1/search/", data=body, method="POST", headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=SERVER_TIMEOUT) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+    except (urllib.error.URLError, OSError):
+        return None
+
+def _search_server(data_dir: str, query: str, limit: int):
+    """
+    请求正在运行的服务做语义搜索
+
+    Returns:
+        结果列表；服务未运行或向量检索还在加载（503）时返回 None
+    """
+    body = json.dumps({"query": query, "limit": limit}, ensure_ascii=False).encode("utf-8")
+    reply = _request_server(data_dir, body)
+    if reply is None or reply[0] == 503:
+        return None
+    status, data = reply
+    if status >= 400:
+        raise RuntimeError(f"服务返回错误 (HTTP {status}): {data.decode('utf-8', 'replace')}")
+    items = json.loads(data)
+
+    return [
+        {
+            "id": item["id"],
+            "title": item["title"],
+            "tags": item["tags"],
+            "created_at": str(item["created_at"]).replace("T", " "),
+            "relevance": item["relevance"],
+            "snippet": _preview(item["chunks"][0]["snippet"] if item.get("chunks") else item.get("content"))
+        }
+        for item in items
+    ]
+
+def _search_local(data_dir: str, query: str, limit: int) -> list:
+    """在本进程加载向量库和模型做语义搜索（最后的手段，需要数秒加载模型；排序与服务一致）"""
+    from backend.core.chroma_db import ChromaDB
+    from backend.core.embedding import Embedding
+    from backend.core.search_engine import SearchEngine
+    from backend.core.sqlite_db import SQLiteDB
+
+    chroma_db = ChromaDB(persist_dir=os.path.join(data_dir, "chroma"), read_only=True)
+    db = SQLiteDB(os.path.join(data_dir, "memories.db"), read_only=True, verbose=False)
+    try:
+        engine = SearchEngine(chroma_db, db, Embedding())
+        return [_hit_to_dict(hit) for hit in engine.search(query, limit)]
+    finally:
+        db.conn.close()
+
+def semantic_search(data_dir: str, query: str, limit: int, local: bool = False) -> list:
+    """语义搜索：优先使用正在运行的服务，不可用时在本进程加载模型"""
+    if not local:
+        results = _search_server(data_dir, query, limit)
+        if results is not None:
+            return results
+        print("ℹ️  服务未运行或向量检索还在加载，在本进程加载模型（较慢）...", file=sys.stderr, flush=True)
+    return _search_local(data_dir, query, limit)
+
+def print_results(results: list, query: str, label: str):
+    print(f"\n🔍 找到 {len(results)} 条匹配的记录 ({label}: '{query}'):")
+    print("=" * 80)
+    if not results:
+        print("未找到匹配的记录。")
+        return
+    for res in results:
+        print(f"ID: {res['id']} (相关度: {res['relevance']:.2%})")
+        print(f"标题: {res['title']}")
+        print(f"标签: {', '.join(res['tags']) if res['tags'] else '无'}")
+        print(f"时间: {res['created_at']}")
+        print("-" * 40)
+        print(f"内容: {res['snippet']}")
+        print("=" * 80)
+
+def build_parser(parser: argparse.ArgumentParser = None) -> argparse.ArgumentParser:
+    if parser is None:
+        parser = argparse.ArgumentParser(prog="mymem search", description="搜索知识库（不需要启动服务）")
+    parser.add_argument("query", help="搜索内容")
+    parser.add_argument("--semantic", action="store_true",
+                        help="语义搜索（优先请求正在运行的服务，否则在本进程加载模型）；默认关键字搜索")
+    parser.add_argument("--local", action="store_true", help="语义搜索时不请求服务，直接在本进程加载模型")
+    parser.add_argument("--limit", type=int, default=10, help="返回结果数量（默认 10）")
+    parser.add_argument("--json", action="store_true", help="以 JSON 输出结果")
+    parser.add_argument("--data", help="数据目录（默认与服务相同：MYMEM_DATA_PATH、开发环境 ./data 或 ~/.mymem/data）")
+    return parser
+
+def run(args) -> int:
+    """执行搜索，返回退出码"""
+    data_dir = os.path.abspath(args.data) if args.data else resolve_data_dir()
+    db_path = os.path.join(data_dir, "memories.db")
+    if not os.path.exists(db_path):
+        print(f"❌ 知识库不存在: {db_path}", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    try:
+        if args.semantic:
+            results = semantic_search(data_dir, args.query, args.limit, local=args.local)
+            label = "语义搜索"
+        else:
+            results = keyword_search(db_path, args.query, args.limit)
+            label = "关键字搜索"
+    except (sqlite3.Error, RuntimeError) as e:
+        print(f"❌ 搜索失败: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print_results(results, args.query, label)
+        print(f"⏱️  {(time.perf_counter() - started) * 1000:.1f} ms")
+    return 0
+
+def main(argv=None) -> int:
+    return run(build_parser().parse_args(argv))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -37,7 +37,7 @@
 `+s[a].replace(" at new "," at ");return n.displayName&&l.includes("<anonymous>")&&(l=l.replace("<anonymous>",n.displayName)),l}while(1<=a&&0<=o);break}}}finally{ex=!1,Error.prepareStackTrace=e}return(n=n?n.displayName||n.name:"")?Ic(n):""}function aW(n){switch(n.tag){case 5:return Ic(n.type);case 16:return Ic("Lazy");case 13:return Ic("Suspense");case 19:return Ic("SuspenseList");case 0:case 2:case 15:return n=ix(n.type,!1),n;case 11:return n=ix(n.type.render,!1),n;case 1:return n=ix(n.type,!0),n;default:return""}}function OS(n){if(n==null)return null;if(typeof n=="function")return n.displayName||n.name||null;if(typeof n=="string")return n;switch(n){case au:return"Fragment";case ru:return"Portal";case RS:return"Profiler";case Qk:return"StrictMode";case ES:return"Suspense";case BS:return"SuspenseList"}if(typeof n=="object")switch(n.$$typeof){case f2:return(n.displayName||"Context")+".Consumer";case g2:return(n._context.displayName||"Context")+".Provider";case Jk:var t=n.render;return n=n.displayName,n||(n=t.displayName||t.name||"",n=n!==""?"ForwardRef("+n+")":"ForwardRef"),n;case tw:return t=n.displayName||null,t!==null?t:OS(n.type)||"Memo";case Ao:t=n._payload,n=n._init;try{return OS(n(t))}catch{}}return null}function oW(n){var t=n.type;switch(n.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return n=t.render,n=n.displayName||n.name||"",t.displayName||(n!==""?"ForwardRef("+n+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return OS(t);case 8:return t===Qk?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof t=="function")return t.displayName||t.name||null;if(typeof t=="string")return t}return null}function Jo(n){switch(typeof n){case"boolean":case"number":case"string":case"undefined":return n;case"object":return n;default:return""}}function m2(n){var t=n.type;return(n=n.nodeName)&&n.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function lW(n){var t=m2(n)?"checked":"value",e=Object.getOwnPropertyDescriptor(n.constructor.prototype,t),i=""+n[t];if(!n.hasOwnProperty(t)&&typeof e<"u"&&typeof e.get=="function"&&typeof e.set=="function"){var s=e.get,r=e.set;return Object.defineProperty(n,t,{configurable:!0,get:function(){return s.call(this)},set:function(a){i=""+a,r.call(this,a)}}),Object.defineProperty(n,t,{enumerable:e.enumerable}),{getValue:function(){return i},setValue:function(a){i=""+a},stopTracking:function(){n._valueTracker=null,delete n[t]}}}}function e_(n){n._valueTracker||(n._valueTracker=lW(n))}function v2(n){if(!n)return!1;var t=n._valueTracker;if(!t)return!0;var e=t.getValue(),i="";return n&&(i=m2(n)?n.checked?"true":"false":n.value),n=i,n!==e?(t.setValue(n),!0):!1}function Cm(n){if(n=n||(typeof document<"u"?document:void 0),typeof n>"u")return null;try{return n.activeElement||n.body}catch{return n.body}}function LS(n,t){var e=t.checked;return ii({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:e??n._wrapperState.initialChecked})}function aC(n,t){var e=t.defaultValue==null?"":t.defaultValue,i=t.checked!=null?t.checked:t.defaultChecked;e=Jo(t.value!=null?t.value:e),n._wrapperState={initialChecked:i,initialValue:e,controlled:t.type==="checkbox"||t.type==="radio"?t.checked!=null:t.value!=null}}function y2(n,t){t=t.checked,t!=null&&Zk(n,"checked",t,!1)}function IS(n,t){y2(n,t);var e=Jo(t.value),i=t.type;if(e!=null)i==="number"?(e===0&&n.value===""||n.value!=e)&&(n.value=""+e):n.value!==""+e&&(n.value=""+e);else if(i==="submit"||i==="reset"){n.removeAttribute("value");return}t.hasOwnProperty("value")?DS(n,t.type,e):t.hasOwnProperty("defaultValue")&&DS(n,t.type,Jo(t.defaultValue)),t.checked==null&&t.defaultChecked!=null&&(n.defaultChecked=!!t.defaultChecked)}function oC(n,t,e){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var i=t.type;if(!(i!=="submit"&&i!=="reset"||t.value!==void 0&&t.value!==null))return;t=""+n._wrapperState.initialValue,e||t===n.value||(n.value=t),n.defaultValue=t}e=n.name,e!==""&&(n.name=""),n.defaultChecked=!!n._wrapperState.initialChecked,e!==""&&(n.name=e)}function DS(n,t,e){(t!=="number"||Cm(n.ownerDocument)!==n)&&(e==null?n.defaultValue=""+n._wrapperState.initialValue:n.defaultValue!==""+e&&(n.defaultValue=""+e))}var Dc=Array.isArray;function Wu(n,t,e,i){if(n=n.options,t){t={};for(var s=0;s<e.length;s++)t["$"+e[s]]=!0;for(e=0;e<n.length;e++)s=t.hasOwnProperty("$"+n[e].value),n[e].selected!==s&&(n[e].selected=s),s&&i&&(n[e].defaultSelected=!0)}else{for(e=""+Jo(e),t=null,s=0;s<n.length;s++){if(n[s].value===e){n[s].selected=!0,i&&(n[s].defaultSelected=!0);return}t!==null||n[s].disabled||(t=n[s])}t!==null&&(t.selected=!0)}}function FS(n,t){if(t.dangerouslySetInnerHTML!=null)throw Error(rt(91));return ii({},t,{value:void 0,defaultValue:void 0,children:""+n._wrapperState.initialValue})}function lC(n,t){var e=t.value;if(e==null){if(e=t.children,t=t.defaultValue,e!=null){if(t!=null)throw Error(rt(92));if(Dc(e)){if(1<e.length)throw Error(rt(93));e=e[0]}t=e}t==null&&(t=""),e=t}n._wrapperState={initialValue:Jo(e)}}function b2(n,t){var e=Jo(t.value),i=Jo(t.defaultValue);e!=null&&(e=""+e,e!==n.value&&(n.value=e),t.defaultValue==null&&n.defaultValue!==e&&(n.defaultValue=e)),i!=null&&(n.defaultValue=""+i)}function hC(n){var t=n.textContent;t===n._wrapperState.initialValue&&t!==""&&t!==null&&(n.value=t)}function x2(n){switch(n){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function zS(n,t){return n==null||n==="http://www.w3.org/1999/xhtml"?x2(t):n==="http://www.w3.org/2000/svg"&&t==="foreignObject"?"http://www.w3.org/1999/xhtml":n}var i_,S2=function(n){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(t,e,i,s){MSApp.execUnsafeLocalFunction(function(){return n(t,e,i,s)})}:n}(function(n,t){if(n.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in n)n.innerHTML=t;else{for(i_=i_||document.createElement("div"),i_.innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=i_.firstChild;n.firstChild;)n.removeChild(n.firstChild);for(;t.firstChild;)n.appendChild(t.firstChild)}});function ig(n,t){if(t){var e=n.firstChild;if(e&&e===n.lastChild&&e.nodeType===3){e.nodeValue=t;return}}n.textContent=t}var Qc={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},hW=["Webkit","ms","Moz","O"];Object.keys(Qc).forEach(function(n){hW.forEach(function(t){t=t+n.charAt(0).toUpperCase()+n.substring(1),Qc[t]=Qc[n]})});function A2(n,t,e){return t==null||typeof t=="boolean"||t===""?"":e||typeof t!="number"||t===0||Qc.hasOwnProperty(n)&&Qc[n]?(""+t).trim():t+"px"}function k2(n,t){n=n.style;for(var e in t)if(t.hasOwnProperty(e)){var i=e.indexOf("--")===0,s=A2(e,t[e],i);e==="float"&&(e="cssFloat"),i?n.setProperty(e,s):n[e]=s}}var uW=ii({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function HS(n,t){if(t){if(uW[n]&&(t.children!=null||t.dangerouslySetInnerHTML!=null))throw Error(rt(137,n));if(t.dangerouslySetInnerHTML!=null){if(t.children!=null)throw Error(rt(60));if(typeof t.dangerouslySetInnerHTML!="object"||!("__html"in t.dangerouslySetInnerHTML))throw Error(rt(61))}if(t.style!=null&&typeof t.style!="object")throw Error(rt(62))}}function jS(n,t){if(n.indexOf("-")===-1)return typeof t.is=="string";switch(n){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var NS=null;function ew(n){return n=n.target||n.srcElement||window,n.correspondingUseElement&&(n=n.correspondingUseElement),n.nodeType===3?n.parentNode:n}var VS=null,Uu=null,Gu=null;function uC(n){if(n=xf(n)){if(typeof VS!="function")throw Error(rt(280));var t=n.stateNode;t&&(t=my(t),VS(n.stateNode,n.type,t))}}function w2(n){Uu?Gu?Gu.push(n):Gu=[n]:Uu=n}function T2(){if(Uu){var n=Uu,t=Gu;if(Gu=Uu=null,uC(n),t)for(n=0;n<t.length;n++)uC(t[n])}}function M2(n,t){return n(t)}function C2(){}var nx=!1;function P2(n,t,e){if(nx)return n(t,e);nx=!0;try{return M2(n,t,e)}finally{nx=!1,(Uu!==null||Gu!==null)&&(C2(),T2())}}function ng(n,t){var e=n.stateNode;if(e===null)return null;var i=my(e);if(i===null)return null;e=i[t];t:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(i=!i.disabled)||(n=n.type,i=!(n==="button"||n==="input"||n==="select"||n==="textarea")),n=!i;break t;default:n=!1}if(n)return null;if(e&&typeof e!="function")throw Error(rt(231,t,typeof e));return e}var WS=!1;if(Ja)try{var cc={};Object.defineProperty(cc,"passive",{get:function(){WS=!0}}),window.addEventListener("test",cc,cc),window.removeEventListener("test",cc,cc)}catch{WS=!1}function dW(n,t,e,i,s,r,a,o,l){var h=Array.prototype.slice.call(arguments,3);try{t.apply(e,h)}catch(u){this.onError(u)}}var Jc=!1,Pm=null,Rm=!1,US=null,cW={onError:function(n){Jc=!0,Pm=n}};function pW(n,t,e,i,s,r,a,o,l){Jc=!1,Pm=null,dW.apply(cW,arguments)}function gW(n,t,e,i,s,r,a,o,l){if(pW.apply(this,arguments),Jc){if(Jc){var h=Pm;Jc=!1,Pm=null}else throw Error(rt(198));Rm||(Rm=!0,US=h)}}function Th(n){var t=n,e=n;if(n.alternate)for(;t.return;)t=t.return;else{n=t;do t=n,t.flags&4098&&(e=t.return),n=t.return;while(n)}return t.tag===3?e:null}function R2(n){if(n.tag===13){var t=n.memoizedState;if(t===null&&(n=n.alternate,n!==null&&(t=n.memoizedState)),t!==null)return t.dehydrated}return null}function dC(n){if(Th(n)!==n)throw Error(rt(188))}function fW(n){var t=n.alternate;if(!t){if(t=Th(n),t===null)throw Error(rt(188));return t!==n?null:n}for(var e=n,i=t;;){var s=e.return;if(s===null)break;var r=s.alternate;if(r===null){if(i=s.return,i!==null){e=i;continue}break}if(s.child===r.child){for(r=s.child;r;){if(r===e)return dC(s),n;if(r===i)return dC(s),t;r=r.sibling}throw Error(rt(188))}if(e.return!==i.return)e=s,i=r;else{for(var a=!1,o=s.child;o;){if(o===e){a=!0,e=s,i=r;break}if(o===i){a=!0,i=s,e=r;break}o=o.sibling}if(!a){for(o=r.child;o;){if(o===e){a=!0,e=r,i=s;break}if(o===i){a=!0,i=r,e=s;break}o=o.sibling}if(!a)throw Error(rt(189))}}if(e.alternate!==i)throw Error(rt(190))}if(e.tag!==3)throw Error(rt(188));return e.stateNode.current===e?n:t}function E2(n){return n=fW(n),n!==null?B2(n):null}function B2(n){if(n.tag===5||n.tag===6)return n;for(n=n.child;n!==null;){var t=B2(n);if(t!==null)return t;n=n.sibling}return null}var O2=hs.unstable_scheduleCallback,cC=hs.unstable_cancelCallback,_W=hs.unstable_shouldYield,mW=hs.unstable_requestPaint,xi=hs.unstable_now,vW=hs.unstable_getCurrentPriorityLevel,iw=hs.unstable_ImmediatePriority,L2=hs.unstable_UserBlockingPriority,Em=hs.unstable_NormalPriority,yW=hs.unstable_LowPriority,I2=hs.unstable_IdlePriority,py=null,aa=null;function bW(n){if(aa&&typeof aa.onCommitFiberRoot=="function")try{aa.onCommitFiberRoot(py,n,void 0,(n.current.flags&128)===128)}catch{}}var Sr=Math.clz32?Math.clz32:AW,xW=Math.log,SW=Math.LN2;function AW(n){return n>>>=0,n===0?32:31-(xW(n)/SW|0)|0}var n_=64,s_=4194304;function Fc(n){switch(n&-n){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return n&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return n&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return n}}function Bm(n,t){var e=n.pendingLanes;if(e===0)return 0;var i=0,s=n.suspendedLanes,r=n.pingedLanes,a=e&268435455;if(a!==0){var o=a&~s;o!==0?i=Fc(o):(r&=a,r!==0&&(i=Fc(r)))}else a=e&~s,a!==0?i=Fc(a):r!==0&&(i=Fc(r));if(i===0)return 0;if(t!==0&&t!==i&&!(t&s)&&(s=i&-i,r=t&-t,s>=r||s===16&&(r&4194240)!==0))return t;if(i&4&&(i|=e&16),t=n.entangledLanes,t!==0)for(n=n.entanglements,t&=i;0<t;)e=31-Sr(t),s=1<<e,i|=n[e],t&=~s;return i}function kW(n,t){switch(n){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function wW(n,t){for(var e=n.suspendedLanes,i=n.pingedLanes,s=n.expirationTimes,r=n.pendingLanes;0<r;){var a=31-Sr(r),o=1<<a,l=s[a];l===-1?(!(o&e)||o&i)&&(s[a]=kW(o,t)):l<=t&&(n.expiredLanes|=o),r&=~o}}function GS(n){return n=n.pendingLanes&-1073741825,n!==0?n:n&1073741824?1073741824:0}function D2(){var n=n_;return n_<<=1,!(n_&4194240)&&(n_=64),n}function sx(n){for(var t=[],e=0;31>e;e++)t.push(n);return t}function yf(n,t,e){n.pendingLanes|=t,t!==536870912&&(n.suspendedLanes=0,n.pingedLanes=0),n=n.eventTimes,t=31-Sr(t),n[t]=e}function TW(n,t){var e=n.pendingLanes&~t;n.pendingLanes=t,n.suspendedLanes=0,n.pingedLanes=0,n.expiredLanes&=t,n.mutableReadLanes&=t,n.entangledLanes&=t,t=n.entanglements;var i=n.eventTimes;for(n=n.expirationTimes;0<e;){var s=31-Sr(e),r=1<<s;t[s]=0,i[s]=-1,n[s]=-1,e&=~r}}function nw(n,t){var e=n.entangledLanes|=t;for(n=n.entanglements;e;){var i=31-Sr(e),s=1<<i;s&t|n[i]&t&&(n[i]|=t),e&=~s}}var ke=0;function F2(n){return n&=-n,1<n?4<n?n&268435455?16:536870912:4:1}var z2,sw,H2,j2,N2,$S=!1,r_=[],Wo=null,Uo=null,Go=null,sg=new Map,rg=new Map,Po=[],MW="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function pC(n,t){switch(n){case"focusin":case"focusout":Wo=null;break;case"dragenter":case"dragleave":Uo=null;break;case"mouseover":case"mouseout":Go=null;break;case"pointerover":case"pointerout":sg.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":rg.delete(t.pointerId)}}function pc(n,t,e,i,s,r){return n===null||n.nativeEvent!==r?(n={blockedOn:t,domEventName:e,eventSystemFlags:i,nativeEvent:r,targetContainers:[s]},t!==null&&(t=xf(t),t!==null&&sw(t)),n):(n.eventSystemFlags|=i,t=n.targetContainers,s!==null&&t.indexOf(s)===-1&&t.push(s),n)}function CW(n,t,e,i,s){switch(t){case"focusin":return Wo=pc(Wo,n,t,e,i,s),!0;case"dragenter":return Uo=pc(Uo,n,t,e,i,s),!0;case"mouseover":return Go=pc(Go,n,t,e,i,s),!0;case"pointerover":var r=s.pointerId;return sg.set(r,pc(sg.get(r)||null,n,t,e,i,s)),!0;case"gotpointercapture":return r=s.pointerId,rg.set(r,pc(rg.get(r)||null,n,t,e,i,s)),!0}return!1}function V2(n){var t=Dl(n.target);if(t!==null){var e=Th(t);if(e!==null){if(t=e.tag,t===13){if(t=R2(e),t!==null){n.blockedOn=t,N2(n.priority,function(){H2(e)});return}}else if(t===3&&e.stateNode.current.memoizedState.isDehydrated){n.blockedOn=e.tag===3?e.stateNode.containerInfo:null;return}}}n.blockedOn=null}function am(n){if(n.blockedOn!==null)return!1;for(var t=n.targetContainers;0<t.length;){var e=YS(n.domEventName,n.eventSystemFlags,t[0],n.nativeEvent);if(e===null){e=n.nativeEvent;var i=new e.constructor(e.type,e);NS=i,e.target.dispatchEvent(i),NS=null}else return t=xf(e),t!==null&&sw(t),n.blockedOn=e,!1;t.shift()}return!0}function gC(n,t,e){am(n)&&e.delete(t)}function PW(){$S=!1,Wo!==null&&am(Wo)&&(Wo=null),Uo!==null&&am(Uo)&&(Uo=null),Go!==null&&am(Go)&&(Go=null),sg.forEach(gC),rg.forEach(gC)}function gc(n,t){n.blockedOn===t&&(n.blockedOn=null,$S||($S=!0,hs.unstable_scheduleCallback(hs.unstable_NormalPriority,PW)))}function ag(n){function t(s){return gc(s,n)}if(0<r_.length){gc(r_[0],n);for(var e=1;e<r_.length;e++){var i=r_[e];i.blockedOn===n&&(i.blockedOn=null)}}for(Wo!==null&&gc(Wo,n),Uo!==null&&gc(Uo,n),Go!==null&&gc(Go,n),sg.forEach(t),rg.forEach(t),e=0;e<Po.length;e++)i=Po[e],i.blockedOn===n&&(i.blockedOn=null);for(;0<Po.length&&(e=Po[0],e.blockedOn===null);)V2(e),e.blockedOn===null&&Po.shift()}var $u=lo.ReactCurrentBatchConfig,Om=!0;function RW(n,t,e,i){var s=ke,r=$u.transition;$u.transition=null;try{ke=1,rw(n,t,e,i)}finally{ke=s,$u.transition=r}}function EW(n,t,e,i){var s=ke,r=$u.transition;$u.transition=null;try{ke=4,rw(n,t,e,i)}finally{ke=s,$u.transition=r}}function rw(n,t,e,i){if(Om){var s=YS(n,t,e,i);if(s===null)gx(n,t,i,Lm,e),pC(n,i);else if(CW(s,n,t,e,i))i.stopPropagation();else if(pC(n,i),t&4&&-1<MW.indexOf(n)){for(;s!==null;){var r=xf(s);if(r!==null&&z2(r),r=YS(n,t,e,i),r===null&&gx(n,t,i,Lm,e),r===s)break;s=r}s!==null&&i.stopPropagation()}else gx(n,t,i,null,e)}}var Lm=null;function YS(n,t,e,i){if(Lm=null,n=ew(i),n=Dl(n),n!==null)if(t=Th(n),t===null)n=null;else if(e=t.tag,e===13){if(n=R2(t),n!==null)return n;n=null}else if(e===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;n=null}else t!==n&&(n=null);return Lm=n,null}function W2(n){switch(n){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(vW()){case iw:return 1;case L2:return 4;case Em:case yW:return 16;case I2:return 536870912;default:return 16}default:return 16}}var Lo=null,aw=null,om=null;function U2(){if(om)return om;var n,t=aw,e=t.length,i,s="value"in Lo?Lo.value:Lo.textContent,r=s.length;for(n=0;n<e&&t[n]===s[n];n++);var a=e-n;for(i=1;i<=a&&t[e-i]===s[r-i];i++);return om=s.slice(n,1<i?1-i:void 0)}function lm(n){var t=n.keyCode;return"charCode"in n?(n=n.charCode,n===0&&t===13&&(n=13)):n=t,n===10&&(n=13),32<=n||n===13?n:0}function a_(){return!0}function fC(){return!1}function fs(n){function t(e,i,s,r,a){this._reactName=e,this._targetInst=s,this.type=i,this.nativeEvent=r,this.target=a,this.currentTarget=null;for(var o in n)n.hasOwnProperty(o)&&(e=n[o],this[o]=e?e(r):r[o]);return this.isDefaultPrevented=(r.defaultPrevented!=null?r.defaultPrevented:r.returnValue===!1)?a_:fC,this.isPropagationStopped=fC,this}return ii(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():typeof e.returnValue!="unknown"&&(e.returnValue=!1),this.isDefaultPrevented=a_)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():typeof e.cancelBubble!="unknown"&&(e.cancelBubble=!0),this.isPropagationStopped=a_)},persist:function(){},isPersistent:a_}),t}var Yd={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(n){return n.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},ow=fs(Yd),bf=ii({},Yd,{view:0,detail:0}),BW=fs(bf),rx,ax,fc,gy=ii({},bf,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:lw,button:0,buttons:0,relatedTarget:function(n){return n.relatedTarget===void 0?n.fromElement===n.srcElement?n.toElement:n.fromElement:n.relatedTarget},movementX:function(n){return"movementX"in n?n.movementX:(n!==fc&&(fc&&n.type==="mousemove"?(rx=n.screenX-fc.screenX,ax=n.screenY-fc.screenY):ax=rx=0,fc=n),rx)},movementY:function(n){return"movementY"in n?n.movementY:ax}}),_C=fs(gy),OW=ii({},gy,{dataTransfer:0}),LW=fs(OW),IW=ii({},bf,{relatedTarget:0}),ox=fs(IW),DW=ii({},Yd,{animationName:0,elapsedTime:0,pseudoElement:0}),FW=fs(DW),zW=ii({},Yd,{clipboardData:function(n){return"clipboardData"in n?n.clipboardData:window.clipboardData}}),HW=fs(zW),jW=ii({},Yd,{data:0}),mC=fs(jW),NW={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},VW={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},WW={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function UW(n){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(n):(n=WW[n])?!!t[n]:!1}function lw(){return UW}var GW=ii({},bf,{key:function(n){if(n.key){var t=NW[n.key]||n.key;if(t!=="Unidentified")return t}return n.type==="keypress"?(n=lm(n),n===13?"Enter":String.fromCharCode(n)):n.type==="keydown"||n.type==="keyup"?VW[n.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:lw,charCode:function(n){return n.type==="keypress"?lm(n):0},keyCode:function(n){return n.type==="keydown"||n.type==="keyup"?n.keyCode:0},which:function(n){return n.type==="keypress"?lm(n):n.type==="keydown"||n.type==="keyup"?n.keyCode:0}}),$W=fs(GW),YW=ii({},gy,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),vC=fs(YW),XW=ii({},bf,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:lw}),KW=fs(XW),qW=ii({},Yd,{propertyName:0,elapsedTime:0,pseudoElement:0}),ZW=fs(qW),QW=ii({},gy,{deltaX:function(n){return"deltaX"in n?n.deltaX:"wheelDeltaX"in n?-n.wheelDeltaX:0},deltaY:function(n){return"deltaY"in n?n.deltaY:"wheelDeltaY"in n?-n.wheelDeltaY:"wheelDelta"in n?-n.wheelDelta:0},deltaZ:0,deltaMode:0}),JW=fs(QW),tU=[9,13,27,32],hw=Ja&&"CompositionEvent"in window,tp=null;Ja&&"documentMode"in document&&(tp=document.documentMode);var eU=Ja&&"TextEvent"in window&&!tp,G2=Ja&&(!hw||tp&&8<tp&&11>=tp),yC=" ",bC=!1;function $2(n,t){switch(n){case"keyup":return tU.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Y2(n){return n=n.detail,typeof n=="object"&&"data"in n?n.data:null}var ou=!1;function iU(n,t){switch(n){case"compositionend":return Y2(t);case"keypress":return t.which!==32?null:(bC=!0,yC);case"textInput":return n=t.data,n===yC&&bC?null:n;default:return null}}function nU(n,t){if(ou)return n==="compositionend"||!hw&&$2(n,t)?(n=U2(),om=aw=Lo=null,ou=!1,n):null;switch(n){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return G2&&t.locale!=="ko"?null:t.data;default:return null}}var sU={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function xC(n){var t=n&&n.nodeName&&n.nodeName.toLowerCase();return t==="input"?!!sU[n.type]:t==="textarea"}function X2(n,t,e,i){w2(i),t=Im(t,"onChange"),0<t.length&&(e=new ow("onChange","change",null,e,i),n.push({event:e,listeners:t}))}var ep=null,og=null;function rU(n){rD(n,0)}function fy(n){var t=uu(n);if(v2(t))return n}function aU(n,t){if(n==="change")return t}var K2=!1;if(Ja){var lx;if(Ja){var hx="oninput"in document;if(!hx){var SC=document.createElement("div");SC.setAttribute("oninput","return;"),hx=typeof SC.oninput=="function"}lx=hx}else lx=!1;K2=lx&&(!document.documentMode||9<document.documentMode)}function AC(){ep&&(ep.detachEvent("onpropertychange",q2),og=ep=null)}function q2(n){if(n.propertyName==="value"&&fy(og)){var t=[];X2(t,og,n,ew(n)),P2(rU,t)}}function oU(n,t,e){n==="focusin"?(AC(),ep=t,og=e,ep.attachEvent("onpropertychange",q2)):n==="focusout"&&AC()}function lU(n){if(n==="selectionchange"||n==="keyup"||n==="keydown")return fy(og)}function hU(n,t){if(n==="click")return fy(t)}function uU(n,t){if(n==="input"||n==="change")return fy(t)}function dU(n,t){return n===t&&(n!==0||1/n===1/t)||n!==n&&t!==t}var wr=typeof Object.is=="function"?Object.is:dU;function lg(n,t){if(wr(n,t))return!0;if(typeof n!="object"||n===null||typeof t!="object"||t===null)return!1;var e=Object.keys(n),i=Object.keys(t);if(e.length!==i.length)return!1;for(i=0;i<e.length;i++){var s=e[i];if(!PS.call(t,s)||!wr(n[s],t[s]))return!1}return!0}function kC(n){for(;n&&n.firstChild;)n=n.firstChild;return n}function wC(n,t){var e=kC(n);n=0;for(var i;e;){if(e.nodeType===3){if(i=n+e.textContent.length,n<=t&&i>=t)return{node:e,offset:t-n};n=i}t:{for(;e;){if(e.nextSibling){e=e.nextSibling;break t}e=e.parentNode}e=void 0}e=kC(e)}}function Z2(n,t){return n&&t?n===t?!0:n&&n.nodeType===3?!1:t&&t.nodeType===3?Z2(n,t.parentNode):"contains"in n?n.contains(t):n.compareDocumentPosition?!!(n.compareDocumentPosition(t)&16):!1:!1}function Q2(){for(var n=window,t=Cm();t instanceof n.HTMLIFrameElement;){try{var e=typeof t.contentWindow.location.href=="string"}catch{e=!1}if(e)n=t.contentWindow;else break;t=Cm(n.document)}return t}function uw(n){var t=n&&n.nodeName&&n.nodeName.toLowerCase();return t&&(t==="input"&&(n.type==="text"||n.type==="search"||n.type==="tel"||n.type==="url"||n.type==="password")||t==="textarea"||n.contentEditable==="true")}function cU(n){var t=Q2(),e=n.focusedElem,i=n.selectionRange;if(t!==e&&e&&e.ownerDocument&&Z2(e.ownerDocument.documentElement,e)){if(i!==null&&uw(e)){if(t=i.start,n=i.end,n===void 0&&(n=t),"selectionStart"in e)e.selectionStart=t,e.selectionEnd=Math.min(n,e.value.length);else if(n=(t=e.ownerDocument||document)&&t.defaultView||window,n.getSelection){n=n.getSelection();var s=e.textContent.length,r=Math.min(i.start,s);i=i.end===void 0?r:Math.min(i.end,s),!n.extend&&r>i&&(s=i,i=r,r=s),s=wC(e,r);var a=wC(e,i);s&&a&&(n.rangeCount!==1||n.anchorNode!==s.node||n.anchorOffset!==s.offset||n.focusNode!==a.node||n.focusOffset!==a.offset)&&(t=t.createRange(),t.setStart(s.node,s.offset),n.removeAllRanges(),r>i?(n.addRange(t),n.extend(a.node,a.offset)):(t.setEnd(a.node,a.offset),n.addRange(t)))}}for(t=[],n=e;n=n.parentNode;)n.nodeType===1&&t.push({element:n,left:n.scrollLeft,top:n.scrollTop});for(typeof e.focus=="function"&&e.focus(),e=0;e<t.length;e++)n=t[e],n.element.scrollLeft=n.left,n.element.scrollTop=n.top}}var pU=Ja&&"documentMode"in document&&11>=document.documentMode,lu=null,XS=null,ip=null,KS=!1;function TC(n,t,e){var i=e.window===e?e.document:e.nodeType===9?e:e.ownerDocument;KS||lu==null||lu!==Cm(i)||(i=lu,"selectionStart"in i&&uw(i)?i={start:i.selectionStart,end:i.selectionEnd}:(i=(i.ownerDocument&&i.ownerDocument.defaultView||window).getSelection(),i={anchorNode:i.anchorNode,anchorOffset:i.anchorOffset,focusNode:i.focusNode,focusOffset:i.focusOffset}),ip&&lg(ip,i)||(ip=i,i=Im(XS,"onSelect"),0<i.length&&(t=new ow("onSelect","select",null,t,e),n.push({event:t,listeners:i}),t.target=lu)))}function o_(n,t){var e={};return e[n.toLowerCase()]=t.toLowerCase(),e["Webkit"+n]="webkit"+t,e["Moz"+n]="moz"+t,e}var hu={animationend:o_("Animation","AnimationEnd"),animationiteration:o_("Animation","AnimationIteration"),animationstart:o_("Animation","AnimationStart"),transitionend:o_("Transition","TransitionEnd")},ux={},J2={};Ja&&(J2=document.createElement("div").style,"AnimationEvent"in window||(delete hu.animationend.animation,delete hu.animationiteration.animation,delete hu.animationstart.animation),"TransitionEvent"in window||delete hu.transitionend.transition);function _y(n){if(ux[n])return ux[n];if(!hu[n])return n;var t=hu[n],e;for(e in t)if(t.hasOwnProperty(e)&&e in J2)return ux[n]=t[e];return n}var tD=_y("animationend"),eD=_y("animationiteration"),iD=_y("animationstart"),nD=_y("transitionend"),sD=new Map,MC="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function hl(n,t){sD.set(n,t),wh(t,[n])}for(var dx=0;dx<MC.length;dx++){var cx=MC[dx],gU=cx.toLowerCase(),fU=cx[0].toUpperCase()+cx.slice(1);hl(gU,"on"+fU)}hl(tD,"onAnimationEnd");hl(eD,"onAnimationIteration");hl(iD,"onAnimationStart");hl("dblclick","onDoubleClick");hl("focusin","onFocus");hl("focusout","onBlur");hl(nD,"onTransitionEnd");pd("onMouseEnter",["mouseout","mouseover"]);pd("onMouseLeave",["mouseout","mouseover"]);pd("onPointerEnter",["pointerout","pointerover"]);pd("onPointerLeave",["pointerout","pointerover"]);wh("onChange","change click focusin focusout input keydown keyup selectionchange".split(" "));wh("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" "));wh("onBeforeInput",["compositionend","keypress","textInput","paste"]);wh("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" "));wh("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" "));wh("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var zc="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),_U=new Set("cancel close invalid load scroll toggle".split(" ").concat(zc));function CC(n,t,e){var i=n.type||"unknown-event";n.currentTarget=e,gW(i,t,void 0,n),n.currentTarget=null}function rD(n,t){t=(t&4)!==0;for(var e=0;e<n.length;e++){var i=n[e],s=i.event;i=i.listeners;t:{var r=void 0;if(t)for(var a=i.length-1;0<=a;a--){var o=i[a],l=o.instance,h=o.currentTarget;if(o=o.listener,l!==r&&s.isPropagationStopped())break t;CC(s,o,h),r=l}else for(a=0;a<i.length;a++){if(o=i[a],l=o.instance,h=o.currentTarget,o=o.listener,l!==r&&s.isPropagationStopped())break t;CC(s,o,h),r=l}}}if(Rm)throw n=US,Rm=!1,US=null,n}function ze(n,t){var e=t[t1];e===void 0&&(e=t[t1]=new Set);var i=n+"__bubble";e.has(i)||(aD(t,n,2,!1),e.add(i))}function px(n,t,e){var i=0;t&&(i|=4),aD(e,n,i,t)}var l_="_reactListening"+Math.random().toString(36).slice(2);function hg(n){if(!n[l_]){n[l_]=!0,p2.forEach(function(e){e!=="selectionchange"&&(_U.has(e)||px(e,!1,n),px(e,!0,n))});var t=n.nodeType===9?n:n.ownerDocument;t===null||t[l_]||(t[l_]=!0,px("selectionchange",!1,t))}}function aD(n,t,e,i){switch(W2(t)){case 1:var s=RW;break;case 4:s=EW;break;default:s=rw}e=s.bind(null,t,e,n),s=void 0,!WS||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(s=!0),i?s!==void 0?n.addEventListener(t,e,{capture:!0,passive:s}):n.addEventListener(t,e,!0):s!==void 0?n.addEventListener(t,e,{passive:s}):n.addEventListener(t,e,!1)}function gx(n,t,e,i,s){var r=i;if(!(t&1)&&!(t&2)&&i!==null)t:for(;;){if(i===null)return;var a=i.tag;if(a===3||a===4){var o=i.stateNode.containerInfo;if(o===s||o.nodeType===8&&o.parentNode===s)break;if(a===4)for(a=i.return;a!==null;){var l=a.tag;if((l===3||l===4)&&(l=a.stateNode.containerInfo,l===s||l.nodeType===8&&l.parentNode===s))return;a=a.return}for(;o!==null;){if(a=Dl(o),a===null)return;if(l=a.tag,l===5||l===6){i=r=a;continue t}o=o.parentNode}}i=i.return}P2(function(){var h=r,u=ew(e),d=[];t:{var c=sD.get(n);if(c!==void 0){var p=ow,g=n;switch(n){case"keypress":if(lm(e)===0)break t;case"keydown":case"keyup":p=$W;break;case"focusin":g="focus",p=ox;break;case"focusout":g="blur",p=ox;break;case"beforeblur":case"afterblur":p=ox;break;case"click":if(e.button===2)break t;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":p=_C;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":p=LW;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":p=KW;break;case tD:case eD:case iD:p=FW;break;case nD:p=ZW;break;case"scroll":p=BW;break;case"wheel":p=JW;break;case"copy":case"cut":case"paste":p=HW;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":p=vC}var f=(t&4)!==0,_=!f&&n==="scroll",m=f?c!==null?c+"Capture":null:c;f=[];for(var v=h,y;v!==null;){y=v;var b=y.stateNode;if(y.tag===5&&b!==null&&(y=b,m!==null&&(b=ng(v,m),b!=null&&f.push(ug(v,b,y)))),_)break;v=v.return}0<f.length&&(c=new p(c,g,null,e,u),d.push({event:c,listeners:f}))}}if(!(t&7)){t:{if(c=n==="mouseover"||n==="pointerover",p=n==="mouseout"||n==="pointerout",c&&e!==NS&&(g=e.relatedTarget||e.fromElement)&&(Dl(g)||g[to]))break t;if((p||c)&&(c=u.window===u?u:(c=u.ownerDocument)?c.defaultView||c.parentWindow:window,p?(g=e.relatedTarget||e.toElement,p=h,g=g?Dl(g):null,g!==null&&(_=Th(g),g!==_||g.tag!==5&&g.tag!==6)&&(g=null)):(p=null,g=h),p!==g)){if(f=_C,b="onMouseLeave",m="onMouseEnter",v="mouse",(n==="pointerout"||n==="pointerover")&&(f=vC,b="onPointerLeave",m="onPointerEnter",v="pointer"),_=p==null?c:uu(p),y=g==null?c:uu(g),c=new f(b,v+"leave",p,e,u),c.target=_,c.relatedTarget=y,b=null,Dl(u)===h&&(f=new f(m,v+"enter",g,e,u),f.target=y,f.relatedTarget=_,b=f),_=b,p&&g)e:{for(f=p,m=g,v=0,y=f;y;y=Fh(y))v++;for(y=0,b=m;b;b=Fh(b))y++;for(;0<v-y;)f=Fh(f),v--;for(;0<y-v;)m=Fh(m),y--;for(;v--;){if(f===m||m!==null&&f===m.alternate)break e;f=Fh(f),m=Fh(m)}f=null}else f=null;p!==null&&PC(d,c,p,f,!1),g!==null&&_!==null&&PC(d,_,g,f,!0)}}t:{if(c=h?uu(h):window,p=c.nodeName&&c.nodeName.toLowerCase(),p==="select"||p==="input"&&c.type==="file")var x=aU;else if(xC(c))if(K2)x=uU;else{x=lU;var S=oU}else(p=c.nodeName)&&p.toLowerCase()==="input"&&(c.type==="checkbox"||c.type==="radio")&&(x=hU);if(x&&(x=x(n,h))){X2(d,x,e,u);break t}S&&S(n,c,h),n==="focusout"&&(S=c._wrapperState)&&S.controlled&&c.type==="number"&&DS(c,"number",c.value)}switch(S=h?uu(h):window,n){case"focusin":(xC(S)||S.contentEditable==="true")&&(lu=S,XS=h,ip=null);break;case"focusout":ip=XS=lu=null;break;case"mousedown":KS=!0;break;case"contextmenu":case"mouseup":case"dragend":KS=!1,TC(d,e,u);break;case"selectionchange":if(pU)break;case"keydown":case"keyup":TC(d,e,u)}var k;if(hw)t:{switch(n){case"compositionstart":var A="onCompositionStart";break t;case"compositionend":A="onCompositionEnd";break t;case"compositionupdate":A="onCompositionUpdate";break t}A=void 0}else ou?$2(n,e)&&(A="onCompositionEnd"):n==="keydown"&&e.keyCode===229&&(A="onCompositionStart");A&&(G2&&e.locale!=="ko"&&(ou||A!=="onCompositionStart"?A==="onCompositionEnd"&&ou&&(k=U2()):(Lo=u,aw="value"in Lo?Lo.value:Lo.textContent,ou=!0)),S=Im(h,A),0<S.length&&(A=new mC(A,n,null,e,u),d.push({event:A,listeners:S}),k?A.data=k:(k=Y2(e),k!==null&&(A.data=k)))),(k=eU?iU(n,e):nU(n,e))&&(h=Im(h,"onBeforeInput"),0<h.length&&(u=new mC("onBeforeInput","beforeinput",null,e,u),d.push({event:u,listeners:h}),u.data=k))}rD(d,t)})}function ug(n,t,e){return{instance:n,listener:t,currentTarget:e}}function Im(n,t){for(var e=t+"Capture",i=[];n!==null;){var s=n,r=s.stateNode;s.tag===5&&r!==null&&(s=r,r=ng(n,e),r!=null&&i.unshift(ug(n,r,s)),r=ng(n,t),r!=null&&i.push(ug(n,r,s))),n=n.return}return i}function Fh(n){if(n===null)return null;do n=n.return;while(n&&n.tag!==5);return n||null}function PC(n,t,e,i,s){for(var r=t._reactName,a=[];e!==null&&e!==i;){var o=e,l=o.alternate,h=o.stateNode;if(l!==null&&l===i)break;o.tag===5&&h!==null&&(o=h,s?(l=ng(e,r),l!=null&&a.unshift(ug(e,l,o))):s||(l=ng(e,r),l!=null&&a.push(ug(e,l,o)))),e=e.return}a.length!==0&&n.push({event:t,listeners:a})}var mU=/\r\n?/g,vU=/\u0000|\uFFFD/g;function RC(n){return(typeof n=="string"?n:""+n).replace(mU,`
 `).replace(vU,"")}function h_(n,t,e){if(t=RC(t),RC(n)!==t&&e)throw Error(rt(425))}function Dm(){}var qS=null,ZS=null;function QS(n,t){return n==="textarea"||n==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var JS=typeof setTimeout=="function"?setTimeout:void 0,yU=typeof clearTimeout=="function"?clearTimeout:void 0,EC=typeof Promise=="function"?Promise:void 0,bU=typeof queueMicrotask=="function"?queueMicrotask:typeof EC<"u"?function(n){return EC.resolve(null).then(n).catch(xU)}:JS;function xU(n){setTimeout(function(){throw n})}function fx(n,t){var e=t,i=0;do{var s=e.nextSibling;if(n.removeChild(e),s&&s.nodeType===8)if(e=s.data,e==="/$"){if(i===0){n.removeChild(s),ag(t);return}i--}else e!=="$"&&e!=="$?"&&e!=="$!"||i++;e=s}while(e);ag(t)}function $o(n){for(;n!=null;n=n.nextSibling){var t=n.nodeType;if(t===1||t===3)break;if(t===8){if(t=n.data,t==="$"||t==="$!"||t==="$?")break;if(t==="/$")return null}}return n}function BC(n){n=n.previousSibling;for(var t=0;n;){if(n.nodeType===8){var e=n.data;if(e==="$"||e==="$!"||e==="$?"){if(t===0)return n;t--}else e==="/$"&&t++}n=n.previousSibling}return null}var Xd=Math.random().toString(36).slice(2),Ur="__reactFiber$"+Xd,dg="__reactProps$"+Xd,to="__reactContainer$"+Xd,t1="__reactEvents$"+Xd,SU="__reactListeners$"+Xd,AU="__reactHandles$"+Xd;function Dl(n){var t=n[Ur];if(t)return t;for(var e=n.parentNode;e;){if(t=e[to]||e[Ur]){if(e=t.alternate,t.child!==null||e!==null&&e.child!==null)for(n=BC(n);n!==null;){if(e=n[Ur])return e;n=BC(n)}return t}n=e,e=n.parentNode}return null}function xf(n){return n=n[Ur]||n[to],!n||n.tag!==5&&n.tag!==6&&n.tag!==13&&n.tag!==3?null:n}function uu(n){if(n.tag===5||n.tag===6)return n.stateNode;throw Error(rt(33))}function my(n){return n[dg]||null}var e1=[],du=-1;function ul(n){return{current:n}}function Ne(n){0>du||(n.current=e1[du],e1[du]=null,du--)}function Oe(n,t){du++,e1[du]=n.current,n.current=t}var tl={},fn=ul(tl),$n=ul(!1),lh=tl;function gd(n,t){var e=n.type.contextTypes;if(!e)return tl;var i=n.stateNode;if(i&&i.__reactInternalMemoizedUnmaskedChildContext===t)return i.__reactInternalMemoizedMaskedChildContext;var s={},r;for(r in e)s[r]=t[r];return i&&(n=n.stateNode,n.__reactInternalMemoizedUnmaskedChildContext=t,n.__reactInternalMemoizedMaskedChildContext=s),s}function Yn(n){return n=n.childContextTypes,n!=null}function Fm(){Ne($n),Ne(fn)}function OC(n,t,e){if(fn.current!==tl)throw Error(rt(168));Oe(fn,t),Oe($n,e)}function oD(n,t,e){var i=n.stateNode;if(t=t.childContextTypes,typeof i.getChildContext!="function")return e;i=i.getChildContext();for(var s in i)if(!(s in t))throw Error(rt(108,oW(n)||"Unknown",s));return ii({},e,i)}function zm(n){return n=(n=n.stateNode)&&n.__reactInternalMemoizedMergedChildContext||tl,lh=fn.current,Oe(fn,n),Oe($n,$n.current),!0}function LC(n,t,e){var i=n.stateNode;if(!i)throw Error(rt(169));e?(n=oD(n,t,lh),i.__reactInternalMemoizedMergedChildContext=n,Ne($n),Ne(fn),Oe(fn,n)):Ne($n),Oe($n,e)}var Pa=null,vy=!1,_x=!1;function lD(n){Pa===null?Pa=[n]:Pa.push(n)}function kU(n){vy=!0,lD(n)}function dl(){if(!_x&&Pa!==null){_x=!0;var n=0,t=ke;try{var e=Pa;for(ke=1;n<e.length;n++){var i=e[n];do i=i(!0);while(i!==null)}Pa=null,vy=!1}catch(s){throw Pa!==null&&(Pa=Pa.slice(n+1)),O2(iw,dl),s}finally{ke=t,_x=!1}}return null}var cu=[],pu=0,Hm=null,jm=0,Ps=[],Rs=0,hh=null,za=1,Ha="";function Pl(n,t){cu[pu++]=jm,cu[pu++]=Hm,Hm=n,jm=t}function hD(n,t,e){Ps[Rs++]=za,Ps[Rs++]=Ha,Ps[Rs++]=hh,hh=n;var i=za;n=Ha;var s=32-Sr(i)-1;i&=~(1<<s),e+=1;var r=32-Sr(t)+s;if(30<r){var a=s-s%5;r=(i&(1<<a)-1).toString(32),i>>=a,s-=a,za=1<<32-Sr(t)+s|e<<s|i,Ha=r+n}else za=1<<r|e<<s|i,Ha=n}function dw(n){n.return!==null&&(Pl(n,1),hD(n,1,0))}function cw(n){for(;n===Hm;)Hm=cu[--pu],cu[pu]=null,jm=cu[--pu],cu[pu]=null;for(;n===hh;)hh=Ps[--Rs],Ps[Rs]=null,Ha=Ps[--Rs],Ps[Rs]=null,za=Ps[--Rs],Ps[Rs]=null}var os=null,as=null,$e=!1,dr=null;function uD(n,t){var e=Fs(5,null,null,0);e.elementType="DELETED",e.stateNode=t,e.return=n,t=n.deletions,t===null?(n.deletions=[e],n.flags|=16):t.push(e)}function IC(n,t){switch(n.tag){case 5:var e=n.type;return t=t.nodeType!==1||e.toLowerCase()!==t.nodeName.toLowerCase()?null:t,t!==null?(n.stateNode=t,os=n,as=$o(t.firstChild),!0):!1;case 6:return t=n.pendingProps===""||t.nodeType!==3?null:t,t!==null?(n.stateNode=t,os=n,as=null,!0):!1;case 13:return t=t.nodeType!==8?null:t,t!==null?(e=hh!==null?{id:za,overflow:Ha}:null,n.memoizedState={dehydrated:t,treeContext:e,retryLane:1073741824},e=Fs(18,null,null,0),e.stateNode=t,e.return=n,n.child=e,os=n,as=null,!0):!1;default:return!1}}function i1(n){return(n.mode&1)!==0&&(n.flags&128)===0}function n1(n){if($e){var t=as;if(t){var e=t;if(!IC(n,t)){if(i1(n))throw Error(rt(418));t=$o(e.nextSibling);var i=os;t&&IC(n,t)?uD(i,e):(n.flags=n.flags&-4097|2,$e=!1,os=n)}}else{if(i1(n))throw Error(rt(418));n.flags=n.flags&-4097|2,$e=!1,os=n}}}function DC(n){for(n=n.return;n!==null&&n.tag!==5&&n.tag!==3&&n.tag!==13;)n=n.return;os=n}function u_(n){if(n!==os)return!1;if(!$e)return DC(n),$e=!0,!1;var t;if((t=n.tag!==3)&&!(t=n.tag!==5)&&(t=n.type,t=t!=="head"&&t!=="body"&&!QS(n.type,n.memoizedProps)),t&&(t=as)){if(i1(n))throw dD(),Error(rt(418));for(;t;)uD(n,t),t=$o(t.nextSibling)}if(DC(n),n.tag===13){if(n=n.memoizedState,n=n!==null?n.dehydrated:null,!n)throw Error(rt(317));t:{for(n=n.nextSibling,t=0;n;){if(n.nodeType===8){var e=n.data;if(e==="/$"){if(t===0){as=$o(n.nextSibling);break t}t--}else e!=="$"&&e!=="$!"&&e!=="$?"||t++}n=n.nextSibling}as=null}}else as=os?$o(n.stateNode.nextSibling):null;return!0}function dD(){for(var n=as;n;)n=$o(n.nextSibling)}function fd(){as=os=null,$e=!1}function pw(n){dr===null?dr=[n]:dr.push(n)}var wU=lo.ReactCurrentBatchConfig;function _c(n,t,e){if(n=e.ref,n!==null&&typeof n!="function"&&typeof n!="object"){if(e._owner){if(e=e._owner,e){if(e.tag!==1)throw Error(rt(309));var i=e.stateNode}if(!i)throw Error(rt(147,n));var s=i,r=""+n;return t!==null&&t.ref!==null&&typeof t.ref=="function"&&t.ref._stringRef===r?t.ref:(t=function(a){var o=s.refs;a===null?delete o[r]:o[r]=a},t._stringRef=r,t)}if(typeof n!="string")throw Error(rt(284));if(!e._owner)throw Error(rt(290,n))}return n}function d_(n,t){throw n=Object.prototype.toString.call(t),Error(rt(31,n==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":n))}function FC(n){var t=n._init;return t(n._payload)}function cD(n){function t(m,v){if(n){var y=m.deletions;y===null?(m.deletions=[v],m.flags|=16):y.push(v)}}function e(m,v){if(!n)return null;for(;v!==null;)t(m,v),v=v.sibling;return null}function i(m,v){for(m=new Map;v!==null;)v.key!==null?m.set(v.key,v):m.set(v.index,v),v=v.sibling;return m}function s(m,v){return m=qo(m,v),m.index=0,m.sibling=null,m}function r(m,v,y){return m.index=y,n?(y=m.alternate,y!==null?(y=y.index,y<v?(m.flags|=2,v):y):(m.flags|=2,v)):(m.flags|=1048576,v)}function a(m){return n&&m.alternate===null&&(m.flags|=2),m}function o(m,v,y,b){return v===null||v.tag!==6?(v=Ax(y,m.mode,b),v.return=m,v):(v=s(v,y),v.return=m,v)}function l(m,v,y,b){var x=y.type;return x===au?u(m,v,y.props.children,b,y.key):v!==null&&(v.elementType===x||typeof x=="object"&&x!==null&&x.$$typeof===Ao&&FC(x)===v.type)?(b=s(v,y.props),b.ref=_c(m,v,y),b.return=m,b):(b=fm(y.type,y.key,y.props,null,m.mode,b),b.ref=_c(m,v,y),b.return=m,b)}function h(m,v,y,b){return v===null||v.tag!==4||v.stateNode.containerInfo!==y.containerInfo||v.stateNode.implementation!==y.implementation?(v=kx(y,m.mode,b),v.return=m,v):(v=s(v,y.children||[]),v.return=m,v)}function u(m,v,y,b,x){return v===null||v.tag!==7?(v=Zl(y,m.mode,b,x),v.return=m,v):(v=s(v,y),v.return=m,v)}function d(m,v,y){if(typeof v=="string"&&v!==""||typeof v=="number")return v=Ax(""+v,m.mode,y),v.return=m,v;if(typeof v=="object"&&v!==null){switch(v.$$typeof){case t_:return y=fm(v.type,v.key,v.props,null,m.mode,y),y.ref=_c(m,null,v),y.return=m,y;case ru:return v=kx(v,m.mode,y),v.return=m,v;case Ao:var b=v._init;return d(m,b(v._payload),y)}if(Dc(v)||dc(v))return v=Zl(v,m.mode,y,null),v.return=m,v;d_(m,v)}return null}function c(m,v,y,b){var x=v!==null?v.key:null;if(typeof y=="string"&&y!==""||typeof y=="number")return x!==null?null:o(m,v,""+y,b);if(typeof y=="object"&&y!==null){switch(y.$$typeof){case t_:return y.key===x?l(m,v,y,b):null;case ru:return y.key===x?h(m,v,y,b):null;case Ao:return x=y._init,c(m,v,x(y._payload),b)}if(Dc(y)||dc(y))return x!==null?null:u(m,v,y,b,null);d_(m,y)}return null}function p(m,v,y,b,x){if(typeof b=="string"&&b!==""||typeof b=="number")return m=m.get(y)||null,o(v,m,""+b,x);if(typeof b=="object"&&b!==null){switch(b.$$typeof){case t_:return m=m.get(b.key===null?y:b.key)||null,l(v,m,b,x);case ru:return m=m.get(b.key===null?y:b.key)||null,h(v,m,b,x);case Ao:var S=b._init;return p(m,v,y,S(b._payload),x)}if(Dc(b)||dc(b))return m=m.get(y)||null,u(v,m,b,x,null);d_(v,b)}return null}function g(m,v,y,b){for(var x=null,S=null,k=v,A=v=0,w=null;k!==null&&A<y.length;A++){k.index>A?(w=k,k=null):w=k.sibling;var T=c(m,k,y[A],b);if(T===null){k===null&&(k=w);break}n&&k&&T.alternate===null&&t(m,k),v=r(T,v,A),S===null?x=T:S.sibling=T,S=T,k=w}if(A===y.length)return e(m,k),$e&&Pl(m,A),x;if(k===null){for(;A<y.length;A++)k=d(m,y[A],b),k!==null&&(v=r(k,v,A),S===null?x=k:S.sibling=k,S=k);return $e&&Pl(m,A),x}for(k=i(m,k);A<y.length;A++)w=p(k,m,A,y[A],b),w!==null&&(n&&w.alternate!==null&&k.delete(w.key===null?A:w.key),v=r(w,v,A),S===null?x=w:S.sibling=w,S=w);return n&&k.forEach(function(M){return t(m,M)}),$e&&Pl(m,A),x}function f(m,v,y,b){var x=dc(y);if(typeof x!="function")throw Error(rt(150));if(y=x.call(y),y==null)throw Error(rt(151));for(var S=x=null,k=v,A=v=0,w=null,T=y.next();k!==null&&!T.done;A++,T=y.next()){k.index>A?(w=k,k=null):w=k.sibling;var M=c(m,k,T.value,b);if(M===null){k===null&&(k=w);break}n&&k&&M.alternate===null&&t(m,k),v=r(M,v,A),S===null?x=M:S.sibling=M,S=M,k=w}if(T.done)return e(m,k),$e&&Pl(m,A),x;if(k===null){for(;!T.done;A++,T=y.next())T=d(m,T.value,b),T!==null&&(v=r(T,v,A),S===null?x=T:S.sibling=T,S=T);return $e&&Pl(m,A),x}for(k=i(m,k);!T.done;A++,T=y.next())T=p(k,m,A,T.value,b),T!==null&&(n&&T.alternate!==null&&k.delete(T.key===null?A:T.key),v=r(T,v,A),S===null?x=T:S.sibling=T,S=T);return n&&k.forEach(function(E){return t(m,E)}),$e&&Pl(m,A),x}function _(m,v,y,b){if(typeof y=="object"&&y!==null&&y.type===au&&y.key===null&&(y=y.props.children),typeof y=="object"&&y!==null){switch(y.$$typeof){case t_:t:{for(var x=y.key,S=v;S!==null;){if(S.key===x){if(x=y.type,x===au){if(S.tag===7){e(m,S.sibling),v=s(S,y.props.children),v.return=m,m=v;break t}}else if(S.elementType===x||typeof x=="object"&&x!==null&&x.$$typeof===Ao&&FC(x)===S.type){e(m,S.sibling),v=s(S,y.props),v.ref=_c(m,S,y),v.return=m,m=v;break t}e(m,S);break}else t(m,S);S=S.sibling}y.type===au?(v=Zl(y.props.children,m.mode,b,y.key),v.return=m,m=v):(b=fm(y.type,y.key,y.props,null,m.mode,b),b.ref=_c(m,v,y),b.return=m,m=b)}return a(m);case ru:t:{for(S=y.key;v!==null;){if(v.key===S)if(v.tag===4&&v.stateNode.containerInfo===y.containerInfo&&v.stateNode.implementation===y.implementation){e(m,v.sibling),v=s(v,y.children||[]),v.return=m,m=v;break t}else{e(m,v);break}else t(m,v);v=v.sibling}v=kx(y,m.mode,b),v.return=m,m=v}return a(m);case Ao:return S=y._init,_(m,v,S(y._payload),b)}if(Dc(y))return g(m,v,y,b);if(dc(y))return f(m,v,y,b);d_(m,y)}return typeof y=="string"&&y!==""||typeof y=="number"?(y=""+y,v!==null&&v.tag===6?(e(m,v.sibling),v=s(v,y),v.return=m,m=v):(e(m,v),v=Ax(y,m.mode,b),v.return=m,m=v),a(m)):e(m,v)}return _}var _d=cD(!0),pD=cD(!1),Nm=ul(null),Vm=null,gu=null,gw=null;function fw(){gw=gu=Vm=null}function _w(n){var t=Nm.current;Ne(Nm),n._currentValue=t}function s1(n,t,e){for(;n!==null;){var i=n.alternate;if((n.childLanes&t)!==t?(n.childLanes|=t,i!==null&&(i.childLanes|=t)):i!==null&&(i.childLanes&t)!==t&&(i.childLanes|=t),n===e)break;n=n.return}}function Yu(n,t){Vm=n,gw=gu=null,n=n.dependencies,n!==null&&n.firstContext!==null&&(n.lanes&t&&(Un=!0),n.firstContext=null)}function Us(n){var t=n._currentValue;if(gw!==n)if(n={context:n,memoizedValue:t,next:null},gu===null){if(Vm===null)throw Error(rt(308));gu=n,Vm.dependencies={lanes:0,firstContext:n}}else gu=gu.next=n;return t}var Fl=null;function mw(n){Fl===null?Fl=[n]:Fl.push(n)}function gD(n,t,e,i){var s=t.interleaved;return s===null?(e.next=e,mw(t)):(e.next=s.next,s.next=e),t.interleaved=e,eo(n,i)}function eo(n,t){n.lanes|=t;var e=n.alternate;for(e!==null&&(e.lanes|=t),e=n,n=n.return;n!==null;)n.childLanes|=t,e=n.alternate,e!==null&&(e.childLanes|=t),e=n,n=n.return;return e.tag===3?e.stateNode:null}var ko=!1;function vw(n){n.updateQueue={baseState:n.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function fD(n,t){n=n.updateQueue,t.updateQueue===n&&(t.updateQueue={baseState:n.baseState,firstBaseUpdate:n.firstBaseUpdate,lastBaseUpdate:n.lastBaseUpdate,shared:n.shared,effects:n.effects})}function qa(n,t){return{eventTime:n,lane:t,tag:0,payload:null,callback:null,next:null}}function Yo(n,t,e){var i=n.updateQueue;if(i===null)return null;if(i=i.shared,ce&2){var s=i.pending;return s===null?t.next=t:(t.next=s.next,s.next=t),i.pending=t,eo(n,e)}return s=i.interleaved,s===null?(t.next=t,mw(i)):(t.next=s.next,s.next=t),i.interleaved=t,eo(n,e)}function hm(n,t,e){if(t=t.updateQueue,t!==null&&(t=t.shared,(e&4194240)!==0)){var i=t.lanes;i&=n.pendingLanes,e|=i,t.lanes=e,nw(n,e)}}function zC(n,t){var e=n.updateQueue,i=n.alternate;if(i!==null&&(i=i.updateQueue,e===i)){var s=null,r=null;if(e=e.firstBaseUpdate,e!==null){do{var a={eventTime:e.eventTime,lane:e.lane,tag:e.tag,payload:e.payload,callback:e.callback,next:null};r===null?s=r=a:r=r.next=a,e=e.next}while(e!==null);r===null?s=r=t:r=r.next=t}else s=r=t;e={baseState:i.baseState,firstBaseUpdate:s,lastBaseUpdate:r,shared:i.shared,effects:i.effects},n.updateQueue=e;return}n=e.lastBaseUpdate,n===null?e.firstBaseUpdate=t:n.next=t,e.lastBaseUpdate=t}function Wm(n,t,e,i){var s=n.updateQueue;ko=!1;var r=s.firstBaseUpdate,a=s.lastBaseUpdate,o=s.shared.pending;if(o!==null){s.shared.pending=null;var l=o,h=l.next;l.next=null,a===null?r=h:a.next=h,a=l;var u=n.alternate;u!==null&&(u=u.updateQueue,o=u.lastBaseUpdate,o!==a&&(o===null?u.firstBaseUpdate=h:o.next=h,u.lastBaseUpdate=l))}if(r!==null){var d=s.baseState;a=0,u=h=l=null,o=r;do{var c=o.lane,p=o.eventTime;if((i&c)===c){u!==null&&(u=u.next={eventTime:p,lane:0,tag:o.tag,payload:o.payload,callback:o.callback,next:null});t:{var g=n,f=o;switch(c=t,p=e,f.tag){case 1:if(g=f.payload,typeof g=="function"){d=g.call(p,d,c);break t}d=g;break t;case 3:g.flags=g.flags&-65537|128;case 0:if(g=f.payload,c=typeof g=="function"?g.call(p,d,c):g,c==null)break t;d=ii({},d,c);break t;case 2:ko=!0}}o.callback!==null&&o.lane!==0&&(n.flags|=64,c=s.effects,c===null?s.effects=[o]:c.push(o))}else p={eventTime:p,lane:c,tag:o.tag,payload:o.payload,callback:o.callback,next:null},u===null?(h=u=p,l=d):u=u.next=p,a|=c;if(o=o.next,o===null){if(o=s.shared.pending,o===null)break;c=o,o=c.next,c.next=null,s.lastBaseUpdate=c,s.shared.pending=null}}while(!0);if(u===null&&(l=d),s.baseState=l,s.firstBaseUpdate=h,s.lastBaseUpdate=u,t=s.shared.interleaved,t!==null){s=t;do a|=s.lane,s=s.next;while(s!==t)}else r===null&&(s.shared.lanes=0);dh|=a,n.lanes=a,n.memoizedState=d}}function HC(n,t,e){if(n=t.effects,t.effects=null,n!==null)for(t=0;t<n.length;t++){var i=n[t],s=i.callback;if(s!==null){if(i.callback=null,i=e,typeof s!="function")throw Error(rt(191,s));s.call(i)}}}var Sf={},oa=ul(Sf),cg=ul(Sf),pg=ul(Sf);function zl(n){if(n===Sf)throw Error(rt(174));return n}function yw(n,t){switch(Oe(pg,t),Oe(cg,n),Oe(oa,Sf),n=t.nodeType,n){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:zS(null,"");break;default:n=n===8?t.parentNode:t,t=n.namespaceURI||null,n=n.tagName,t=zS(t,n)}Ne(oa),Oe(oa,t)}function md(){Ne(oa),Ne(cg),Ne(pg)}function _D(n){zl(pg.current);var t=zl(oa.current),e=zS(t,n.type);t!==e&&(Oe(cg,n),Oe(oa,e))}function bw(n){cg.current===n&&(Ne(oa),Ne(cg))}var Qe=ul(0);function Um(n){for(var t=n;t!==null;){if(t.tag===13){var e=t.memoizedState;if(e!==null&&(e=e.dehydrated,e===null||e.data==="$?"||e.data==="$!"))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if(t.flags&128)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===n)break;for(;t.sibling===null;){if(t.return===null||t.return===n)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var mx=[];function xw(){for(var n=0;n<mx.length;n++)mx[n]._workInProgressVersionPrimary=null;mx.length=0}var um=lo.ReactCurrentDispatcher,vx=lo.ReactCurrentBatchConfig,uh=0,ti=null,Li=null,Hi=null,Gm=!1,np=!1,gg=0,TU=0;function an(){throw Error(rt(321))}function Sw(n,t){if(t===null)return!1;for(var e=0;e<t.length&&e<n.length;e++)if(!wr(n[e],t[e]))return!1;return!0}function Aw(n,t,e,i,s,r){if(uh=r,ti=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,um.current=n===null||n.memoizedState===null?RU:EU,n=e(i,s),np){r=0;do{if(np=!1,gg=0,25<=r)throw Error(rt(301));r+=1,Hi=Li=null,t.updateQueue=null,um.current=BU,n=e(i,s)}while(np)}if(um.current=$m,t=Li!==null&&Li.next!==null,uh=0,Hi=Li=ti=null,Gm=!1,t)throw Error(rt(300));return n}function kw(){var n=gg!==0;return gg=0,n}function Dr(){var n={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Hi===null?ti.memoizedState=Hi=n:Hi=Hi.next=n,Hi}function Gs(){if(Li===null){var n=ti.alternate;n=n!==null?n.memoizedState:null}else n=Li.next;var t=Hi===null?ti.memoizedState:Hi.next;if(t!==null)Hi=t,Li=n;else{if(n===null)throw Error(rt(310));Li=n,n={memoizedState:Li.memoizedState,baseState:Li.baseState,baseQueue:Li.baseQueue,queue:Li.queue,next:null},Hi===null?ti.memoizedState=Hi=n:Hi=Hi.next=n}return Hi}function fg(n,t){return typeof t=="function"?t(n):t}function yx(n){var t=Gs(),e=t.queue;if(e===null)throw Error(rt(311));e.lastRenderedReducer=n;var i=Li,s=i.baseQueue,r=e.pending;if(r!==null){if(s!==null){var a=s.next;s.next=r.next,r.next=a}i.baseQueue=s=r,e.pending=null}if(s!==null){r=s.next,i=i.baseState;var o=a=null,l=null,h=r;do{var u=h.lane;if((uh&u)===u)l!==null&&(l=l.next={lane:0,action:h.action,hasEagerState:h.hasEagerState,eagerState:h.eagerState,next:null}),i=h.hasEagerState?h.eagerState:n(i,h.action);else{var d={lane:u,action:h.action,hasEagerState:h.hasEagerState,eagerState:h.eagerState,next:null};l===null?(o=l=d,a=i):l=l.next=d,ti.lanes|=u,dh|=u}h=h.next}while(h!==null&&h!==r);l===null?a=i:l.next=o,wr(i,t.memoizedState)||(Un=!0),t.memoizedState=i,t.baseState=a,t.baseQueue=l,e.lastRenderedState=i}if(n=e.interleaved,n!==null){s=n;do r=s.lane,ti.lanes|=r,dh|=r,s=s.next;while(s!==n)}else s===null&&(e.lanes=0);return[t.memoizedState,e.dispatch]}function bx(n){var t=Gs(),e=t.queue;if(e===null)throw Error(rt(311));e.lastRenderedReducer=n;var i=e.dispatch,s=e.pending,r=t.memoizedState;if(s!==null){e.pending=null;var a=s=s.next;do r=n(r,a.action),a=a.next;while(a!==s);wr(r,t.memoizedState)||(Un=!0),t.memoizedState=r,t.baseQueue===null&&(t.baseState=r),e.lastRenderedState=r}return[r,i]}function mD(){}function vD(n,t){var e=ti,i=Gs(),s=t(),r=!wr(i.memoizedState,s);if(r&&(i.memoizedState=s,Un=!0),i=i.queue,ww(xD.bind(null,e,i,n),[n]),i.getSnapshot!==t||r||Hi!==null&&Hi.memoizedState.tag&1){if(e.flags|=2048,_g(9,bD.bind(null,e,i,s,t),void 0,null),Ui===null)throw Error(rt(349));uh&30||yD(e,t,s)}return s}function yD(n,t,e){n.flags|=16384,n={getSnapshot:t,value:e},t=ti.updateQueue,t===null?(t={lastEffect:null,stores:null},ti.updateQueue=t,t.stores=[n]):(e=t.stores,e===null?t.stores=[n]:e.push(n))}function bD(n,t,e,i){t.value=e,t.getSnapshot=i,SD(t)&&AD(n)}function xD(n,t,e){return e(function(){SD(t)&&AD(n)})}function SD(n){var t=n.getSnapshot;n=n.value;try{var e=t();return!wr(n,e)}catch{return!0}}function AD(n){var t=eo(n,1);t!==null&&Ar(t,n,1,-1)}function jC(n){var t=Dr();return typeof n=="function"&&(n=n()),t.memoizedState=t.baseState=n,n={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:fg,lastRenderedState:n},t.queue=n,n=n.dispatch=PU.bind(null,ti,n),[t.memoizedState,n]}function _g(n,t,e,i){return n={tag:n,create:t,destroy:e,deps:i,next:null},t=ti.updateQueue,t===null?(t={lastEffect:null,stores:null},ti.updateQueue=t,t.lastEffect=n.next=n):(e=t.lastEffect,e===null?t.lastEffect=n.next=n:(i=e.next,e.next=n,n.next=i,t.lastEffect=n)),n}function kD(){return Gs().memoizedState}function dm(n,t,e,i){var s=Dr();ti.flags|=n,s.memoizedState=_g(1|t,e,void 0,i===void 0?null:i)}function yy(n,t,e,i){var s=Gs();i=i===void 0?null:i;var r=void 0;if(Li!==null){var a=Li.memoizedState;if(r=a.destroy,i!==null&&Sw(i,a.deps)){s.memoizedState=_g(t,e,r,i);return}}ti.flags|=n,s.memoizedState=_g(1|t,e,r,i)}function NC(n,t){return dm(8390656,8,n,t)}function ww(n,t){return yy(2048,8,n,t)}function wD(n,t){return yy(4,2,n,t)}function TD(n,t){return yy(4,4,n,t)}function MD(n,t){if(typeof t=="function")return n=n(),t(n),function(){t(null)};if(t!=null)return n=n(),t.current=n,function(){t.current=null}}function CD(n,t,e){return e=e!=null?e.concat([n]):null,yy(4,4,MD.bind(null,t,n),e)}function Tw(){}function PD(n,t){var e=Gs();t=t===void 0?null:t;var i=e.memoizedState;return i!==null&&t!==null&&Sw(t,i[1])?i[0]:(e.memoizedState=[n,t],n)}function RD(n,t){var e=Gs();t=t===void 0?null:t;var i=e.memoizedState;return i!==null&&t!==null&&Sw(t,i[1])?i[0]:(n=n(),e.memoizedState=[n,t],n)}function ED(n,t,e){return uh&21?(wr(e,t)||(e=D2(),ti.lanes|=e,dh|=e,n.baseState=!0),t):(n.baseState&&(n.baseState=!1,Un=!0),n.memoizedState=e)}function MU(n,t){var e=ke;ke=e!==0&&4>e?e:4,n(!0);var i=vx.transition;vx.transition={};try{n(!1),t()}finally{ke=e,vx.transition=i}}function BD(){return Gs().memoizedState}function CU(n,t,e){var i=Ko(n);if(e={lane:i,action:e,hasEagerState:!1,eagerState:null,next:null},OD(n))LD(t,e);else if(e=gD(n,t,e,i),e!==null){var s=wn();Ar(e,n,i,s),ID(e,t,i)}}function PU(n,t,e){var i=Ko(n),s={lane:i,action:e,hasEagerState:!1,eagerState:null,next:null};if(OD(n))LD(t,s);else{var r=n.alternate;if(n.lanes===0&&(r===null||r.lanes===0)&&(r=t.lastRenderedReducer,r!==null))try{var a=t.lastRenderedState,o=r(a,e);if(s.hasEagerState=!0,s.eagerState=o,wr(o,a)){var l=t.interleaved;l===null?(s.next=s,mw(t)):(s.next=l.next,l.next=s),t.interleaved=s;return}}catch{}finally{}e=gD(n,t,s,i),e!==null&&(s=wn(),Ar(e,n,i,s),ID(e,t,i))}}function OD(n){var t=n.alternate;return n===ti||t!==null&&t===ti}function LD(n,t){np=Gm=!0;var e=n.pending;e===null?t.next=t:(t.next=e.next,e.next=t),n.pending=t}function ID(n,t,e){if(e&4194240){var i=t.lanes;i&=n.pendingLanes,e|=i,t.lanes=e,nw(n,e)}}var $m={readContext:Us,useCallback:an,useContext:an,useEffect:an,useImperativeHandle:an,useInsertionEffect:an,useLayoutEffect:an,useMemo:an,useReducer:an,useRef:an,useState:an,useDebugValue:an,useDeferredValue:an,useTransition:an,useMutableSource:an,useSyncExternalStore:an,useId:an,unstable_isNewReconciler:!1},RU={readContext:Us,useCallback:function(n,t){return Dr().memoizedState=[n,t===void 0?null:t],n},useContext:Us,useEffect:NC,useImperativeHandle:function(n,t,e){return e=e!=null?e.concat([n]):null,dm(4194308,4,MD.bind(null,t,n),e)},useLayoutEffect:function(n,t){return dm(4194308,4,n,t)},useInsertionEffect:function(n,t){return dm(4,2,n,t)},useMemo:function(n,t){var e=Dr();return t=t===void 0?null:t,n=n(),e.memoizedState=[n,t],n},useReducer:function(n,t,e){var i=Dr();return t=e!==void 0?e(t):t,i.memoizedState=i.baseState=t,n={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:n,lastRenderedState:t},i.queue=n,n=n.dispatch=CU.bind(null,ti,n),[i.memoizedState,n]},useRef:function(n){var t=Dr();return n={current:n},t.memoizedState=n},useState:jC,useDebugValue:Tw,useDeferredValue:function(n){return Dr().memoizedState=n},useTransition:function(){var n=jC(!1),t=n[0];return n=MU.bind(null,n[1]),Dr().memoizedState=n,[t,n]},useMutableSource:function(){},useSyncExternalStore:function(n,t,e){var i=ti,s=Dr();if($e){if(e===void 0)throw Error(rt(407));e=e()}else{if(e=t(),Ui===null)throw Error(rt(349));uh&30||yD(i,t,e)}s.memoizedState=e;var r={value:e,getSnapshot:t};return s.queue=r,NC(xD.bind(null,i,r,n),[n]),i.flags|=2048,_g(9,bD.bind(null,i,r,e,t),void 0,null),e},useId:function(){var n=Dr(),t=Ui.identifierPrefix;if($e){var e=Ha,i=za;e=(i&~(1<<32-Sr(i)-1)).toString(32)+e,t=":"+t+"R"+e,e=gg++,0<e&&(t+="H"+e.toString(32)),t+=":"}else e=TU++,t=":"+t+"r"+e.toString(32)+":";return n.memoizedState=t},unstable_isNewReconciler:!1},EU={readContext:Us,useCallback:PD,useContext:Us,useEffect:ww,useImperativeHandle:CD,useInsertionEffect:wD,useLayoutEffect:TD,useMemo:RD,useReducer:yx,useRef:kD,useState:function(){return yx(fg)},useDebugValue:Tw,useDeferredValue:function(n){var t=Gs();return ED(t,Li.memoizedState,n)},useTransition:function(){var n=yx(fg)[0],t=Gs().memoizedState;return[n,t]},useMutableSource:mD,useSyncExternalStore:vD,useId:BD,unstable_isNewReconciler:!1},BU={readContext:Us,useCallback:PD,useContext:Us,useEffect:ww,useImperativeHandle:CD,useInsertionEffect:wD,useLayoutEffect:TD,useMemo:RD,useReducer:bx,useRef:kD,useState:function(){return bx(fg)},useDebugValue:Tw,useDeferredValue:function(n){var t=Gs();return Li===null?t.memoizedState=n:ED(t,Li.memoizedState,n)},useTransition:function(){var n=bx(fg)[0],t=Gs().memoizedState;return[n,t]},useMutableSource:mD,useSyncExternalStore:vD,useId:BD,unstable_isNewReconciler:!1};function or(n,t){if(n&&n.defaultProps){t=ii({},t),n=n.defaultProps;for(var e in n)t[e]===void 0&&(t[e]=n[e]);return t}return t}function r1(n,t,e,i){t=n.memoizedState,e=e(i,t),e=e==null?t:ii({},t,e),n.memoizedState=e,n.lanes===0&&(n.updateQueue.baseState=e)}var by={isMounted:function(n){return(n=n._reactInternals)?Th(n)===n:!1},enqueueSetState:function(n,t,e){n=n._reactInternals;var i=wn(),s=Ko(n),r=qa(i,s);r.payload=t,e!=null&&(r.callback=e),t=Yo(n,r,s),t!==null&&(Ar(t,n,s,i),hm(t,n,s))},enqueueReplaceState:function(n,t,e){n=n._reactInternals;var i=wn(),s=Ko(n),r=qa(i,s);r.tag=1,r.payload=t,e!=null&&(r.callback=e),t=Yo(n,r,s),t!==null&&(Ar(t,n,s,i),hm(t,n,s))},enqueueForceUpdate:function(n,t){n=n._reactInternals;var e=wn(),i=Ko(n),s=qa(e,i);s.tag=2,t!=null&&(s.callback=t),t=Yo(n,s,i),t!==null&&(Ar(t,n,i,e),hm(t,n,i))}};function VC(n,t,e,i,s,r,a){return n=n.stateNode,typeof n.shouldComponentUpdate=="function"?n.shouldComponentUpdate(i,r,a):t.prototype&&t.prototype.isPureReactComponent?!lg(e,i)||!lg(s,r):!0}function DD(n,t,e){var i=!1,s=tl,r=t.contextType;return typeof r=="object"&&r!==null?r=Us(r):(s=Yn(t)?lh:fn.current,i=t.contextTypes,r=(i=i!=null)?gd(n,s):tl),t=new t(e,r),n.memoizedState=t.state!==null&&t.state!==void 0?t.state:null,t.updater=by,n.stateNode=t,t._reactInternals=n,i&&(n=n.stateNode,n.__reactInternalMemoizedUnmaskedChildContext=s,n.__reactInternalMemoizedMaskedChildContext=r),t}function WC(n,t,e,i){n=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(e,i),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(e,i),t.state!==n&&by.enqueueReplaceState(t,t.state,null)}function a1(n,t,e,i){var s=n.stateNode;s.props=e,s.state=n.memoizedState,s.refs={},vw(n);var r=t.contextType;typeof r=="object"&&r!==null?s.context=Us(r):(r=Yn(t)?lh:fn.current,s.context=gd(n,r)),s.state=n.memoizedState,r=t.getDerivedStateFromProps,typeof r=="function"&&(r1(n,t,r,e),s.state=n.memoizedState),typeof t.getDerivedStateFromProps=="function"||typeof s.getSnapshotBeforeUpdate=="function"||typeof s.UNSAFE_componentWillMount!="function"&&typeof s.componentWillMount!="function"||(t=s.state,typeof s.componentWillMount=="function"&&s.componentWillMount(),typeof s.UNSAFE_componentWillMount=="function"&&s.UNSAFE_componentWillMount(),t!==s.state&&by.enqueueReplaceState(s,s.state,null),Wm(n,e,s,i),s.state=n.memoizedState),typeof s.componentDidMount=="function"&&(n.flags|=4194308)}function vd(n,t){try{var e="",i=t;do e+=aW(i),i=i.return;while(i);var s=e}catch(r){s=`
 Error generating stack: `+r.message+`
-`+r.stack}return{value:n,source:t,stack:s,digest:null}}function xx(n,t,e){return{value:n,source:null,stack:e??null,digest:t??null}}function o1(n,t){try{console.error(t.value)}catch(e){setTimeout(function(){throw e})}}var OU=typeof WeakMap=="function"?WeakMap:Map;function FD(n,t,e){e=qa(-1,e),e.tag=3,e.payload={element:null};var i=t.value;return e.callback=function(){Xm||(Xm=!0,m1=i),o1(n,t)},e}function zD(n,t,e){e=qa(-1,e),e.tag=3;var i=n.type.getDerivedStateFromError;if(typeof i=="function"){var s=t.value;e.payload=function(){return i(s)},e.callback=function(){o1(n,t)}}var r=n.stateNode;return r!==null&&typeof r.componentDidCatch=="function"&&(e.callback=function(){o1(n,t),typeof i!="function"&&(Xo===null?Xo=new Set([this]):Xo.add(this));var a=t.stack;this.componentDidCatch(t.value,{componentStack:a!==null?a:""})}),e}function UC(n,t,e){var i=n.pingCache;if(i===null){i=n.pingCache=new OU;var s=new Set;i.set(t,s)}else s=i.get(t),s===void 0&&(s=new Set,i.set(t,s));s.has(e)||(s.add(e),n=YU.bind(null,n,t,e),t.then(n,n))}function GC(n){do{var t;if((t=n.tag===13)&&(t=n.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return n;n=n.return}while(n!==null);return null}function $C(n,t,e,i,s){return n.mode&1?(n.flags|=65536,n.lanes=s,n):(n===t?n.flags|=65536:(n.flags|=128,e.flags|=131072,e.flags&=-52805,e.tag===1&&(e.alternate===null?e.tag=17:(t=qa(-1,1),t.tag=2,Yo(e,t,1))),e.lanes|=1),n)}var LU=lo.ReactCurrentOwner,Un=!1;function xn(n,t,e,i){t.child=n===null?pD(t,null,e,i):_d(t,n.child,e,i)}function YC(n,t,e,i,s){e=e.render;var r=t.ref;return Yu(t,s),i=Aw(n,t,e,i,r,s),e=kw(),n!==null&&!Un?(t.updateQueue=n.updateQueue,t.flags&=-2053,n.lanes&=~s,io(n,t,s)):($e&&e&&dw(t),t.flags|=1,xn(n,t,i,s),t.child)}function XC(n,t,e,i,s){if(n===null){var r=e.type;return typeof r=="function"&&!Lw(r)&&r.defaultProps===void 0&&e.compare===null&&e.defaultProps===void 0?(t.tag=15,t.type=r,HD(n,t,r,i,s)):(n=fm(e.type,null,i,t,t.mode,s),n.ref=t.ref,n.return=t,t.child=n)}if(r=n.child,!(n.lanes&s)){var a=r.memoizedProps;if(e=e.compare,e=e!==null?e:lg,e(a,i)&&n.ref===t.ref)return io(n,t,s)}return t.flags|=1,n=qo(r,i),n.ref=t.ref,n.return=t,t.child=n}function HD(n,t,e,i,s){if(n!==null){var r=n.memoizedProps;if(lg(r,i)&&n.ref===t.ref)if(Un=!1,t.pendingProps=i=r,(n.lanes&s)!==0)n.flags&131072&&(Un=!0);else return t.lanes=n.lanes,io(n,t,s)}return l1(n,t,e,i,s)}function jD(n,t,e){var i=t.pendingProps,s=i.children,r=n!==null?n.memoizedState:null;if(i.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},Oe(_u,ss),ss|=e;else{if(!(e&1073741824))return n=r!==null?r.baseLanes|e:e,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:n,cachePool:null,transitions:null},t.updateQueue=null,Oe(_u,ss),ss|=n,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},i=r!==null?r.baseLanes:e,Oe(_u,ss),ss|=i}else r!==null?(i=r.baseLanes|e,t.memoizedState=null):i=e,Oe(_u,ss),ss|=i;return xn(n,t,s,e),t.child}function ND(n,t){var e=t.ref;(n===null&&e!==null||n!==null&&n.ref!==e)&&(t.flags|=512,t.flags|=2097152)}function l1(n,t,e,i,s){var r=Yn(e)?lh:fn.current;return r=gd(t,r),Yu(t,s),e=Aw(n,t,e,i,r,s),i=kw(),n!==null&&!Un?(t.updateQueue=n.updateQueue,t.flags&=-2053,n.lanes&=~s,io(n,t,s)):($e&&i&&dw(t),t.flags|=1,xn(n,t,e,s),t.child)}function KC(n,t,e,i,s){if(Yn(e)){var r=!0;zm(t)}else r=!1;if(Yu(t,s),t.stateNode===null)cm(n,t),DD(t,e,i),a1(t,e,i,s),i=!0;else if(n===null){var a=t.stateNode,o=t.memoizedProps;a.props=o;var l=a.context,h=e.contextType;typeof h=="object"&&h!==null?h=Us(h):(h=Yn(e)?lh:fn.current,h=gd(t,h));var u=e.getDerivedStateFromProps,d=typeof u=="function"||typeof a.getSnapshotBeforeUpdate=="function";d||typeof a.UNSAFE_componentWillReceiveProps!="function"&&typeof a.componentWillReceiveProps!="function"||(o!==i||l!==h)&&WC(t,a,i,h),ko=!1;var c=t.memoizedState;a.state=c,Wm(t,i,a,s),l=t.memoizedState,o!==i||c!==l||$n.current||ko?(typeof u=="function"&&(r1(t,e,u,i),l=t.memoizedState),(o=ko||VC(t,e,o,i,c,l,h))?(d||typeof a.UNSAFE_componentWillMount!="function"&&typeof a.componentWillMount!="function"||(typeof a.componentWillMount=="function"&&a.componentWillMount(),typeof a.UNSAFE_componentWillMount=="function"&&a.UNSAFE_componentWillMount()),typeof a.componentDidMount=="function"&&(t.flags|=4194308)):(typeof a.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=i,t.memoizedState=l),a.props=i,a.state=l,a.context=h,i=o):(typeof a.componentDidMount=="function"&&(t.flags|=4194308),i=!1)}else{a=t.stateNode,fD(n,t),o=t.memoizedProps,h=t.type===t.elementType?o:or(t.type,o),a.props=h,d=t.pendingProps,c=a.context,l=e.contextType,typeof l=="object"&&l!==null?l=Us(l):(l=Yn(e)?lh:fn.current,l=gd(t,l));var p=e.getDerivedStateFromProps;(u=typeof p=="function"||typeof a.getSnapshotBeforeUpdate=="function")||typeof a.UNSAFE_componentWillReceiveProps!="function"&&typeof a.componentWillReceiveProps!="function"||(o!==d||c!==l)&&WC(t,a,i,l),ko=!1,c=t.memoizedState,a.state=c,Wm(t,i,a,s);var g=t.memoizedState;o!==d||c!==g||$n.current||ko?(typeof p=="function"&&(r1(t,e,p,i),g=t.memoizedState),(h=ko||VC(t,e,h,i,c,g,l)||!1)?(u||typeof a.UNSAFE_componentWillUpdate!="function"&&typeof a.componentWillUpdate!="function"||(typeof a.componentWillUpdate=="function"&&a.componentWillUpdate(i,g,l),typeof a.UNSAFE_componentWillUpdate=="function"&&a.UNSAFE_componentWillUpdate(i,g,l)),typeof a.componentDidUpdate=="function"&&(t.flags|=4),typeof a.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof a.componentDidUpdate!="function"||o===n.memoizedProps&&c===n.memoizedState||(t.flags|=4),typeof a.getSnapshotBeforeUpdate!="function"||o===n.memoizedProps&&c===n.memoizedState||(t.flags|=1024),t.memoizedProps=i,t.memoizedState=g),a.props=i,a.state=g,a.context=l,i=h):(typeof a.componentDidUpdate!="function"||o===n.memoizedProps&&c===n.memoizedState||(t.flags|=4),typeof a.getSnapshotBeforeUpdate!="function"||o===n.memoizedProps&&c===n.memoizedState||(t.flags|=1024),i=!1)}return h1(n,t,e,i,r,s)}function h1(n,t,e,i,s,r){ND(n,t);var a=(t.flags&128)!==0;if(!i&&!a)return s&&LC(t,e,!1),io(n,t,r);i=t.stateNode,LU.current=t;var o=a&&typeof e.getDerivedStateFromError!="function"?null:i.render();return t.flags|=1,n!==null&&a?(t.child=_d(t,n.child,null,r),t.child=_d(t,null,o,r)):xn(n,t,o,r),t.memoizedState=i.state,s&&LC(t,e,!0),t.child}function VD(n){var t=n.stateNode;t.pendingContext?OC(n,t.pendingContext,t.pendingContext!==t.context):t.context&&OC(n,t.context,!1),yw(n,t.containerInfo)}function qC(n,t,e,i,s){return fd(),pw(s),t.flags|=256,xn(n,t,e,i),t.child}var u1={dehydrated:null,treeContext:null,retryLane:0};function d1(n){return{baseLanes:n,cachePool:null,transitions:null}}function WD(n,t,e){var i=t.pendingProps,s=Qe.current,r=!1,a=(t.flags&128)!==0,o;if((o=a)||(o=n!==null&&n.memoizedState===null?!1:(s&2)!==0),o?(r=!0,t.flags&=-129):(n===null||n.memoizedState!==null)&&(s|=1),Oe(Qe,s&1),n===null)return n1(t),n=t.memoizedState,n!==null&&(n=n.dehydrated,n!==null)?(t.mode&1?n.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(a=i.children,n=i.fallback,r?(i=t.mode,r=t.child,a={mode:"hidden",children:a},!(i&1)&&r!==null?(r.childLanes=0,r.pendingProps=a):r=Ay(a,i,0,null),n=Zl(n,i,e,null),r.return=t,n.return=t,r.sibling=n,t.child=r,t.child.memoizedState=d1(e),t.memoizedState=u1,n):Mw(t,a));if(s=n.memoizedState,s!==null&&(o=s.dehydrated,o!==null))return IU(n,t,a,i,o,s,e);if(r){r=i.fallback,a=t.mode,s=n.child,o=s.sibling;var l={mode:"hidden",children:i.children};return!(a&1)&&t.child!==s?(i=t.child,i.childLanes=0,i.pendingProps=l,t.deletions=null):(i=qo(s,l),i.subtreeFlags=s.subtreeFlags&14680064),o!==null?r=qo(o,r):(r=Zl(r,a,e,null),r.flags|=2),r.return=t,i.return=t,i.sibling=r,t.child=i,i=r,r=t.child,a=n.child.memoizedState,a=a===null?d1(e):{baseLanes:a.baseLanes|e,cachePool:null,transitions:a.transitions},r.memoizedState=a,r.childLanes=n.childLanes&~e,t.memoizedState=u1,i}return r=n.child,n=r.sibling,i=qo(r,{mode:"visible",children:i.children}),!(t.mode&1)&&(i.lanes=e),i.return=t,i.sibling=null,n!==null&&(e=t.deletions,e===null?(t.deletions=[n],t.flags|=16):e.push(n)),t.child=i,t.memoizedState=null,i}function Mw(n,t){return t=Ay({mode:"visible",children:t},n.mode,0,null),t.return=n,n.child=t}function c_(n,t,e,i){return i!==null&&pw(i),_d(t,n.child,null,e),n=Mw(t,t.pendingProps.children),n.flags|=2,t.memoizedState=null,n}function IU(n,t,e,i,s,r,a){if(e)return t.flags&256?(t.flags&=-257,i=xx(Error(rt(422))),c_(n,t,a,i)):t.memoizedState!==null?(t.child=n.child,t.flags|=128,null):(r=i.fallback,s=t.mode,i=Ay({mode:"visible",children:i.children},s,0,null),r=Zl(r,s,a,null),r.flags|=2,i.return=t,r.return=t,i.sibling=r,t.child=i,t.mode&1&&_d(t,n.child,null,a),t.child.memoizedState=d1(a),t.memoizedState=u1,r);if(!(t.mode&1))return c_(n,t,a,null);if(s.data==="$!"){if(i=s.nextSibling&&s.nextSibling.dataset,i)var o=i.dgst;return i=o,r=Error(rt(419)),i=xx(r,i,void 0),c_(n,t,a,i)}if(o=(a&n.childLanes)!==0,Un||o){if(i=Ui,i!==null){switch(a&-a){case 4:s=2;break;case 16:s=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:s=32;break;case 536870912:s=268435456;break;default:s=0}s=s&(i.suspendedLanes|a)?0:s,s!==0&&s!==r.retryLane&&(r.retryLane=s,eo(n,s),Ar(i,n,s,-1))}return Ow(),i=xx(Error(rt(421))),c_(n,t,a,i)}return s.data==="$?"?(t.flags|=128,t.child=n.child,t=XU.bind(null,n),s._reactRetry=t,null):(n=r.treeContext,as=$o(s.nextSibling),os=t,$e=!0,dr=null,n!==null&&(Ps[Rs++]=za,Ps[Rs++]=Ha,Ps[Rs++]=hh,za=n.id,Ha=n.overflow,hh=t),t=Mw(t,i.children),t.flags|=4096,t)}function ZC(n,t,e){n.lanes|=t;var i=n.alternate;i!==null&&(i.lanes|=t),s1(n.return,t,e)}function Sx(n,t,e,i,s){var r=n.memoizedState;r===null?n.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:i,tail:e,tailMode:s}:(r.isBackwards=t,r.rendering=null,r.renderingStartTime=0,r.last=i,r.tail=e,r.tailMode=s)}function UD(n,t,e){var i=t.pendingProps,s=i.revealOrder,r=i.tail;if(xn(n,t,i.children,e),i=Qe.current,i&2)i=i&1|2,t.flags|=128;else{if(n!==null&&n.flags&128)t:for(n=t.child;n!==null;){if(n.tag===13)n.memoizedState!==null&&ZC(n,e,t);else if(n.tag===19)ZC(n,e,t);else if(n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break t;for(;n.sibling===null;){if(n.return===null||n.return===t)break t;n=n.return}n.sibling.return=n.return,n=n.sibling}i&=1}if(Oe(Qe,i),!(t.mode&1))t.memoizedState=null;else switch(s){case"forwards":for(e=t.child,s=null;e!==null;)n=e.alternate,n!==null&&Um(n)===null&&(s=e),e=e.sibling;e=s,e===null?(s=t.child,t.child=null):(s=e.sibling,e.sibling=null),Sx(t,!1,s,e,r);break;case"backwards":for(e=null,s=t.child,t.child=null;s!==null;){if(n=s.alternate,n!==null&&Um(n)===null){t.child=s;break}n=s.sibling,s.sibling=e,e=s,s=n}Sx(t,!0,e,null,r);break;case"together":Sx(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function cm(n,t){!(t.mode&1)&&n!==null&&(n.alternate=null,t.alternate=null,t.flags|=2)}function io(n,t,e){if(n!==null&&(t.dependencies=n.dependencies),dh|=t.lanes,!(e&t.childLanes))return null;if(n!==null&&t.child!==n.child)throw Error(rt(153));if(t.child!==null){for(n=t.child,e=qo(n,n.pendingProps),t.child=e,e.return=t;n.sibling!==null;)n=n.sibling,e=e.sibling=qo(n,n.pendingProps),e.return=t;e.sibling=null}return t.child}function DU(n,t,e){switch(t.tag){case 3:VD(t),fd();break;case 5:_D(t);break;case 1:Yn(t.type)&&zm(t);break;case 4:yw(t,t.stateNode.containerInfo);break;case 10:var i=t.type._context,s=t.memoizedProps.value;Oe(Nm,i._currentValue),i._currentValue=s;break;case 13:if(i=t.memoizedState,i!==null)return i.dehydrated!==null?(Oe(Qe,Qe.current&1),t.flags|=128,null):e&t.child.childLanes?WD(n,t,e):(Oe(Qe,Qe.current&1),n=io(n,t,e),n!==null?n.sibling:null);Oe(Qe,Qe.current&1);break;case 19:if(i=(e&t.childLanes)!==0,n.flags&128){if(i)return UD(n,t,e);t.flags|=128}if(s=t.memoizedState,s!==null&&(s.rendering=null,s.tail=null,s.lastEffect=null),Oe(Qe,Qe.current),i)break;return null;case 22:case 23:return t.lanes=0,jD(n,t,e)}return io(n,t,e)}var GD,c1,$D,YD;GD=function(n,t){for(var e=t.child;e!==null;){if(e.tag===5||e.tag===6)n.appendChild(e.stateNode);else if(e.tag!==4&&e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break;for(;e.sibling===null;){if(e.return===null||e.return===t)return;e=e.return}e.sibling.return=e.return,e=e.sibling}};c1=function(){};$D=function(n,t,e,i){var s=n.memoizedProps;if(s!==i){n=t.stateNode,zl(oa.current);var r=null;switch(e){case"input":s=LS(n,s),i=LS(n,i),r=[];break;case"select":s=ii({},s,{value:void 0}),i=ii({},i,{value:void 0}),r=[];break;case"textarea":s=FS(n,s),i=FS(n,i),r=[];break;default:typeof s.onClick!="function"&&typeof i.onClick=="function"&&(n.onclick=Dm)}HS(e,i);var a;e=null;for(h in s)if(!i.hasOwnProperty(h)&&s.hasOwnProperty(h)&&s[h]!=null)if(h==="style"){var o=s[h];for(a in o)o.hasOwnProperty(a)&&(e||(e={}),e[a]="")}else h!=="dangerouslySetInnerHTML"&&h!=="children"&&h!=="suppressContentEditableWarning"&&h!=="suppressHydrationWarning"&&h!=="autoFocus"&&(eg.hasOwnProperty(h)?r||(r=[]):(r=r||[]).push(h,null));for(h in i){var l=i[h];if(o=s!=null?s[h]:void 0,i.hasOwnProperty(h)&&l!==o&&(l!=null||o!=null))if(h==="style")if(o){for(a in o)!o.hasOwnProperty(a)||l&&l.hasOwnProperty(a)||(e||(e={}),e[a]="");for(a in l)l.hasOwnProperty(a)&&o[a]!==l[a]&&(e||(e={}),e[a]=l[a])}else e||(r||(r=[]),r.push(h,e)),e=l;else h==="dangerouslySetInnerHTML"?(l=l?l.__html:void 0,o=o?o.__html:void 0,l!=null&&o!==l&&(r=r||[]).push(h,l)):h==="children"?typeof l!="string"&&typeof l!="number"||(r=r||[]).push(h,""+l):h!=="suppressContentEditableWarning"&&h!=="suppressHydrationWarning"&&(eg.hasOwnProperty(h)?(l!=null&&h==="onScroll"&&ze("scroll",n),r||o===l||(r=[])):(r=r||[]).push(h,l))}e&&(r=r||[]).push("style",e);var h=r;(t.updateQueue=h)&&(t.flags|=4)}};YD=function(n,t,e,i){e!==i&&(t.flags|=4)};function mc(n,t){if(!$e)switch(n.tailMode){case"hidden":t=n.tail;for(var e=null;t!==null;)t.alternate!==null&&(e=t),t=t.sibling;e===null?n.tail=null:e.sibling=null;break;case"collapsed":e=n.tail;for(var i=null;e!==null;)e.alternate!==null&&(i=e),e=e.sibling;i===null?t||n.tail===null?n.tail=null:n.tail.sibling=null:i.sibling=null}}function on(n){var t=n.alternate!==null&&n.alternate.child===n.child,e=0,i=0;if(t)for(var s=n.child;s!==null;)e|=s.lanes|s.childLanes,i|=s.subtreeFlags&14680064,i|=s.flags&14680064,s.return=n,s=s.sibling;else for(s=n.child;s!==null;)e|=s.lanes|s.childLanes,i|=s.subtreeFlags,i|=s.flags,s.return=n,s=s.sibling;return n.subtreeFlags|=i,n.childLanes=e,t}function FU(n,t,e){var i=t.pendingProps;switch(cw(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return on(t),null;case 1:return Yn(t.type)&&Fm(),on(t),null;case 3:return i=t.stateNode,md(),Ne($n),Ne(fn),xw(),i.pendingContext&&(i.context=i.pendingContext,i.pendingContext=null),(n===null||n.child===null)&&(u_(t)?t.flags|=4:n===null||n.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,dr!==null&&(b1(dr),dr=null))),c1(n,t),on(t),null;case 5:bw(t);var s=zl(pg.current);if(e=t.type,n!==null&&t.stateNode!=null)$D(n,t,e,i,s),n.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!i){if(t.stateNode===null)throw Error(rt(166));return on(t),null}if(n=zl(oa.current),u_(t)){i=t.stateNode,e=t.type;var r=t.memoizedProps;switch(i[Ur]=t,i[dg]=r,n=(t.mode&1)!==0,e){case"dialog":ze("cancel",i),ze("close",i);break;case"iframe":case"object":case"embed":ze("load",i);break;case"video":case"audio":for(s=0;s<zc.length;s++)ze(zc[s],i);break;case"source":ze("error",i);break;case"img":case"image":case"link":ze("error",i),ze("load",i);break;case"details":ze("toggle",i);break;case"input":aC(i,r),ze("invalid",i);break;case"select":i._wrapperState={wasMultiple:!!r.multiple},ze("invalid",i);break;case"textarea":lC(i,r),ze("invalid",i)}HS(e,r),s=null;for(var a in r)if(r.hasOwnProperty(a)){var o=r[a];a==="children"?typeof o=="string"?i.textContent!==o&&(r.suppressHydrationWarning!==!0&&h_(i.textContent,o,n),s=["children",o]):typeof o=="number"&&i.textContent!==""+o&&(r.suppressHydrationWarning!==!0&&h_(i.textContent,o,n),s=["children",""+o]):eg.hasOwnProperty(a)&&o!=null&&a==="onScroll"&&ze("scroll",i)}switch(e){case"input":e_(i),oC(i,r,!0);break;case"textarea":e_(i),hC(i);break;case"select":case"option":break;default:typeof r.onClick=="function"&&(i.onclick=Dm)}i=s,t.updateQueue=i,i!==null&&(t.flags|=4)}else{a=s.nodeType===9?s:s.ownerDocument,n==="http://www.w3.org/1999/xhtml"&&(n=x2(e)),n==="http://www.w3.org/1999/xhtml"?e==="script"?(n=a.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild)):typeof i.is=="string"?n=a.createElement(e,{is:i.is}):(n=a.createElement(e),e==="select"&&(a=n,i.multiple?a.multiple=!0:i.size&&(a.size=i.size))):n=a.createElementNS(n,e),n[Ur]=t,n[dg]=i,GD(n,t,!1,!1),t.stateNode=n;t:{switch(a=jS(e,i),e){case"dialog":ze("cancel",n),ze("close",n),s=i;break;case"iframe":case"object":case"embed":ze("load",n),s=i;break;case"video":case"audio":for(s=0;s<zc.length;s++)ze(zc[s],n);s=i;break;case"source":ze("error",n),s=i;break;case"img":case"image":case"link":ze("error",n),ze("load",n),s=i;break;case"details":ze("toggle",n),s=i;break;case"input":aC(n,i),s=LS(n,i),ze("invalid",n);break;case"option":s=i;break;case"select":n._wrapperState={wasMultiple:!!i.multiple},s=ii({},i,{value:void 0}),ze("invalid",n);break;case"textarea":lC(n,i),s=FS(n,i),ze("invalid",n);break;default:s=i}HS(e,s),o=s;for(r in o)if(o.hasOwnProperty(r)){var l=o[r];r==="style"?k2(n,l):r==="dangerouslySetInnerHTML"?(l=l?l.__html:void 0,l!=null&&S2(n,l)):r==="children"?typeof l=="string"?(e!=="textarea"||l!=="")&&ig(n,l):typeof l=="number"&&ig(n,""+l):r!=="suppressContentEditableWarning"&&r!=="suppressHydrationWarning"&&r!=="autoFocus"&&(eg.hasOwnProperty(r)?l!=null&&r==="onScroll"&&ze("scroll",n):l!=null&&Zk(n,r,l,a))}switch(e){case"input":e_(n),oC(n,i,!1);break;case"textarea":e_(n),hC(n);break;case"option":i.value!=null&&n.setAttribute("value",""+Jo(i.value));break;case"select":n.multiple=!!i.multiple,r=i.value,r!=null?Wu(n,!!i.multiple,r,!1):i.defaultValue!=null&&Wu(n,!!i.multiple,i.defaultValue,!0);break;default:typeof s.onClick=="function"&&(n.onclick=Dm)}switch(e){case"button":case"input":case"select":case"textarea":i=!!i.autoFocus;break t;case"img":i=!0;break t;default:i=!1}}i&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return on(t),null;case 6:if(n&&t.stateNode!=null)YD(n,t,n.memoizedProps,i);else{if(typeof i!="string"&&t.stateNode===null)throw Error(rt(166));if(e=zl(pg.current),zl(oa.current),u_(t)){if(i=t.stateNode,e=t.memoizedProps,i[Ur]=t,(r=i.nodeValue!==e)&&(n=os,n!==null))switch(n.tag){case 3:h_(i.nodeValue,e,(n.mode&1)!==0);break;case 5:n.memoizedProps.suppressHydrationWarning!==!0&&h_(i.nodeValue,e,(n.mode&1)!==0)}r&&(t.flags|=4)}else i=(e.nodeType===9?e:e.ownerDocument).createTextNode(i),i[Ur]=t,t.stateNode=i}return on(t),null;case 13:if(Ne(Qe),i=t.memoizedState,n===null||n.memoizedState!==null&&n.memoizedState.dehydrated!==null){if($e&&as!==null&&t.mode&1&&!(t.flags&128))dD(),fd(),t.flags|=98560,r=!1;else if(r=u_(t),i!==null&&i.dehydrated!==null){if(n===null){if(!r)throw Error(rt(318));if(r=t.memoizedState,r=r!==null?r.dehydrated:null,!r)throw Error(rt(317));r[Ur]=t}else fd(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;on(t),r=!1}else dr!==null&&(b1(dr),dr=null),r=!0;if(!r)return t.flags&65536?t:null}return t.flags&128?(t.lanes=e,t):(i=i!==null,i!==(n!==null&&n.memoizedState!==null)&&i&&(t.child.flags|=8192,t.mode&1&&(n===null||Qe.current&1?Di===0&&(Di=3):Ow())),t.updateQueue!==null&&(t.flags|=4),on(t),null);case 4:return md(),c1(n,t),n===null&&hg(t.stateNode.containerInfo),on(t),null;case 10:return _w(t.type._context),on(t),null;case 17:return Yn(t.type)&&Fm(),on(t),null;case 19:if(Ne(Qe),r=t.memoizedState,r===null)return on(t),null;if(i=(t.flags&128)!==0,a=r.rendering,a===null)if(i)mc(r,!1);else{if(Di!==0||n!==null&&n.flags&128)for(n=t.child;n!==null;){if(a=Um(n),a!==null){for(t.flags|=128,mc(r,!1),i=a.updateQueue,i!==null&&(t.updateQueue=i,t.flags|=4),t.subtreeFlags=0,i=e,e=t.child;e!==null;)r=e,n=i,r.flags&=14680066,a=r.alternate,a===null?(r.childLanes=0,r.lanes=n,r.child=null,r.subtreeFlags=0,r.memoizedProps=null,r.memoizedState=null,r.updateQueue=null,r.dependencies=null,r.stateNode=null):(r.childLanes=a.childLanes,r.lanes=a.lanes,r.child=a.child,r.subtreeFlags=0,r.deletions=null,r.memoizedProps=a.memoizedProps,r.memoizedState=a.memoizedState,r.updateQueue=a.updateQueue,r.type=a.type,n=a.dependencies,r.dependencies=n===null?null:{lanes:n.lanes,firstContext:n.firstContext}),e=e.sibling;return Oe(Qe,Qe.current&1|2),t.child}n=n.sibling}r.tail!==null&&xi()>yd&&(t.flags|=128,i=!0,mc(r,!1),t.lanes=4194304)}else{if(!i)if(n=Um(a),n!==null){if(t.flags|=128,i=!0,e=n.updateQueue,e!==null&&(t.updateQueue=e,t.flags|=4),mc(r,!0),r.tail===null&&r.tailMode==="hidden"&&!a.alternate&&!$e)return on(t),null}else 2*xi()-r.renderingStartTime>yd&&e!==1073741824&&(t.flags|=128,i=!0,mc(r,!1),t.lanes=4194304);r.isBackwards?(a.sibling=t.child,t.child=a):(e=r.last,e!==null?e.sibling=a:t.child=a,r.last=a)}return r.tail!==null?(t=r.tail,r.rendering=t,r.tail=t.sibling,r.renderingStartTime=xi(),t.sibling=null,e=Qe.current,Oe(Qe,i?e&1|2:e&1),t):(on(t),null);case 22:case 23:return Bw(),i=t.memoizedState!==null,n!==null&&n.memoizedState!==null!==i&&(t.flags|=8192),i&&t.mode&1?ss&1073741824&&(on(t),t.subtreeFlags&6&&(t.flags|=8192)):on(t),null;case 24:return null;case 25:return null}throw Error(rt(156,t.tag))}function zU(n,t){switch(cw(t),t.tag){case 1:return Yn(t.type)&&Fm(),n=t.flags,n&65536?(t.flags=n&-65537|128,t):null;case 3:return md(),Ne($n),Ne(fn),xw(),n=t.flags,n&65536&&!(n&128)?(t.flags=n&-65537|128,t):null;case 5:return bw(t),null;case 13:if(Ne(Qe),n=t.memoizedState,n!==null&&n.dehydrated!==null){if(t.alternate===null)throw Error(rt(340));fd()}return n=t.flags,n&65536?(t.flags=n&-65537|128,t):null;case 19:return Ne(Qe),null;case 4:return md(),null;case 10:return _w(t.type._context),null;case 22:case 23:return Bw(),null;case 24:return null;default:return null}}var p_=!1,cn=!1,HU=typeof WeakSet=="function"?WeakSet:Set,bt=null;function fu(n,t){var e=n.ref;if(e!==null)if(typeof e=="function")try{e(null)}catch(i){li(n,t,i)}else e.current=null}function p1(n,t,e){try{e()}catch(i){li(n,t,i)}}var QC=!1;function jU(n,t){if(qS=Om,n=Q2(),uw(n)){if("selectionStart"in n)var e={start:n.selectionStart,end:n.selectionEnd};else t:{e=(e=n.ownerDocument)&&e.defaultView||window;var i=e.getSelection&&e.getSelection();if(i&&i.rangeCount!==0){e=i.anchorNode;var s=i.anchorOffset,r=i.focusNode;i=i.focusOffset;try{e.nodeType,r.nodeType}catch{e=null;break t}var a=0,o=-1,l=-1,h=0,u=0,d=n,c=null;e:for(;;){for(var p;d!==e||s!==0&&d.nodeType!==3||(o=a+s),d!==r||i!==0&&d.nodeType!==3||(l=a+i),d.nodeType===3&&(a+=d.nodeValue.length),(p=d.firstChild)!==null;)c=d,d=p;for(;;){if(d===n)break e;if(c===e&&++h===s&&(o=a),c===r&&++u===i&&(l=a),(p=d.nextSibling)!==null)break;d=c,c=d.parentNode}d=p}e=o===-1||l===-1?null:{start:o,end:l}}else e=null}e=e||{start:0,end:0}}else e=null;for(ZS={focusedElem:n,selectionRange:e},Om=!1,bt=t;bt!==null;)if(t=bt,n=t.child,(t.subtreeFlags&1028)!==0&&n!==null)n.return=t,bt=n;else for(;bt!==null;){t=bt;try{var g=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(g!==null){var f=g.memoizedProps,_=g.memoizedState,m=t.stateNode,v=m.getSnapshotBeforeUpdate(t.elementType===t.type?f:or(t.type,f),_);m.__reactInternalSnapshotBeforeUpdate=v}break;case 3:var y=t.stateNode.containerInfo;y.nodeType===1?y.textContent="":y.nodeType===9&&y.documentElement&&y.removeChild(y.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(rt(163))}}catch(b){li(t,t.return,b)}if(n=t.sibling,n!==null){n.return=t.return,bt=n;break}bt=t.return}return g=QC,QC=!1,g}function sp(n,t,e){var i=t.updateQueue;if(i=i!==null?i.lastEffect:null,i!==null){var s=i=i.next;do{if((s.tag&n)===n){var r=s.destroy;s.destroy=void 0,r!==void 0&&p1(t,e,r)}s=s.next}while(s!==i)}}function xy(n,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var e=t=t.next;do{if((e.tag&n)===n){var i=e.create;e.destroy=i()}e=e.next}while(e!==t)}}function g1(n){var t=n.ref;if(t!==null){var e=n.stateNode;switch(n.tag){case 5:n=e;break;default:n=e}typeof t=="function"?t(n):t.current=n}}function XD(n){var t=n.alternate;t!==null&&(n.alternate=null,XD(t)),n.child=null,n.deletions=null,n.sibling=null,n.tag===5&&(t=n.stateNode,t!==null&&(delete t[Ur],delete t[dg],delete t[t1],delete t[SU],delete t[AU])),n.stateNode=null,n.return=null,n.dependencies=null,n.memoizedProps=null,n.memoizedState=null,n.pendingProps=null,n.stateNode=null,n.updateQueue=null}function KD(n){return n.tag===5||n.tag===3||n.tag===4}function JC(n){t:for(;;){for(;n.sibling===null;){if(n.return===null||KD(n.return))return null;n=n.return}for(n.sibling.return=n.return,n=n.sibling;n.tag!==5&&n.tag!==6&&n.tag!==18;){if(n.flags&2||n.child===null||n.tag===4)continue t;n.child.return=n,n=n.child}if(!(n.flags&2))return n.stateNode}}function f1(n,t,e){var i=n.tag;if(i===5||i===6)n=n.stateNode,t?e.nodeType===8?e.parentNode.insertBefore(n,t):e.insertBefore(n,t):(e.nodeType===8?(t=e.parentNode,t.insertBefore(n,e)):(t=e,t.appendChild(n)),e=e._reactRootContainer,e!=null||t.onclick!==null||(t.onclick=Dm));else if(i!==4&&(n=n.child,n!==null))for(f1(n,t,e),n=n.sibling;n!==null;)f1(n,t,e),n=n.sibling}function _1(n,t,e){var i=n.tag;if(i===5||i===6)n=n.stateNode,t?e.insertBefore(n,t):e.appendChild(n);else if(i!==4&&(n=n.child,n!==null))for(_1(n,t,e),n=n.sibling;n!==null;)_1(n,t,e),n=n.sibling}var Xi=null,lr=!1;function vo(n,t,e){for(e=e.child;e!==null;)qD(n,t,e),e=e.sibling}function qD(n,t,e){if(aa&&typeof aa.onCommitFiberUnmount=="function")try{aa.onCommitFiberUnmount(py,e)}catch{}switch(e.tag){case 5:cn||fu(e,t);case 6:var i=Xi,s=lr;Xi=null,vo(n,t,e),Xi=i,lr=s,Xi!==null&&(lr?(n=Xi,e=e.stateNode,n.nodeType===8?n.parentNode.removeChild(e):n.removeChild(e)):Xi.removeChild(e.stateNode));break;case 18:Xi!==null&&(lr?(n=Xi,e=e.stateNode,n.nodeType===8?fx(n.parentNode,e):n.nodeType===1&&fx(n,e),ag(n)):fx(Xi,e.stateNode));break;case 4:i=Xi,s=lr,Xi=e.stateNode.containerInfo,lr=!0,vo(n,t,e),Xi=i,lr=s;break;case 0:case 11:case 14:case 15:if(!cn&&(i=e.updateQueue,i!==null&&(i=i.lastEffect,i!==null))){s=i=i.next;do{var r=s,a=r.destroy;r=r.tag,a!==void 0&&(r&2||r&4)&&p1(e,t,a),s=s.next}while(s!==i)}vo(n,t,e);break;case 1:if(!cn&&(fu(e,t),i=e.stateNode,typeof i.componentWillUnmount=="function"))try{i.props=e.memoizedProps,i.state=e.memoizedState,i.componentWillUnmount()}catch(o){li(e,t,o)}vo(n,t,e);break;case 21:vo(n,t,e);break;case 22:e.mode&1?(cn=(i=cn)||e.memoizedState!==null,vo(n,t,e),cn=i):vo(n,t,e);break;default:vo(n,t,e)}}function tP(n){var t=n.updateQueue;if(t!==null){n.updateQueue=null;var e=n.stateNode;e===null&&(e=n.stateNode=new HU),t.forEach(function(i){var s=KU.bind(null,n,i);e.has(i)||(e.add(i),i.then(s,s))})}}function sr(n,t){var e=t.deletions;if(e!==null)for(var i=0;i<e.length;i++){var s=e[i];try{var r=n,a=t,o=a;t:for(;o!==null;){switch(o.tag){case 5:Xi=o.stateNode,lr=!1;break t;case 3:Xi=o.stateNode.containerInfo,lr=!0;break t;case 4:Xi=o.stateNode.containerInfo,lr=!0;break t}o=o.return}if(Xi===null)throw Error(rt(160));qD(r,a,s),Xi=null,lr=!1;var l=s.alternate;l!==null&&(l.return=null),s.return=null}catch(h){li(s,t,h)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)ZD(t,n),t=t.sibling}function ZD(n,t){var e=n.alternate,i=n.flags;switch(n.tag){case 0:case 11:case 14:case 15:if(sr(t,n),Br(n),i&4){try{sp(3,n,n.return),xy(3,n)}catch(f){li(n,n.return,f)}try{sp(5,n,n.return)}catch(f){li(n,n.return,f)}}break;case 1:sr(t,n),Br(n),i&512&&e!==null&&fu(e,e.return);break;case 5:if(sr(t,n),Br(n),i&512&&e!==null&&fu(e,e.return),n.flags&32){var s=n.stateNode;try{ig(s,"")}catch(f){li(n,n.return,f)}}if(i&4&&(s=n.stateNode,s!=null)){var r=n.memoizedProps,a=e!==null?e.memoizedProps:r,o=n.type,l=n.updateQueue;if(n.updateQueue=null,l!==null)try{o==="input"&&r.type==="radio"&&r.name!=null&&y2(s,r),jS(o,a);var h=jS(o,r);for(a=0;a<l.length;a+=2){var u=l[a],d=l[a+1];u==="style"?k2(s,d):u==="dangerouslySetInnerHTML"?S2(s,d):u==="children"?ig(s,d):Zk(s,u,d,h)}switch(o){case"input":IS(s,r);break;case"textarea":b2(s,r);break;case"select":var c=s._wrapperState.wasMultiple;s._wrapperState.wasMultiple=!!r.multiple;var p=r.value;p!=null?Wu(s,!!r.multiple,p,!1):c!==!!r.multiple&&(r.defaultValue!=null?Wu(s,!!r.multiple,r.defaultValue,!0):Wu(s,!!r.multiple,r.multiple?[]:"",!1))}s[dg]=r}catch(f){li(n,n.return,f)}}break;case 6:if(sr(t,n),Br(n),i&4){if(n.stateNode===null)throw Error(rt(162));s=n.stateNode,r=n.memoizedProps;try{s.nodeValue=r}catch(f){li(n,n.return,f)}}break;case 3:if(sr(t,n),Br(n),i&4&&e!==null&&e.memoizedState.isDehydrated)try{ag(t.containerInfo)}catch(f){li(n,n.return,f)}break;case 4:sr(t,n),Br(n);break;case 13:sr(t,n),Br(n),s=n.child,s.flags&8192&&(r=s.memoizedState!==null,s.stateNode.isHidden=r,!r||s.alternate!==null&&s.alternate.memoizedState!==null||(Rw=xi())),i&4&&tP(n);break;case 22:if(u=e!==null&&e.memoizedState!==null,n.mode&1?(cn=(h=cn)||u,sr(t,n),cn=h):sr(t,n),Br(n),i&8192){if(h=n.memoizedState!==null,(n.stateNode.isHidden=h)&&!u&&n.mode&1)for(bt=n,u=n.child;u!==null;){for(d=bt=u;bt!==null;){switch(c=bt,p=c.child,c.tag){case 0:case 11:case 14:case 15:sp(4,c,c.return);break;case 1:fu(c,c.return);var g=c.stateNode;if(typeof g.componentWillUnmount=="function"){i=c,e=c.return;try{t=i,g.props=t.memoizedProps,g.state=t.memoizedState,g.componentWillUnmount()}catch(f){li(i,e,f)}}break;case 5:fu(c,c.return);break;case 22:if(c.memoizedState!==null){iP(d);continue}}p!==null?(p.return=c,bt=p):iP(d)}u=u.sibling}t:for(u=null,d=n;;){if(d.tag===5){if(u===null){u=d;try{s=d.stateNode,h?(r=s.style,typeof r.setProperty=="function"?r.setProperty("display","none","important"):r.display="none"):(o=d.stateNode,l=d.memoizedProps.style,a=l!=null&&l.hasOwnProperty("display")?l.display:null,o.style.display=A2("display",a))}catch(f){li(n,n.return,f)}}}else if(d.tag===6){if(u===null)try{d.stateNode.nodeValue=h?"":d.memoizedProps}catch(f){li(n,n.return,f)}}else if((d.tag!==22&&d.tag!==23||d.memoizedState===null||d===n)&&d.child!==null){d.child.return=d,d=d.child;continue}if(d===n)break t;for(;d.sibling===null;){if(d.return===null||d.return===n)break t;u===d&&(u=null),d=d.return}u===d&&(u=null),d.sibling.return=d.return,d=d.sibling}}break;case 19:sr(t,n),Br(n),i&4&&tP(n);break;case 21:break;default:sr(t,n),Br(n)}}function Br(n){var t=n.flags;if(t&2){try{t:{for(var e=n.return;e!==null;){if(KD(e)){var i=e;break t}e=e.return}throw Error(rt(160))}switch(i.tag){case 5:var s=i.stateNode;i.flags&32&&(ig(s,""),i.flags&=-33);var r=JC(n);_1(n,r,s);break;case 3:case 4:var a=i.stateNode.containerInfo,o=JC(n);f1(n,o,a);break;default:throw Error(rt(161))}}catch(l){li(n,n.return,l)}n.flags&=-3}t&4096&&(n.flags&=-4097)}function NU(n,t,e){bt=n,QD(n)}function QD(n,t,e){for(var i=(n.mode&1)!==0;bt!==null;){var s=bt,r=s.child;if(s.tag===22&&i){var a=s.memoizedState!==null||p_;if(!a){var o=s.alternate,l=o!==null&&o.memoizedState!==null||cn;o=p_;var h=cn;if(p_=a,(cn=l)&&!h)for(bt=s;bt!==null;)a=bt,l=a.child,a.tag===22&&a.memoizedState!==null?nP(s):l!==null?(l.return=a,bt=l):nP(s);for(;r!==null;)bt=r,QD(r),r=r.sibling;bt=s,p_=o,cn=h}eP(n)}else s.subtreeFlags&8772&&r!==null?(r.return=s,bt=r):eP(n)}}function eP(n){for(;bt!==null;){var t=bt;if(t.flags&8772){var e=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:cn||xy(5,t);break;case 1:var i=t.stateNode;if(t.flags&4&&!cn)if(e===null)i.componentDidMount();else{var s=t.elementType===t.type?e.memoizedProps:or(t.type,e.memoizedProps);i.componentDidUpdate(s,e.memoizedState,i.__reactInternalSnapshotBeforeUpdate)}var r=t.updateQueue;r!==null&&HC(t,r,i);break;case 3:var a=t.updateQueue;if(a!==null){if(e=null,t.child!==null)switch(t.child.tag){case 5:e=t.child.stateNode;break;case 1:e=t.child.stateNode}HC(t,a,e)}break;case 5:var o=t.stateNode;if(e===null&&t.flags&4){e=o;var l=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":l.autoFocus&&e.focus();break;case"img":l.src&&(e.src=l.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var h=t.alternate;if(h!==null){var u=h.memoizedState;if(u!==null){var d=u.dehydrated;d!==null&&ag(d)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(rt(163))}cn||t.flags&512&&g1(t)}catch(c){li(t,t.return,c)}}if(t===n){bt=null;break}if(e=t.sibling,e!==null){e.return=t.return,bt=e;break}bt=t.return}}function iP(n){for(;bt!==null;){var t=bt;if(t===n){bt=null;break}var e=t.sibling;if(e!==null){e.return=t.return,bt=e;break}bt=t.return}}function nP(n){for(;bt!==null;){var t=bt;try{switch(t.tag){case 0:case 11:case 15:var e=t.return;try{xy(4,t)}catch(l){li(t,e,l)}break;case 1:var i=t.stateNode;if(typeof i.componentDidMount=="function"){var s=t.return;try{i.componentDidMount()}catch(l){li(t,s,l)}}var r=t.return;try{g1(t)}catch(l){li(t,r,l)}break;case 5:var a=t.return;try{g1(t)}catch(l){li(t,a,l)}}}catch(l){li(t,t.return,l)}if(t===n){bt=null;break}var o=t.sibling;if(o!==null){o.return=t.return,bt=o;break}bt=t.return}}var VU=Math.ceil,Ym=lo.ReactCurrentDispatcher,Cw=lo.ReactCurrentOwner,Ns=lo.ReactCurrentBatchConfig,ce=0,Ui=null,Ei=null,Qi=0,ss=0,_u=ul(0),Di=0,mg=null,dh=0,Sy=0,Pw=0,rp=null,jn=null,Rw=0,yd=1/0,Ta=null,Xm=!1,m1=null,Xo=null,g_=!1,Io=null,Km=0,ap=0,v1=null,pm=-1,gm=0;function wn(){return ce&6?xi():pm!==-1?pm:pm=xi()}function Ko(n){return n.mode&1?ce&2&&Qi!==0?Qi&-Qi:wU.transition!==null?(gm===0&&(gm=D2()),gm):(n=ke,n!==0||(n=window.event,n=n===void 0?16:W2(n.type)),n):1}function Ar(n,t,e,i){if(50<ap)throw ap=0,v1=null,Error(rt(185));yf(n,e,i),(!(ce&2)||n!==Ui)&&(n===Ui&&(!(ce&2)&&(Sy|=e),Di===4&&Ro(n,Qi)),Xn(n,i),e===1&&ce===0&&!(t.mode&1)&&(yd=xi()+500,vy&&dl()))}function Xn(n,t){var e=n.callbackNode;wW(n,t);var i=Bm(n,n===Ui?Qi:0);if(i===0)e!==null&&cC(e),n.callbackNode=null,n.callbackPriority=0;else if(t=i&-i,n.callbackPriority!==t){if(e!=null&&cC(e),t===1)n.tag===0?kU(sP.bind(null,n)):lD(sP.bind(null,n)),bU(function(){!(ce&6)&&dl()}),e=null;else{switch(F2(i)){case 1:e=iw;break;case 4:e=L2;break;case 16:e=Em;break;case 536870912:e=I2;break;default:e=Em}e=aF(e,JD.bind(null,n))}n.callbackPriority=t,n.callbackNode=e}}function JD(n,t){if(pm=-1,gm=0,ce&6)throw Error(rt(327));var e=n.callbackNode;if(Xu()&&n.callbackNode!==e)return null;var i=Bm(n,n===Ui?Qi:0);if(i===0)return null;if(i&30||i&n.expiredLanes||t)t=qm(n,i);else{t=i;var s=ce;ce|=2;var r=eF();(Ui!==n||Qi!==t)&&(Ta=null,yd=xi()+500,ql(n,t));do try{GU();break}catch(o){tF(n,o)}while(!0);fw(),Ym.current=r,ce=s,Ei!==null?t=0:(Ui=null,Qi=0,t=Di)}if(t!==0){if(t===2&&(s=GS(n),s!==0&&(i=s,t=y1(n,s))),t===1)throw e=mg,ql(n,0),Ro(n,i),Xn(n,xi()),e;if(t===6)Ro(n,i);else{if(s=n.current.alternate,!(i&30)&&!WU(s)&&(t=qm(n,i),t===2&&(r=GS(n),r!==0&&(i=r,t=y1(n,r))),t===1))throw e=mg,ql(n,0),Ro(n,i),Xn(n,xi()),e;switch(n.finishedWork=s,n.finishedLanes=i,t){case 0:case 1:throw Error(rt(345));case 2:Rl(n,jn,Ta);break;case 3:if(Ro(n,i),(i&130023424)===i&&(t=Rw+500-xi(),10<t)){if(Bm(n,0)!==0)break;if(s=n.suspendedLanes,(s&i)!==i){wn(),n.pingedLanes|=n.suspendedLanes&s;break}n.timeoutHandle=JS(Rl.bind(null,n,jn,Ta),t);break}Rl(n,jn,Ta);break;case 4:if(Ro(n,i),(i&4194240)===i)break;for(t=n.eventTimes,s=-1;0<i;){var a=31-Sr(i);r=1<<a,a=t[a],a>s&&(s=a),i&=~r}if(i=s,i=xi()-i,i=(120>i?120:480>i?480:1080>i?1080:1920>i?1920:3e3>i?3e3:4320>i?4320:1960*VU(i/1960))-i,10<i){n.timeoutHandle=JS(Rl.bind(null,n,jn,Ta),i);break}Rl(n,jn,Ta);break;case 5:Rl(n,jn,Ta);break;default:throw Error(rt(329))}}}return Xn(n,xi()),n.callbackNode===e?JD.bind(null,n):null}function y1(n,t){var e=rp;return n.current.memoizedState.isDehydrated&&(ql(n,t).flags|=256),n=qm(n,t),n!==2&&(t=jn,jn=e,t!==null&&b1(t)),n}function b1(n){jn===null?jn=n:jn.push.apply(jn,n)}function WU(n){for(var t=n;;){if(t.flags&16384){var e=t.updateQueue;if(e!==null&&(e=e.stores,e!==null))for(var i=0;i<e.length;i++){var s=e[i],r=s.getSnapshot;s=s.value;try{if(!wr(r(),s))return!1}catch{return!1}}}if(e=t.child,t.subtreeFlags&16384&&e!==null)e.return=t,t=e;else{if(t===n)break;for(;t.sibling===null;){if(t.return===null||t.return===n)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Ro(n,t){for(t&=~Pw,t&=~Sy,n.suspendedLanes|=t,n.pingedLanes&=~t,n=n.expirationTimes;0<t;){var e=31-Sr(t),i=1<<e;n[e]=-1,t&=~i}}function sP(n){if(ce&6)throw Error(rt(327));Xu();var t=Bm(n,0);if(!(t&1))return Xn(n,xi()),null;var e=qm(n,t);if(n.tag!==0&&e===2){var i=GS(n);i!==0&&(t=i,e=y1(n,i))}if(e===1)throw e=mg,ql(n,0),Ro(n,t),Xn(n,xi()),e;if(e===6)throw Error(rt(345));return n.finishedWork=n.current.alternate,n.finishedLanes=t,Rl(n,jn,Ta),Xn(n,xi()),null}function Ew(n,t){var e=ce;ce|=1;try{return n(t)}finally{ce=e,ce===0&&(yd=xi()+500,vy&&dl())}}function ch(n){Io!==null&&Io.tag===0&&!(ce&6)&&Xu();var t=ce;ce|=1;var e=Ns.transition,i=ke;try{if(Ns.transition=null,ke=1,n)return n()}finally{ke=i,Ns.transition=e,ce=t,!(ce&6)&&dl()}}function Bw(){ss=_u.current,Ne(_u)}function ql(n,t){n.finishedWork=null,n.finishedLanes=0;var e=n.timeoutHandle;if(e!==-1&&(n.timeoutHandle=-1,yU(e)),Ei!==null)for(e=Ei.return;e!==null;){var i=e;switch(cw(i),i.tag){case 1:i=i.type.childContextTypes,i!=null&&Fm();break;case 3:md(),Ne($n),Ne(fn),xw();break;case 5:bw(i);break;case 4:md();break;case 13:Ne(Qe);break;case 19:Ne(Qe);break;case 10:_w(i.type._context);break;case 22:case 23:Bw()}e=e.return}if(Ui=n,Ei=n=qo(n.current,null),Qi=ss=t,Di=0,mg=null,Pw=Sy=dh=0,jn=rp=null,Fl!==null){for(t=0;t<Fl.length;t++)if(e=Fl[t],i=e.interleaved,i!==null){e.interleaved=null;var s=i.next,r=e.pending;if(r!==null){var a=r.next;r.next=s,i.next=a}e.pending=i}Fl=null}return n}function tF(n,t){do{var e=Ei;try{if(fw(),um.current=$m,Gm){for(var i=ti.memoizedState;i!==null;){var s=i.queue;s!==null&&(s.pending=null),i=i.next}Gm=!1}if(uh=0,Hi=Li=ti=null,np=!1,gg=0,Cw.current=null,e===null||e.return===null){Di=1,mg=t,Ei=null;break}t:{var r=n,a=e.return,o=e,l=t;if(t=Qi,o.flags|=32768,l!==null&&typeof l=="object"&&typeof l.then=="function"){var h=l,u=o,d=u.tag;if(!(u.mode&1)&&(d===0||d===11||d===15)){var c=u.alternate;c?(u.updateQueue=c.updateQueue,u.memoizedState=c.memoizedState,u.lanes=c.lanes):(u.updateQueue=null,u.memoizedState=null)}var p=GC(a);if(p!==null){p.flags&=-257,$C(p,a,o,r,t),p.mode&1&&UC(r,h,t),t=p,l=h;var g=t.updateQueue;if(g===null){var f=new Set;f.add(l),t.updateQueue=f}else g.add(l);break t}else{if(!(t&1)){UC(r,h,t),Ow();break t}l=Error(rt(426))}}else if($e&&o.mode&1){var _=GC(a);if(_!==null){!(_.flags&65536)&&(_.flags|=256),$C(_,a,o,r,t),pw(vd(l,o));break t}}r=l=vd(l,o),Di!==4&&(Di=2),rp===null?rp=[r]:rp.push(r),r=a;do{switch(r.tag){case 3:r.flags|=65536,t&=-t,r.lanes|=t;var m=FD(r,l,t);zC(r,m);break t;case 1:o=l;var v=r.type,y=r.stateNode;if(!(r.flags&128)&&(typeof v.getDerivedStateFromError=="function"||y!==null&&typeof y.componentDidCatch=="function"&&(Xo===null||!Xo.has(y)))){r.flags|=65536,t&=-t,r.lanes|=t;var b=zD(r,o,t);zC(r,b);break t}}r=r.return}while(r!==null)}nF(e)}catch(x){t=x,Ei===e&&e!==null&&(Ei=e=e.return);continue}break}while(!0)}function eF(){var n=Ym.current;return Ym.current=$m,n===null?$m:n}function Ow(){(Di===0||Di===3||Di===2)&&(Di=4),Ui===null||!(dh&268435455)&&!(Sy&268435455)||Ro(Ui,Qi)}function qm(n,t){var e=ce;ce|=2;var i=eF();(Ui!==n||Qi!==t)&&(Ta=null,ql(n,t));do try{UU();break}catch(s){tF(n,s)}while(!0);if(fw(),ce=e,Ym.current=i,Ei!==null)throw Error(rt(261));return Ui=null,Qi=0,Di}function UU(){for(;Ei!==null;)iF(Ei)}function GU(){for(;Ei!==null&&!_W();)iF(Ei)}function iF(n){var t=rF(n.alternate,n,ss);n.memoizedProps=n.pendingProps,t===null?nF(n):Ei=t,Cw.current=null}function nF(n){var t=n;do{var e=t.alternate;if(n=t.return,t.flags&32768){if(e=zU(e,t),e!==null){e.flags&=32767,Ei=e;return}if(n!==null)n.flags|=32768,n.subtreeFlags=0,n.deletions=null;else{Di=6,Ei=null;return}}else if(e=FU(e,t,ss),e!==null){Ei=e;return}if(t=t.sibling,t!==null){Ei=t;return}Ei=t=n}while(t!==null);Di===0&&(Di=5)}function Rl(n,t,e){var i=ke,s=Ns.transition;try{Ns.transition=null,ke=1,$U(n,t,e,i)}finally{Ns.transition=s,ke=i}return null}function $U(n,t,e,i){do Xu();while(Io!==null);if(ce&6)throw Error(rt(327));e=n.finishedWork;var s=n.finishedLanes;if(e===null)return null;if(n.finishedWork=null,n.finishedLanes=0,e===n.current)throw Error(rt(177));n.callbackNode=null,n.callbackPriority=0;var r=e.lanes|e.childLanes;if(TW(n,r),n===Ui&&(Ei=Ui=null,Qi=0),!(e.subtreeFlags&2064)&&!(e.flags&2064)||g_||(g_=!0,aF(Em,function(){return Xu(),null})),r=(e.flags&15990)!==0,e.subtreeFlags&15990||r){r=Ns.transition,Ns.transition=null;var a=ke;ke=1;var o=ce;ce|=4,Cw.current=null,jU(n,e),ZD(e,n),cU(ZS),Om=!!qS,ZS=qS=null,n.current=e,NU(e),mW(),ce=o,ke=a,Ns.transition=r}else n.current=e;if(g_&&(g_=!1,Io=n,Km=s),r=n.pendingLanes,r===0&&(Xo=null),bW(e.stateNode),Xn(n,xi()),t!==null)for(i=n.onRecoverableError,e=0;e<t.length;e++)s=t[e],i(s.value,{componentStack:s.stack,digest:s.digest});if(Xm)throw Xm=!1,n=m1,m1=null,n;return Km&1&&n.tag!==0&&Xu(),r=n.pendingLanes,r&1?n===v1?ap++:(ap=0,v1=n):ap=0,dl(),null}function Xu(){if(Io!==null){var n=F2(Km),t=Ns.transition,e=ke;try{if(Ns.transition=null,ke=16>n?16:n,Io===null)var i=!1;else{if(n=Io,Io=null,Km=0,ce&6)throw Error(rt(331));var s=ce;for(ce|=4,bt=n.current;bt!==null;){var r=bt,a=r.child;if(bt.flags&16){var o=r.deletions;if(o!==null){for(var l=0;l<o.length;l++){var h=o[l];for(bt=h;bt!==null;){var u=bt;switch(u.tag){case 0:case 11:case 15:sp(8,u,r)}var d=u.child;if(d!==null)d.return=u,bt=d;else for(;bt!==null;){u=bt;var c=u.sibling,p=u.return;if(XD(u),u===h){bt=null;break}if(c!==null){c.return=p,bt=c;break}bt=p}}}var g=r.alternate;if(g!==null){var f=g.child;if(f!==null){g.child=null;do{var _=f.sibling;f.sibling=null,f=_}while(f!==null)}}bt=r}}if(r.subtreeFlags&2064&&a!==null)a.return=r,bt=a;else t:for(;bt!==null;){if(r=bt,r.flags&2048)switch(r.tag){case 0:case 11:case 15:sp(9,r,r.return)}var m=r.sibling;if(m!==null){m.return=r.return,bt=m;break t}bt=r.return}}var v=n.current;for(bt=v;bt!==null;){a=bt;var y=a.child;if(a.subtreeFlags&2064&&y!==null)y.return=a,bt=y;else t:for(a=v;bt!==null;){if(o=bt,o.flags&2048)try{switch(o.tag){case 0:case 11:case 15:xy(9,o)}}catch(x){li(o,o.return,x)}if(o===a){bt=null;break t}var b=o.sibling;if(b!==null){b.return=o.return,bt=b;break t}bt=o.return}}if(ce=s,dl(),aa&&typeof aa.onPostCommitFiberRoot=="function")try{aa.onPostCommitFiberRoot(py,n)}catch{}i=!0}return i}finally{ke=e,Ns.transition=t}}return!1}function rP(n,t,e){t=vd(e,t),t=FD(n,t,1),n=Yo(n,t,1),t=wn(),n!==null&&(yf(n,1,t),Xn(n,t))}function li(n,t,e){if(n.tag===3)rP(n,n,e);else for(;t!==null;){if(t.tag===3){rP(t,n,e);break}else if(t.tag===1){var i=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof i.componentDidCatch=="function"&&(Xo===null||!Xo.has(i))){n=vd(e,n),n=zD(t,n,1),t=Yo(t,n,1),n=wn(),t!==null&&(yf(t,1,n),Xn(t,n));break}}t=t.return}}function YU(n,t,e){var i=n.pingCache;i!==null&&i.delete(t),t=wn(),n.pingedLanes|=n.suspendedLanes&e,Ui===n&&(Qi&e)===e&&(Di===4||Di===3&&(Qi&130023424)===Qi&&500>xi()-Rw?ql(n,0):Pw|=e),Xn(n,t)}function sF(n,t){t===0&&(n.mode&1?(t=s_,s_<<=1,!(s_&130023424)&&(s_=4194304)):t=1);var e=wn();n=eo(n,t),n!==null&&(yf(n,t,e),Xn(n,e))}function XU(n){var t=n.memoizedState,e=0;t!==null&&(e=t.retryLane),sF(n,e)}function KU(n,t){var e=0;switch(n.tag){case 13:var i=n.stateNode,s=n.memoizedState;s!==null&&(e=s.retryLane);break;case 19:i=n.stateNode;break;default:throw Error(rt(314))}i!==null&&i.delete(t),sF(n,e)}var rF;rF=function(n,t,e){if(n!==null)if(n.memoizedProps!==t.pendingProps||$n.current)Un=!0;else{if(!(n.lanes&e)&&!(t.flags&128))return Un=!1,DU(n,t,e);Un=!!(n.flags&131072)}else Un=!1,$e&&t.flags&1048576&&hD(t,jm,t.index);switch(t.lanes=0,t.tag){case 2:var i=t.type;cm(n,t),n=t.pendingProps;var s=gd(t,fn.current);Yu(t,e),s=Aw(null,t,i,n,s,e);var r=kw();return t.flags|=1,typeof s=="object"&&s!==null&&typeof s.render=="function"&&s.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Yn(i)?(r=!0,zm(t)):r=!1,t.memoizedState=s.state!==null&&s.state!==void 0?s.state:null,vw(t),s.updater=by,t.stateNode=s,s._reactInternals=t,a1(t,i,n,e),t=h1(null,t,i,!0,r,e)):(t.tag=0,$e&&r&&dw(t),xn(null,t,s,e),t=t.child),t;case 16:i=t.elementType;t:{switch(cm(n,t),n=t.pendingProps,s=i._init,i=s(i._payload),t.type=i,s=t.tag=ZU(i),n=or(i,n),s){case 0:t=l1(null,t,i,n,e);break t;case 1:t=KC(null,t,i,n,e);break t;case 11:t=YC(null,t,i,n,e);break t;case 14:t=XC(null,t,i,or(i.type,n),e);break t}throw Error(rt(306,i,""))}return t;case 0:return i=t.type,s=t.pendingProps,s=t.elementType===i?s:or(i,s),l1(n,t,i,s,e);case 1:return i=t.type,s=t.pendingProps,s=t.elementType===i?s:or(i,s),KC(n,t,i,s,e);case 3:t:{if(VD(t),n===null)throw Error(rt(387));i=t.pendingProps,r=t.memoizedState,s=r.element,fD(n,t),Wm(t,i,null,e);var a=t.memoizedState;if(i=a.element,r.isDehydrated)if(r={element:i,isDehydrated:!1,cache:a.cache,pendingSuspenseBoundaries:a.pendingSuspenseBoundaries,transitions:a.transitions},t.updateQueue.baseState=r,t.memoizedState=r,t.flags&256){s=vd(Error(rt(423)),t),t=qC(n,t,i,e,s);break t}else if(i!==s){s=vd(Error(rt(424)),t),t=qC(n,t,i,e,s);break t}else for(as=$o(t.stateNode.containerInfo.firstChild),os=t,$e=!0,dr=null,e=pD(t,null,i,e),t.child=e;e;)e.flags=e.flags&-3|4096,e=e.sibling;else{if(fd(),i===s){t=io(n,t,e);break t}xn(n,t,i,e)}t=t.child}return t;case 5:return _D(t),n===null&&n1(t),i=t.type,s=t.pendingProps,r=n!==null?n.memoizedProps:null,a=s.children,QS(i,s)?a=null:r!==null&&QS(i,r)&&(t.flags|=32),ND(n,t),xn(n,t,a,e),t.child;case 6:return n===null&&n1(t),null;case 13:return WD(n,t,e);case 4:return yw(t,t.stateNode.containerInfo),i=t.pendingProps,n===null?t.child=_d(t,null,i,e):xn(n,t,i,e),t.child;case 11:return i=t.type,s=t.pendingProps,s=t.elementType===i?s:or(i,s),YC(n,t,i,s,e);case 7:return xn(n,t,t.pendingProps,e),t.child;case 8:return xn(n,t,t.pendingProps.children,e),t.child;case 12:return xn(n,t,t.pendingProps.children,e),t.child;case 10:t:{if(i=t.type._context,s=t.pendingProps,r=t.memoizedProps,a=s.value,Oe(Nm,i._currentValue),i._currentValue=a,r!==null)if(wr(r.value,a)){if(r.children===s.children&&!$n.current){t=io(n,t,e);break t}}else for(r=t.child,r!==null&&(r.return=t);r!==null;){var o=r.dependencies;if(o!==null){a=r.child;for(var l=o.firstContext;l!==null;){if(l.context===i){if(r.tag===1){l=qa(-1,e&-e),l.tag=2;var h=r.updateQueue;if(h!==null){h=h.shared;var u=h.pending;u===null?l.next=l:(l.next=u.next,u.next=l),h.pending=l}}r.lanes|=e,l=r.alternate,l!==null&&(l.lanes|=e),s1(r.return,e,t),o.lanes|=e;break}l=l.next}}else if(r.tag===10)a=r.type===t.type?null:r.child;else if(r.tag===18){if(a=r.return,a===null)throw Error(rt(341));a.lanes|=e,o=a.alternate,o!==null&&(o.lanes|=e),s1(a,e,t),a=r.sibling}else a=r.child;if(a!==null)a.return=r;else for(a=r;a!==null;){if(a===t){a=null;break}if(r=a.sibling,r!==null){r.return=a.return,a=r;break}a=a.return}r=a}xn(n,t,s.children,e),t=t.child}return t;case 9:return s=t.type,i=t.pendingProps.children,Yu(t,e),s=Us(s),i=i(s),t.flags|=1,xn(n,t,i,e),t.child;case 14:return i=t.type,s=or(i,t.pendingProps),s=or(i.type,s),XC(n,t,i,s,e);case 15:return HD(n,t,t.type,t.pendingProps,e);case 17:return i=t.type,s=t.pendingProps,s=t.elementType===i?s:or(i,s),cm(n,t),t.tag=1,Yn(i)?(n=!0,zm(t)):n=!1,Yu(t,e),DD(t,i,s),a1(t,i,s,e),h1(null,t,i,!0,n,e);case 19:return UD(n,t,e);case 22:return jD(n,t,e)}throw Error(rt(156,t.tag))};function aF(n,t){return O2(n,t)}function qU(n,t,e,i){this.tag=n,this.key=e,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=i,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Fs(n,t,e,i){return new qU(n,t,e,i)}function Lw(n){return n=n.prototype,!(!n||!n.isReactComponent)}function ZU(n){if(typeof n=="function")return Lw(n)?1:0;if(n!=null){if(n=n.$$typeof,n===Jk)return 11;if(n===tw)return 14}return 2}function qo(n,t){var e=n.alternate;return e===null?(e=Fs(n.tag,t,n.key,n.mode),e.elementType=n.elementType,e.type=n.type,e.stateNode=n.stateNode,e.alternate=n,n.alternate=e):(e.pendingProps=t,e.type=n.type,e.flags=0,e.subtreeFlags=0,e.deletions=null),e.flags=n.flags&14680064,e.childLanes=n.childLanes,e.lanes=n.lanes,e.child=n.child,e.memoizedProps=n.memoizedProps,e.memoizedState=n.memoizedState,e.updateQueue=n.updateQueue,t=n.dependencies,e.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},e.sibling=n.sibling,e.index=n.index,e.ref=n.ref,e}function fm(n,t,e,i,s,r){var a=2;if(i=n,typeof n=="function")Lw(n)&&(a=1);else if(typeof n=="string")a=5;else t:switch(n){case au:return Zl(e.children,s,r,t);case Qk:a=8,s|=8;break;case RS:return n=Fs(12,e,t,s|2),n.elementType=RS,n.lanes=r,n;case ES:return n=Fs(13,e,t,s),n.elementType=ES,n.lanes=r,n;case BS:return n=Fs(19,e,t,s),n.elementType=BS,n.lanes=r,n;case _2:return Ay(e,s,r,t);default:if(typeof n=="object"&&n!==null)switch(n.$$typeof){case g2:a=10;break t;case f2:a=9;break t;case Jk:a=11;break t;case tw:a=14;break t;case Ao:a=16,i=null;break t}throw Error(rt(130,n==null?n:typeof n,""))}return t=Fs(a,e,t,s),t.elementType=n,t.type=i,t.lanes=r,t}function Zl(n,t,e,i){return n=Fs(7,n,i,t),n.lanes=e,n}function Ay(n,t,e,i){return n=Fs(22,n,i,t),n.elementType=_2,n.lanes=e,n.stateNode={isHidden:!1},n}function Ax(n,t,e){return n=Fs(6,n,null,t),n.lanes=e,n}function kx(n,t,e){return t=Fs(4,n.children!==null?n.children:[],n.key,t),t.lanes=e,t.stateNode={containerInfo:n.containerInfo,pendingChildren:null,implementation:n.implementation},t}function QU(n,t,e,i,s){this.tag=t,this.containerInfo=n,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=sx(0),this.expirationTimes=sx(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=sx(0),this.identifierPrefix=i,this.onRecoverableError=s,this.mutableSourceEagerHydrationData=null}function Iw(n,t,e,i,s,r,a,o,l){return n=new QU(n,t,e,o,l),t===1?(t=1,r===!0&&(t|=8)):t=0,r=Fs(3,null,null,t),n.current=r,r.stateNode=n,r.memoizedState={element:i,isDehydrated:e,cache:null,transitions:null,pendingSuspenseBoundaries:null},vw(r),n}function JU(n,t,e){var i=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:ru,key:i==null?null:""+i,children:n,containerInfo:t,implementation:e}}function oF(n){if(!n)return tl;n=n._reactInternals;t:{if(Th(n)!==n||n.tag!==1)throw Error(rt(170));var t=n;do{switch(t.tag){case 3:t=t.stateNode.context;break t;case 1:if(Yn(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break t}}t=t.return}while(t!==null);throw Error(rt(171))}if(n.tag===1){var e=n.type;if(Yn(e))return oD(n,e,t)}return t}function lF(n,t,e,i,s,r,a,o,l){return n=Iw(e,i,!0,n,s,r,a,o,l),n.context=oF(null),e=n.current,i=wn(),s=Ko(e),r=qa(i,s),r.callback=t??null,Yo(e,r,s),n.current.lanes=s,yf(n,s,i),Xn(n,i),n}function ky(n,t,e,i){var s=t.current,r=wn(),a=Ko(s);return e=oF(e),t.context===null?t.context=e:t.pendingContext=e,t=qa(r,a),t.payload={element:n},i=i===void 0?null:i,i!==null&&(t.callback=i),n=Yo(s,t,a),n!==null&&(Ar(n,s,a,r),hm(n,s,a)),a}function Zm(n){if(n=n.current,!n.child)return null;switch(n.child.tag){case 5:return n.child.stateNode;default:return n.child.stateNode}}function aP(n,t){if(n=n.memoizedState,n!==null&&n.dehydrated!==null){var e=n.retryLane;n.retryLane=e!==0&&e<t?e:t}}function Dw(n,t){aP(n,t),(n=n.alternate)&&aP(n,t)}function t4(){return null}var hF=typeof reportError=="function"?reportError:function(n){console.error(n)};function Fw(n){this._internalRoot=n}wy.prototype.render=Fw.prototype.render=function(n){var t=this._internalRoot;if(t===null)throw Error(rt(409));ky(n,t,null,null)};wy.prototype.unmount=Fw.prototype.unmount=function(){var n=this._internalRoot;if(n!==null){this._internalRoot=null;var t=n.containerInfo;ch(function(){ky(null,n,null,null)}),t[to]=null}};function wy(n){this._internalRoot=n}wy.prototype.unstable_scheduleHydration=function(n){if(n){var t=j2();n={blockedOn:null,target:n,priority:t};for(var e=0;e<Po.length&&t!==0&&t<Po[e].priority;e++);Po.splice(e,0,n),e===0&&V2(n)}};function zw(n){return!(!n||n.nodeType!==1&&n.nodeType!==9&&n.nodeType!==11)}function Ty(n){return!(!n||n.nodeType!==1&&n.nodeType!==9&&n.nodeType!==11&&(n.nodeType!==8||n.nodeValue!==" react-mount-point-unstable "))}function oP(){}function e4(n,t,e,i,s){if(s){if(typeof i=="function"){var r=i;i=function(){var h=Zm(a);r.call(h)}}var a=lF(t,i,n,0,null,!1,!1,"",oP);return n._reactRootContainer=a,n[to]=a.current,hg(n.nodeType===8?n.parentNode:n),ch(),a}for(;s=n.lastChild;)n.removeChild(s);if(typeof i=="function"){var o=i;i=function(){var h=Zm(l);o.call(h)}}var l=Iw(n,0,!1,null,null,!1,!1,"",oP);return n._reactRootContainer=l,n[to]=l.current,hg(n.nodeType===8?n.parentNode:n),ch(function(){ky(t,l,e,i)}),l}function My(n,t,e,i,s){var r=e._reactRootContainer;if(r){var a=r;if(typeof s=="function"){var o=s;s=function(){var l=Zm(a);o.call(l)}}ky(t,a,n,s)}else a=e4(e,t,n,s,i);return Zm(a)}z2=function(n){switch(n.tag){case 3:var t=n.stateNode;if(t.current.memoizedState.isDehydrated){var e=Fc(t.pendingLanes);e!==0&&(nw(t,e|1),Xn(t,xi()),!(ce&6)&&(yd=xi()+500,dl()))}break;case 13:ch(function(){var i=eo(n,1);if(i!==null){var s=wn();Ar(i,n,1,s)}}),Dw(n,1)}};sw=function(n){if(n.tag===13){var t=eo(n,134217728);if(t!==null){var e=wn();Ar(t,n,134217728,e)}Dw(n,134217728)}};H2=function(n){if(n.tag===13){var t=Ko(n),e=eo(n,t);if(e!==null){var i=wn();Ar(e,n,t,i)}Dw(n,t)}};j2=function(){return ke};N2=function(n,t){var e=ke;try{return ke=n,t()}finally{ke=e}};VS=function(n,t,e){switch(t){case"input":if(IS(n,e),t=e.name,e.type==="radio"&&t!=null){for(e=n;e.parentNode;)e=e.parentNode;for(e=e.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<e.length;t++){var i=e[t];if(i!==n&&i.form===n.form){var s=my(i);if(!s)throw Error(rt(90));v2(i),IS(i,s)}}}break;case"textarea":b2(n,e);break;case"select":t=e.value,t!=null&&Wu(n,!!e.multiple,t,!1)}};M2=Ew;C2=ch;var i4={usingClientEntryPoint:!1,Events:[xf,uu,my,w2,T2,Ew]},vc={findFiberByHostInstance:Dl,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},n4={bundleType:vc.bundleType,version:vc.version,rendererPackageName:vc.rendererPackageName,rendererConfig:vc.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:lo.ReactCurrentDispatcher,findHostInstanceByFiber:function(n){return n=E2(n),n===null?null:n.stateNode},findFiberByHostInstance:vc.findFiberByHostInstance||t4,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var f_=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!f_.isDisabled&&f_.supportsFiber)try{py=f_.inject(n4),aa=f_}catch{}}gs.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=i4;gs.createPortal=function(n,t){var e=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!zw(t))throw Error(rt(200));return JU(n,t,null,e)};gs.createRoot=function(n,t){if(!zw(n))throw Error(rt(299));var e=!1,i="",s=hF;return t!=null&&(t.unstable_strictMode===!0&&(e=!0),t.identifierPrefix!==void 0&&(i=t.identifierPrefix),t.onRecoverableError!==void 0&&(s=t.onRecoverableError)),t=Iw(n,1,!1,null,null,e,!1,i,s),n[to]=t.current,hg(n.nodeType===8?n.parentNode:n),new Fw(t)};gs.findDOMNode=function(n){if(n==null)return null;if(n.nodeType===1)return n;var t=n._reactInternals;if(t===void 0)throw typeof n.render=="function"?Error(rt(188)):(n=Object.keys(n).join(","),Error(rt(268,n)));return n=E2(t),n=n===null?null:n.stateNode,n};gs.flushSync=function(n){return ch(n)};gs.hydrate=function(n,t,e){if(!Ty(t))throw Error(rt(200));return My(null,n,t,!0,e)};gs.hydrateRoot=function(n,t,e){if(!zw(n))throw Error(rt(405));var i=e!=null&&e.hydratedSources||null,s=!1,r="",a=hF;if(e!=null&&(e.unstable_strictMode===!0&&(s=!0),e.identifierPrefix!==void 0&&(r=e.identifierPrefix),e.onRecoverableError!==void 0&&(a=e.onRecoverableError)),t=lF(t,null,n,1,e??null,s,!1,r,a),n[to]=t.current,hg(n),i)for(n=0;n<i.length;n++)e=i[n],s=e._getVersion,s=s(e._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[e,s]:t.mutableSourceEagerHydrationData.push(e,s);return new wy(t)};gs.render=function(n,t,e){if(!Ty(t))throw Error(rt(200));return My(null,n,t,!1,e)};gs.unmountComponentAtNode=function(n){if(!Ty(n))throw Error(rt(40));return n._reactRootContainer?(ch(function(){My(null,null,n,!1,function(){n._reactRootContainer=null,n[to]=null})}),!0):!1};gs.unstable_batchedUpdates=Ew;gs.unstable_renderSubtreeIntoContainer=function(n,t,e,i){if(!Ty(e))throw Error(rt(200));if(n==null||n._reactInternals===void 0)throw Error(rt(38));return My(n,t,e,!1,i)};gs.version="18.3.1-next-f1338f8080-20240426";function uF(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(uF)}catch(n){console.error(n)}}uF(),u2.exports=gs;var s4=u2.exports,lP=s4;CS.createRoot=lP.createRoot,CS.hydrateRoot=lP.hydrateRoot;function r4({children:n,header:t,nav:e}){return W.jsxs("div",{className:"layout",children:[W.jsx("header",{className:"layout-header",children:W.jsxs("div",{className:"header-container",children:[W.jsx("div",{className:"header-left",children:t||W.jsx("h1",{children:"AI Memory Hub"})}),W.jsx("nav",{className:"header-nav",children:e})]})}),W.jsx("main",{className:"layout-main",children:n})]})}const cl="/api/v1";async function Mh(n){if(!n.ok){const t=await n.json().catch(()=>({detail:"网络错误"}));throw new Error(t.detail||`HTTP ${n.status}: ${n.statusText}`)}return n.json()}async function a4(n,t=10){try{const e=await fetch(`${cl}/search/`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({query:n,limit:t})});return await Mh(e)}catch(e){throw e.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):e}}async function o4(n,t=10){try{const e=await fetch(`${cl}/search/sqlite`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({query:n,limit:t})});return await Mh(e)}catch(e){throw e.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):e}}async function l4(n,t,e=[]){try{const i=await fetch(`${cl}/memories/`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({title:n,content:t,tags:e})});return await Mh(i)}catch(i){throw i.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):i}}async function dF(){try{const n=await fetch(`${cl}/memories/`);return await Mh(n)}catch(n){throw n.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):n}}async function wx(n){try{const t=await fetch(`${cl}/memories/${n}`);return await Mh(t)}catch(t){throw t.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):t}}async function h4(n,t,e,i=[]){try{const s=await fetch(`${cl}/memories/${n}`,{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify({title:t,content:e,tags:i})});return await Mh(s)}catch(s){throw s.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):s}}async function u4(n){try{const t=await fetch(`${cl}/memories/${n}`,{method:"DELETE"});if(!t.ok){const e=await t.json().catch(()=>({detail:"删除失败"}));throw new Error(e.detail||`HTTP ${t.status}`)}return{success:!0}}catch(t){throw t.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):t}}async function d4(){try{const n=await fetch(`${cl}/memories/stats`);return await Mh(n)}catch(n){throw n.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):n}}function c4({memories:n,onMemoryClick:t,onMemoryDelete:e,refreshTrigger:i}){const[s,r]=Ht.useState(n||[]),[a,o]=Ht.useState(!n),[l,h]=Ht.useState(null),u=c=>new Date(c).toLocaleDateString("zh-CN",{year:"numeric",month:"short",day:"numeric",hour:"2-digit",minute:"2-digit"}),d=(c,p)=>{c.stopPropagation(),window.confirm("确定要删除这条记忆吗？")&&e(p)};return Ht.useEffect(()=>{(async()=>{if(n){r(n);return}o(!0),h(null);try{const p=await dF();r(p)}catch(p){h(p.message||"加载失败")}finally{o(!1)}})()},[i,n]),a?W.jsx("div",{className:"loading",children:"加载中..."}):l?W.jsxs("div",{className:"error",children:["错误: ",l]}):!s||s.length===0?W.jsx("div",{className:"empty-state",children:W.jsx("p",{children:"还没有记忆，创建第一条记忆吧！"})}):W.jsx("div",{className:"memory-list",children:s.map(c=>W.jsx("div",{className:"memory-list-item",onClick:()=>t(c.id),children:W.jsxs("div",{className:"memory-list-item-main",children:[W.jsx("div",{className:"memory-list-item-header",children:W.jsx("h4",{className:"memory-list-item-title",children:c.title})}),W.jsxs("p",{className:"memory-list-item-content",children:[c.content.substring(0,200),c.content.length>200?"...":""]}),W.jsxs("div",{className:"memory-list-item-footer",children:[W.jsx("div",{className:"memory-list-item-tags",children:c.tags&&c.tags.length>0?c.tags.map((p,g)=>W.jsx("span",{className:"memory-tag",children:p},g)):W.jsx("span",{className:"memory-tag-empty",children:"无标签"})}),W.jsxs("div",{className:"memory-list-item-actions",children:[W.jsx("span",{className:"memory-list-item-date",children:u(c.created_at)}),W.jsx("button",{className:"memory-list-item-delete",onClick:p=>d(p,c.id),title:"删除",children:"删除"})]})]})]})},c.id))})}function cF({onSubmit:n,onCancel:t,initialData:e=null,isEdit:i=!1}){var f;const[s,r]=Ht.useState((e==null?void 0:e.title)||""),[a,o]=Ht.useState((e==null?void 0:e.content)||""),[l,h]=Ht.useState(((f=e==null?void 0:e.tags)==null?void 0:f.join(", "))||""),[u,d]=Ht.useState(""),[c,p]=Ht.useState(!1);Ht.useEffect(()=>{var _;e&&(r(e.title||""),o(e.content||""),h(((_=e.tags)==null?void 0:_.join(", "))||""))},[e]);const g=async _=>{if(_.preventDefault(),d(""),!s.trim()){d("标题不能为空");return}if(!a.trim()){d("内容不能为空");return}const m=l.split(",").map(v=>v.trim()).filter(v=>v.length>0);p(!0);try{await n({title:s.trim(),content:a.trim(),tags:m}),r(""),o(""),h("")}catch(v){d(v.message||"创建失败，请重试")}finally{p(!1)}};return W.jsxs("form",{className:"memory-form",onSubmit:g,children:[W.jsx("h2",{children:i?"编辑记忆":"创建新记忆"}),u&&W.jsx("div",{className:"form-error",children:u}),W.jsxs("div",{className:"form-group",children:[W.jsx("label",{htmlFor:"title",children:"标题 *"}),W.jsx("input",{id:"title",type:"text",value:s,onChange:_=>r(_.target.value),placeholder:"输入记忆标题",disabled:c})]}),W.jsxs("div",{className:"form-group",children:[W.jsx("label",{htmlFor:"content",children:"内容 *"}),W.jsx("textarea",{id:"content",value:a,onChange:_=>o(_.target.value),placeholder:"输入记忆内容",rows:6,disabled:c})]}),W.jsxs("div",{className:"form-group",children:[W.jsx("label",{htmlFor:"tags",children:"标签"}),W.jsx("input",{id:"tags",type:"text",value:l,onChange:_=>h(_.target.value),placeholder:"用逗号分隔多个标签，例如：工作, 重要",disabled:c})]}),W.jsxs("div",{className:"form-actions",children:[t&&W.jsx("button",{type:"button",onClick:t,disabled:c,children:"取消"}),W.jsx("button",{type:"submit",disabled:c,children:c?i?"保存中...":"创建中...":i?"保存修改":"创建记忆"})]})]})}function p4({memoryId:n,onBack:t,onDelete:e,onUpdate:i}){const[s,r]=Ht.useState(null),[a,o]=Ht.useState(!0),[l,h]=Ht.useState(null),[u,d]=Ht.useState(!1);Ht.useEffect(()=>{n&&(async()=>{o(!0),h(null);try{const v=await wx(n);r(v)}catch(v){h(v.message||"加载失败")}finally{o(!1)}})()},[n]);const c=()=>{window.confirm("确定要删除这条记忆吗？")&&e(s.id)},p=()=>{d(!0)},g=()=>{d(!1),(async()=>{try{const v=await wx(n);r(v)}catch(v){h(v.message||"加载失败")}})()},f=async m=>{try{await i(s.id,m),d(!1);const v=await wx(n);r(v)}catch(v){throw v}},_=m=>new Date(m).toLocaleDateString("zh-CN",{year:"numeric",month:"long",day:"numeric",hour:"2-digit",minute:"2-digit"});return a?W.jsx("div",{className:"memory-detail",children:W.jsx("div",{className:"loading",children:"加载中..."})}):l?W.jsxs("div",{className:"memory-detail",children:[W.jsxs("div",{className:"error",children:["错误: ",l]}),W.jsx("button",{onClick:t,children:"返回"})]}):s?u?W.jsxs("div",{className:"memory-detail",children:[W.jsx("div",{className:"memory-detail-header",children:W.jsx("button",{onClick:g,className:"back-button",children:"✕ 取消编辑"})}),W.jsx("div",{className:"memory-detail-body-scrollable",children:W.jsx("div",{className:"memory-detail-body",children:W.jsx(cF,{initialData:s,isEdit:!0,onSubmit:f,onCancel:g})})})]}):W.jsxs("div",{className:"memory-detail",children:[W.jsxs("div",{className:"memory-detail-header",children:[W.jsx("button",{onClick:t,className:"back-button",children:"✕ 关闭"}),W.jsxs("div",{className:"memory-detail-actions",children:[W.jsx("button",{onClick:p,className:"edit-button",children:"编辑"}),W.jsx("button",{onClick:c,className:"delete-button",children:"删除"})]})]}),W.jsx("div",{className:"memory-detail-fixed",children:W.jsxs("div",{className:"memory-detail-content",children:[W.jsx("h1",{children:s.title}),W.jsxs("div",{className:"memory-detail-meta",children:[W.jsx("div",{className:"memory-detail-tags",children:s.tags&&s.tags.length>0?s.tags.map((m,v)=>W.jsx("span",{className:"memory-tag",children:m},v)):W.jsx("span",{className:"memory-tag-empty",children:"无标签"})}),W.jsx("span",{className:"memory-detail-date",children:_(s.created_at)})]})]})}),W.jsx("div",{className:"memory-detail-body-scrollable",children:W.jsx("div",{className:"memory-detail-body",children:W.jsx("p",{children:s.content})})})]}):W.jsxs("div",{className:"memory-detail",children:[W.jsx("div",{className:"error",children:"记忆不存在"}),W.jsx("button",{onClick:t,children:"返回"})]})}function g4({onSearch:n,loading:t=!1,searchMode:e="vector",onModeChange:i}){const[s,r]=Ht.useState(""),a=l=>{l.preventDefault(),s.trim()&&n(s.trim(),e)},o=()=>{r(""),n("",e)};return W.jsxs("div",{className:"search-container",children:[W.jsxs("form",{className:"search-bar",onSubmit:a,children:[W.jsx("input",{type:"text",value:s,onChange:l=>r(l.target.value),placeholder:e==="vector"?"输入关键词进行语义搜索...":"输入关键词进行文本搜索...",disabled:t}),W.jsxs("div",{className:"search-actions",children:[s&&W.jsx("button",{type:"button",onClick:o,className:"search-clear",children:"清除"}),W.jsx("button",{type:"submit",disabled:t||!s.trim(),children:t?"搜索中...":"搜索"})]})]}),W.jsxs("div",{className:"search-mode-selector",children:[W.jsx("button",{type:"button",className:`search-mode-btn ${e==="vector"?"active":""}`,onClick:()=>i("vector"),disabled:t,children:"🔍 语义搜索"}),W.jsx("button",{type:"button",className:`search-mode-btn ${e==="sqlite"?"active":""}`,onClick:()=>i("sqlite"),disabled:t,children:"📝 文本搜索"})]})]})}function f4({results:n,onMemoryClick:t,onMemoryDelete:e,query:i,searchMode:s="vector"}){const r=o=>new Date(o).toLocaleDateString("zh-CN",{year:"numeric",month:"short",day:"numeric",hour:"2-digit",minute:"2-digit"}),a=(o,l)=>{o.stopPropagation(),window.confirm("确定要删除这条记忆吗？")&&e(l)};return i?n.length===0?W.jsx("div",{className:"search-results-empty",children:W.jsx("p",{children:"未找到相关记忆"})}):W.jsxs("div",{className:"search-results",children:[W.jsxs("h3",{children:["搜索结果 (",n.length," 条)",W.jsx("span",{className:"search-mode-badge",children:s==="vector"?"🔍 语义搜索":"📝 文本搜索"})]}),W.jsx("div",{className:"search-results-list",children:n.map(o=>W.jsx("div",{className:"search-result-item",onClick:()=>t(o.id),children:W.jsxs("div",{className:"search-result-item-main",children:[W.jsxs("div",{className:"search-result-item-header",children:[W.jsx("h4",{className:"search-result-item-title",children:o.title}),o.relevance!==void 0&&W.jsxs("span",{className:"search-result-item-relevance",children:[(o.relevance*100).toFixed(1),"%"]})]}),W.jsxs("p",{className:"search-result-item-content",children:[o.content.substring(0,200),o.content.length>200?"...":""]}),W.jsxs("div",{className:"search-result-item-footer",children:[W.jsx("div",{className:"search-result-item-tags",children:o.tags&&o.tags.length>0?o.tags.map((l,h)=>W.jsx("span",{className:"search-result-tag",children:l},h)):W.jsx("span",{className:"search-result-tag-empty",children:"无标签"})}),W.jsxs("div",{className:"search-result-item-actions",children:[W.jsx("span",{className:"search-result-item-date",children:r(o.created_at)}),W.jsx("button",{className:"search-result-item-delete",onClick:l=>a(l,o.id),title:"删除",children:"删除"})]})]})]})},o.id))})]}):null}function _4({suggestion:n,onClick:t}){return W.jsx("div",{className:"suggestion-item",onClick:t,children:W.jsxs("div",{className:"suggestion-item-main",children:[W.jsxs("div",{className:"suggestion-item-header",children:[W.jsx("h4",{className:"suggestion-item-title",children:n.title}),W.jsx("span",{className:"suggestion-badge",children:"建议"})]}),W.jsxs("p",{className:"suggestion-item-content",children:[n.content.substring(0,200),n.content.length>200?"...":""]}),W.jsxs("div",{className:"suggestion-item-footer",children:[W.jsx("div",{className:"suggestion-item-tags",children:n.tags&&n.tags.length>0?n.tags.map((e,i)=>W.jsx("span",{className:"suggestion-tag",children:e},i)):null}),W.jsx("span",{className:"suggestion-hint",children:"点击创建"})]})]})})}const pF=n=>n;var oi;(function(n){n["desktop-browser"]="desktop-browser",n["mobile-browser"]="mobile-browser",n.node="node",n.worker="worker",n.miniApp="miniApp",n.wx="wx",n.tt="tt",n.harmony="harmony",n["desktop-miniApp"]="desktop-miniApp",n.lynx="lynx"})(oi||(oi={}));var q;(function(n){n.cartesianAxis="cartesianAxis",n.cartesianBandAxis="cartesianAxis-band",n.cartesianLinearAxis="cartesianAxis-linear",n.cartesianTimeAxis="cartesianAxis-time",n.cartesianLogAxis="cartesianAxis-log",n.cartesianSymlogAxis="cartesianAxis-symlog",n.polarAxis="polarAxis",n.polarBandAxis="polarAxis-band",n.polarLinearAxis="polarAxis-linear",n.crosshair="crosshair",n.cartesianCrosshair="cartesianCrosshair",n.polarCrosshair="polarCrosshair",n.dataZoom="dataZoom",n.geoCoordinate="geoCoordinate",n.indicator="indicator",n.discreteLegend="discreteLegend",n.continuousLegend="continuousLegend",n.colorLegend="colorLegend",n.sizeLegend="sizeLegend",n.markLine="markLine",n.markArea="markArea",n.markPoint="markPoint",n.polarMarkLine="polarMarkLine",n.polarMarkArea="polarMarkArea",n.polarMarkPoint="polarMarkPoint",n.geoMarkPoint="geoMarkPoint",n.tooltip="tooltip",n.title="title",n.player="player",n.scrollBar="scrollBar",n.label="label",n.totalLabel="totalLabel",n.brush="brush",n.poptip="poptip",n.customMark="customMark"})(q||(q={}));var gF={exports:{}};(function(n){var t=Object.prototype.hasOwnProperty,e="~";function i(){}Object.create&&(i.prototype=Object.create(null),new i().__proto__||(e=!1));function s(l,h,u){this.fn=l,this.context=h,this.once=u||!1}function r(l,h,u,d,c){if(typeof u!="function")throw new TypeError("The listener must be a function");var p=new s(u,d||l,c),g=e?e+h:h;return l._events[g]?l._events[g].fn?l._events[g]=[l._events[g],p]:l._events[g].push(p):(l._events[g]=p,l._eventsCount++),l}function a(l,h){--l._eventsCount===0?l._events=new i:delete l._events[h]}function o(){this._events=new i,this._eventsCount=0}o.prototype.eventNames=function(){var h=[],u,d;if(this._eventsCount===0)return h;for(d in u=this._events)t.call(u,d)&&h.push(e?d.slice(1):d);return Object.getOwnPropertySymbols?h.concat(Object.getOwnPropertySymbols(u)):h},o.prototype.listeners=function(h){var u=e?e+h:h,d=this._events[u];if(!d)return[];if(d.fn)return[d.fn];for(var c=0,p=d.length,g=new Array(p);c<p;c++)g[c]=d[c].fn;return g},o.prototype.listenerCount=function(h){var u=e?e+h:h,d=this._events[u];return d?d.fn?1:d.length:0},o.prototype.emit=function(h,u,d,c,p,g){var f=e?e+h:h;if(!this._events[f])return!1;var _=this._events[f],m=arguments.length,v,y;if(_.fn){switch(_.once&&this.removeListener(h,_.fn,void 0,!0),m){case 1:return _.fn.call(_.context),!0;case 2:return _.fn.call(_.context,u),!0;case 3:return _.fn.call(_.context,u,d),!0;case 4:return _.fn.call(_.context,u,d,c),!0;case 5:return _.fn.call(_.context,u,d,c,p),!0;case 6:return _.fn.call(_.context,u,d,c,p,g),!0}for(y=1,v=new Array(m-1);y<m;y++)v[y-1]=arguments[y];_.fn.apply(_.context,v)}else{var b=_.length,x;for(y=0;y<b;y++)switch(_[y].once&&this.removeListener(h,_[y].fn,void 0,!0),m){case 1:_[y].fn.call(_[y].context);break;case 2:_[y].fn.call(_[y].context,u);break;case 3:_[y].fn.call(_[y].context,u,d);break;case 4:_[y].fn.call(_[y].context,u,d,c);break;default:if(!v)for(x=1,v=new Array(m-1);x<m;x++)v[x-1]=arguments[x];_[y].fn.apply(_[y].context,v)}}return!0},o.prototype.on=function(h,u,d){return r(this,h,u,d,!1)},o.prototype.once=function(h,u,d){return r(this,h,u,d,!0)},o.prototype.removeListener=function(h,u,d,c){var p=e?e+h:h;if(!this._events[p])return this;if(!u)return a(this,p),this;var g=this._events[p];if(g.fn)g.fn===u&&(!c||g.once)&&(!d||g.context===d)&&a(this,p);else{for(var f=0,_=[],m=g.length;f<m;f++)(g[f].fn!==u||c&&!g[f].once||d&&g[f].context!==d)&&_.push(g[f]);_.length?this._events[p]=_.length===1?_[0]:_:a(this,p)}return this},o.prototype.removeAllListeners=function(h){var u;return h?(u=e?e+h:h,this._events[u]&&a(this,u)):(this._events=new i,this._eventsCount=0),this},o.prototype.off=o.prototype.removeListener,o.prototype.addListener=o.prototype.on,o.prefixed=e,o.EventEmitter=o,n.exports=o})(gF);var m4=gF.exports;const pl=Uk(m4),Kd=(n,t)=>Object.prototype.toString.call(n)===`[object ${t}]`,Ti=(n,t=!1)=>t?typeof n=="boolean":n===!0||n===!1||Kd(n,"Boolean"),G=n=>typeof n=="function",O=n=>n==null,P=n=>n!=null,kt=n=>{const t=typeof n;return n!==null&&t==="object"||t==="function"},v4=n=>typeof n=="object"&&n!==null,Vs=function(n){if(!v4(n)||!Kd(n,"Object"))return!1;if(Object.getPrototypeOf(n)===null)return!0;let t=n;for(;Object.getPrototypeOf(t)!==null;)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(n)===t},Ee=n=>n===void 0,vt=(n,t=!1)=>{const e=typeof n;return t?e==="string":e==="string"||Kd(n,"String")},V=n=>Array.isArray?Array.isArray(n):Kd(n,"Array"),Hw=function(n){return n!==null&&typeof n!="function"&&Number.isFinite(n.length)},y4=n=>Kd(n,"Date"),it=(n,t=!1)=>{const e=typeof n;return t?e==="number":e==="number"||Kd(n,"Number")},b4=n=>typeof n=="string"&&!isNaN(Number(n))&&!isNaN(parseFloat(n)),U=n=>it(n)&&Number.isFinite(n),fF=n=>new RegExp(/^(http(s)?:\/\/)\w+[^\s]+(\.[^\s]+){1,}$/).test(n),_F=n=>new RegExp(/^data:image\/(?:gif|png|jpeg|bmp|webp|svg\+xml)(?:;charset=utf-8)?;base64,(?:[A-Za-z0-9]|[+/])+={0,2}/g).test(n),x4=n=>({}).toString.call(n).replace(/^\[object /,"").replace(/]$/,""),S4=Object.prototype,A4=function(n){const t=n&&n.constructor;return n===(typeof t=="function"&&t.prototype||S4)},k4=Object.prototype.hasOwnProperty;function ht(n){if(O(n))return!0;if(Hw(n))return!n.length;const t=x4(n);if(t==="Map"||t==="Set")return!n.size;if(A4(n))return!Object.keys(n).length;for(const e in n)if(k4.call(n,e))return!1;return!0}const Ot=(n,t,e)=>{const i=vt(t)?t.split("."):t;for(let s=0;s<i.length;s++)n=n?n[i[s]]:void 0;return n===void 0?e:n},w4=Object.prototype.hasOwnProperty,T4=(n,t)=>n!=null&&w4.call(n,t);function gn(n,t,e){let i;if(!P(n)||typeof n!="object"||t&&t(n))return n;const s=V(n),r=n.length;i=s?new Array(r):typeof n=="object"?{}:Ti(n)||it(n)||vt(n)?n:y4(n)?new Date(+n):void 0;const a=s?void 0:Object.keys(Object(n));let o=-1;if(i)for(;++o<(a||n).length;){const l=a?a[o]:o,h=n[l];e&&e.includes(l.toString())?i[l]=h:i[l]=gn(h,t,e)}return i}function jw(n,t,e=!1,i=!1){if(t){if(n===t)return;if(P(t)&&typeof t=="object"){const s=Object(t),r=[];for(const l in s)r.push(l);let{length:a}=r,o=-1;for(;a--;){const l=r[++o];!P(s[l])||typeof s[l]!="object"||i&&V(n[l])?mF(n,l,s[l]):M4(n,t,l,e,i)}}}}function M4(n,t,e,i=!1,s=!1){const r=n[e],a=t[e];let o=t[e],l=!0;if(V(a)){if(i)o=[];else if(V(r))o=r;else if(Hw(r)){o=new Array(r.length);let h=-1;const u=r.length;for(;++h<u;)o[h]=r[h]}}else Vs(a)?(o=r??{},typeof r!="function"&&typeof r=="object"||(o={})):l=!1;l&&jw(o,a,i,s),mF(n,e,o)}function mF(n,t,e){(e!==void 0&&!C4(n[t],e)||e===void 0&&!(t in n))&&(n[t]=e)}function C4(n,t){return n===t||Number.isNaN(n)&&Number.isNaN(t)}function Z(n,...t){let e=-1;const i=t.length;for(;++e<i;)jw(n,t[e],!0);return n}function el(n,t){if(!n||!Vs(n))return n;const e={};return Object.keys(n).forEach(i=>{const s=n[i];let r=!1;t.forEach(a=>{(vt(a)&&a===i||a instanceof RegExp&&i.match(a))&&(r=!0)}),r||(e[i]=s)}),e}function hP(n){return Object.prototype.toString.call(n)}function uP(n){return Object.keys(n)}function ee(n,t,e){if(n===t)return!0;if(typeof n!=typeof t||n==null||t==null)return!1;if(Number.isNaN(n)&&Number.isNaN(t))return!0;if(hP(n)!==hP(t)||G(n)||typeof n!="object")return!1;if(V(n)){if(n.length!==t.length)return!1;for(let r=n.length-1;r>=0;r--)if(!ee(n[r],t[r]))return!1;return!0}if(!Vs(n))return!1;const i=uP(n),s=uP(t);if(i.length!==s.length)return!1;i.sort(),s.sort();for(let r=i.length-1;r>=0;r--)if(i[r]!=s[r])return!1;for(let r=i.length-1;r>=0;r--){const a=i[r];if(!ee(n[a],t[a]))return!1}return!0}function P4(n){if(!n)return[];if(Object.keys)return Object.keys(n);const t=[];for(const e in n)n.hasOwnProperty(e)&&t.push(e);return t}function R4(n,t,e){const i=P4(t);for(let s=0;s<i.length;s++){const r=i[s];(e?t[r]!=null:n[r]==null)&&(n[r]=t[r])}return n}function se(n,t,e=!0){if(n="prototype"in n?n.prototype:n,t="prototype"in t?t.prototype:t,Object.getOwnPropertyNames){const i=Object.getOwnPropertyNames(t);for(let s=0;s<i.length;s++){const r=i[s];r!=="constructor"&&(e?t[r]!=null:n[r]==null)&&(n[r]=t[r])}}else R4(n,t,e)}function N(n){return P(n)?V(n)?n:[n]:[]}function zt(n){if(Hw(n))return n[n.length-1]}const Ye=(n,t)=>{var e;if(n.length===0)return;let i=n[0];for(let s=1;s<n.length;s++){const r=n[s];((e=t==null?void 0:t(r,i))!==null&&e!==void 0?e:r-i)>0&&(i=r)}return i},gi=(n,t)=>{var e;if(n.length===0)return;let i=n[0];for(let s=1;s<n.length;s++){const r=n[s];((e=t==null?void 0:t(r,i))!==null&&e!==void 0?e:r-i)<0&&(i=r)}return i};function __(n,t){if(!V(n)||!V(t)||n.length!==t.length)return!1;for(let e=0;e<n.length;e++)if(n[e]!==t[e])return!1;return!0}function E4(n){return n&&V(n)?Array.from(new Set(N(n))):n}function vF(n,t=Math.random){let e,i,s=n.length;for(;s;)e=Math.floor(t()*s),i=n[--s],n[s]=n[e],n[e]=i;return n}function x1(n){if(!V(n))return[n];const t=[];for(const e of n)t.push(...x1(e));return t}function yF(n,t,e){P(t)||(t=n,n=0),P(e)||(e=1);let i=-1;const s=0|Math.max(0,Math.ceil((t-n)/e)),r=new Array(s);for(;++i<s;)r[i]=n+i*e;return r}function bF(n,t){return n<t?-1:n>t?1:n>=t?0:NaN}function Do(n){return Number(n)}function Zh(n,t,e=Do){const i=n.length;if(!i)return;if(t<=0||i<2)return e(n[0],0,n);if(t>=1)return e(n[i-1],i-1,n);const s=(i-1)*t,r=Math.floor(s),a=e(n[r],r,n);return a+(e(n[r+1],r+1,n)-a)*(s-r)}const B4=typeof console<"u";function m_(n,t,e){const i=[t].concat([].slice.call(e));B4&&console[n].apply(console,i)}var ks;(function(n){n[n.None=0]="None",n[n.Error=1]="Error",n[n.Warn=2]="Warn",n[n.Info=3]="Info",n[n.Debug=4]="Debug"})(ks||(ks={}));class Xt{static getInstance(t,e){return Xt._instance&&it(t)?Xt._instance.level(t):Xt._instance||(Xt._instance=new Xt(t,e)),Xt._instance}static setInstance(t){return Xt._instance=t}static setInstanceLevel(t){Xt._instance?Xt._instance.level(t):Xt._instance=new Xt(t)}static clearInstance(){Xt._instance=null}constructor(t=ks.None,e){this._onErrorHandler=[],this._level=t,this._method=e}addErrorHandler(t){this._onErrorHandler.find(e=>e===t)||this._onErrorHandler.push(t)}removeErrorHandler(t){const e=this._onErrorHandler.findIndex(i=>i===t);e<0||this._onErrorHandler.splice(e,1)}callErrorHandler(...t){this._onErrorHandler.forEach(e=>e(...t))}canLogInfo(){return this._level>=ks.Info}canLogDebug(){return this._level>=ks.Debug}canLogError(){return this._level>=ks.Error}canLogWarn(){return this._level>=ks.Warn}level(t){return arguments.length?(this._level=+t,this):this._level}error(...t){var e;return this._level>=ks.Error&&(this._onErrorHandler.length?this.callErrorHandler(...t):m_((e=this._method)!==null&&e!==void 0?e:"error","ERROR",t)),this}warn(...t){return this._level>=ks.Warn&&m_(this._method||"warn","WARN",t),this}info(...t){return this._level>=ks.Info&&m_(this._method||"log","INFO",t),this}debug(...t){return this._level>=ks.Debug&&m_(this._method||"log","DEBUG",t),this}}Xt._instance=null;function xF(n,t,e=0,i){for(O(i)&&(i=n.length);e<i;){const s=e+i>>>1;bF(n[s],t)>0?i=s:e=s+1}return e}const dP=(n,t)=>SF(0,n.length,e=>t(n[e])),SF=(n,t,e)=>{let i=n,s=t;for(;i<s;){const r=Math.floor((i+s)/2);e(r)>=0?s=r:i=r+1}return i},O4=(n,t)=>{let e=n;return e=n.sort(bF),Zh(e,.5)},L4=1e-10,I4=1e-10;function Xe(n,t,e=I4,i=L4){const s=i,r=e*Math.max(n,t);return Math.abs(n-t)<=Math.max(s,r)}function Ma(n,t,e,i){return n>t&&!Xe(n,t,e,i)}function Fr(n,t,e,i){return n<t&&!Xe(n,t,e,i)}const Af=n=>{let t=null,e=null;return(...i)=>(t&&i.every((s,r)=>s===t[r])||(t=i,e=n(...i)),e)},te=function(n,t,e){return n<t?t:n>e?e:n},El=(n,t,e)=>{let[i,s]=n;s<i&&(i=n[1],s=n[0]);const r=s-i;return r>=e-t?[t,e]:(i=Math.min(Math.max(i,t),e-r),[i,i+r])};function bd(n,t){let e;return n>t&&(e=n,n=t,t=e),i=>Math.max(n,Math.min(t,i))}let Qm=!1;try{Qm=typeof requestAnimationFrame=="function"&&typeof cancelAnimationFrame=="function"}catch{Qm=!1}function Ch(n,t,e){let i,s,r,a,o,l,h=0,u=!1,d=!1,c=!0;const p=!t&&t!==0&&Qm;if(typeof n!="function")throw new TypeError("Expected a function");function g(b){const x=i,S=s;return i=s=void 0,h=b,a=n.apply(S,x),a}function f(b,x){return p?(cancelAnimationFrame(o),requestAnimationFrame(b)):setTimeout(b,x)}function _(b){const x=b-l;return l===void 0||x>=t||x<0||d&&b-h>=r}function m(){const b=Date.now();if(_(b))return v(b);o=f(m,function(x){const S=x-h,k=t-(x-l);return d?Math.min(k,r-S):k}(b))}function v(b){return o=void 0,c&&i?g(b):(i=s=void 0,a)}function y(...b){const x=Date.now(),S=_(x);if(i=b,s=this,l=x,S){if(o===void 0)return function(k){return h=k,o=f(m,t),u?g(k):a}(l);if(d)return o=f(m,t),g(l)}return o===void 0&&(o=f(m,t)),a}return t=+t||0,kt(e)&&(u=!!e.leading,d="maxWait"in e,d&&(r=Math.max(U(e.maxWait)?e.maxWait:0,t)),c="trailing"in e?!!e.trailing:c),y.cancel=function(){o!==void 0&&function(b){if(p)return cancelAnimationFrame(b);clearTimeout(b)}(o),h=0,i=l=s=o=void 0},y.flush=function(){return o===void 0?a:v(Date.now())},y.pending=function(){return o!==void 0},y}Qm=!1;function ho(n,t,e){let i=!0,s=!0;if(typeof n!="function")throw new TypeError("Expected a function");return kt(e)&&(i="leading"in e?!!e.leading:i,s="trailing"in e?!!e.trailing:s),Ch(n,t,{leading:i,trailing:s,maxWait:t})}function _m(n,t){return e=>n*(1-e)+t*e}function D4(n,t){return function(e){return Math.round(n*(1-e)+t*e)}}function F4(n,t){const e=n.valueOf(),i=t.valueOf(),s=new Date;return r=>(s.setTime(e*(1-r)+i*r),s)}function Ql(n){if(U(n))return n;const t=+n;return U(t)?t:0}function z4(n){return parseFloat("0."+Math.sin(n).toString().substring(6))}const H4=1664525,j4=1013904223,cP=4294967296;function N4(n=1){let t=n;return()=>(t=(H4*t+j4)%cP)/cP}const V4=()=>{let n=-1;const t=[0,.1,.2,.3,.4,.5,.6,.7,.8,.9];return()=>(n=(n+1)%t.length,t[n])},W4=n=>t=>Ot(t,n),pP=(n,t={})=>{if(G(n))return n;const e=[n];return(t&&t.get||W4)(e)},xd=(n,t={})=>{if(V(n)){const e=n.map(i=>pP(i,t));return i=>e.map(s=>s(i))}return pP(n,t)},bn=n=>n?typeof n=="string"||typeof n=="number"?()=>n:G(n)?n:t=>t[n.field]:null,hr=(n,t)=>O(n)?t:vt(n)?t*parseFloat(n)/100:n,U4=n=>0,gP=(n,t)=>{const e=G(t)?t:r=>r;let i,s;if(n&&n.length){const r=n.length;for(let a=0;a<r;a+=1){let o=e(n[a]);O(o)||!it(o=+o)||Number.isNaN(o)||(O(i)?(i=o,s=o):(i=Math.min(i,o),s=Math.max(s,o)))}return[i,s]}return[i,s]};function G4(n){if(n<=0||n>=1)return 0;const t=-.00778489400243029,e=-.322396458041136,i=-2.40075827716184,s=-2.54973253934373,r=4.37466414146497,a=2.93816398269878,o=.00778469570904146,l=.32246712907004,h=2.445134137143,u=3.75440866190742;let d,c;return n<.02425?(d=Math.sqrt(-2*Math.log(n)),(((((t*d+e)*d+i)*d+s)*d+r)*d+a)/((((o*d+l)*d+h)*d+u)*d+1)):n<=.97575?(d=n-.5,c=d*d,(((((-39.6968302866538*c+220.946098424521)*c-275.928510446969)*c+138.357751867269)*c-30.6647980661472)*c+2.50662827745924)*d/(((((-54.4760987982241*c+161.585836858041)*c-155.698979859887)*c+66.8013118877197)*c-13.2806815528857)*c+1)):(d=Math.sqrt(-2*Math.log(1-n)),-(((((t*d+e)*d+i)*d+s)*d+r)*d+a)/((((o*d+l)*d+h)*d+u)*d+1))}function $4(n,t,e,i){let s=1/0,r=-1/0,a=0,o=0;for(let d=0;d<n.length;d++){const c=n[d];let p=t(c),g=e(c);!O(p)&&(p=+p)>=p&&!O(g)&&(g=+g)>=g&&(p<s&&(s=p),p>r&&(r=p),a++,o+=p)}if(a===0)return{min:s,max:r,n:a,X:0,SSE:0,Sxx:0};const l=o/a;let h=0,u=0;for(let d=0;d<n.length;d++){const c=n[d];let p=t(c),g=e(c);if(!O(p)&&(p=+p)>=p&&!O(g)&&(g=+g)>=g){const f=g-i(p);h+=f*f;const _=p-l;u+=_*_}}return{min:s,max:r,n:a,X:l,SSE:h,Sxx:u}}function fP(n,t){const{n:e,X:i,Sxx:s,SSE:r}=t,a=e>2?r/(e-2):0;return{seMean:s>0?Math.sqrt(a*(1/e+(n-i)*(n-i)/s)):Math.sqrt(a/e),sePred:Math.sqrt(a*(1+1/e+(s>0?(n-i)*(n-i)/s:0)))}}function Y4(n,t,e,i){const s=i-n*n;if(Math.abs(s)<Number.EPSILON)return{a:t,b:0};const r=(e-n*t)/s;return{a:t-r*n,b:r}}function X4(n,t,e,i){for(let s=0;s<n.length;s++){const r=n[s];let a=t(r),o=e(r);!O(a)&&(a=+a)>=a&&!O(o)&&(o=+o)>=o&&i(a,o,s)}}function K4(n,t,e,i,s){let r=0,a=0;for(let o=0;o<n.length;o++){const l=n[o];let h=e(l);if(!O(h)&&(h=+h)>=h){const u=h-s(t(l));r+=u*u;const d=h-i;a+=d*d}}return a===0?0:1-r/a}function q4(n,t=s=>s.x,e=s=>s.y,i){var s;const r=(s=i==null?void 0:i.alpha)!==null&&s!==void 0?s:.05;let a=0,o=0,l=0,h=0,u=0;X4(n,t,e,(f,_)=>{a++,o+=(f-o)/a,l+=(_-l)/a,h+=(f*_-h)/a,u+=(f*f-u)/a});const{a:d,b:c}=Y4(o,l,h,u),p=f=>d+c*f,g=$4(n,t,e,p);return{coef:{a:d,b:c},predict:p,rSquared:K4(n,t,e,l,p),evaluateGrid:function(f){const _=[];if(g.n===0||f<=0)return _;if(g.min===g.max){for(let v=0;v<f;v++)_.push({x:g.min,y:p(g.min)});return _}const m=(g.max-g.min)/(f-1);for(let v=0;v<f;v++){const y=v===f-1?g.max:g.min+m*v;_.push({x:y,y:p(y)})}return _},confidenceInterval:function(f=50){const _=[];if(g.n===0||f<=0)return _;const m=G4(1-r/2);if(g.min===g.max){const y=p(g.min),b=fP(g.min,g);for(let x=0;x<f;x++)_.push({x:g.min,mean:y,lower:y-m*b.seMean,upper:y+m*b.seMean,predLower:y-m*b.sePred,predUpper:y+m*b.sePred});return _}const v=(g.max-g.min)/(f-1);for(let y=0;y<f;y++){const b=y===f-1?g.max:g.min+v*y,x=p(b),S=fP(b,g);_.push({x:b,mean:x,lower:x-m*S.seMean,upper:x+m*S.seMean,predLower:x-m*S.sePred,predUpper:x+m*S.sePred})}return _}}}const Se=1e-12,ne=Math.PI,Ls=ne/2,qi=2*ne,Tt=2*Math.PI,jt=Math.abs,le=Math.atan2,bi=Math.cos,Zi=Math.max,ki=Math.min,He=Math.sin,kr=Math.sqrt,zh=Math.pow;function Z4(n){return n>1?0:n<-1?ne:Math.acos(n)}function _P(n){return n>=1?Ls:n<=-1?-Ls:Math.asin(n)}function mP(n,t,e,i,s){let r=e,a=i;return typeof n=="number"&&typeof e=="number"&&(r=(1-s)*n+s*e),typeof t=="number"&&typeof i=="number"&&(a=(1-s)*t+s*i),{x:r,y:a}}function S1(n,t){return n[0]*t[1]-n[1]*t[0]}function Q4(n,t){return jt(n[0]-t[0])+jt(n[1]-t[1])<1e-12}function AF(n,t=10){return Math.round(n*t)/t}function Sd(n){const t=n.toString().split(/[eE]/),e=(t[0].split(".")[1]||"").length-(+t[1]||0);return e>0?e:0}function Qr(n,t){return AF(n+t,10**Math.max(Sd(n),Sd(t)))}function vg(n,t){return AF(n-t,10**Math.max(Sd(n),Sd(t)))}class he{constructor(t=0,e=0,i,s){this.x=0,this.y=0,this.x=t,this.y=e,this.x1=i,this.y1=s}clone(){return new he(this.x,this.y)}copyFrom(t){return this.x=t.x,this.y=t.y,this.x1=t.x1,this.y1=t.y1,this.defined=t.defined,this.context=t.context,this}set(t,e){return this.x=t,this.y=e,this}add(t){return it(t)?(this.x+=t,void(this.y+=t)):(this.x+=t.x,this.y+=t.y,this)}sub(t){return it(t)?(this.x-=t,void(this.y-=t)):(this.x-=t.x,this.y-=t.y,this)}multi(t){throw new Error("暂不支持")}div(t){throw new Error("暂不支持")}}class Si{static distancePP(t,e){return kr(zh(t.x-e.x,2)+zh(t.y-e.y,2))}static distanceNN(t,e,i,s){return kr(zh(t-i,2)+zh(e-s,2))}static distancePN(t,e,i){return kr(zh(e-t.x,2)+zh(i-t.y,2))}static pointAtPP(t,e,i){return new he((e.x-t.x)*i+t.x,(e.y-t.y)*i+t.y)}}function de(n){return n*(Math.PI/180)}function Nw(n){return 180*n/Math.PI}const J4=(n=0)=>{if(n<0)for(;n<-qi;)n+=qi;else if(n>0)for(;n>qi;)n-=qi;return n},tG=J4;function _e(n,t,e){return t?{x:n.x+t*Math.cos(e),y:n.y+t*Math.sin(e)}:{x:n.x,y:n.y}}function yg(n,t={x:0,y:0},e=0,i=2*Math.PI){const{x:s,y:r}=n,{x:a,y:o}=t;let l=s-a,h=r-o;const u=Math.sqrt(l*l+h*h);if(u===0)return{radius:0,angle:0};l/=u,h/=u;let d=Math.atan2(h,l);if(d<e)for(;d<=e;)d+=2*Math.PI;if(d>i)for(;d>=i;)d-=2*Math.PI;return{radius:u,angle:d}}function kF(n,t){return Math.atan2(t.y-n.y,t.x-n.x)}function il(n){for(;n<0;)n+=2*Math.PI;for(;n>=2*Math.PI;)n-=2*Math.PI;return n}function eG(n,t){const e=Math.abs(t-n);if(e>=2*Math.PI||2*Math.PI-e<1e-6)return[0,Math.PI/2,Math.PI,1.5*Math.PI];const i=il(Math.min(n,t)),s=i+e,r=[i,s];let a=Math.floor(i/Math.PI)*Math.PI/2;for(;a<s;)a>i&&r.push(a),a+=Math.PI/2;return r}function iG(n,t,e,i){const{x:s,y:r}=t,a=eG(e,i),{width:o,height:l}=n,h=[];return a.forEach(u=>{const d=Math.sin(u),c=Math.cos(u);d===1?h.push(l-r):d===-1?h.push(r):c===1?h.push(o-s):c===-1?h.push(s):(d>0?h.push(Math.abs((l-r)/d)):h.push(Math.abs(r/d)),c>0?h.push(Math.abs((o-s)/c)):h.push(Math.abs(s/c)))}),Math.min.apply(null,h)}function wF(n){return(n=il(n))>0&&n<=Math.PI/2?2:n>Math.PI/2&&n<=Math.PI?3:n>Math.PI&&n<=3*Math.PI/2?4:1}function Tx(n,t,e){n[0]=t[0]-e[0],n[1]=t[1]-e[1]}function TF(n,t,e,i){let s=n[0],r=t[0],a=e[0],o=i[0];return r<s&&([s,r]=[r,s]),o<a&&([o,a]=[a,o]),!(r<a||o<s)&&(s=n[1],r=t[1],a=e[1],o=i[1],r<s&&([s,r]=[r,s]),o<a&&([o,a]=[a,o]),!(r<a||o<s))}function MF(n,t,e,i){if(!TF(n,t,e,i))return!1;const s=[0,0],r=[0,0],a=[0,0];if(Tx(s,t,n),Tx(r,i,e),Q4(s,r))return!0;Tx(a,e,n);const o=S1(a,r)/S1(s,r);return o>=0&&o<=1&&[n[0]+s[0]*o,n[1]+s[1]*o]}function CF(n,t,e){if(n===null)return t;if(t===null)return n;const{x11:i,x12:s,y11:r,y12:a,x21:o,x22:l,y21:h,y22:u}=Vw(n,t,e);return i>=l||s<=o||r>=u||a<=h?{x1:0,y1:0,x2:0,y2:0}:{x1:Math.max(i,o),y1:Math.max(r,h),x2:Math.min(s,l),y2:Math.min(a,u)}}var mu;(function(n){n[n.NONE=0]="NONE",n[n.BBOX1=1]="BBOX1",n[n.BBOX2=2]="BBOX2"})(mu||(mu={}));const Vw=(n,t,e)=>{let i=n.x1,s=n.x2,r=n.y1,a=n.y2,o=t.x1,l=t.x2,h=t.y1,u=t.y2;return e&&(i>s&&([i,s]=[s,i]),r>a&&([r,a]=[a,r]),o>l&&([o,l]=[l,o]),h>u&&([h,u]=[u,h])),{x11:i,x12:s,y11:r,y12:a,x21:o,x22:l,y21:h,y22:u}};function nG(n,t,e){if(!n||!t)return mu.NONE;const{x11:i,x12:s,y11:r,y12:a,x21:o,x22:l,y21:h,y22:u}=Vw(n,t,e);return i>o&&s<l&&r>h&&a<u?mu.BBOX1:o>i&&l<s&&h>r&&u<a?mu.BBOX2:mu.NONE}function bg(n,t,e){if(n&&t){if(!e)return!(n.x1>t.x2||n.x2<t.x1||n.y1>t.y2||n.y2<t.y1);const{x11:i,x12:s,y11:r,y12:a,x21:o,x22:l,y21:h,y22:u}=Vw(n,t,!0);return!(i>l||s<o||r>u||a<h)}return!0}function op(n,t,e){if(!t)return!0;if(!e)return n.x>=t.x1&&n.x<=t.x2&&n.y>=t.y1&&n.y<=t.y2;let i=t.x1,s=t.x2,r=t.y1,a=t.y2;return i>s&&([i,s]=[s,i]),r>a&&([r,a]=[a,r]),n.x>=i&&n.x<=s&&n.y>=r&&n.y<=a}function Mx(n,t){return Math.abs(t[0]*n[0]+t[1]*n[1])}function Jr({x:n,y:t},e,i={x:0,y:0}){return{x:(n-i.x)*Math.cos(e)-(t-i.y)*Math.sin(e)+i.x,y:(n-i.x)*Math.sin(e)+(t-i.y)*Math.cos(e)+i.y}}function A1(n){return{x:(n.x1+n.x2)/2,y:(n.y1+n.y2)/2}}function vP(n,t){const e=t?de(n.angle):n.angle,i=A1(n);return[Jr({x:n.x1,y:n.y1},e,i),Jr({x:n.x2,y:n.y1},e,i),Jr({x:n.x2,y:n.y2},e,i),Jr({x:n.x1,y:n.y2},e,i)]}function PF(n,t,e=!1){const i=vP(n,e),s=vP(t,e),r=(_,m)=>[m.x-_.x,m.y-_.y],a=r(A1(n),A1(t)),o=r(i[0],i[1]),l=r(i[1],i[2]),h=r(s[0],s[1]),u=r(s[1],s[2]),d=e?de(n.angle):n.angle;let c=e?de(90-n.angle):n.angle+Ls;const p=e?de(t.angle):t.angle;let g=e?de(90-t.angle):t.angle+Ls;c>Tt&&(c-=Tt),g>Tt&&(g-=Tt);const f=(_,m,v,y)=>{const b=[Math.cos(m),Math.sin(m)];return _+(Mx(b,v)+Mx(b,y))/2>Mx(b,a)};return f((n.x2-n.x1)/2,d,h,u)&&f((n.y2-n.y1)/2,c,h,u)&&f((t.x2-t.x1)/2,p,o,l)&&f((t.y2-t.y1)/2,g,o,l)}const sG=1e-8;function rG(n,t,e,i,s){for(let r=0,a=s[s.length-1];r<s.length;r++){const o=s[r];if(TF([n,t],[e,i],[o.x,o.y],[a.x,a.y]))return!0;a=o}return!1}function RF(n,t,e){let i=0,s=n[0];if(!s)return!1;for(let a=1;a<n.length;a++){const o=n[a];i+=Ca(s.x,s.y,o.x,o.y,t,e),s=o}const r=n[0];return yP(s.x,r.x)&&yP(s.y,r.y)||(i+=Ca(s.x,s.y,r.x,r.y,t,e)),i!==0}function Ca(n,t,e,i,s,r){if(r>t&&r>i||r<t&&r<i||i===t)return 0;const a=(r-t)/(i-t);let o=i<t?1:-1;a!==1&&a!==0||(o=i<t?.5:-.5);const l=a*(e-n)+n;return l===s?1/0:l>s?o:0}function yP(n,t){return Math.abs(n-t)<sG}function aG(n,t){for(let e=0;e<t.length;e++)if(RF(n,t[e].x,t[e].y)||e>0&&rG(t[e-1].x,t[e-1].y,t[e].x,t[e].y,n))return!0;return!1}const bP=n=>{let t=n.charCodeAt(0),e=n.length===2?n.charCodeAt(1):0,i=t;return 55296<=t&&t<=56319&&56320<=e&&e<=57343&&(t&=1023,e&=1023,i=t<<10|e,i+=65536),i===12288||65281<=i&&i<=65376||65504<=i&&i<=65510?"F":i===8361||65377<=i&&i<=65470||65474<=i&&i<=65479||65482<=i&&i<=65487||65490<=i&&i<=65495||65498<=i&&i<=65500||65512<=i&&i<=65518?"H":4352<=i&&i<=4447||4515<=i&&i<=4519||4602<=i&&i<=4607||9001<=i&&i<=9002||11904<=i&&i<=11929||11931<=i&&i<=12019||12032<=i&&i<=12245||12272<=i&&i<=12283||12289<=i&&i<=12350||12353<=i&&i<=12438||12441<=i&&i<=12543||12549<=i&&i<=12589||12593<=i&&i<=12686||12688<=i&&i<=12730||12736<=i&&i<=12771||12784<=i&&i<=12830||12832<=i&&i<=12871||12880<=i&&i<=13054||13056<=i&&i<=19903||19968<=i&&i<=42124||42128<=i&&i<=42182||43360<=i&&i<=43388||44032<=i&&i<=55203||55216<=i&&i<=55238||55243<=i&&i<=55291||63744<=i&&i<=64255||65040<=i&&i<=65049||65072<=i&&i<=65106||65108<=i&&i<=65126||65128<=i&&i<=65131||110592<=i&&i<=110593||127488<=i&&i<=127490||127504<=i&&i<=127546||127552<=i&&i<=127560||127568<=i&&i<=127569||131072<=i&&i<=194367||177984<=i&&i<=196605||196608<=i&&i<=262141?"W":32<=i&&i<=126||162<=i&&i<=163||165<=i&&i<=166||i===172||i===175||10214<=i&&i<=10221||10629<=i&&i<=10630?"Na":i===161||i===164||167<=i&&i<=168||i===170||173<=i&&i<=174||176<=i&&i<=180||182<=i&&i<=186||188<=i&&i<=191||i===198||i===208||215<=i&&i<=216||222<=i&&i<=225||i===230||232<=i&&i<=234||236<=i&&i<=237||i===240||242<=i&&i<=243||247<=i&&i<=250||i===252||i===254||i===257||i===273||i===275||i===283||294<=i&&i<=295||i===299||305<=i&&i<=307||i===312||319<=i&&i<=322||i===324||328<=i&&i<=331||i===333||338<=i&&i<=339||358<=i&&i<=359||i===363||i===462||i===464||i===466||i===468||i===470||i===472||i===474||i===476||i===593||i===609||i===708||i===711||713<=i&&i<=715||i===717||i===720||728<=i&&i<=731||i===733||i===735||768<=i&&i<=879||913<=i&&i<=929||931<=i&&i<=937||945<=i&&i<=961||963<=i&&i<=969||i===1025||1040<=i&&i<=1103||i===1105||i===8208||8211<=i&&i<=8214||8216<=i&&i<=8217||8220<=i&&i<=8221||8224<=i&&i<=8226||8228<=i&&i<=8231||i===8240||8242<=i&&i<=8243||i===8245||i===8251||i===8254||i===8308||i===8319||8321<=i&&i<=8324||i===8364||i===8451||i===8453||i===8457||i===8467||i===8470||8481<=i&&i<=8482||i===8486||i===8491||8531<=i&&i<=8532||8539<=i&&i<=8542||8544<=i&&i<=8555||8560<=i&&i<=8569||i===8585||8592<=i&&i<=8601||8632<=i&&i<=8633||i===8658||i===8660||i===8679||i===8704||8706<=i&&i<=8707||8711<=i&&i<=8712||i===8715||i===8719||i===8721||i===8725||i===8730||8733<=i&&i<=8736||i===8739||i===8741||8743<=i&&i<=8748||i===8750||8756<=i&&i<=8759||8764<=i&&i<=8765||i===8776||i===8780||i===8786||8800<=i&&i<=8801||8804<=i&&i<=8807||8810<=i&&i<=8811||8814<=i&&i<=8815||8834<=i&&i<=8835||8838<=i&&i<=8839||i===8853||i===8857||i===8869||i===8895||i===8978||9312<=i&&i<=9449||9451<=i&&i<=9547||9552<=i&&i<=9587||9600<=i&&i<=9615||9618<=i&&i<=9621||9632<=i&&i<=9633||9635<=i&&i<=9641||9650<=i&&i<=9651||9654<=i&&i<=9655||9660<=i&&i<=9661||9664<=i&&i<=9665||9670<=i&&i<=9672||i===9675||9678<=i&&i<=9681||9698<=i&&i<=9701||i===9711||9733<=i&&i<=9734||i===9737||9742<=i&&i<=9743||9748<=i&&i<=9749||i===9756||i===9758||i===9792||i===9794||9824<=i&&i<=9825||9827<=i&&i<=9829||9831<=i&&i<=9834||9836<=i&&i<=9837||i===9839||9886<=i&&i<=9887||9918<=i&&i<=9919||9924<=i&&i<=9933||9935<=i&&i<=9953||i===9955||9960<=i&&i<=9983||i===10045||i===10071||10102<=i&&i<=10111||11093<=i&&i<=11097||12872<=i&&i<=12879||57344<=i&&i<=63743||65024<=i&&i<=65039||i===65533||127232<=i&&i<=127242||127248<=i&&i<=127277||127280<=i&&i<=127337||127344<=i&&i<=127386||917760<=i&&i<=917999||983040<=i&&i<=1048573||1048576<=i&&i<=1114109?"A":"N"};function Jm(n,t={},e){e||(e=1);const{fontStyle:i=t.fontStyle,fontVariant:s=t.fontVariant,fontWeight:r=t.fontWeight,fontSize:a=t.fontSize,fontFamily:o=t.fontFamily}=n;return(i?i+" ":"")+(s?s+" ":"")+(r?r+" ":"")+a*e+"px "+(o||"sans-serif")}class pn{constructor(t,e){this._numberCharSize=null,this._fullCharSize=null,this._letterCharSize=null,this._specialCharSizeMap={},this._canvas=null,this._context=null,this._contextSaved=!1,this._notSupportCanvas=!1,this._notSupportVRender=!1,this._userSpec={},this.specialCharSet=`-/: .,@%'"~`,this._option=t,this._userSpec=e??{},this.textSpec=this._initSpec(),P(t.specialCharSet)&&(this.specialCharSet=t.specialCharSet),this._standardMethod=P(t.getTextBounds)?this.fullMeasure.bind(this):this.measureWithNaiveCanvas.bind(this)}initContext(){if(this._notSupportCanvas)return!1;if(O(this._canvas)&&(P(this._option.getCanvasForMeasure)&&(this._canvas=this._option.getCanvasForMeasure()),O(this._canvas)&&typeof window<"u"&&window.document!==void 0&&globalThis&&P(globalThis.document)&&(this._canvas=globalThis.document.createElement("canvas"))),O(this._context)&&P(this._canvas)){const t=this._canvas.getContext("2d");P(t)&&(t.save(),t.font=Jm(this.textSpec),this._contextSaved=!0,this._context=t)}return!O(this._context)||(this._notSupportCanvas=!0,!1)}_initSpec(){var t,e,i;const{defaultFontParams:s={}}=this._option,{fontStyle:r=s.fontStyle,fontVariant:a=s.fontVariant,fontWeight:o=(t=s.fontWeight)!==null&&t!==void 0?t:"normal",fontSize:l=(e=s.fontSize)!==null&&e!==void 0?e:12,fontFamily:h=(i=s.fontFamily)!==null&&i!==void 0?i:"sans-serif",align:u,textAlign:d=u??"center",baseline:c,textBaseline:p=c??"middle",ellipsis:g,limit:f}=this._userSpec;let{lineHeight:_=l}=this._userSpec;if(vt(_)&&_[_.length-1]==="%"){const m=Number.parseFloat(_.substring(0,_.length-1))/100;_=l*m}return{fontStyle:r,fontVariant:a,fontFamily:h,fontSize:l,fontWeight:o,textAlign:d,textBaseline:p,ellipsis:g,limit:f,lineHeight:_}}measure(t,e){switch(e){case"vrender":case"canopus":return this.fullMeasure(t);case"canvas":return this.measureWithNaiveCanvas(t);case"simple":return this.quickMeasureWithoutCanvas(t);default:return this.quickMeasure(t)}}fullMeasure(t){if(O(t))return{width:0,height:0};if(O(this._option.getTextBounds)||!this._notSupportVRender)return this.measureWithNaiveCanvas(t);const{fontFamily:e,fontSize:i,fontWeight:s,textAlign:r,textBaseline:a,ellipsis:o,limit:l,lineHeight:h}=this.textSpec;let u;try{const d=this._option.getTextBounds({text:t,fontFamily:e,fontSize:i,fontWeight:s,textAlign:r,textBaseline:a,ellipsis:!!o,maxLineWidth:l||1/0,lineHeight:h});u={width:d.width(),height:d.height()}}catch{this._notSupportVRender=!0,u=this.measureWithNaiveCanvas(t)}return u}measureWithNaiveCanvas(t){return this._measureReduce(t,this._measureWithNaiveCanvas.bind(this))}_measureWithNaiveCanvas(t){var e;if(!this.initContext())return this._quickMeasureWithoutCanvas(t);const i=this._context.measureText(t),{fontSize:s,lineHeight:r}=this.textSpec;return{width:i.width,height:(e=r)!==null&&e!==void 0?e:s,fontBoundingBoxAscent:i.fontBoundingBoxAscent,fontBoundingBoxDescent:i.fontBoundingBoxDescent}}quickMeasure(t){return this._measureReduce(t,this._quickMeasure.bind(this))}_quickMeasure(t){const e={width:0,height:0};for(let i=0;i<t.length;i++){const s=t[i];let r=this._measureSpecialChar(s);O(r)&&pn.NUMBERS_CHAR_SET.includes(s)&&(r=this._measureNumberChar()),O(r)&&["F","W"].includes(bP(s))&&(r=this._measureFullSizeChar()),O(r)&&(r=this._measureLetterChar()),e.width+=r.width,e.height=Math.max(e.height,r.height),!O(r.fontBoundingBoxAscent)&&(e.fontBoundingBoxAscent=r.fontBoundingBoxAscent),!O(r.fontBoundingBoxDescent)&&(e.fontBoundingBoxDescent=r.fontBoundingBoxDescent)}return e}quickMeasureWithoutCanvas(t){return this._measureReduce(t,this._quickMeasureWithoutCanvas.bind(this))}_quickMeasureWithoutCanvas(t){var e;const i={width:0,height:0},{fontSize:s,lineHeight:r}=this.textSpec;for(let a=0;a<t.length;a++){const o=t[a],l=["F","W"].includes(bP(o))?1:.53;i.width+=l*s}return i.height=(e=r)!==null&&e!==void 0?e:s,i}_measureReduce(t,e){var i;const{fontSize:s,lineHeight:r}=this.textSpec,a={width:0,height:0};if(O(t))return a;if(V(t)){const o=t.filter(P).map(l=>l.toString());return o.length===0?a:o.length===1?e(o[0]):{width:o.reduce((l,h)=>Math.max(l,e(h).width),0),height:o.length*(((i=r)!==null&&i!==void 0?i:s)+1)+1}}return e(t.toString())}_measureNumberChar(){if(O(this._numberCharSize)){const t=this._standardMethod(pn.NUMBERS_CHAR_SET);this._numberCharSize={width:t.width/pn.NUMBERS_CHAR_SET.length,height:t.height,fontBoundingBoxAscent:t.fontBoundingBoxAscent,fontBoundingBoxDescent:t.fontBoundingBoxDescent}}return this._numberCharSize}_measureFullSizeChar(){return O(this._fullCharSize)&&(this._fullCharSize=this._standardMethod(pn.FULL_SIZE_CHAR)),this._fullCharSize}_measureLetterChar(){if(O(this._letterCharSize)){const t=this._standardMethod(pn.ALPHABET_CHAR_SET);this._letterCharSize={width:t.width/pn.ALPHABET_CHAR_SET.length,height:t.height,fontBoundingBoxAscent:t.fontBoundingBoxAscent,fontBoundingBoxDescent:t.fontBoundingBoxDescent}}return this._letterCharSize}_measureSpecialChar(t){return P(this._specialCharSizeMap[t])?this._specialCharSizeMap[t]:this.specialCharSet.includes(t)?(this._specialCharSizeMap[t]=this._standardMethod(t),this._specialCharSizeMap[t]):null}release(){P(this._canvas)&&(this._canvas=null),P(this._context)&&(this._contextSaved&&(this._context.restore(),this._contextSaved=!1),this._context=null)}}pn.ALPHABET_CHAR_SET="abcdefghijklmnopqrstuvwxyz",pn.NUMBERS_CHAR_SET="0123456789",pn.FULL_SIZE_CHAR="字";const EF=(n,t)=>{const{x1:e,x2:i,y1:s,y2:r}=n,a=Math.abs(i-e),o=Math.abs(r-s);let l=(e+i)/2,h=(s+r)/2,u=0,d=0;switch(t){case"top":case"inside-top":d=-.5;break;case"bottom":case"inside-bottom":d=.5;break;case"left":case"inside-left":u=-.5;break;case"right":case"inside-right":u=.5;break;case"top-right":u=.5,d=-.5;break;case"top-left":u=-.5,d=-.5;break;case"bottom-right":u=.5,d=.5;break;case"bottom-left":u=-.5,d=.5}return l+=u*a,h+=d*o,{x:l,y:h}},xP=(n,t)=>Math.max(t.x1-n.x2,n.x1-t.x2,t.y1-n.y2,n.y1-t.y2),oG=(n,t)=>{const e=[{x:Math.cos(n.angle),y:Math.sin(n.angle)},{x:-Math.sin(n.angle),y:Math.cos(n.angle)},{x:Math.cos(t.angle),y:Math.sin(n.angle)},{x:-Math.sin(t.angle),y:Math.cos(n.angle)}];function i(r,a,o){const l=r.getRotatedCorners().map(h=>h.x*a+h.y*o);return{min:Math.min(...l),max:Math.max(...l)}}let s=0;for(const r of e){const a=i(n,r.x,r.y),o=i(t,r.x,r.y);let l;l=a.max<o.min?o.min-a.max:o.max<a.min?a.min-o.max:0,s=Math.max(s,l)}return s};function Ww(n,t,e){const{x1:i,y1:s,x2:r,y2:a}=t;return e.onlyTranslate()?(n!==t&&n.setValue(t.x1,t.y1,t.x2,t.y2),n.translate(e.e,e.f),t):(n.clear(),n.add(e.a*i+e.c*s+e.e,e.b*i+e.d*s+e.f),n.add(e.a*r+e.c*s+e.e,e.b*r+e.d*s+e.f),n.add(e.a*r+e.c*a+e.e,e.b*r+e.d*a+e.f),n.add(e.a*i+e.c*a+e.e,e.b*i+e.d*a+e.f),t)}class Gi{constructor(t){t?this.setValue(t.x1,t.y1,t.x2,t.y2):this.clear()}clone(){return new Gi(this)}clear(){return this.x1=+Number.MAX_VALUE,this.y1=+Number.MAX_VALUE,this.x2=-Number.MAX_VALUE,this.y2=-Number.MAX_VALUE,this}empty(){return this.x1===+Number.MAX_VALUE&&this.y1===+Number.MAX_VALUE&&this.x2===-Number.MAX_VALUE&&this.y2===-Number.MAX_VALUE}equals(t){return this.x1===t.x1&&this.y1===t.y1&&this.x2===t.x2&&this.y2===t.y2}setValue(t=0,e=0,i=0,s=0){return this.x1=t,this.y1=e,this.x2=i,this.y2=s,this}set(t=0,e=0,i=0,s=0){return i<t?(this.x2=t,this.x1=i):(this.x1=t,this.x2=i),s<e?(this.y2=e,this.y1=s):(this.y1=e,this.y2=s),this}add(t=0,e=0){return t<this.x1&&(this.x1=t),e<this.y1&&(this.y1=e),t>this.x2&&(this.x2=t),e>this.y2&&(this.y2=e),this}expand(t=0){return V(t)?(this.y1-=t[0],this.x2+=t[1],this.y2+=t[2],this.x1-=t[3]):(this.x1-=t,this.y1-=t,this.x2+=t,this.y2+=t),this}round(){return this.x1=Math.floor(this.x1),this.y1=Math.floor(this.y1),this.x2=Math.ceil(this.x2),this.y2=Math.ceil(this.y2),this}translate(t=0,e=0){return this.x1+=t,this.x2+=t,this.y1+=e,this.y2+=e,this}rotate(t=0,e=0,i=0){const s=this.rotatedPoints(t,e,i);return this.clear().add(s[0],s[1]).add(s[2],s[3]).add(s[4],s[5]).add(s[6],s[7])}scale(t=0,e=0,i=0,s=0){const r=this.scalePoints(t,e,i,s);return this.clear().add(r[0],r[1]).add(r[2],r[3])}union(t){return t.x1<this.x1&&(this.x1=t.x1),t.y1<this.y1&&(this.y1=t.y1),t.x2>this.x2&&(this.x2=t.x2),t.y2>this.y2&&(this.y2=t.y2),this}intersect(t){return t.x1>this.x1&&(this.x1=t.x1),t.y1>this.y1&&(this.y1=t.y1),t.x2<this.x2&&(this.x2=t.x2),t.y2<this.y2&&(this.y2=t.y2),this}encloses(t){return t&&this.x1<=t.x1&&this.x2>=t.x2&&this.y1<=t.y1&&this.y2>=t.y2}alignsWith(t){return t&&(this.x1===t.x1||this.x2===t.x2||this.y1===t.y1||this.y2===t.y2)}intersects(t){return t&&!(this.x2<t.x1||this.x1>t.x2||this.y2<t.y1||this.y1>t.y2)}contains(t=0,e=0){return!(t<this.x1||t>this.x2||e<this.y1||e>this.y2)}containsPoint(t){return!(t.x<this.x1||t.x>this.x2||t.y<this.y1||t.y>this.y2)}width(){return this.empty()?0:this.x2-this.x1}height(){return this.empty()?0:this.y2-this.y1}scaleX(t=0){return this.x1*=t,this.x2*=t,this}scaleY(t=0){return this.y1*=t,this.y2*=t,this}transformWithMatrix(t){return Ww(this,this,t),this}copy(t){return this.x1=t.x1,this.y1=t.y1,this.x2=t.x2,this.y2=t.y2,this}rotatedPoints(t,e,i){const{x1:s,y1:r,x2:a,y2:o}=this,l=Math.cos(t),h=Math.sin(t),u=e-e*l+i*h,d=i-e*h-i*l;return[l*s-h*r+u,h*s+l*r+d,l*s-h*o+u,h*s+l*o+d,l*a-h*r+u,h*a+l*r+d,l*a-h*o+u,h*a+l*o+d]}scalePoints(t,e,i,s){const{x1:r,y1:a,x2:o,y2:l}=this;return[t*r+(1-t)*i,e*a+(1-e)*s,t*o+(1-t)*i,e*l+(1-e)*s]}}class Ie extends Gi{}class Uw extends Gi{constructor(t,e=0){var i;super(t),t&&(this.angle=(i=t.angle)!==null&&i!==void 0?i:e)}intersects(t){return PF(this,t)}setValue(t=0,e=0,i=0,s=0,r=0){return super.setValue(t,e,i,s),this.angle=r,this}clone(){return new Uw(this)}getRotatedCorners(){const t={x:(this.x1+this.x2)/2,y:(this.y1+this.y2)/2};return[Jr({x:this.x1,y:this.y1},this.angle,t),Jr({x:this.x2,y:this.y1},this.angle,t),Jr({x:this.x1,y:this.y2},this.angle,t),Jr({x:this.x2,y:this.y2},this.angle,t)]}}class ye{constructor(t=1,e=0,i=0,s=1,r=0,a=0){this.a=t,this.b=e,this.c=i,this.d=s,this.e=r,this.f=a}equalToMatrix(t){return!(this.e!==t.e||this.f!==t.f||this.a!==t.a||this.d!==t.d||this.b!==t.b||this.c!==t.c)}equalTo(t,e,i,s,r,a){return!(this.e!==r||this.f!==a||this.a!==t||this.d!==s||this.b!==e||this.c!==i)}setValue(t,e,i,s,r,a){return this.a=t,this.b=e,this.c=i,this.d=s,this.e=r,this.f=a,this}reset(){return this.a=1,this.b=0,this.c=0,this.d=1,this.e=0,this.f=0,this}getInverse(){const t=this.a,e=this.b,i=this.c,s=this.d,r=this.e,a=this.f,o=new ye,l=t*s-e*i;return o.a=s/l,o.b=-e/l,o.c=-i/l,o.d=t/l,o.e=(i*a-s*r)/l,o.f=-(t*a-e*r)/l,o}rotate(t){const e=Math.cos(t),i=Math.sin(t),s=this.a*e+this.c*i,r=this.b*e+this.d*i,a=this.a*-i+this.c*e,o=this.b*-i+this.d*e;return this.a=s,this.b=r,this.c=a,this.d=o,this}rotateByCenter(t,e,i){const s=Math.cos(t),r=Math.sin(t),a=(1-s)*e+r*i,o=(1-s)*i-r*e,l=s*this.a-r*this.b,h=r*this.a+s*this.b,u=s*this.c-r*this.d,d=r*this.c+s*this.d,c=s*this.e-r*this.f+a,p=r*this.e+s*this.f+o;return this.a=l,this.b=h,this.c=u,this.d=d,this.e=c,this.f=p,this}scale(t,e){return this.a*=t,this.b*=t,this.c*=e,this.d*=e,this}setScale(t,e){return this.b=this.b/this.a*t,this.c=this.c/this.d*e,this.a=t,this.d=e,this}transform(t,e,i,s,r,a){return this.multiply(t,e,i,s,r,a),this}translate(t,e){return this.e+=this.a*t+this.c*e,this.f+=this.b*t+this.d*e,this}transpose(){const{a:t,b:e,c:i,d:s,e:r,f:a}=this;return this.a=e,this.b=t,this.c=s,this.d=i,this.e=a,this.f=r,this}multiply(t,e,i,s,r,a){const o=this.a,l=this.b,h=this.c,u=this.d,d=o*t+h*e,c=l*t+u*e,p=o*i+h*s,g=l*i+u*s,f=o*r+h*a+this.e,_=l*r+u*a+this.f;return this.a=d,this.b=c,this.c=p,this.d=g,this.e=f,this.f=_,this}interpolate(t,e){const i=new ye;return i.a=this.a+(t.a-this.a)*e,i.b=this.b+(t.b-this.b)*e,i.c=this.c+(t.c-this.c)*e,i.d=this.d+(t.d-this.d)*e,i.e=this.e+(t.e-this.e)*e,i.f=this.f+(t.f-this.f)*e,i}transformPoint(t,e){const{a:i,b:s,c:r,d:a,e:o,f:l}=this,h=i*a-s*r,u=a/h,d=-s/h,c=-r/h,p=i/h,g=(r*l-a*o)/h,f=-(i*l-s*o)/h,{x:_,y:m}=t;e.x=_*u+m*c+g,e.y=_*d+m*p+f}onlyTranslate(t=1){return this.a===t&&this.b===0&&this.c===0&&this.d===t}clone(){return new ye(this.a,this.b,this.c,this.d,this.e,this.f)}toTransformAttrs(){const t=this.a,e=this.b,i=this.c,s=this.d,r=t*s-e*i,a={x:this.e,y:this.f,rotateDeg:0,scaleX:0,scaleY:0,skewX:0,skewY:0};if(t!==0||e!==0){const o=Math.sqrt(t*t+e*e);a.rotateDeg=e>0?Math.acos(t/o):-Math.acos(t/o),a.scaleX=o,a.scaleY=r/o,a.skewX=(t*i+e*s)/r,a.skewY=0}else if(i!==0||s!==0){const o=Math.sqrt(i*i+s*s);a.rotateDeg=Math.PI/2-(s>0?Math.acos(-i/o):-Math.acos(i/o)),a.scaleX=r/o,a.scaleY=o,a.skewX=0,a.skewY=(t*i+e*s)/r}return a.rotateDeg=Nw(a.rotateDeg),a}}function lG(n,t,e,i,s,r,a,o){const l=t.a,h=t.b,u=t.c,d=t.d,c=t.e,p=t.f,g=bi(a),f=He(a);let _,m;o?(_=o[0],m=o[1]):(_=e,m=i);const v=_-e,y=m-i,b=l*g+u*f,x=h*g+d*f,S=u*g-l*f,k=d*g-h*f;n.a=s*b,n.b=s*x,n.c=r*S,n.d=r*k,n.e=c+l*_+u*m-b*v-S*y,n.f=p+h*_+d*m-x*v-k*y}class hG{constructor(){this.CLEAN_THRESHOLD=1e3,this.L_TIME=1e3,this.R_COUNT=1,this.R_TIMESTAMP_MAX_SIZE=20}clearCache(t,e){const{CLEAN_THRESHOLD:i=this.CLEAN_THRESHOLD,L_TIME:s=this.L_TIME,R_COUNT:r=this.R_COUNT}=e;if(t.size<i)return 0;let a=0;const o=h=>{a++,t.delete(h)},l=Date.now();return t.forEach((h,u)=>{if(h.timestamp.length<r)return o(u);let d=0;for(;l-h.timestamp[h.timestamp.length-1-d]<s&&(d++,!(d>=r)););if(d<r)return o(u);for(;l-h.timestamp[0]>s;)h.timestamp.shift()}),a}addLimitedTimestamp(t,e,i){const{R_TIMESTAMP_MAX_SIZE:s=this.R_TIMESTAMP_MAX_SIZE}=i;t.timestamp.length>s&&t.timestamp.shift(),t.timestamp.push(e)}clearTimeStamp(t,e){const{L_TIME:i=this.L_TIME}=e,s=Date.now();t.forEach(r=>{for(;s-r.timestamp[0]>i;)r.timestamp.shift()})}clearItemTimestamp(t,e){const{L_TIME:i=this.L_TIME}=e,s=Date.now();for(;s-t.timestamp[0]>i;)t.timestamp.shift()}}function tv(n,t,e){t/=100,e/=100;const i=(1-Math.abs(2*e-1))*t,s=i*(1-Math.abs(n/60%2-1)),r=e-i/2;let a=0,o=0,l=0;return 0<=n&&n<60?(a=i,o=s,l=0):60<=n&&n<120?(a=s,o=i,l=0):120<=n&&n<180?(a=0,o=i,l=s):180<=n&&n<240?(a=0,o=s,l=i):240<=n&&n<300?(a=s,o=0,l=i):300<=n&&n<360&&(a=i,o=0,l=s),a=Math.round(255*(a+r)),o=Math.round(255*(o+r)),l=Math.round(255*(l+r)),{r:a,g:o,b:l}}function Cy(n,t,e){n/=255,t/=255,e/=255;const i=Math.min(n,t,e),s=Math.max(n,t,e),r=s-i;let a=0,o=0,l=0;return a=r===0?0:s===n?(t-e)/r%6:s===t?(e-n)/r+2:(n-t)/r+4,a=Math.round(60*a),a<0&&(a+=360),l=(s+i)/2,o=r===0?0:r/(1-Math.abs(2*l-1)),o=+(100*o).toFixed(1),l=+(100*l).toFixed(1),{h:a,s:o,l}}const uG=/^#([0-9a-f]{3,8})$/,SP={transparent:4294967040},mm={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function v_(n){return((n=Math.max(0,Math.min(255,Math.round(n)||0)))<16?"0":"")+n.toString(16)}function BF(n){return it(n)?new An(n>>16,n>>8&255,255&n,1):V(n)?new An(n[0],n[1],n[2]):new An(255,255,255)}function dG(n){return it(n)?new An(n>>>24,n>>>16&255,n>>>8&255,255&n):V(n)?new An(n[0],n[1],n[2],n[3]):new An(255,255,255,1)}function Cx(n){return n<.04045?.0773993808*n:Math.pow(.9478672986*n+.0521327014,2.4)}function Px(n){return n<.0031308?12.92*n:1.055*Math.pow(n,.41666)-.055}const AP=(n,t)=>{const e=uG.exec(n);if(t||e){const i=parseInt(e[1],16),s=e[1].length;return s===3?new An((i>>8&15)+((i>>8&15)<<4),(i>>4&15)+((i>>4&15)<<4),(15&i)+((15&i)<<4),1):s===6?BF(i):s===8?new An(i>>24&255,i>>16&255,i>>8&255,(255&i)/255):null}};class ui{static Brighter(t,e=1){return e===1?t:new ui(t).brighter(e).toRGBA()}static SetOpacity(t,e=1){return e===1?t:new ui(t).setOpacity(e).toRGBA()}static getColorBrightness(t,e="hsl"){const i=t instanceof ui?t:new ui(t);switch(e){case"hsv":default:return i.getHSVBrightness();case"hsl":return i.getHSLBrightness();case"lum":return i.getLuminance();case"lum2":return i.getLuminance2();case"lum3":return i.getLuminance3();case"wcag":return i.getLuminanceWCAG()}}static parseColorString(t){if(P(SP[t]))return dG(SP[t]);if(P(mm[t]))return BF(mm[t]);const e=`${t}`.trim().toLowerCase(),i=AP(e);if(i!==void 0)return i;if(/^(rgb|RGB|rgba|RGBA)/.test(e)){const s=e.replace(/(?:\(|\)|rgba|RGBA|rgb|RGB)*/g,"").split(",");return new An(parseInt(s[0],10),parseInt(s[1],10),parseInt(s[2],10),parseFloat(s[3]))}if(/^(hsl|HSL|hsla|HSLA)/.test(e)){const s=e.replace(/(?:\(|\)|hsla|HSLA|hsl|HSL)*/g,"").split(","),r=tv(parseInt(s[0],10),parseInt(s[1],10),parseInt(s[2],10));return new An(r.r,r.g,r.b,parseFloat(s[3]))}}constructor(t){const e=ui.parseColorString(t);e?this.color=e:(console.warn(`Warn: 传入${t}无法解析为Color`),this.color=new An(255,255,255))}toRGBA(){return this.color.formatRgb()}toString(){return this.color.formatRgb()}toHex(){return this.color.formatHex()}toHsl(){return this.color.formatHsl()}brighter(t){const{r:e,g:i,b:s}=this.color;return this.color.r=Math.max(0,Math.min(255,Math.floor(e*t))),this.color.g=Math.max(0,Math.min(255,Math.floor(i*t))),this.color.b=Math.max(0,Math.min(255,Math.floor(s*t))),this}add(t){const{r:e,g:i,b:s}=this.color;return this.color.r+=Math.min(255,e+t.color.r),this.color.g+=Math.min(255,i+t.color.g),this.color.b+=Math.min(255,s+t.color.b),this}sub(t){return this.color.r=Math.max(0,this.color.r-t.color.r),this.color.g=Math.max(0,this.color.g-t.color.g),this.color.b=Math.max(0,this.color.b-t.color.b),this}multiply(t){const{r:e,g:i,b:s}=this.color;return this.color.r=Math.max(0,Math.min(255,Math.floor(e*t.color.r))),this.color.g=Math.max(0,Math.min(255,Math.floor(i*t.color.g))),this.color.b=Math.max(0,Math.min(255,Math.floor(s*t.color.b))),this}getHSVBrightness(){return Math.max(this.color.r,this.color.g,this.color.b)/255}getHSLBrightness(){return .5*(Math.max(this.color.r,this.color.g,this.color.b)/255+Math.min(this.color.r,this.color.g,this.color.b)/255)}setHsl(t,e,i){const s=this.color.opacity,r=Cy(this.color.r,this.color.g,this.color.b),a=tv(O(t)?r.h:te(t,0,360),O(e)?r.s:e>=0&&e<=1?100*e:e,O(i)?r.l:i<=1&&i>=0?100*i:i);return this.color=new An(a.r,a.g,a.b,s),this}setRGB(t,e,i){return!O(t)&&(this.color.r=t),!O(e)&&(this.color.g=e),!O(i)&&(this.color.b=i),this}setHex(t){const e=`${t}`.trim().toLowerCase(),i=AP(e,!0);return i??this}setColorName(t){const e=mm[t.toLowerCase()];return e!==void 0?this.setHex(e):console.warn("THREE.Color: Unknown color "+t),this}setScalar(t){return this.color.r=t,this.color.g=t,this.color.b=t,this}setOpacity(t=1){return this.color.opacity=t,this}getLuminance(){return(.2126*this.color.r+.7152*this.color.g+.0722*this.color.b)/255}getLuminance2(){return(.2627*this.color.r+.678*this.color.g+.0593*this.color.b)/255}getLuminance3(){return(.299*this.color.r+.587*this.color.g+.114*this.color.b)/255}getLuminanceWCAG(){const t=this.color.r/255,e=this.color.g/255,i=this.color.b/255;let s,r,a;return s=t<=.03928?t/12.92:Math.pow((t+.055)/1.055,2.4),r=e<=.03928?e/12.92:Math.pow((e+.055)/1.055,2.4),a=i<=.03928?i/12.92:Math.pow((i+.055)/1.055,2.4),.2126*s+.7152*r+.0722*a}clone(){return new ui(this.color.toString())}copyGammaToLinear(t,e=2){return this.color.r=Math.pow(t.color.r,e),this.color.g=Math.pow(t.color.g,e),this.color.b=Math.pow(t.color.b,e),this}copyLinearToGamma(t,e=2){const i=e>0?1/e:1;return this.color.r=Math.pow(t.color.r,i),this.color.g=Math.pow(t.color.g,i),this.color.b=Math.pow(t.color.b,i),this}convertGammaToLinear(t){return this.copyGammaToLinear(this,t),this}convertLinearToGamma(t){return this.copyLinearToGamma(this,t),this}copySRGBToLinear(t){return this.color.r=Cx(t.color.r),this.color.g=Cx(t.color.g),this.color.b=Cx(t.color.b),this}copyLinearToSRGB(t){return this.color.r=Px(t.color.r),this.color.g=Px(t.color.g),this.color.b=Px(t.color.b),this}convertSRGBToLinear(){return this.copySRGBToLinear(this),this}convertLinearToSRGB(){return this.copyLinearToSRGB(this),this}}class An{constructor(t,e,i,s){this.r=isNaN(+t)?255:Math.max(0,Math.min(255,+t)),this.g=isNaN(+e)?255:Math.max(0,Math.min(255,+e)),this.b=isNaN(+i)?255:Math.max(0,Math.min(255,+i)),P(s)?this.opacity=isNaN(+s)?1:Math.max(0,Math.min(1,+s)):this.opacity=1}formatHex(){return`#${v_(this.r)+v_(this.g)+v_(this.b)+(this.opacity===1?"":v_(255*this.opacity))}`}formatRgb(){const t=this.opacity;return`${t===1?"rgb(":"rgba("}${this.r},${this.g},${this.b}${t===1?")":`,${t})`}`}formatHsl(){const t=this.opacity,{h:e,s:i,l:s}=Cy(this.r,this.g,this.b);return`${t===1?"hsl(":"hsla("}${e},${i}%,${s}%${t===1?")":`,${t})`}`}toString(){return this.formatHex()}}function OF(n){let t="",e="",i="";const s=n[0]==="#"?1:0;for(let r=s;r<n.length;r++)n[r]!=="#"&&(r<s+2?t+=n[r]:r<s+4?e+=n[r]:r<s+6&&(i+=n[r]));return[parseInt(t,16),parseInt(e,16),parseInt(i,16)]}function cG(n,t,e){return Number((1<<24)+(n<<16)+(t<<8)+e).toString(16).slice(1)}function pG(n,t){const e=n.r,i=t.r,s=n.g,r=t.g,a=n.b,o=t.b,l=n.opacity,h=t.opacity;return u=>{const d=Math.round(e*(1-u)+i*u),c=Math.round(s*(1-u)+r*u),p=Math.round(a*(1-u)+o*u);return new An(d,c,p,l*(1-u)+h*u)}}const gG=Object.freeze(Object.defineProperty({__proto__:null,Color:ui,DEFAULT_COLORS:mm,RGB:An,hexToRgb:OF,hslToRgb:tv,interpolateRgb:pG,rgbToHex:cG,rgbToHsl:Cy},Symbol.toStringTag,{value:"Module"}));function tn(n){if(U(n))return[n,n,n,n];if(V(n)){const t=n.length;if(t===1){const e=n[0];return[e,e,e,e]}if(t===2){const[e,i]=n;return[e,i,e,i]}if(t===3){const[e,i,s]=n;return[e,i,s,i]}if(t===4)return n}if(kt(n)){const{top:t=0,right:e=0,bottom:i=0,left:s=0}=n;return[t,e,i,s]}return[0,0,0,0]}function kP(n,t=0,e=0){if(!n)return{width:t,height:e};let i;try{i=window==null?void 0:window.getComputedStyle}catch{i=()=>({})}const s=i(n);if(/^(\d*\.?\d+)(px)$/.exec(s.width)){const r=parseFloat(s.width)-parseFloat(s.paddingLeft)-parseFloat(s.paddingRight)||n.clientWidth-1,a=parseFloat(s.height)-parseFloat(s.paddingTop)-parseFloat(s.paddingBottom)||n.clientHeight-1;return{width:r<=0?t:r,height:a<=0?e:a}}return{width:t,height:e}}function fG(n){const{x:t,y:e}=n.getBoundingClientRect();return{x:t,y:e}}const _G=(n="")=>{const t={};return n.split(";").forEach(e=>{if(e){const i=e.split(":");if(i.length===2){const s=i[0].trim(),r=i[1].trim();s&&r&&(t[s]=r)}}}),t},wP=n=>n.replace(/([A-Z])/g,"-$1").toLowerCase();function TP(n,t,e){e===void 0&&(e={});var i={type:"Feature"};return(e.id===0||e.id)&&(i.id=e.id),e.bbox&&(i.bbox=e.bbox),i.properties=t||{},i.geometry=n,i}function LF(n,t){t===void 0&&(t={});var e={type:"FeatureCollection"};return t.id&&(e.id=t.id),t.bbox&&(e.bbox=t.bbox),e.features=n,e}function mG(n){return!!n&&n.constructor===Object}class _r{static getInstance(){return _r.instance||(_r.instance=new _r),_r.instance}constructor(){this.locale_shortWeekdays=["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],this.locale_periods=["AM","PM"],this.locale_weekdays=["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],this.locale_shortMonths=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],this.numberRe=/^\s*\d+/,this.pads={"-":"",_:" ",0:"0"},this.requoteRe=/[\\^$*+?|[\]().{}]/g,this.locale_months=["January","February","March","April","May","June","July","August","September","October","November","December"],this.formatShortWeekday=t=>this.locale_shortWeekdays[t.getDay()],this.formatWeekday=t=>this.locale_weekdays[t.getDay()],this.formatShortMonth=t=>this.locale_shortMonths[t.getMonth()],this.formatMonth=t=>this.locale_months[t.getMonth()],this.formatDayOfMonth=(t,e)=>this.pad(t.getDate(),e,2),this.formatHour24=(t,e)=>this.pad(t.getHours(),e,2),this.formatHour12=(t,e)=>this.pad(t.getHours()%12||12,e,2),this.formatMilliseconds=(t,e)=>this.pad(t.getMilliseconds(),e,3),this.formatMonthNumber=(t,e)=>this.pad(t.getMonth()+1,e,2),this.formatMinutes=(t,e)=>this.pad(t.getMinutes(),e,2),this.formatPeriod=t=>this.locale_periods[+(t.getHours()>=12)],this.formatSeconds=(t,e)=>this.pad(t.getSeconds(),e,2),this.formatFullYear=(t,e)=>this.pad(t.getFullYear()%1e4,e,4),this.formatUTCShortWeekday=t=>this.locale_shortWeekdays[t.getUTCDay()],this.formatUTCWeekday=t=>this.locale_weekdays[t.getUTCDay()],this.formatUTCShortMonth=t=>this.locale_shortMonths[t.getUTCMonth()],this.formatUTCMonth=t=>this.locale_months[t.getUTCMonth()],this.formatUTCDayOfMonth=(t,e)=>this.pad(t.getUTCDate(),e,2),this.formatUTCHour24=(t,e)=>this.pad(t.getUTCHours(),e,2),this.formatUTCHour12=(t,e)=>this.pad(t.getUTCHours()%12||12,e,2),this.formatUTCMilliseconds=(t,e)=>this.pad(t.getUTCMilliseconds(),e,3),this.formatUTCMonthNumber=(t,e)=>this.pad(t.getUTCMonth()+1,e,2),this.formatUTCMinutes=(t,e)=>this.pad(t.getUTCMinutes(),e,2),this.formatUTCPeriod=t=>this.locale_periods[+(t.getUTCHours()>=12)],this.formatUTCSeconds=(t,e)=>this.pad(t.getUTCSeconds(),e,2),this.formatUTCFullYear=(t,e)=>this.pad(t.getUTCFullYear()%1e4,e,4),this.formats={a:this.formatShortWeekday,A:this.formatWeekday,b:this.formatShortMonth,B:this.formatMonth,d:this.formatDayOfMonth,e:this.formatDayOfMonth,H:this.formatHour24,I:this.formatHour12,L:this.formatMilliseconds,m:this.formatMonthNumber,M:this.formatMinutes,p:this.formatPeriod,S:this.formatSeconds,Y:this.formatFullYear},this.utcFormats={a:this.formatUTCShortWeekday,A:this.formatUTCWeekday,b:this.formatUTCShortMonth,B:this.formatUTCMonth,d:this.formatUTCDayOfMonth,e:this.formatUTCDayOfMonth,H:this.formatUTCHour24,I:this.formatUTCHour12,L:this.formatUTCMilliseconds,m:this.formatUTCMonthNumber,M:this.formatUTCMinutes,p:this.formatUTCPeriod,S:this.formatUTCSeconds,Y:this.formatUTCFullYear},this.parseShortWeekday=(t,e,i)=>{const s=this.shortWeekdayRe.exec(e.slice(i));return s?(t.w=this.shortWeekdayLookup.get(s[0].toLowerCase()),i+s[0].length):-1},this.parseWeekday=(t,e,i)=>{const s=this.weekdayRe.exec(e.slice(i));return s?(t.w=this.weekdayLookup.get(s[0].toLowerCase()),i+s[0].length):-1},this.parseShortMonth=(t,e,i)=>{const s=this.shortMonthRe.exec(e.slice(i));return s?(t.m=this.shortMonthLookup.get(s[0].toLowerCase()),i+s[0].length):-1},this.parseMonth=(t,e,i)=>{const s=this.monthRe.exec(e.slice(i));return s?(t.m=this.monthLookup.get(s[0].toLowerCase()),i+s[0].length):-1},this.parseDayOfMonth=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+2));return s?(t.d=+s[0],i+s[0].length):-1},this.parseHour24=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+2));return s?(t.H=+s[0],i+s[0].length):-1},this.parseMilliseconds=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+3));return s?(t.L=+s[0],i+s[0].length):-1},this.parseMonthNumber=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+2));return s?(t.m=s-1,i+s[0].length):-1},this.parseMinutes=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+2));return s?(t.M=+s[0],i+s[0].length):-1},this.parsePeriod=(t,e,i)=>{const s=this.periodRe.exec(e.slice(i));return s?(t.p=this.periodLookup.get(s[0].toLowerCase()),i+s[0].length):-1},this.parseSeconds=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+2));return s?(t.S=+s[0],i+s[0].length):-1},this.parseFullYear=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+4));return s?(t.y=+s[0],i+s[0].length):-1},this.parses={a:this.parseShortWeekday,A:this.parseWeekday,b:this.parseShortMonth,B:this.parseMonth,d:this.parseDayOfMonth,e:this.parseDayOfMonth,H:this.parseHour24,I:this.parseHour24,L:this.parseMilliseconds,m:this.parseMonthNumber,M:this.parseMinutes,p:this.parsePeriod,S:this.parseSeconds,Y:this.parseFullYear},this.timeFormat=(t,e)=>this.newFormat(t,this.formats)(new Date(this.getFullTimeStamp(e))),this.timeUTCFormat=(t,e)=>this.newFormat(t,this.utcFormats)(new Date(this.getFullTimeStamp(e))),this.timeParse=(t,e)=>this.newParse(t,!1)(e+""),this.requoteF=this.requote.bind(this),this.periodRe=this.formatRe(this.locale_periods),this.periodLookup=this.formatLookup(this.locale_periods),this.weekdayRe=this.formatRe(this.locale_weekdays),this.weekdayLookup=this.formatLookup(this.locale_weekdays),this.shortWeekdayRe=this.formatRe(this.locale_shortWeekdays),this.shortWeekdayLookup=this.formatLookup(this.locale_shortWeekdays),this.monthRe=this.formatRe(this.locale_months),this.monthLookup=this.formatLookup(this.locale_months),this.shortMonthRe=this.formatRe(this.locale_shortMonths),this.shortMonthLookup=this.formatLookup(this.locale_shortMonths)}requote(t){return t.replace(this.requoteRe,"\\$&")}localDate(t){if(0<=t.y&&t.y<100){const e=new Date(-1,t.m,t.d,t.H,t.M,t.S,t.L);return e.setFullYear(t.y),e}return new Date(t.y,t.m,t.d,t.H,t.M,t.S,t.L)}utcDate(t){if(0<=t.y&&t.y<100){const e=new Date(Date.UTC(-1,t.m,t.d,t.H,t.M,t.S,t.L));return e.setUTCFullYear(t.y),e}return new Date(Date.UTC(t.y,t.m,t.d,t.H,t.M,t.S,t.L))}newDate(t,e,i){return{y:t,m:e,d:i,H:0,M:0,S:0,L:0}}formatRe(t){return new RegExp("^(?:"+t.map(this.requoteF).join("|")+")","i")}formatLookup(t){return new Map(t.map((e,i)=>[e.toLowerCase(),i]))}pad(t,e,i){const s=t<0?"-":"",r=(s?-t:t)+"",a=r.length;return s+(a<i?new Array(i-a+1).join(e)+r:r)}parseSpecifier(t,e,i,s){let r=0;const a=e.length,o=i.length;let l,h;for(;r<a;){if(s>=o)return-1;if(l=e.charCodeAt(r++),l===37){if(l=e.charAt(r++),h=this.parses[l in this.pads?e.charAt(r++):l],!h||(s=h(t,i,s))<0)return-1}else if(l!==i.charCodeAt(s++))return-1}return s}newParse(t,e){const i=this;return function(s){const r=i.newDate(1900,void 0,1);return i.parseSpecifier(r,t,s+="",0)!==s.length?null:"Q"in r?new Date(r.Q):"s"in r?new Date(1e3*r.s+("L"in r?r.L:0)):(e&&!("Z"in r)&&(r.Z=0),"p"in r&&(r.H=r.H%12+12*r.p),r.m===void 0&&(r.m="q"in r?r.q:0),"Z"in r?(r.H+=r.Z/100|0,r.M+=r.Z%100,i.utcDate(r)):i.localDate(r))}}newFormat(t,e){const i=this;return function(s){const r=[];let a=-1,o=0;const l=t.length;let h,u,d;for(s instanceof Date||(s=new Date(+s));++a<l;)t.charCodeAt(a)===37&&(r.push(t.slice(o,a)),(u=i.pads[h=t.charAt(++a)])?h=t.charAt(++a):u=h==="e"?" ":"0",d=e[h],h=d(s,u),r.push(h),o=a+1);return r.push(t.slice(o,a)),r.join("")}}getFullTimeStamp(t){const e=parseInt(t+"",10);return String(e).length===10?1e3*e:e}}function vG(n){return Math.abs(n=Math.round(n))>=1e21?n.toLocaleString("en").replace(/,/g,""):n.toString(10)}function ev(n,t){const e=t?n.toExponential(t-1):n.toExponential(),i=e.indexOf("e");if(i<0)return null;const s=e.slice(0,i);return[s.length>1?s[0]+s.slice(2):s,+e.slice(i+1)]}function yG(n,t){return function(e,i){let s=e.length;const r=[];let a=0,o=n[0],l=0;for(;s>0&&o>0&&(l+o+1>i&&(o=Math.max(1,i-l)),r.push(e.substring(s-=o,s+o)),!((l+=o+1)>i));)o=n[a=(a+1)%n.length];return r.reverse().join(t)}}let IF;function bG(n,t){const e=ev(n,t);if(!e)return n+"";const i=e[0],s=e[1],r=s-(IF=3*Math.max(-8,Math.min(8,Math.floor(s/3))))+1,a=i.length;return r===a?i:r>a?i+new Array(r-a+1).join("0"):r>0?i.slice(0,r)+"."+i.slice(r):"0."+new Array(1-r).join("0")+ev(n,Math.max(0,t+r-1))[0]}function MP(n,t){const e=ev(n,t);if(!e)return n+"";const i=e[0],s=e[1];return s<0?"0."+new Array(-s).join("0")+i:i.length>s+1?i.slice(0,s+1)+"."+i.slice(s+1):i+new Array(s-i.length+2).join("0")}function xG(n){const t=n.length;let e,i=-1;t:for(let s=1;s<t;++s)switch(n[s]){case".":i=e=s;break;case"0":i===0&&(i=s),e=s;break;default:if(!+n[s])break t;i>0&&(i=0)}return i>0?n.slice(0,i)+n.slice(e+1):n}class SG{constructor(t={}){this.fill=t.fill===void 0?" ":t.fill+"",this.align=t.align===void 0?">":t.align+"",this.sign=t.sign===void 0?"-":t.sign+"",this.symbol=t.symbol===void 0?"":t.symbol+"",this.zero=!!t.zero,this.width=t.width===void 0?void 0:+t.width,this.comma=!!t.comma,this.precision=t.precision===void 0?void 0:+t.precision,this.trim=!!t.trim,this.type=t.type===void 0?"":t.type+""}toString(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(this.width===void 0?"":Math.max(1,0|this.width))+(this.comma?",":"")+(this.precision===void 0?"":"."+Math.max(0,0|this.precision))+(this.trim?"~":"")+this.type}}const DF=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function CP(n){let t;if(t=DF.exec(n))return new SG({fill:t[1],align:t[2],sign:t[3],symbol:t[4],zero:t[5],width:t[6],comma:t[7],precision:t[8]&&t[8].slice(1),trim:t[9],type:t[10]});Xt.getInstance().error("invalid format: "+n)}const PP=["y","z","a","f","p","n","µ","m","","k","M","G","T","P","E","Z","Y"];class Hl{constructor(){this.locale={thousands:",",grouping:[3],currency:["$",""]},this.group=this.locale.grouping===void 0||this.locale.thousands===void 0?t=>t:yG([...this.locale.grouping].map(Number),`${this.locale.thousands}`),this.currencyPrefix=this.locale.currency===void 0?"":this.locale.currency[0]+"",this.currencySuffix=this.locale.currency===void 0?"":this.locale.currency[1]+"",this.decimal=this.locale.decimal===void 0?".":this.locale.decimal+"",this.numerals=this.locale.numerals===void 0?t=>t:kG([...this.locale.numerals].map(String)),this.percent=this.locale.percent===void 0?"%":this.locale.percent+"",this.minus=this.locale.minus===void 0?"−":this.locale.minus+"",this.nan=this.locale.nan===void 0?"NaN":this.locale.nan+"",this.formatter=t=>this.newFormat(t),this.format=(t,e)=>this.formatter(t)(e),this.formatPrefix=(t,e)=>this._formatPrefix(t,e)}static getInstance(){return Hl.instance||(Hl.instance=new Hl),Hl.instance}newFormat(t){const e=CP(t);let i=e.fill,s=e.align;const r=e.sign,a=e.symbol;let o=e.zero;const l=e.width;let h=e.comma,u=e.precision,d=e.trim,c=e.type;c==="n"?(h=!0,c="g"):RP[c]||(u===void 0&&(u=12),d=!0,c="g"),(o||i==="0"&&s==="=")&&(o=!0,i="0",s="=");const p=a==="$"?this.currencyPrefix:a==="#"&&/[boxX]/.test(c)?"0"+c.toLowerCase():"",g=a==="$"?this.currencySuffix:/[%p]/.test(c)?this.percent:"",f=RP[c],_=/[defgprstz%]/.test(c);u=u===void 0?6:/[gprs]/.test(c)?Math.max(1,Math.min(21,u)):Math.max(0,Math.min(20,u));const{nan:m,minus:v,decimal:y,group:b,numerals:x}=this;function S(k){let A,w,T,M=p,E=g,R=k;if(c==="c")E=f(R)+E,R="";else{R=+R;let L=R<0||1/R<0;if(R=isNaN(R)?m:f(Math.abs(R),u),d&&(R=xG(R)),L&&+R==0&&r!=="+"&&(L=!1),M=(L?r==="("?r:v:r==="-"||r==="("?"":r)+M,E=(c==="s"?PP[8+IF/3]:"")+E+(L&&r==="("?")":""),_){for(A=-1,w=R.length;++A<w;)if(T=R.charCodeAt(A),48>T||T>57){E=(T===46?y+R.slice(A+1):R.slice(A))+E,R=R.slice(0,A);break}}}h&&!o&&(R=b(R,1/0));let B=M.length+R.length+E.length,C=B<l?new Array(l-B+1).join(i):"";switch(h&&o&&(R=b(C+R,C.length?l-E.length:1/0),C=""),s){case"<":R=M+R+E+C;break;case"=":R=M+C+R+E;break;case"^":R=C.slice(0,B=C.length>>1)+M+R+E+C.slice(B);break;default:R=C+M+R+E}return x(R)}return S.toString=function(){return t+""},S}_formatPrefix(t,e){const i=CP(t);i.type="f";const s=this.newFormat(i.toString()),r=3*Math.max(-8,Math.min(8,Math.floor(AG(e)/3))),a=Math.pow(10,-r),o=PP[8+r/3];return function(l){return s(a*l)+o}}}const RP={"%":(n,t)=>(100*n).toFixed(t),b:n=>Math.round(n).toString(2),c:n=>n+"",d:vG,f:(n,t)=>n.toFixed(t),e:(n,t)=>n.toExponential(t),g:(n,t)=>n.toPrecision(t),o:n=>Math.round(n).toString(8),p:(n,t)=>MP(100*n,t),r:MP,s:bG,X:n=>Math.round(n).toString(16).toUpperCase(),x:n=>Math.round(n).toString(16),t:(n,t)=>Number.isInteger(n)?n.toFixed(2):Math.floor(n*Math.pow(10,t))/Math.pow(10,t)+"",z:(n,t)=>n%1==0?n+"":n.toFixed(t)};function AG(n){const t=ev(Math.abs(n));return t?t[1]:NaN}function kG(n){return function(t){return t.replace(/[0-9]/g,e=>n[+e])}}const wG=(n,t)=>{const{callback:e}=t;return e&&(n=n.filter(e)),n};function Py(){return new iv}function iv(){this.reset()}iv.prototype={constructor:iv,reset:function(){this.s=this.t=0},add:function(n){EP(y_,n,this.t),EP(this,y_.s,this.s),this.s?this.t+=y_.t:this.s=y_.t},valueOf:function(){return this.s}};var y_=new iv;function EP(n,t,e){var i=n.s=t+e,s=i-t,r=i-s;n.t=t-r+(e-s)}var Ut=1e-6,TG=1e-12,Qt=Math.PI,ci=Qt/2,BP=Qt/4,us=Qt*2,hn=180/Qt,Ze=Qt/180,Ae=Math.abs,qd=Math.atan,no=Math.atan2,Zt=Math.cos,FF=Math.exp,nv=Math.log,Rx=Math.pow,Gt=Math.sin,zs=Math.sign||function(n){return n>0?1:n<0?-1:0},qn=Math.sqrt,Gw=Math.tan;function zF(n){return n>1?0:n<-1?Qt:Math.acos(n)}function $s(n){return n>1?ci:n<-1?-ci:Math.asin(n)}function Hs(){}function sv(n,t){n&&LP.hasOwnProperty(n.type)&&LP[n.type](n,t)}var OP={Feature:function(n,t){sv(n.geometry,t)},FeatureCollection:function(n,t){for(var e=n.features,i=-1,s=e.length;++i<s;)sv(e[i].geometry,t)}},LP={Sphere:function(n,t){t.sphere()},Point:function(n,t){n=n.coordinates,t.point(n[0],n[1],n[2])},MultiPoint:function(n,t){for(var e=n.coordinates,i=-1,s=e.length;++i<s;)n=e[i],t.point(n[0],n[1],n[2])},LineString:function(n,t){k1(n.coordinates,t,0)},MultiLineString:function(n,t){for(var e=n.coordinates,i=-1,s=e.length;++i<s;)k1(e[i],t,0)},Polygon:function(n,t){IP(n.coordinates,t)},MultiPolygon:function(n,t){for(var e=n.coordinates,i=-1,s=e.length;++i<s;)IP(e[i],t)},GeometryCollection:function(n,t){for(var e=n.geometries,i=-1,s=e.length;++i<s;)sv(e[i],t)}};function k1(n,t,e){var i=-1,s=n.length-e,r;for(t.lineStart();++i<s;)r=n[i],t.point(r[0],r[1],r[2]);t.lineEnd()}function IP(n,t){var e=-1,i=n.length;for(t.polygonStart();++e<i;)k1(n[e],t,1);t.polygonEnd()}function Qh(n,t){n&&OP.hasOwnProperty(n.type)?OP[n.type](n,t):sv(n,t)}function w1(n){return[no(n[1],n[0]),$s(n[2])]}function Ad(n){var t=n[0],e=n[1],i=Zt(e);return[i*Zt(t),i*Gt(t),Gt(e)]}function b_(n,t){return n[0]*t[0]+n[1]*t[1]+n[2]*t[2]}function rv(n,t){return[n[1]*t[2]-n[2]*t[1],n[2]*t[0]-n[0]*t[2],n[0]*t[1]-n[1]*t[0]]}function Ex(n,t){n[0]+=t[0],n[1]+=t[1],n[2]+=t[2]}function x_(n,t){return[n[0]*t,n[1]*t,n[2]*t]}function T1(n){var t=qn(n[0]*n[0]+n[1]*n[1]+n[2]*n[2]);n[0]/=t,n[1]/=t,n[2]/=t}function M1(n,t){function e(i,s){return i=n(i,s),t(i[0],i[1])}return n.invert&&t.invert&&(e.invert=function(i,s){return i=t.invert(i,s),i&&n.invert(i[0],i[1])}),e}function C1(n,t){return[Ae(n)>Qt?n+Math.round(-n/us)*us:n,t]}C1.invert=C1;function HF(n,t,e){return(n%=us)?t||e?M1(FP(n),zP(t,e)):FP(n):t||e?zP(t,e):C1}function DP(n){return function(t,e){return t+=n,[t>Qt?t-us:t<-Qt?t+us:t,e]}}function FP(n){var t=DP(n);return t.invert=DP(-n),t}function zP(n,t){var e=Zt(n),i=Gt(n),s=Zt(t),r=Gt(t);function a(o,l){var h=Zt(l),u=Zt(o)*h,d=Gt(o)*h,c=Gt(l),p=c*e+u*i;return[no(d*s-p*r,u*e-c*i),$s(p*s+d*r)]}return a.invert=function(o,l){var h=Zt(l),u=Zt(o)*h,d=Gt(o)*h,c=Gt(l),p=c*s-d*r;return[no(d*s+c*r,u*e+p*i),$s(p*e-u*i)]},a}function MG(n){n=HF(n[0]*Ze,n[1]*Ze,n.length>2?n[2]*Ze:0);function t(e){return e=n(e[0]*Ze,e[1]*Ze),e[0]*=hn,e[1]*=hn,e}return t.invert=function(e){return e=n.invert(e[0]*Ze,e[1]*Ze),e[0]*=hn,e[1]*=hn,e},t}function CG(n,t,e,i,s,r){if(e){var a=Zt(t),o=Gt(t),l=i*e;s==null?(s=t+i*us,r=t-l/2):(s=HP(a,s),r=HP(a,r),(i>0?s<r:s>r)&&(s+=i*us));for(var h,u=s;i>0?u>r:u<r;u-=l)h=w1([a,-o*Zt(u),-o*Gt(u)]),n.point(h[0],h[1])}}function HP(n,t){t=Ad(t),t[0]-=n,T1(t);var e=zF(-t[1]);return((-t[2]<0?-e:e)+us-Ut)%us}function jF(){var n=[],t;return{point:function(e,i,s){t.push([e,i,s])},lineStart:function(){n.push(t=[])},lineEnd:Hs,rejoin:function(){n.length>1&&n.push(n.pop().concat(n.shift()))},result:function(){var e=n;return n=[],t=null,e}}}function vm(n,t){return Ae(n[0]-t[0])<Ut&&Ae(n[1]-t[1])<Ut}function S_(n,t,e,i){this.x=n,this.z=t,this.o=e,this.e=i,this.v=!1,this.n=this.p=null}function NF(n,t,e,i,s){var r=[],a=[],o,l;if(n.forEach(function(g){if(!((f=g.length-1)<=0)){var f,_=g[0],m=g[f],v;if(vm(_,m)){if(!_[2]&&!m[2]){for(s.lineStart(),o=0;o<f;++o)s.point((_=g[o])[0],_[1]);s.lineEnd();return}m[0]+=2*Ut}r.push(v=new S_(_,g,null,!0)),a.push(v.o=new S_(_,null,v,!1)),r.push(v=new S_(m,g,null,!1)),a.push(v.o=new S_(m,null,v,!0))}}),!!r.length){for(a.sort(t),jP(r),jP(a),o=0,l=a.length;o<l;++o)a[o].e=e=!e;for(var h=r[0],u,d;;){for(var c=h,p=!0;c.v;)if((c=c.n)===h)return;u=c.z,s.lineStart();do{if(c.v=c.o.v=!0,c.e){if(p)for(o=0,l=u.length;o<l;++o)s.point((d=u[o])[0],d[1]);else i(c.x,c.n.x,1,s);c=c.n}else{if(p)for(u=c.p.z,o=u.length-1;o>=0;--o)s.point((d=u[o])[0],d[1]);else i(c.x,c.p.x,-1,s);c=c.p}c=c.o,u=c.z,p=!p}while(!c.v);s.lineEnd()}}}function jP(n){if(t=n.length){for(var t,e=0,i=n[0],s;++e<t;)i.n=s=n[e],s.p=i,i=s;i.n=s=n[0],s.p=i}}var Bx=Py();function Ox(n){return Ae(n[0])<=Qt?n[0]:zs(n[0])*((Ae(n[0])+Qt)%us-Qt)}function PG(n,t){var e=Ox(t),i=t[1],s=Gt(i),r=[Gt(e),-Zt(e),0],a=0,o=0;Bx.reset(),s===1?i=ci+Ut:s===-1&&(i=-ci-Ut);for(var l=0,h=n.length;l<h;++l)if(d=(u=n[l]).length)for(var u,d,c=u[d-1],p=Ox(c),g=c[1]/2+BP,f=Gt(g),_=Zt(g),m=0;m<d;++m,p=y,f=x,_=S,c=v){var v=u[m],y=Ox(v),b=v[1]/2+BP,x=Gt(b),S=Zt(b),k=y-p,A=k>=0?1:-1,w=A*k,T=w>Qt,M=f*x;if(Bx.add(no(M*A*Gt(w),_*S+M*Zt(w))),a+=T?k+A*us:k,T^p>=e^y>=e){var E=rv(Ad(c),Ad(v));T1(E);var R=rv(r,E);T1(R);var B=(T^k>=0?-1:1)*$s(R[2]);(i>B||i===B&&(E[0]||E[1]))&&(o+=T^k>=0?1:-1)}}return(a<-Ut||a<Ut&&Bx<-Ut)^o&1}function VF(n,t){return n<t?-1:n>t?1:n>=t?0:NaN}function RG(n){return n.length===1&&(n=EG(n)),{left:function(t,e,i,s){for(i==null&&(i=0),s==null&&(s=t.length);i<s;){var r=i+s>>>1;n(t[r],e)<0?i=r+1:s=r}return i},right:function(t,e,i,s){for(i==null&&(i=0),s==null&&(s=t.length);i<s;){var r=i+s>>>1;n(t[r],e)>0?s=r:i=r+1}return i}}}function EG(n){return function(t,e){return VF(n(t),e)}}RG(VF);function WF(n){for(var t=n.length,e,i=-1,s=0,r,a;++i<t;)s+=n[i].length;for(r=new Array(s);--t>=0;)for(a=n[t],e=a.length;--e>=0;)r[--s]=a[e];return r}function UF(n,t,e,i){return function(s){var r=t(s),a=jF(),o=t(a),l=!1,h,u,d,c={point:p,lineStart:f,lineEnd:_,polygonStart:function(){c.point=m,c.lineStart=v,c.lineEnd=y,u=[],h=[]},polygonEnd:function(){c.point=p,c.lineStart=f,c.lineEnd=_,u=WF(u);var b=PG(h,i);u.length?(l||(s.polygonStart(),l=!0),NF(u,OG,b,e,s)):b&&(l||(s.polygonStart(),l=!0),s.lineStart(),e(null,null,1,s),s.lineEnd()),l&&(s.polygonEnd(),l=!1),u=h=null},sphere:function(){s.polygonStart(),s.lineStart(),e(null,null,1,s),s.lineEnd(),s.polygonEnd()}};function p(b,x){n(b,x)&&s.point(b,x)}function g(b,x){r.point(b,x)}function f(){c.point=g,r.lineStart()}function _(){c.point=p,r.lineEnd()}function m(b,x){d.push([b,x]),o.point(b,x)}function v(){o.lineStart(),d=[]}function y(){m(d[0][0],d[0][1]),o.lineEnd();var b=o.clean(),x=a.result(),S,k=x.length,A,w,T;if(d.pop(),h.push(d),d=null,!!k){if(b&1){if(w=x[0],(A=w.length-1)>0){for(l||(s.polygonStart(),l=!0),s.lineStart(),S=0;S<A;++S)s.point((T=w[S])[0],T[1]);s.lineEnd()}return}k>1&&b&2&&x.push(x.pop().concat(x.shift())),u.push(x.filter(BG))}}return c}}function BG(n){return n.length>1}function OG(n,t){return((n=n.x)[0]<0?n[1]-ci-Ut:ci-n[1])-((t=t.x)[0]<0?t[1]-ci-Ut:ci-t[1])}const NP=UF(function(){return!0},LG,DG,[-Qt,-ci]);function LG(n){var t=NaN,e=NaN,i=NaN,s;return{lineStart:function(){n.lineStart(),s=1},point:function(r,a){var o=r>0?Qt:-Qt,l=Ae(r-t);Ae(l-Qt)<Ut?(n.point(t,e=(e+a)/2>0?ci:-ci),n.point(i,e),n.lineEnd(),n.lineStart(),n.point(o,e),n.point(r,e),s=0):i!==o&&l>=Qt&&(Ae(t-i)<Ut&&(t-=i*Ut),Ae(r-o)<Ut&&(r-=o*Ut),e=IG(t,e,r,a),n.point(i,e),n.lineEnd(),n.lineStart(),n.point(o,e),s=0),n.point(t=r,e=a),i=o},lineEnd:function(){n.lineEnd(),t=e=NaN},clean:function(){return 2-s}}}function IG(n,t,e,i){var s,r,a=Gt(n-e);return Ae(a)>Ut?qd((Gt(t)*(r=Zt(i))*Gt(e)-Gt(i)*(s=Zt(t))*Gt(n))/(s*r*a)):(t+i)/2}function DG(n,t,e,i){var s;if(n==null)s=e*ci,i.point(-Qt,s),i.point(0,s),i.point(Qt,s),i.point(Qt,0),i.point(Qt,-s),i.point(0,-s),i.point(-Qt,-s),i.point(-Qt,0),i.point(-Qt,s);else if(Ae(n[0]-t[0])>Ut){var r=n[0]<t[0]?Qt:-Qt;s=e*r/2,i.point(-r,s),i.point(0,s),i.point(r,s)}else i.point(t[0],t[1])}function FG(n){var t=Zt(n),e=6*Ze,i=t>0,s=Ae(t)>Ut;function r(u,d,c,p){CG(p,n,e,c,u,d)}function a(u,d){return Zt(u)*Zt(d)>t}function o(u){var d,c,p,g,f;return{lineStart:function(){g=p=!1,f=1},point:function(_,m){var v=[_,m],y,b=a(_,m),x=i?b?0:h(_,m):b?h(_+(_<0?Qt:-Qt),m):0;if(!d&&(g=p=b)&&u.lineStart(),b!==p&&(y=l(d,v),(!y||vm(d,y)||vm(v,y))&&(v[2]=1)),b!==p)f=0,b?(u.lineStart(),y=l(v,d),u.point(y[0],y[1])):(y=l(d,v),u.point(y[0],y[1],2),u.lineEnd()),d=y;else if(s&&d&&i^b){var S;!(x&c)&&(S=l(v,d,!0))&&(f=0,i?(u.lineStart(),u.point(S[0][0],S[0][1]),u.point(S[1][0],S[1][1]),u.lineEnd()):(u.point(S[1][0],S[1][1]),u.lineEnd(),u.lineStart(),u.point(S[0][0],S[0][1],3)))}b&&(!d||!vm(d,v))&&u.point(v[0],v[1]),d=v,p=b,c=x},lineEnd:function(){p&&u.lineEnd(),d=null},clean:function(){return f|(g&&p)<<1}}}function l(u,d,c){var p=Ad(u),g=Ad(d),f=[1,0,0],_=rv(p,g),m=b_(_,_),v=_[0],y=m-v*v;if(!y)return!c&&u;var b=t*m/y,x=-t*v/y,S=rv(f,_),k=x_(f,b),A=x_(_,x);Ex(k,A);var w=S,T=b_(k,w),M=b_(w,w),E=T*T-M*(b_(k,k)-1);if(!(E<0)){var R=qn(E),B=x_(w,(-T-R)/M);if(Ex(B,k),B=w1(B),!c)return B;var C=u[0],L=d[0],F=u[1],D=d[1],z;L<C&&(z=C,C=L,L=z);var H=L-C,j=Ae(H-Qt)<Ut,K=j||H<Ut;if(!j&&D<F&&(z=F,F=D,D=z),K?j?F+D>0^B[1]<(Ae(B[0]-C)<Ut?F:D):F<=B[1]&&B[1]<=D:H>Qt^(C<=B[0]&&B[0]<=L)){var Y=x_(w,(-T+R)/M);return Ex(Y,k),[B,w1(Y)]}}}function h(u,d){var c=i?n:Qt-n,p=0;return u<-c?p|=1:u>c&&(p|=2),d<-c?p|=4:d>c&&(p|=8),p}return UF(a,o,r,i?[0,-n]:[-Qt,n-Qt])}function zG(n,t,e,i,s,r){var a=n[0],o=n[1],l=t[0],h=t[1],u=0,d=1,c=l-a,p=h-o,g;if(g=e-a,!(!c&&g>0)){if(g/=c,c<0){if(g<u)return;g<d&&(d=g)}else if(c>0){if(g>d)return;g>u&&(u=g)}if(g=s-a,!(!c&&g<0)){if(g/=c,c<0){if(g>d)return;g>u&&(u=g)}else if(c>0){if(g<u)return;g<d&&(d=g)}if(g=i-o,!(!p&&g>0)){if(g/=p,p<0){if(g<u)return;g<d&&(d=g)}else if(p>0){if(g>d)return;g>u&&(u=g)}if(g=r-o,!(!p&&g<0)){if(g/=p,p<0){if(g>d)return;g>u&&(u=g)}else if(p>0){if(g<u)return;g<d&&(d=g)}return u>0&&(n[0]=a+u*c,n[1]=o+u*p),d<1&&(t[0]=a+d*c,t[1]=o+d*p),!0}}}}}var Hc=1e9,A_=-Hc;function GF(n,t,e,i){function s(h,u){return n<=h&&h<=e&&t<=u&&u<=i}function r(h,u,d,c){var p=0,g=0;if(h==null||(p=a(h,d))!==(g=a(u,d))||l(h,u)<0^d>0)do c.point(p===0||p===3?n:e,p>1?i:t);while((p=(p+d+4)%4)!==g);else c.point(u[0],u[1])}function a(h,u){return Ae(h[0]-n)<Ut?u>0?0:3:Ae(h[0]-e)<Ut?u>0?2:1:Ae(h[1]-t)<Ut?u>0?1:0:u>0?3:2}function o(h,u){return l(h.x,u.x)}function l(h,u){var d=a(h,1),c=a(u,1);return d!==c?d-c:d===0?u[1]-h[1]:d===1?h[0]-u[0]:d===2?h[1]-u[1]:u[0]-h[0]}return function(h){var u=h,d=jF(),c,p,g,f,_,m,v,y,b,x,S,k={point:A,lineStart:E,lineEnd:R,polygonStart:T,polygonEnd:M};function A(C,L){s(C,L)&&u.point(C,L)}function w(){for(var C=0,L=0,F=p.length;L<F;++L)for(var D=p[L],z=1,H=D.length,j=D[0],K,Y,$=j[0],X=j[1];z<H;++z)K=$,Y=X,j=D[z],$=j[0],X=j[1],Y<=i?X>i&&($-K)*(i-Y)>(X-Y)*(n-K)&&++C:X<=i&&($-K)*(i-Y)<(X-Y)*(n-K)&&--C;return C}function T(){u=d,c=[],p=[],S=!0}function M(){var C=w(),L=S&&C,F=(c=WF(c)).length;(L||F)&&(h.polygonStart(),L&&(h.lineStart(),r(null,null,1,h),h.lineEnd()),F&&NF(c,o,C,r,h),h.polygonEnd()),u=h,c=p=g=null}function E(){k.point=B,p&&p.push(g=[]),x=!0,b=!1,v=y=NaN}function R(){c&&(B(f,_),m&&b&&d.rejoin(),c.push(d.result())),k.point=A,b&&u.lineEnd()}function B(C,L){var F=s(C,L);if(p&&g.push([C,L]),x)f=C,_=L,m=F,x=!1,F&&(u.lineStart(),u.point(C,L));else if(F&&b)u.point(C,L);else{var D=[v=Math.max(A_,Math.min(Hc,v)),y=Math.max(A_,Math.min(Hc,y))],z=[C=Math.max(A_,Math.min(Hc,C)),L=Math.max(A_,Math.min(Hc,L))];zG(D,z,n,t,e,i)?(b||(u.lineStart(),u.point(D[0],D[1])),u.point(z[0],z[1]),F||u.lineEnd(),S=!1):F&&(u.lineStart(),u.point(C,L),S=!1)}v=C,y=L,b=F}return k}}function xg(n){return n}var Lx=Py(),P1=Py(),$F,YF,R1,E1,Oa={point:Hs,lineStart:Hs,lineEnd:Hs,polygonStart:function(){Oa.lineStart=HG,Oa.lineEnd=NG},polygonEnd:function(){Oa.lineStart=Oa.lineEnd=Oa.point=Hs,Lx.add(Ae(P1)),P1.reset()},result:function(){var n=Lx/2;return Lx.reset(),n}};function HG(){Oa.point=jG}function jG(n,t){Oa.point=XF,$F=R1=n,YF=E1=t}function XF(n,t){P1.add(E1*n-R1*t),R1=n,E1=t}function NG(){XF($F,YF)}var kd=1/0,av=kd,Sg=-kd,ov=Sg,lv={point:VG,lineStart:Hs,lineEnd:Hs,polygonStart:Hs,polygonEnd:Hs,result:function(){var n=[[kd,av],[Sg,ov]];return Sg=ov=-(av=kd=1/0),n}};function VG(n,t){n<kd&&(kd=n),n>Sg&&(Sg=n),t<av&&(av=t),t>ov&&(ov=t)}var B1=0,O1=0,jc=0,hv=0,uv=0,vu=0,L1=0,I1=0,Nc=0,KF,qF,Gr,$r,Is={point:ph,lineStart:VP,lineEnd:WP,polygonStart:function(){Is.lineStart=GG,Is.lineEnd=$G},polygonEnd:function(){Is.point=ph,Is.lineStart=VP,Is.lineEnd=WP},result:function(){var n=Nc?[L1/Nc,I1/Nc]:vu?[hv/vu,uv/vu]:jc?[B1/jc,O1/jc]:[NaN,NaN];return B1=O1=jc=hv=uv=vu=L1=I1=Nc=0,n}};function ph(n,t){B1+=n,O1+=t,++jc}function VP(){Is.point=WG}function WG(n,t){Is.point=UG,ph(Gr=n,$r=t)}function UG(n,t){var e=n-Gr,i=t-$r,s=qn(e*e+i*i);hv+=s*(Gr+n)/2,uv+=s*($r+t)/2,vu+=s,ph(Gr=n,$r=t)}function WP(){Is.point=ph}function GG(){Is.point=YG}function $G(){ZF(KF,qF)}function YG(n,t){Is.point=ZF,ph(KF=Gr=n,qF=$r=t)}function ZF(n,t){var e=n-Gr,i=t-$r,s=qn(e*e+i*i);hv+=s*(Gr+n)/2,uv+=s*($r+t)/2,vu+=s,s=$r*n-Gr*t,L1+=s*(Gr+n),I1+=s*($r+t),Nc+=s*3,ph(Gr=n,$r=t)}function QF(n){this._context=n}QF.prototype={_radius:4.5,pointRadius:function(n){return this._radius=n,this},polygonStart:function(){this._line=0},polygonEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){this._line===0&&this._context.closePath(),this._point=NaN},point:function(n,t){switch(this._point){case 0:{this._context.moveTo(n,t),this._point=1;break}case 1:{this._context.lineTo(n,t);break}default:{this._context.moveTo(n+this._radius,t),this._context.arc(n,t,this._radius,0,us);break}}},result:Hs};var D1=Py(),Ix,JF,tz,Vc,Wc,Ag={point:Hs,lineStart:function(){Ag.point=XG},lineEnd:function(){Ix&&ez(JF,tz),Ag.point=Hs},polygonStart:function(){Ix=!0},polygonEnd:function(){Ix=null},result:function(){var n=+D1;return D1.reset(),n}};function XG(n,t){Ag.point=ez,JF=Vc=n,tz=Wc=t}function ez(n,t){Vc-=n,Wc-=t,D1.add(qn(Vc*Vc+Wc*Wc)),Vc=n,Wc=t}function iz(){this._string=[]}iz.prototype={_radius:4.5,_circle:UP(4.5),pointRadius:function(n){return(n=+n)!==this._radius&&(this._radius=n,this._circle=null),this},polygonStart:function(){this._line=0},polygonEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){this._line===0&&this._string.push("Z"),this._point=NaN},point:function(n,t){switch(this._point){case 0:{this._string.push("M",n,",",t),this._point=1;break}case 1:{this._string.push("L",n,",",t);break}default:{this._circle==null&&(this._circle=UP(this._radius)),this._string.push("M",n,",",t,this._circle);break}}},result:function(){if(this._string.length){var n=this._string.join("");return this._string=[],n}else return null}};function UP(n){return"m0,"+n+"a"+n+","+n+" 0 1,1 0,"+-2*n+"a"+n+","+n+" 0 1,1 0,"+2*n+"z"}function $w(n,t){var e=4.5,i,s;function r(a){return a&&(typeof e=="function"&&s.pointRadius(+e.apply(this,arguments)),Qh(a,i(s))),s.result()}return r.area=function(a){return Qh(a,i(Oa)),Oa.result()},r.measure=function(a){return Qh(a,i(Ag)),Ag.result()},r.bounds=function(a){return Qh(a,i(lv)),lv.result()},r.centroid=function(a){return Qh(a,i(Is)),Is.result()},r.projection=function(a){return arguments.length?(i=a==null?(n=null,xg):(n=a).stream,r):n},r.context=function(a){return arguments.length?(s=a==null?(t=null,new iz):new QF(t=a),typeof e!="function"&&s.pointRadius(e),r):t},r.pointRadius=function(a){return arguments.length?(e=typeof a=="function"?a:(s.pointRadius(+a),+a),r):e},r.projection(n).context(t)}function Ry(n){return function(t){var e=new F1;for(var i in n)e[i]=n[i];return e.stream=t,e}}function F1(){}F1.prototype={constructor:F1,point:function(n,t){this.stream.point(n,t)},sphere:function(){this.stream.sphere()},lineStart:function(){this.stream.lineStart()},lineEnd:function(){this.stream.lineEnd()},polygonStart:function(){this.stream.polygonStart()},polygonEnd:function(){this.stream.polygonEnd()}};function Yw(n,t,e){var i=n.clipExtent&&n.clipExtent();return n.scale(150).translate([0,0]),i!=null&&n.clipExtent(null),Qh(e,n.stream(lv)),t(lv.result()),i!=null&&n.clipExtent(i),n}function Ey(n,t,e){return Yw(n,function(i){var s=t[1][0]-t[0][0],r=t[1][1]-t[0][1],a=Math.min(s/(i[1][0]-i[0][0]),r/(i[1][1]-i[0][1])),o=+t[0][0]+(s-a*(i[1][0]+i[0][0]))/2,l=+t[0][1]+(r-a*(i[1][1]+i[0][1]))/2;n.scale(150*a).translate([o,l])},e)}function Xw(n,t,e){return Ey(n,[[0,0],t],e)}function Kw(n,t,e){return Yw(n,function(i){var s=+t,r=s/(i[1][0]-i[0][0]),a=(s-r*(i[1][0]+i[0][0]))/2,o=-r*i[0][1];n.scale(150*r).translate([a,o])},e)}function qw(n,t,e){return Yw(n,function(i){var s=+t,r=s/(i[1][1]-i[0][1]),a=-r*i[0][0],o=(s-r*(i[1][1]+i[0][1]))/2;n.scale(150*r).translate([a,o])},e)}var GP=16,KG=Zt(30*Ze);function $P(n,t){return+t?ZG(n,t):qG(n)}function qG(n){return Ry({point:function(t,e){t=n(t,e),this.stream.point(t[0],t[1])}})}function ZG(n,t){function e(i,s,r,a,o,l,h,u,d,c,p,g,f,_){var m=h-i,v=u-s,y=m*m+v*v;if(y>4*t&&f--){var b=a+c,x=o+p,S=l+g,k=qn(b*b+x*x+S*S),A=$s(S/=k),w=Ae(Ae(S)-1)<Ut||Ae(r-d)<Ut?(r+d)/2:no(x,b),T=n(w,A),M=T[0],E=T[1],R=M-i,B=E-s,C=v*R-m*B;(C*C/y>t||Ae((m*R+v*B)/y-.5)>.3||a*c+o*p+l*g<KG)&&(e(i,s,r,a,o,l,M,E,w,b/=k,x/=k,S,f,_),_.point(M,E),e(M,E,w,b,x,S,h,u,d,c,p,g,f,_))}}return function(i){var s,r,a,o,l,h,u,d,c,p,g,f,_={point:m,lineStart:v,lineEnd:b,polygonStart:function(){i.polygonStart(),_.lineStart=x},polygonEnd:function(){i.polygonEnd(),_.lineStart=v}};function m(A,w){A=n(A,w),i.point(A[0],A[1])}function v(){d=NaN,_.point=y,i.lineStart()}function y(A,w){var T=Ad([A,w]),M=n(A,w);e(d,c,u,p,g,f,d=M[0],c=M[1],u=A,p=T[0],g=T[1],f=T[2],GP,i),i.point(d,c)}function b(){_.point=m,i.lineEnd()}function x(){v(),_.point=S,_.lineEnd=k}function S(A,w){y(s=A,w),r=d,a=c,o=p,l=g,h=f,_.point=y}function k(){e(d,c,u,p,g,f,r,a,s,o,l,h,GP,i),_.lineEnd=b,b()}return _}}var QG=Ry({point:function(n,t){this.stream.point(n*Ze,t*Ze)}});function JG(n){return Ry({point:function(t,e){var i=n(t,e);return this.stream.point(i[0],i[1])}})}function t$(n,t,e,i,s){function r(a,o){return a*=i,o*=s,[t+n*a,e-n*o]}return r.invert=function(a,o){return[(a-t)/n*i,(e-o)/n*s]},r}function YP(n,t,e,i,s,r){var a=Zt(r),o=Gt(r),l=a*n,h=o*n,u=a/n,d=o/n,c=(o*e-a*t)/n,p=(o*t+a*e)/n;function g(f,_){return f*=i,_*=s,[l*f-h*_+t,e-h*f-l*_]}return g.invert=function(f,_){return[i*(u*f-d*_+c),s*(p-d*f-u*_)]},g}function uo(n){return nz(function(){return n})()}function nz(n){var t,e=150,i=480,s=250,r=0,a=0,o=0,l=0,h=0,u,d=0,c=1,p=1,g=null,f=NP,_=null,m,v,y,b=xg,x=.5,S,k,A,w,T;function M(C){return A(C[0]*Ze,C[1]*Ze)}function E(C){return C=A.invert(C[0],C[1]),C&&[C[0]*hn,C[1]*hn]}M.stream=function(C){return w&&T===C?w:w=QG(JG(u)(f(S(b(T=C)))))},M.preclip=function(C){return arguments.length?(f=C,g=void 0,B()):f},M.postclip=function(C){return arguments.length?(b=C,_=m=v=y=null,B()):b},M.clipAngle=function(C){return arguments.length?(f=+C?FG(g=C*Ze):(g=null,NP),B()):g*hn},M.clipExtent=function(C){return arguments.length?(b=C==null?(_=m=v=y=null,xg):GF(_=+C[0][0],m=+C[0][1],v=+C[1][0],y=+C[1][1]),B()):_==null?null:[[_,m],[v,y]]},M.scale=function(C){return arguments.length?(e=+C,R()):e},M.translate=function(C){return arguments.length?(i=+C[0],s=+C[1],R()):[i,s]},M.center=function(C){return arguments.length?(r=C[0]%360*Ze,a=C[1]%360*Ze,R()):[r*hn,a*hn]},M.rotate=function(C){return arguments.length?(o=C[0]%360*Ze,l=C[1]%360*Ze,h=C.length>2?C[2]%360*Ze:0,R()):[o*hn,l*hn,h*hn]},M.angle=function(C){return arguments.length?(d=C%360*Ze,R()):d*hn},M.reflectX=function(C){return arguments.length?(c=C?-1:1,R()):c<0},M.reflectY=function(C){return arguments.length?(p=C?-1:1,R()):p<0},M.precision=function(C){return arguments.length?(S=$P(k,x=C*C),B()):qn(x)},M.fitExtent=function(C,L){return Ey(M,C,L)},M.fitSize=function(C,L){return Xw(M,C,L)},M.fitWidth=function(C,L){return Kw(M,C,L)},M.fitHeight=function(C,L){return qw(M,C,L)};function R(){var C=YP(e,0,0,c,p,d).apply(null,t(r,a)),L=(d?YP:t$)(e,i-C[0],s-C[1],c,p,d);return u=HF(o,l,h),k=M1(t,L),A=M1(u,k),S=$P(k,x),B()}function B(){return w=T=null,M}return function(){return t=n.apply(this,arguments),M.invert=t.invert&&E,R()}}function Zw(n){var t=0,e=Qt/3,i=nz(n),s=i(t,e);return s.parallels=function(r){return arguments.length?i(t=r[0]*Ze,e=r[1]*Ze):[t*hn,e*hn]},s}function e$(n){var t=Zt(n);function e(i,s){return[i*t,Gt(s)/t]}return e.invert=function(i,s){return[i/t,$s(s*t)]},e}function i$(n,t){var e=Gt(n),i=(e+Gt(t))/2;if(Ae(i)<Ut)return e$(n);var s=1+e*(2*i-e),r=qn(s)/i;function a(o,l){var h=qn(s-2*i*Gt(l))/i;return[h*Gt(o*=i),r-h*Zt(o)]}return a.invert=function(o,l){var h=r-l,u=no(o,Ae(h))*zs(h);return h*i<0&&(u-=Qt*zs(o)*zs(h)),[u/i,$s((s-(o*o+h*h)*i*i)/(2*i))]},a}function dv(){return Zw(i$).scale(155.424).center([0,33.6442])}function sz(){return dv().parallels([29.5,45.5]).scale(1070).translate([480,250]).rotate([96,0]).center([-.6,38.7])}function n$(n){var t=n.length;return{point:function(e,i){for(var s=-1;++s<t;)n[s].point(e,i)},sphere:function(){for(var e=-1;++e<t;)n[e].sphere()},lineStart:function(){for(var e=-1;++e<t;)n[e].lineStart()},lineEnd:function(){for(var e=-1;++e<t;)n[e].lineEnd()},polygonStart:function(){for(var e=-1;++e<t;)n[e].polygonStart()},polygonEnd:function(){for(var e=-1;++e<t;)n[e].polygonEnd()}}}function s$(){var n,t,e=sz(),i,s=dv().rotate([154,0]).center([-2,58.5]).parallels([55,65]),r,a=dv().rotate([157,0]).center([-3,19.9]).parallels([8,18]),o,l,h={point:function(c,p){l=[c,p]}};function u(c){var p=c[0],g=c[1];return l=null,i.point(p,g),l||(r.point(p,g),l)||(o.point(p,g),l)}u.invert=function(c){var p=e.scale(),g=e.translate(),f=(c[0]-g[0])/p,_=(c[1]-g[1])/p;return(_>=.12&&_<.234&&f>=-.425&&f<-.214?s:_>=.166&&_<.234&&f>=-.214&&f<-.115?a:e).invert(c)},u.stream=function(c){return n&&t===c?n:n=n$([e.stream(t=c),s.stream(c),a.stream(c)])},u.precision=function(c){return arguments.length?(e.precision(c),s.precision(c),a.precision(c),d()):e.precision()},u.scale=function(c){return arguments.length?(e.scale(c),s.scale(c*.35),a.scale(c),u.translate(e.translate())):e.scale()},u.translate=function(c){if(!arguments.length)return e.translate();var p=e.scale(),g=+c[0],f=+c[1];return i=e.translate(c).clipExtent([[g-.455*p,f-.238*p],[g+.455*p,f+.238*p]]).stream(h),r=s.translate([g-.307*p,f+.201*p]).clipExtent([[g-.425*p+Ut,f+.12*p+Ut],[g-.214*p-Ut,f+.234*p-Ut]]).stream(h),o=a.translate([g-.205*p,f+.212*p]).clipExtent([[g-.214*p+Ut,f+.166*p+Ut],[g-.115*p-Ut,f+.234*p-Ut]]).stream(h),d()},u.fitExtent=function(c,p){return Ey(u,c,p)},u.fitSize=function(c,p){return Xw(u,c,p)},u.fitWidth=function(c,p){return Kw(u,c,p)},u.fitHeight=function(c,p){return qw(u,c,p)};function d(){return n=t=null,u}return u.scale(1070)}function rz(n){return function(t,e){var i=Zt(t),s=Zt(e),r=n(i*s);return[r*s*Gt(t),r*Gt(e)]}}function kf(n){return function(t,e){var i=qn(t*t+e*e),s=n(i),r=Gt(s),a=Zt(s);return[no(t*r,i*a),$s(i&&e*r/i)]}}var az=rz(function(n){return qn(2/(1+n))});az.invert=kf(function(n){return 2*$s(n/2)});function r$(){return uo(az).scale(124.75).clipAngle(180-.001)}var oz=rz(function(n){return(n=zF(n))&&n/Gt(n)});oz.invert=kf(function(n){return n});function a$(){return uo(oz).scale(79.4188).clipAngle(180-.001)}function By(n,t){return[n,nv(Gw((ci+t)/2))]}By.invert=function(n,t){return[n,2*qd(FF(t))-ci]};function o$(){return lz(By).scale(961/us)}function lz(n){var t=uo(n),e=t.center,i=t.scale,s=t.translate,r=t.clipExtent,a=null,o,l,h;t.scale=function(d){return arguments.length?(i(d),u()):i()},t.translate=function(d){return arguments.length?(s(d),u()):s()},t.center=function(d){return arguments.length?(e(d),u()):e()},t.clipExtent=function(d){return arguments.length?(d==null?a=o=l=h=null:(a=+d[0][0],o=+d[0][1],l=+d[1][0],h=+d[1][1]),u()):a==null?null:[[a,o],[l,h]]};function u(){var d=Qt*i(),c=t(MG(t.rotate()).invert([0,0]));return r(a==null?[[c[0]-d,c[1]-d],[c[0]+d,c[1]+d]]:n===By?[[Math.max(c[0]-d,a),o],[Math.min(c[0]+d,l),h]]:[[a,Math.max(c[1]-d,o)],[l,Math.min(c[1]+d,h)]])}return u()}function k_(n){return Gw((ci+n)/2)}function l$(n,t){var e=Zt(n),i=n===t?Gt(n):nv(e/Zt(t))/nv(k_(t)/k_(n)),s=e*Rx(k_(n),i)/i;if(!i)return By;function r(a,o){s>0?o<-ci+Ut&&(o=-ci+Ut):o>ci-Ut&&(o=ci-Ut);var l=s/Rx(k_(o),i);return[l*Gt(i*a),s-l*Zt(i*a)]}return r.invert=function(a,o){var l=s-o,h=zs(i)*qn(a*a+l*l),u=no(a,Ae(l))*zs(l);return l*i<0&&(u-=Qt*zs(a)*zs(l)),[u/i,2*qd(Rx(s/h,1/i))-ci]},r}function h$(){return Zw(l$).scale(109.5).parallels([30,30])}function cv(n,t){return[n,t]}cv.invert=cv;function u$(){return uo(cv).scale(152.63)}function d$(n,t){var e=Zt(n),i=n===t?Gt(n):(e-Zt(t))/(t-n),s=e/i+n;if(Ae(i)<Ut)return cv;function r(a,o){var l=s-o,h=i*a;return[l*Gt(h),s-l*Zt(h)]}return r.invert=function(a,o){var l=s-o,h=no(a,Ae(l))*zs(l);return l*i<0&&(h-=Qt*zs(a)*zs(l)),[h/i,s-zs(i)*qn(a*a+l*l)]},r}function c$(){return Zw(d$).scale(131.154).center([0,13.9389])}var lp=1.340264,hp=-.081106,up=893e-6,dp=.003796,pv=qn(3)/2,p$=12;function hz(n,t){var e=$s(pv*Gt(t)),i=e*e,s=i*i*i;return[n*Zt(e)/(pv*(lp+3*hp*i+s*(7*up+9*dp*i))),e*(lp+hp*i+s*(up+dp*i))]}hz.invert=function(n,t){for(var e=t,i=e*e,s=i*i*i,r=0,a,o,l;r<p$&&(o=e*(lp+hp*i+s*(up+dp*i))-t,l=lp+3*hp*i+s*(7*up+9*dp*i),e-=a=o/l,i=e*e,s=i*i*i,!(Ae(a)<TG));++r);return[pv*n*(lp+3*hp*i+s*(7*up+9*dp*i))/Zt(e),$s(Gt(e)/pv)]};function g$(){return uo(hz).scale(177.158)}function uz(n,t){var e=Zt(t),i=Zt(n)*e;return[e*Gt(n)/i,Gt(t)/i]}uz.invert=kf(qd);function f$(){return uo(uz).scale(144.049).clipAngle(60)}function _$(){var n=1,t=0,e=0,i=1,s=1,r=0,a,o,l=null,h,u,d,c=1,p=1,g=Ry({point:function(b,x){var S=y([b,x]);this.stream.point(S[0],S[1])}}),f=xg,_,m;function v(){return c=n*i,p=n*s,_=m=null,y}function y(b){var x=b[0]*c,S=b[1]*p;if(r){var k=S*a-x*o;x=x*a+S*o,S=k}return[x+t,S+e]}return y.invert=function(b){var x=b[0]-t,S=b[1]-e;if(r){var k=S*a+x*o;x=x*a-S*o,S=k}return[x/c,S/p]},y.stream=function(b){return _&&m===b?_:_=g(f(m=b))},y.postclip=function(b){return arguments.length?(f=b,l=h=u=d=null,v()):f},y.clipExtent=function(b){return arguments.length?(f=b==null?(l=h=u=d=null,xg):GF(l=+b[0][0],h=+b[0][1],u=+b[1][0],d=+b[1][1]),v()):l==null?null:[[l,h],[u,d]]},y.scale=function(b){return arguments.length?(n=+b,v()):n},y.translate=function(b){return arguments.length?(t=+b[0],e=+b[1],v()):[t,e]},y.angle=function(b){return arguments.length?(r=b%360*Ze,o=Gt(r),a=Zt(r),v()):r*hn},y.reflectX=function(b){return arguments.length?(i=b?-1:1,v()):i<0},y.reflectY=function(b){return arguments.length?(s=b?-1:1,v()):s<0},y.fitExtent=function(b,x){return Ey(y,b,x)},y.fitSize=function(b,x){return Xw(y,b,x)},y.fitWidth=function(b,x){return Kw(y,b,x)},y.fitHeight=function(b,x){return qw(y,b,x)},y}function dz(n,t){var e=t*t,i=e*e;return[n*(.8707-.131979*e+i*(-.013791+i*(.003971*e-.001529*i))),t*(1.007226+e*(.015085+i*(-.044475+.028874*e-.005916*i)))]}dz.invert=function(n,t){var e=t,i=25,s;do{var r=e*e,a=r*r;e-=s=(e*(1.007226+r*(.015085+a*(-.044475+.028874*r-.005916*a)))-t)/(1.007226+r*(.015085*3+a*(-.044475*7+.028874*9*r-.005916*11*a)))}while(Ae(s)>Ut&&--i>0);return[n/(.8707+(r=e*e)*(-.131979+r*(-.013791+r*r*r*(.003971-.001529*r)))),e]};function m$(){return uo(dz).scale(175.295)}function cz(n,t){return[Zt(t)*Gt(n),Gt(t)]}cz.invert=kf($s);function v$(){return uo(cz).scale(249.5).clipAngle(90+Ut)}function pz(n,t){var e=Zt(t),i=1+Zt(n)*e;return[e*Gt(n)/i,Gt(t)/i]}pz.invert=kf(function(n){return 2*qd(n)});function y$(){return uo(pz).scale(250).clipAngle(142)}function gz(n,t){return[nv(Gw((ci+t)/2)),-n]}gz.invert=function(n,t){return[-t,2*qd(FF(n))-ci]};function b$(){var n=lz(gz),t=n.center,e=n.rotate;return n.center=function(i){return arguments.length?t([-i[1],i[0]]):(i=t(),[i[1],-i[0]])},n.rotate=function(i){return arguments.length?e([i[0],i[1],i.length>2?i[2]+90:90]):(i=e(),[i[0],i[1],i[2]-90])},e([0,0,90]).scale(159.155)}function x$(n){return n}function S$(n){if(n==null)return x$;var t,e,i=n.scale[0],s=n.scale[1],r=n.translate[0],a=n.translate[1];return function(o,l){l||(t=e=0);var h=2,u=o.length,d=new Array(u);for(d[0]=(t+=o[0])*i+r,d[1]=(e+=o[1])*s+a;h<u;)d[h]=o[h],++h;return d}}function A$(n,t){for(var e,i=n.length,s=i-t;s<--i;)e=n[s],n[s++]=n[i],n[i]=e}function k$(n,t){return typeof t=="string"&&(t=n.objects[t]),t.type==="GeometryCollection"?{type:"FeatureCollection",features:t.geometries.map(function(e){return XP(n,e)})}:XP(n,t)}function XP(n,t){var e=t.id,i=t.bbox,s=t.properties==null?{}:t.properties,r=w$(n,t);return e==null&&i==null?{type:"Feature",properties:s,geometry:r}:i==null?{type:"Feature",id:e,properties:s,geometry:r}:{type:"Feature",id:e,bbox:i,properties:s,geometry:r}}function w$(n,t){var e=S$(n.transform),i=n.arcs;function s(u,d){d.length&&d.pop();for(var c=i[u<0?~u:u],p=0,g=c.length;p<g;++p)d.push(e(c[p],p));u<0&&A$(d,g)}function r(u){return e(u)}function a(u){for(var d=[],c=0,p=u.length;c<p;++c)s(u[c],d);return d.length<2&&d.push(d[0]),d}function o(u){for(var d=a(u);d.length<4;)d.push(d[0]);return d}function l(u){return u.map(o)}function h(u){var d=u.type,c;switch(d){case"GeometryCollection":return{type:d,geometries:u.geometries.map(h)};case"Point":c=r(u.coordinates);break;case"MultiPoint":c=u.coordinates.map(r);break;case"LineString":c=a(u.arcs);break;case"MultiLineString":c=u.arcs.map(a);break;case"Polygon":c=l(u.arcs);break;case"MultiPolygon":c=u.arcs.map(l);break;default:return null}return{type:d,coordinates:c}}return h(t)}var fz={exports:{}},Pr=function(n,t){this.p1=n,this.p2=t};Pr.prototype.rise=function(){return this.p2[1]-this.p1[1]};Pr.prototype.run=function(){return this.p2[0]-this.p1[0]};Pr.prototype.slope=function(){return this.rise()/this.run()};Pr.prototype.yIntercept=function(){return this.p1[1]-this.p1[0]*this.slope(this.p1,this.p2)};Pr.prototype.isVertical=function(){return!isFinite(this.slope())};Pr.prototype.isHorizontal=function(){return this.p1[1]==this.p2[1]};Pr.prototype._perpendicularDistanceHorizontal=function(n){return Math.abs(this.p1[1]-n[1])};Pr.prototype._perpendicularDistanceVertical=function(n){return Math.abs(this.p1[0]-n[0])};Pr.prototype._perpendicularDistanceHasSlope=function(n){var t=this.slope(),e=this.yIntercept();return Math.abs(t*n[0]-n[1]+e)/Math.sqrt(Math.pow(t,2)+1)};Pr.prototype.perpendicularDistance=function(n){return this.isVertical()?this._perpendicularDistanceVertical(n):this.isHorizontal()?this._perpendicularDistanceHorizontal(n):this._perpendicularDistanceHasSlope(n)};var T$=Pr,M$=T$,z1=function(n,t){for(var e=0,i=0,s=1;s<=n.length-2;s++){var r=new M$(n[0],n[n.length-1]).perpendicularDistance(n[s]);r>e&&(i=s,e=r)}if(e>t)var a=z1(n.slice(0,i),t),o=z1(n.slice(i,n.length),t),l=a.concat(o);else n.length>1?l=[n[0],n[n.length-1]]:l=[n[0]];return l},C$=z1;(function(n){var t=C$;n.exports=function(s,r,a){return a||(s=JSON.parse(JSON.stringify(s))),s.features?i(s,r):s.type&&s.type==="Feature"?e(s,r):new Error("FeatureCollection or individual Feature required")},n.exports.simplify=function(s,r){return t(s,r)};function e(s,r){var a=s.geometry,o=a.type;if(o==="LineString")a.coordinates=n.exports.simplify(a.coordinates,r);else if(o==="Polygon"||o==="MultiLineString")for(var l=0;l<a.coordinates.length;l++)a.coordinates[l]=n.exports.simplify(a.coordinates[l],r);else if(o==="MultiPolygon")for(var h=0;h<a.coordinates.length;h++)for(var u=0;u<a.coordinates[h].length;u++)a.coordinates[h][u]=n.exports.simplify(a.coordinates[h][u],r);return s}function i(s,r){for(var a=0;a<s.features.length;a++)s.features[a]=e(s.features[a],r);return s}})(fz);var P$=fz.exports;const R$=Uk(P$),Oy=function(n,...t){return B$(gn(n),...t)};function _z(n,t,e){const i=t[e];if(i===void 0)n[e]=null;else if(kt(i)){kt(n[e])||(n[e]={});for(const s in i)_z(n[e],i,s)}else n[e]=i}function E$(n,t){if(kt(t)&&n!==t)for(const e in t)_z(n,t,e)}function B$(n,...t){n||(n={});let e=-1;const i=t.length;for(;++e<i;)E$(n,t[e]);return n}const O$={tolerance:.01},L$=(n,t)=>{const e=Oy(O$,t),{tolerance:i}=e;return R$(n,i)};var gh;(function(n){n.DSV="dsv",n.TREE="tree",n.GEO="geo",n.BYTE="bytejson",n.HEX="hex",n.GRAPH="graph",n.TABLE="table",n.GEO_GRATICULE="geo-graticule"})(gh||(gh={}));const I$=(n,t)=>{const{fields:e,key:i,value:s,retains:r}=t,a=[];for(let o=0;o<n.length;o++)e.forEach(l=>{const h={};if(h[i]=l,h[s]=n[o][l],r)r.forEach(u=>{h[u]=n[o][u]});else for(const u in n[o])e.indexOf(u)===-1&&(h[u]=n[o][u]);a.push(h)});return a},mz=(n,t)=>{var e,i;if(!(t!=null&&t.fields)||n.length===0)return n;const s=t.fields,r=n[0],a={},o=[];for(const l in s)if(Object.prototype.hasOwnProperty.call(s,l)){const h=s[l];if(h.sort&&(U(h.sortIndex)||(h.sortIndex=0),P(h.sortReverse)||(h.sortReverse=h.sort==="desc")),!h.type){let d=r;l in r||(d=(e=n.find(c=>l in c))!==null&&e!==void 0?e:r),h.type=typeof d[l]=="number"?"linear":"ordinal"}let u;if(typeof h.sortIndex=="number"&&(u={key:l,type:h.type,index:h.sortIndex,sortIndex:{},sortIndexCount:0,sortReverse:h.sortReverse===!0},o.push(u)),((i=h.domain)===null||i===void 0?void 0:i.length)>0)if(h.type==="ordinal"){h._domainCache={},a[l]=h;const d={};h.domain.forEach((c,p)=>{d[c]=p,h._domainCache[c]=p}),u&&(u.sortIndex=d,u.sortIndexCount=h.domain.length)}else h.domain.length>=2&&(a[l]=h)}return Object.keys(a).length>0&&(n=n.filter(l=>{for(const h in a){const u=a[h];if(u.type==="ordinal"){if(!(l[h]in u._domainCache))return!1}else if(u.domain[0]>l[h]||u.domain[1]<l[h])return!1}return!0})),o.sort((l,h)=>l.index-h.index),n.sort((l,h)=>D$(l,h,o)),n};function D$(n,t,e){for(let i=0;i<e.length;i++){const s=e[i];let r=0;if(s.type==="ordinal"?(s.sortIndex[t[s.key]]===void 0&&(s.sortIndex[t[s.key]]=s.sortIndexCount++),s.sortIndex[n[s.key]]===void 0&&(s.sortIndex[n[s.key]]=s.sortIndexCount++),r=s.sortIndex[n[s.key]]-s.sortIndex[t[s.key]]):s.type==="linear"&&(r=n[s.key]-t[s.key]),s.sortReverse&&(r=-r),r!==0)return r}return 0}const KP=(n,t)=>{var e,i,s,r;const{numBins:a,thresholds:o,countName:l,percentageName:h,valuesName:u,countField:d,field:c,n:p,x0Name:g,x1Name:f}=t,_=t.groupField,m=Array.isArray(_)?_.length>0:!!_,v=[];if(!m)for(let T=0;T<a;T++){const M={[g]:o[T],[f]:o[T+1],[l]:0};t.includeValues&&(M[u]=[]),v.push(M)}const y=m?new Array(a).fill(0).map(()=>new Map):[],b=m?new Array(a).fill(0).map(()=>new Map):[],x=[],S=new Set,k=new Map;for(let T=0;T<p;T++){const M=n[T][c];if(M==null)continue;const E=+M;if(Number.isFinite(E))for(let R=0;R<a;R++){const B=o[R],C=o[R+1];if(E>=B&&E<C||R===a-1&&E<=C){const L=(e=n[T][d])!==null&&e!==void 0?e:1;if(m){let F;F=V(_)?_.map(H=>String(n[T][H])).join("||"):String(n[T][_]);const D=y[R],z=(i=D.get(F))!==null&&i!==void 0?i:0;if(D.set(F,z+L),S.has(F)||(S.add(F),x.push(F),V(_)?k.set(F,Object.fromEntries(_.map(H=>[H,n[T][H]]))):k.set(F,n[T][_])),t&&t.includeValues){const H=b[R];H.has(F)||H.set(F,[]);const j=H.get(F);j&&j.push(n[T])}}else v[R][l]+=L;t&&t.includeValues&&!m&&v[R][u].push(n[T]);break}}}let A=0;const w=[];if(m){for(let M=0;M<a;M++)for(const E of x){const R=(s=y[M].get(E))!==null&&s!==void 0?s:0,B={[g]:o[M],[f]:o[M+1],[l]:R},C=(r=k.get(E))!==null&&r!==void 0?r:{};if(V(_))for(const L of _)B[L]=C[L];else _&&(B[_]=C);t&&t.includeValues&&(B[u]=b[M].get(E)||[]),w.push(B),A+=R}const T=A;for(const M of w)M[h]=T>0?M[l]/T:0}else{for(let T=0,M=v.length;T<M;T++)A+=v[T][l];for(let T=0,M=v.length;T<M;T++)v[T][h]=A>0?v[T][l]/A:0,w.push(v[T])}return w},F$=(n,t)=>{var e,i,s,r,a,o,l,h,u,d;const c=t==null?void 0:t.field;if(!c)return[];const p=t.countField,g=n.length;let f,_=1/0,m=-1/0;if(t.extent)_=t.extent[0],m=t.extent[1];else for(let R=0;R<g;R++){const B=n[R][c];if(O(B))continue;const C=+B;Number.isFinite(C)&&(C<_&&(_=C),C>m&&(m=C))}if(!Number.isFinite(_)||!Number.isFinite(m)||g===0)return[];if(t.thresholds&&t.thresholds.length)f=t.thresholds.slice(),f.sort((R,B)=>R-B);else if(typeof t.step=="number"&&t.step>0){const R=t.step;let B=_;for(t.extent||(B=Math.floor(_/R)*R),f=[B];B<=m;)B+=R,f.push(B)}else{let R=t.bins&&t.bins>0?Math.floor(t.bins):10;if(m-_>1){const B=Math.floor(_),C=Math.ceil((m-B)/R);f=new Array(R+1);for(let L=0;L<=R;L++)if(f[L]=B+C*L,f[L]>m){R=L,f.length=R+1;break}}else{const B=(m-_)/R;f=new Array(R+1);for(let C=0;C<=R;C++)if(f[C]=_+B*C,f[C]>m){R=C,f.length=R+1;break}}}const v=Math.max(0,f.length-1);if(v===0)return[];const y=(i=(e=t.outputNames)===null||e===void 0?void 0:e.x0)!==null&&i!==void 0?i:"x0",b=(r=(s=t.outputNames)===null||s===void 0?void 0:s.x1)!==null&&r!==void 0?r:"x1",x=(o=(a=t.outputNames)===null||a===void 0?void 0:a.count)!==null&&o!==void 0?o:"count",S=(h=(l=t.outputNames)===null||l===void 0?void 0:l.values)!==null&&h!==void 0?h:"values",k=(d=(u=t.outputNames)===null||u===void 0?void 0:u.percentage)!==null&&d!==void 0?d:"percentage",A=V(t==null?void 0:t.facetField)?t==null?void 0:t.facetField:t!=null&&t.facetField?[t.facetField]:[],w=V(t==null?void 0:t.groupField)?t==null?void 0:t.groupField:t!=null&&t.groupField?[t.groupField]:[],T=w.length?w:void 0,M=Object.assign(Object.assign({},t),{numBins:v,thresholds:f,countName:x,percentageName:k,valuesName:S,countField:p,field:c,n:g,x0Name:y,x1Name:b,groupField:T});if(!A.length)return KP(n,M);const E={};return n.forEach(R=>{const B=A.map(C=>R==null?void 0:R[C]).join("-&&-");E[B]?E[B].push(R):E[B]=[R]}),Object.values(E).map(R=>{const B=[...w,...A];return KP(R,Object.assign(Object.assign({},M),{groupField:B.length?B:void 0,n:R.length}))}).flat()},z$=(n,t)=>{var e,i,s,r,a,o,l,h,u,d,c,p,g,f,_,m;const v=t==null?void 0:t.field;if(!v)return[];const y=t==null?void 0:t.groupField;let b=(e=t==null?void 0:t.whiskers)!==null&&e!==void 0?e:1.5;const x=!!(t!=null&&t.includeValues),S=(i=t==null?void 0:t.outputNames)!==null&&i!==void 0?i:{},k=(s=S.key)!==null&&s!==void 0?s:V(y)?null:(r=y)!==null&&r!==void 0?r:"key",A=(a=S.count)!==null&&a!==void 0?a:"count",w=(o=S.mean)!==null&&o!==void 0?o:"mean",T=(l=S.q1)!==null&&l!==void 0?l:"q1",M=(h=S.median)!==null&&h!==void 0?h:"median",E=(u=S.q3)!==null&&u!==void 0?u:"q3",R=(d=S.iqr)!==null&&d!==void 0?d:"iqr",B=(c=S.min)!==null&&c!==void 0?c:"min",C=(p=S.max)!==null&&p!==void 0?p:"max",L=(g=S.lowerWhisker)!==null&&g!==void 0?g:"lowerWhisker",F=(f=S.upperWhisker)!==null&&f!==void 0?f:"upperWhisker",D=(_=S.outliers)!==null&&_!==void 0?_:"outliers",z=(m=S.values)!==null&&m!==void 0?m:"values",H=new Map,j=new Map,K=new Map,Y=n.length;for(let X=0;X<Y;X++){const tt=n[X],et=tt[v];if(O(et))continue;const ct=+et;if(!Number.isFinite(ct))continue;let ut;ut=V(y)?y.map(mt=>String(tt[mt])).join("||"):y?String(tt[y]):"___all",H.has(ut)||(H.set(ut,[]),x&&j.set(ut,[]),V(y)?K.set(ut,Object.fromEntries(y.map(mt=>[mt,tt[mt]]))):K.set(ut,y?tt[y]:null));const at=H.get(ut);if(at&&at.push(ct),x){const mt=j.get(ut);mt&&mt.push(tt)}}V(b)&&(b=[te(Math.min.apply(null,b),0,1),te(Math.max.apply(null,b),0,1)]);const $=[];for(const[X,tt]of H){if(!tt||tt.length===0)continue;const et=tt.slice().sort((qe,De)=>qe-De),ct=et.length,ut=et[0],at=et[et.length-1];let mt=0;for(let qe=0;qe<et.length;qe++)mt+=et[qe];const wt=mt/ct,Dt=Zh(et,.25),Et=Zh(et,.5),yt=Zh(et,.75),gt=yt-Dt,oe=V(b)?Zh(et,b[0]):Dt-b*gt,ve=V(b)?Zh(et,b[1]):yt+b*gt,ft=[];for(let qe=0;qe<et.length;qe++)(et[qe]<oe||et[qe]>ve)&&ft.push(et[qe]);const Ft={},xe=K.get(X);if(k!==null)Ft[k]=xe;else if(V(y)){const qe=xe||{};for(const De of y)Ft[De]=qe[De]}Ft[A]=ct,Ft[w]=wt,Ft[T]=Dt,Ft[M]=Et,Ft[E]=yt,Ft[R]=gt,Ft[B]=ut,Ft[C]=at,Ft[L]=oe,Ft[F]=ve,Ft[D]=ft,x&&(Ft[z]=j.get(X)||[]),$.push(Ft)}return $};var qP={},Dx={},Fx=34,yc=10,zx=13;function vz(n){return new Function("d","return {"+n.map(function(t,e){return JSON.stringify(t)+": d["+e+'] || ""'}).join(",")+"}")}function H$(n,t){var e=vz(n);return function(i,s){return t(e(i),s,n)}}function ZP(n){var t=Object.create(null),e=[];return n.forEach(function(i){for(var s in i)s in t||e.push(t[s]=s)}),e}function Dn(n,t){var e=n+"",i=e.length;return i<t?new Array(t-i+1).join(0)+e:e}function j$(n){return n<0?"-"+Dn(-n,6):n>9999?"+"+Dn(n,6):Dn(n,4)}function N$(n){var t=n.getUTCHours(),e=n.getUTCMinutes(),i=n.getUTCSeconds(),s=n.getUTCMilliseconds();return isNaN(n)?"Invalid Date":j$(n.getUTCFullYear())+"-"+Dn(n.getUTCMonth()+1,2)+"-"+Dn(n.getUTCDate(),2)+(s?"T"+Dn(t,2)+":"+Dn(e,2)+":"+Dn(i,2)+"."+Dn(s,3)+"Z":i?"T"+Dn(t,2)+":"+Dn(e,2)+":"+Dn(i,2)+"Z":e||t?"T"+Dn(t,2)+":"+Dn(e,2)+"Z":"")}function Qw(n){var t=new RegExp('["'+n+`
+`+r.stack}return{value:n,source:t,stack:s,digest:null}}function xx(n,t,e){return{value:n,source:null,stack:e??null,digest:t??null}}function o1(n,t){try{console.error(t.value)}catch(e){setTimeout(function(){throw e})}}var OU=typeof WeakMap=="function"?WeakMap:Map;function FD(n,t,e){e=qa(-1,e),e.tag=3,e.payload={element:null};var i=t.value;return e.callback=function(){Xm||(Xm=!0,m1=i),o1(n,t)},e}function zD(n,t,e){e=qa(-1,e),e.tag=3;var i=n.type.getDerivedStateFromError;if(typeof i=="function"){var s=t.value;e.payload=function(){return i(s)},e.callback=function(){o1(n,t)}}var r=n.stateNode;return r!==null&&typeof r.componentDidCatch=="function"&&(e.callback=function(){o1(n,t),typeof i!="function"&&(Xo===null?Xo=new Set([this]):Xo.add(this));var a=t.stack;this.componentDidCatch(t.value,{componentStack:a!==null?a:""})}),e}function UC(n,t,e){var i=n.pingCache;if(i===null){i=n.pingCache=new OU;var s=new Set;i.set(t,s)}else s=i.get(t),s===void 0&&(s=new Set,i.set(t,s));s.has(e)||(s.add(e),n=YU.bind(null,n,t,e),t.then(n,n))}function GC(n){do{var t;if((t=n.tag===13)&&(t=n.memoizedState,t=t!==null?t.dehydrated!==null:!0),t)return n;n=n.return}while(n!==null);return null}function $C(n,t,e,i,s){return n.mode&1?(n.flags|=65536,n.lanes=s,n):(n===t?n.flags|=65536:(n.flags|=128,e.flags|=131072,e.flags&=-52805,e.tag===1&&(e.alternate===null?e.tag=17:(t=qa(-1,1),t.tag=2,Yo(e,t,1))),e.lanes|=1),n)}var LU=lo.ReactCurrentOwner,Un=!1;function xn(n,t,e,i){t.child=n===null?pD(t,null,e,i):_d(t,n.child,e,i)}function YC(n,t,e,i,s){e=e.render;var r=t.ref;return Yu(t,s),i=Aw(n,t,e,i,r,s),e=kw(),n!==null&&!Un?(t.updateQueue=n.updateQueue,t.flags&=-2053,n.lanes&=~s,io(n,t,s)):($e&&e&&dw(t),t.flags|=1,xn(n,t,i,s),t.child)}function XC(n,t,e,i,s){if(n===null){var r=e.type;return typeof r=="function"&&!Lw(r)&&r.defaultProps===void 0&&e.compare===null&&e.defaultProps===void 0?(t.tag=15,t.type=r,HD(n,t,r,i,s)):(n=fm(e.type,null,i,t,t.mode,s),n.ref=t.ref,n.return=t,t.child=n)}if(r=n.child,!(n.lanes&s)){var a=r.memoizedProps;if(e=e.compare,e=e!==null?e:lg,e(a,i)&&n.ref===t.ref)return io(n,t,s)}return t.flags|=1,n=qo(r,i),n.ref=t.ref,n.return=t,t.child=n}function HD(n,t,e,i,s){if(n!==null){var r=n.memoizedProps;if(lg(r,i)&&n.ref===t.ref)if(Un=!1,t.pendingProps=i=r,(n.lanes&s)!==0)n.flags&131072&&(Un=!0);else return t.lanes=n.lanes,io(n,t,s)}return l1(n,t,e,i,s)}function jD(n,t,e){var i=t.pendingProps,s=i.children,r=n!==null?n.memoizedState:null;if(i.mode==="hidden")if(!(t.mode&1))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},Oe(_u,ss),ss|=e;else{if(!(e&1073741824))return n=r!==null?r.baseLanes|e:e,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:n,cachePool:null,transitions:null},t.updateQueue=null,Oe(_u,ss),ss|=n,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},i=r!==null?r.baseLanes:e,Oe(_u,ss),ss|=i}else r!==null?(i=r.baseLanes|e,t.memoizedState=null):i=e,Oe(_u,ss),ss|=i;return xn(n,t,s,e),t.child}function ND(n,t){var e=t.ref;(n===null&&e!==null||n!==null&&n.ref!==e)&&(t.flags|=512,t.flags|=2097152)}function l1(n,t,e,i,s){var r=Yn(e)?lh:fn.current;return r=gd(t,r),Yu(t,s),e=Aw(n,t,e,i,r,s),i=kw(),n!==null&&!Un?(t.updateQueue=n.updateQueue,t.flags&=-2053,n.lanes&=~s,io(n,t,s)):($e&&i&&dw(t),t.flags|=1,xn(n,t,e,s),t.child)}function KC(n,t,e,i,s){if(Yn(e)){var r=!0;zm(t)}else r=!1;if(Yu(t,s),t.stateNode===null)cm(n,t),DD(t,e,i),a1(t,e,i,s),i=!0;else if(n===null){var a=t.stateNode,o=t.memoizedProps;a.props=o;var l=a.context,h=e.contextType;typeof h=="object"&&h!==null?h=Us(h):(h=Yn(e)?lh:fn.current,h=gd(t,h));var u=e.getDerivedStateFromProps,d=typeof u=="function"||typeof a.getSnapshotBeforeUpdate=="function";d||typeof a.UNSAFE_componentWillReceiveProps!="function"&&typeof a.componentWillReceiveProps!="function"||(o!==i||l!==h)&&WC(t,a,i,h),ko=!1;var c=t.memoizedState;a.state=c,Wm(t,i,a,s),l=t.memoizedState,o!==i||c!==l||$n.current||ko?(typeof u=="function"&&(r1(t,e,u,i),l=t.memoizedState),(o=ko||VC(t,e,o,i,c,l,h))?(d||typeof a.UNSAFE_componentWillMount!="function"&&typeof a.componentWillMount!="function"||(typeof a.componentWillMount=="function"&&a.componentWillMount(),typeof a.UNSAFE_componentWillMount=="function"&&a.UNSAFE_componentWillMount()),typeof a.componentDidMount=="function"&&(t.flags|=4194308)):(typeof a.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=i,t.memoizedState=l),a.props=i,a.state=l,a.context=h,i=o):(typeof a.componentDidMount=="function"&&(t.flags|=4194308),i=!1)}else{a=t.stateNode,fD(n,t),o=t.memoizedProps,h=t.type===t.elementType?o:or(t.type,o),a.props=h,d=t.pendingProps,c=a.context,l=e.contextType,typeof l=="object"&&l!==null?l=Us(l):(l=Yn(e)?lh:fn.current,l=gd(t,l));var p=e.getDerivedStateFromProps;(u=typeof p=="function"||typeof a.getSnapshotBeforeUpdate=="function")||typeof a.UNSAFE_componentWillReceiveProps!="function"&&typeof a.componentWillReceiveProps!="function"||(o!==d||c!==l)&&WC(t,a,i,l),ko=!1,c=t.memoizedState,a.state=c,Wm(t,i,a,s);var g=t.memoizedState;o!==d||c!==g||$n.current||ko?(typeof p=="function"&&(r1(t,e,p,i),g=t.memoizedState),(h=ko||VC(t,e,h,i,c,g,l)||!1)?(u||typeof a.UNSAFE_componentWillUpdate!="function"&&typeof a.componentWillUpdate!="function"||(typeof a.componentWillUpdate=="function"&&a.componentWillUpdate(i,g,l),typeof a.UNSAFE_componentWillUpdate=="function"&&a.UNSAFE_componentWillUpdate(i,g,l)),typeof a.componentDidUpdate=="function"&&(t.flags|=4),typeof a.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof a.componentDidUpdate!="function"||o===n.memoizedProps&&c===n.memoizedState||(t.flags|=4),typeof a.getSnapshotBeforeUpdate!="function"||o===n.memoizedProps&&c===n.memoizedState||(t.flags|=1024),t.memoizedProps=i,t.memoizedState=g),a.props=i,a.state=g,a.context=l,i=h):(typeof a.componentDidUpdate!="function"||o===n.memoizedProps&&c===n.memoizedState||(t.flags|=4),typeof a.getSnapshotBeforeUpdate!="function"||o===n.memoizedProps&&c===n.memoizedState||(t.flags|=1024),i=!1)}return h1(n,t,e,i,r,s)}function h1(n,t,e,i,s,r){ND(n,t);var a=(t.flags&128)!==0;if(!i&&!a)return s&&LC(t,e,!1),io(n,t,r);i=t.stateNode,LU.current=t;var o=a&&typeof e.getDerivedStateFromError!="function"?null:i.render();return t.flags|=1,n!==null&&a?(t.child=_d(t,n.child,null,r),t.child=_d(t,null,o,r)):xn(n,t,o,r),t.memoizedState=i.state,s&&LC(t,e,!0),t.child}function VD(n){var t=n.stateNode;t.pendingContext?OC(n,t.pendingContext,t.pendingContext!==t.context):t.context&&OC(n,t.context,!1),yw(n,t.containerInfo)}function qC(n,t,e,i,s){return fd(),pw(s),t.flags|=256,xn(n,t,e,i),t.child}var u1={dehydrated:null,treeContext:null,retryLane:0};function d1(n){return{baseLanes:n,cachePool:null,transitions:null}}function WD(n,t,e){var i=t.pendingProps,s=Qe.current,r=!1,a=(t.flags&128)!==0,o;if((o=a)||(o=n!==null&&n.memoizedState===null?!1:(s&2)!==0),o?(r=!0,t.flags&=-129):(n===null||n.memoizedState!==null)&&(s|=1),Oe(Qe,s&1),n===null)return n1(t),n=t.memoizedState,n!==null&&(n=n.dehydrated,n!==null)?(t.mode&1?n.data==="$!"?t.lanes=8:t.lanes=1073741824:t.lanes=1,null):(a=i.children,n=i.fallback,r?(i=t.mode,r=t.child,a={mode:"hidden",children:a},!(i&1)&&r!==null?(r.childLanes=0,r.pendingProps=a):r=Ay(a,i,0,null),n=Zl(n,i,e,null),r.return=t,n.return=t,r.sibling=n,t.child=r,t.child.memoizedState=d1(e),t.memoizedState=u1,n):Mw(t,a));if(s=n.memoizedState,s!==null&&(o=s.dehydrated,o!==null))return IU(n,t,a,i,o,s,e);if(r){r=i.fallback,a=t.mode,s=n.child,o=s.sibling;var l={mode:"hidden",children:i.children};return!(a&1)&&t.child!==s?(i=t.child,i.childLanes=0,i.pendingProps=l,t.deletions=null):(i=qo(s,l),i.subtreeFlags=s.subtreeFlags&14680064),o!==null?r=qo(o,r):(r=Zl(r,a,e,null),r.flags|=2),r.return=t,i.return=t,i.sibling=r,t.child=i,i=r,r=t.child,a=n.child.memoizedState,a=a===null?d1(e):{baseLanes:a.baseLanes|e,cachePool:null,transitions:a.transitions},r.memoizedState=a,r.childLanes=n.childLanes&~e,t.memoizedState=u1,i}return r=n.child,n=r.sibling,i=qo(r,{mode:"visible",children:i.children}),!(t.mode&1)&&(i.lanes=e),i.return=t,i.sibling=null,n!==null&&(e=t.deletions,e===null?(t.deletions=[n],t.flags|=16):e.push(n)),t.child=i,t.memoizedState=null,i}function Mw(n,t){return t=Ay({mode:"visible",children:t},n.mode,0,null),t.return=n,n.child=t}function c_(n,t,e,i){return i!==null&&pw(i),_d(t,n.child,null,e),n=Mw(t,t.pendingProps.children),n.flags|=2,t.memoizedState=null,n}function IU(n,t,e,i,s,r,a){if(e)return t.flags&256?(t.flags&=-257,i=xx(Error(rt(422))),c_(n,t,a,i)):t.memoizedState!==null?(t.child=n.child,t.flags|=128,null):(r=i.fallback,s=t.mode,i=Ay({mode:"visible",children:i.children},s,0,null),r=Zl(r,s,a,null),r.flags|=2,i.return=t,r.return=t,i.sibling=r,t.child=i,t.mode&1&&_d(t,n.child,null,a),t.child.memoizedState=d1(a),t.memoizedState=u1,r);if(!(t.mode&1))return c_(n,t,a,null);if(s.data==="$!"){if(i=s.nextSibling&&s.nextSibling.dataset,i)var o=i.dgst;return i=o,r=Error(rt(419)),i=xx(r,i,void 0),c_(n,t,a,i)}if(o=(a&n.childLanes)!==0,Un||o){if(i=Ui,i!==null){switch(a&-a){case 4:s=2;break;case 16:s=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:s=32;break;case 536870912:s=268435456;break;default:s=0}s=s&(i.suspendedLanes|a)?0:s,s!==0&&s!==r.retryLane&&(r.retryLane=s,eo(n,s),Ar(i,n,s,-1))}return Ow(),i=xx(Error(rt(421))),c_(n,t,a,i)}return s.data==="$?"?(t.flags|=128,t.child=n.child,t=XU.bind(null,n),s._reactRetry=t,null):(n=r.treeContext,as=$o(s.nextSibling),os=t,$e=!0,dr=null,n!==null&&(Ps[Rs++]=za,Ps[Rs++]=Ha,Ps[Rs++]=hh,za=n.id,Ha=n.overflow,hh=t),t=Mw(t,i.children),t.flags|=4096,t)}function ZC(n,t,e){n.lanes|=t;var i=n.alternate;i!==null&&(i.lanes|=t),s1(n.return,t,e)}function Sx(n,t,e,i,s){var r=n.memoizedState;r===null?n.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:i,tail:e,tailMode:s}:(r.isBackwards=t,r.rendering=null,r.renderingStartTime=0,r.last=i,r.tail=e,r.tailMode=s)}function UD(n,t,e){var i=t.pendingProps,s=i.revealOrder,r=i.tail;if(xn(n,t,i.children,e),i=Qe.current,i&2)i=i&1|2,t.flags|=128;else{if(n!==null&&n.flags&128)t:for(n=t.child;n!==null;){if(n.tag===13)n.memoizedState!==null&&ZC(n,e,t);else if(n.tag===19)ZC(n,e,t);else if(n.child!==null){n.child.return=n,n=n.child;continue}if(n===t)break t;for(;n.sibling===null;){if(n.return===null||n.return===t)break t;n=n.return}n.sibling.return=n.return,n=n.sibling}i&=1}if(Oe(Qe,i),!(t.mode&1))t.memoizedState=null;else switch(s){case"forwards":for(e=t.child,s=null;e!==null;)n=e.alternate,n!==null&&Um(n)===null&&(s=e),e=e.sibling;e=s,e===null?(s=t.child,t.child=null):(s=e.sibling,e.sibling=null),Sx(t,!1,s,e,r);break;case"backwards":for(e=null,s=t.child,t.child=null;s!==null;){if(n=s.alternate,n!==null&&Um(n)===null){t.child=s;break}n=s.sibling,s.sibling=e,e=s,s=n}Sx(t,!0,e,null,r);break;case"together":Sx(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function cm(n,t){!(t.mode&1)&&n!==null&&(n.alternate=null,t.alternate=null,t.flags|=2)}function io(n,t,e){if(n!==null&&(t.dependencies=n.dependencies),dh|=t.lanes,!(e&t.childLanes))return null;if(n!==null&&t.child!==n.child)throw Error(rt(153));if(t.child!==null){for(n=t.child,e=qo(n,n.pendingProps),t.child=e,e.return=t;n.sibling!==null;)n=n.sibling,e=e.sibling=qo(n,n.pendingProps),e.return=t;e.sibling=null}return t.child}function DU(n,t,e){switch(t.tag){case 3:VD(t),fd();break;case 5:_D(t);break;case 1:Yn(t.type)&&zm(t);break;case 4:yw(t,t.stateNode.containerInfo);break;case 10:var i=t.type._context,s=t.memoizedProps.value;Oe(Nm,i._currentValue),i._currentValue=s;break;case 13:if(i=t.memoizedState,i!==null)return i.dehydrated!==null?(Oe(Qe,Qe.current&1),t.flags|=128,null):e&t.child.childLanes?WD(n,t,e):(Oe(Qe,Qe.current&1),n=io(n,t,e),n!==null?n.sibling:null);Oe(Qe,Qe.current&1);break;case 19:if(i=(e&t.childLanes)!==0,n.flags&128){if(i)return UD(n,t,e);t.flags|=128}if(s=t.memoizedState,s!==null&&(s.rendering=null,s.tail=null,s.lastEffect=null),Oe(Qe,Qe.current),i)break;return null;case 22:case 23:return t.lanes=0,jD(n,t,e)}return io(n,t,e)}var GD,c1,$D,YD;GD=function(n,t){for(var e=t.child;e!==null;){if(e.tag===5||e.tag===6)n.appendChild(e.stateNode);else if(e.tag!==4&&e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break;for(;e.sibling===null;){if(e.return===null||e.return===t)return;e=e.return}e.sibling.return=e.return,e=e.sibling}};c1=function(){};$D=function(n,t,e,i){var s=n.memoizedProps;if(s!==i){n=t.stateNode,zl(oa.current);var r=null;switch(e){case"input":s=LS(n,s),i=LS(n,i),r=[];break;case"select":s=ii({},s,{value:void 0}),i=ii({},i,{value:void 0}),r=[];break;case"textarea":s=FS(n,s),i=FS(n,i),r=[];break;default:typeof s.onClick!="function"&&typeof i.onClick=="function"&&(n.onclick=Dm)}HS(e,i);var a;e=null;for(h in s)if(!i.hasOwnProperty(h)&&s.hasOwnProperty(h)&&s[h]!=null)if(h==="style"){var o=s[h];for(a in o)o.hasOwnProperty(a)&&(e||(e={}),e[a]="")}else h!=="dangerouslySetInnerHTML"&&h!=="children"&&h!=="suppressContentEditableWarning"&&h!=="suppressHydrationWarning"&&h!=="autoFocus"&&(eg.hasOwnProperty(h)?r||(r=[]):(r=r||[]).push(h,null));for(h in i){var l=i[h];if(o=s!=null?s[h]:void 0,i.hasOwnProperty(h)&&l!==o&&(l!=null||o!=null))if(h==="style")if(o){for(a in o)!o.hasOwnProperty(a)||l&&l.hasOwnProperty(a)||(e||(e={}),e[a]="");for(a in l)l.hasOwnProperty(a)&&o[a]!==l[a]&&(e||(e={}),e[a]=l[a])}else e||(r||(r=[]),r.push(h,e)),e=l;else h==="dangerouslySetInnerHTML"?(l=l?l.__html:void 0,o=o?o.__html:void 0,l!=null&&o!==l&&(r=r||[]).push(h,l)):h==="children"?typeof l!="string"&&typeof l!="number"||(r=r||[]).push(h,""+l):h!=="suppressContentEditableWarning"&&h!=="suppressHydrationWarning"&&(eg.hasOwnProperty(h)?(l!=null&&h==="onScroll"&&ze("scroll",n),r||o===l||(r=[])):(r=r||[]).push(h,l))}e&&(r=r||[]).push("style",e);var h=r;(t.updateQueue=h)&&(t.flags|=4)}};YD=function(n,t,e,i){e!==i&&(t.flags|=4)};function mc(n,t){if(!$e)switch(n.tailMode){case"hidden":t=n.tail;for(var e=null;t!==null;)t.alternate!==null&&(e=t),t=t.sibling;e===null?n.tail=null:e.sibling=null;break;case"collapsed":e=n.tail;for(var i=null;e!==null;)e.alternate!==null&&(i=e),e=e.sibling;i===null?t||n.tail===null?n.tail=null:n.tail.sibling=null:i.sibling=null}}function on(n){var t=n.alternate!==null&&n.alternate.child===n.child,e=0,i=0;if(t)for(var s=n.child;s!==null;)e|=s.lanes|s.childLanes,i|=s.subtreeFlags&14680064,i|=s.flags&14680064,s.return=n,s=s.sibling;else for(s=n.child;s!==null;)e|=s.lanes|s.childLanes,i|=s.subtreeFlags,i|=s.flags,s.return=n,s=s.sibling;return n.subtreeFlags|=i,n.childLanes=e,t}function FU(n,t,e){var i=t.pendingProps;switch(cw(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return on(t),null;case 1:return Yn(t.type)&&Fm(),on(t),null;case 3:return i=t.stateNode,md(),Ne($n),Ne(fn),xw(),i.pendingContext&&(i.context=i.pendingContext,i.pendingContext=null),(n===null||n.child===null)&&(u_(t)?t.flags|=4:n===null||n.memoizedState.isDehydrated&&!(t.flags&256)||(t.flags|=1024,dr!==null&&(b1(dr),dr=null))),c1(n,t),on(t),null;case 5:bw(t);var s=zl(pg.current);if(e=t.type,n!==null&&t.stateNode!=null)$D(n,t,e,i,s),n.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!i){if(t.stateNode===null)throw Error(rt(166));return on(t),null}if(n=zl(oa.current),u_(t)){i=t.stateNode,e=t.type;var r=t.memoizedProps;switch(i[Ur]=t,i[dg]=r,n=(t.mode&1)!==0,e){case"dialog":ze("cancel",i),ze("close",i);break;case"iframe":case"object":case"embed":ze("load",i);break;case"video":case"audio":for(s=0;s<zc.length;s++)ze(zc[s],i);break;case"source":ze("error",i);break;case"img":case"image":case"link":ze("error",i),ze("load",i);break;case"details":ze("toggle",i);break;case"input":aC(i,r),ze("invalid",i);break;case"select":i._wrapperState={wasMultiple:!!r.multiple},ze("invalid",i);break;case"textarea":lC(i,r),ze("invalid",i)}HS(e,r),s=null;for(var a in r)if(r.hasOwnProperty(a)){var o=r[a];a==="children"?typeof o=="string"?i.textContent!==o&&(r.suppressHydrationWarning!==!0&&h_(i.textContent,o,n),s=["children",o]):typeof o=="number"&&i.textContent!==""+o&&(r.suppressHydrationWarning!==!0&&h_(i.textContent,o,n),s=["children",""+o]):eg.hasOwnProperty(a)&&o!=null&&a==="onScroll"&&ze("scroll",i)}switch(e){case"input":e_(i),oC(i,r,!0);break;case"textarea":e_(i),hC(i);break;case"select":case"option":break;default:typeof r.onClick=="function"&&(i.onclick=Dm)}i=s,t.updateQueue=i,i!==null&&(t.flags|=4)}else{a=s.nodeType===9?s:s.ownerDocument,n==="http://www.w3.org/1999/xhtml"&&(n=x2(e)),n==="http://www.w3.org/1999/xhtml"?e==="script"?(n=a.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild)):typeof i.is=="string"?n=a.createElement(e,{is:i.is}):(n=a.createElement(e),e==="select"&&(a=n,i.multiple?a.multiple=!0:i.size&&(a.size=i.size))):n=a.createElementNS(n,e),n[Ur]=t,n[dg]=i,GD(n,t,!1,!1),t.stateNode=n;t:{switch(a=jS(e,i),e){case"dialog":ze("cancel",n),ze("close",n),s=i;break;case"iframe":case"object":case"embed":ze("load",n),s=i;break;case"video":case"audio":for(s=0;s<zc.length;s++)ze(zc[s],n);s=i;break;case"source":ze("error",n),s=i;break;case"img":case"image":case"link":ze("error",n),ze("load",n),s=i;break;case"details":ze("toggle",n),s=i;break;case"input":aC(n,i),s=LS(n,i),ze("invalid",n);break;case"option":s=i;break;case"select":n._wrapperState={wasMultiple:!!i.multiple},s=ii({},i,{value:void 0}),ze("invalid",n);break;case"textarea":lC(n,i),s=FS(n,i),ze("invalid",n);break;default:s=i}HS(e,s),o=s;for(r in o)if(o.hasOwnProperty(r)){var l=o[r];r==="style"?k2(n,l):r==="dangerouslySetInnerHTML"?(l=l?l.__html:void 0,l!=null&&S2(n,l)):r==="children"?typeof l=="string"?(e!=="textarea"||l!=="")&&ig(n,l):typeof l=="number"&&ig(n,""+l):r!=="suppressContentEditableWarning"&&r!=="suppressHydrationWarning"&&r!=="autoFocus"&&(eg.hasOwnProperty(r)?l!=null&&r==="onScroll"&&ze("scroll",n):l!=null&&Zk(n,r,l,a))}switch(e){case"input":e_(n),oC(n,i,!1);break;case"textarea":e_(n),hC(n);break;case"option":i.value!=null&&n.setAttribute("value",""+Jo(i.value));break;case"select":n.multiple=!!i.multiple,r=i.value,r!=null?Wu(n,!!i.multiple,r,!1):i.defaultValue!=null&&Wu(n,!!i.multiple,i.defaultValue,!0);break;default:typeof s.onClick=="function"&&(n.onclick=Dm)}switch(e){case"button":case"input":case"select":case"textarea":i=!!i.autoFocus;break t;case"img":i=!0;break t;default:i=!1}}i&&(t.flags|=4)}t.ref!==null&&(t.flags|=512,t.flags|=2097152)}return on(t),null;case 6:if(n&&t.stateNode!=null)YD(n,t,n.memoizedProps,i);else{if(typeof i!="string"&&t.stateNode===null)throw Error(rt(166));if(e=zl(pg.current),zl(oa.current),u_(t)){if(i=t.stateNode,e=t.memoizedProps,i[Ur]=t,(r=i.nodeValue!==e)&&(n=os,n!==null))switch(n.tag){case 3:h_(i.nodeValue,e,(n.mode&1)!==0);break;case 5:n.memoizedProps.suppressHydrationWarning!==!0&&h_(i.nodeValue,e,(n.mode&1)!==0)}r&&(t.flags|=4)}else i=(e.nodeType===9?e:e.ownerDocument).createTextNode(i),i[Ur]=t,t.stateNode=i}return on(t),null;case 13:if(Ne(Qe),i=t.memoizedState,n===null||n.memoizedState!==null&&n.memoizedState.dehydrated!==null){if($e&&as!==null&&t.mode&1&&!(t.flags&128))dD(),fd(),t.flags|=98560,r=!1;else if(r=u_(t),i!==null&&i.dehydrated!==null){if(n===null){if(!r)throw Error(rt(318));if(r=t.memoizedState,r=r!==null?r.dehydrated:null,!r)throw Error(rt(317));r[Ur]=t}else fd(),!(t.flags&128)&&(t.memoizedState=null),t.flags|=4;on(t),r=!1}else dr!==null&&(b1(dr),dr=null),r=!0;if(!r)return t.flags&65536?t:null}return t.flags&128?(t.lanes=e,t):(i=i!==null,i!==(n!==null&&n.memoizedState!==null)&&i&&(t.child.flags|=8192,t.mode&1&&(n===null||Qe.current&1?Di===0&&(Di=3):Ow())),t.updateQueue!==null&&(t.flags|=4),on(t),null);case 4:return md(),c1(n,t),n===null&&hg(t.stateNode.containerInfo),on(t),null;case 10:return _w(t.type._context),on(t),null;case 17:return Yn(t.type)&&Fm(),on(t),null;case 19:if(Ne(Qe),r=t.memoizedState,r===null)return on(t),null;if(i=(t.flags&128)!==0,a=r.rendering,a===null)if(i)mc(r,!1);else{if(Di!==0||n!==null&&n.flags&128)for(n=t.child;n!==null;){if(a=Um(n),a!==null){for(t.flags|=128,mc(r,!1),i=a.updateQueue,i!==null&&(t.updateQueue=i,t.flags|=4),t.subtreeFlags=0,i=e,e=t.child;e!==null;)r=e,n=i,r.flags&=14680066,a=r.alternate,a===null?(r.childLanes=0,r.lanes=n,r.child=null,r.subtreeFlags=0,r.memoizedProps=null,r.memoizedState=null,r.updateQueue=null,r.dependencies=null,r.stateNode=null):(r.childLanes=a.childLanes,r.lanes=a.lanes,r.child=a.child,r.subtreeFlags=0,r.deletions=null,r.memoizedProps=a.memoizedProps,r.memoizedState=a.memoizedState,r.updateQueue=a.updateQueue,r.type=a.type,n=a.dependencies,r.dependencies=n===null?null:{lanes:n.lanes,firstContext:n.firstContext}),e=e.sibling;return Oe(Qe,Qe.current&1|2),t.child}n=n.sibling}r.tail!==null&&xi()>yd&&(t.flags|=128,i=!0,mc(r,!1),t.lanes=4194304)}else{if(!i)if(n=Um(a),n!==null){if(t.flags|=128,i=!0,e=n.updateQueue,e!==null&&(t.updateQueue=e,t.flags|=4),mc(r,!0),r.tail===null&&r.tailMode==="hidden"&&!a.alternate&&!$e)return on(t),null}else 2*xi()-r.renderingStartTime>yd&&e!==1073741824&&(t.flags|=128,i=!0,mc(r,!1),t.lanes=4194304);r.isBackwards?(a.sibling=t.child,t.child=a):(e=r.last,e!==null?e.sibling=a:t.child=a,r.last=a)}return r.tail!==null?(t=r.tail,r.rendering=t,r.tail=t.sibling,r.renderingStartTime=xi(),t.sibling=null,e=Qe.current,Oe(Qe,i?e&1|2:e&1),t):(on(t),null);case 22:case 23:return Bw(),i=t.memoizedState!==null,n!==null&&n.memoizedState!==null!==i&&(t.flags|=8192),i&&t.mode&1?ss&1073741824&&(on(t),t.subtreeFlags&6&&(t.flags|=8192)):on(t),null;case 24:return null;case 25:return null}throw Error(rt(156,t.tag))}function zU(n,t){switch(cw(t),t.tag){case 1:return Yn(t.type)&&Fm(),n=t.flags,n&65536?(t.flags=n&-65537|128,t):null;case 3:return md(),Ne($n),Ne(fn),xw(),n=t.flags,n&65536&&!(n&128)?(t.flags=n&-65537|128,t):null;case 5:return bw(t),null;case 13:if(Ne(Qe),n=t.memoizedState,n!==null&&n.dehydrated!==null){if(t.alternate===null)throw Error(rt(340));fd()}return n=t.flags,n&65536?(t.flags=n&-65537|128,t):null;case 19:return Ne(Qe),null;case 4:return md(),null;case 10:return _w(t.type._context),null;case 22:case 23:return Bw(),null;case 24:return null;default:return null}}var p_=!1,cn=!1,HU=typeof WeakSet=="function"?WeakSet:Set,bt=null;function fu(n,t){var e=n.ref;if(e!==null)if(typeof e=="function")try{e(null)}catch(i){li(n,t,i)}else e.current=null}function p1(n,t,e){try{e()}catch(i){li(n,t,i)}}var QC=!1;function jU(n,t){if(qS=Om,n=Q2(),uw(n)){if("selectionStart"in n)var e={start:n.selectionStart,end:n.selectionEnd};else t:{e=(e=n.ownerDocument)&&e.defaultView||window;var i=e.getSelection&&e.getSelection();if(i&&i.rangeCount!==0){e=i.anchorNode;var s=i.anchorOffset,r=i.focusNode;i=i.focusOffset;try{e.nodeType,r.nodeType}catch{e=null;break t}var a=0,o=-1,l=-1,h=0,u=0,d=n,c=null;e:for(;;){for(var p;d!==e||s!==0&&d.nodeType!==3||(o=a+s),d!==r||i!==0&&d.nodeType!==3||(l=a+i),d.nodeType===3&&(a+=d.nodeValue.length),(p=d.firstChild)!==null;)c=d,d=p;for(;;){if(d===n)break e;if(c===e&&++h===s&&(o=a),c===r&&++u===i&&(l=a),(p=d.nextSibling)!==null)break;d=c,c=d.parentNode}d=p}e=o===-1||l===-1?null:{start:o,end:l}}else e=null}e=e||{start:0,end:0}}else e=null;for(ZS={focusedElem:n,selectionRange:e},Om=!1,bt=t;bt!==null;)if(t=bt,n=t.child,(t.subtreeFlags&1028)!==0&&n!==null)n.return=t,bt=n;else for(;bt!==null;){t=bt;try{var g=t.alternate;if(t.flags&1024)switch(t.tag){case 0:case 11:case 15:break;case 1:if(g!==null){var f=g.memoizedProps,_=g.memoizedState,m=t.stateNode,v=m.getSnapshotBeforeUpdate(t.elementType===t.type?f:or(t.type,f),_);m.__reactInternalSnapshotBeforeUpdate=v}break;case 3:var y=t.stateNode.containerInfo;y.nodeType===1?y.textContent="":y.nodeType===9&&y.documentElement&&y.removeChild(y.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(rt(163))}}catch(b){li(t,t.return,b)}if(n=t.sibling,n!==null){n.return=t.return,bt=n;break}bt=t.return}return g=QC,QC=!1,g}function sp(n,t,e){var i=t.updateQueue;if(i=i!==null?i.lastEffect:null,i!==null){var s=i=i.next;do{if((s.tag&n)===n){var r=s.destroy;s.destroy=void 0,r!==void 0&&p1(t,e,r)}s=s.next}while(s!==i)}}function xy(n,t){if(t=t.updateQueue,t=t!==null?t.lastEffect:null,t!==null){var e=t=t.next;do{if((e.tag&n)===n){var i=e.create;e.destroy=i()}e=e.next}while(e!==t)}}function g1(n){var t=n.ref;if(t!==null){var e=n.stateNode;switch(n.tag){case 5:n=e;break;default:n=e}typeof t=="function"?t(n):t.current=n}}function XD(n){var t=n.alternate;t!==null&&(n.alternate=null,XD(t)),n.child=null,n.deletions=null,n.sibling=null,n.tag===5&&(t=n.stateNode,t!==null&&(delete t[Ur],delete t[dg],delete t[t1],delete t[SU],delete t[AU])),n.stateNode=null,n.return=null,n.dependencies=null,n.memoizedProps=null,n.memoizedState=null,n.pendingProps=null,n.stateNode=null,n.updateQueue=null}function KD(n){return n.tag===5||n.tag===3||n.tag===4}function JC(n){t:for(;;){for(;n.sibling===null;){if(n.return===null||KD(n.return))return null;n=n.return}for(n.sibling.return=n.return,n=n.sibling;n.tag!==5&&n.tag!==6&&n.tag!==18;){if(n.flags&2||n.child===null||n.tag===4)continue t;n.child.return=n,n=n.child}if(!(n.flags&2))return n.stateNode}}function f1(n,t,e){var i=n.tag;if(i===5||i===6)n=n.stateNode,t?e.nodeType===8?e.parentNode.insertBefore(n,t):e.insertBefore(n,t):(e.nodeType===8?(t=e.parentNode,t.insertBefore(n,e)):(t=e,t.appendChild(n)),e=e._reactRootContainer,e!=null||t.onclick!==null||(t.onclick=Dm));else if(i!==4&&(n=n.child,n!==null))for(f1(n,t,e),n=n.sibling;n!==null;)f1(n,t,e),n=n.sibling}function _1(n,t,e){var i=n.tag;if(i===5||i===6)n=n.stateNode,t?e.insertBefore(n,t):e.appendChild(n);else if(i!==4&&(n=n.child,n!==null))for(_1(n,t,e),n=n.sibling;n!==null;)_1(n,t,e),n=n.sibling}var Xi=null,lr=!1;function vo(n,t,e){for(e=e.child;e!==null;)qD(n,t,e),e=e.sibling}function qD(n,t,e){if(aa&&typeof aa.onCommitFiberUnmount=="function")try{aa.onCommitFiberUnmount(py,e)}catch{}switch(e.tag){case 5:cn||fu(e,t);case 6:var i=Xi,s=lr;Xi=null,vo(n,t,e),Xi=i,lr=s,Xi!==null&&(lr?(n=Xi,e=e.stateNode,n.nodeType===8?n.parentNode.removeChild(e):n.removeChild(e)):Xi.removeChild(e.stateNode));break;case 18:Xi!==null&&(lr?(n=Xi,e=e.stateNode,n.nodeType===8?fx(n.parentNode,e):n.nodeType===1&&fx(n,e),ag(n)):fx(Xi,e.stateNode));break;case 4:i=Xi,s=lr,Xi=e.stateNode.containerInfo,lr=!0,vo(n,t,e),Xi=i,lr=s;break;case 0:case 11:case 14:case 15:if(!cn&&(i=e.updateQueue,i!==null&&(i=i.lastEffect,i!==null))){s=i=i.next;do{var r=s,a=r.destroy;r=r.tag,a!==void 0&&(r&2||r&4)&&p1(e,t,a),s=s.next}while(s!==i)}vo(n,t,e);break;case 1:if(!cn&&(fu(e,t),i=e.stateNode,typeof i.componentWillUnmount=="function"))try{i.props=e.memoizedProps,i.state=e.memoizedState,i.componentWillUnmount()}catch(o){li(e,t,o)}vo(n,t,e);break;case 21:vo(n,t,e);break;case 22:e.mode&1?(cn=(i=cn)||e.memoizedState!==null,vo(n,t,e),cn=i):vo(n,t,e);break;default:vo(n,t,e)}}function tP(n){var t=n.updateQueue;if(t!==null){n.updateQueue=null;var e=n.stateNode;e===null&&(e=n.stateNode=new HU),t.forEach(function(i){var s=KU.bind(null,n,i);e.has(i)||(e.add(i),i.then(s,s))})}}function sr(n,t){var e=t.deletions;if(e!==null)for(var i=0;i<e.length;i++){var s=e[i];try{var r=n,a=t,o=a;t:for(;o!==null;){switch(o.tag){case 5:Xi=o.stateNode,lr=!1;break t;case 3:Xi=o.stateNode.containerInfo,lr=!0;break t;case 4:Xi=o.stateNode.containerInfo,lr=!0;break t}o=o.return}if(Xi===null)throw Error(rt(160));qD(r,a,s),Xi=null,lr=!1;var l=s.alternate;l!==null&&(l.return=null),s.return=null}catch(h){li(s,t,h)}}if(t.subtreeFlags&12854)for(t=t.child;t!==null;)ZD(t,n),t=t.sibling}function ZD(n,t){var e=n.alternate,i=n.flags;switch(n.tag){case 0:case 11:case 14:case 15:if(sr(t,n),Br(n),i&4){try{sp(3,n,n.return),xy(3,n)}catch(f){li(n,n.return,f)}try{sp(5,n,n.return)}catch(f){li(n,n.return,f)}}break;case 1:sr(t,n),Br(n),i&512&&e!==null&&fu(e,e.return);break;case 5:if(sr(t,n),Br(n),i&512&&e!==null&&fu(e,e.return),n.flags&32){var s=n.stateNode;try{ig(s,"")}catch(f){li(n,n.return,f)}}if(i&4&&(s=n.stateNode,s!=null)){var r=n.memoizedProps,a=e!==null?e.memoizedProps:r,o=n.type,l=n.updateQueue;if(n.updateQueue=null,l!==null)try{o==="input"&&r.type==="radio"&&r.name!=null&&y2(s,r),jS(o,a);var h=jS(o,r);for(a=0;a<l.length;a+=2){var u=l[a],d=l[a+1];u==="style"?k2(s,d):u==="dangerouslySetInnerHTML"?S2(s,d):u==="children"?ig(s,d):Zk(s,u,d,h)}switch(o){case"input":IS(s,r);break;case"textarea":b2(s,r);break;case"select":var c=s._wrapperState.wasMultiple;s._wrapperState.wasMultiple=!!r.multiple;var p=r.value;p!=null?Wu(s,!!r.multiple,p,!1):c!==!!r.multiple&&(r.defaultValue!=null?Wu(s,!!r.multiple,r.defaultValue,!0):Wu(s,!!r.multiple,r.multiple?[]:"",!1))}s[dg]=r}catch(f){li(n,n.return,f)}}break;case 6:if(sr(t,n),Br(n),i&4){if(n.stateNode===null)throw Error(rt(162));s=n.stateNode,r=n.memoizedProps;try{s.nodeValue=r}catch(f){li(n,n.return,f)}}break;case 3:if(sr(t,n),Br(n),i&4&&e!==null&&e.memoizedState.isDehydrated)try{ag(t.containerInfo)}catch(f){li(n,n.return,f)}break;case 4:sr(t,n),Br(n);break;case 13:sr(t,n),Br(n),s=n.child,s.flags&8192&&(r=s.memoizedState!==null,s.stateNode.isHidden=r,!r||s.alternate!==null&&s.alternate.memoizedState!==null||(Rw=xi())),i&4&&tP(n);break;case 22:if(u=e!==null&&e.memoizedState!==null,n.mode&1?(cn=(h=cn)||u,sr(t,n),cn=h):sr(t,n),Br(n),i&8192){if(h=n.memoizedState!==null,(n.stateNode.isHidden=h)&&!u&&n.mode&1)for(bt=n,u=n.child;u!==null;){for(d=bt=u;bt!==null;){switch(c=bt,p=c.child,c.tag){case 0:case 11:case 14:case 15:sp(4,c,c.return);break;case 1:fu(c,c.return);var g=c.stateNode;if(typeof g.componentWillUnmount=="function"){i=c,e=c.return;try{t=i,g.props=t.memoizedProps,g.state=t.memoizedState,g.componentWillUnmount()}catch(f){li(i,e,f)}}break;case 5:fu(c,c.return);break;case 22:if(c.memoizedState!==null){iP(d);continue}}p!==null?(p.return=c,bt=p):iP(d)}u=u.sibling}t:for(u=null,d=n;;){if(d.tag===5){if(u===null){u=d;try{s=d.stateNode,h?(r=s.style,typeof r.setProperty=="function"?r.setProperty("display","none","important"):r.display="none"):(o=d.stateNode,l=d.memoizedProps.style,a=l!=null&&l.hasOwnProperty("display")?l.display:null,o.style.display=A2("display",a))}catch(f){li(n,n.return,f)}}}else if(d.tag===6){if(u===null)try{d.stateNode.nodeValue=h?"":d.memoizedProps}catch(f){li(n,n.return,f)}}else if((d.tag!==22&&d.tag!==23||d.memoizedState===null||d===n)&&d.child!==null){d.child.return=d,d=d.child;continue}if(d===n)break t;for(;d.sibling===null;){if(d.return===null||d.return===n)break t;u===d&&(u=null),d=d.return}u===d&&(u=null),d.sibling.return=d.return,d=d.sibling}}break;case 19:sr(t,n),Br(n),i&4&&tP(n);break;case 21:break;default:sr(t,n),Br(n)}}function Br(n){var t=n.flags;if(t&2){try{t:{for(var e=n.return;e!==null;){if(KD(e)){var i=e;break t}e=e.return}throw Error(rt(160))}switch(i.tag){case 5:var s=i.stateNode;i.flags&32&&(ig(s,""),i.flags&=-33);var r=JC(n);_1(n,r,s);break;case 3:case 4:var a=i.stateNode.containerInfo,o=JC(n);f1(n,o,a);break;default:throw Error(rt(161))}}catch(l){li(n,n.return,l)}n.flags&=-3}t&4096&&(n.flags&=-4097)}function NU(n,t,e){bt=n,QD(n)}function QD(n,t,e){for(var i=(n.mode&1)!==0;bt!==null;){var s=bt,r=s.child;if(s.tag===22&&i){var a=s.memoizedState!==null||p_;if(!a){var o=s.alternate,l=o!==null&&o.memoizedState!==null||cn;o=p_;var h=cn;if(p_=a,(cn=l)&&!h)for(bt=s;bt!==null;)a=bt,l=a.child,a.tag===22&&a.memoizedState!==null?nP(s):l!==null?(l.return=a,bt=l):nP(s);for(;r!==null;)bt=r,QD(r),r=r.sibling;bt=s,p_=o,cn=h}eP(n)}else s.subtreeFlags&8772&&r!==null?(r.return=s,bt=r):eP(n)}}function eP(n){for(;bt!==null;){var t=bt;if(t.flags&8772){var e=t.alternate;try{if(t.flags&8772)switch(t.tag){case 0:case 11:case 15:cn||xy(5,t);break;case 1:var i=t.stateNode;if(t.flags&4&&!cn)if(e===null)i.componentDidMount();else{var s=t.elementType===t.type?e.memoizedProps:or(t.type,e.memoizedProps);i.componentDidUpdate(s,e.memoizedState,i.__reactInternalSnapshotBeforeUpdate)}var r=t.updateQueue;r!==null&&HC(t,r,i);break;case 3:var a=t.updateQueue;if(a!==null){if(e=null,t.child!==null)switch(t.child.tag){case 5:e=t.child.stateNode;break;case 1:e=t.child.stateNode}HC(t,a,e)}break;case 5:var o=t.stateNode;if(e===null&&t.flags&4){e=o;var l=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":l.autoFocus&&e.focus();break;case"img":l.src&&(e.src=l.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(t.memoizedState===null){var h=t.alternate;if(h!==null){var u=h.memoizedState;if(u!==null){var d=u.dehydrated;d!==null&&ag(d)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(rt(163))}cn||t.flags&512&&g1(t)}catch(c){li(t,t.return,c)}}if(t===n){bt=null;break}if(e=t.sibling,e!==null){e.return=t.return,bt=e;break}bt=t.return}}function iP(n){for(;bt!==null;){var t=bt;if(t===n){bt=null;break}var e=t.sibling;if(e!==null){e.return=t.return,bt=e;break}bt=t.return}}function nP(n){for(;bt!==null;){var t=bt;try{switch(t.tag){case 0:case 11:case 15:var e=t.return;try{xy(4,t)}catch(l){li(t,e,l)}break;case 1:var i=t.stateNode;if(typeof i.componentDidMount=="function"){var s=t.return;try{i.componentDidMount()}catch(l){li(t,s,l)}}var r=t.return;try{g1(t)}catch(l){li(t,r,l)}break;case 5:var a=t.return;try{g1(t)}catch(l){li(t,a,l)}}}catch(l){li(t,t.return,l)}if(t===n){bt=null;break}var o=t.sibling;if(o!==null){o.return=t.return,bt=o;break}bt=t.return}}var VU=Math.ceil,Ym=lo.ReactCurrentDispatcher,Cw=lo.ReactCurrentOwner,Ns=lo.ReactCurrentBatchConfig,ce=0,Ui=null,Ei=null,Qi=0,ss=0,_u=ul(0),Di=0,mg=null,dh=0,Sy=0,Pw=0,rp=null,jn=null,Rw=0,yd=1/0,Ta=null,Xm=!1,m1=null,Xo=null,g_=!1,Io=null,Km=0,ap=0,v1=null,pm=-1,gm=0;function wn(){return ce&6?xi():pm!==-1?pm:pm=xi()}function Ko(n){return n.mode&1?ce&2&&Qi!==0?Qi&-Qi:wU.transition!==null?(gm===0&&(gm=D2()),gm):(n=ke,n!==0||(n=window.event,n=n===void 0?16:W2(n.type)),n):1}function Ar(n,t,e,i){if(50<ap)throw ap=0,v1=null,Error(rt(185));yf(n,e,i),(!(ce&2)||n!==Ui)&&(n===Ui&&(!(ce&2)&&(Sy|=e),Di===4&&Ro(n,Qi)),Xn(n,i),e===1&&ce===0&&!(t.mode&1)&&(yd=xi()+500,vy&&dl()))}function Xn(n,t){var e=n.callbackNode;wW(n,t);var i=Bm(n,n===Ui?Qi:0);if(i===0)e!==null&&cC(e),n.callbackNode=null,n.callbackPriority=0;else if(t=i&-i,n.callbackPriority!==t){if(e!=null&&cC(e),t===1)n.tag===0?kU(sP.bind(null,n)):lD(sP.bind(null,n)),bU(function(){!(ce&6)&&dl()}),e=null;else{switch(F2(i)){case 1:e=iw;break;case 4:e=L2;break;case 16:e=Em;break;case 536870912:e=I2;break;default:e=Em}e=aF(e,JD.bind(null,n))}n.callbackPriority=t,n.callbackNode=e}}function JD(n,t){if(pm=-1,gm=0,ce&6)throw Error(rt(327));var e=n.callbackNode;if(Xu()&&n.callbackNode!==e)return null;var i=Bm(n,n===Ui?Qi:0);if(i===0)return null;if(i&30||i&n.expiredLanes||t)t=qm(n,i);else{t=i;var s=ce;ce|=2;var r=eF();(Ui!==n||Qi!==t)&&(Ta=null,yd=xi()+500,ql(n,t));do try{GU();break}catch(o){tF(n,o)}while(!0);fw(),Ym.current=r,ce=s,Ei!==null?t=0:(Ui=null,Qi=0,t=Di)}if(t!==0){if(t===2&&(s=GS(n),s!==0&&(i=s,t=y1(n,s))),t===1)throw e=mg,ql(n,0),Ro(n,i),Xn(n,xi()),e;if(t===6)Ro(n,i);else{if(s=n.current.alternate,!(i&30)&&!WU(s)&&(t=qm(n,i),t===2&&(r=GS(n),r!==0&&(i=r,t=y1(n,r))),t===1))throw e=mg,ql(n,0),Ro(n,i),Xn(n,xi()),e;switch(n.finishedWork=s,n.finishedLanes=i,t){case 0:case 1:throw Error(rt(345));case 2:Rl(n,jn,Ta);break;case 3:if(Ro(n,i),(i&130023424)===i&&(t=Rw+500-xi(),10<t)){if(Bm(n,0)!==0)break;if(s=n.suspendedLanes,(s&i)!==i){wn(),n.pingedLanes|=n.suspendedLanes&s;break}n.timeoutHandle=JS(Rl.bind(null,n,jn,Ta),t);break}Rl(n,jn,Ta);break;case 4:if(Ro(n,i),(i&4194240)===i)break;for(t=n.eventTimes,s=-1;0<i;){var a=31-Sr(i);r=1<<a,a=t[a],a>s&&(s=a),i&=~r}if(i=s,i=xi()-i,i=(120>i?120:480>i?480:1080>i?1080:1920>i?1920:3e3>i?3e3:4320>i?4320:1960*VU(i/1960))-i,10<i){n.timeoutHandle=JS(Rl.bind(null,n,jn,Ta),i);break}Rl(n,jn,Ta);break;case 5:Rl(n,jn,Ta);break;default:throw Error(rt(329))}}}return Xn(n,xi()),n.callbackNode===e?JD.bind(null,n):null}function y1(n,t){var e=rp;return n.current.memoizedState.isDehydrated&&(ql(n,t).flags|=256),n=qm(n,t),n!==2&&(t=jn,jn=e,t!==null&&b1(t)),n}function b1(n){jn===null?jn=n:jn.push.apply(jn,n)}function WU(n){for(var t=n;;){if(t.flags&16384){var e=t.updateQueue;if(e!==null&&(e=e.stores,e!==null))for(var i=0;i<e.length;i++){var s=e[i],r=s.getSnapshot;s=s.value;try{if(!wr(r(),s))return!1}catch{return!1}}}if(e=t.child,t.subtreeFlags&16384&&e!==null)e.return=t,t=e;else{if(t===n)break;for(;t.sibling===null;){if(t.return===null||t.return===n)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Ro(n,t){for(t&=~Pw,t&=~Sy,n.suspendedLanes|=t,n.pingedLanes&=~t,n=n.expirationTimes;0<t;){var e=31-Sr(t),i=1<<e;n[e]=-1,t&=~i}}function sP(n){if(ce&6)throw Error(rt(327));Xu();var t=Bm(n,0);if(!(t&1))return Xn(n,xi()),null;var e=qm(n,t);if(n.tag!==0&&e===2){var i=GS(n);i!==0&&(t=i,e=y1(n,i))}if(e===1)throw e=mg,ql(n,0),Ro(n,t),Xn(n,xi()),e;if(e===6)throw Error(rt(345));return n.finishedWork=n.current.alternate,n.finishedLanes=t,Rl(n,jn,Ta),Xn(n,xi()),null}function Ew(n,t){var e=ce;ce|=1;try{return n(t)}finally{ce=e,ce===0&&(yd=xi()+500,vy&&dl())}}function ch(n){Io!==null&&Io.tag===0&&!(ce&6)&&Xu();var t=ce;ce|=1;var e=Ns.transition,i=ke;try{if(Ns.transition=null,ke=1,n)return n()}finally{ke=i,Ns.transition=e,ce=t,!(ce&6)&&dl()}}function Bw(){ss=_u.current,Ne(_u)}function ql(n,t){n.finishedWork=null,n.finishedLanes=0;var e=n.timeoutHandle;if(e!==-1&&(n.timeoutHandle=-1,yU(e)),Ei!==null)for(e=Ei.return;e!==null;){var i=e;switch(cw(i),i.tag){case 1:i=i.type.childContextTypes,i!=null&&Fm();break;case 3:md(),Ne($n),Ne(fn),xw();break;case 5:bw(i);break;case 4:md();break;case 13:Ne(Qe);break;case 19:Ne(Qe);break;case 10:_w(i.type._context);break;case 22:case 23:Bw()}e=e.return}if(Ui=n,Ei=n=qo(n.current,null),Qi=ss=t,Di=0,mg=null,Pw=Sy=dh=0,jn=rp=null,Fl!==null){for(t=0;t<Fl.length;t++)if(e=Fl[t],i=e.interleaved,i!==null){e.interleaved=null;var s=i.next,r=e.pending;if(r!==null){var a=r.next;r.next=s,i.next=a}e.pending=i}Fl=null}return n}function tF(n,t){do{var e=Ei;try{if(fw(),um.current=$m,Gm){for(var i=ti.memoizedState;i!==null;){var s=i.queue;s!==null&&(s.pending=null),i=i.next}Gm=!1}if(uh=0,Hi=Li=ti=null,np=!1,gg=0,Cw.current=null,e===null||e.return===null){Di=1,mg=t,Ei=null;break}t:{var r=n,a=e.return,o=e,l=t;if(t=Qi,o.flags|=32768,l!==null&&typeof l=="object"&&typeof l.then=="function"){var h=l,u=o,d=u.tag;if(!(u.mode&1)&&(d===0||d===11||d===15)){var c=u.alternate;c?(u.updateQueue=c.updateQueue,u.memoizedState=c.memoizedState,u.lanes=c.lanes):(u.updateQueue=null,u.memoizedState=null)}var p=GC(a);if(p!==null){p.flags&=-257,$C(p,a,o,r,t),p.mode&1&&UC(r,h,t),t=p,l=h;var g=t.updateQueue;if(g===null){var f=new Set;f.add(l),t.updateQueue=f}else g.add(l);break t}else{if(!(t&1)){UC(r,h,t),Ow();break t}l=Error(rt(426))}}else if($e&&o.mode&1){var _=GC(a);if(_!==null){!(_.flags&65536)&&(_.flags|=256),$C(_,a,o,r,t),pw(vd(l,o));break t}}r=l=vd(l,o),Di!==4&&(Di=2),rp===null?rp=[r]:rp.push(r),r=a;do{switch(r.tag){case 3:r.flags|=65536,t&=-t,r.lanes|=t;var m=FD(r,l,t);zC(r,m);break t;case 1:o=l;var v=r.type,y=r.stateNode;if(!(r.flags&128)&&(typeof v.getDerivedStateFromError=="function"||y!==null&&typeof y.componentDidCatch=="function"&&(Xo===null||!Xo.has(y)))){r.flags|=65536,t&=-t,r.lanes|=t;var b=zD(r,o,t);zC(r,b);break t}}r=r.return}while(r!==null)}nF(e)}catch(x){t=x,Ei===e&&e!==null&&(Ei=e=e.return);continue}break}while(!0)}function eF(){var n=Ym.current;return Ym.current=$m,n===null?$m:n}function Ow(){(Di===0||Di===3||Di===2)&&(Di=4),Ui===null||!(dh&268435455)&&!(Sy&268435455)||Ro(Ui,Qi)}function qm(n,t){var e=ce;ce|=2;var i=eF();(Ui!==n||Qi!==t)&&(Ta=null,ql(n,t));do try{UU();break}catch(s){tF(n,s)}while(!0);if(fw(),ce=e,Ym.current=i,Ei!==null)throw Error(rt(261));return Ui=null,Qi=0,Di}function UU(){for(;Ei!==null;)iF(Ei)}function GU(){for(;Ei!==null&&!_W();)iF(Ei)}function iF(n){var t=rF(n.alternate,n,ss);n.memoizedProps=n.pendingProps,t===null?nF(n):Ei=t,Cw.current=null}function nF(n){var t=n;do{var e=t.alternate;if(n=t.return,t.flags&32768){if(e=zU(e,t),e!==null){e.flags&=32767,Ei=e;return}if(n!==null)n.flags|=32768,n.subtreeFlags=0,n.deletions=null;else{Di=6,Ei=null;return}}else if(e=FU(e,t,ss),e!==null){Ei=e;return}if(t=t.sibling,t!==null){Ei=t;return}Ei=t=n}while(t!==null);Di===0&&(Di=5)}function Rl(n,t,e){var i=ke,s=Ns.transition;try{Ns.transition=null,ke=1,$U(n,t,e,i)}finally{Ns.transition=s,ke=i}return null}function $U(n,t,e,i){do Xu();while(Io!==null);if(ce&6)throw Error(rt(327));e=n.finishedWork;var s=n.finishedLanes;if(e===null)return null;if(n.finishedWork=null,n.finishedLanes=0,e===n.current)throw Error(rt(177));n.callbackNode=null,n.callbackPriority=0;var r=e.lanes|e.childLanes;if(TW(n,r),n===Ui&&(Ei=Ui=null,Qi=0),!(e.subtreeFlags&2064)&&!(e.flags&2064)||g_||(g_=!0,aF(Em,function(){return Xu(),null})),r=(e.flags&15990)!==0,e.subtreeFlags&15990||r){r=Ns.transition,Ns.transition=null;var a=ke;ke=1;var o=ce;ce|=4,Cw.current=null,jU(n,e),ZD(e,n),cU(ZS),Om=!!qS,ZS=qS=null,n.current=e,NU(e),mW(),ce=o,ke=a,Ns.transition=r}else n.current=e;if(g_&&(g_=!1,Io=n,Km=s),r=n.pendingLanes,r===0&&(Xo=null),bW(e.stateNode),Xn(n,xi()),t!==null)for(i=n.onRecoverableError,e=0;e<t.length;e++)s=t[e],i(s.value,{componentStack:s.stack,digest:s.digest});if(Xm)throw Xm=!1,n=m1,m1=null,n;return Km&1&&n.tag!==0&&Xu(),r=n.pendingLanes,r&1?n===v1?ap++:(ap=0,v1=n):ap=0,dl(),null}function Xu(){if(Io!==null){var n=F2(Km),t=Ns.transition,e=ke;try{if(Ns.transition=null,ke=16>n?16:n,Io===null)var i=!1;else{if(n=Io,Io=null,Km=0,ce&6)throw Error(rt(331));var s=ce;for(ce|=4,bt=n.current;bt!==null;){var r=bt,a=r.child;if(bt.flags&16){var o=r.deletions;if(o!==null){for(var l=0;l<o.length;l++){var h=o[l];for(bt=h;bt!==null;){var u=bt;switch(u.tag){case 0:case 11:case 15:sp(8,u,r)}var d=u.child;if(d!==null)d.return=u,bt=d;else for(;bt!==null;){u=bt;var c=u.sibling,p=u.return;if(XD(u),u===h){bt=null;break}if(c!==null){c.return=p,bt=c;break}bt=p}}}var g=r.alternate;if(g!==null){var f=g.child;if(f!==null){g.child=null;do{var _=f.sibling;f.sibling=null,f=_}while(f!==null)}}bt=r}}if(r.subtreeFlags&2064&&a!==null)a.return=r,bt=a;else t:for(;bt!==null;){if(r=bt,r.flags&2048)switch(r.tag){case 0:case 11:case 15:sp(9,r,r.return)}var m=r.sibling;if(m!==null){m.return=r.return,bt=m;break t}bt=r.return}}var v=n.current;for(bt=v;bt!==null;){a=bt;var y=a.child;if(a.subtreeFlags&2064&&y!==null)y.return=a,bt=y;else t:for(a=v;bt!==null;){if(o=bt,o.flags&2048)try{switch(o.tag){case 0:case 11:case 15:xy(9,o)}}catch(x){li(o,o.return,x)}if(o===a){bt=null;break t}var b=o.sibling;if(b!==null){b.return=o.return,bt=b;break t}bt=o.return}}if(ce=s,dl(),aa&&typeof aa.onPostCommitFiberRoot=="function")try{aa.onPostCommitFiberRoot(py,n)}catch{}i=!0}return i}finally{ke=e,Ns.transition=t}}return!1}function rP(n,t,e){t=vd(e,t),t=FD(n,t,1),n=Yo(n,t,1),t=wn(),n!==null&&(yf(n,1,t),Xn(n,t))}function li(n,t,e){if(n.tag===3)rP(n,n,e);else for(;t!==null;){if(t.tag===3){rP(t,n,e);break}else if(t.tag===1){var i=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof i.componentDidCatch=="function"&&(Xo===null||!Xo.has(i))){n=vd(e,n),n=zD(t,n,1),t=Yo(t,n,1),n=wn(),t!==null&&(yf(t,1,n),Xn(t,n));break}}t=t.return}}function YU(n,t,e){var i=n.pingCache;i!==null&&i.delete(t),t=wn(),n.pingedLanes|=n.suspendedLanes&e,Ui===n&&(Qi&e)===e&&(Di===4||Di===3&&(Qi&130023424)===Qi&&500>xi()-Rw?ql(n,0):Pw|=e),Xn(n,t)}function sF(n,t){t===0&&(n.mode&1?(t=s_,s_<<=1,!(s_&130023424)&&(s_=4194304)):t=1);var e=wn();n=eo(n,t),n!==null&&(yf(n,t,e),Xn(n,e))}function XU(n){var t=n.memoizedState,e=0;t!==null&&(e=t.retryLane),sF(n,e)}function KU(n,t){var e=0;switch(n.tag){case 13:var i=n.stateNode,s=n.memoizedState;s!==null&&(e=s.retryLane);break;case 19:i=n.stateNode;break;default:throw Error(rt(314))}i!==null&&i.delete(t),sF(n,e)}var rF;rF=function(n,t,e){if(n!==null)if(n.memoizedProps!==t.pendingProps||$n.current)Un=!0;else{if(!(n.lanes&e)&&!(t.flags&128))return Un=!1,DU(n,t,e);Un=!!(n.flags&131072)}else Un=!1,$e&&t.flags&1048576&&hD(t,jm,t.index);switch(t.lanes=0,t.tag){case 2:var i=t.type;cm(n,t),n=t.pendingProps;var s=gd(t,fn.current);Yu(t,e),s=Aw(null,t,i,n,s,e);var r=kw();return t.flags|=1,typeof s=="object"&&s!==null&&typeof s.render=="function"&&s.$$typeof===void 0?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Yn(i)?(r=!0,zm(t)):r=!1,t.memoizedState=s.state!==null&&s.state!==void 0?s.state:null,vw(t),s.updater=by,t.stateNode=s,s._reactInternals=t,a1(t,i,n,e),t=h1(null,t,i,!0,r,e)):(t.tag=0,$e&&r&&dw(t),xn(null,t,s,e),t=t.child),t;case 16:i=t.elementType;t:{switch(cm(n,t),n=t.pendingProps,s=i._init,i=s(i._payload),t.type=i,s=t.tag=ZU(i),n=or(i,n),s){case 0:t=l1(null,t,i,n,e);break t;case 1:t=KC(null,t,i,n,e);break t;case 11:t=YC(null,t,i,n,e);break t;case 14:t=XC(null,t,i,or(i.type,n),e);break t}throw Error(rt(306,i,""))}return t;case 0:return i=t.type,s=t.pendingProps,s=t.elementType===i?s:or(i,s),l1(n,t,i,s,e);case 1:return i=t.type,s=t.pendingProps,s=t.elementType===i?s:or(i,s),KC(n,t,i,s,e);case 3:t:{if(VD(t),n===null)throw Error(rt(387));i=t.pendingProps,r=t.memoizedState,s=r.element,fD(n,t),Wm(t,i,null,e);var a=t.memoizedState;if(i=a.element,r.isDehydrated)if(r={element:i,isDehydrated:!1,cache:a.cache,pendingSuspenseBoundaries:a.pendingSuspenseBoundaries,transitions:a.transitions},t.updateQueue.baseState=r,t.memoizedState=r,t.flags&256){s=vd(Error(rt(423)),t),t=qC(n,t,i,e,s);break t}else if(i!==s){s=vd(Error(rt(424)),t),t=qC(n,t,i,e,s);break t}else for(as=$o(t.stateNode.containerInfo.firstChild),os=t,$e=!0,dr=null,e=pD(t,null,i,e),t.child=e;e;)e.flags=e.flags&-3|4096,e=e.sibling;else{if(fd(),i===s){t=io(n,t,e);break t}xn(n,t,i,e)}t=t.child}return t;case 5:return _D(t),n===null&&n1(t),i=t.type,s=t.pendingProps,r=n!==null?n.memoizedProps:null,a=s.children,QS(i,s)?a=null:r!==null&&QS(i,r)&&(t.flags|=32),ND(n,t),xn(n,t,a,e),t.child;case 6:return n===null&&n1(t),null;case 13:return WD(n,t,e);case 4:return yw(t,t.stateNode.containerInfo),i=t.pendingProps,n===null?t.child=_d(t,null,i,e):xn(n,t,i,e),t.child;case 11:return i=t.type,s=t.pendingProps,s=t.elementType===i?s:or(i,s),YC(n,t,i,s,e);case 7:return xn(n,t,t.pendingProps,e),t.child;case 8:return xn(n,t,t.pendingProps.children,e),t.child;case 12:return xn(n,t,t.pendingProps.children,e),t.child;case 10:t:{if(i=t.type._context,s=t.pendingProps,r=t.memoizedProps,a=s.value,Oe(Nm,i._currentValue),i._currentValue=a,r!==null)if(wr(r.value,a)){if(r.children===s.children&&!$n.current){t=io(n,t,e);break t}}else for(r=t.child,r!==null&&(r.return=t);r!==null;){var o=r.dependencies;if(o!==null){a=r.child;for(var l=o.firstContext;l!==null;){if(l.context===i){if(r.tag===1){l=qa(-1,e&-e),l.tag=2;var h=r.updateQueue;if(h!==null){h=h.shared;var u=h.pending;u===null?l.next=l:(l.next=u.next,u.next=l),h.pending=l}}r.lanes|=e,l=r.alternate,l!==null&&(l.lanes|=e),s1(r.return,e,t),o.lanes|=e;break}l=l.next}}else if(r.tag===10)a=r.type===t.type?null:r.child;else if(r.tag===18){if(a=r.return,a===null)throw Error(rt(341));a.lanes|=e,o=a.alternate,o!==null&&(o.lanes|=e),s1(a,e,t),a=r.sibling}else a=r.child;if(a!==null)a.return=r;else for(a=r;a!==null;){if(a===t){a=null;break}if(r=a.sibling,r!==null){r.return=a.return,a=r;break}a=a.return}r=a}xn(n,t,s.children,e),t=t.child}return t;case 9:return s=t.type,i=t.pendingProps.children,Yu(t,e),s=Us(s),i=i(s),t.flags|=1,xn(n,t,i,e),t.child;case 14:return i=t.type,s=or(i,t.pendingProps),s=or(i.type,s),XC(n,t,i,s,e);case 15:return HD(n,t,t.type,t.pendingProps,e);case 17:return i=t.type,s=t.pendingProps,s=t.elementType===i?s:or(i,s),cm(n,t),t.tag=1,Yn(i)?(n=!0,zm(t)):n=!1,Yu(t,e),DD(t,i,s),a1(t,i,s,e),h1(null,t,i,!0,n,e);case 19:return UD(n,t,e);case 22:return jD(n,t,e)}throw Error(rt(156,t.tag))};function aF(n,t){return O2(n,t)}function qU(n,t,e,i){this.tag=n,this.key=e,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=i,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Fs(n,t,e,i){return new qU(n,t,e,i)}function Lw(n){return n=n.prototype,!(!n||!n.isReactComponent)}function ZU(n){if(typeof n=="function")return Lw(n)?1:0;if(n!=null){if(n=n.$$typeof,n===Jk)return 11;if(n===tw)return 14}return 2}function qo(n,t){var e=n.alternate;return e===null?(e=Fs(n.tag,t,n.key,n.mode),e.elementType=n.elementType,e.type=n.type,e.stateNode=n.stateNode,e.alternate=n,n.alternate=e):(e.pendingProps=t,e.type=n.type,e.flags=0,e.subtreeFlags=0,e.deletions=null),e.flags=n.flags&14680064,e.childLanes=n.childLanes,e.lanes=n.lanes,e.child=n.child,e.memoizedProps=n.memoizedProps,e.memoizedState=n.memoizedState,e.updateQueue=n.updateQueue,t=n.dependencies,e.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},e.sibling=n.sibling,e.index=n.index,e.ref=n.ref,e}function fm(n,t,e,i,s,r){var a=2;if(i=n,typeof n=="function")Lw(n)&&(a=1);else if(typeof n=="string")a=5;else t:switch(n){case au:return Zl(e.children,s,r,t);case Qk:a=8,s|=8;break;case RS:return n=Fs(12,e,t,s|2),n.elementType=RS,n.lanes=r,n;case ES:return n=Fs(13,e,t,s),n.elementType=ES,n.lanes=r,n;case BS:return n=Fs(19,e,t,s),n.elementType=BS,n.lanes=r,n;case _2:return Ay(e,s,r,t);default:if(typeof n=="object"&&n!==null)switch(n.$$typeof){case g2:a=10;break t;case f2:a=9;break t;case Jk:a=11;break t;case tw:a=14;break t;case Ao:a=16,i=null;break t}throw Error(rt(130,n==null?n:typeof n,""))}return t=Fs(a,e,t,s),t.elementType=n,t.type=i,t.lanes=r,t}function Zl(n,t,e,i){return n=Fs(7,n,i,t),n.lanes=e,n}function Ay(n,t,e,i){return n=Fs(22,n,i,t),n.elementType=_2,n.lanes=e,n.stateNode={isHidden:!1},n}function Ax(n,t,e){return n=Fs(6,n,null,t),n.lanes=e,n}function kx(n,t,e){return t=Fs(4,n.children!==null?n.children:[],n.key,t),t.lanes=e,t.stateNode={containerInfo:n.containerInfo,pendingChildren:null,implementation:n.implementation},t}function QU(n,t,e,i,s){this.tag=t,this.containerInfo=n,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=sx(0),this.expirationTimes=sx(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=sx(0),this.identifierPrefix=i,this.onRecoverableError=s,this.mutableSourceEagerHydrationData=null}function Iw(n,t,e,i,s,r,a,o,l){return n=new QU(n,t,e,o,l),t===1?(t=1,r===!0&&(t|=8)):t=0,r=Fs(3,null,null,t),n.current=r,r.stateNode=n,r.memoizedState={element:i,isDehydrated:e,cache:null,transitions:null,pendingSuspenseBoundaries:null},vw(r),n}function JU(n,t,e){var i=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:ru,key:i==null?null:""+i,children:n,containerInfo:t,implementation:e}}function oF(n){if(!n)return tl;n=n._reactInternals;t:{if(Th(n)!==n||n.tag!==1)throw Error(rt(170));var t=n;do{switch(t.tag){case 3:t=t.stateNode.context;break t;case 1:if(Yn(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break t}}t=t.return}while(t!==null);throw Error(rt(171))}if(n.tag===1){var e=n.type;if(Yn(e))return oD(n,e,t)}return t}function lF(n,t,e,i,s,r,a,o,l){return n=Iw(e,i,!0,n,s,r,a,o,l),n.context=oF(null),e=n.current,i=wn(),s=Ko(e),r=qa(i,s),r.callback=t??null,Yo(e,r,s),n.current.lanes=s,yf(n,s,i),Xn(n,i),n}function ky(n,t,e,i){var s=t.current,r=wn(),a=Ko(s);return e=oF(e),t.context===null?t.context=e:t.pendingContext=e,t=qa(r,a),t.payload={element:n},i=i===void 0?null:i,i!==null&&(t.callback=i),n=Yo(s,t,a),n!==null&&(Ar(n,s,a,r),hm(n,s,a)),a}function Zm(n){if(n=n.current,!n.child)return null;switch(n.child.tag){case 5:return n.child.stateNode;default:return n.child.stateNode}}function aP(n,t){if(n=n.memoizedState,n!==null&&n.dehydrated!==null){var e=n.retryLane;n.retryLane=e!==0&&e<t?e:t}}function Dw(n,t){aP(n,t),(n=n.alternate)&&aP(n,t)}function t4(){return null}var hF=typeof reportError=="function"?reportError:function(n){console.error(n)};function Fw(n){this._internalRoot=n}wy.prototype.render=Fw.prototype.render=function(n){var t=this._internalRoot;if(t===null)throw Error(rt(409));ky(n,t,null,null)};wy.prototype.unmount=Fw.prototype.unmount=function(){var n=this._internalRoot;if(n!==null){this._internalRoot=null;var t=n.containerInfo;ch(function(){ky(null,n,null,null)}),t[to]=null}};function wy(n){this._internalRoot=n}wy.prototype.unstable_scheduleHydration=function(n){if(n){var t=j2();n={blockedOn:null,target:n,priority:t};for(var e=0;e<Po.length&&t!==0&&t<Po[e].priority;e++);Po.splice(e,0,n),e===0&&V2(n)}};function zw(n){return!(!n||n.nodeType!==1&&n.nodeType!==9&&n.nodeType!==11)}function Ty(n){return!(!n||n.nodeType!==1&&n.nodeType!==9&&n.nodeType!==11&&(n.nodeType!==8||n.nodeValue!==" react-mount-point-unstable "))}function oP(){}function e4(n,t,e,i,s){if(s){if(typeof i=="function"){var r=i;i=function(){var h=Zm(a);r.call(h)}}var a=lF(t,i,n,0,null,!1,!1,"",oP);return n._reactRootContainer=a,n[to]=a.current,hg(n.nodeType===8?n.parentNode:n),ch(),a}for(;s=n.lastChild;)n.removeChild(s);if(typeof i=="function"){var o=i;i=function(){var h=Zm(l);o.call(h)}}var l=Iw(n,0,!1,null,null,!1,!1,"",oP);return n._reactRootContainer=l,n[to]=l.current,hg(n.nodeType===8?n.parentNode:n),ch(function(){ky(t,l,e,i)}),l}function My(n,t,e,i,s){var r=e._reactRootContainer;if(r){var a=r;if(typeof s=="function"){var o=s;s=function(){var l=Zm(a);o.call(l)}}ky(t,a,n,s)}else a=e4(e,t,n,s,i);return Zm(a)}z2=function(n){switch(n.tag){case 3:var t=n.stateNode;if(t.current.memoizedState.isDehydrated){var e=Fc(t.pendingLanes);e!==0&&(nw(t,e|1),Xn(t,xi()),!(ce&6)&&(yd=xi()+500,dl()))}break;case 13:ch(function(){var i=eo(n,1);if(i!==null){var s=wn();Ar(i,n,1,s)}}),Dw(n,1)}};sw=function(n){if(n.tag===13){var t=eo(n,134217728);if(t!==null){var e=wn();Ar(t,n,134217728,e)}Dw(n,134217728)}};H2=function(n){if(n.tag===13){var t=Ko(n),e=eo(n,t);if(e!==null){var i=wn();Ar(e,n,t,i)}Dw(n,t)}};j2=function(){return ke};N2=function(n,t){var e=ke;try{return ke=n,t()}finally{ke=e}};VS=function(n,t,e){switch(t){case"input":if(IS(n,e),t=e.name,e.type==="radio"&&t!=null){for(e=n;e.parentNode;)e=e.parentNode;for(e=e.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<e.length;t++){var i=e[t];if(i!==n&&i.form===n.form){var s=my(i);if(!s)throw Error(rt(90));v2(i),IS(i,s)}}}break;case"textarea":b2(n,e);break;case"select":t=e.value,t!=null&&Wu(n,!!e.multiple,t,!1)}};M2=Ew;C2=ch;var i4={usingClientEntryPoint:!1,Events:[xf,uu,my,w2,T2,Ew]},vc={findFiberByHostInstance:Dl,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},n4={bundleType:vc.bundleType,version:vc.version,rendererPackageName:vc.rendererPackageName,rendererConfig:vc.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:lo.ReactCurrentDispatcher,findHostInstanceByFiber:function(n){return n=E2(n),n===null?null:n.stateNode},findFiberByHostInstance:vc.findFiberByHostInstance||t4,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var f_=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!f_.isDisabled&&f_.supportsFiber)try{py=f_.inject(n4),aa=f_}catch{}}gs.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=i4;gs.createPortal=function(n,t){var e=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!zw(t))throw Error(rt(200));return JU(n,t,null,e)};gs.createRoot=function(n,t){if(!zw(n))throw Error(rt(299));var e=!1,i="",s=hF;return t!=null&&(t.unstable_strictMode===!0&&(e=!0),t.identifierPrefix!==void 0&&(i=t.identifierPrefix),t.onRecoverableError!==void 0&&(s=t.onRecoverableError)),t=Iw(n,1,!1,null,null,e,!1,i,s),n[to]=t.current,hg(n.nodeType===8?n.parentNode:n),new Fw(t)};gs.findDOMNode=function(n){if(n==null)return null;if(n.nodeType===1)return n;var t=n._reactInternals;if(t===void 0)throw typeof n.render=="function"?Error(rt(188)):(n=Object.keys(n).join(","),Error(rt(268,n)));return n=E2(t),n=n===null?null:n.stateNode,n};gs.flushSync=function(n){return ch(n)};gs.hydrate=function(n,t,e){if(!Ty(t))throw Error(rt(200));return My(null,n,t,!0,e)};gs.hydrateRoot=function(n,t,e){if(!zw(n))throw Error(rt(405));var i=e!=null&&e.hydratedSources||null,s=!1,r="",a=hF;if(e!=null&&(e.unstable_strictMode===!0&&(s=!0),e.identifierPrefix!==void 0&&(r=e.identifierPrefix),e.onRecoverableError!==void 0&&(a=e.onRecoverableError)),t=lF(t,null,n,1,e??null,s,!1,r,a),n[to]=t.current,hg(n),i)for(n=0;n<i.length;n++)e=i[n],s=e._getVersion,s=s(e._source),t.mutableSourceEagerHydrationData==null?t.mutableSourceEagerHydrationData=[e,s]:t.mutableSourceEagerHydrationData.push(e,s);return new wy(t)};gs.render=function(n,t,e){if(!Ty(t))throw Error(rt(200));return My(null,n,t,!1,e)};gs.unmountComponentAtNode=function(n){if(!Ty(n))throw Error(rt(40));return n._reactRootContainer?(ch(function(){My(null,null,n,!1,function(){n._reactRootContainer=null,n[to]=null})}),!0):!1};gs.unstable_batchedUpdates=Ew;gs.unstable_renderSubtreeIntoContainer=function(n,t,e,i){if(!Ty(e))throw Error(rt(200));if(n==null||n._reactInternals===void 0)throw Error(rt(38));return My(n,t,e,!1,i)};gs.version="18.3.1-next-f1338f8080-20240426";function uF(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(uF)}catch(n){console.error(n)}}uF(),u2.exports=gs;var s4=u2.exports,lP=s4;CS.createRoot=lP.createRoot,CS.hydrateRoot=lP.hydrateRoot;function r4({children:n,header:t,nav:e}){return W.jsxs("div",{className:"layout",children:[W.jsx("header",{className:"layout-header",children:W.jsxs("div",{className:"header-container",children:[W.jsx("div",{className:"header-left",children:t||W.jsx("h1",{children:"AI Memory Hub"})}),W.jsx("nav",{className:"header-nav",children:e})]})}),W.jsx("main",{className:"layout-main",children:n})]})}const cl="/api/v1";async function Mh(n){if(!n.ok){const t=await n.json().catch(()=>({detail:"网络错误"}));throw new Error(t.detail||`HTTP ${n.status}: ${n.statusText}`)}return n.json()}async function a4(n,t=10){try{const e=await fetch(`${cl}/search/`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({query:n,limit:t,include_content:!0})});return await Mh(e)}catch(e){throw e.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):e}}async function o4(n,t=10){try{const e=await fetch(`${cl}/search/sqlite`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({query:n,limit:t,include_content:!0})});return await Mh(e)}catch(e){throw e.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):e}}async function l4(n,t,e=[]){try{const i=await fetch(`${cl}/memories/`,{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({title:n,content:t,tags:e})});return await Mh(i)}catch(i){throw i.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):i}}async function dF(){try{const n=await fetch(`${cl}/memories/`);return await Mh(n)}catch(n){throw n.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):n}}async function wx(n){try{const t=await fetch(`${cl}/memories/${n}`);return await Mh(t)}catch(t){throw t.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):t}}async function h4(n,t,e,i=[]){try{const s=await fetch(`${cl}/memories/${n}`,{method:"PUT",headers:{"Content-Type":"application/json"},body:JSON.stringify({title:t,content:e,tags:i})});return await Mh(s)}catch(s){throw s.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):s}}async function u4(n){try{const t=await fetch(`${cl}/memories/${n}`,{method:"DELETE"});if(!t.ok){const e=await t.json().catch(()=>({detail:"删除失败"}));throw new Error(e.detail||`HTTP ${t.status}`)}return{success:!0}}catch(t){throw t.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):t}}async function d4(){try{const n=await fetch(`${cl}/memories/stats`);return await Mh(n)}catch(n){throw n.message.includes("Failed to fetch")?new Error("无法连接到服务器，请检查后端服务是否启动"):n}}function c4({memories:n,onMemoryClick:t,onMemoryDelete:e,refreshTrigger:i}){const[s,r]=Ht.useState(n||[]),[a,o]=Ht.useState(!n),[l,h]=Ht.useState(null),u=c=>new Date(c).toLocaleDateString("zh-CN",{year:"numeric",month:"short",day:"numeric",hour:"2-digit",minute:"2-digit"}),d=(c,p)=>{c.stopPropagation(),window.confirm("确定要删除这条记忆吗？")&&e(p)};return Ht.useEffect(()=>{(async()=>{if(n){r(n);return}o(!0),h(null);try{const p=await dF();r(p)}catch(p){h(p.message||"加载失败")}finally{o(!1)}})()},[i,n]),a?W.jsx("div",{className:"loading",children:"加载中..."}):l?W.jsxs("div",{className:"error",children:["错误: ",l]}):!s||s.length===0?W.jsx("div",{className:"empty-state",children:W.jsx("p",{children:"还没有记忆，创建第一条记忆吧！"})}):W.jsx("div",{className:"memory-list",children:s.map(c=>W.jsx("div",{className:"memory-list-item",onClick:()=>t(c.id),children:W.jsxs("div",{className:"memory-list-item-main",children:[W.jsx("div",{className:"memory-list-item-header",children:W.jsx("h4",{className:"memory-list-item-title",children:c.title})}),W.jsxs("p",{className:"memory-list-item-content",children:[c.content.substring(0,200),c.content.length>200?"...":""]}),W.jsxs("div",{className:"memory-list-item-footer",children:[W.jsx("div",{className:"memory-list-item-tags",children:c.tags&&c.tags.length>0?c.tags.map((p,g)=>W.jsx("span",{className:"memory-tag",children:p},g)):W.jsx("span",{className:"memory-tag-empty",children:"无标签"})}),W.jsxs("div",{className:"memory-list-item-actions",children:[W.jsx("span",{className:"memory-list-item-date",children:u(c.created_at)}),W.jsx("button",{className:"memory-list-item-delete",onClick:p=>d(p,c.id),title:"删除",children:"删除"})]})]})]})},c.id))})}function cF({onSubmit:n,onCancel:t,initialData:e=null,isEdit:i=!1}){var f;const[s,r]=Ht.useState((e==null?void 0:e.title)||""),[a,o]=Ht.useState((e==null?void 0:e.content)||""),[l,h]=Ht.useState(((f=e==null?void 0:e.tags)==null?void 0:f.join(", "))||""),[u,d]=Ht.useState(""),[c,p]=Ht.useState(!1);Ht.useEffect(()=>{var _;e&&(r(e.title||""),o(e.content||""),h(((_=e.tags)==null?void 0:_.join(", "))||""))},[e]);const g=async _=>{if(_.preventDefault(),d(""),!s.trim()){d("标题不能为空");return}if(!a.trim()){d("内容不能为空");return}const m=l.split(",").map(v=>v.trim()).filter(v=>v.length>0);p(!0);try{await n({title:s.trim(),content:a.trim(),tags:m}),r(""),o(""),h("")}catch(v){d(v.message||"创建失败，请重试")}finally{p(!1)}};return W.jsxs("form",{className:"memory-form",onSubmit:g,children:[W.jsx("h2",{children:i?"编辑记忆":"创建新记忆"}),u&&W.jsx("div",{className:"form-error",children:u}),W.jsxs("div",{className:"form-group",children:[W.jsx("label",{htmlFor:"title",children:"标题 *"}),W.jsx("input",{id:"title",type:"text",value:s,onChange:_=>r(_.target.value),placeholder:"输入记忆标题",disabled:c})]}),W.jsxs("div",{className:"form-group",children:[W.jsx("label",{htmlFor:"content",children:"内容 *"}),W.jsx("textarea",{id:"content",value:a,onChange:_=>o(_.target.value),placeholder:"输入记忆内容",rows:6,disabled:c})]}),W.jsxs("div",{className:"form-group",children:[W.jsx("label",{htmlFor:"tags",children:"标签"}),W.jsx("input",{id:"tags",type:"text",value:l,onChange:_=>h(_.target.value),placeholder:"用逗号分隔多个标签，例如：工作, 重要",disabled:c})]}),W.jsxs("div",{className:"form-actions",children:[t&&W.jsx("button",{type:"button",onClick:t,disabled:c,children:"取消"}),W.jsx("button",{type:"submit",disabled:c,children:c?i?"保存中...":"创建中...":i?"保存修改":"创建记忆"})]})]})}function p4({memoryId:n,onBack:t,onDelete:e,onUpdate:i}){const[s,r]=Ht.useState(null),[a,o]=Ht.useState(!0),[l,h]=Ht.useState(null),[u,d]=Ht.useState(!1);Ht.useEffect(()=>{n&&(async()=>{o(!0),h(null);try{const v=await wx(n);r(v)}catch(v){h(v.message||"加载失败")}finally{o(!1)}})()},[n]);const c=()=>{window.confirm("确定要删除这条记忆吗？")&&e(s.id)},p=()=>{d(!0)},g=()=>{d(!1),(async()=>{try{const v=await wx(n);r(v)}catch(v){h(v.message||"加载失败")}})()},f=async m=>{try{await i(s.id,m),d(!1);const v=await wx(n);r(v)}catch(v){throw v}},_=m=>new Date(m).toLocaleDateString("zh-CN",{year:"numeric",month:"long",day:"numeric",hour:"2-digit",minute:"2-digit"});return a?W.jsx("div",{className:"memory-detail",children:W.jsx("div",{className:"loading",children:"加载中..."})}):l?W.jsxs("div",{className:"memory-detail",children:[W.jsxs("div",{className:"error",children:["错误: ",l]}),W.jsx("button",{onClick:t,children:"返回"})]}):s?u?W.jsxs("div",{className:"memory-detail",children:[W.jsx("div",{className:"memory-detail-header",children:W.jsx("button",{onClick:g,className:"back-button",children:"✕ 取消编辑"})}),W.jsx("div",{className:"memory-detail-body-scrollable",children:W.jsx("div",{className:"memory-detail-body",children:W.jsx(cF,{initialData:s,isEdit:!0,onSubmit:f,onCancel:g})})})]}):W.jsxs("div",{className:"memory-detail",children:[W.jsxs("div",{className:"memory-detail-header",children:[W.jsx("button",{onClick:t,className:"back-button",children:"✕ 关闭"}),W.jsxs("div",{className:"memory-detail-actions",children:[W.jsx("button",{onClick:p,className:"edit-button",children:"编辑"}),W.jsx("button",{onClick:c,className:"delete-button",children:"删除"})]})]}),W.jsx("div",{className:"memory-detail-fixed",children:W.jsxs("div",{className:"memory-detail-content",children:[W.jsx("h1",{children:s.title}),W.jsxs("div",{className:"memory-detail-meta",children:[W.jsx("div",{className:"memory-detail-tags",children:s.tags&&s.tags.length>0?s.tags.map((m,v)=>W.jsx("span",{className:"memory-tag",children:m},v)):W.jsx("span",{className:"memory-tag-empty",children:"无标签"})}),W.jsx("span",{className:"memory-detail-date",children:_(s.created_at)})]})]})}),W.jsx("div",{className:"memory-detail-body-scrollable",children:W.jsx("div",{className:"memory-detail-body",children:W.jsx("p",{children:s.content})})})]}):W.jsxs("div",{className:"memory-detail",children:[W.jsx("div",{className:"error",children:"记忆不存在"}),W.jsx("button",{onClick:t,children:"返回"})]})}function g4({onSearch:n,loading:t=!1,searchMode:e="vector",onModeChange:i}){const[s,r]=Ht.useState(""),a=l=>{l.preventDefault(),s.trim()&&n(s.trim(),e)},o=()=>{r(""),n("",e)};return W.jsxs("div",{className:"search-container",children:[W.jsxs("form",{className:"search-bar",onSubmit:a,children:[W.jsx("input",{type:"text",value:s,onChange:l=>r(l.target.value),placeholder:e==="vector"?"输入关键词进行语义搜索...":"输入关键词进行文本搜索...",disabled:t}),W.jsxs("div",{className:"search-actions",children:[s&&W.jsx("button",{type:"button",onClick:o,className:"search-clear",children:"清除"}),W.jsx("button",{type:"submit",disabled:t||!s.trim(),children:t?"搜索中...":"搜索"})]})]}),W.jsxs("div",{className:"search-mode-selector",children:[W.jsx("button",{type:"button",className:`search-mode-btn ${e==="vector"?"active":""}`,onClick:()=>i("vector"),disabled:t,children:"🔍 语义搜索"}),W.jsx("button",{type:"button",className:`search-mode-btn ${e==="sqlite"?"active":""}`,onClick:()=>i("sqlite"),disabled:t,children:"📝 文本搜索"})]})]})}function f4({results:n,onMemoryClick:t,onMemoryDelete:e,query:i,searchMode:s="vector"}){const r=o=>new Date(o).toLocaleDateString("zh-CN",{year:"numeric",month:"short",day:"numeric",hour:"2-digit",minute:"2-digit"}),a=(o,l)=>{o.stopPropagation(),window.confirm("确定要删除这条记忆吗？")&&e(l)};return i?n.length===0?W.jsx("div",{className:"search-results-empty",children:W.jsx("p",{children:"未找到相关记忆"})}):W.jsxs("div",{className:"search-results",children:[W.jsxs("h3",{children:["搜索结果 (",n.length," 条)",W.jsx("span",{className:"search-mode-badge",children:s==="vector"?"🔍 语义搜索":"📝 文本搜索"})]}),W.jsx("div",{className:"search-results-list",children:n.map(o=>W.jsx("div",{className:"search-result-item",onClick:()=>t(o.id),children:W.jsxs("div",{className:"search-result-item-main",children:[W.jsxs("div",{className:"search-result-item-header",children:[W.jsx("h4",{className:"search-result-item-title",children:o.title}),o.relevance!==void 0&&W.jsxs("span",{className:"search-result-item-relevance",children:[(o.relevance*100).toFixed(1),"%"]})]}),W.jsxs("p",{className:"search-result-item-content",children:[o.content.substring(0,200),o.content.length>200?"...":""]}),W.jsxs("div",{className:"search-result-item-footer",children:[W.jsx("div",{className:"search-result-item-tags",children:o.tags&&o.tags.length>0?o.tags.map((l,h)=>W.jsx("span",{className:"search-result-tag",children:l},h)):W.jsx("span",{className:"search-result-tag-empty",children:"无标签"})}),W.jsxs("div",{className:"search-result-item-actions",children:[W.jsx("span",{className:"search-result-item-date",children:r(o.created_at)}),W.jsx("button",{className:"search-result-item-delete",onClick:l=>a(l,o.id),title:"删除",children:"删除"})]})]})]})},o.id))})]}):null}function _4({suggestion:n,onClick:t}){return W.jsx("div",{className:"suggestion-item",onClick:t,children:W.jsxs("div",{className:"suggestion-item-main",children:[W.jsxs("div",{className:"suggestion-item-header",children:[W.jsx("h4",{className:"suggestion-item-title",children:n.title}),W.jsx("span",{className:"suggestion-badge",children:"建议"})]}),W.jsxs("p",{className:"suggestion-item-content",children:[n.content.substring(0,200),n.content.length>200?"...":""]}),W.jsxs("div",{className:"suggestion-item-footer",children:[W.jsx("div",{className:"suggestion-item-tags",children:n.tags&&n.tags.length>0?n.tags.map((e,i)=>W.jsx("span",{className:"suggestion-tag",children:e},i)):null}),W.jsx("span",{className:"suggestion-hint",children:"点击创建"})]})]})})}const pF=n=>n;var oi;(function(n){n["desktop-browser"]="desktop-browser",n["mobile-browser"]="mobile-browser",n.node="node",n.worker="worker",n.miniApp="miniApp",n.wx="wx",n.tt="tt",n.harmony="harmony",n["desktop-miniApp"]="desktop-miniApp",n.lynx="lynx"})(oi||(oi={}));var q;(function(n){n.cartesianAxis="cartesianAxis",n.cartesianBandAxis="cartesianAxis-band",n.cartesianLinearAxis="cartesianAxis-linear",n.cartesianTimeAxis="cartesianAxis-time",n.cartesianLogAxis="cartesianAxis-log",n.cartesianSymlogAxis="cartesianAxis-symlog",n.polarAxis="polarAxis",n.polarBandAxis="polarAxis-band",n.polarLinearAxis="polarAxis-linear",n.crosshair="crosshair",n.cartesianCrosshair="cartesianCrosshair",n.polarCrosshair="polarCrosshair",n.dataZoom="dataZoom",n.geoCoordinate="geoCoordinate",n.indicator="indicator",n.discreteLegend="discreteLegend",n.continuousLegend="continuousLegend",n.colorLegend="colorLegend",n.sizeLegend="sizeLegend",n.markLine="markLine",n.markArea="markArea",n.markPoint="markPoint",n.polarMarkLine="polarMarkLine",n.polarMarkArea="polarMarkArea",n.polarMarkPoint="polarMarkPoint",n.geoMarkPoint="geoMarkPoint",n.tooltip="tooltip",n.title="title",n.player="player",n.scrollBar="scrollBar",n.label="label",n.totalLabel="totalLabel",n.brush="brush",n.poptip="poptip",n.customMark="customMark"})(q||(q={}));var gF={exports:{}};(function(n){var t=Object.prototype.hasOwnProperty,e="~";function i(){}Object.create&&(i.prototype=Object.create(null),new i().__proto__||(e=!1));function s(l,h,u){this.fn=l,this.context=h,this.once=u||!1}function r(l,h,u,d,c){if(typeof u!="function")throw new TypeError("The listener must be a function");var p=new s(u,d||l,c),g=e?e+h:h;return l._events[g]?l._events[g].fn?l._events[g]=[l._events[g],p]:l._events[g].push(p):(l._events[g]=p,l._eventsCount++),l}function a(l,h){--l._eventsCount===0?l._events=new i:delete l._events[h]}function o(){this._events=new i,this._eventsCount=0}o.prototype.eventNames=function(){var h=[],u,d;if(this._eventsCount===0)return h;for(d in u=this._events)t.call(u,d)&&h.push(e?d.slice(1):d);return Object.getOwnPropertySymbols?h.concat(Object.getOwnPropertySymbols(u)):h},o.prototype.listeners=function(h){var u=e?e+h:h,d=this._events[u];if(!d)return[];if(d.fn)return[d.fn];for(var c=0,p=d.length,g=new Array(p);c<p;c++)g[c]=d[c].fn;return g},o.prototype.listenerCount=function(h){var u=e?e+h:h,d=this._events[u];return d?d.fn?1:d.length:0},o.prototype.emit=function(h,u,d,c,p,g){var f=e?e+h:h;if(!this._events[f])return!1;var _=this._events[f],m=arguments.length,v,y;if(_.fn){switch(_.once&&this.removeListener(h,_.fn,void 0,!0),m){case 1:return _.fn.call(_.context),!0;case 2:return _.fn.call(_.context,u),!0;case 3:return _.fn.call(_.context,u,d),!0;case 4:return _.fn.call(_.context,u,d,c),!0;case 5:return _.fn.call(_.context,u,d,c,p),!0;case 6:return _.fn.call(_.context,u,d,c,p,g),!0}for(y=1,v=new Array(m-1);y<m;y++)v[y-1]=arguments[y];_.fn.apply(_.context,v)}else{var b=_.length,x;for(y=0;y<b;y++)switch(_[y].once&&this.removeListener(h,_[y].fn,void 0,!0),m){case 1:_[y].fn.call(_[y].context);break;case 2:_[y].fn.call(_[y].context,u);break;case 3:_[y].fn.call(_[y].context,u,d);break;case 4:_[y].fn.call(_[y].context,u,d,c);break;default:if(!v)for(x=1,v=new Array(m-1);x<m;x++)v[x-1]=arguments[x];_[y].fn.apply(_[y].context,v)}}return!0},o.prototype.on=function(h,u,d){return r(this,h,u,d,!1)},o.prototype.once=function(h,u,d){return r(this,h,u,d,!0)},o.prototype.removeListener=function(h,u,d,c){var p=e?e+h:h;if(!this._events[p])return this;if(!u)return a(this,p),this;var g=this._events[p];if(g.fn)g.fn===u&&(!c||g.once)&&(!d||g.context===d)&&a(this,p);else{for(var f=0,_=[],m=g.length;f<m;f++)(g[f].fn!==u||c&&!g[f].once||d&&g[f].context!==d)&&_.push(g[f]);_.length?this._events[p]=_.length===1?_[0]:_:a(this,p)}return this},o.prototype.removeAllListeners=function(h){var u;return h?(u=e?e+h:h,this._events[u]&&a(this,u)):(this._events=new i,this._eventsCount=0),this},o.prototype.off=o.prototype.removeListener,o.prototype.addListener=o.prototype.on,o.prefixed=e,o.EventEmitter=o,n.exports=o})(gF);var m4=gF.exports;const pl=Uk(m4),Kd=(n,t)=>Object.prototype.toString.call(n)===`[object ${t}]`,Ti=(n,t=!1)=>t?typeof n=="boolean":n===!0||n===!1||Kd(n,"Boolean"),G=n=>typeof n=="function",O=n=>n==null,P=n=>n!=null,kt=n=>{const t=typeof n;return n!==null&&t==="object"||t==="function"},v4=n=>typeof n=="object"&&n!==null,Vs=function(n){if(!v4(n)||!Kd(n,"Object"))return!1;if(Object.getPrototypeOf(n)===null)return!0;let t=n;for(;Object.getPrototypeOf(t)!==null;)t=Object.getPrototypeOf(t);return Object.getPrototypeOf(n)===t},Ee=n=>n===void 0,vt=(n,t=!1)=>{const e=typeof n;return t?e==="string":e==="string"||Kd(n,"String")},V=n=>Array.isArray?Array.isArray(n):Kd(n,"Array"),Hw=function(n){return n!==null&&typeof n!="function"&&Number.isFinite(n.length)},y4=n=>Kd(n,"Date"),it=(n,t=!1)=>{const e=typeof n;return t?e==="number":e==="number"||Kd(n,"Number")},b4=n=>typeof n=="string"&&!isNaN(Number(n))&&!isNaN(parseFloat(n)),U=n=>it(n)&&Number.isFinite(n),fF=n=>new RegExp(/^(http(s)?:\/\/)\w+[^\s]+(\.[^\s]+){1,}$/).test(n),_F=n=>new RegExp(/^data:image\/(?:gif|png|jpeg|bmp|webp|svg\+xml)(?:;charset=utf-8)?;base64,(?:[A-Za-z0-9]|[+/])+={0,2}/g).test(n),x4=n=>({}).toString.call(n).replace(/^\[object /,"").replace(/]$/,""),S4=Object.prototype,A4=function(n){const t=n&&n.constructor;return n===(typeof t=="function"&&t.prototype||S4)},k4=Object.prototype.hasOwnProperty;function ht(n){if(O(n))return!0;if(Hw(n))return!n.length;const t=x4(n);if(t==="Map"||t==="Set")return!n.size;if(A4(n))return!Object.keys(n).length;for(const e in n)if(k4.call(n,e))return!1;return!0}const Ot=(n,t,e)=>{const i=vt(t)?t.split("."):t;for(let s=0;s<i.length;s++)n=n?n[i[s]]:void 0;return n===void 0?e:n},w4=Object.prototype.hasOwnProperty,T4=(n,t)=>n!=null&&w4.call(n,t);function gn(n,t,e){let i;if(!P(n)||typeof n!="object"||t&&t(n))return n;const s=V(n),r=n.length;i=s?new Array(r):typeof n=="object"?{}:Ti(n)||it(n)||vt(n)?n:y4(n)?new Date(+n):void 0;const a=s?void 0:Object.keys(Object(n));let o=-1;if(i)for(;++o<(a||n).length;){const l=a?a[o]:o,h=n[l];e&&e.includes(l.toString())?i[l]=h:i[l]=gn(h,t,e)}return i}function jw(n,t,e=!1,i=!1){if(t){if(n===t)return;if(P(t)&&typeof t=="object"){const s=Object(t),r=[];for(const l in s)r.push(l);let{length:a}=r,o=-1;for(;a--;){const l=r[++o];!P(s[l])||typeof s[l]!="object"||i&&V(n[l])?mF(n,l,s[l]):M4(n,t,l,e,i)}}}}function M4(n,t,e,i=!1,s=!1){const r=n[e],a=t[e];let o=t[e],l=!0;if(V(a)){if(i)o=[];else if(V(r))o=r;else if(Hw(r)){o=new Array(r.length);let h=-1;const u=r.length;for(;++h<u;)o[h]=r[h]}}else Vs(a)?(o=r??{},typeof r!="function"&&typeof r=="object"||(o={})):l=!1;l&&jw(o,a,i,s),mF(n,e,o)}function mF(n,t,e){(e!==void 0&&!C4(n[t],e)||e===void 0&&!(t in n))&&(n[t]=e)}function C4(n,t){return n===t||Number.isNaN(n)&&Number.isNaN(t)}function Z(n,...t){let e=-1;const i=t.length;for(;++e<i;)jw(n,t[e],!0);return n}function el(n,t){if(!n||!Vs(n))return n;const e={};return Object.keys(n).forEach(i=>{const s=n[i];let r=!1;t.forEach(a=>{(vt(a)&&a===i||a instanceof RegExp&&i.match(a))&&(r=!0)}),r||(e[i]=s)}),e}function hP(n){return Object.prototype.toString.call(n)}function uP(n){return Object.keys(n)}function ee(n,t,e){if(n===t)return!0;if(typeof n!=typeof t||n==null||t==null)return!1;if(Number.isNaN(n)&&Number.isNaN(t))return!0;if(hP(n)!==hP(t)||G(n)||typeof n!="object")return!1;if(V(n)){if(n.length!==t.length)return!1;for(let r=n.length-1;r>=0;r--)if(!ee(n[r],t[r]))return!1;return!0}if(!Vs(n))return!1;const i=uP(n),s=uP(t);if(i.length!==s.length)return!1;i.sort(),s.sort();for(let r=i.length-1;r>=0;r--)if(i[r]!=s[r])return!1;for(let r=i.length-1;r>=0;r--){const a=i[r];if(!ee(n[a],t[a]))return!1}return!0}function P4(n){if(!n)return[];if(Object.keys)return Object.keys(n);const t=[];for(const e in n)n.hasOwnProperty(e)&&t.push(e);return t}function R4(n,t,e){const i=P4(t);for(let s=0;s<i.length;s++){const r=i[s];(e?t[r]!=null:n[r]==null)&&(n[r]=t[r])}return n}function se(n,t,e=!0){if(n="prototype"in n?n.prototype:n,t="prototype"in t?t.prototype:t,Object.getOwnPropertyNames){const i=Object.getOwnPropertyNames(t);for(let s=0;s<i.length;s++){const r=i[s];r!=="constructor"&&(e?t[r]!=null:n[r]==null)&&(n[r]=t[r])}}else R4(n,t,e)}function N(n){return P(n)?V(n)?n:[n]:[]}function zt(n){if(Hw(n))return n[n.length-1]}const Ye=(n,t)=>{var e;if(n.length===0)return;let i=n[0];for(let s=1;s<n.length;s++){const r=n[s];((e=t==null?void 0:t(r,i))!==null&&e!==void 0?e:r-i)>0&&(i=r)}return i},gi=(n,t)=>{var e;if(n.length===0)return;let i=n[0];for(let s=1;s<n.length;s++){const r=n[s];((e=t==null?void 0:t(r,i))!==null&&e!==void 0?e:r-i)<0&&(i=r)}return i};function __(n,t){if(!V(n)||!V(t)||n.length!==t.length)return!1;for(let e=0;e<n.length;e++)if(n[e]!==t[e])return!1;return!0}function E4(n){return n&&V(n)?Array.from(new Set(N(n))):n}function vF(n,t=Math.random){let e,i,s=n.length;for(;s;)e=Math.floor(t()*s),i=n[--s],n[s]=n[e],n[e]=i;return n}function x1(n){if(!V(n))return[n];const t=[];for(const e of n)t.push(...x1(e));return t}function yF(n,t,e){P(t)||(t=n,n=0),P(e)||(e=1);let i=-1;const s=0|Math.max(0,Math.ceil((t-n)/e)),r=new Array(s);for(;++i<s;)r[i]=n+i*e;return r}function bF(n,t){return n<t?-1:n>t?1:n>=t?0:NaN}function Do(n){return Number(n)}function Zh(n,t,e=Do){const i=n.length;if(!i)return;if(t<=0||i<2)return e(n[0],0,n);if(t>=1)return e(n[i-1],i-1,n);const s=(i-1)*t,r=Math.floor(s),a=e(n[r],r,n);return a+(e(n[r+1],r+1,n)-a)*(s-r)}const B4=typeof console<"u";function m_(n,t,e){const i=[t].concat([].slice.call(e));B4&&console[n].apply(console,i)}var ks;(function(n){n[n.None=0]="None",n[n.Error=1]="Error",n[n.Warn=2]="Warn",n[n.Info=3]="Info",n[n.Debug=4]="Debug"})(ks||(ks={}));class Xt{static getInstance(t,e){return Xt._instance&&it(t)?Xt._instance.level(t):Xt._instance||(Xt._instance=new Xt(t,e)),Xt._instance}static setInstance(t){return Xt._instance=t}static setInstanceLevel(t){Xt._instance?Xt._instance.level(t):Xt._instance=new Xt(t)}static clearInstance(){Xt._instance=null}constructor(t=ks.None,e){this._onErrorHandler=[],this._level=t,this._method=e}addErrorHandler(t){this._onErrorHandler.find(e=>e===t)||this._onErrorHandler.push(t)}removeErrorHandler(t){const e=this._onErrorHandler.findIndex(i=>i===t);e<0||this._onErrorHandler.splice(e,1)}callErrorHandler(...t){this._onErrorHandler.forEach(e=>e(...t))}canLogInfo(){return this._level>=ks.Info}canLogDebug(){return this._level>=ks.Debug}canLogError(){return this._level>=ks.Error}canLogWarn(){return this._level>=ks.Warn}level(t){return arguments.length?(this._level=+t,this):this._level}error(...t){var e;return this._level>=ks.Error&&(this._onErrorHandler.length?this.callErrorHandler(...t):m_((e=this._method)!==null&&e!==void 0?e:"error","ERROR",t)),this}warn(...t){return this._level>=ks.Warn&&m_(this._method||"warn","WARN",t),this}info(...t){return this._level>=ks.Info&&m_(this._method||"log","INFO",t),this}debug(...t){return this._level>=ks.Debug&&m_(this._method||"log","DEBUG",t),this}}Xt._instance=null;function xF(n,t,e=0,i){for(O(i)&&(i=n.length);e<i;){const s=e+i>>>1;bF(n[s],t)>0?i=s:e=s+1}return e}const dP=(n,t)=>SF(0,n.length,e=>t(n[e])),SF=(n,t,e)=>{let i=n,s=t;for(;i<s;){const r=Math.floor((i+s)/2);e(r)>=0?s=r:i=r+1}return i},O4=(n,t)=>{let e=n;return e=n.sort(bF),Zh(e,.5)},L4=1e-10,I4=1e-10;function Xe(n,t,e=I4,i=L4){const s=i,r=e*Math.max(n,t);return Math.abs(n-t)<=Math.max(s,r)}function Ma(n,t,e,i){return n>t&&!Xe(n,t,e,i)}function Fr(n,t,e,i){return n<t&&!Xe(n,t,e,i)}const Af=n=>{let t=null,e=null;return(...i)=>(t&&i.every((s,r)=>s===t[r])||(t=i,e=n(...i)),e)},te=function(n,t,e){return n<t?t:n>e?e:n},El=(n,t,e)=>{let[i,s]=n;s<i&&(i=n[1],s=n[0]);const r=s-i;return r>=e-t?[t,e]:(i=Math.min(Math.max(i,t),e-r),[i,i+r])};function bd(n,t){let e;return n>t&&(e=n,n=t,t=e),i=>Math.max(n,Math.min(t,i))}let Qm=!1;try{Qm=typeof requestAnimationFrame=="function"&&typeof cancelAnimationFrame=="function"}catch{Qm=!1}function Ch(n,t,e){let i,s,r,a,o,l,h=0,u=!1,d=!1,c=!0;const p=!t&&t!==0&&Qm;if(typeof n!="function")throw new TypeError("Expected a function");function g(b){const x=i,S=s;return i=s=void 0,h=b,a=n.apply(S,x),a}function f(b,x){return p?(cancelAnimationFrame(o),requestAnimationFrame(b)):setTimeout(b,x)}function _(b){const x=b-l;return l===void 0||x>=t||x<0||d&&b-h>=r}function m(){const b=Date.now();if(_(b))return v(b);o=f(m,function(x){const S=x-h,k=t-(x-l);return d?Math.min(k,r-S):k}(b))}function v(b){return o=void 0,c&&i?g(b):(i=s=void 0,a)}function y(...b){const x=Date.now(),S=_(x);if(i=b,s=this,l=x,S){if(o===void 0)return function(k){return h=k,o=f(m,t),u?g(k):a}(l);if(d)return o=f(m,t),g(l)}return o===void 0&&(o=f(m,t)),a}return t=+t||0,kt(e)&&(u=!!e.leading,d="maxWait"in e,d&&(r=Math.max(U(e.maxWait)?e.maxWait:0,t)),c="trailing"in e?!!e.trailing:c),y.cancel=function(){o!==void 0&&function(b){if(p)return cancelAnimationFrame(b);clearTimeout(b)}(o),h=0,i=l=s=o=void 0},y.flush=function(){return o===void 0?a:v(Date.now())},y.pending=function(){return o!==void 0},y}Qm=!1;function ho(n,t,e){let i=!0,s=!0;if(typeof n!="function")throw new TypeError("Expected a function");return kt(e)&&(i="leading"in e?!!e.leading:i,s="trailing"in e?!!e.trailing:s),Ch(n,t,{leading:i,trailing:s,maxWait:t})}function _m(n,t){return e=>n*(1-e)+t*e}function D4(n,t){return function(e){return Math.round(n*(1-e)+t*e)}}function F4(n,t){const e=n.valueOf(),i=t.valueOf(),s=new Date;return r=>(s.setTime(e*(1-r)+i*r),s)}function Ql(n){if(U(n))return n;const t=+n;return U(t)?t:0}function z4(n){return parseFloat("0."+Math.sin(n).toString().substring(6))}const H4=1664525,j4=1013904223,cP=4294967296;function N4(n=1){let t=n;return()=>(t=(H4*t+j4)%cP)/cP}const V4=()=>{let n=-1;const t=[0,.1,.2,.3,.4,.5,.6,.7,.8,.9];return()=>(n=(n+1)%t.length,t[n])},W4=n=>t=>Ot(t,n),pP=(n,t={})=>{if(G(n))return n;const e=[n];return(t&&t.get||W4)(e)},xd=(n,t={})=>{if(V(n)){const e=n.map(i=>pP(i,t));return i=>e.map(s=>s(i))}return pP(n,t)},bn=n=>n?typeof n=="string"||typeof n=="number"?()=>n:G(n)?n:t=>t[n.field]:null,hr=(n,t)=>O(n)?t:vt(n)?t*parseFloat(n)/100:n,U4=n=>0,gP=(n,t)=>{const e=G(t)?t:r=>r;let i,s;if(n&&n.length){const r=n.length;for(let a=0;a<r;a+=1){let o=e(n[a]);O(o)||!it(o=+o)||Number.isNaN(o)||(O(i)?(i=o,s=o):(i=Math.min(i,o),s=Math.max(s,o)))}return[i,s]}return[i,s]};function G4(n){if(n<=0||n>=1)return 0;const t=-.00778489400243029,e=-.322396458041136,i=-2.40075827716184,s=-2.54973253934373,r=4.37466414146497,a=2.93816398269878,o=.00778469570904146,l=.32246712907004,h=2.445134137143,u=3.75440866190742;let d,c;return n<.02425?(d=Math.sqrt(-2*Math.log(n)),(((((t*d+e)*d+i)*d+s)*d+r)*d+a)/((((o*d+l)*d+h)*d+u)*d+1)):n<=.97575?(d=n-.5,c=d*d,(((((-39.6968302866538*c+220.946098424521)*c-275.928510446969)*c+138.357751867269)*c-30.6647980661472)*c+2.50662827745924)*d/(((((-54.4760987982241*c+161.585836858041)*c-155.698979859887)*c+66.8013118877197)*c-13.2806815528857)*c+1)):(d=Math.sqrt(-2*Math.log(1-n)),-(((((t*d+e)*d+i)*d+s)*d+r)*d+a)/((((o*d+l)*d+h)*d+u)*d+1))}function $4(n,t,e,i){let s=1/0,r=-1/0,a=0,o=0;for(let d=0;d<n.length;d++){const c=n[d];let p=t(c),g=e(c);!O(p)&&(p=+p)>=p&&!O(g)&&(g=+g)>=g&&(p<s&&(s=p),p>r&&(r=p),a++,o+=p)}if(a===0)return{min:s,max:r,n:a,X:0,SSE:0,Sxx:0};const l=o/a;let h=0,u=0;for(let d=0;d<n.length;d++){const c=n[d];let p=t(c),g=e(c);if(!O(p)&&(p=+p)>=p&&!O(g)&&(g=+g)>=g){const f=g-i(p);h+=f*f;const _=p-l;u+=_*_}}return{min:s,max:r,n:a,X:l,SSE:h,Sxx:u}}function fP(n,t){const{n:e,X:i,Sxx:s,SSE:r}=t,a=e>2?r/(e-2):0;return{seMean:s>0?Math.sqrt(a*(1/e+(n-i)*(n-i)/s)):Math.sqrt(a/e),sePred:Math.sqrt(a*(1+1/e+(s>0?(n-i)*(n-i)/s:0)))}}function Y4(n,t,e,i){const s=i-n*n;if(Math.abs(s)<Number.EPSILON)return{a:t,b:0};const r=(e-n*t)/s;return{a:t-r*n,b:r}}function X4(n,t,e,i){for(let s=0;s<n.length;s++){const r=n[s];let a=t(r),o=e(r);!O(a)&&(a=+a)>=a&&!O(o)&&(o=+o)>=o&&i(a,o,s)}}function K4(n,t,e,i,s){let r=0,a=0;for(let o=0;o<n.length;o++){const l=n[o];let h=e(l);if(!O(h)&&(h=+h)>=h){const u=h-s(t(l));r+=u*u;const d=h-i;a+=d*d}}return a===0?0:1-r/a}function q4(n,t=s=>s.x,e=s=>s.y,i){var s;const r=(s=i==null?void 0:i.alpha)!==null&&s!==void 0?s:.05;let a=0,o=0,l=0,h=0,u=0;X4(n,t,e,(f,_)=>{a++,o+=(f-o)/a,l+=(_-l)/a,h+=(f*_-h)/a,u+=(f*f-u)/a});const{a:d,b:c}=Y4(o,l,h,u),p=f=>d+c*f,g=$4(n,t,e,p);return{coef:{a:d,b:c},predict:p,rSquared:K4(n,t,e,l,p),evaluateGrid:function(f){const _=[];if(g.n===0||f<=0)return _;if(g.min===g.max){for(let v=0;v<f;v++)_.push({x:g.min,y:p(g.min)});return _}const m=(g.max-g.min)/(f-1);for(let v=0;v<f;v++){const y=v===f-1?g.max:g.min+m*v;_.push({x:y,y:p(y)})}return _},confidenceInterval:function(f=50){const _=[];if(g.n===0||f<=0)return _;const m=G4(1-r/2);if(g.min===g.max){const y=p(g.min),b=fP(g.min,g);for(let x=0;x<f;x++)_.push({x:g.min,mean:y,lower:y-m*b.seMean,upper:y+m*b.seMean,predLower:y-m*b.sePred,predUpper:y+m*b.sePred});return _}const v=(g.max-g.min)/(f-1);for(let y=0;y<f;y++){const b=y===f-1?g.max:g.min+v*y,x=p(b),S=fP(b,g);_.push({x:b,mean:x,lower:x-m*S.seMean,upper:x+m*S.seMean,predLower:x-m*S.sePred,predUpper:x+m*S.sePred})}return _}}}const Se=1e-12,ne=Math.PI,Ls=ne/2,qi=2*ne,Tt=2*Math.PI,jt=Math.abs,le=Math.atan2,bi=Math.cos,Zi=Math.max,ki=Math.min,He=Math.sin,kr=Math.sqrt,zh=Math.pow;function Z4(n){return n>1?0:n<-1?ne:Math.acos(n)}function _P(n){return n>=1?Ls:n<=-1?-Ls:Math.asin(n)}function mP(n,t,e,i,s){let r=e,a=i;return typeof n=="number"&&typeof e=="number"&&(r=(1-s)*n+s*e),typeof t=="number"&&typeof i=="number"&&(a=(1-s)*t+s*i),{x:r,y:a}}function S1(n,t){return n[0]*t[1]-n[1]*t[0]}function Q4(n,t){return jt(n[0]-t[0])+jt(n[1]-t[1])<1e-12}function AF(n,t=10){return Math.round(n*t)/t}function Sd(n){const t=n.toString().split(/[eE]/),e=(t[0].split(".")[1]||"").length-(+t[1]||0);return e>0?e:0}function Qr(n,t){return AF(n+t,10**Math.max(Sd(n),Sd(t)))}function vg(n,t){return AF(n-t,10**Math.max(Sd(n),Sd(t)))}class he{constructor(t=0,e=0,i,s){this.x=0,this.y=0,this.x=t,this.y=e,this.x1=i,this.y1=s}clone(){return new he(this.x,this.y)}copyFrom(t){return this.x=t.x,this.y=t.y,this.x1=t.x1,this.y1=t.y1,this.defined=t.defined,this.context=t.context,this}set(t,e){return this.x=t,this.y=e,this}add(t){return it(t)?(this.x+=t,void(this.y+=t)):(this.x+=t.x,this.y+=t.y,this)}sub(t){return it(t)?(this.x-=t,void(this.y-=t)):(this.x-=t.x,this.y-=t.y,this)}multi(t){throw new Error("暂不支持")}div(t){throw new Error("暂不支持")}}class Si{static distancePP(t,e){return kr(zh(t.x-e.x,2)+zh(t.y-e.y,2))}static distanceNN(t,e,i,s){return kr(zh(t-i,2)+zh(e-s,2))}static distancePN(t,e,i){return kr(zh(e-t.x,2)+zh(i-t.y,2))}static pointAtPP(t,e,i){return new he((e.x-t.x)*i+t.x,(e.y-t.y)*i+t.y)}}function de(n){return n*(Math.PI/180)}function Nw(n){return 180*n/Math.PI}const J4=(n=0)=>{if(n<0)for(;n<-qi;)n+=qi;else if(n>0)for(;n>qi;)n-=qi;return n},tG=J4;function _e(n,t,e){return t?{x:n.x+t*Math.cos(e),y:n.y+t*Math.sin(e)}:{x:n.x,y:n.y}}function yg(n,t={x:0,y:0},e=0,i=2*Math.PI){const{x:s,y:r}=n,{x:a,y:o}=t;let l=s-a,h=r-o;const u=Math.sqrt(l*l+h*h);if(u===0)return{radius:0,angle:0};l/=u,h/=u;let d=Math.atan2(h,l);if(d<e)for(;d<=e;)d+=2*Math.PI;if(d>i)for(;d>=i;)d-=2*Math.PI;return{radius:u,angle:d}}function kF(n,t){return Math.atan2(t.y-n.y,t.x-n.x)}function il(n){for(;n<0;)n+=2*Math.PI;for(;n>=2*Math.PI;)n-=2*Math.PI;return n}function eG(n,t){const e=Math.abs(t-n);if(e>=2*Math.PI||2*Math.PI-e<1e-6)return[0,Math.PI/2,Math.PI,1.5*Math.PI];const i=il(Math.min(n,t)),s=i+e,r=[i,s];let a=Math.floor(i/Math.PI)*Math.PI/2;for(;a<s;)a>i&&r.push(a),a+=Math.PI/2;return r}function iG(n,t,e,i){const{x:s,y:r}=t,a=eG(e,i),{width:o,height:l}=n,h=[];return a.forEach(u=>{const d=Math.sin(u),c=Math.cos(u);d===1?h.push(l-r):d===-1?h.push(r):c===1?h.push(o-s):c===-1?h.push(s):(d>0?h.push(Math.abs((l-r)/d)):h.push(Math.abs(r/d)),c>0?h.push(Math.abs((o-s)/c)):h.push(Math.abs(s/c)))}),Math.min.apply(null,h)}function wF(n){return(n=il(n))>0&&n<=Math.PI/2?2:n>Math.PI/2&&n<=Math.PI?3:n>Math.PI&&n<=3*Math.PI/2?4:1}function Tx(n,t,e){n[0]=t[0]-e[0],n[1]=t[1]-e[1]}function TF(n,t,e,i){let s=n[0],r=t[0],a=e[0],o=i[0];return r<s&&([s,r]=[r,s]),o<a&&([o,a]=[a,o]),!(r<a||o<s)&&(s=n[1],r=t[1],a=e[1],o=i[1],r<s&&([s,r]=[r,s]),o<a&&([o,a]=[a,o]),!(r<a||o<s))}function MF(n,t,e,i){if(!TF(n,t,e,i))return!1;const s=[0,0],r=[0,0],a=[0,0];if(Tx(s,t,n),Tx(r,i,e),Q4(s,r))return!0;Tx(a,e,n);const o=S1(a,r)/S1(s,r);return o>=0&&o<=1&&[n[0]+s[0]*o,n[1]+s[1]*o]}function CF(n,t,e){if(n===null)return t;if(t===null)return n;const{x11:i,x12:s,y11:r,y12:a,x21:o,x22:l,y21:h,y22:u}=Vw(n,t,e);return i>=l||s<=o||r>=u||a<=h?{x1:0,y1:0,x2:0,y2:0}:{x1:Math.max(i,o),y1:Math.max(r,h),x2:Math.min(s,l),y2:Math.min(a,u)}}var mu;(function(n){n[n.NONE=0]="NONE",n[n.BBOX1=1]="BBOX1",n[n.BBOX2=2]="BBOX2"})(mu||(mu={}));const Vw=(n,t,e)=>{let i=n.x1,s=n.x2,r=n.y1,a=n.y2,o=t.x1,l=t.x2,h=t.y1,u=t.y2;return e&&(i>s&&([i,s]=[s,i]),r>a&&([r,a]=[a,r]),o>l&&([o,l]=[l,o]),h>u&&([h,u]=[u,h])),{x11:i,x12:s,y11:r,y12:a,x21:o,x22:l,y21:h,y22:u}};function nG(n,t,e){if(!n||!t)return mu.NONE;const{x11:i,x12:s,y11:r,y12:a,x21:o,x22:l,y21:h,y22:u}=Vw(n,t,e);return i>o&&s<l&&r>h&&a<u?mu.BBOX1:o>i&&l<s&&h>r&&u<a?mu.BBOX2:mu.NONE}function bg(n,t,e){if(n&&t){if(!e)return!(n.x1>t.x2||n.x2<t.x1||n.y1>t.y2||n.y2<t.y1);const{x11:i,x12:s,y11:r,y12:a,x21:o,x22:l,y21:h,y22:u}=Vw(n,t,!0);return!(i>l||s<o||r>u||a<h)}return!0}function op(n,t,e){if(!t)return!0;if(!e)return n.x>=t.x1&&n.x<=t.x2&&n.y>=t.y1&&n.y<=t.y2;let i=t.x1,s=t.x2,r=t.y1,a=t.y2;return i>s&&([i,s]=[s,i]),r>a&&([r,a]=[a,r]),n.x>=i&&n.x<=s&&n.y>=r&&n.y<=a}function Mx(n,t){return Math.abs(t[0]*n[0]+t[1]*n[1])}function Jr({x:n,y:t},e,i={x:0,y:0}){return{x:(n-i.x)*Math.cos(e)-(t-i.y)*Math.sin(e)+i.x,y:(n-i.x)*Math.sin(e)+(t-i.y)*Math.cos(e)+i.y}}function A1(n){return{x:(n.x1+n.x2)/2,y:(n.y1+n.y2)/2}}function vP(n,t){const e=t?de(n.angle):n.angle,i=A1(n);return[Jr({x:n.x1,y:n.y1},e,i),Jr({x:n.x2,y:n.y1},e,i),Jr({x:n.x2,y:n.y2},e,i),Jr({x:n.x1,y:n.y2},e,i)]}function PF(n,t,e=!1){const i=vP(n,e),s=vP(t,e),r=(_,m)=>[m.x-_.x,m.y-_.y],a=r(A1(n),A1(t)),o=r(i[0],i[1]),l=r(i[1],i[2]),h=r(s[0],s[1]),u=r(s[1],s[2]),d=e?de(n.angle):n.angle;let c=e?de(90-n.angle):n.angle+Ls;const p=e?de(t.angle):t.angle;let g=e?de(90-t.angle):t.angle+Ls;c>Tt&&(c-=Tt),g>Tt&&(g-=Tt);const f=(_,m,v,y)=>{const b=[Math.cos(m),Math.sin(m)];return _+(Mx(b,v)+Mx(b,y))/2>Mx(b,a)};return f((n.x2-n.x1)/2,d,h,u)&&f((n.y2-n.y1)/2,c,h,u)&&f((t.x2-t.x1)/2,p,o,l)&&f((t.y2-t.y1)/2,g,o,l)}const sG=1e-8;function rG(n,t,e,i,s){for(let r=0,a=s[s.length-1];r<s.length;r++){const o=s[r];if(TF([n,t],[e,i],[o.x,o.y],[a.x,a.y]))return!0;a=o}return!1}function RF(n,t,e){let i=0,s=n[0];if(!s)return!1;for(let a=1;a<n.length;a++){const o=n[a];i+=Ca(s.x,s.y,o.x,o.y,t,e),s=o}const r=n[0];return yP(s.x,r.x)&&yP(s.y,r.y)||(i+=Ca(s.x,s.y,r.x,r.y,t,e)),i!==0}function Ca(n,t,e,i,s,r){if(r>t&&r>i||r<t&&r<i||i===t)return 0;const a=(r-t)/(i-t);let o=i<t?1:-1;a!==1&&a!==0||(o=i<t?.5:-.5);const l=a*(e-n)+n;return l===s?1/0:l>s?o:0}function yP(n,t){return Math.abs(n-t)<sG}function aG(n,t){for(let e=0;e<t.length;e++)if(RF(n,t[e].x,t[e].y)||e>0&&rG(t[e-1].x,t[e-1].y,t[e].x,t[e].y,n))return!0;return!1}const bP=n=>{let t=n.charCodeAt(0),e=n.length===2?n.charCodeAt(1):0,i=t;return 55296<=t&&t<=56319&&56320<=e&&e<=57343&&(t&=1023,e&=1023,i=t<<10|e,i+=65536),i===12288||65281<=i&&i<=65376||65504<=i&&i<=65510?"F":i===8361||65377<=i&&i<=65470||65474<=i&&i<=65479||65482<=i&&i<=65487||65490<=i&&i<=65495||65498<=i&&i<=65500||65512<=i&&i<=65518?"H":4352<=i&&i<=4447||4515<=i&&i<=4519||4602<=i&&i<=4607||9001<=i&&i<=9002||11904<=i&&i<=11929||11931<=i&&i<=12019||12032<=i&&i<=12245||12272<=i&&i<=12283||12289<=i&&i<=12350||12353<=i&&i<=12438||12441<=i&&i<=12543||12549<=i&&i<=12589||12593<=i&&i<=12686||12688<=i&&i<=12730||12736<=i&&i<=12771||12784<=i&&i<=12830||12832<=i&&i<=12871||12880<=i&&i<=13054||13056<=i&&i<=19903||19968<=i&&i<=42124||42128<=i&&i<=42182||43360<=i&&i<=43388||44032<=i&&i<=55203||55216<=i&&i<=55238||55243<=i&&i<=55291||63744<=i&&i<=64255||65040<=i&&i<=65049||65072<=i&&i<=65106||65108<=i&&i<=65126||65128<=i&&i<=65131||110592<=i&&i<=110593||127488<=i&&i<=127490||127504<=i&&i<=127546||127552<=i&&i<=127560||127568<=i&&i<=127569||131072<=i&&i<=194367||177984<=i&&i<=196605||196608<=i&&i<=262141?"W":32<=i&&i<=126||162<=i&&i<=163||165<=i&&i<=166||i===172||i===175||10214<=i&&i<=10221||10629<=i&&i<=10630?"Na":i===161||i===164||167<=i&&i<=168||i===170||173<=i&&i<=174||176<=i&&i<=180||182<=i&&i<=186||188<=i&&i<=191||i===198||i===208||215<=i&&i<=216||222<=i&&i<=225||i===230||232<=i&&i<=234||236<=i&&i<=237||i===240||242<=i&&i<=243||247<=i&&i<=250||i===252||i===254||i===257||i===273||i===275||i===283||294<=i&&i<=295||i===299||305<=i&&i<=307||i===312||319<=i&&i<=322||i===324||328<=i&&i<=331||i===333||338<=i&&i<=339||358<=i&&i<=359||i===363||i===462||i===464||i===466||i===468||i===470||i===472||i===474||i===476||i===593||i===609||i===708||i===711||713<=i&&i<=715||i===717||i===720||728<=i&&i<=731||i===733||i===735||768<=i&&i<=879||913<=i&&i<=929||931<=i&&i<=937||945<=i&&i<=961||963<=i&&i<=969||i===1025||1040<=i&&i<=1103||i===1105||i===8208||8211<=i&&i<=8214||8216<=i&&i<=8217||8220<=i&&i<=8221||8224<=i&&i<=8226||8228<=i&&i<=8231||i===8240||8242<=i&&i<=8243||i===8245||i===8251||i===8254||i===8308||i===8319||8321<=i&&i<=8324||i===8364||i===8451||i===8453||i===8457||i===8467||i===8470||8481<=i&&i<=8482||i===8486||i===8491||8531<=i&&i<=8532||8539<=i&&i<=8542||8544<=i&&i<=8555||8560<=i&&i<=8569||i===8585||8592<=i&&i<=8601||8632<=i&&i<=8633||i===8658||i===8660||i===8679||i===8704||8706<=i&&i<=8707||8711<=i&&i<=8712||i===8715||i===8719||i===8721||i===8725||i===8730||8733<=i&&i<=8736||i===8739||i===8741||8743<=i&&i<=8748||i===8750||8756<=i&&i<=8759||8764<=i&&i<=8765||i===8776||i===8780||i===8786||8800<=i&&i<=8801||8804<=i&&i<=8807||8810<=i&&i<=8811||8814<=i&&i<=8815||8834<=i&&i<=8835||8838<=i&&i<=8839||i===8853||i===8857||i===8869||i===8895||i===8978||9312<=i&&i<=9449||9451<=i&&i<=9547||9552<=i&&i<=9587||9600<=i&&i<=9615||9618<=i&&i<=9621||9632<=i&&i<=9633||9635<=i&&i<=9641||9650<=i&&i<=9651||9654<=i&&i<=9655||9660<=i&&i<=9661||9664<=i&&i<=9665||9670<=i&&i<=9672||i===9675||9678<=i&&i<=9681||9698<=i&&i<=9701||i===9711||9733<=i&&i<=9734||i===9737||9742<=i&&i<=9743||9748<=i&&i<=9749||i===9756||i===9758||i===9792||i===9794||9824<=i&&i<=9825||9827<=i&&i<=9829||9831<=i&&i<=9834||9836<=i&&i<=9837||i===9839||9886<=i&&i<=9887||9918<=i&&i<=9919||9924<=i&&i<=9933||9935<=i&&i<=9953||i===9955||9960<=i&&i<=9983||i===10045||i===10071||10102<=i&&i<=10111||11093<=i&&i<=11097||12872<=i&&i<=12879||57344<=i&&i<=63743||65024<=i&&i<=65039||i===65533||127232<=i&&i<=127242||127248<=i&&i<=127277||127280<=i&&i<=127337||127344<=i&&i<=127386||917760<=i&&i<=917999||983040<=i&&i<=1048573||1048576<=i&&i<=1114109?"A":"N"};function Jm(n,t={},e){e||(e=1);const{fontStyle:i=t.fontStyle,fontVariant:s=t.fontVariant,fontWeight:r=t.fontWeight,fontSize:a=t.fontSize,fontFamily:o=t.fontFamily}=n;return(i?i+" ":"")+(s?s+" ":"")+(r?r+" ":"")+a*e+"px "+(o||"sans-serif")}class pn{constructor(t,e){this._numberCharSize=null,this._fullCharSize=null,this._letterCharSize=null,this._specialCharSizeMap={},this._canvas=null,this._context=null,this._contextSaved=!1,this._notSupportCanvas=!1,this._notSupportVRender=!1,this._userSpec={},this.specialCharSet=`-/: .,@%'"~`,this._option=t,this._userSpec=e??{},this.textSpec=this._initSpec(),P(t.specialCharSet)&&(this.specialCharSet=t.specialCharSet),this._standardMethod=P(t.getTextBounds)?this.fullMeasure.bind(this):this.measureWithNaiveCanvas.bind(this)}initContext(){if(this._notSupportCanvas)return!1;if(O(this._canvas)&&(P(this._option.getCanvasForMeasure)&&(this._canvas=this._option.getCanvasForMeasure()),O(this._canvas)&&typeof window<"u"&&window.document!==void 0&&globalThis&&P(globalThis.document)&&(this._canvas=globalThis.document.createElement("canvas"))),O(this._context)&&P(this._canvas)){const t=this._canvas.getContext("2d");P(t)&&(t.save(),t.font=Jm(this.textSpec),this._contextSaved=!0,this._context=t)}return!O(this._context)||(this._notSupportCanvas=!0,!1)}_initSpec(){var t,e,i;const{defaultFontParams:s={}}=this._option,{fontStyle:r=s.fontStyle,fontVariant:a=s.fontVariant,fontWeight:o=(t=s.fontWeight)!==null&&t!==void 0?t:"normal",fontSize:l=(e=s.fontSize)!==null&&e!==void 0?e:12,fontFamily:h=(i=s.fontFamily)!==null&&i!==void 0?i:"sans-serif",align:u,textAlign:d=u??"center",baseline:c,textBaseline:p=c??"middle",ellipsis:g,limit:f}=this._userSpec;let{lineHeight:_=l}=this._userSpec;if(vt(_)&&_[_.length-1]==="%"){const m=Number.parseFloat(_.substring(0,_.length-1))/100;_=l*m}return{fontStyle:r,fontVariant:a,fontFamily:h,fontSize:l,fontWeight:o,textAlign:d,textBaseline:p,ellipsis:g,limit:f,lineHeight:_}}measure(t,e){switch(e){case"vrender":case"canopus":return this.fullMeasure(t);case"canvas":return this.measureWithNaiveCanvas(t);case"simple":return this.quickMeasureWithoutCanvas(t);default:return this.quickMeasure(t)}}fullMeasure(t){if(O(t))return{width:0,height:0};if(O(this._option.getTextBounds)||!this._notSupportVRender)return this.measureWithNaiveCanvas(t);const{fontFamily:e,fontSize:i,fontWeight:s,textAlign:r,textBaseline:a,ellipsis:o,limit:l,lineHeight:h}=this.textSpec;let u;try{const d=this._option.getTextBounds({text:t,fontFamily:e,fontSize:i,fontWeight:s,textAlign:r,textBaseline:a,ellipsis:!!o,maxLineWidth:l||1/0,lineHeight:h});u={width:d.width(),height:d.height()}}catch{this._notSupportVRender=!0,u=this.measureWithNaiveCanvas(t)}return u}measureWithNaiveCanvas(t){return this._measureReduce(t,this._measureWithNaiveCanvas.bind(this))}_measureWithNaiveCanvas(t){var e;if(!this.initContext())return this._quickMeasureWithoutCanvas(t);const i=this._context.measureText(t),{fontSize:s,lineHeight:r}=this.textSpec;return{width:i.width,height:(e=r)!==null&&e!==void 0?e:s,fontBoundingBoxAscent:i.fontBoundingBoxAscent,fontBoundingBoxDescent:i.fontBoundingBoxDescent}}quickMeasure(t){return this._measureReduce(t,this._quickMeasure.bind(this))}_quickMeasure(t){const e={width:0,height:0};for(let i=0;i<t.length;i++){const s=t[i];let r=this._measureSpecialChar(s);O(r)&&pn.NUMBERS_CHAR_SET.includes(s)&&(r=this._measureNumberChar()),O(r)&&["F","W"].includes(bP(s))&&(r=this._measureFullSizeChar()),O(r)&&(r=this._measureLetterChar()),e.width+=r.width,e.height=Math.max(e.height,r.height),!O(r.fontBoundingBoxAscent)&&(e.fontBoundingBoxAscent=r.fontBoundingBoxAscent),!O(r.fontBoundingBoxDescent)&&(e.fontBoundingBoxDescent=r.fontBoundingBoxDescent)}return e}quickMeasureWithoutCanvas(t){return this._measureReduce(t,this._quickMeasureWithoutCanvas.bind(this))}_quickMeasureWithoutCanvas(t){var e;const i={width:0,height:0},{fontSize:s,lineHeight:r}=this.textSpec;for(let a=0;a<t.length;a++){const o=t[a],l=["F","W"].includes(bP(o))?1:.53;i.width+=l*s}return i.height=(e=r)!==null&&e!==void 0?e:s,i}_measureReduce(t,e){var i;const{fontSize:s,lineHeight:r}=this.textSpec,a={width:0,height:0};if(O(t))return a;if(V(t)){const o=t.filter(P).map(l=>l.toString());return o.length===0?a:o.length===1?e(o[0]):{width:o.reduce((l,h)=>Math.max(l,e(h).width),0),height:o.length*(((i=r)!==null&&i!==void 0?i:s)+1)+1}}return e(t.toString())}_measureNumberChar(){if(O(this._numberCharSize)){const t=this._standardMethod(pn.NUMBERS_CHAR_SET);this._numberCharSize={width:t.width/pn.NUMBERS_CHAR_SET.length,height:t.height,fontBoundingBoxAscent:t.fontBoundingBoxAscent,fontBoundingBoxDescent:t.fontBoundingBoxDescent}}return this._numberCharSize}_measureFullSizeChar(){return O(this._fullCharSize)&&(this._fullCharSize=this._standardMethod(pn.FULL_SIZE_CHAR)),this._fullCharSize}_measureLetterChar(){if(O(this._letterCharSize)){const t=this._standardMethod(pn.ALPHABET_CHAR_SET);this._letterCharSize={width:t.width/pn.ALPHABET_CHAR_SET.length,height:t.height,fontBoundingBoxAscent:t.fontBoundingBoxAscent,fontBoundingBoxDescent:t.fontBoundingBoxDescent}}return this._letterCharSize}_measureSpecialChar(t){return P(this._specialCharSizeMap[t])?this._specialCharSizeMap[t]:this.specialCharSet.includes(t)?(this._specialCharSizeMap[t]=this._standardMethod(t),this._specialCharSizeMap[t]):null}release(){P(this._canvas)&&(this._canvas=null),P(this._context)&&(this._contextSaved&&(this._context.restore(),this._contextSaved=!1),this._context=null)}}pn.ALPHABET_CHAR_SET="abcdefghijklmnopqrstuvwxyz",pn.NUMBERS_CHAR_SET="0123456789",pn.FULL_SIZE_CHAR="字";const EF=(n,t)=>{const{x1:e,x2:i,y1:s,y2:r}=n,a=Math.abs(i-e),o=Math.abs(r-s);let l=(e+i)/2,h=(s+r)/2,u=0,d=0;switch(t){case"top":case"inside-top":d=-.5;break;case"bottom":case"inside-bottom":d=.5;break;case"left":case"inside-left":u=-.5;break;case"right":case"inside-right":u=.5;break;case"top-right":u=.5,d=-.5;break;case"top-left":u=-.5,d=-.5;break;case"bottom-right":u=.5,d=.5;break;case"bottom-left":u=-.5,d=.5}return l+=u*a,h+=d*o,{x:l,y:h}},xP=(n,t)=>Math.max(t.x1-n.x2,n.x1-t.x2,t.y1-n.y2,n.y1-t.y2),oG=(n,t)=>{const e=[{x:Math.cos(n.angle),y:Math.sin(n.angle)},{x:-Math.sin(n.angle),y:Math.cos(n.angle)},{x:Math.cos(t.angle),y:Math.sin(n.angle)},{x:-Math.sin(t.angle),y:Math.cos(n.angle)}];function i(r,a,o){const l=r.getRotatedCorners().map(h=>h.x*a+h.y*o);return{min:Math.min(...l),max:Math.max(...l)}}let s=0;for(const r of e){const a=i(n,r.x,r.y),o=i(t,r.x,r.y);let l;l=a.max<o.min?o.min-a.max:o.max<a.min?a.min-o.max:0,s=Math.max(s,l)}return s};function Ww(n,t,e){const{x1:i,y1:s,x2:r,y2:a}=t;return e.onlyTranslate()?(n!==t&&n.setValue(t.x1,t.y1,t.x2,t.y2),n.translate(e.e,e.f),t):(n.clear(),n.add(e.a*i+e.c*s+e.e,e.b*i+e.d*s+e.f),n.add(e.a*r+e.c*s+e.e,e.b*r+e.d*s+e.f),n.add(e.a*r+e.c*a+e.e,e.b*r+e.d*a+e.f),n.add(e.a*i+e.c*a+e.e,e.b*i+e.d*a+e.f),t)}class Gi{constructor(t){t?this.setValue(t.x1,t.y1,t.x2,t.y2):this.clear()}clone(){return new Gi(this)}clear(){return this.x1=+Number.MAX_VALUE,this.y1=+Number.MAX_VALUE,this.x2=-Number.MAX_VALUE,this.y2=-Number.MAX_VALUE,this}empty(){return this.x1===+Number.MAX_VALUE&&this.y1===+Number.MAX_VALUE&&this.x2===-Number.MAX_VALUE&&this.y2===-Number.MAX_VALUE}equals(t){return this.x1===t.x1&&this.y1===t.y1&&this.x2===t.x2&&this.y2===t.y2}setValue(t=0,e=0,i=0,s=0){return this.x1=t,this.y1=e,this.x2=i,this.y2=s,this}set(t=0,e=0,i=0,s=0){return i<t?(this.x2=t,this.x1=i):(this.x1=t,this.x2=i),s<e?(this.y2=e,this.y1=s):(this.y1=e,this.y2=s),this}add(t=0,e=0){return t<this.x1&&(this.x1=t),e<this.y1&&(this.y1=e),t>this.x2&&(this.x2=t),e>this.y2&&(this.y2=e),this}expand(t=0){return V(t)?(this.y1-=t[0],this.x2+=t[1],this.y2+=t[2],this.x1-=t[3]):(this.x1-=t,this.y1-=t,this.x2+=t,this.y2+=t),this}round(){return this.x1=Math.floor(this.x1),this.y1=Math.floor(this.y1),this.x2=Math.ceil(this.x2),this.y2=Math.ceil(this.y2),this}translate(t=0,e=0){return this.x1+=t,this.x2+=t,this.y1+=e,this.y2+=e,this}rotate(t=0,e=0,i=0){const s=this.rotatedPoints(t,e,i);return this.clear().add(s[0],s[1]).add(s[2],s[3]).add(s[4],s[5]).add(s[6],s[7])}scale(t=0,e=0,i=0,s=0){const r=this.scalePoints(t,e,i,s);return this.clear().add(r[0],r[1]).add(r[2],r[3])}union(t){return t.x1<this.x1&&(this.x1=t.x1),t.y1<this.y1&&(this.y1=t.y1),t.x2>this.x2&&(this.x2=t.x2),t.y2>this.y2&&(this.y2=t.y2),this}intersect(t){return t.x1>this.x1&&(this.x1=t.x1),t.y1>this.y1&&(this.y1=t.y1),t.x2<this.x2&&(this.x2=t.x2),t.y2<this.y2&&(this.y2=t.y2),this}encloses(t){return t&&this.x1<=t.x1&&this.x2>=t.x2&&this.y1<=t.y1&&this.y2>=t.y2}alignsWith(t){return t&&(this.x1===t.x1||this.x2===t.x2||this.y1===t.y1||this.y2===t.y2)}intersects(t){return t&&!(this.x2<t.x1||this.x1>t.x2||this.y2<t.y1||this.y1>t.y2)}contains(t=0,e=0){return!(t<this.x1||t>this.x2||e<this.y1||e>this.y2)}containsPoint(t){return!(t.x<this.x1||t.x>this.x2||t.y<this.y1||t.y>this.y2)}width(){return this.empty()?0:this.x2-this.x1}height(){return this.empty()?0:this.y2-this.y1}scaleX(t=0){return this.x1*=t,this.x2*=t,this}scaleY(t=0){return this.y1*=t,this.y2*=t,this}transformWithMatrix(t){return Ww(this,this,t),this}copy(t){return this.x1=t.x1,this.y1=t.y1,this.x2=t.x2,this.y2=t.y2,this}rotatedPoints(t,e,i){const{x1:s,y1:r,x2:a,y2:o}=this,l=Math.cos(t),h=Math.sin(t),u=e-e*l+i*h,d=i-e*h-i*l;return[l*s-h*r+u,h*s+l*r+d,l*s-h*o+u,h*s+l*o+d,l*a-h*r+u,h*a+l*r+d,l*a-h*o+u,h*a+l*o+d]}scalePoints(t,e,i,s){const{x1:r,y1:a,x2:o,y2:l}=this;return[t*r+(1-t)*i,e*a+(1-e)*s,t*o+(1-t)*i,e*l+(1-e)*s]}}class Ie extends Gi{}class Uw extends Gi{constructor(t,e=0){var i;super(t),t&&(this.angle=(i=t.angle)!==null&&i!==void 0?i:e)}intersects(t){return PF(this,t)}setValue(t=0,e=0,i=0,s=0,r=0){return super.setValue(t,e,i,s),this.angle=r,this}clone(){return new Uw(this)}getRotatedCorners(){const t={x:(this.x1+this.x2)/2,y:(this.y1+this.y2)/2};return[Jr({x:this.x1,y:this.y1},this.angle,t),Jr({x:this.x2,y:this.y1},this.angle,t),Jr({x:this.x1,y:this.y2},this.angle,t),Jr({x:this.x2,y:this.y2},this.angle,t)]}}class ye{constructor(t=1,e=0,i=0,s=1,r=0,a=0){this.a=t,this.b=e,this.c=i,this.d=s,this.e=r,this.f=a}equalToMatrix(t){return!(this.e!==t.e||this.f!==t.f||this.a!==t.a||this.d!==t.d||this.b!==t.b||this.c!==t.c)}equalTo(t,e,i,s,r,a){return!(this.e!==r||this.f!==a||this.a!==t||this.d!==s||this.b!==e||this.c!==i)}setValue(t,e,i,s,r,a){return this.a=t,this.b=e,this.c=i,this.d=s,this.e=r,this.f=a,this}reset(){return this.a=1,this.b=0,this.c=0,this.d=1,this.e=0,this.f=0,this}getInverse(){const t=this.a,e=this.b,i=this.c,s=this.d,r=this.e,a=this.f,o=new ye,l=t*s-e*i;return o.a=s/l,o.b=-e/l,o.c=-i/l,o.d=t/l,o.e=(i*a-s*r)/l,o.f=-(t*a-e*r)/l,o}rotate(t){const e=Math.cos(t),i=Math.sin(t),s=this.a*e+this.c*i,r=this.b*e+this.d*i,a=this.a*-i+this.c*e,o=this.b*-i+this.d*e;return this.a=s,this.b=r,this.c=a,this.d=o,this}rotateByCenter(t,e,i){const s=Math.cos(t),r=Math.sin(t),a=(1-s)*e+r*i,o=(1-s)*i-r*e,l=s*this.a-r*this.b,h=r*this.a+s*this.b,u=s*this.c-r*this.d,d=r*this.c+s*this.d,c=s*this.e-r*this.f+a,p=r*this.e+s*this.f+o;return this.a=l,this.b=h,this.c=u,this.d=d,this.e=c,this.f=p,this}scale(t,e){return this.a*=t,this.b*=t,this.c*=e,this.d*=e,this}setScale(t,e){return this.b=this.b/this.a*t,this.c=this.c/this.d*e,this.a=t,this.d=e,this}transform(t,e,i,s,r,a){return this.multiply(t,e,i,s,r,a),this}translate(t,e){return this.e+=this.a*t+this.c*e,this.f+=this.b*t+this.d*e,this}transpose(){const{a:t,b:e,c:i,d:s,e:r,f:a}=this;return this.a=e,this.b=t,this.c=s,this.d=i,this.e=a,this.f=r,this}multiply(t,e,i,s,r,a){const o=this.a,l=this.b,h=this.c,u=this.d,d=o*t+h*e,c=l*t+u*e,p=o*i+h*s,g=l*i+u*s,f=o*r+h*a+this.e,_=l*r+u*a+this.f;return this.a=d,this.b=c,this.c=p,this.d=g,this.e=f,this.f=_,this}interpolate(t,e){const i=new ye;return i.a=this.a+(t.a-this.a)*e,i.b=this.b+(t.b-this.b)*e,i.c=this.c+(t.c-this.c)*e,i.d=this.d+(t.d-this.d)*e,i.e=this.e+(t.e-this.e)*e,i.f=this.f+(t.f-this.f)*e,i}transformPoint(t,e){const{a:i,b:s,c:r,d:a,e:o,f:l}=this,h=i*a-s*r,u=a/h,d=-s/h,c=-r/h,p=i/h,g=(r*l-a*o)/h,f=-(i*l-s*o)/h,{x:_,y:m}=t;e.x=_*u+m*c+g,e.y=_*d+m*p+f}onlyTranslate(t=1){return this.a===t&&this.b===0&&this.c===0&&this.d===t}clone(){return new ye(this.a,this.b,this.c,this.d,this.e,this.f)}toTransformAttrs(){const t=this.a,e=this.b,i=this.c,s=this.d,r=t*s-e*i,a={x:this.e,y:this.f,rotateDeg:0,scaleX:0,scaleY:0,skewX:0,skewY:0};if(t!==0||e!==0){const o=Math.sqrt(t*t+e*e);a.rotateDeg=e>0?Math.acos(t/o):-Math.acos(t/o),a.scaleX=o,a.scaleY=r/o,a.skewX=(t*i+e*s)/r,a.skewY=0}else if(i!==0||s!==0){const o=Math.sqrt(i*i+s*s);a.rotateDeg=Math.PI/2-(s>0?Math.acos(-i/o):-Math.acos(i/o)),a.scaleX=r/o,a.scaleY=o,a.skewX=0,a.skewY=(t*i+e*s)/r}return a.rotateDeg=Nw(a.rotateDeg),a}}function lG(n,t,e,i,s,r,a,o){const l=t.a,h=t.b,u=t.c,d=t.d,c=t.e,p=t.f,g=bi(a),f=He(a);let _,m;o?(_=o[0],m=o[1]):(_=e,m=i);const v=_-e,y=m-i,b=l*g+u*f,x=h*g+d*f,S=u*g-l*f,k=d*g-h*f;n.a=s*b,n.b=s*x,n.c=r*S,n.d=r*k,n.e=c+l*_+u*m-b*v-S*y,n.f=p+h*_+d*m-x*v-k*y}class hG{constructor(){this.CLEAN_THRESHOLD=1e3,this.L_TIME=1e3,this.R_COUNT=1,this.R_TIMESTAMP_MAX_SIZE=20}clearCache(t,e){const{CLEAN_THRESHOLD:i=this.CLEAN_THRESHOLD,L_TIME:s=this.L_TIME,R_COUNT:r=this.R_COUNT}=e;if(t.size<i)return 0;let a=0;const o=h=>{a++,t.delete(h)},l=Date.now();return t.forEach((h,u)=>{if(h.timestamp.length<r)return o(u);let d=0;for(;l-h.timestamp[h.timestamp.length-1-d]<s&&(d++,!(d>=r)););if(d<r)return o(u);for(;l-h.timestamp[0]>s;)h.timestamp.shift()}),a}addLimitedTimestamp(t,e,i){const{R_TIMESTAMP_MAX_SIZE:s=this.R_TIMESTAMP_MAX_SIZE}=i;t.timestamp.length>s&&t.timestamp.shift(),t.timestamp.push(e)}clearTimeStamp(t,e){const{L_TIME:i=this.L_TIME}=e,s=Date.now();t.forEach(r=>{for(;s-r.timestamp[0]>i;)r.timestamp.shift()})}clearItemTimestamp(t,e){const{L_TIME:i=this.L_TIME}=e,s=Date.now();for(;s-t.timestamp[0]>i;)t.timestamp.shift()}}function tv(n,t,e){t/=100,e/=100;const i=(1-Math.abs(2*e-1))*t,s=i*(1-Math.abs(n/60%2-1)),r=e-i/2;let a=0,o=0,l=0;return 0<=n&&n<60?(a=i,o=s,l=0):60<=n&&n<120?(a=s,o=i,l=0):120<=n&&n<180?(a=0,o=i,l=s):180<=n&&n<240?(a=0,o=s,l=i):240<=n&&n<300?(a=s,o=0,l=i):300<=n&&n<360&&(a=i,o=0,l=s),a=Math.round(255*(a+r)),o=Math.round(255*(o+r)),l=Math.round(255*(l+r)),{r:a,g:o,b:l}}function Cy(n,t,e){n/=255,t/=255,e/=255;const i=Math.min(n,t,e),s=Math.max(n,t,e),r=s-i;let a=0,o=0,l=0;return a=r===0?0:s===n?(t-e)/r%6:s===t?(e-n)/r+2:(n-t)/r+4,a=Math.round(60*a),a<0&&(a+=360),l=(s+i)/2,o=r===0?0:r/(1-Math.abs(2*l-1)),o=+(100*o).toFixed(1),l=+(100*l).toFixed(1),{h:a,s:o,l}}const uG=/^#([0-9a-f]{3,8})$/,SP={transparent:4294967040},mm={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function v_(n){return((n=Math.max(0,Math.min(255,Math.round(n)||0)))<16?"0":"")+n.toString(16)}function BF(n){return it(n)?new An(n>>16,n>>8&255,255&n,1):V(n)?new An(n[0],n[1],n[2]):new An(255,255,255)}function dG(n){return it(n)?new An(n>>>24,n>>>16&255,n>>>8&255,255&n):V(n)?new An(n[0],n[1],n[2],n[3]):new An(255,255,255,1)}function Cx(n){return n<.04045?.0773993808*n:Math.pow(.9478672986*n+.0521327014,2.4)}function Px(n){return n<.0031308?12.92*n:1.055*Math.pow(n,.41666)-.055}const AP=(n,t)=>{const e=uG.exec(n);if(t||e){const i=parseInt(e[1],16),s=e[1].length;return s===3?new An((i>>8&15)+((i>>8&15)<<4),(i>>4&15)+((i>>4&15)<<4),(15&i)+((15&i)<<4),1):s===6?BF(i):s===8?new An(i>>24&255,i>>16&255,i>>8&255,(255&i)/255):null}};class ui{static Brighter(t,e=1){return e===1?t:new ui(t).brighter(e).toRGBA()}static SetOpacity(t,e=1){return e===1?t:new ui(t).setOpacity(e).toRGBA()}static getColorBrightness(t,e="hsl"){const i=t instanceof ui?t:new ui(t);switch(e){case"hsv":default:return i.getHSVBrightness();case"hsl":return i.getHSLBrightness();case"lum":return i.getLuminance();case"lum2":return i.getLuminance2();case"lum3":return i.getLuminance3();case"wcag":return i.getLuminanceWCAG()}}static parseColorString(t){if(P(SP[t]))return dG(SP[t]);if(P(mm[t]))return BF(mm[t]);const e=`${t}`.trim().toLowerCase(),i=AP(e);if(i!==void 0)return i;if(/^(rgb|RGB|rgba|RGBA)/.test(e)){const s=e.replace(/(?:\(|\)|rgba|RGBA|rgb|RGB)*/g,"").split(",");return new An(parseInt(s[0],10),parseInt(s[1],10),parseInt(s[2],10),parseFloat(s[3]))}if(/^(hsl|HSL|hsla|HSLA)/.test(e)){const s=e.replace(/(?:\(|\)|hsla|HSLA|hsl|HSL)*/g,"").split(","),r=tv(parseInt(s[0],10),parseInt(s[1],10),parseInt(s[2],10));return new An(r.r,r.g,r.b,parseFloat(s[3]))}}constructor(t){const e=ui.parseColorString(t);e?this.color=e:(console.warn(`Warn: 传入${t}无法解析为Color`),this.color=new An(255,255,255))}toRGBA(){return this.color.formatRgb()}toString(){return this.color.formatRgb()}toHex(){return this.color.formatHex()}toHsl(){return this.color.formatHsl()}brighter(t){const{r:e,g:i,b:s}=this.color;return this.color.r=Math.max(0,Math.min(255,Math.floor(e*t))),this.color.g=Math.max(0,Math.min(255,Math.floor(i*t))),this.color.b=Math.max(0,Math.min(255,Math.floor(s*t))),this}add(t){const{r:e,g:i,b:s}=this.color;return this.color.r+=Math.min(255,e+t.color.r),this.color.g+=Math.min(255,i+t.color.g),this.color.b+=Math.min(255,s+t.color.b),this}sub(t){return this.color.r=Math.max(0,this.color.r-t.color.r),this.color.g=Math.max(0,this.color.g-t.color.g),this.color.b=Math.max(0,this.color.b-t.color.b),this}multiply(t){const{r:e,g:i,b:s}=this.color;return this.color.r=Math.max(0,Math.min(255,Math.floor(e*t.color.r))),this.color.g=Math.max(0,Math.min(255,Math.floor(i*t.color.g))),this.color.b=Math.max(0,Math.min(255,Math.floor(s*t.color.b))),this}getHSVBrightness(){return Math.max(this.color.r,this.color.g,this.color.b)/255}getHSLBrightness(){return .5*(Math.max(this.color.r,this.color.g,this.color.b)/255+Math.min(this.color.r,this.color.g,this.color.b)/255)}setHsl(t,e,i){const s=this.color.opacity,r=Cy(this.color.r,this.color.g,this.color.b),a=tv(O(t)?r.h:te(t,0,360),O(e)?r.s:e>=0&&e<=1?100*e:e,O(i)?r.l:i<=1&&i>=0?100*i:i);return this.color=new An(a.r,a.g,a.b,s),this}setRGB(t,e,i){return!O(t)&&(this.color.r=t),!O(e)&&(this.color.g=e),!O(i)&&(this.color.b=i),this}setHex(t){const e=`${t}`.trim().toLowerCase(),i=AP(e,!0);return i??this}setColorName(t){const e=mm[t.toLowerCase()];return e!==void 0?this.setHex(e):console.warn("THREE.Color: Unknown color "+t),this}setScalar(t){return this.color.r=t,this.color.g=t,this.color.b=t,this}setOpacity(t=1){return this.color.opacity=t,this}getLuminance(){return(.2126*this.color.r+.7152*this.color.g+.0722*this.color.b)/255}getLuminance2(){return(.2627*this.color.r+.678*this.color.g+.0593*this.color.b)/255}getLuminance3(){return(.299*this.color.r+.587*this.color.g+.114*this.color.b)/255}getLuminanceWCAG(){const t=this.color.r/255,e=this.color.g/255,i=this.color.b/255;let s,r,a;return s=t<=.03928?t/12.92:Math.pow((t+.055)/1.055,2.4),r=e<=.03928?e/12.92:Math.pow((e+.055)/1.055,2.4),a=i<=.03928?i/12.92:Math.pow((i+.055)/1.055,2.4),.2126*s+.7152*r+.0722*a}clone(){return new ui(this.color.toString())}copyGammaToLinear(t,e=2){return this.color.r=Math.pow(t.color.r,e),this.color.g=Math.pow(t.color.g,e),this.color.b=Math.pow(t.color.b,e),this}copyLinearToGamma(t,e=2){const i=e>0?1/e:1;return this.color.r=Math.pow(t.color.r,i),this.color.g=Math.pow(t.color.g,i),this.color.b=Math.pow(t.color.b,i),this}convertGammaToLinear(t){return this.copyGammaToLinear(this,t),this}convertLinearToGamma(t){return this.copyLinearToGamma(this,t),this}copySRGBToLinear(t){return this.color.r=Cx(t.color.r),this.color.g=Cx(t.color.g),this.color.b=Cx(t.color.b),this}copyLinearToSRGB(t){return this.color.r=Px(t.color.r),this.color.g=Px(t.color.g),this.color.b=Px(t.color.b),this}convertSRGBToLinear(){return this.copySRGBToLinear(this),this}convertLinearToSRGB(){return this.copyLinearToSRGB(this),this}}class An{constructor(t,e,i,s){this.r=isNaN(+t)?255:Math.max(0,Math.min(255,+t)),this.g=isNaN(+e)?255:Math.max(0,Math.min(255,+e)),this.b=isNaN(+i)?255:Math.max(0,Math.min(255,+i)),P(s)?this.opacity=isNaN(+s)?1:Math.max(0,Math.min(1,+s)):this.opacity=1}formatHex(){return`#${v_(this.r)+v_(this.g)+v_(this.b)+(this.opacity===1?"":v_(255*this.opacity))}`}formatRgb(){const t=this.opacity;return`${t===1?"rgb(":"rgba("}${this.r},${this.g},${this.b}${t===1?")":`,${t})`}`}formatHsl(){const t=this.opacity,{h:e,s:i,l:s}=Cy(this.r,this.g,this.b);return`${t===1?"hsl(":"hsla("}${e},${i}%,${s}%${t===1?")":`,${t})`}`}toString(){return this.formatHex()}}function OF(n){let t="",e="",i="";const s=n[0]==="#"?1:0;for(let r=s;r<n.length;r++)n[r]!=="#"&&(r<s+2?t+=n[r]:r<s+4?e+=n[r]:r<s+6&&(i+=n[r]));return[parseInt(t,16),parseInt(e,16),parseInt(i,16)]}function cG(n,t,e){return Number((1<<24)+(n<<16)+(t<<8)+e).toString(16).slice(1)}function pG(n,t){const e=n.r,i=t.r,s=n.g,r=t.g,a=n.b,o=t.b,l=n.opacity,h=t.opacity;return u=>{const d=Math.round(e*(1-u)+i*u),c=Math.round(s*(1-u)+r*u),p=Math.round(a*(1-u)+o*u);return new An(d,c,p,l*(1-u)+h*u)}}const gG=Object.freeze(Object.defineProperty({__proto__:null,Color:ui,DEFAULT_COLORS:mm,RGB:An,hexToRgb:OF,hslToRgb:tv,interpolateRgb:pG,rgbToHex:cG,rgbToHsl:Cy},Symbol.toStringTag,{value:"Module"}));function tn(n){if(U(n))return[n,n,n,n];if(V(n)){const t=n.length;if(t===1){const e=n[0];return[e,e,e,e]}if(t===2){const[e,i]=n;return[e,i,e,i]}if(t===3){const[e,i,s]=n;return[e,i,s,i]}if(t===4)return n}if(kt(n)){const{top:t=0,right:e=0,bottom:i=0,left:s=0}=n;return[t,e,i,s]}return[0,0,0,0]}function kP(n,t=0,e=0){if(!n)return{width:t,height:e};let i;try{i=window==null?void 0:window.getComputedStyle}catch{i=()=>({})}const s=i(n);if(/^(\d*\.?\d+)(px)$/.exec(s.width)){const r=parseFloat(s.width)-parseFloat(s.paddingLeft)-parseFloat(s.paddingRight)||n.clientWidth-1,a=parseFloat(s.height)-parseFloat(s.paddingTop)-parseFloat(s.paddingBottom)||n.clientHeight-1;return{width:r<=0?t:r,height:a<=0?e:a}}return{width:t,height:e}}function fG(n){const{x:t,y:e}=n.getBoundingClientRect();return{x:t,y:e}}const _G=(n="")=>{const t={};return n.split(";").forEach(e=>{if(e){const i=e.split(":");if(i.length===2){const s=i[0].trim(),r=i[1].trim();s&&r&&(t[s]=r)}}}),t},wP=n=>n.replace(/([A-Z])/g,"-$1").toLowerCase();function TP(n,t,e){e===void 0&&(e={});var i={type:"Feature"};return(e.id===0||e.id)&&(i.id=e.id),e.bbox&&(i.bbox=e.bbox),i.properties=t||{},i.geometry=n,i}function LF(n,t){t===void 0&&(t={});var e={type:"FeatureCollection"};return t.id&&(e.id=t.id),t.bbox&&(e.bbox=t.bbox),e.features=n,e}function mG(n){return!!n&&n.constructor===Object}class _r{static getInstance(){return _r.instance||(_r.instance=new _r),_r.instance}constructor(){this.locale_shortWeekdays=["Sun","Mon","Tue","Wed","Thu","Fri","Sat"],this.locale_periods=["AM","PM"],this.locale_weekdays=["Sunday","Monday","Tuesday","Wednesday","Thursday","Friday","Saturday"],this.locale_shortMonths=["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"],this.numberRe=/^\s*\d+/,this.pads={"-":"",_:" ",0:"0"},this.requoteRe=/[\\^$*+?|[\]().{}]/g,this.locale_months=["January","February","March","April","May","June","July","August","September","October","November","December"],this.formatShortWeekday=t=>this.locale_shortWeekdays[t.getDay()],this.formatWeekday=t=>this.locale_weekdays[t.getDay()],this.formatShortMonth=t=>this.locale_shortMonths[t.getMonth()],this.formatMonth=t=>this.locale_months[t.getMonth()],this.formatDayOfMonth=(t,e)=>this.pad(t.getDate(),e,2),this.formatHour24=(t,e)=>this.pad(t.getHours(),e,2),this.formatHour12=(t,e)=>this.pad(t.getHours()%12||12,e,2),this.formatMilliseconds=(t,e)=>this.pad(t.getMilliseconds(),e,3),this.formatMonthNumber=(t,e)=>this.pad(t.getMonth()+1,e,2),this.formatMinutes=(t,e)=>this.pad(t.getMinutes(),e,2),this.formatPeriod=t=>this.locale_periods[+(t.getHours()>=12)],this.formatSeconds=(t,e)=>this.pad(t.getSeconds(),e,2),this.formatFullYear=(t,e)=>this.pad(t.getFullYear()%1e4,e,4),this.formatUTCShortWeekday=t=>this.locale_shortWeekdays[t.getUTCDay()],this.formatUTCWeekday=t=>this.locale_weekdays[t.getUTCDay()],this.formatUTCShortMonth=t=>this.locale_shortMonths[t.getUTCMonth()],this.formatUTCMonth=t=>this.locale_months[t.getUTCMonth()],this.formatUTCDayOfMonth=(t,e)=>this.pad(t.getUTCDate(),e,2),this.formatUTCHour24=(t,e)=>this.pad(t.getUTCHours(),e,2),this.formatUTCHour12=(t,e)=>this.pad(t.getUTCHours()%12||12,e,2),this.formatUTCMilliseconds=(t,e)=>this.pad(t.getUTCMilliseconds(),e,3),this.formatUTCMonthNumber=(t,e)=>this.pad(t.getUTCMonth()+1,e,2),this.formatUTCMinutes=(t,e)=>this.pad(t.getUTCMinutes(),e,2),this.formatUTCPeriod=t=>this.locale_periods[+(t.getUTCHours()>=12)],this.formatUTCSeconds=(t,e)=>this.pad(t.getUTCSeconds(),e,2),this.formatUTCFullYear=(t,e)=>this.pad(t.getUTCFullYear()%1e4,e,4),this.formats={a:this.formatShortWeekday,A:this.formatWeekday,b:this.formatShortMonth,B:this.formatMonth,d:this.formatDayOfMonth,e:this.formatDayOfMonth,H:this.formatHour24,I:this.formatHour12,L:this.formatMilliseconds,m:this.formatMonthNumber,M:this.formatMinutes,p:this.formatPeriod,S:this.formatSeconds,Y:this.formatFullYear},this.utcFormats={a:this.formatUTCShortWeekday,A:this.formatUTCWeekday,b:this.formatUTCShortMonth,B:this.formatUTCMonth,d:this.formatUTCDayOfMonth,e:this.formatUTCDayOfMonth,H:this.formatUTCHour24,I:this.formatUTCHour12,L:this.formatUTCMilliseconds,m:this.formatUTCMonthNumber,M:this.formatUTCMinutes,p:this.formatUTCPeriod,S:this.formatUTCSeconds,Y:this.formatUTCFullYear},this.parseShortWeekday=(t,e,i)=>{const s=this.shortWeekdayRe.exec(e.slice(i));return s?(t.w=this.shortWeekdayLookup.get(s[0].toLowerCase()),i+s[0].length):-1},this.parseWeekday=(t,e,i)=>{const s=this.weekdayRe.exec(e.slice(i));return s?(t.w=this.weekdayLookup.get(s[0].toLowerCase()),i+s[0].length):-1},this.parseShortMonth=(t,e,i)=>{const s=this.shortMonthRe.exec(e.slice(i));return s?(t.m=this.shortMonthLookup.get(s[0].toLowerCase()),i+s[0].length):-1},this.parseMonth=(t,e,i)=>{const s=this.monthRe.exec(e.slice(i));return s?(t.m=this.monthLookup.get(s[0].toLowerCase()),i+s[0].length):-1},this.parseDayOfMonth=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+2));return s?(t.d=+s[0],i+s[0].length):-1},this.parseHour24=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+2));return s?(t.H=+s[0],i+s[0].length):-1},this.parseMilliseconds=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+3));return s?(t.L=+s[0],i+s[0].length):-1},this.parseMonthNumber=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+2));return s?(t.m=s-1,i+s[0].length):-1},this.parseMinutes=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+2));return s?(t.M=+s[0],i+s[0].length):-1},this.parsePeriod=(t,e,i)=>{const s=this.periodRe.exec(e.slice(i));return s?(t.p=this.periodLookup.get(s[0].toLowerCase()),i+s[0].length):-1},this.parseSeconds=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+2));return s?(t.S=+s[0],i+s[0].length):-1},this.parseFullYear=(t,e,i)=>{const s=this.numberRe.exec(e.slice(i,i+4));return s?(t.y=+s[0],i+s[0].length):-1},this.parses={a:this.parseShortWeekday,A:this.parseWeekday,b:this.parseShortMonth,B:this.parseMonth,d:this.parseDayOfMonth,e:this.parseDayOfMonth,H:this.parseHour24,I:this.parseHour24,L:this.parseMilliseconds,m:this.parseMonthNumber,M:this.parseMinutes,p:this.parsePeriod,S:this.parseSeconds,Y:this.parseFullYear},this.timeFormat=(t,e)=>this.newFormat(t,this.formats)(new Date(this.getFullTimeStamp(e))),this.timeUTCFormat=(t,e)=>this.newFormat(t,this.utcFormats)(new Date(this.getFullTimeStamp(e))),this.timeParse=(t,e)=>this.newParse(t,!1)(e+""),this.requoteF=this.requote.bind(this),this.periodRe=this.formatRe(this.locale_periods),this.periodLookup=this.formatLookup(this.locale_periods),this.weekdayRe=this.formatRe(this.locale_weekdays),this.weekdayLookup=this.formatLookup(this.locale_weekdays),this.shortWeekdayRe=this.formatRe(this.locale_shortWeekdays),this.shortWeekdayLookup=this.formatLookup(this.locale_shortWeekdays),this.monthRe=this.formatRe(this.locale_months),this.monthLookup=this.formatLookup(this.locale_months),this.shortMonthRe=this.formatRe(this.locale_shortMonths),this.shortMonthLookup=this.formatLookup(this.locale_shortMonths)}requote(t){return t.replace(this.requoteRe,"\\$&")}localDate(t){if(0<=t.y&&t.y<100){const e=new Date(-1,t.m,t.d,t.H,t.M,t.S,t.L);return e.setFullYear(t.y),e}return new Date(t.y,t.m,t.d,t.H,t.M,t.S,t.L)}utcDate(t){if(0<=t.y&&t.y<100){const e=new Date(Date.UTC(-1,t.m,t.d,t.H,t.M,t.S,t.L));return e.setUTCFullYear(t.y),e}return new Date(Date.UTC(t.y,t.m,t.d,t.H,t.M,t.S,t.L))}newDate(t,e,i){return{y:t,m:e,d:i,H:0,M:0,S:0,L:0}}formatRe(t){return new RegExp("^(?:"+t.map(this.requoteF).join("|")+")","i")}formatLookup(t){return new Map(t.map((e,i)=>[e.toLowerCase(),i]))}pad(t,e,i){const s=t<0?"-":"",r=(s?-t:t)+"",a=r.length;return s+(a<i?new Array(i-a+1).join(e)+r:r)}parseSpecifier(t,e,i,s){let r=0;const a=e.length,o=i.length;let l,h;for(;r<a;){if(s>=o)return-1;if(l=e.charCodeAt(r++),l===37){if(l=e.charAt(r++),h=this.parses[l in this.pads?e.charAt(r++):l],!h||(s=h(t,i,s))<0)return-1}else if(l!==i.charCodeAt(s++))return-1}return s}newParse(t,e){const i=this;return function(s){const r=i.newDate(1900,void 0,1);return i.parseSpecifier(r,t,s+="",0)!==s.length?null:"Q"in r?new Date(r.Q):"s"in r?new Date(1e3*r.s+("L"in r?r.L:0)):(e&&!("Z"in r)&&(r.Z=0),"p"in r&&(r.H=r.H%12+12*r.p),r.m===void 0&&(r.m="q"in r?r.q:0),"Z"in r?(r.H+=r.Z/100|0,r.M+=r.Z%100,i.utcDate(r)):i.localDate(r))}}newFormat(t,e){const i=this;return function(s){const r=[];let a=-1,o=0;const l=t.length;let h,u,d;for(s instanceof Date||(s=new Date(+s));++a<l;)t.charCodeAt(a)===37&&(r.push(t.slice(o,a)),(u=i.pads[h=t.charAt(++a)])?h=t.charAt(++a):u=h==="e"?" ":"0",d=e[h],h=d(s,u),r.push(h),o=a+1);return r.push(t.slice(o,a)),r.join("")}}getFullTimeStamp(t){const e=parseInt(t+"",10);return String(e).length===10?1e3*e:e}}function vG(n){return Math.abs(n=Math.round(n))>=1e21?n.toLocaleString("en").replace(/,/g,""):n.toString(10)}function ev(n,t){const e=t?n.toExponential(t-1):n.toExponential(),i=e.indexOf("e");if(i<0)return null;const s=e.slice(0,i);return[s.length>1?s[0]+s.slice(2):s,+e.slice(i+1)]}function yG(n,t){return function(e,i){let s=e.length;const r=[];let a=0,o=n[0],l=0;for(;s>0&&o>0&&(l+o+1>i&&(o=Math.max(1,i-l)),r.push(e.substring(s-=o,s+o)),!((l+=o+1)>i));)o=n[a=(a+1)%n.length];return r.reverse().join(t)}}let IF;function bG(n,t){const e=ev(n,t);if(!e)return n+"";const i=e[0],s=e[1],r=s-(IF=3*Math.max(-8,Math.min(8,Math.floor(s/3))))+1,a=i.length;return r===a?i:r>a?i+new Array(r-a+1).join("0"):r>0?i.slice(0,r)+"."+i.slice(r):"0."+new Array(1-r).join("0")+ev(n,Math.max(0,t+r-1))[0]}function MP(n,t){const e=ev(n,t);if(!e)return n+"";const i=e[0],s=e[1];return s<0?"0."+new Array(-s).join("0")+i:i.length>s+1?i.slice(0,s+1)+"."+i.slice(s+1):i+new Array(s-i.length+2).join("0")}function xG(n){const t=n.length;let e,i=-1;t:for(let s=1;s<t;++s)switch(n[s]){case".":i=e=s;break;case"0":i===0&&(i=s),e=s;break;default:if(!+n[s])break t;i>0&&(i=0)}return i>0?n.slice(0,i)+n.slice(e+1):n}class SG{constructor(t={}){this.fill=t.fill===void 0?" ":t.fill+"",this.align=t.align===void 0?">":t.align+"",this.sign=t.sign===void 0?"-":t.sign+"",this.symbol=t.symbol===void 0?"":t.symbol+"",this.zero=!!t.zero,this.width=t.width===void 0?void 0:+t.width,this.comma=!!t.comma,this.precision=t.precision===void 0?void 0:+t.precision,this.trim=!!t.trim,this.type=t.type===void 0?"":t.type+""}toString(){return this.fill+this.align+this.sign+this.symbol+(this.zero?"0":"")+(this.width===void 0?"":Math.max(1,0|this.width))+(this.comma?",":"")+(this.precision===void 0?"":"."+Math.max(0,0|this.precision))+(this.trim?"~":"")+this.type}}const DF=/^(?:(.)?([<>=^]))?([+\-( ])?([$#])?(0)?(\d+)?(,)?(\.\d+)?(~)?([a-z%])?$/i;function CP(n){let t;if(t=DF.exec(n))return new SG({fill:t[1],align:t[2],sign:t[3],symbol:t[4],zero:t[5],width:t[6],comma:t[7],precision:t[8]&&t[8].slice(1),trim:t[9],type:t[10]});Xt.getInstance().error("invalid format: "+n)}const PP=["y","z","a","f","p","n","µ","m","","k","M","G","T","P","E","Z","Y"];class Hl{constructor(){this.locale={thousands:",",grouping:[3],currency:["$",""]},this.group=this.locale.grouping===void 0||this.locale.thousands===void 0?t=>t:yG([...this.locale.grouping].map(Number),`${this.locale.thousands}`),this.currencyPrefix=this.locale.currency===void 0?"":this.locale.currency[0]+"",this.currencySuffix=this.locale.currency===void 0?"":this.locale.currency[1]+"",this.decimal=this.locale.decimal===void 0?".":this.locale.decimal+"",this.numerals=this.locale.numerals===void 0?t=>t:kG([...this.locale.numerals].map(String)),this.percent=this.locale.percent===void 0?"%":this.locale.percent+"",this.minus=this.locale.minus===void 0?"−":this.locale.minus+"",this.nan=this.locale.nan===void 0?"NaN":this.locale.nan+"",this.formatter=t=>this.newFormat(t),this.format=(t,e)=>this.formatter(t)(e),this.formatPrefix=(t,e)=>this._formatPrefix(t,e)}static getInstance(){return Hl.instance||(Hl.instance=new Hl),Hl.instance}newFormat(t){const e=CP(t);let i=e.fill,s=e.align;const r=e.sign,a=e.symbol;let o=e.zero;const l=e.width;let h=e.comma,u=e.precision,d=e.trim,c=e.type;c==="n"?(h=!0,c="g"):RP[c]||(u===void 0&&(u=12),d=!0,c="g"),(o||i==="0"&&s==="=")&&(o=!0,i="0",s="=");const p=a==="$"?this.currencyPrefix:a==="#"&&/[boxX]/.test(c)?"0"+c.toLowerCase():"",g=a==="$"?this.currencySuffix:/[%p]/.test(c)?this.percent:"",f=RP[c],_=/[defgprstz%]/.test(c);u=u===void 0?6:/[gprs]/.test(c)?Math.max(1,Math.min(21,u)):Math.max(0,Math.min(20,u));const{nan:m,minus:v,decimal:y,group:b,numerals:x}=this;function S(k){let A,w,T,M=p,E=g,R=k;if(c==="c")E=f(R)+E,R="";else{R=+R;let L=R<0||1/R<0;if(R=isNaN(R)?m:f(Math.abs(R),u),d&&(R=xG(R)),L&&+R==0&&r!=="+"&&(L=!1),M=(L?r==="("?r:v:r==="-"||r==="("?"":r)+M,E=(c==="s"?PP[8+IF/3]:"")+E+(L&&r==="("?")":""),_){for(A=-1,w=R.length;++A<w;)if(T=R.charCodeAt(A),48>T||T>57){E=(T===46?y+R.slice(A+1):R.slice(A))+E,R=R.slice(0,A);break}}}h&&!o&&(R=b(R,1/0));let B=M.length+R.length+E.length,C=B<l?new Array(l-B+1).join(i):"";switch(h&&o&&(R=b(C+R,C.length?l-E.length:1/0),C=""),s){case"<":R=M+R+E+C;break;case"=":R=M+C+R+E;break;case"^":R=C.slice(0,B=C.length>>1)+M+R+E+C.slice(B);break;default:R=C+M+R+E}return x(R)}return S.toString=function(){return t+""},S}_formatPrefix(t,e){const i=CP(t);i.type="f";const s=this.newFormat(i.toString()),r=3*Math.max(-8,Math.min(8,Math.floor(AG(e)/3))),a=Math.pow(10,-r),o=PP[8+r/3];return function(l){return s(a*l)+o}}}const RP={"%":(n,t)=>(100*n).toFixed(t),b:n=>Math.round(n).toString(2),c:n=>n+"",d:vG,f:(n,t)=>n.toFixed(t),e:(n,t)=>n.toExponential(t),g:(n,t)=>n.toPrecision(t),o:n=>Math.round(n).toString(8),p:(n,t)=>MP(100*n,t),r:MP,s:bG,X:n=>Math.round(n).toString(16).toUpperCase(),x:n=>Math.round(n).toString(16),t:(n,t)=>Number.isInteger(n)?n.toFixed(2):Math.floor(n*Math.pow(10,t))/Math.pow(10,t)+"",z:(n,t)=>n%1==0?n+"":n.toFixed(t)};function AG(n){const t=ev(Math.abs(n));return t?t[1]:NaN}function kG(n){return function(t){return t.replace(/[0-9]/g,e=>n[+e])}}const wG=(n,t)=>{const{callback:e}=t;return e&&(n=n.filter(e)),n};function Py(){return new iv}function iv(){this.reset()}iv.prototype={constructor:iv,reset:function(){this.s=this.t=0},add:function(n){EP(y_,n,this.t),EP(this,y_.s,this.s),this.s?this.t+=y_.t:this.s=y_.t},valueOf:function(){return this.s}};var y_=new iv;function EP(n,t,e){var i=n.s=t+e,s=i-t,r=i-s;n.t=t-r+(e-s)}var Ut=1e-6,TG=1e-12,Qt=Math.PI,ci=Qt/2,BP=Qt/4,us=Qt*2,hn=180/Qt,Ze=Qt/180,Ae=Math.abs,qd=Math.atan,no=Math.atan2,Zt=Math.cos,FF=Math.exp,nv=Math.log,Rx=Math.pow,Gt=Math.sin,zs=Math.sign||function(n){return n>0?1:n<0?-1:0},qn=Math.sqrt,Gw=Math.tan;function zF(n){return n>1?0:n<-1?Qt:Math.acos(n)}function $s(n){return n>1?ci:n<-1?-ci:Math.asin(n)}function Hs(){}function sv(n,t){n&&LP.hasOwnProperty(n.type)&&LP[n.type](n,t)}var OP={Feature:function(n,t){sv(n.geometry,t)},FeatureCollection:function(n,t){for(var e=n.features,i=-1,s=e.length;++i<s;)sv(e[i].geometry,t)}},LP={Sphere:function(n,t){t.sphere()},Point:function(n,t){n=n.coordinates,t.point(n[0],n[1],n[2])},MultiPoint:function(n,t){for(var e=n.coordinates,i=-1,s=e.length;++i<s;)n=e[i],t.point(n[0],n[1],n[2])},LineString:function(n,t){k1(n.coordinates,t,0)},MultiLineString:function(n,t){for(var e=n.coordinates,i=-1,s=e.length;++i<s;)k1(e[i],t,0)},Polygon:function(n,t){IP(n.coordinates,t)},MultiPolygon:function(n,t){for(var e=n.coordinates,i=-1,s=e.length;++i<s;)IP(e[i],t)},GeometryCollection:function(n,t){for(var e=n.geometries,i=-1,s=e.length;++i<s;)sv(e[i],t)}};function k1(n,t,e){var i=-1,s=n.length-e,r;for(t.lineStart();++i<s;)r=n[i],t.point(r[0],r[1],r[2]);t.lineEnd()}function IP(n,t){var e=-1,i=n.length;for(t.polygonStart();++e<i;)k1(n[e],t,1);t.polygonEnd()}function Qh(n,t){n&&OP.hasOwnProperty(n.type)?OP[n.type](n,t):sv(n,t)}function w1(n){return[no(n[1],n[0]),$s(n[2])]}function Ad(n){var t=n[0],e=n[1],i=Zt(e);return[i*Zt(t),i*Gt(t),Gt(e)]}function b_(n,t){return n[0]*t[0]+n[1]*t[1]+n[2]*t[2]}function rv(n,t){return[n[1]*t[2]-n[2]*t[1],n[2]*t[0]-n[0]*t[2],n[0]*t[1]-n[1]*t[0]]}function Ex(n,t){n[0]+=t[0],n[1]+=t[1],n[2]+=t[2]}function x_(n,t){return[n[0]*t,n[1]*t,n[2]*t]}function T1(n){var t=qn(n[0]*n[0]+n[1]*n[1]+n[2]*n[2]);n[0]/=t,n[1]/=t,n[2]/=t}function M1(n,t){function e(i,s){return i=n(i,s),t(i[0],i[1])}return n.invert&&t.invert&&(e.invert=function(i,s){return i=t.invert(i,s),i&&n.invert(i[0],i[1])}),e}function C1(n,t){return[Ae(n)>Qt?n+Math.round(-n/us)*us:n,t]}C1.invert=C1;function HF(n,t,e){return(n%=us)?t||e?M1(FP(n),zP(t,e)):FP(n):t||e?zP(t,e):C1}function DP(n){return function(t,e){return t+=n,[t>Qt?t-us:t<-Qt?t+us:t,e]}}function FP(n){var t=DP(n);return t.invert=DP(-n),t}function zP(n,t){var e=Zt(n),i=Gt(n),s=Zt(t),r=Gt(t);function a(o,l){var h=Zt(l),u=Zt(o)*h,d=Gt(o)*h,c=Gt(l),p=c*e+u*i;return[no(d*s-p*r,u*e-c*i),$s(p*s+d*r)]}return a.invert=function(o,l){var h=Zt(l),u=Zt(o)*h,d=Gt(o)*h,c=Gt(l),p=c*s-d*r;return[no(d*s+c*r,u*e+p*i),$s(p*e-u*i)]},a}function MG(n){n=HF(n[0]*Ze,n[1]*Ze,n.length>2?n[2]*Ze:0);function t(e){return e=n(e[0]*Ze,e[1]*Ze),e[0]*=hn,e[1]*=hn,e}return t.invert=function(e){return e=n.invert(e[0]*Ze,e[1]*Ze),e[0]*=hn,e[1]*=hn,e},t}function CG(n,t,e,i,s,r){if(e){var a=Zt(t),o=Gt(t),l=i*e;s==null?(s=t+i*us,r=t-l/2):(s=HP(a,s),r=HP(a,r),(i>0?s<r:s>r)&&(s+=i*us));for(var h,u=s;i>0?u>r:u<r;u-=l)h=w1([a,-o*Zt(u),-o*Gt(u)]),n.point(h[0],h[1])}}function HP(n,t){t=Ad(t),t[0]-=n,T1(t);var e=zF(-t[1]);return((-t[2]<0?-e:e)+us-Ut)%us}function jF(){var n=[],t;return{point:function(e,i,s){t.push([e,i,s])},lineStart:function(){n.push(t=[])},lineEnd:Hs,rejoin:function(){n.length>1&&n.push(n.pop().concat(n.shift()))},result:function(){var e=n;return n=[],t=null,e}}}function vm(n,t){return Ae(n[0]-t[0])<Ut&&Ae(n[1]-t[1])<Ut}function S_(n,t,e,i){this.x=n,this.z=t,this.o=e,this.e=i,this.v=!1,this.n=this.p=null}function NF(n,t,e,i,s){var r=[],a=[],o,l;if(n.forEach(function(g){if(!((f=g.length-1)<=0)){var f,_=g[0],m=g[f],v;if(vm(_,m)){if(!_[2]&&!m[2]){for(s.lineStart(),o=0;o<f;++o)s.point((_=g[o])[0],_[1]);s.lineEnd();return}m[0]+=2*Ut}r.push(v=new S_(_,g,null,!0)),a.push(v.o=new S_(_,null,v,!1)),r.push(v=new S_(m,g,null,!1)),a.push(v.o=new S_(m,null,v,!0))}}),!!r.length){for(a.sort(t),jP(r),jP(a),o=0,l=a.length;o<l;++o)a[o].e=e=!e;for(var h=r[0],u,d;;){for(var c=h,p=!0;c.v;)if((c=c.n)===h)return;u=c.z,s.lineStart();do{if(c.v=c.o.v=!0,c.e){if(p)for(o=0,l=u.length;o<l;++o)s.point((d=u[o])[0],d[1]);else i(c.x,c.n.x,1,s);c=c.n}else{if(p)for(u=c.p.z,o=u.length-1;o>=0;--o)s.point((d=u[o])[0],d[1]);else i(c.x,c.p.x,-1,s);c=c.p}c=c.o,u=c.z,p=!p}while(!c.v);s.lineEnd()}}}function jP(n){if(t=n.length){for(var t,e=0,i=n[0],s;++e<t;)i.n=s=n[e],s.p=i,i=s;i.n=s=n[0],s.p=i}}var Bx=Py();function Ox(n){return Ae(n[0])<=Qt?n[0]:zs(n[0])*((Ae(n[0])+Qt)%us-Qt)}function PG(n,t){var e=Ox(t),i=t[1],s=Gt(i),r=[Gt(e),-Zt(e),0],a=0,o=0;Bx.reset(),s===1?i=ci+Ut:s===-1&&(i=-ci-Ut);for(var l=0,h=n.length;l<h;++l)if(d=(u=n[l]).length)for(var u,d,c=u[d-1],p=Ox(c),g=c[1]/2+BP,f=Gt(g),_=Zt(g),m=0;m<d;++m,p=y,f=x,_=S,c=v){var v=u[m],y=Ox(v),b=v[1]/2+BP,x=Gt(b),S=Zt(b),k=y-p,A=k>=0?1:-1,w=A*k,T=w>Qt,M=f*x;if(Bx.add(no(M*A*Gt(w),_*S+M*Zt(w))),a+=T?k+A*us:k,T^p>=e^y>=e){var E=rv(Ad(c),Ad(v));T1(E);var R=rv(r,E);T1(R);var B=(T^k>=0?-1:1)*$s(R[2]);(i>B||i===B&&(E[0]||E[1]))&&(o+=T^k>=0?1:-1)}}return(a<-Ut||a<Ut&&Bx<-Ut)^o&1}function VF(n,t){return n<t?-1:n>t?1:n>=t?0:NaN}function RG(n){return n.length===1&&(n=EG(n)),{left:function(t,e,i,s){for(i==null&&(i=0),s==null&&(s=t.length);i<s;){var r=i+s>>>1;n(t[r],e)<0?i=r+1:s=r}return i},right:function(t,e,i,s){for(i==null&&(i=0),s==null&&(s=t.length);i<s;){var r=i+s>>>1;n(t[r],e)>0?s=r:i=r+1}return i}}}function EG(n){return function(t,e){return VF(n(t),e)}}RG(VF);function WF(n){for(var t=n.length,e,i=-1,s=0,r,a;++i<t;)s+=n[i].length;for(r=new Array(s);--t>=0;)for(a=n[t],e=a.length;--e>=0;)r[--s]=a[e];return r}function UF(n,t,e,i){return function(s){var r=t(s),a=jF(),o=t(a),l=!1,h,u,d,c={point:p,lineStart:f,lineEnd:_,polygonStart:function(){c.point=m,c.lineStart=v,c.lineEnd=y,u=[],h=[]},polygonEnd:function(){c.point=p,c.lineStart=f,c.lineEnd=_,u=WF(u);var b=PG(h,i);u.length?(l||(s.polygonStart(),l=!0),NF(u,OG,b,e,s)):b&&(l||(s.polygonStart(),l=!0),s.lineStart(),e(null,null,1,s),s.lineEnd()),l&&(s.polygonEnd(),l=!1),u=h=null},sphere:function(){s.polygonStart(),s.lineStart(),e(null,null,1,s),s.lineEnd(),s.polygonEnd()}};function p(b,x){n(b,x)&&s.point(b,x)}function g(b,x){r.point(b,x)}function f(){c.point=g,r.lineStart()}function _(){c.point=p,r.lineEnd()}function m(b,x){d.push([b,x]),o.point(b,x)}function v(){o.lineStart(),d=[]}function y(){m(d[0][0],d[0][1]),o.lineEnd();var b=o.clean(),x=a.result(),S,k=x.length,A,w,T;if(d.pop(),h.push(d),d=null,!!k){if(b&1){if(w=x[0],(A=w.length-1)>0){for(l||(s.polygonStart(),l=!0),s.lineStart(),S=0;S<A;++S)s.point((T=w[S])[0],T[1]);s.lineEnd()}return}k>1&&b&2&&x.push(x.pop().concat(x.shift())),u.push(x.filter(BG))}}return c}}function BG(n){return n.length>1}function OG(n,t){return((n=n.x)[0]<0?n[1]-ci-Ut:ci-n[1])-((t=t.x)[0]<0?t[1]-ci-Ut:ci-t[1])}const NP=UF(function(){return!0},LG,DG,[-Qt,-ci]);function LG(n){var t=NaN,e=NaN,i=NaN,s;return{lineStart:function(){n.lineStart(),s=1},point:function(r,a){var o=r>0?Qt:-Qt,l=Ae(r-t);Ae(l-Qt)<Ut?(n.point(t,e=(e+a)/2>0?ci:-ci),n.point(i,e),n.lineEnd(),n.lineStart(),n.point(o,e),n.point(r,e),s=0):i!==o&&l>=Qt&&(Ae(t-i)<Ut&&(t-=i*Ut),Ae(r-o)<Ut&&(r-=o*Ut),e=IG(t,e,r,a),n.point(i,e),n.lineEnd(),n.lineStart(),n.point(o,e),s=0),n.point(t=r,e=a),i=o},lineEnd:function(){n.lineEnd(),t=e=NaN},clean:function(){return 2-s}}}function IG(n,t,e,i){var s,r,a=Gt(n-e);return Ae(a)>Ut?qd((Gt(t)*(r=Zt(i))*Gt(e)-Gt(i)*(s=Zt(t))*Gt(n))/(s*r*a)):(t+i)/2}function DG(n,t,e,i){var s;if(n==null)s=e*ci,i.point(-Qt,s),i.point(0,s),i.point(Qt,s),i.point(Qt,0),i.point(Qt,-s),i.point(0,-s),i.point(-Qt,-s),i.point(-Qt,0),i.point(-Qt,s);else if(Ae(n[0]-t[0])>Ut){var r=n[0]<t[0]?Qt:-Qt;s=e*r/2,i.point(-r,s),i.point(0,s),i.point(r,s)}else i.point(t[0],t[1])}function FG(n){var t=Zt(n),e=6*Ze,i=t>0,s=Ae(t)>Ut;function r(u,d,c,p){CG(p,n,e,c,u,d)}function a(u,d){return Zt(u)*Zt(d)>t}function o(u){var d,c,p,g,f;return{lineStart:function(){g=p=!1,f=1},point:function(_,m){var v=[_,m],y,b=a(_,m),x=i?b?0:h(_,m):b?h(_+(_<0?Qt:-Qt),m):0;if(!d&&(g=p=b)&&u.lineStart(),b!==p&&(y=l(d,v),(!y||vm(d,y)||vm(v,y))&&(v[2]=1)),b!==p)f=0,b?(u.lineStart(),y=l(v,d),u.point(y[0],y[1])):(y=l(d,v),u.point(y[0],y[1],2),u.lineEnd()),d=y;else if(s&&d&&i^b){var S;!(x&c)&&(S=l(v,d,!0))&&(f=0,i?(u.lineStart(),u.point(S[0][0],S[0][1]),u.point(S[1][0],S[1][1]),u.lineEnd()):(u.point(S[1][0],S[1][1]),u.lineEnd(),u.lineStart(),u.point(S[0][0],S[0][1],3)))}b&&(!d||!vm(d,v))&&u.point(v[0],v[1]),d=v,p=b,c=x},lineEnd:function(){p&&u.lineEnd(),d=null},clean:function(){return f|(g&&p)<<1}}}function l(u,d,c){var p=Ad(u),g=Ad(d),f=[1,0,0],_=rv(p,g),m=b_(_,_),v=_[0],y=m-v*v;if(!y)return!c&&u;var b=t*m/y,x=-t*v/y,S=rv(f,_),k=x_(f,b),A=x_(_,x);Ex(k,A);var w=S,T=b_(k,w),M=b_(w,w),E=T*T-M*(b_(k,k)-1);if(!(E<0)){var R=qn(E),B=x_(w,(-T-R)/M);if(Ex(B,k),B=w1(B),!c)return B;var C=u[0],L=d[0],F=u[1],D=d[1],z;L<C&&(z=C,C=L,L=z);var H=L-C,j=Ae(H-Qt)<Ut,K=j||H<Ut;if(!j&&D<F&&(z=F,F=D,D=z),K?j?F+D>0^B[1]<(Ae(B[0]-C)<Ut?F:D):F<=B[1]&&B[1]<=D:H>Qt^(C<=B[0]&&B[0]<=L)){var Y=x_(w,(-T+R)/M);return Ex(Y,k),[B,w1(Y)]}}}function h(u,d){var c=i?n:Qt-n,p=0;return u<-c?p|=1:u>c&&(p|=2),d<-c?p|=4:d>c&&(p|=8),p}return UF(a,o,r,i?[0,-n]:[-Qt,n-Qt])}function zG(n,t,e,i,s,r){var a=n[0],o=n[1],l=t[0],h=t[1],u=0,d=1,c=l-a,p=h-o,g;if(g=e-a,!(!c&&g>0)){if(g/=c,c<0){if(g<u)return;g<d&&(d=g)}else if(c>0){if(g>d)return;g>u&&(u=g)}if(g=s-a,!(!c&&g<0)){if(g/=c,c<0){if(g>d)return;g>u&&(u=g)}else if(c>0){if(g<u)return;g<d&&(d=g)}if(g=i-o,!(!p&&g>0)){if(g/=p,p<0){if(g<u)return;g<d&&(d=g)}else if(p>0){if(g>d)return;g>u&&(u=g)}if(g=r-o,!(!p&&g<0)){if(g/=p,p<0){if(g>d)return;g>u&&(u=g)}else if(p>0){if(g<u)return;g<d&&(d=g)}return u>0&&(n[0]=a+u*c,n[1]=o+u*p),d<1&&(t[0]=a+d*c,t[1]=o+d*p),!0}}}}}var Hc=1e9,A_=-Hc;function GF(n,t,e,i){function s(h,u){return n<=h&&h<=e&&t<=u&&u<=i}function r(h,u,d,c){var p=0,g=0;if(h==null||(p=a(h,d))!==(g=a(u,d))||l(h,u)<0^d>0)do c.point(p===0||p===3?n:e,p>1?i:t);while((p=(p+d+4)%4)!==g);else c.point(u[0],u[1])}function a(h,u){return Ae(h[0]-n)<Ut?u>0?0:3:Ae(h[0]-e)<Ut?u>0?2:1:Ae(h[1]-t)<Ut?u>0?1:0:u>0?3:2}function o(h,u){return l(h.x,u.x)}function l(h,u){var d=a(h,1),c=a(u,1);return d!==c?d-c:d===0?u[1]-h[1]:d===1?h[0]-u[0]:d===2?h[1]-u[1]:u[0]-h[0]}return function(h){var u=h,d=jF(),c,p,g,f,_,m,v,y,b,x,S,k={point:A,lineStart:E,lineEnd:R,polygonStart:T,polygonEnd:M};function A(C,L){s(C,L)&&u.point(C,L)}function w(){for(var C=0,L=0,F=p.length;L<F;++L)for(var D=p[L],z=1,H=D.length,j=D[0],K,Y,$=j[0],X=j[1];z<H;++z)K=$,Y=X,j=D[z],$=j[0],X=j[1],Y<=i?X>i&&($-K)*(i-Y)>(X-Y)*(n-K)&&++C:X<=i&&($-K)*(i-Y)<(X-Y)*(n-K)&&--C;return C}function T(){u=d,c=[],p=[],S=!0}function M(){var C=w(),L=S&&C,F=(c=WF(c)).length;(L||F)&&(h.polygonStart(),L&&(h.lineStart(),r(null,null,1,h),h.lineEnd()),F&&NF(c,o,C,r,h),h.polygonEnd()),u=h,c=p=g=null}function E(){k.point=B,p&&p.push(g=[]),x=!0,b=!1,v=y=NaN}function R(){c&&(B(f,_),m&&b&&d.rejoin(),c.push(d.result())),k.point=A,b&&u.lineEnd()}function B(C,L){var F=s(C,L);if(p&&g.push([C,L]),x)f=C,_=L,m=F,x=!1,F&&(u.lineStart(),u.point(C,L));else if(F&&b)u.point(C,L);else{var D=[v=Math.max(A_,Math.min(Hc,v)),y=Math.max(A_,Math.min(Hc,y))],z=[C=Math.max(A_,Math.min(Hc,C)),L=Math.max(A_,Math.min(Hc,L))];zG(D,z,n,t,e,i)?(b||(u.lineStart(),u.point(D[0],D[1])),u.point(z[0],z[1]),F||u.lineEnd(),S=!1):F&&(u.lineStart(),u.point(C,L),S=!1)}v=C,y=L,b=F}return k}}function xg(n){return n}var Lx=Py(),P1=Py(),$F,YF,R1,E1,Oa={point:Hs,lineStart:Hs,lineEnd:Hs,polygonStart:function(){Oa.lineStart=HG,Oa.lineEnd=NG},polygonEnd:function(){Oa.lineStart=Oa.lineEnd=Oa.point=Hs,Lx.add(Ae(P1)),P1.reset()},result:function(){var n=Lx/2;return Lx.reset(),n}};function HG(){Oa.point=jG}function jG(n,t){Oa.point=XF,$F=R1=n,YF=E1=t}function XF(n,t){P1.add(E1*n-R1*t),R1=n,E1=t}function NG(){XF($F,YF)}var kd=1/0,av=kd,Sg=-kd,ov=Sg,lv={point:VG,lineStart:Hs,lineEnd:Hs,polygonStart:Hs,polygonEnd:Hs,result:function(){var n=[[kd,av],[Sg,ov]];return Sg=ov=-(av=kd=1/0),n}};function VG(n,t){n<kd&&(kd=n),n>Sg&&(Sg=n),t<av&&(av=t),t>ov&&(ov=t)}var B1=0,O1=0,jc=0,hv=0,uv=0,vu=0,L1=0,I1=0,Nc=0,KF,qF,Gr,$r,Is={point:ph,lineStart:VP,lineEnd:WP,polygonStart:function(){Is.lineStart=GG,Is.lineEnd=$G},polygonEnd:function(){Is.point=ph,Is.lineStart=VP,Is.lineEnd=WP},result:function(){var n=Nc?[L1/Nc,I1/Nc]:vu?[hv/vu,uv/vu]:jc?[B1/jc,O1/jc]:[NaN,NaN];return B1=O1=jc=hv=uv=vu=L1=I1=Nc=0,n}};function ph(n,t){B1+=n,O1+=t,++jc}function VP(){Is.point=WG}function WG(n,t){Is.point=UG,ph(Gr=n,$r=t)}function UG(n,t){var e=n-Gr,i=t-$r,s=qn(e*e+i*i);hv+=s*(Gr+n)/2,uv+=s*($r+t)/2,vu+=s,ph(Gr=n,$r=t)}function WP(){Is.point=ph}function GG(){Is.point=YG}function $G(){ZF(KF,qF)}function YG(n,t){Is.point=ZF,ph(KF=Gr=n,qF=$r=t)}function ZF(n,t){var e=n-Gr,i=t-$r,s=qn(e*e+i*i);hv+=s*(Gr+n)/2,uv+=s*($r+t)/2,vu+=s,s=$r*n-Gr*t,L1+=s*(Gr+n),I1+=s*($r+t),Nc+=s*3,ph(Gr=n,$r=t)}function QF(n){this._context=n}QF.prototype={_radius:4.5,pointRadius:function(n){return this._radius=n,this},polygonStart:function(){this._line=0},polygonEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){this._line===0&&this._context.closePath(),this._point=NaN},point:function(n,t){switch(this._point){case 0:{this._context.moveTo(n,t),this._point=1;break}case 1:{this._context.lineTo(n,t);break}default:{this._context.moveTo(n+this._radius,t),this._context.arc(n,t,this._radius,0,us);break}}},result:Hs};var D1=Py(),Ix,JF,tz,Vc,Wc,Ag={point:Hs,lineStart:function(){Ag.point=XG},lineEnd:function(){Ix&&ez(JF,tz),Ag.point=Hs},polygonStart:function(){Ix=!0},polygonEnd:function(){Ix=null},result:function(){var n=+D1;return D1.reset(),n}};function XG(n,t){Ag.point=ez,JF=Vc=n,tz=Wc=t}function ez(n,t){Vc-=n,Wc-=t,D1.add(qn(Vc*Vc+Wc*Wc)),Vc=n,Wc=t}function iz(){this._string=[]}iz.prototype={_radius:4.5,_circle:UP(4.5),pointRadius:function(n){return(n=+n)!==this._radius&&(this._radius=n,this._circle=null),this},polygonStart:function(){this._line=0},polygonEnd:function(){this._line=NaN},lineStart:function(){this._point=0},lineEnd:function(){this._line===0&&this._string.push("Z"),this._point=NaN},point:function(n,t){switch(this._point){case 0:{this._string.push("M",n,",",t),this._point=1;break}case 1:{this._string.push("L",n,",",t);break}default:{this._circle==null&&(this._circle=UP(this._radius)),this._string.push("M",n,",",t,this._circle);break}}},result:function(){if(this._string.length){var n=this._string.join("");return this._string=[],n}else return null}};function UP(n){return"m0,"+n+"a"+n+","+n+" 0 1,1 0,"+-2*n+"a"+n+","+n+" 0 1,1 0,"+2*n+"z"}function $w(n,t){var e=4.5,i,s;function r(a){return a&&(typeof e=="function"&&s.pointRadius(+e.apply(this,arguments)),Qh(a,i(s))),s.result()}return r.area=function(a){return Qh(a,i(Oa)),Oa.result()},r.measure=function(a){return Qh(a,i(Ag)),Ag.result()},r.bounds=function(a){return Qh(a,i(lv)),lv.result()},r.centroid=function(a){return Qh(a,i(Is)),Is.result()},r.projection=function(a){return arguments.length?(i=a==null?(n=null,xg):(n=a).stream,r):n},r.context=function(a){return arguments.length?(s=a==null?(t=null,new iz):new QF(t=a),typeof e!="function"&&s.pointRadius(e),r):t},r.pointRadius=function(a){return arguments.length?(e=typeof a=="function"?a:(s.pointRadius(+a),+a),r):e},r.projection(n).context(t)}function Ry(n){return function(t){var e=new F1;for(var i in n)e[i]=n[i];return e.stream=t,e}}function F1(){}F1.prototype={constructor:F1,point:function(n,t){this.stream.point(n,t)},sphere:function(){this.stream.sphere()},lineStart:function(){this.stream.lineStart()},lineEnd:function(){this.stream.lineEnd()},polygonStart:function(){this.stream.polygonStart()},polygonEnd:function(){this.stream.polygonEnd()}};function Yw(n,t,e){var i=n.clipExtent&&n.clipExtent();return n.scale(150).translate([0,0]),i!=null&&n.clipExtent(null),Qh(e,n.stream(lv)),t(lv.result()),i!=null&&n.clipExtent(i),n}function Ey(n,t,e){return Yw(n,function(i){var s=t[1][0]-t[0][0],r=t[1][1]-t[0][1],a=Math.min(s/(i[1][0]-i[0][0]),r/(i[1][1]-i[0][1])),o=+t[0][0]+(s-a*(i[1][0]+i[0][0]))/2,l=+t[0][1]+(r-a*(i[1][1]+i[0][1]))/2;n.scale(150*a).translate([o,l])},e)}function Xw(n,t,e){return Ey(n,[[0,0],t],e)}function Kw(n,t,e){return Yw(n,function(i){var s=+t,r=s/(i[1][0]-i[0][0]),a=(s-r*(i[1][0]+i[0][0]))/2,o=-r*i[0][1];n.scale(150*r).translate([a,o])},e)}function qw(n,t,e){return Yw(n,function(i){var s=+t,r=s/(i[1][1]-i[0][1]),a=-r*i[0][0],o=(s-r*(i[1][1]+i[0][1]))/2;n.scale(150*r).translate([a,o])},e)}var GP=16,KG=Zt(30*Ze);function $P(n,t){return+t?ZG(n,t):qG(n)}function qG(n){return Ry({point:function(t,e){t=n(t,e),this.stream.point(t[0],t[1])}})}function ZG(n,t){function e(i,s,r,a,o,l,h,u,d,c,p,g,f,_){var m=h-i,v=u-s,y=m*m+v*v;if(y>4*t&&f--){var b=a+c,x=o+p,S=l+g,k=qn(b*b+x*x+S*S),A=$s(S/=k),w=Ae(Ae(S)-1)<Ut||Ae(r-d)<Ut?(r+d)/2:no(x,b),T=n(w,A),M=T[0],E=T[1],R=M-i,B=E-s,C=v*R-m*B;(C*C/y>t||Ae((m*R+v*B)/y-.5)>.3||a*c+o*p+l*g<KG)&&(e(i,s,r,a,o,l,M,E,w,b/=k,x/=k,S,f,_),_.point(M,E),e(M,E,w,b,x,S,h,u,d,c,p,g,f,_))}}return function(i){var s,r,a,o,l,h,u,d,c,p,g,f,_={point:m,lineStart:v,lineEnd:b,polygonStart:function(){i.polygonStart(),_.lineStart=x},polygonEnd:function(){i.polygonEnd(),_.lineStart=v}};function m(A,w){A=n(A,w),i.point(A[0],A[1])}function v(){d=NaN,_.point=y,i.lineStart()}function y(A,w){var T=Ad([A,w]),M=n(A,w);e(d,c,u,p,g,f,d=M[0],c=M[1],u=A,p=T[0],g=T[1],f=T[2],GP,i),i.point(d,c)}function b(){_.point=m,i.lineEnd()}function x(){v(),_.point=S,_.lineEnd=k}function S(A,w){y(s=A,w),r=d,a=c,o=p,l=g,h=f,_.point=y}function k(){e(d,c,u,p,g,f,r,a,s,o,l,h,GP,i),_.lineEnd=b,b()}return _}}var QG=Ry({point:function(n,t){this.stream.point(n*Ze,t*Ze)}});function JG(n){return Ry({point:function(t,e){var i=n(t,e);return this.stream.point(i[0],i[1])}})}function t$(n,t,e,i,s){function r(a,o){return a*=i,o*=s,[t+n*a,e-n*o]}return r.invert=function(a,o){return[(a-t)/n*i,(e-o)/n*s]},r}function YP(n,t,e,i,s,r){var a=Zt(r),o=Gt(r),l=a*n,h=o*n,u=a/n,d=o/n,c=(o*e-a*t)/n,p=(o*t+a*e)/n;function g(f,_){return f*=i,_*=s,[l*f-h*_+t,e-h*f-l*_]}return g.invert=function(f,_){return[i*(u*f-d*_+c),s*(p-d*f-u*_)]},g}function uo(n){return nz(function(){return n})()}function nz(n){var t,e=150,i=480,s=250,r=0,a=0,o=0,l=0,h=0,u,d=0,c=1,p=1,g=null,f=NP,_=null,m,v,y,b=xg,x=.5,S,k,A,w,T;function M(C){return A(C[0]*Ze,C[1]*Ze)}function E(C){return C=A.invert(C[0],C[1]),C&&[C[0]*hn,C[1]*hn]}M.stream=function(C){return w&&T===C?w:w=QG(JG(u)(f(S(b(T=C)))))},M.preclip=function(C){return arguments.length?(f=C,g=void 0,B()):f},M.postclip=function(C){return arguments.length?(b=C,_=m=v=y=null,B()):b},M.clipAngle=function(C){return arguments.length?(f=+C?FG(g=C*Ze):(g=null,NP),B()):g*hn},M.clipExtent=function(C){return arguments.length?(b=C==null?(_=m=v=y=null,xg):GF(_=+C[0][0],m=+C[0][1],v=+C[1][0],y=+C[1][1]),B()):_==null?null:[[_,m],[v,y]]},M.scale=function(C){return arguments.length?(e=+C,R()):e},M.translate=function(C){return arguments.length?(i=+C[0],s=+C[1],R()):[i,s]},M.center=function(C){return arguments.length?(r=C[0]%360*Ze,a=C[1]%360*Ze,R()):[r*hn,a*hn]},M.rotate=function(C){return arguments.length?(o=C[0]%360*Ze,l=C[1]%360*Ze,h=C.length>2?C[2]%360*Ze:0,R()):[o*hn,l*hn,h*hn]},M.angle=function(C){return arguments.length?(d=C%360*Ze,R()):d*hn},M.reflectX=function(C){return arguments.length?(c=C?-1:1,R()):c<0},M.reflectY=function(C){return arguments.length?(p=C?-1:1,R()):p<0},M.precision=function(C){return arguments.length?(S=$P(k,x=C*C),B()):qn(x)},M.fitExtent=function(C,L){return Ey(M,C,L)},M.fitSize=function(C,L){return Xw(M,C,L)},M.fitWidth=function(C,L){return Kw(M,C,L)},M.fitHeight=function(C,L){return qw(M,C,L)};function R(){var C=YP(e,0,0,c,p,d).apply(null,t(r,a)),L=(d?YP:t$)(e,i-C[0],s-C[1],c,p,d);return u=HF(o,l,h),k=M1(t,L),A=M1(u,k),S=$P(k,x),B()}function B(){return w=T=null,M}return function(){return t=n.apply(this,arguments),M.invert=t.invert&&E,R()}}function Zw(n){var t=0,e=Qt/3,i=nz(n),s=i(t,e);return s.parallels=function(r){return arguments.length?i(t=r[0]*Ze,e=r[1]*Ze):[t*hn,e*hn]},s}function e$(n){var t=Zt(n);function e(i,s){return[i*t,Gt(s)/t]}return e.invert=function(i,s){return[i/t,$s(s*t)]},e}function i$(n,t){var e=Gt(n),i=(e+Gt(t))/2;if(Ae(i)<Ut)return e$(n);var s=1+e*(2*i-e),r=qn(s)/i;function a(o,l){var h=qn(s-2*i*Gt(l))/i;return[h*Gt(o*=i),r-h*Zt(o)]}return a.invert=function(o,l){var h=r-l,u=no(o,Ae(h))*zs(h);return h*i<0&&(u-=Qt*zs(o)*zs(h)),[u/i,$s((s-(o*o+h*h)*i*i)/(2*i))]},a}function dv(){return Zw(i$).scale(155.424).center([0,33.6442])}function sz(){return dv().parallels([29.5,45.5]).scale(1070).translate([480,250]).rotate([96,0]).center([-.6,38.7])}function n$(n){var t=n.length;return{point:function(e,i){for(var s=-1;++s<t;)n[s].point(e,i)},sphere:function(){for(var e=-1;++e<t;)n[e].sphere()},lineStart:function(){for(var e=-1;++e<t;)n[e].lineStart()},lineEnd:function(){for(var e=-1;++e<t;)n[e].lineEnd()},polygonStart:function(){for(var e=-1;++e<t;)n[e].polygonStart()},polygonEnd:function(){for(var e=-1;++e<t;)n[e].polygonEnd()}}}function s$(){var n,t,e=sz(),i,s=dv().rotate([154,0]).center([-2,58.5]).parallels([55,65]),r,a=dv().rotate([157,0]).center([-3,19.9]).parallels([8,18]),o,l,h={point:function(c,p){l=[c,p]}};function u(c){var p=c[0],g=c[1];return l=null,i.point(p,g),l||(r.point(p,g),l)||(o.point(p,g),l)}u.invert=function(c){var p=e.scale(),g=e.translate(),f=(c[0]-g[0])/p,_=(c[1]-g[1])/p;return(_>=.12&&_<.234&&f>=-.425&&f<-.214?s:_>=.166&&_<.234&&f>=-.214&&f<-.115?a:e).invert(c)},u.stream=function(c){return n&&t===c?n:n=n$([e.stream(t=c),s.stream(c),a.stream(c)])},u.precision=function(c){return arguments.length?(e.precision(c),s.precision(c),a.precision(c),d()):e.precision()},u.scale=function(c){return arguments.length?(e.scale(c),s.scale(c*.35),a.scale(c),u.translate(e.translate())):e.scale()},u.translate=function(c){if(!arguments.length)return e.translate();var p=e.scale(),g=+c[0],f=+c[1];return i=e.translate(c).clipExtent([[g-.455*p,f-.238*p],[g+.455*p,f+.238*p]]).stream(h),r=s.translate([g-.307*p,f+.201*p]).clipExtent([[g-.425*p+Ut,f+.12*p+Ut],[g-.214*p-Ut,f+.234*p-Ut]]).stream(h),o=a.translate([g-.205*p,f+.212*p]).clipExtent([[g-.214*p+Ut,f+.166*p+Ut],[g-.115*p-Ut,f+.234*p-Ut]]).stream(h),d()},u.fitExtent=function(c,p){return Ey(u,c,p)},u.fitSize=function(c,p){return Xw(u,c,p)},u.fitWidth=function(c,p){return Kw(u,c,p)},u.fitHeight=function(c,p){return qw(u,c,p)};function d(){return n=t=null,u}return u.scale(1070)}function rz(n){return function(t,e){var i=Zt(t),s=Zt(e),r=n(i*s);return[r*s*Gt(t),r*Gt(e)]}}function kf(n){return function(t,e){var i=qn(t*t+e*e),s=n(i),r=Gt(s),a=Zt(s);return[no(t*r,i*a),$s(i&&e*r/i)]}}var az=rz(function(n){return qn(2/(1+n))});az.invert=kf(function(n){return 2*$s(n/2)});function r$(){return uo(az).scale(124.75).clipAngle(180-.001)}var oz=rz(function(n){return(n=zF(n))&&n/Gt(n)});oz.invert=kf(function(n){return n});function a$(){return uo(oz).scale(79.4188).clipAngle(180-.001)}function By(n,t){return[n,nv(Gw((ci+t)/2))]}By.invert=function(n,t){return[n,2*qd(FF(t))-ci]};function o$(){return lz(By).scale(961/us)}function lz(n){var t=uo(n),e=t.center,i=t.scale,s=t.translate,r=t.clipExtent,a=null,o,l,h;t.scale=function(d){return arguments.length?(i(d),u()):i()},t.translate=function(d){return arguments.length?(s(d),u()):s()},t.center=function(d){return arguments.length?(e(d),u()):e()},t.clipExtent=function(d){return arguments.length?(d==null?a=o=l=h=null:(a=+d[0][0],o=+d[0][1],l=+d[1][0],h=+d[1][1]),u()):a==null?null:[[a,o],[l,h]]};function u(){var d=Qt*i(),c=t(MG(t.rotate()).invert([0,0]));return r(a==null?[[c[0]-d,c[1]-d],[c[0]+d,c[1]+d]]:n===By?[[Math.max(c[0]-d,a),o],[Math.min(c[0]+d,l),h]]:[[a,Math.max(c[1]-d,o)],[l,Math.min(c[1]+d,h)]])}return u()}function k_(n){return Gw((ci+n)/2)}function l$(n,t){var e=Zt(n),i=n===t?Gt(n):nv(e/Zt(t))/nv(k_(t)/k_(n)),s=e*Rx(k_(n),i)/i;if(!i)return By;function r(a,o){s>0?o<-ci+Ut&&(o=-ci+Ut):o>ci-Ut&&(o=ci-Ut);var l=s/Rx(k_(o),i);return[l*Gt(i*a),s-l*Zt(i*a)]}return r.invert=function(a,o){var l=s-o,h=zs(i)*qn(a*a+l*l),u=no(a,Ae(l))*zs(l);return l*i<0&&(u-=Qt*zs(a)*zs(l)),[u/i,2*qd(Rx(s/h,1/i))-ci]},r}function h$(){return Zw(l$).scale(109.5).parallels([30,30])}function cv(n,t){return[n,t]}cv.invert=cv;function u$(){return uo(cv).scale(152.63)}function d$(n,t){var e=Zt(n),i=n===t?Gt(n):(e-Zt(t))/(t-n),s=e/i+n;if(Ae(i)<Ut)return cv;function r(a,o){var l=s-o,h=i*a;return[l*Gt(h),s-l*Zt(h)]}return r.invert=function(a,o){var l=s-o,h=no(a,Ae(l))*zs(l);return l*i<0&&(h-=Qt*zs(a)*zs(l)),[h/i,s-zs(i)*qn(a*a+l*l)]},r}function c$(){return Zw(d$).scale(131.154).center([0,13.9389])}var lp=1.340264,hp=-.081106,up=893e-6,dp=.003796,pv=qn(3)/2,p$=12;function hz(n,t){var e=$s(pv*Gt(t)),i=e*e,s=i*i*i;return[n*Zt(e)/(pv*(lp+3*hp*i+s*(7*up+9*dp*i))),e*(lp+hp*i+s*(up+dp*i))]}hz.invert=function(n,t){for(var e=t,i=e*e,s=i*i*i,r=0,a,o,l;r<p$&&(o=e*(lp+hp*i+s*(up+dp*i))-t,l=lp+3*hp*i+s*(7*up+9*dp*i),e-=a=o/l,i=e*e,s=i*i*i,!(Ae(a)<TG));++r);return[pv*n*(lp+3*hp*i+s*(7*up+9*dp*i))/Zt(e),$s(Gt(e)/pv)]};function g$(){return uo(hz).scale(177.158)}function uz(n,t){var e=Zt(t),i=Zt(n)*e;return[e*Gt(n)/i,Gt(t)/i]}uz.invert=kf(qd);function f$(){return uo(uz).scale(144.049).clipAngle(60)}function _$(){var n=1,t=0,e=0,i=1,s=1,r=0,a,o,l=null,h,u,d,c=1,p=1,g=Ry({point:function(b,x){var S=y([b,x]);this.stream.point(S[0],S[1])}}),f=xg,_,m;function v(){return c=n*i,p=n*s,_=m=null,y}function y(b){var x=b[0]*c,S=b[1]*p;if(r){var k=S*a-x*o;x=x*a+S*o,S=k}return[x+t,S+e]}return y.invert=function(b){var x=b[0]-t,S=b[1]-e;if(r){var k=S*a+x*o;x=x*a-S*o,S=k}return[x/c,S/p]},y.stream=function(b){return _&&m===b?_:_=g(f(m=b))},y.postclip=function(b){return arguments.length?(f=b,l=h=u=d=null,v()):f},y.clipExtent=function(b){return arguments.length?(f=b==null?(l=h=u=d=null,xg):GF(l=+b[0][0],h=+b[0][1],u=+b[1][0],d=+b[1][1]),v()):l==null?null:[[l,h],[u,d]]},y.scale=function(b){return arguments.length?(n=+b,v()):n},y.translate=function(b){return arguments.length?(t=+b[0],e=+b[1],v()):[t,e]},y.angle=function(b){return arguments.length?(r=b%360*Ze,o=Gt(r),a=Zt(r),v()):r*hn},y.reflectX=function(b){return arguments.length?(i=b?-1:1,v()):i<0},y.reflectY=function(b){return arguments.length?(s=b?-1:1,v()):s<0},y.fitExtent=function(b,x){return Ey(y,b,x)},y.fitSize=function(b,x){return Xw(y,b,x)},y.fitWidth=function(b,x){return Kw(y,b,x)},y.fitHeight=function(b,x){return qw(y,b,x)},y}function dz(n,t){var e=t*t,i=e*e;return[n*(.8707-.131979*e+i*(-.013791+i*(.003971*e-.001529*i))),t*(1.007226+e*(.015085+i*(-.044475+.028874*e-.005916*i)))]}dz.invert=function(n,t){var e=t,i=25,s;do{var r=e*e,a=r*r;e-=s=(e*(1.007226+r*(.015085+a*(-.044475+.028874*r-.005916*a)))-t)/(1.007226+r*(.015085*3+a*(-.044475*7+.028874*9*r-.005916*11*a)))}while(Ae(s)>Ut&&--i>0);return[n/(.8707+(r=e*e)*(-.131979+r*(-.013791+r*r*r*(.003971-.001529*r)))),e]};function m$(){return uo(dz).scale(175.295)}function cz(n,t){return[Zt(t)*Gt(n),Gt(t)]}cz.invert=kf($s);function v$(){return uo(cz).scale(249.5).clipAngle(90+Ut)}function pz(n,t){var e=Zt(t),i=1+Zt(n)*e;return[e*Gt(n)/i,Gt(t)/i]}pz.invert=kf(function(n){return 2*qd(n)});function y$(){return uo(pz).scale(250).clipAngle(142)}function gz(n,t){return[nv(Gw((ci+t)/2)),-n]}gz.invert=function(n,t){return[-t,2*qd(FF(n))-ci]};function b$(){var n=lz(gz),t=n.center,e=n.rotate;return n.center=function(i){return arguments.length?t([-i[1],i[0]]):(i=t(),[i[1],-i[0]])},n.rotate=function(i){return arguments.length?e([i[0],i[1],i.length>2?i[2]+90:90]):(i=e(),[i[0],i[1],i[2]-90])},e([0,0,90]).scale(159.155)}function x$(n){return n}function S$(n){if(n==null)return x$;var t,e,i=n.scale[0],s=n.scale[1],r=n.translate[0],a=n.translate[1];return function(o,l){l||(t=e=0);var h=2,u=o.length,d=new Array(u);for(d[0]=(t+=o[0])*i+r,d[1]=(e+=o[1])*s+a;h<u;)d[h]=o[h],++h;return d}}function A$(n,t){for(var e,i=n.length,s=i-t;s<--i;)e=n[s],n[s++]=n[i],n[i]=e}function k$(n,t){return typeof t=="string"&&(t=n.objects[t]),t.type==="GeometryCollection"?{type:"FeatureCollection",features:t.geometries.map(function(e){return XP(n,e)})}:XP(n,t)}function XP(n,t){var e=t.id,i=t.bbox,s=t.properties==null?{}:t.properties,r=w$(n,t);return e==null&&i==null?{type:"Feature",properties:s,geometry:r}:i==null?{type:"Feature",id:e,properties:s,geometry:r}:{type:"Feature",id:e,bbox:i,properties:s,geometry:r}}function w$(n,t){var e=S$(n.transform),i=n.arcs;function s(u,d){d.length&&d.pop();for(var c=i[u<0?~u:u],p=0,g=c.length;p<g;++p)d.push(e(c[p],p));u<0&&A$(d,g)}function r(u){return e(u)}function a(u){for(var d=[],c=0,p=u.length;c<p;++c)s(u[c],d);return d.length<2&&d.push(d[0]),d}function o(u){for(var d=a(u);d.length<4;)d.push(d[0]);return d}function l(u){return u.map(o)}function h(u){var d=u.type,c;switch(d){case"GeometryCollection":return{type:d,geometries:u.geometries.map(h)};case"Point":c=r(u.coordinates);break;case"MultiPoint":c=u.coordinates.map(r);break;case"LineString":c=a(u.arcs);break;case"MultiLineString":c=u.arcs.map(a);break;case"Polygon":c=l(u.arcs);break;case"MultiPolygon":c=u.arcs.map(l);break;default:return null}return{type:d,coordinates:c}}return h(t)}var fz={exports:{}},Pr=function(n,t){this.p1=n,this.p2=t};Pr.prototype.rise=function(){return this.p2[1]-this.p1[1]};Pr.prototype.run=function(){return this.p2[0]-this.p1[0]};Pr.prototype.slope=function(){return this.rise()/this.run()};Pr.prototype.yIntercept=function(){return this.p1[1]-this.p1[0]*this.slope(this.p1,this.p2)};Pr.prototype.isVertical=function(){return!isFinite(this.slope())};Pr.prototype.isHorizontal=function(){return this.p1[1]==this.p2[1]};Pr.prototype._perpendicularDistanceHorizontal=function(n){return Math.abs(this.p1[1]-n[1])};Pr.prototype._perpendicularDistanceVertical=function(n){return Math.abs(this.p1[0]-n[0])};Pr.prototype._perpendicularDistanceHasSlope=function(n){var t=this.slope(),e=this.yIntercept();return Math.abs(t*n[0]-n[1]+e)/Math.sqrt(Math.pow(t,2)+1)};Pr.prototype.perpendicularDistance=function(n){return this.isVertical()?this._perpendicularDistanceVertical(n):this.isHorizontal()?this._perpendicularDistanceHorizontal(n):this._perpendicularDistanceHasSlope(n)};var T$=Pr,M$=T$,z1=function(n,t){for(var e=0,i=0,s=1;s<=n.length-2;s++){var r=new M$(n[0],n[n.length-1]).perpendicularDistance(n[s]);r>e&&(i=s,e=r)}if(e>t)var a=z1(n.slice(0,i),t),o=z1(n.slice(i,n.length),t),l=a.concat(o);else n.length>1?l=[n[0],n[n.length-1]]:l=[n[0]];return l},C$=z1;(function(n){var t=C$;n.exports=function(s,r,a){return a||(s=JSON.parse(JSON.stringify(s))),s.features?i(s,r):s.type&&s.type==="Feature"?e(s,r):new Error("FeatureCollection or individual Feature required")},n.exports.simplify=function(s,r){return t(s,r)};function e(s,r){var a=s.geometry,o=a.type;if(o==="LineString")a.coordinates=n.exports.simplify(a.coordinates,r);else if(o==="Polygon"||o==="MultiLineString")for(var l=0;l<a.coordinates.length;l++)a.coordinates[l]=n.exports.simplify(a.coordinates[l],r);else if(o==="MultiPolygon")for(var h=0;h<a.coordinates.length;h++)for(var u=0;u<a.coordinates[h].length;u++)a.coordinates[h][u]=n.exports.simplify(a.coordinates[h][u],r);return s}function i(s,r){for(var a=0;a<s.features.length;a++)s.features[a]=e(s.features[a],r);return s}})(fz);var P$=fz.exports;const R$=Uk(P$),Oy=function(n,...t){return B$(gn(n),...t)};function _z(n,t,e){const i=t[e];if(i===void 0)n[e]=null;else if(kt(i)){kt(n[e])||(n[e]={});for(const s in i)_z(n[e],i,s)}else n[e]=i}function E$(n,t){if(kt(t)&&n!==t)for(const e in t)_z(n,t,e)}function B$(n,...t){n||(n={});let e=-1;const i=t.length;for(;++e<i;)E$(n,t[e]);return n}const O$={tolerance:.01},L$=(n,t)=>{const e=Oy(O$,t),{tolerance:i}=e;return R$(n,i)};var gh;(function(n){n.DSV="dsv",n.TREE="tree",n.GEO="geo",n.BYTE="bytejson",n.HEX="hex",n.GRAPH="graph",n.TABLE="table",n.GEO_GRATICULE="geo-graticule"})(gh||(gh={}));const I$=(n,t)=>{const{fields:e,key:i,value:s,retains:r}=t,a=[];for(let o=0;o<n.length;o++)e.forEach(l=>{const h={};if(h[i]=l,h[s]=n[o][l],r)r.forEach(u=>{h[u]=n[o][u]});else for(const u in n[o])e.indexOf(u)===-1&&(h[u]=n[o][u]);a.push(h)});return a},mz=(n,t)=>{var e,i;if(!(t!=null&&t.fields)||n.length===0)return n;const s=t.fields,r=n[0],a={},o=[];for(const l in s)if(Object.prototype.hasOwnProperty.call(s,l)){const h=s[l];if(h.sort&&(U(h.sortIndex)||(h.sortIndex=0),P(h.sortReverse)||(h.sortReverse=h.sort==="desc")),!h.type){let d=r;l in r||(d=(e=n.find(c=>l in c))!==null&&e!==void 0?e:r),h.type=typeof d[l]=="number"?"linear":"ordinal"}let u;if(typeof h.sortIndex=="number"&&(u={key:l,type:h.type,index:h.sortIndex,sortIndex:{},sortIndexCount:0,sortReverse:h.sortReverse===!0},o.push(u)),((i=h.domain)===null||i===void 0?void 0:i.length)>0)if(h.type==="ordinal"){h._domainCache={},a[l]=h;const d={};h.domain.forEach((c,p)=>{d[c]=p,h._domainCache[c]=p}),u&&(u.sortIndex=d,u.sortIndexCount=h.domain.length)}else h.domain.length>=2&&(a[l]=h)}return Object.keys(a).length>0&&(n=n.filter(l=>{for(const h in a){const u=a[h];if(u.type==="ordinal"){if(!(l[h]in u._domainCache))return!1}else if(u.domain[0]>l[h]||u.domain[1]<l[h])return!1}return!0})),o.sort((l,h)=>l.index-h.index),n.sort((l,h)=>D$(l,h,o)),n};function D$(n,t,e){for(let i=0;i<e.length;i++){const s=e[i];let r=0;if(s.type==="ordinal"?(s.sortIndex[t[s.key]]===void 0&&(s.sortIndex[t[s.key]]=s.sortIndexCount++),s.sortIndex[n[s.key]]===void 0&&(s.sortIndex[n[s.key]]=s.sortIndexCount++),r=s.sortIndex[n[s.key]]-s.sortIndex[t[s.key]]):s.type==="linear"&&(r=n[s.key]-t[s.key]),s.sortReverse&&(r=-r),r!==0)return r}return 0}const KP=(n,t)=>{var e,i,s,r;const{numBins:a,thresholds:o,countName:l,percentageName:h,valuesName:u,countField:d,field:c,n:p,x0Name:g,x1Name:f}=t,_=t.groupField,m=Array.isArray(_)?_.length>0:!!_,v=[];if(!m)for(let T=0;T<a;T++){const M={[g]:o[T],[f]:o[T+1],[l]:0};t.includeValues&&(M[u]=[]),v.push(M)}const y=m?new Array(a).fill(0).map(()=>new Map):[],b=m?new Array(a).fill(0).map(()=>new Map):[],x=[],S=new Set,k=new Map;for(let T=0;T<p;T++){const M=n[T][c];if(M==null)continue;const E=+M;if(Number.isFinite(E))for(let R=0;R<a;R++){const B=o[R],C=o[R+1];if(E>=B&&E<C||R===a-1&&E<=C){const L=(e=n[T][d])!==null&&e!==void 0?e:1;if(m){let F;F=V(_)?_.map(H=>String(n[T][H])).join("||"):String(n[T][_]);const D=y[R],z=(i=D.get(F))!==null&&i!==void 0?i:0;if(D.set(F,z+L),S.has(F)||(S.add(F),x.push(F),V(_)?k.set(F,Object.fromEntries(_.map(H=>[H,n[T][H]]))):k.set(F,n[T][_])),t&&t.includeValues){const H=b[R];H.has(F)||H.set(F,[]);const j=H.get(F);j&&j.push(n[T])}}else v[R][l]+=L;t&&t.includeValues&&!m&&v[R][u].push(n[T]);break}}}let A=0;const w=[];if(m){for(let M=0;M<a;M++)for(const E of x){const R=(s=y[M].get(E))!==null&&s!==void 0?s:0,B={[g]:o[M],[f]:o[M+1],[l]:R},C=(r=k.get(E))!==null&&r!==void 0?r:{};if(V(_))for(const L of _)B[L]=C[L];else _&&(B[_]=C);t&&t.includeValues&&(B[u]=b[M].get(E)||[]),w.push(B),A+=R}const T=A;for(const M of w)M[h]=T>0?M[l]/T:0}else{for(let T=0,M=v.length;T<M;T++)A+=v[T][l];for(let T=0,M=v.length;T<M;T++)v[T][h]=A>0?v[T][l]/A:0,w.push(v[T])}return w},F$=(n,t)=>{var e,i,s,r,a,o,l,h,u,d;const c=t==null?void 0:t.field;if(!c)return[];const p=t.countField,g=n.length;let f,_=1/0,m=-1/0;if(t.extent)_=t.extent[0],m=t.extent[1];else for(let R=0;R<g;R++){const B=n[R][c];if(O(B))continue;const C=+B;Number.isFinite(C)&&(C<_&&(_=C),C>m&&(m=C))}if(!Number.isFinite(_)||!Number.isFinite(m)||g===0)return[];if(t.thresholds&&t.thresholds.length)f=t.thresholds.slice(),f.sort((R,B)=>R-B);else if(typeof t.step=="number"&&t.step>0){const R=t.step;let B=_;for(t.extent||(B=Math.floor(_/R)*R),f=[B];B<=m;)B+=R,f.push(B)}else{let R=t.bins&&t.bins>0?Math.floor(t.bins):10;if(m-_>1){const B=Math.floor(_),C=Math.ceil((m-B)/R);f=new Array(R+1);for(let L=0;L<=R;L++)if(f[L]=B+C*L,f[L]>m){R=L,f.length=R+1;break}}else{const B=(m-_)/R;f=new Array(R+1);for(let C=0;C<=R;C++)if(f[C]=_+B*C,f[C]>m){R=C,f.length=R+1;break}}}const v=Math.max(0,f.length-1);if(v===0)return[];const y=(i=(e=t.outputNames)===null||e===void 0?void 0:e.x0)!==null&&i!==void 0?i:"x0",b=(r=(s=t.outputNames)===null||s===void 0?void 0:s.x1)!==null&&r!==void 0?r:"x1",x=(o=(a=t.outputNames)===null||a===void 0?void 0:a.count)!==null&&o!==void 0?o:"count",S=(h=(l=t.outputNames)===null||l===void 0?void 0:l.values)!==null&&h!==void 0?h:"values",k=(d=(u=t.outputNames)===null||u===void 0?void 0:u.percentage)!==null&&d!==void 0?d:"percentage",A=V(t==null?void 0:t.facetField)?t==null?void 0:t.facetField:t!=null&&t.facetField?[t.facetField]:[],w=V(t==null?void 0:t.groupField)?t==null?void 0:t.groupField:t!=null&&t.groupField?[t.groupField]:[],T=w.length?w:void 0,M=Object.assign(Object.assign({},t),{numBins:v,thresholds:f,countName:x,percentageName:k,valuesName:S,countField:p,field:c,n:g,x0Name:y,x1Name:b,groupField:T});if(!A.length)return KP(n,M);const E={};return n.forEach(R=>{const B=A.map(C=>R==null?void 0:R[C]).join("-&&-");E[B]?E[B].push(R):E[B]=[R]}),Object.values(E).map(R=>{const B=[...w,...A];return KP(R,Object.assign(Object.assign({},M),{groupField:B.length?B:void 0,n:R.length}))}).flat()},z$=(n,t)=>{var e,i,s,r,a,o,l,h,u,d,c,p,g,f,_,m;const v=t==null?void 0:t.field;if(!v)return[];const y=t==null?void 0:t.groupField;let b=(e=t==null?void 0:t.whiskers)!==null&&e!==void 0?e:1.5;const x=!!(t!=null&&t.includeValues),S=(i=t==null?void 0:t.outputNames)!==null&&i!==void 0?i:{},k=(s=S.key)!==null&&s!==void 0?s:V(y)?null:(r=y)!==null&&r!==void 0?r:"key",A=(a=S.count)!==null&&a!==void 0?a:"count",w=(o=S.mean)!==null&&o!==void 0?o:"mean",T=(l=S.q1)!==null&&l!==void 0?l:"q1",M=(h=S.median)!==null&&h!==void 0?h:"median",E=(u=S.q3)!==null&&u!==void 0?u:"q3",R=(d=S.iqr)!==null&&d!==void 0?d:"iqr",B=(c=S.min)!==null&&c!==void 0?c:"min",C=(p=S.max)!==null&&p!==void 0?p:"max",L=(g=S.lowerWhisker)!==null&&g!==void 0?g:"lowerWhisker",F=(f=S.upperWhisker)!==null&&f!==void 0?f:"upperWhisker",D=(_=S.outliers)!==null&&_!==void 0?_:"outliers",z=(m=S.values)!==null&&m!==void 0?m:"values",H=new Map,j=new Map,K=new Map,Y=n.length;for(let X=0;X<Y;X++){const tt=n[X],et=tt[v];if(O(et))continue;const ct=+et;if(!Number.isFinite(ct))continue;let ut;ut=V(y)?y.map(mt=>String(tt[mt])).join("||"):y?String(tt[y]):"___all",H.has(ut)||(H.set(ut,[]),x&&j.set(ut,[]),V(y)?K.set(ut,Object.fromEntries(y.map(mt=>[mt,tt[mt]]))):K.set(ut,y?tt[y]:null));const at=H.get(ut);if(at&&at.push(ct),x){const mt=j.get(ut);mt&&mt.push(tt)}}V(b)&&(b=[te(Math.min.apply(null,b),0,1),te(Math.max.apply(null,b),0,1)]);const $=[];for(const[X,tt]of H){if(!tt||tt.length===0)continue;const et=tt.slice().sort((qe,De)=>qe-De),ct=et.length,ut=et[0],at=et[et.length-1];let mt=0;for(let qe=0;qe<et.length;qe++)mt+=et[qe];const wt=mt/ct,Dt=Zh(et,.25),Et=Zh(et,.5),yt=Zh(et,.75),gt=yt-Dt,oe=V(b)?Zh(et,b[0]):Dt-b*gt,ve=V(b)?Zh(et,b[1]):yt+b*gt,ft=[];for(let qe=0;qe<et.length;qe++)(et[qe]<oe||et[qe]>ve)&&ft.push(et[qe]);const Ft={},xe=K.get(X);if(k!==null)Ft[k]=xe;else if(V(y)){const qe=xe||{};for(const De of y)Ft[De]=qe[De]}Ft[A]=ct,Ft[w]=wt,Ft[T]=Dt,Ft[M]=Et,Ft[E]=yt,Ft[R]=gt,Ft[B]=ut,Ft[C]=at,Ft[L]=oe,Ft[F]=ve,Ft[D]=ft,x&&(Ft[z]=j.get(X)||[]),$.push(Ft)}return $};var qP={},Dx={},Fx=34,yc=10,zx=13;function vz(n){return new Function("d","return {"+n.map(function(t,e){return JSON.stringify(t)+": d["+e+'] || ""'}).join(",")+"}")}function H$(n,t){var e=vz(n);return function(i,s){return t(e(i),s,n)}}function ZP(n){var t=Object.create(null),e=[];return n.forEach(function(i){for(var s in i)s in t||e.push(t[s]=s)}),e}function Dn(n,t){var e=n+"",i=e.length;return i<t?new Array(t-i+1).join(0)+e:e}function j$(n){return n<0?"-"+Dn(-n,6):n>9999?"+"+Dn(n,6):Dn(n,4)}function N$(n){var t=n.getUTCHours(),e=n.getUTCMinutes(),i=n.getUTCSeconds(),s=n.getUTCMilliseconds();return isNaN(n)?"Invalid Date":j$(n.getUTCFullYear())+"-"+Dn(n.getUTCMonth()+1,2)+"-"+Dn(n.getUTCDate(),2)+(s?"T"+Dn(t,2)+":"+Dn(e,2)+":"+Dn(i,2)+"."+Dn(s,3)+"Z":i?"T"+Dn(t,2)+":"+Dn(e,2)+":"+Dn(i,2)+"Z":e||t?"T"+Dn(t,2)+":"+Dn(e,2)+"Z":"")}function Qw(n){var t=new RegExp('["'+n+`
 \r]`),e=n.charCodeAt(0);function i(d,c){var p,g,f=s(d,function(_,m){if(p)return p(_,m-1);g=_,p=c?H$(_,c):vz(_)});return f.columns=g||[],f}function s(d,c){var p=[],g=d.length,f=0,_=0,m,v=g<=0,y=!1;d.charCodeAt(g-1)===yc&&--g,d.charCodeAt(g-1)===zx&&--g;function b(){if(v)return Dx;if(y)return y=!1,qP;var S,k=f,A;if(d.charCodeAt(k)===Fx){for(;f++<g&&d.charCodeAt(f)!==Fx||d.charCodeAt(++f)===Fx;);return(S=f)>=g?v=!0:(A=d.charCodeAt(f++))===yc?y=!0:A===zx&&(y=!0,d.charCodeAt(f)===yc&&++f),d.slice(k+1,S-1).replace(/""/g,'"')}for(;f<g;){if((A=d.charCodeAt(S=f++))===yc)y=!0;else if(A===zx)y=!0,d.charCodeAt(f)===yc&&++f;else if(A!==e)continue;return d.slice(k,S)}return v=!0,d.slice(k,g)}for(;(m=b())!==Dx;){for(var x=[];m!==qP&&m!==Dx;)x.push(m),m=b();c&&(x=c(x,_++))==null||p.push(x)}return p}function r(d,c){return d.map(function(p){return c.map(function(g){return u(p[g])}).join(n)})}function a(d,c){return c==null&&(c=ZP(d)),[c.map(u).join(n)].concat(r(d,c)).join(`
 `)}function o(d,c){return c==null&&(c=ZP(d)),r(d,c).join(`
 `)}function l(d){return d.map(h).join(`
@@ -1,11 +1,26 @@
 """
 文本分段工具
 """
-from typing import List
+import hashlib
+import random
+from typing import List, Tuple
 
-def split_text_by_chars(text: str, chunk_size: int = 1000, overlap: int = 100) -> List[str]:
+# 分段模式
+CHUNKING_FIXED = "fixed"
+CHUNKING_CDC = "cdc"
+
+# 内容定义分段（CDC）使用的 gear 表，固定种子保证每次切出相同的边界
+_GEAR_SIZE = 1021
+_gear_rng = random.Random(0x6D796D656D)
+_GEAR = [_gear_rng.getrandbits(32) for _ in range(_GEAR_SIZE)]
+del _gear_rng
+
+# 达到最大长度仍没有边界时，优先回退到的句末字符
+_SENTENCE_ENDS = "\n。！？；.!?;"
+
+def split_text_with_offsets(text: str, chunk_size: int = 1000, overlap: int = 100) -> List[Tuple[int, int, str]]:
     """
-    按字符数分段文本
+    按字符数分段文本，并返回每段在原文中的位置
 
     Args:
         text: 输入文本
@@ -13,10 +28,10 @@ def split_text_by_chars(text: str, chunk_size: int = 1000, overlap: int = 100) -
         overlap: 重叠字符数，避免在句子中间切断（默认100）
 
     Returns:
-        分段后的文本列表
+        (start, end, chunk) 列表，满足 text[start:end] == chunk
     """
     if len(text) <= chunk_size:
-        return [text]
+        return [(0, len(text), text)]
 
     chunks = []
     start = 0
@@ -36,12 +51,102 @@ def split_text_by_chars(text: str, chunk_size: int = 1000, overlap: int = 100) -
                 if period_pos != -1 and period_pos > start + chunk_size // 2:
                     end = period_pos + 1
 
-        chunk = text[start:end].strip()
+        raw = text[start:end]
+        chunk = raw.strip()
         if chunk:
-            chunks.append(chunk)
+            # 去掉首尾空白后修正偏移量
+            chunk_start = start + (len(raw) - len(raw.lstrip()))
+            chunks.append((chunk_start, chunk_start + len(chunk), chunk))
 
         # 下一段的起始位置，考虑重叠
         start = end - overlap if overlap > 0 and end < len(text) else end
 
     return chunks
 
+def split_text_content_defined(text: str, chunk_size: int = 1000) -> List[Tuple[int, int, str]]:
+    """
+    内容定义分段（gear 滚动哈希）
+
+    边界只由附近的文本决定：在文档中间插入或删除文字只会改变附近的一两段，
+    其余段落保持不变，更新时可以复用已有向量。段与段之间不重叠。
+
+    Args:
+        text: 输入文本
+        chunk_size: 每段最大字符数（默认1000），最小长度为其 1/4
+
+    Returns:
+        (start, end, chunk) 列表，满足 text[start:end] == chunk
+    """
+    min_size = max(1, chunk_size // 4)
+    # 越过最小长度后，每个位置成为边界的概率约为 1/2^mask_bits（取哈希高位）
+    mask_bits = max(1, (chunk_size // 2).bit_length() - 1)
+    mask = ((1 << mask_bits) - 1) << (32 - mask_bits)
+
+    chunks = []
+    start = 0
+    length = len(text)
+    while start < length:
+        limit = min(start + chunk_size, length)
+        end = limit
+        if limit - start > min_size:
+            h = 0
+            for i in range(start, limit):
+                h = ((h << 1) + _GEAR[ord(text[i]) % _GEAR_SIZE]) & 0xFFFFFFFF
+                if i + 1 - start >= min_size and not h & mask:
+                    end = i + 1
+                    break
+            else:
+                if limit < length:
+                    # 达到最大长度仍没有边界，回退到最后一个句末字符
+                    for i in range(limit - 1, start + min_size - 1, -1):
+                        if text[i] in _SENTENCE_ENDS:
+                            end = i + 1
+                            break
+
+        raw = text[start:end]
+        chunk = raw.strip()
+        if chunk:
+            # 去掉首尾空白后修正偏移量
+            chunk_start = start + (len(raw) - len(raw.lstrip()))
+            chunks.append((chunk_start, chunk_start + len(chunk), chunk))
+        start = end
+
+    return chunks
+
+def split_text(text: str, mode: str = CHUNKING_FIXED, chunk_size: int = 1000,
+               overlap: int = 100) -> List[Tuple[int, int, str]]:
+    """
+    按指定模式分段文本
+
+    Args:
+        text: 输入文本
+        mode: "fixed"（固定长度 + 重叠）或 "cdc"（内容定义分段）
+        chunk_size: 每段最大字符数
+        overlap: 重叠字符数（仅 fixed 模式）
+
+    Returns:
+        (start, end, chunk) 列表
+    """
+    if mode == CHUNKING_CDC:
+        return split_text_content_defined(text, chunk_size)
+    if mode != CHUNKING_FIXED:
+        raise ValueError(f"未知的分段模式: {mode}")
+    return split_text_with_offsets(text, chunk_size, overlap)
+
+def chunk_hash(chunk: str) -> str:
+    """文本块内容哈希（用作块 ID，更新时据此比对哪些块需要重新向量化）"""
+    return hashlib.sha1(chunk.encode("utf-8")).hexdigest()[:16]
+
+def split_text_by_chars(text: str, chunk_size: int = 1000, overlap: int = 100) -> List[str]:
+    """
+    按字符数分段文本
+
+    Args:
+        text: 输入文本
+        chunk_size: 每段最大字符数（默认1000）
+        overlap: 重叠字符数，避免在句子中间切断（默认100）
+
+    Returns:
+        分段后的文本列表
+    """
+    return [chunk for _, _, chunk in split_text_with_offsets(text, chunk_size, overlap)]
@@ -10,7 +10,7 @@ import SearchBar from './components/SearchBar'
 import SearchResults from './components/SearchResults'
 import SuggestionCard from './components/SuggestionCard'
 import UserProfile from './components/UserProfile'
-import { createMemory, updateMemory, deleteMemory, searchMemories, searchMemoriesSQLite, getAllMemories, getStats } from './api'
+import { createMemory, updateMemory, deleteMemory, searchMemories, searchMemoriesSQLite, getAllMemories, getMemory, getStats, subscribeMemoryEvents } from './api'
 import { generateRandomSuggestions } from './utils/randomSuggestions'
 
 function App() {
@@ -127,6 +127,30 @@ function App() {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [refreshTrigger, currentPage])
 
+  // 订阅变更事件，增量更新已加载的列表（无需重新拉取全部记忆）
+  useEffect(() => {
+    return subscribeMemoryEvents(async (event) => {
+      if (event.op === 'delete') {
+        setMemories(prev => prev.filter(m => m.id !== event.id))
+        return
+      }
+      try {
+        const memory = await getMemory(event.id)
+        setMemories(prev => {
+          if (prev.length === 0) return prev // 列表尚未加载，进入页面时会完整加载
+          const index = prev.findIndex(m => m.id === memory.id)
+          if (index === -1) return [memory, ...prev]
+          const next = [...prev]
+          next[index] = memory
+          return next
+        })
+      } catch (err) {
+        // 记忆可能已被删除，之后的 delete 事件会处理
+        console.error('获取变更的记忆失败:', err)
+      }
+    })
+  }, [])
+
   // 执行搜索
   const handleSearch = async (query, mode = searchMode) => {
     setSearchQuery(query)
@@ -23,7 +23,7 @@ export async function searchMemories(query, limit = 10) {
     const response = await fetch(`${BASE_URL}/search/`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ query, limit })
+      body: JSON.stringify({ query, limit, include_content: true })
     })
     return await handleResponse(response)
   } catch (error) {
@@ -42,7 +42,7 @@ export async function searchMemoriesSQLite(query, limit = 10) {
     const response = await fetch(`${BASE_URL}/search/sqlite`, {
       method: 'POST',
       headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ query, limit })
+      body: JSON.stringify({ query, limit, include_content: true })
     })
     return await handleResponse(response)
   } catch (error) {
@@ -157,3 +157,15 @@ export async function getStats() {
   }
 }
 
+
+/**
+ * 订阅记忆变更事件（SSE），断线后浏览器自动重连并通过 Last-Event-ID 补齐
+ * @param {(event: {seq: number, op: 'create'|'update'|'delete', id: number, timestamp: string}) => void} onEvent
+ * @returns {() => void} 取消订阅
+ */
+export function subscribeMemoryEvents(onEvent) {
+  const source = new EventSource(`${BASE_URL}/events`)
+  const handler = (e) => onEvent(JSON.parse(e.data))
+  ;['create', 'update', 'delete'].forEach((op) => source.addEventListener(op, handler))
+  return () => source.close()
+}
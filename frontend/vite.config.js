@@ -4,6 +4,10 @@ import react from '@vitejs/plugin-react'
 // https://vitejs.dev/config/
 export default defineConfig({
   plugins: [react()],
+  build: {
+    // .vite/manifest.json 列出带内容哈希的产物，后端只对其中的文件使用 immutable 长期缓存
+    manifest: true
+  },
   server: {
     port: 3000,
     proxy: {
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+响应序列化与压缩基准：对 1k / 50k 条的记忆列表和搜索结果，对比
+原来的方式（逐条构建响应模型 + jsonable_encoder + json.dumps）与现在的方式
+（列表由 SQLite 直接生成 JSON；搜索结果由字典经 orjson 序列化），以及各压缩级别的大小和耗时
+
+使用方法：
+python3 scripts/bench_responses.py
+python3 scripts/bench_responses.py --sizes 1000 50000 --repeat 3
+
+不启动服务、不加载模型；列表数据写入临时 SQLite 数据库
+"""
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from fastapi.encoders import jsonable_encoder
+
+from backend.api.models import MemoryResponse, SearchResult, ChunkHit
+from backend.api.responses import dumps, brotli, orjson
+from backend.core.search_engine import SearchHit, ChunkMatch
+from backend.core.sqlite_db import SQLiteDB
+
+WORDS = ("记忆 知识 向量 检索 模型 数据库 缓存 索引 同步 进程 线程 网络 文件 配置 日志 "
+         "部署 测试 性能 内存 磁盘 接口 前端 后端 队列 事务 分段 标签 摘要 上下文 相似").split()
+
+def _text(rng: random.Random, words: int) -> str:
+    return "".join(rng.choice(WORDS) for _ in range(words))
+
+def _best_ms(fn, repeat: int):
+    """返回 (最短耗时 ms, 结果)"""
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = (time.perf_counter() - started) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def _starlette_json(content) -> bytes:
+    """原来的 JSONResponse 序列化方式"""
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+def _make_hits(rng: random.Random, count: int) -> list:
+    from datetime import datetime
+    hits = []
+    for i in range(count):
+        relevance = round(rng.uniform(0.7, 1.0), 6)
+        chunks = [ChunkMatch(j, j * 400, j * 400 + 380, relevance, _text(rng, 60)) for j in range(2)]
+        hits.append(SearchHit(i + 1, _text(rng, 6), None, rng.sample(WORDS, 2), datetime.now(), relevance, chunks))
+    return hits
+
+def bench_list(db: SQLiteDB, repeat: int):
+    def old():
+        models = [MemoryResponse(**memory) for memory in db.get_all_memories()]
+        return _starlette_json(jsonable_encoder(models))
+
+    old_ms, old_body = _best_ms(old, repeat)
+    new_ms, new_body = _best_ms(db.get_all_memories_json, repeat)
+    assert json.loads(old_body) == json.loads(new_body), "列表响应内容不一致"
+    return old_ms, new_ms, new_body
+
+def bench_search(hits: list, repeat: int):
+    # 导入搜索路由会打开数据目录（main 中已指向临时目录）
+    from backend.api.search import _to_search_result
+
+    def old():
+        results = [
+            SearchResult(
+                id=hit.id, title=hit.title, content=None, tags=hit.tags, created_at=hit.created_at,
+                relevance=hit.relevance,
+                chunks=[ChunkHit(chunk_index=c.chunk_index, start=c.start, end=c.end, relevance=c.relevance,
+                                 snippet=c.snippet) for c in hit.chunks]
+            )
+            for hit in hits
+        ]
+        return _starlette_json(jsonable_encoder(results))
+
+    old_ms, old_body = _best_ms(old, repeat)
+    new_ms, new_body = _best_ms(lambda: dumps([_to_search_result(hit, False) for hit in hits]), repeat)
+    assert json.loads(old_body) == json.loads(new_body), "搜索响应内容不一致"
+    return old_ms, new_ms, new_body
+
+def bench_compression(body: bytes, repeat: int) -> list:
+    rows = []
+    for level in (1, 4, 6):
+        ms, compressed = _best_ms(lambda: gzip.compress(body, compresslevel=level, mtime=0), repeat)
+        rows.append((f"gzip-{level}", len(compressed), ms))
+    if brotli is not None:
+        for quality in (1, 4):
+            ms, compressed = _best_ms(lambda: brotli.compress(body, quality=quality), repeat)
+            rows.append((f"br-{quality}", len(compressed), ms))
+    return rows
+
+def _print_result(label: str, old_ms: float, new_ms: float, body: bytes, repeat: int):
+    print(f"\n{label}: {len(body) / 1024 / 1024:.2f} MB")
+    print(f"  序列化  原来 {old_ms:8.1f} ms   现在 {new_ms:8.1f} ms   ({old_ms / new_ms:.1f}x)")
+    for name, size, ms in bench_compression(body, repeat):
+        print(f"  {name:<7} {size / 1024 / 1024:8.2f} MB ({size / len(body):5.1%})   {ms:8.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="响应序列化与压缩基准")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 50000], help="条数（默认 1000 50000）")
+    parser.add_argument("--repeat", type=int, default=3, help="每项重复次数，取最短耗时（默认 3）")
+    args = parser.parse_args()
+
+    print(f"orjson: {'已安装' if orjson is not None else '未安装（使用 json）'}   "
+          f"brotli: {'已安装' if brotli is not None else '未安装'}")
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["MYMEM_DATA_PATH"] = tmp
+        for size in args.sizes:
+            db = SQLiteDB(os.path.join(tmp, f"bench_{size}.db"), verbose=False)
+            items = [(_text(rng, 6), _text(rng, 400), rng.sample(WORDS, 3)) for _ in range(size)]
+            db.create_memories(items)
+            _print_result(f"记忆列表 {size} 条", *bench_list(db, args.repeat), args.repeat)
+            db.conn.close()
+            _print_result(f"搜索结果 {size} 条", *bench_search(_make_hits(rng, size), args.repeat), args.repeat)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+多进程模式吞吐量基准：分别以 1 个和 N 个 worker 启动服务，并发发送语义搜索请求，
+对比每秒请求数、延迟和进程总内存（PSS，Linux）
+
+使用方法：
+python3 scripts/bench_workers.py --workers 4 --duration 20
+
+默认使用临时数据目录并先导入 --seed 条示例记忆；--data 指定已有数据目录时只读不写
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+WORDS = ("记忆 知识 向量 检索 模型 数据库 缓存 索引 同步 进程 线程 网络 文件 配置 日志 "
+         "部署 测试 性能 内存 磁盘 接口 前端 后端 队列 事务 分段 标签 摘要 上下文 相似").split()
+
+def request(port, method, path, body=None, timeout=30):
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    req = urllib.request.Request(f"http://127.0.0.1:{port}{path}", data=data, method=method,
+                                 headers={"Content-Type": "application/json"})
+    with urllib.request.urlopen(req, timeout=timeout) as response:
+        return response.status, response.read()
+
+def random_text(rng, words):
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+def start_server(port, data_dir, workers):
+    """以指定 worker 数启动服务，等待 /ready"""
+    env = dict(os.environ, MYMEM_PORT=str(port), MYMEM_DATA_PATH=data_dir, MYMEM_ENV="prod")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "backend.main", "start", "--workers", str(workers)],
+        cwd=PROJECT_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    # 每个 worker 各自加载向量库，/ready 每次由其中一个 worker 回答：连续多次就绪才认为全部就绪
+    deadline = time.time() + 300
+    ready_in_a_row = 0
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"服务启动失败 (退出码 {process.returncode})")
+        try:
+            request(port, "GET", "/ready", timeout=2)
+            ready_in_a_row += 1
+            if ready_in_a_row >= workers * 4:
+                return process
+            continue
+        except (urllib.error.URLError, OSError):
+            ready_in_a_row = 0
+        time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("等待服务就绪超时")
+
+def stop_server(process):
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=60)
+    except subprocess.TimeoutExpired:
+        process.kill()
+
+def seed(port, count):
+    """通过 /api/v1/memories/bulk 导入示例记忆"""
+    rng = random.Random(0)
+    lines = "\n".join(
+        json.dumps({"title": f"示例 {i}", "content": random_text(rng, 200), "tags": ["bench"]}, ensure_ascii=False)
+        for i in range(count)
+    ).encode("utf-8")
+    req = urllib.request.Request(f"http://127.0.0.1:{port}/api/v1/memories/bulk", data=lines, method="POST",
+                                 headers={"Content-Type": "application/x-ndjson"})
+    with urllib.request.urlopen(req, timeout=3600) as response:
+        summary = json.loads(response.read().decode("utf-8").strip().split("\n")[-1])
+    print(f"   已导入 {summary.get('created', 0)} 条示例记忆")
+
+def process_tree_pss(pid):
+    """进程及其子进程的 PSS 之和（MB，共享页按进程数分摊），非 Linux 返回 None"""
+    pids = [pid]
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            pids += [int(child) for child in f.read().split()]
+        total = 0
+        for p in pids:
+            with open(f"/proc/{p}/smaps_rollup") as f:
+                for line in f:
+                    if line.startswith("Pss:"):
+                        total += int(line.split()[1])
+        return total / 1024
+    except OSError:
+        return None
+
+def run_load(port, concurrency, duration):
+    """concurrency 个线程持续发送搜索请求 duration 秒"""
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def client(seed_value):
+        rng = random.Random(seed_value)
+        local = []
+        while time.perf_counter() < stop_at:
+            started = time.perf_counter()
+            try:
+                request(port, "POST", "/api/v1/search/", {"query": random_text(rng, 8), "limit": 5})
+                local.append(time.perf_counter() - started)
+            except (urllib.error.URLError, OSError):
+                with lock:
+                    errors[0] += 1
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else 0.0
+
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "rps": len(latencies) / elapsed,
+        "p50": percentile(0.50),
+        "p95": percentile(0.95)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="多进程模式吞吐量基准（1 个 worker 对比 N 个 worker）")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="多进程模式的 worker 数（默认 CPU 核数）")
+    parser.add_argument("--concurrency", type=int, default=None, help="并发请求数（默认 worker 数的 2 倍）")
+    parser.add_argument("--duration", type=float, default=15.0, help="每轮压测秒数（默认 15）")
+    parser.add_argument("--warmup", type=float, default=3.0, help="每轮压测前的预热秒数（默认 3）")
+    parser.add_argument("--port", type=int, default=7950, help="压测使用的端口（默认 7950）")
+    parser.add_argument("--data", help="使用已有数据目录（默认临时目录）")
+    parser.add_argument("--seed", type=int, default=500, help="临时数据目录中导入的示例记忆数（默认 500）")
+    args = parser.parse_args()
+    concurrency = args.concurrency or args.workers * 2
+
+    data_dir = args.data or tempfile.mkdtemp(prefix="mymem-bench-")
+    print(f"📁 数据目录: {data_dir}")
+    print(f"⚙️  并发 {concurrency}，每轮 {args.duration:.0f}s")
+
+    results = {}
+    try:
+        for workers in dict.fromkeys((1, args.workers)):
+            print(f"\n🚀 启动服务: {workers} 个 worker")
+            started = time.perf_counter()
+            process = start_server(args.port, data_dir, workers)
+            print(f"   就绪耗时 {time.perf_counter() - started:.1f}s")
+            try:
+                if not args.data and args.seed and not results:
+                    seed(args.port, args.seed)
+                run_load(args.port, concurrency, args.warmup)
+                result = run_load(args.port, concurrency, args.duration)
+                result["pss"] = process_tree_pss(process.pid)
+                results[workers] = result
+                print(f"   {result['rps']:.1f} req/s，p50 {result['p50']:.1f}ms，p95 {result['p95']:.1f}ms，"
+                      f"错误 {result['errors']}")
+            finally:
+                stop_server(process)
+    finally:
+        if not args.data:
+            shutil.rmtree(data_dir, ignore_errors=True)
+
+    print("\n📊 结果")
+    print(f"{'workers':>8} {'req/s':>10} {'p50(ms)':>10} {'p95(ms)':>10} {'PSS(MB)':>10} {'加速比':>8}")
+    baseline = results[1]["rps"] or 1.0
+    for workers, result in results.items():
+        pss = f"{result['pss']:.0f}" if result["pss"] is not None else "-"
+        print(f"{workers:>8} {result['rps']:>10.1f} {result['p50']:>10.1f} {result['p95']:>10.1f} "
+              f"{pss:>10} {result['rps'] / baseline:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
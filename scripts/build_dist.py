@@ -4,6 +4,8 @@
 自动化构建脚本：
 1. 构建前端 (npm run build)
 2. 将构建产物拷贝到后端静态文件目录 (backend/static)
+3. 为 /assets 下可压缩的文件生成预压缩的 .gz（已安装 brotli 时同时生成 .br）
+4. 记录前端源码指纹（服务在源码目录中启动时据此提示产物是否过期）
 """
 import os
 import shutil
@@ -17,6 +19,9 @@ BACKEND_DIR = PROJECT_ROOT / "backend"
 FRONTEND_DIR = PROJECT_ROOT / "frontend"
 STATIC_DIR = BACKEND_DIR / "static"
 
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
 def build_frontend():
     """构建前端"""
     print("🚀 正在构建前端...")
@@ -52,10 +57,29 @@ def integrate_frontend():
 
     print(f"✅ 前端产物已拷贝至: {STATIC_DIR}")
 
+def precompress_frontend():
+    """预压缩静态资源（服务按 Accept-Encoding 直接返回，不必在请求时压缩）"""
+    from backend.frontend import precompress_assets
+
+    print("🗜️  正在预压缩静态资源...")
+    count = precompress_assets(str(STATIC_DIR / "assets"))
+    print(f"✅ 已生成 {count} 个预压缩文件")
+
+def stamp_frontend():
+    """记录构建产物对应的前端源码指纹"""
+    from backend.frontend import SOURCE_STAMP, frontend_source_hash
+
+    stamp = STATIC_DIR / SOURCE_STAMP
+    stamp.parent.mkdir(parents=True, exist_ok=True)
+    stamp.write_text(frontend_source_hash(str(FRONTEND_DIR)) + "\n", encoding="utf-8")
+    print(f"✅ 已记录前端源码指纹: {stamp}")
+
 def main():
     try:
         build_frontend()
         integrate_frontend()
+        precompress_frontend()
+        stamp_frontend()
         print("\n✨ 集成构建成功！现在可以运行 `python3 backend/main.py` 启动完整服务。")
     except subprocess.CalledProcessError as e:
         print(f"❌ 构建过程中出错: {e}")
@@ -4,7 +4,7 @@
 服务自检与启动脚本：
 用于 AI Skills 调用时确保后端服务已启动。
 """
-import socket
+import json
 import subprocess
 import time
 import sys
@@ -15,11 +15,23 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 BACKEND_DIR = PROJECT_ROOT / "backend"
 
-def is_port_open(host, port):
-    """检查端口是否开放"""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.settimeout(1)
-        return s.connect_ex((host, port)) == 0
+# 与技能脚本共用客户端（优先通过数据目录下的 Unix socket 连接）
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "skills" / "myMem"))
+from backend.config import settings
+from mymem_client import MymemClient
+
+def get_readiness(host, port):
+    """查询 /ready（各组件加载状态），服务未响应时返回 None"""
+    client = MymemClient(f"http://{host}:{port}", timeout=2, socket_path=settings.socket_path)
+    try:
+        # 503：服务已响应，模型等组件还在加载
+        _, data = client.request_raw("GET", "/ready")
+        return json.loads(data)
+    except (ConnectionError, ValueError):
+        return None
+    finally:
+        client.close()
 
 def start_service_daemon():
     """以后台守护进程方式启动服务"""
@@ -58,20 +70,29 @@ def main():
     host = os.getenv("MYMEM_HOST", "127.0.0.1")
     port = int(os.getenv("MYMEM_PORT", 7937))
 
-    if is_port_open(host, port):
+    if get_readiness(host, port) is not None:
         print(f"✨ Mymem 服务已在 {host}:{port} 运行。")
         sys.exit(0)
 
     start_service_daemon()
 
-    # 等待服务启动
-    max_retries = 10
-    for i in range(max_retries):
+    # 等待服务就绪：端口在启动后立即可用，模型在服务内后台加载，以 /ready 为准
+    timeout = float(os.getenv("MYMEM_START_TIMEOUT", 120))
+    deadline = time.time() + timeout
+    while time.time() < deadline:
         time.sleep(1)
-        if is_port_open(host, port):
+        state = get_readiness(host, port)
+        if state is None:
+            print("⏳ 正在等待服务响应...")
+            continue
+        if state["ready"]:
             print(f"✅ 服务启动成功，响应于 {host}:{port}")
             sys.exit(0)
-        print(f"⏳ 正在等待服务就绪... ({i+1}/{max_retries})")
+        pending = {name: c for name, c in state["components"].items() if c["status"] != "ready"}
+        if any(c["status"] == "failed" for c in pending.values()):
+            print(f"❌ 组件加载失败: {', '.join(pending)}，请检查日志。")
+            sys.exit(1)
+        print(f"⏳ 正在加载: {', '.join(pending)}（关键字搜索已可用）")
 
     print("❌ 服务启动超时，请检查日志。")
     sys.exit(1)
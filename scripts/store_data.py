@@ -26,7 +26,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 from core.sqlite_db import SQLiteDB
 from core.chroma_db import ChromaDB
 from core.embedding import Embedding
-from utils.text_splitter import split_text_by_chars
+from utils.text_splitter import split_text_with_offsets, chunk_hash
 
 
 def store_memory(title: str, content: str, tags: list = None):
@@ -58,7 +58,7 @@ def store_memory(title: str, content: str, tags: list = None):
 
     # 2. 组合 title 和 content，然后切割文本
     full_text = f"{title}\n{content}"
-    text_chunks = split_text_by_chars(full_text, chunk_size=1000, overlap=100)
+    text_chunks = split_text_with_offsets(full_text, chunk_size=1000, overlap=100)
 
     # 3. 为每个文本块生成向量并存储到 ChromaDB
     if text_chunks:
@@ -66,19 +66,25 @@ def store_memory(title: str, content: str, tags: list = None):
         ids_list = []
         metadatas_list = []
 
-        for chunk_index, chunk in enumerate(text_chunks):
+        for chunk_index, (chunk_start, chunk_end, chunk) in enumerate(text_chunks):
             # 生成向量
             embedding = embedder.encode(chunk)
             embeddings_list.append(embedding)
 
-            # 使用 memory_id:chunk_index 作为唯一ID
-            chunk_id = f"{memory_id}:{chunk_index}"
+            # 使用 memory_id:内容哈希 作为唯一ID（与后端 Indexer 一致）
+            digest = chunk_hash(chunk)
+            chunk_id = f"{memory_id}:{digest}"
+            if chunk_id in ids_list:
+                chunk_id = f"{chunk_id}-{chunk_index}"
             ids_list.append(chunk_id)
 
             # 存储元数据
             metadatas_list.append({
                 "memory_id": memory_id,
                 "chunk_index": chunk_index,
+                "start": chunk_start,
+                "end": chunk_end,
+                "chunk_hash": digest,
                 "title": title,
                 "total_chunks": len(text_chunks)
             })
@@ -91,6 +97,9 @@ def store_memory(title: str, content: str, tags: list = None):
             metadatas=metadatas_list
         )
 
+    # 4. 向量已写入，结束索引日志
+    sqlite_db.finish_memory_index_jobs([memory_id])
+
     return memory_id
 
 
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 import json
 import argparse
+import os
 import sys
 
 # 检查 Python 版本，确保使用 Python 3
@@ -11,16 +12,17 @@ if sys.version_info[0] < 3:
     sys.stderr.write("  python3 {} <参数>\n".format(sys.argv[0]))
     sys.exit(1)
 
-# 尝试导入 requests 库
-try:
-    import requests
-except ImportError:
-    sys.stderr.write("错误: 需要安装 mymem 环境或单独安装 requests 库\n")
-    sys.stderr.write("请运行: pip install requests 或安装主程序\n")
-    sys.exit(1)
+# 共用的客户端位于技能根目录（优先走 Unix socket，复用连接）
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from mymem_client import MymemClient, ApiError
+
+# 记忆接口路径（--api-url 兼容旧的完整接口地址写法）
+MEMORIES_PATH = "/api/v1/memories/"
 
-# 默认 API 地址
-DEFAULT_API_URL = "http://localhost:7937/api/v1/memories/"
+def _base_url(api_url):
+    if api_url and api_url.rstrip("/").endswith(MEMORIES_PATH.rstrip("/")):
+        return api_url.rstrip("/")[:-len(MEMORIES_PATH.rstrip("/"))]
+    return api_url
 
 def validate_input(title, content):
     """验证输入参数"""
@@ -36,36 +38,40 @@ def add_memory(api_url, title, content, tags=None):
     if tags is None:
         tags = []
 
-    data = {
-        "title": title,
-        "content": content,
-        "tags": tags
-    }
-
+    client = MymemClient(_base_url(api_url))
     try:
-        response = requests.post(api_url, json=data, timeout=30)
-        response.raise_for_status()
-
-        result = response.json()
+        result = client.add_memory(title, content, tags)
         memory_id = result.get("id")
 
         if memory_id is None:
             raise ValueError("API 响应中缺少 id 字段")
 
         return memory_id
-    except requests.exceptions.ConnectionError:
-        raise ConnectionError(f"无法连接到 API 服务器: {api_url}\n请确保 Mymem 服务已启动（运行命令: mymem start）")
-    except requests.exceptions.HTTPError as e:
-        error_detail = ""
-        try:
-            error_response = e.response.json()
-            error_detail = error_response.get("detail", str(e))
-        except:
-            error_detail = str(e)
-        raise RuntimeError(f"API 请求失败: {error_detail}")
+    except ConnectionError:
+        raise ConnectionError(f"无法连接到 API 服务器: {client.address}\n请确保 Mymem 服务已启动（运行命令: mymem start）")
+    except ApiError as e:
+        raise RuntimeError(f"API 请求失败: {e.detail}")
     except Exception as e:
         raise RuntimeError(f"发生意外错误: {str(e)}")
 
+def add_memories(api_url, lines):
+    """
+    批量模式：标准输入每行一个 {"title", "content", "tags"} JSON，一次请求批量导入
+
+    Returns:
+        (每条的导入状态列表, 汇总)
+    """
+    memories = []
+    for line in lines:
+        if not line.strip():
+            continue
+        memory = json.loads(line)
+        validate_input(memory.get("title"), memory.get("content"))
+        memories.append({"title": memory["title"], "content": memory["content"], "tags": memory.get("tags", [])})
+    with MymemClient(_base_url(api_url), timeout=600) as client:
+        statuses = client.add_memories(memories)
+    return statuses[:-1], statuses[-1]
+
 def print_result(success, message, memory_id=None, error=None):
     """统一输出 JSON 格式结果"""
     result = {
@@ -81,14 +87,28 @@ def print_result(success, message, memory_id=None, error=None):
 
 def main():
     parser = argparse.ArgumentParser(description="Add new memory to the knowledge base via API.")
-    parser.add_argument("--api-url", default=DEFAULT_API_URL, help=f"API endpoint URL (default: {DEFAULT_API_URL})")
-    parser.add_argument("--title", required=True, help="Title of the memory")
-    parser.add_argument("--content", required=True, help="Content of the memory")
+    parser.add_argument("--api-url", default=None,
+                        help="API base URL (default: Unix socket in the data dir, then http://localhost:7937)")
+    parser.add_argument("--title", help="Title of the memory")
+    parser.add_argument("--content", help="Content of the memory")
     parser.add_argument("--tags", nargs="*", default=[], help="Tags for the memory")
+    parser.add_argument("--batch", action="store_true",
+                        help='Read one {"title", "content", "tags"} JSON object per line from stdin')
 
     args = parser.parse_args()
+    if not args.batch and (args.title is None or args.content is None):
+        parser.error("--title and --content are required unless --batch is given")
 
     try:
+        if args.batch:
+            statuses, summary = add_memories(args.api_url, sys.stdin)
+            result = {
+                "success": summary.get("failed", 0) == 0,
+                "message": f"Added {summary.get('created', 0)} memories, {summary.get('failed', 0)} failed",
+                "results": statuses
+            }
+            print(json.dumps(result, indent=2, ensure_ascii=False))
+            sys.exit(0 if result["success"] else 1)
         memory_id = add_memory(args.api_url, args.title, args.content, args.tags)
         print_result(
             success=True,
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mymem 本地客户端（技能脚本共用）
+
+优先通过数据目录下的 Unix domain socket 连接服务，socket 不存在或连不上时回退到 TCP；
+同一个客户端复用 keep-alive 连接，批量模式下多个请求只建立一次连接。
+每个请求通过 X-Request-Timeout 头告知服务端客户端的超时，超时后服务端不再继续处理。
+只依赖标准库（不导入 requests），缩短每次调用的启动耗时
+"""
+import http.client
+import json
+import os
+import socket
+from urllib.parse import urlsplit
+
+# 默认 API 地址
+DEFAULT_API_URL = "http://localhost:7937"
+# 服务在数据目录下监听的 socket 文件名
+SOCKET_NAME = "mymem.sock"
+# 告知服务端客户端超时（秒）的请求头
+TIMEOUT_HEADER = "X-Request-Timeout"
+# 批量语义搜索单次请求最多的查询数（与服务端一致）
+MAX_BATCH_QUERIES = 64
+# 复用连接在等待响应时断开，只有这些方法可以安全重发（服务端可能已执行过该请求）
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+class ApiError(RuntimeError):
+    """服务返回了错误状态码"""
+
+    def __init__(self, status, detail):
+        super().__init__(f"API 请求失败 (HTTP {status}): {detail}")
+        self.status = status
+        self.detail = detail
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """通过 Unix domain socket 发送 HTTP 请求"""
+
+    def __init__(self, socket_path, timeout):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+def default_socket_path():
+    """
+    查找服务的 Unix socket：MYMEM_SOCKET、MYMEM_DATA_PATH 下、用户环境默认数据目录 ~/.mymem/data 下
+
+    Returns:
+        存在的 socket 路径，都不存在时返回 None
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    candidates = [os.getenv("MYMEM_SOCKET")]
+    if os.getenv("MYMEM_DATA_PATH"):
+        candidates.append(os.path.join(os.path.abspath(os.getenv("MYMEM_DATA_PATH")), SOCKET_NAME))
+    candidates.append(os.path.join(os.path.expanduser("~"), ".mymem", "data", SOCKET_NAME))
+    for path in candidates:
+        if path and os.path.exists(path):
+            return path
+    return None
+
+class MymemClient:
+    """
+    Mymem API 客户端
+
+    未指定 api_url 时自动选择连接方式：优先 Unix socket，其次 http://localhost:<MYMEM_PORT>；
+    显式指定 api_url（且未指定 socket_path）时只使用该地址
+    """
+
+    def __init__(self, api_url=None, timeout=30, socket_path=None):
+        """
+        Args:
+            api_url: API 基础地址，如 http://localhost:7937
+            timeout: 单个请求的超时（秒）
+            socket_path: 优先使用的 Unix socket 路径（不存在或连不上时使用 api_url）
+        """
+        self.socket_path = socket_path if socket_path and os.path.exists(socket_path) else None
+        if api_url is None:
+            self.socket_path = self.socket_path or default_socket_path()
+            port = os.getenv("MYMEM_PORT")
+            api_url = f"http://localhost:{port}" if port else DEFAULT_API_URL
+        self.api_url = api_url.rstrip("/")
+        parsed = urlsplit(self.api_url)
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port or 80
+        self._base_path = parsed.path.rstrip("/")
+        self.timeout = timeout
+        self._conn = None
+
+    @property
+    def address(self):
+        """当前使用的连接地址（用于错误提示）"""
+        return f"unix:{self.socket_path}" if self.socket_path else self.api_url
+
+    def _connect(self):
+        if self.socket_path:
+            conn = _UnixHTTPConnection(self.socket_path, self.timeout)
+            try:
+                conn.connect()
+                return conn
+            except OSError:
+                # socket 文件残留或服务未监听 socket（如开发模式），回退到 TCP
+                self.socket_path = None
+        conn = http.client.HTTPConnection(self._host, self._port, timeout=self.timeout)
+        try:
+            conn.connect()
+        except OSError:
+            raise ConnectionError(
+                f"无法连接到后端服务 ({self.api_url})。\n"
+                f"请确保 Mymem 服务已启动：\n"
+                f"  mymem start"
+            )
+        return conn
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def request_raw(self, method, path, body=None, content_type="application/json"):
+        """
+        发送请求
+
+        Returns:
+            (状态码, 响应体 bytes)
+        """
+        headers = {"Content-Type": content_type} if body is not None else {}
+        if self.timeout:
+            headers[TIMEOUT_HEADER] = str(self.timeout)
+        for attempt in range(2):
+            reused = self._conn is not None
+            if not reused:
+                self._conn = self._connect()
+            sent = False
+            try:
+                self._conn.request(method, self._base_path + path, body=body, headers=headers)
+                sent = True
+                response = self._conn.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # 复用的 keep-alive 连接已被服务端关闭：请求未发出时总可以重发；
+                # 已发出的请求可能已被执行，只重发幂等方法，避免 POST 重复写入
+                self.close()
+                if reused and attempt == 0 and (not sent or method.upper() in IDEMPOTENT_METHODS):
+                    continue
+                raise ConnectionError(f"与后端服务 ({self.address}) 的连接中断")
+            except OSError as e:
+                self.close()
+                raise ConnectionError(f"请求后端服务 ({self.address}) 失败: {e}")
+            if response.will_close:
+                self.close()
+            return response.status, data
+
+    def request(self, method, path, payload=None):
+        """发送 JSON 请求，返回解析后的 JSON；状态码 >= 400 时抛出 ApiError"""
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8") if payload is not None else None
+        status, data = self.request_raw(method, path, body)
+        if status >= 400:
+            try:
+                detail = json.loads(data).get("detail", data.decode("utf-8", "replace"))
+            except (ValueError, AttributeError):
+                detail = data.decode("utf-8", "replace")
+            raise ApiError(status, detail)
+        return json.loads(data) if data else None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ---- 接口封装 ----
+
+    def health(self):
+        return self.request("GET", "/health")
+
+    def search_vector(self, query, limit=5, include_content=False):
+        """语义搜索"""
+        return self.request("POST", "/api/v1/search/",
+                            {"query": query, "limit": limit, "include_content": include_content})
+
+    def search_vector_batch(self, queries, limit=5, include_content=False):
+        """批量语义搜索（每 MAX_BATCH_QUERIES 个查询一次请求、一次批量向量化），返回与 queries 顺序一致的结果列表"""
+        results = []
+        for offset in range(0, len(queries), MAX_BATCH_QUERIES):
+            results.extend(self.request("POST", "/api/v1/search/batch", [
+                {"query": query, "limit": limit, "include_content": include_content}
+                for query in queries[offset:offset + MAX_BATCH_QUERIES]
+            ]))
+        return results
+
+    def search_sqlite(self, query, include_content=False):
+        """全文检索"""
+        return self.request("POST", "/api/v1/search/sqlite",
+                            {"query": query, "include_content": include_content})
+
+    def add_memory(self, title, content, tags=None):
+        """添加一条记忆，返回记录"""
+        return self.request("POST", "/api/v1/memories/",
+                            {"title": title, "content": content, "tags": tags or []})
+
+    def add_memories(self, memories):
+        """
+        批量添加记忆（/api/v1/memories/bulk）
+
+        Args:
+            memories: [{"title", "content", "tags"}...]
+
+        Returns:
+            每条输入的导入状态列表，最后一项为汇总
+        """
+        body = "\n".join(json.dumps(memory, ensure_ascii=False) for memory in memories).encode("utf-8")
+        status, data = self.request_raw("POST", "/api/v1/memories/bulk", body, content_type="application/x-ndjson")
+        if status >= 400:
+            raise ApiError(status, data.decode("utf-8", "replace"))
+        return [json.loads(line) for line in data.decode("utf-8").splitlines() if line.strip()]
@@ -5,46 +5,55 @@ SQLite 关键词搜索脚本 - 仅保留单一 API 搜索接口
 """
 import json
 import argparse
+import os
 import sys
 
-# 尝试导入 requests 库
-try:
-    import requests
-except ImportError:
-    sys.stderr.write("错误: 需要安装 mymem 环境或单独安装 requests 库\n")
-    sys.stderr.write("请运行: pip install requests 或安装主程序\n")
-    sys.exit(1)
+# 共用的客户端位于技能根目录（优先走 Unix socket，复用连接）
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from mymem_client import MymemClient
 
-# 默认 API 地址
-DEFAULT_API_URL = "http://localhost:7937"
-
-def search_sqlite(api_url, query):
+def search_sqlite(api_url, query, include_content=False, client=None):
     """通过单一接口进行 SQLite 搜索"""
-    url = f"{api_url}/api/v1/search/sqlite"
-    payload = {"query": query}
-
+    client = client or MymemClient(api_url, timeout=10)
     try:
-        response = requests.post(url, json=payload, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.ConnectionError:
-        raise ConnectionError(
-            f"无法连接到后端服务 ({api_url})。\n"
-            f"请确保 Mymem 服务已启动：\n"
-            f"  mymem start"
-        )
+        return client.search_sqlite(query, include_content=include_content)
+    except ConnectionError:
+        raise
     except Exception as e:
         raise RuntimeError(f"搜索失败: {str(e)}")
 
+def search_batch(api_url, lines, include_content=False):
+    """批量模式：每行一个关键词，复用同一连接逐个查询，逐行输出 {"query", "results"}（NDJSON）"""
+    with MymemClient(api_url, timeout=10) as client:
+        for line in lines:
+            query = line.strip()
+            if not query:
+                continue
+            try:
+                results = search_sqlite(api_url, query, include_content, client=client)
+                print(json.dumps({"query": query, "results": results}, ensure_ascii=False), flush=True)
+            except ConnectionError:
+                raise
+            except RuntimeError as e:
+                print(json.dumps({"query": query, "error": True, "message": str(e)}, ensure_ascii=False), flush=True)
+
 def main():
     parser = argparse.ArgumentParser(description="SQLite keyword search via single API endpoint.")
-    parser.add_argument("query", help="The keyword to search for")
-    parser.add_argument("--api-url", default=DEFAULT_API_URL, help=f"API base URL")
+    parser.add_argument("query", nargs="?", help="The keyword to search for")
+    parser.add_argument("--api-url", default=None,
+                        help="API base URL (default: Unix socket in the data dir, then http://localhost:7937)")
+    parser.add_argument("--full", action="store_true", help="Return full memory content instead of matched snippets")
+    parser.add_argument("--batch", action="store_true", help="Read one query per line from stdin, print one JSON line per query")
 
     args = parser.parse_args()
+    if not args.batch and args.query is None:
+        parser.error("the query is required unless --batch is given")
 
     try:
-        results = search_sqlite(args.api_url, args.query)
+        if args.batch:
+            search_batch(args.api_url, sys.stdin, include_content=args.full)
+            return
+        results = search_sqlite(args.api_url, args.query, include_content=args.full)
         # 直接输出 JSON 结果，无任何解释文字
         print(json.dumps(results, indent=2, ensure_ascii=False))
     except Exception as e:
@@ -5,20 +5,14 @@
 """
 import json
 import argparse
+import os
 import sys
 
-# 尝试导入 requests 库
-try:
-    import requests
-except ImportError:
-    sys.stderr.write("错误: 需要安装 mymem 环境或单独安装 requests 库\n")
-    sys.stderr.write("请运行: pip install requests 或安装主程序\n")
-    sys.exit(1)
+# 共用的客户端位于技能根目录（优先走 Unix socket，复用连接）
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from mymem_client import MymemClient, ApiError
 
-# 默认 API 地址
-DEFAULT_API_URL = "http://localhost:7937"
-
-def search_vector(query, limit=5, api_url=DEFAULT_API_URL):
+def search_vector(query, limit=5, api_url=None, include_content=False, client=None):
     """调用后端向量搜索 API"""
     if not query or not query.strip():
         raise ValueError("query cannot be empty")
@@ -26,39 +20,44 @@ def search_vector(query, limit=5, api_url=DEFAULT_API_URL):
     if limit < 0:
         raise ValueError("limit must be non-negative")
 
-    url = f"{api_url}/api/v1/search/"
-    data = {"query": query, "limit": limit}
-
+    client = client or MymemClient(api_url, timeout=15)
     try:
-        response = requests.post(url, json=data, timeout=15)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.ConnectionError:
-        raise ConnectionError(
-            f"无法连接到后端服务 ({api_url})。\n"
-            f"请确保 Mymem 服务已启动：\n"
-            f"  mymem start"
-        )
-    except requests.exceptions.HTTPError as e:
-        error_body = ""
-        try:
-            error_body = e.response.json()
-        except:
-            error_body = e.response.text
-        raise RuntimeError(f"API 请求失败 (HTTP {e.response.status_code}): {error_body}")
+        return client.search_vector(query, limit, include_content=include_content)
+    except (ConnectionError, ApiError):
+        raise
     except Exception as e:
         raise RuntimeError(f"发生意外错误: {str(e)}")
 
+def search_batch(lines, limit=5, api_url=None, include_content=False):
+    """
+    批量模式：每行一个查询，一次请求批量向量化，逐行输出 {"query", "results"}（NDJSON）
+    """
+    queries = [line.strip() for line in lines if line.strip()]
+    if limit < 0:
+        raise ValueError("limit must be non-negative")
+    with MymemClient(api_url, timeout=60) as client:
+        results = client.search_vector_batch(queries, limit, include_content=include_content)
+    for query, result in zip(queries, results):
+        print(json.dumps({"query": query, "results": result}, ensure_ascii=False))
+
 def main():
     parser = argparse.ArgumentParser(description="向量语义搜索 - 通过 API 调用后端搜索接口")
-    parser.add_argument("query", help="搜索查询文本")
+    parser.add_argument("query", nargs="?", help="搜索查询文本")
     parser.add_argument("--limit", type=int, default=5, help="限制结果数量")
-    parser.add_argument("--api-url", default=DEFAULT_API_URL, help=f"API 基础地址")
+    parser.add_argument("--api-url", default=None,
+                        help="API 基础地址（默认优先使用数据目录下的 Unix socket，其次 http://localhost:7937）")
+    parser.add_argument("--full", action="store_true", help="返回记忆全文（默认只返回命中片段）")
+    parser.add_argument("--batch", action="store_true", help="从标准输入读取多个查询（每行一个），逐行输出 JSON 结果")
 
     args = parser.parse_args()
+    if not args.batch and args.query is None:
+        parser.error("缺少搜索查询文本（或使用 --batch 从标准输入读取）")
 
     try:
-        results = search_vector(args.query, args.limit, args.api_url)
+        if args.batch:
+            search_batch(sys.stdin, args.limit, args.api_url, include_content=args.full)
+            return
+        results = search_vector(args.query, args.limit, args.api_url, include_content=args.full)
         print(json.dumps(results, indent=2, ensure_ascii=False))
     except Exception as e:
         print(json.dumps({"error": True, "message": str(e)}, indent=2, ensure_ascii=False), file=sys.stderr)
@@ -0,0 +1,21 @@
+"""
+测试公共配置
+
+部分模块（如 api 路由）在导入时按配置打开数据库，导入 backend 之前先把数据目录指向临时目录，
+测试不会读写开发环境的 ./data
+"""
+import os
+import tempfile
+
+os.environ["MYMEM_DATA_PATH"] = tempfile.mkdtemp(prefix="mymem-test-")
+
+import pytest
+
+from backend.core.sqlite_db import SQLiteDB
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    """临时目录中的空数据库"""
+    db = SQLiteDB(str(tmp_path / "memories.db"), verbose=False)
+    yield db
+    db.conn.close()
@@ -0,0 +1,90 @@
+"""
+准入控制：并发池排队上限（429）、排队超时（503）
+"""
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from backend.api.admission import admitted, check_capacity
+from backend.core.admission import AdmissionPool, AdmissionRejected
+
+async def _occupy(pool: AdmissionPool, release: threading.Event) -> asyncio.Future:
+    """占用池的全部名额，直到 release 被设置"""
+    tasks = [asyncio.create_task(pool.run(release.wait)) for _ in range(pool.max_concurrent)]
+    while pool.active < pool.max_concurrent:
+        await asyncio.sleep(0.001)
+    return asyncio.gather(*tasks)
+
+def test_full_queue_is_rejected_with_429():
+    async def scenario():
+        pool = AdmissionPool("test", max_concurrent=1, max_waiting=0, max_wait=5)
+        release = threading.Event()
+        running = await _occupy(pool, release)
+        assert pool.saturated()
+        with pytest.raises(HTTPException) as excinfo:
+            await admitted(pool, lambda: None)
+        with pytest.raises(HTTPException) as capacity:
+            check_capacity(pool)
+        release.set()
+        await running
+        return pool, excinfo.value, capacity.value
+
+    pool, error, capacity = asyncio.run(scenario())
+    assert error.status_code == 429
+    assert int(error.headers["Retry-After"]) >= 1
+    assert capacity.status_code == 429
+    assert pool.stats()["rejected"] == 2
+
+def test_queue_timeout_is_rejected_with_503():
+    async def scenario():
+        pool = AdmissionPool("test", max_concurrent=1, max_waiting=4, max_wait=0.05)
+        release = threading.Event()
+        running = await _occupy(pool, release)
+        with pytest.raises(HTTPException) as excinfo:
+            await admitted(pool, lambda: None)
+        release.set()
+        await running
+        return pool, excinfo.value
+
+    pool, error = asyncio.run(scenario())
+    assert error.status_code == 503
+    assert "Retry-After" in error.headers
+    assert (pool.timed_out, pool.waiting) == (1, 0)
+
+def test_waiting_request_runs_when_slot_frees():
+    async def scenario():
+        pool = AdmissionPool("test", max_concurrent=1, max_waiting=1, max_wait=5)
+        release = threading.Event()
+        running = await _occupy(pool, release)
+        queued = asyncio.create_task(pool.run(lambda x: x * 2, 21))
+        while pool.waiting == 0:
+            await asyncio.sleep(0.001)
+        # 排队已满：第三个请求被拒绝，已排队的不受影响
+        with pytest.raises(AdmissionRejected) as excinfo:
+            await pool.run(lambda: None)
+        release.set()
+        await running
+        return pool, await queued, excinfo.value
+
+    pool, result, rejected = asyncio.run(scenario())
+    assert result == 42
+    assert rejected.reason == "queue_full"
+    stats = pool.stats()
+    assert (stats["active"], stats["waiting"], stats["completed"], stats["rejected"]) == (0, 0, 2, 1)
+
+def test_unbounded_run_ignores_queue_limit():
+    async def scenario():
+        pool = AdmissionPool("test", max_concurrent=1, max_waiting=0, max_wait=0.01)
+        release = threading.Event()
+        running = await _occupy(pool, release)
+        # 已接纳的长请求中的后续批次：不受排队长度和等待时间限制
+        follow_up = asyncio.create_task(pool.run(lambda: "done", bounded=False))
+        await asyncio.sleep(0.05)
+        assert not follow_up.done()
+        release.set()
+        await running
+        return await follow_up
+
+    assert asyncio.run(scenario()) == "done"
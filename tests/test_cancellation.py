@@ -0,0 +1,98 @@
+"""
+请求取消：截止时间、断开连接，排队和阶段之间放弃（499 / 504）
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from backend.api.admission import STATUS_CLIENT_CLOSED, _parse_timeout, _watch_disconnect, admitted
+from backend.core.admission import AdmissionPool
+from backend.core.cancellation import CancelScope, RequestCancelled, checkpoint
+
+def test_deadline_cancels_at_next_stage():
+    cancel = CancelScope(timeout=0.01)
+    cancel.check("encode")
+    time.sleep(0.02)
+    with pytest.raises(RequestCancelled) as excinfo:
+        cancel.check("vector_query")
+    assert (excinfo.value.reason, excinfo.value.stage) == ("deadline", "vector_query")
+    assert cancel.remaining() == 0.0
+
+def test_first_cancel_reason_wins():
+    cancel = CancelScope()
+    assert cancel.remaining() is None
+    cancel.cancel()
+    cancel.cancel("deadline")
+    with pytest.raises(RequestCancelled) as excinfo:
+        checkpoint(cancel, "hydrate")
+    assert excinfo.value.reason == "disconnected"
+
+def test_checkpoint_without_scope_is_noop():
+    checkpoint(None, "encode")
+
+def test_disconnected_request_is_not_run():
+    ran = []
+
+    async def scenario():
+        pool = AdmissionPool("test", max_concurrent=1, max_waiting=1, max_wait=5)
+        cancel = CancelScope()
+        cancel.cancel()
+        with pytest.raises(HTTPException) as excinfo:
+            await admitted(pool, ran.append, 1, cancel=cancel)
+        return pool, excinfo.value
+
+    pool, error = asyncio.run(scenario())
+    assert error.status_code == STATUS_CLIENT_CLOSED
+    assert ran == []
+    assert pool.stats()["cancelled"] == {"disconnected": 1}
+
+def test_queue_wait_is_bounded_by_deadline():
+    async def scenario():
+        pool = AdmissionPool("test", max_concurrent=1, max_waiting=1, max_wait=30)
+        release = threading.Event()
+        running = asyncio.create_task(pool.run(release.wait))
+        while pool.active == 0:
+            await asyncio.sleep(0.001)
+        started = time.monotonic()
+        with pytest.raises(HTTPException) as excinfo:
+            await admitted(pool, lambda: None, cancel=CancelScope(timeout=0.05))
+        waited = time.monotonic() - started
+        release.set()
+        await running
+        return pool, excinfo.value, waited
+
+    pool, error, waited = asyncio.run(scenario())
+    # 截止时间早于 max_wait：排队到截止时间即放弃，返回 504 而不是 503
+    assert error.status_code == 504
+    assert waited < 5
+    assert pool.stats()["cancelled_stages"] == {"queue": 1}
+    assert pool.timed_out == 0
+
+def test_watch_disconnect_cancels_scope():
+    class FakeRequest:
+        def __init__(self):
+            self.messages = asyncio.Queue()
+
+        async def receive(self):
+            return await self.messages.get()
+
+    async def scenario():
+        request = FakeRequest()
+        cancel = CancelScope()
+        watcher = asyncio.create_task(_watch_disconnect(request, cancel))
+        await request.messages.put({"type": "http.disconnect"})
+        await asyncio.wait_for(watcher, 1)
+        return cancel
+
+    assert asyncio.run(scenario()).reason == "disconnected"
+
+def test_parse_timeout_header():
+    assert _parse_timeout(None) is None
+    assert _parse_timeout("2.5") == 2.5
+    for value in ("0", "-1", "soon", "nan"):
+        with pytest.raises(HTTPException) as excinfo:
+            _parse_timeout(value)
+        assert excinfo.value.status_code == 400
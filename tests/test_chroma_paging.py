@@ -0,0 +1,50 @@
+"""
+按块 ID 分页读取向量库：遍历期间的写入不会让块被跳过或重复读取
+"""
+import numpy as np
+import pytest
+
+from backend.core.archive import _incomplete_memories
+from backend.core.chroma_db import ChromaDB
+
+@pytest.fixture
+def chroma_db(tmp_path):
+    (tmp_path / "chroma").mkdir()
+    return ChromaDB(str(tmp_path / "chroma"))
+
+def _add(chroma_db, memory_id: int, count: int, start: int = 0):
+    ids = [f"{memory_id}:{i:04d}" for i in range(start, start + count)]
+    rng = np.random.default_rng(memory_id * 1000 + start)
+    chroma_db.add_vectors(ids, rng.random((count, 8), dtype=np.float32),
+                          [{"memory_id": memory_id, "chunk_index": i} for i in range(start, start + count)])
+    return ids
+
+def test_writes_during_scan_do_not_shift_pages(chroma_db):
+    original = _add(chroma_db, 1, 30)
+    ids = chroma_db.list_ids()
+    assert ids == sorted(original)
+
+    seen = []
+    for page_number, page in enumerate(chroma_db.iter_pages(ids, ["metadatas"], page_size=7)):
+        seen.extend(page["ids"])
+        if page_number == 0:
+            # 读取期间：删除排在前面（已读）和后面（未读）的块，并插入排在最前面的新块
+            chroma_db.delete([ids[0], ids[-1]])
+            _add(chroma_db, 0, 5)
+
+    assert len(seen) == len(set(seen))
+    # 第一页之后删除的块不返回，新增的块不在列表中；其余每块恰好读取一次
+    assert seen == ids[:-1]
+
+def test_iter_metadata_pages_reads_every_chunk(chroma_db):
+    _add(chroma_db, 2, 12)
+    _add(chroma_db, 1, 3)
+    pages = list(chroma_db.iter_metadata_pages(page_size=5))
+    assert [len(ids) for ids, _ in pages] == [5, 5, 5]
+    assert sorted(metadata["memory_id"] for _, metadatas in pages for metadata in metadatas) == [1] * 3 + [2] * 12
+
+def test_incomplete_memories():
+    chunk_memory_ids = [1, 1, 2, 3, 3]
+    total_chunks = [2, 2, 3, -1, -1]
+    # 2：读取期间被改写，只导出 1/3 块；3：旧数据没有 total_chunks，不检查；4：没有任何块
+    assert _incomplete_memories({1, 2, 3, 4}, chunk_memory_ids, total_chunks) == {2, 4}
@@ -0,0 +1,74 @@
+"""
+上下文组装：token 前缀解码与命中区域合并
+"""
+from backend.api.context import _CharEncoder, _decode_prefix, _merge_regions
+
+class _ByteEncoder:
+    """每个 UTF-8 字节一个 token，模拟 BPE 边界落在多字节字符中间"""
+
+    def encode(self, text: str) -> list:
+        return list(text.encode("utf-8"))
+
+    def decode(self, tokens: list) -> str:
+        return bytes(tokens).decode("utf-8", errors="replace")
+
+def test_decode_prefix_backs_off_split_character():
+    encoder = _ByteEncoder()
+    tokens = encoder.encode("ab中文")
+    # "中" 占 3 个字节，只保留前 1 / 2 个字节
+    for cut in (3, 4):
+        text, used = _decode_prefix(encoder, tokens[:cut])
+        assert text == "ab"
+        assert used == tokens[:2]
+
+def test_decode_prefix_keeps_complete_characters():
+    encoder = _ByteEncoder()
+    tokens = encoder.encode("ab中文")
+    text, used = _decode_prefix(encoder, tokens[:5])
+    assert text == "ab中"
+    assert used == tokens[:5]
+
+def test_decode_prefix_handles_four_byte_characters():
+    encoder = _ByteEncoder()
+    tokens = encoder.encode("a😀")
+    text, used = _decode_prefix(encoder, tokens[:4])
+    assert text == "a"
+    assert used == tokens[:1]
+
+def test_decode_prefix_with_char_encoder():
+    encoder = _CharEncoder()
+    tokens = encoder.encode("中文内容")
+    assert _decode_prefix(encoder, tokens[:2]) == ("中文", ["中", "文"])
+
+def _chunk(index, start, end, distance):
+    return {"chunk_index": index, "start": start, "end": end, "distance": distance}
+
+def test_merge_regions_merges_overlapping_chunks():
+    regions = _merge_regions([
+        _chunk(2, 150, 250, 0.4),
+        _chunk(0, 0, 100, 0.5),
+        _chunk(1, 80, 180, 0.2),
+    ], text_length=300)
+    assert regions == [
+        {"start": 0, "end": 250, "chunk_indexes": [0, 1, 2], "distance": 0.2},
+    ]
+
+def test_merge_regions_keeps_disjoint_chunks_apart():
+    regions = _merge_regions([
+        _chunk(0, 0, 100, 0.5),
+        _chunk(3, 300, 400, 0.1),
+        _chunk(1, 100, 200, 0.3),
+    ], text_length=500)
+    # 相接但不重叠的块（CDC 分段）不合并
+    assert [(r["start"], r["end"], r["chunk_indexes"]) for r in regions] == [
+        (0, 100, [0]), (100, 200, [1]), (300, 400, [3]),
+    ]
+
+def test_merge_regions_treats_missing_offsets_as_whole_text():
+    regions = _merge_regions([
+        _chunk(None, None, None, 0.3),
+        _chunk(1, 50, 120, 0.1),
+    ], text_length=200)
+    assert regions == [
+        {"start": 0, "end": 200, "chunk_indexes": [1], "distance": 0.1},
+    ]
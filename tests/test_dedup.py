@@ -0,0 +1,67 @@
+"""
+重复检测：块覆盖度与存量数据的重复分组
+"""
+import numpy as np
+
+from backend.core.chroma_db import ChromaDB
+from backend.core.dedup import DuplicateDetector
+
+def _result(memory_id, distance, chunk="c", metadata=True):
+    return {
+        "id": f"{memory_id}:{chunk}",
+        "distance": distance,
+        "metadata": {"memory_id": memory_id} if metadata else None,
+    }
+
+def test_coverage_averages_best_match_per_chunk():
+    results_per_chunk = [
+        # 第 1 块：记忆 2 的两个块都命中，只取最相似的
+        [_result(2, 0.02, "a"), _result(2, 0.3, "b"), _result(3, 0.1)],
+        # 第 2 块：只有记忆 2 命中
+        [_result(2, 0.04, "b")],
+    ]
+    scores = DuplicateDetector._coverage(results_per_chunk, total_chunks=2)
+    assert scores.keys() == {2, 3}
+    assert abs(scores[2] - (0.98 + 0.96) / 2) < 1e-9
+    # 只覆盖一半内容的记忆得分减半
+    assert abs(scores[3] - 0.9 / 2) < 1e-9
+
+def test_coverage_excludes_self_and_reads_legacy_ids():
+    results_per_chunk = [[_result(1, 0.0), _result(4, 0.1, metadata=False)]]
+    assert DuplicateDetector._coverage(results_per_chunk, total_chunks=1, exclude_id=1) == {4: 0.9}
+
+def _unit(*values):
+    vector = np.array(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+def test_find_clusters_groups_near_and_exact_duplicates(sqlite_db, tmp_path):
+    ids = [sqlite_db.create_memory(f"记忆{i}", content, []) for i, content in enumerate(
+        ["部署步骤", "部署步骤（另存）", "同一段内容", "同一段内容", "无关内容"]
+    )]
+    near_a, near_b, exact_a, exact_b, other = ids
+
+    (tmp_path / "chroma").mkdir()
+    chroma_db = ChromaDB(str(tmp_path / "chroma"))
+    chunks = [
+        # near_a 与 near_b 的两个块几乎相同
+        (near_a, "a1", _unit(1, 0, 0, 0.01)), (near_a, "a2", _unit(0, 1, 0, 0.01)),
+        (near_b, "b1", _unit(1, 0, 0, 0.02)), (near_b, "b2", _unit(0, 1, 0, 0.02)),
+        # 精确重复只靠内容哈希分组，向量互不相似
+        (exact_a, "e1", _unit(0, 0, 1, 0)), (exact_b, "e2", _unit(0, 0, -1, 1)),
+        (other, "o1", _unit(-1, -1, 0, 0)),
+    ]
+    chroma_db.add_vectors(
+        [f"{memory_id}:{chunk}" for memory_id, chunk, _ in chunks],
+        np.stack([vector for _, _, vector in chunks]),
+        [{"memory_id": memory_id} for memory_id, _, _ in chunks],
+    )
+
+    detector = DuplicateDetector(sqlite_db, chroma_db, threshold=0.95)
+    seen = []
+    clusters = detector.find_clusters(progress=lambda scanned, total: seen.append((scanned, total)))
+
+    assert [cluster["ids"] for cluster in clusters] == [[near_a, near_b], [exact_a, exact_b]]
+    [near_pair] = clusters[0]["pairs"]
+    assert near_pair["exact"] is False and near_pair["similarity"] > 0.99
+    assert clusters[1]["pairs"] == [{"a": exact_a, "b": exact_b, "similarity": 1.0, "exact": True}]
+    assert seen[-1] == (len(chunks), len(chunks))
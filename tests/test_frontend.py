@@ -0,0 +1,126 @@
+"""
+前端静态文件：缓存头、ETag 304、原地修改后重新校验、构建产物与源码一致性
+"""
+import gzip
+import json
+import os
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from backend.frontend import (
+    IMMUTABLE_CACHE_CONTROL, SOURCE_STAMP, Frontend, check_build_freshness, frontend_source_hash
+)
+
+HASHED = "index-3f2a1b.js"
+PLAIN = "legacy.css"
+
+def _write(path, content: str, mtime_offset: int = 0):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    if mtime_offset:
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset * 1_000_000_000))
+
+@pytest.fixture
+def static_dir(tmp_path):
+    directory = tmp_path / "static"
+    _write(str(directory / "index.html"), "<html>v1</html>")
+    _write(str(directory / "favicon.svg"), "<svg/>")
+    _write(str(directory / "assets" / HASHED), "console.log('app');\n" * 200)
+    _write(str(directory / "assets" / PLAIN), "body { color: black; }\n" * 100)
+    _write(str(directory / ".vite" / "manifest.json"),
+           json.dumps({"index.html": {"file": f"assets/{HASHED}", "isEntry": True}}))
+    return directory
+
+@pytest.fixture
+def client(static_dir):
+    # 与 main.py 的挂载方式相同
+    frontend = Frontend(str(static_dir))
+    app = FastAPI()
+    app.mount("/assets", frontend.assets, name="assets")
+
+    @app.get("/{full_path:path}")
+    async def serve(full_path: str, request: Request):
+        return await frontend.response(full_path, request.headers)
+
+    return TestClient(app)
+
+def test_hashed_asset_is_immutable_and_compressed(client):
+    response = client.get(f"/assets/{HASHED}", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == IMMUTABLE_CACHE_CONTROL
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.text == "console.log('app');\n" * 200
+
+def test_unhashed_asset_revalidates_with_etag(client):
+    response = client.get(f"/assets/{PLAIN}")
+    assert response.headers["cache-control"] == "no-cache"
+    etag = response.headers["etag"]
+
+    cached = client.get(f"/assets/{PLAIN}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+def test_in_place_edit_changes_etag_and_body(client, static_dir):
+    path = str(static_dir / "assets" / PLAIN)
+    first = client.get(f"/assets/{PLAIN}", headers={"Accept-Encoding": "gzip"})
+    _write(path, "body { color: red; }\n" * 120, mtime_offset=1)
+
+    response = client.get(f"/assets/{PLAIN}", headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]})
+    assert response.status_code == 200
+    assert response.headers["etag"] != first.headers["etag"]
+    # 内存中的压缩结果随文件一起更新
+    assert response.text == "body { color: red; }\n" * 120
+
+def test_precompressed_sibling_is_served(client, static_dir):
+    path = str(static_dir / "assets" / PLAIN)
+    content = "body { color: blue; }\n" * 100
+    _write(path, content, mtime_offset=1)
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(content.encode("utf-8")))
+    stat = os.stat(path)
+    os.utime(path + ".gz", ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    response = client.get(f"/assets/{PLAIN}", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == content
+
+def test_deleted_asset_returns_404(client, static_dir):
+    assert client.get(f"/assets/{PLAIN}").status_code == 200
+    os.remove(str(static_dir / "assets" / PLAIN))
+    assert client.get(f"/assets/{PLAIN}").status_code == 404
+
+def test_index_reloads_after_rebuild(client, static_dir):
+    first = client.get("/")
+    assert first.text == "<html>v1</html>"
+    assert client.get("/some/route", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+    _write(str(static_dir / "index.html"), "<html>version 2</html>", mtime_offset=1)
+    response = client.get("/", headers={"If-None-Match": first.headers["etag"]})
+    assert response.status_code == 200
+    assert response.text == "<html>version 2</html>"
+    assert response.headers["cache-control"] == "no-cache"
+
+def test_top_level_file(client):
+    response = client.get("/favicon.svg")
+    assert response.text == "<svg/>"
+    assert client.get("/favicon.svg", headers={"If-None-Match": response.headers["etag"]}).status_code == 304
+
+def test_build_freshness_follows_source_hash(tmp_path, static_dir, capsys):
+    frontend_dir = tmp_path / "frontend"
+    _write(str(frontend_dir / "src" / "main.jsx"), "render()")
+    assert not check_build_freshness(str(static_dir), str(frontend_dir))
+    assert "build_dist.py" in capsys.readouterr().out
+
+    _write(str(static_dir / SOURCE_STAMP), frontend_source_hash(str(frontend_dir)))
+    assert check_build_freshness(str(static_dir), str(frontend_dir))
+
+    _write(str(frontend_dir / "src" / "main.jsx"), "render(App)")
+    assert not check_build_freshness(str(static_dir), str(frontend_dir))
+    # 安装包中没有 frontend 源码，不检查
+    assert check_build_freshness(str(static_dir), str(tmp_path / "missing"))
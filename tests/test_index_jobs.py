@@ -0,0 +1,82 @@
+"""
+索引日志（outbox）：写入与日志同一事务，认领、完成、交还重试
+"""
+from backend.core.index_queue import apply_index_jobs
+
+def _status(db, memory_id):
+    return db.get_memory(memory_id).indexing_status
+
+def test_queued_job_is_claimed_and_finished(sqlite_db):
+    memory_id = sqlite_db.create_memory("标题", "内容", [], enqueue_index=True)
+    assert _status(sqlite_db, memory_id) == "pending"
+
+    [job] = sqlite_db.claim_index_jobs(10)
+    assert (job["memory_id"], job["op"], job["status"], job["attempts"]) == (memory_id, "index", "pending", 1)
+    assert sqlite_db.get_index_job(job["id"])["status"] == "running"
+    assert _status(sqlite_db, memory_id) == "indexing"
+    assert sqlite_db.claim_index_jobs(10) == []
+
+    sqlite_db.finish_index_job(job["id"], "done")
+    assert _status(sqlite_db, memory_id) == "done"
+    assert sqlite_db.count_index_jobs() == 0
+
+def test_newer_job_keeps_memory_pending(sqlite_db):
+    memory_id = sqlite_db.create_memory("标题", "内容", [], enqueue_index=True)
+    [job] = sqlite_db.claim_index_jobs(10)
+    # 处理期间记忆又被修改
+    sqlite_db.update_memory(memory_id, "标题", "新内容", [], enqueue_index=True)
+    sqlite_db.finish_index_job(job["id"], "done")
+    assert _status(sqlite_db, memory_id) == "pending"
+
+    [newer] = sqlite_db.claim_index_jobs(10)
+    sqlite_db.finish_index_job(newer["id"], "done")
+    assert _status(sqlite_db, memory_id) == "done"
+
+def test_synchronous_write_finishes_claimed_job(sqlite_db):
+    memory_id = sqlite_db.create_memory("标题", "内容", [])
+    assert _status(sqlite_db, memory_id) == "indexing"
+    # 调用方认领的日志不会被后台队列领取
+    assert sqlite_db.claim_index_jobs(10) == []
+
+    applied = []
+    assert apply_index_jobs(sqlite_db, [memory_id], lambda: applied.append(memory_id))
+    assert applied == [memory_id]
+    assert _status(sqlite_db, memory_id) == "done"
+
+def test_failed_synchronous_write_is_released_for_retry(sqlite_db):
+    memory_id = sqlite_db.create_memory("标题", "内容", [])
+
+    def fail():
+        raise RuntimeError("向量库不可用")
+
+    assert not apply_index_jobs(sqlite_db, [memory_id], fail)
+    assert _status(sqlite_db, memory_id) == "pending"
+    job = sqlite_db.get_latest_index_job(memory_id)
+    assert (job["status"], job["error"]) == ("pending", "向量库不可用")
+    assert [j["id"] for j in sqlite_db.claim_index_jobs(10)] == [job["id"]]
+
+def test_release_keeps_newer_queued_job(sqlite_db):
+    memory_id = sqlite_db.create_memory("标题", "内容", [])
+    sqlite_db.update_memory(memory_id, "标题", "新内容", [], enqueue_index=True)
+    sqlite_db.finish_memory_index_jobs([memory_id])
+    # 第一次写入已完成，修改后的日志仍在排队
+    assert _status(sqlite_db, memory_id) == "pending"
+    assert sqlite_db.get_pending_index_memory_ids() == {memory_id}
+
+def test_delete_and_enqueue_follow_current_state(sqlite_db):
+    kept = sqlite_db.create_memory("保留", "内容", [], enqueue_index=True)
+    gone = sqlite_db.create_memory("删除", "内容", [], enqueue_index=True)
+    sqlite_db.delete_memory(gone, enqueue_index=True)
+    for job in sqlite_db.claim_index_jobs(10):
+        sqlite_db.finish_index_job(job["id"], "done")
+
+    assert sqlite_db.enqueue_index_jobs([kept, gone]) == 2
+    ops = {job["memory_id"]: job["op"] for job in sqlite_db.claim_index_jobs(10)}
+    assert ops == {kept: "index", gone: "delete"}
+
+def test_interrupted_jobs_return_to_queue(sqlite_db):
+    sqlite_db.create_memory("标题", "内容", [], enqueue_index=True)
+    [job] = sqlite_db.claim_index_jobs(10)
+    assert sqlite_db.reset_running_index_jobs() == 1
+    [again] = sqlite_db.claim_index_jobs(10)
+    assert (again["id"], again["attempts"]) == (job["id"], 2)
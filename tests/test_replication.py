@@ -0,0 +1,86 @@
+"""
+增量同步：按 (origin, origin_id) 定位本地记忆，双向同步不来回写入
+"""
+import pytest
+
+from backend.core.replication import Replicator
+from backend.core.sqlite_db import SQLiteDB
+
+@pytest.fixture
+def remote_db(tmp_path):
+    db = SQLiteDB(str(tmp_path / "remote.db"), verbose=False)
+    yield db
+    db.conn.close()
+
+def _feed(db: SQLiteDB, since: int = 0) -> list:
+    """与 /api/v1/changes 相同：本机创建的记忆以实例 ID 作为 origin"""
+    records = []
+    for change in db.get_changes(since):
+        change["origin_id"] = change["origin_id"] if change["origin"] else change["memory_id"]
+        change["origin"] = change["origin"] or db.instance_id
+        records.append(change)
+    return records
+
+def _stats():
+    return {"created": 0, "updated": 0, "deleted": 0, "skipped": 0, "reused": 0, "embedded": 0}
+
+def _apply(db: SQLiteDB, records: list) -> dict:
+    stats = _stats()
+    Replicator(db, indexer=None)._apply_batch(records, reuse_vectors=False, stats=stats)
+    return stats
+
+def test_resolve_own_foreign_and_unknown_origins(sqlite_db, remote_db):
+    own_id = sqlite_db.create_memory("本机", "本机创建", [])
+    [synced_id] = sqlite_db.create_memories([("同步", "从远端同步", [])], origins=[(remote_db.instance_id, 5)])
+    replicator = Replicator(sqlite_db, indexer=None)
+    resolved = replicator._resolve([
+        {"origin": sqlite_db.instance_id, "origin_id": own_id},
+        {"origin": sqlite_db.instance_id, "origin_id": own_id + 100},
+        {"origin": remote_db.instance_id, "origin_id": 5},
+        {"origin": remote_db.instance_id, "origin_id": 6},
+        {"origin": "other-instance", "origin_id": 5},
+    ])
+    assert resolved == {
+        (sqlite_db.instance_id, own_id): own_id,
+        (sqlite_db.instance_id, own_id + 100): None,
+        (remote_db.instance_id, 5): synced_id,
+        (remote_db.instance_id, 6): None,
+        ("other-instance", 5): None,
+    }
+
+def test_pull_creates_updates_and_deletes(sqlite_db, remote_db):
+    first = remote_db.create_memory("一", "内容一", ["a"])
+    second = remote_db.create_memory("二", "内容二", [])
+    assert _apply(sqlite_db, _feed(remote_db))["created"] == 2
+    local = sqlite_db.find_memory_ids_by_origin(remote_db.instance_id, [first, second])
+    assert sqlite_db.get_memory(local[first]).tags == ["a"]
+
+    seq = remote_db.get_max_change_seq()
+    remote_db.update_memory(first, "一", "内容一（修改）", ["a"])
+    remote_db.delete_memory(second)
+    stats = _apply(sqlite_db, _feed(remote_db, seq))
+    assert (stats["updated"], stats["deleted"]) == (1, 1)
+    assert sqlite_db.get_memory(local[first]).content == "内容一（修改）"
+    assert sqlite_db.get_memory(local[second]) is None
+
+def test_echoed_changes_are_not_written_again(sqlite_db, remote_db):
+    # 本机 -> 远端 -> 本机：回传的内容与本地相同，不产生新的变更
+    sqlite_db.create_memory("本机", "本机创建", [])
+    assert _apply(remote_db, _feed(sqlite_db))["created"] == 1
+
+    seq = sqlite_db.get_max_change_seq()
+    stats = _apply(sqlite_db, _feed(remote_db))
+    assert stats["skipped"] == 1 and stats["created"] == stats["updated"] == 0
+    assert sqlite_db.get_max_change_seq() == seq
+
+    # 远端再拉取本机也没有新变更
+    assert _feed(sqlite_db, seq) == []
+
+def test_own_deleted_memory_is_not_recreated(sqlite_db, remote_db):
+    memory_id = sqlite_db.create_memory("本机", "本机创建", [])
+    _apply(remote_db, _feed(sqlite_db))
+    sqlite_db.delete_memory(memory_id)
+
+    stats = _apply(sqlite_db, _feed(remote_db))
+    assert stats["skipped"] == 1 and stats["created"] == 0
+    assert sqlite_db.count() == 0
@@ -0,0 +1,57 @@
+"""
+搜索引擎：向量块按记忆去重
+"""
+from backend.core.search_engine import chunk_distance, collapse_chunks, distance_to_relevance
+
+def _hit(memory_id, distance, chunk="c", metadata=True):
+    result = {"id": f"{memory_id}:{chunk}", "distance": distance}
+    if metadata:
+        result["metadata"] = {"memory_id": memory_id}
+    return result
+
+def test_collapse_orders_memories_by_nearest_chunk():
+    results = [
+        _hit(1, 0.6, "a"),
+        _hit(2, 0.3, "a"),
+        _hit(1, 0.2, "b"),
+        _hit(3, 0.9, "a"),
+        _hit(2, 0.5, "b"),
+    ]
+    candidates = collapse_chunks(results)
+    assert candidates.memory_ids.tolist() == [1, 2, 3]
+    assert candidates.distances.tolist() == [0.2, 0.3, 0.9]
+    # 每条记忆的命中块按距离升序
+    assert [rows.tolist() for rows in candidates.chunk_rows] == [[2, 0], [1, 4], [3]]
+
+def test_collapse_excludes_memory():
+    results = [_hit(1, 0.1), _hit(2, 0.2), _hit(1, 0.3, "b")]
+    candidates = collapse_chunks(results, exclude_memory_id=1)
+    assert candidates.memory_ids.tolist() == [2]
+    assert [rows.tolist() for rows in candidates.chunk_rows] == [[1]]
+
+def test_collapse_parses_memory_id_from_chunk_id():
+    # 旧数据没有 metadata：块 ID 为纯数字或 "memory_id:块标识"
+    results = [
+        {"id": "7", "distance": 0.4},
+        {"id": "8:abc", "distance": 0.1},
+        {"id": "7:def", "distance": None},
+    ]
+    candidates = collapse_chunks(results)
+    assert candidates.memory_ids.tolist() == [8, 7]
+    assert candidates.distances.tolist() == [0.1, 0.4]
+
+def test_collapse_empty():
+    candidates = collapse_chunks([])
+    assert len(candidates) == 0
+    assert candidates.chunk_rows == []
+
+def test_take_keeps_rows_aligned():
+    candidates = collapse_chunks([_hit(1, 0.1), _hit(2, 0.2), _hit(3, 0.3)])
+    subset = candidates.take(candidates.distances > 0.15)
+    assert subset.memory_ids.tolist() == [2, 3]
+    assert [rows.tolist() for rows in subset.chunk_rows] == [[1], [2]]
+    assert subset.vector_results is candidates.vector_results
+
+def test_missing_distance_counts_as_half_relevance():
+    assert chunk_distance({"id": "1"}) == 1.0
+    assert distance_to_relevance(chunk_distance({"id": "1", "distance": None})) == 0.5
@@ -0,0 +1,49 @@
+"""
+SQLite 全文检索：逐字分词与片段还原
+"""
+from backend.core.sqlite_db import FTS_SPACE, SNIPPET_CLOSE, SNIPPET_OPEN
+
+def test_tokenize_marks_whitespace_runs(sqlite_db):
+    assert sqlite_db._tokenize_for_fts("ab  c\n中文") == f"a b {FTS_SPACE} c {FTS_SPACE} 中 文"
+    assert sqlite_db._tokenize_for_fts("ab  c", keep_spaces=False) == "a b c"
+
+def test_detokenize_restores_spaces_and_merges_marks(sqlite_db):
+    snippet = f"t h e {FTS_SPACE} {SNIPPET_OPEN}q{SNIPPET_CLOSE} {SNIPPET_OPEN}u{SNIPPET_CLOSE} i c k {FTS_SPACE} 中 文"
+    assert sqlite_db._detokenize_snippet(snippet) == f"the {SNIPPET_OPEN}qu{SNIPPET_CLOSE}ick 中文"
+    assert sqlite_db._detokenize_snippet("") == ""
+
+def test_search_snippet_keeps_word_spacing(sqlite_db):
+    memory_id = sqlite_db.create_memory("英文笔记", "the quick brown fox jumps over the lazy dog", [])
+    results = sqlite_db.search_memories("brown fox")
+    assert [r.id for r in results] == [memory_id]
+    snippet = results[0].snippet
+    assert f"{SNIPPET_OPEN}brown fox{SNIPPET_CLOSE}" in snippet
+    assert "quick" in snippet and "jumps" in snippet
+    assert FTS_SPACE not in snippet
+
+def test_search_matches_chinese_phrase(sqlite_db):
+    memory_id = sqlite_db.create_memory("架构", "双库架构：SQLite 保存原文，ChromaDB 保存向量", ["设计"])
+    assert [r.id for r in sqlite_db.search_memories("保存原文")] == [memory_id]
+    assert [r.id for r in sqlite_db.search_memories("设计")] == [memory_id]
+    # 短语必须连续出现
+    assert sqlite_db.search_memories("原文向量") == []
+
+def test_old_schema_rebuilds_fts_on_open(tmp_path):
+    from backend.core.sqlite_db import SQLiteDB
+
+    path = str(tmp_path / "memories.db")
+    db = SQLiteDB(path, verbose=False)
+    memory_id = db.create_memory("笔记", "hello world", [])
+    # 模拟旧版本：FTS 中没有空白标记
+    db.conn.execute("DELETE FROM memories_fts")
+    db.conn.execute("INSERT INTO memories_fts(rowid, title, content, tags) VALUES (?, ?, ?, ?)",
+                    (memory_id, "笔 记", "h e l l o w o r l d", ""))
+    db.conn.execute("PRAGMA user_version = 1")
+    db.conn.commit()
+    db.conn.close()
+
+    db = SQLiteDB(path, verbose=False)
+    try:
+        assert db.search_memories("world")[0].snippet == f"hello {SNIPPET_OPEN}world{SNIPPET_CLOSE}"
+    finally:
+        db.conn.close()
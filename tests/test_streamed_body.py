@@ -0,0 +1,115 @@
+"""
+边读请求体边输出响应（批量导入的 NDJSON 流）
+"""
+import asyncio
+
+from backend.api.admission import StreamedBody, StreamedBodyResponse
+
+class FakeRequest:
+    """按测试给出的顺序返回 ASGI 消息"""
+
+    def __init__(self):
+        self.messages = asyncio.Queue()
+
+    async def receive(self):
+        return await self.messages.get()
+
+    def send_body(self, body: bytes, more: bool = True):
+        self.messages.put_nowait({"type": "http.request", "body": body, "more_body": more})
+
+    def disconnect(self):
+        self.messages.put_nowait({"type": "http.disconnect"})
+
+# ASGI 2.4 之前的服务器：StreamingResponse 会同时监听断开连接
+HTTP_SCOPE = {"type": "http", "asgi": {"spec_version": "2.3"}}
+
+async def _next(iterator):
+    return await asyncio.wait_for(iterator.__anext__(), 1)
+
+def test_chunks_are_available_before_body_ends():
+    async def scenario():
+        request = FakeRequest()
+        body = StreamedBody(request)
+        chunks = body.chunks()
+        request.send_body(b'{"a": 1}\n')
+        # 后续分块还没有发送，第一块已经可以处理
+        assert await _next(chunks) == b'{"a": 1}\n'
+        request.send_body(b'{"a": 2}\n', more=False)
+        assert await _next(chunks) == b'{"a": 2}\n'
+        assert [chunk async for chunk in chunks] == []
+        assert not body.disconnected
+
+        request.disconnect()
+        assert await asyncio.wait_for(body.wait_disconnect(), 1) == {"type": "http.disconnect"}
+        assert body.disconnected
+        body.close()
+
+    asyncio.run(scenario())
+
+def test_disconnect_mid_body_ends_chunks():
+    async def scenario():
+        request = FakeRequest()
+        body = StreamedBody(request)
+        request.send_body(b"first")
+        request.disconnect()
+        received = [chunk async for chunk in body.chunks()]
+        body.close()
+        return received, body.disconnected
+
+    assert asyncio.run(scenario()) == ([b"first"], True)
+
+def test_response_streams_while_reading_body():
+    async def scenario():
+        request = FakeRequest()
+        body = StreamedBody(request)
+        sent = []
+
+        async def echo():
+            async for chunk in body.chunks():
+                yield chunk.upper()
+
+        async def send(message):
+            sent.append(message)
+
+        response = StreamedBodyResponse(echo(), body, media_type="application/x-ndjson")
+        serving = asyncio.create_task(response(HTTP_SCOPE, None, send))
+        request.send_body(b"one\n")
+        # 请求体还没读完，第一行的结果已经发出
+        while not any(message.get("body") == b"ONE\n" for message in sent):
+            await asyncio.sleep(0.001)
+        request.send_body(b"two\n", more=False)
+        await asyncio.wait_for(serving, 1)
+        return sent
+
+    sent = asyncio.run(scenario())
+    assert sent[0]["type"] == "http.response.start" and sent[0]["status"] == 200
+    assert b"".join(message.get("body", b"") for message in sent[1:]) == b"ONE\nTWO\n"
+    assert sent[-1].get("more_body") is False
+
+def test_response_stops_when_client_disconnects():
+    async def scenario():
+        request = FakeRequest()
+        body = StreamedBody(request)
+        produced = []
+
+        async def process():
+            async for chunk in body.chunks():
+                produced.append(chunk)
+                yield chunk
+            if body.disconnected:
+                return
+            yield b"end\n"
+
+        async def send(message):
+            pass
+
+        response = StreamedBodyResponse(process(), body, media_type="application/x-ndjson")
+        serving = asyncio.create_task(response(HTTP_SCOPE, None, send))
+        request.send_body(b"one\n")
+        while not produced:
+            await asyncio.sleep(0.001)
+        request.disconnect()
+        await asyncio.wait_for(serving, 1)
+        return produced
+
+    assert asyncio.run(scenario()) == [b"one\n"]
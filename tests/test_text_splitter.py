@@ -0,0 +1,84 @@
+"""
+文本分段：固定长度与内容定义分段（CDC）
+"""
+import random
+
+import pytest
+
+from backend.utils.text_splitter import (
+    CHUNKING_CDC, CHUNKING_FIXED, chunk_hash, split_text, split_text_content_defined
+)
+
+WORDS = ["记忆", "向量", "检索", "分段", "模型", "索引", "memory", "vector", "chunk", "search"]
+
+def _sample_text(seed: int = 7, paragraphs: int = 60) -> str:
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(paragraphs):
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 30)))
+        lines.append(sentence + "。")
+    return "\n".join(lines)
+
+def _run_on_text(seed: int = 7, words: int = 2000) -> str:
+    """没有换行和句号的长文本，fixed 模式只能按长度切"""
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+def _hashes(text: str, mode: str) -> list:
+    return [chunk_hash(chunk) for _, _, chunk in split_text(text, mode=mode, chunk_size=200, overlap=20)]
+
+def _shared_suffix(before: list, after: list) -> int:
+    n = 0
+    while n < min(len(before), len(after)) and before[-1 - n] == after[-1 - n]:
+        n += 1
+    return n
+
+@pytest.mark.parametrize("mode", [CHUNKING_CDC, CHUNKING_FIXED])
+def test_offsets_point_into_text(mode):
+    text = _sample_text()
+    chunks = split_text(text, mode=mode, chunk_size=200, overlap=20)
+    assert len(chunks) > 1
+    for start, end, chunk in chunks:
+        assert text[start:end] == chunk
+        assert chunk == chunk.strip()
+
+def test_cdc_chunks_cover_text_without_overlap():
+    text = _sample_text()
+    chunks = split_text_content_defined(text, chunk_size=200)
+    # 段与段之间只丢掉空白
+    assert "".join("".join(chunk.split()) for _, _, chunk in chunks) == "".join(text.split())
+    for (_, prev_end, _), (start, _, _) in zip(chunks, chunks[1:]):
+        assert start >= prev_end
+
+def test_cdc_respects_max_size():
+    for _, _, chunk in split_text_content_defined(_sample_text(), chunk_size=200):
+        assert len(chunk) <= 200
+
+@pytest.mark.parametrize("make_text", [_sample_text, _run_on_text])
+def test_cdc_edit_near_top_keeps_later_chunks(make_text):
+    text = make_text()
+    before = _hashes(text, CHUNKING_CDC)
+    after = _hashes("新增的开头文字 " + text, CHUNKING_CDC)
+    # 边界很快重新对齐，只有开头附近的块变化
+    assert _shared_suffix(before, after) >= len(before) - 3
+
+def test_fixed_edit_near_top_shifts_later_chunks():
+    text = _run_on_text()
+    before = _hashes(text, CHUNKING_FIXED)
+    after = _hashes("新增的开头文字 " + text, CHUNKING_FIXED)
+    assert _shared_suffix(before, after) < len(before) // 2
+
+def test_cdc_edit_in_middle_only_touches_nearby_chunks():
+    text = _run_on_text()
+    middle = len(text) // 2
+    edited = text[:middle] + " 插入 一些 文字 " + text[middle:]
+    before = _hashes(text, CHUNKING_CDC)
+    after = _hashes(edited, CHUNKING_CDC)
+    assert len(set(before) - set(after)) <= 3
+
+def test_short_text_is_one_chunk():
+    assert split_text("标题\n内容", mode=CHUNKING_CDC) == [(0, 5, "标题\n内容")]
+
+def test_unknown_mode_raises():
+    with pytest.raises(ValueError):
+        split_text("abc", mode="bogus")